@@ -1,14 +1,212 @@
+import base64
+import copy
+import json
+import threading
+import time
+
+import httpx
 import streamlit as st
-from supabase import create_client
-from ranks_config import RANK_TIERS
+from supabase import ClientOptions, create_client
+import rating_log
+import head_to_head
+import player_stats
+import season_close
+import season_repair
+from rank_index import RankIndex
+import db_trace
+
+
+@st.cache_resource
+def get_http_client():
+    """Pool de connexions HTTP (keep-alive) unique pour tout le processus, partagé par toutes les sessions."""
+    return httpx.Client(
+        timeout=120,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    )
+
+
+@st.cache_resource
+def get_db():
+    """DBManager unique pour tout le processus (créé au premier appel, réutilisé ensuite)."""
+    return DBManager()
 
 
+@db_trace.traced
 class DBManager:
-    def __init__(self):
-        # Initialisation via les secrets Streamlit
-        self.supabase = create_client(
-            st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"]
-        )
+    def __init__(self, client=None):
+        # client : backend de stockage fixe. Toutes les méthodes ne lui demandent que
+        # table(nom) (requêtes chaînées façon postgrest-py) et rpc(fonction, params) :
+        # supabase-py ou local_backend.LocalClient (SQLite, sans réseau, pour les tests,
+        # le profilage et les benchmarks). Sinon, voir la propriété `supabase` ci-dessous.
+        self._client = client
+
+        # Cache de lecture (partagé par toutes les sessions, voir section CACHE)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+        self.cache_stats = {"hits": 0, "misses": 0, "invalidations": 0, "discarded": 0, "bytes_loaded": 0}
+
+        # Versions des profils (voir section VERSIONS DES PROFILS)
+        self._profiles_epoch = 0
+        self._profile_versions = {}
+
+    @property
+    def supabase(self):
+        """
+        Client Supabase de la session Streamlit en cours.
+        Le DBManager est partagé par toutes les sessions, mais l'authentification
+        (set_session, sign_out...) est propre à chaque client : chaque session a donc
+        le sien, rangé dans st.session_state, et tous passent par le même pool HTTP.
+        Les requêtes passent par db_trace.TracedClient (mesures du Panel Admin).
+        """
+        if self._client is not None:
+            return db_trace.TracedClient(self._client)
+
+        client = st.session_state.get("supabase_client")
+        if client is None:
+            # Initialisation via les secrets Streamlit
+            client = create_client(
+                st.secrets["SUPABASE_URL"],
+                st.secrets["SUPABASE_KEY"],
+                options=ClientOptions(httpx_client=get_http_client()),
+            )
+            st.session_state["supabase_client"] = client
+        return db_trace.TracedClient(client)
+
+    # =========================================================
+    # CACHE DE LECTURE
+    # =========================================================
+    # Les lectures fréquentes (classement, profils, tournois, archives) passent par _cached :
+    # le résultat est gardé CACHE_TTL secondes, et chaque méthode d'écriture invalide
+    # les clés qu'elle modifie. Une clé est un tuple ("leaderboard", "1v1") ;
+    # invalidate("leaderboard") efface toutes les clés qui commencent par "leaderboard".
+    # Le cache est partagé par toutes les sessions, mais chaque session lit avec son propre
+    # client, donc sous ses propres règles RLS : les entrées sont rangées par contexte
+    # d'authentification (_auth_context), une session ne reçoit jamais ce qu'une autre a lu.
+    CACHE_TTL = 30
+
+    def _auth_context(self):
+        """
+        Contexte RLS des lectures de la session : (rôle, id utilisateur) du jeton que le client
+        envoie (en-tête Authorization, mis à jour par supabase-py à chaque connexion,
+        rafraîchissement ou déconnexion). None pour un client fixe (pas de RLS).
+        Le jeton n'est pas vérifié ici : il ne sert qu'à ranger le cache, Postgres le vérifie.
+        """
+        if self._client is not None:
+            return None
+        client = st.session_state.get("supabase_client")
+        if client is None:
+            return ("anon", None)  # Le client sera créé avec la clé anonyme
+        token = client.options.headers.get("Authorization", "").removeprefix("Bearer ")
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        except (IndexError, ValueError):
+            return ("anon", None)  # Clé d'API qui n'est pas un JWT
+        return (claims.get("role", "anon"), claims.get("sub"))
+
+    def _cached(self, key, loader, ttl=None, copy_result=True):
+        # copy_result : l'appelant reçoit une copie et peut la modifier sans abîmer le cache
+        # (False pour les objets partagés volontairement, comme l'index des rangs)
+        now = time.monotonic()
+        entry_key = (self._auth_context(), key)
+        with self._cache_lock:
+            entry = self._cache.get(entry_key)
+            if entry and entry[0] > now:
+                self.cache_stats["hits"] += 1
+                return copy.deepcopy(entry[1]) if copy_result else entry[1]
+            self.cache_stats["misses"] += 1
+            generation = self._cache_generation
+
+        value = loader()
+        # Taille (JSON) de ce qui a été téléchargé, pour suivre le poids des requêtes
+        size = len(json.dumps(getattr(value, "data", None), default=str)) if hasattr(value, "data") else 0
+        with self._cache_lock:
+            self.cache_stats["bytes_loaded"] += size
+            if generation == self._cache_generation:
+                self._cache[entry_key] = (now + (ttl or self.CACHE_TTL), value)
+            else:
+                # Une écriture a invalidé le cache pendant la lecture : la valeur a peut-être
+                # été lue avant l'écriture, elle n'est rendue qu'à cet appelant
+                self.cache_stats["discarded"] += 1
+        return copy.deepcopy(value) if copy_result else value
+
+    def invalidate(self, *prefixes):
+        """Efface les entrées du cache dont la clé commence par l'un des préfixes."""
+        prefixes = [p if isinstance(p, tuple) else (p,) for p in prefixes]
+        with self._cache_lock:
+            # Toutes sessions confondues : une écriture change ce que chacune peut lire
+            for entry_key in list(self._cache):
+                key = entry_key[1]
+                if any(key[:len(p)] == p for p in prefixes):
+                    del self._cache[entry_key]
+            self._cache_generation += 1
+            self.cache_stats["invalidations"] += 1
+
+    # =========================================================
+    # INDEX DES RANGS
+    # =========================================================
+    # Un RankIndex par mode, gardé dans le cache sous ("rank_index", mode) sans copie.
+    # La validation d'un match le met à jour sur place ; les écritures qui changent
+    # beaucoup d'Elos (révocation, clôture de saison, réparation) l'invalident.
+
+    def get_rank_index(self, mode="1v1"):
+        elo_col = "elo_rating" if mode == "1v1" else "elo_2v2"
+
+        def load():
+            rows = self.supabase.table("profiles").select(f"id, {elo_col}").execute().data or []
+            return RankIndex({p["id"]: p.get(elo_col) for p in rows})
+
+        return self._cached(("rank_index", mode), load, copy_result=False)
+
+    def update_rank_index(self, mode, ratings):
+        """Applique de nouveaux Elos ({player_id: Elo}) aux index déjà chargés (un par contexte)."""
+        with self._cache_lock:
+            indexes = [entry[1] for entry_key, entry in self._cache.items() if entry_key[1] == ("rank_index", mode)]
+        if ratings:
+            for index in indexes:
+                index.update(ratings)
+
+    def get_player_rank(self, player_id, mode="1v1"):
+        """Rang d'un joueur dans le classement d'un mode (None s'il n'y figure pas)."""
+        return self.get_rank_index(mode).rank(player_id)
+
+    # =========================================================
+    # VERSIONS DES PROFILS
+    # =========================================================
+    # Chaque session garde son propre profil en mémoire (voir session_profile.py).
+    # Toute écriture qui touche un profil incrémente sa version ici ; comme le DBManager
+    # est partagé, une session voit aussi les écritures faites par les autres
+    # (ex. un adversaire qui valide un match). touch_profiles() sans argument
+    # périme tous les profils (clôture de saison, révocation...).
+
+    def touch_profiles(self, player_ids=None):
+        with self._cache_lock:
+            if player_ids is None:
+                self._profiles_epoch += 1
+            else:
+                for pid in player_ids:
+                    self._profile_versions[pid] = self._profile_versions.get(pid, 0) + 1
+
+    def profile_version(self, player_id):
+        """Tampon de version d'un profil : change à chaque écriture qui le concerne."""
+        with self._cache_lock:
+            return (self._profiles_epoch, self._profile_versions.get(player_id, 0))
+
+    def get_profile(self, player_id):
+        """Profil complet d'un joueur par son id (lecture directe, sans cache)."""
+        return self.supabase.table("profiles").select("*").eq("id", player_id).single().execute().data
+
+    def update_profile(self, player_id, updates):
+        """Met à jour des colonnes du profil d'un joueur."""
+        self.supabase.table("profiles").update(updates).eq("id", player_id).execute()
+        self.touch_profiles([player_id])
+
+    def cache_info(self):
+        """Compteurs du cache (succès, échecs, invalidations, entrées en mémoire)."""
+        with self._cache_lock:
+            return {**self.cache_stats, "entries": len(self._cache)}
 
     def sign_up(self, email, password, username):
         """Crée un compte utilisateur et lie un profil avec le pseudo"""
@@ -20,6 +218,7 @@ class DBManager:
             self.supabase.table("profiles").insert(
                 {"id": response.user.id, "username": username}
             ).execute()
+            self.invalidate("profiles", "leaderboard", "rank_index")
         return response
 
     def log_in(self, email, password):
@@ -45,26 +244,35 @@ class DBManager:
         except Exception as e:
             return False, f"Erreur de mise à jour : {e}"
 
-    def get_user_profile(self, username):
+    # Champs lus par écran (projections) : chaque appel ne télécharge que ce qu'il affiche,
+    # sans les tableaux unlocked_titles ni les colonnes internes ("*" = tout le profil)
+    PLAYER_LIST_COLUMNS = "id, username"
+    PROFILE_CARD_COLUMNS = "id, username, elo_rating, elo_2v2, equipped_title, is_hidden_profile"
+    LEADERBOARD_COLUMNS = {
+        "1v1": "id, username, elo_rating, matches_played, is_hidden_leaderboard",
+        "2v2": "id, username, elo_2v2, matches_2v2, is_hidden_leaderboard",
+    }
+
+    def get_user_profile(self, username, columns="*"):
         """Récupère toutes les infos d'un joueur (y compris son rôle admin)"""
         return (
             self.supabase.table("profiles")
-            .select("*")
+            .select(columns)
             .eq("username", username)
             .single()
             .execute()
         )
 
-    def get_leaderboard(self, mode="1v1"):
+    def get_leaderboard(self, mode="1v1", columns="*"):
         # On choisit la colonne de tri selon le mode
         sort_col = "elo_rating" if mode == "1v1" else "elo_2v2"
 
-        return (
+        return self._cached(("leaderboard", mode, columns), lambda: (
             self.supabase.table("profiles")
-            .select("*")
+            .select(columns)
             .order(sort_col, desc=True)
             .execute()
-        )
+        ))
 
     def declare_match(
         self,
@@ -87,61 +295,70 @@ class DBManager:
         return self.supabase.table("matches").insert(data).execute()
 
     def revoke_match(self, match_id):
-        """Annule un match validé et rétablit les anciens scores Elo (Compatible Asymétrique)"""
+        """
+        Annule un match validé puis recalcule les Elos de son mode depuis le point de reprise
+        le plus proche avant ce match (les matchs suivants dépendaient de lui).
+        Le rejeu est calculé ici sans rien écrire ; la révocation et les seules différences
+        (matchs, profils, journal) sont écrites en un appel à la fonction Postgres
+        `revoke_match` (une transaction : un échec laisse le match validé et les Elos intacts).
+        """
         try:
             match = self.supabase.table("matches").select("*").eq("id", match_id).single().execute().data
             if not match or match["status"] != "validated":
                 return False, "Le match n'est pas dans un état permettant la révocation."
 
-            mode = match.get("mode", "1v1")
-            
-            # Récupération asymétrique (Si elo_loss n'existe pas sur les vieux matchs, on utilise elo_gain par défaut)
-            gain = match.get("elo_gain", 0)
-            loss = match.get("elo_loss", gain)
-
-            # --- CAS 1v1 ---
-            if mode == "1v1":
-                w_res = self.supabase.table("profiles").select("*").eq("id", match["winner_id"]).single().execute()
-                l_res = self.supabase.table("profiles").select("*").eq("id", match["loser_id"]).single().execute()
-
-                # On retire le gain au vainqueur
-                self.supabase.table("profiles").update({
-                    "elo_rating": w_res.data["elo_rating"] - gain,
-                    "matches_played": max(0, w_res.data["matches_played"] - 1),
-                }).eq("id", match["winner_id"]).execute()
-
-                # On rend la perte au vaincu
-                self.supabase.table("profiles").update({
-                    "elo_rating": l_res.data["elo_rating"] + loss,
-                    "matches_played": max(0, l_res.data["matches_played"] - 1),
-                }).eq("id", match["loser_id"]).execute()
-
-            # --- CAS 2v2 ---
-            elif mode == "2v2":
-                winners = [match["winner_id"], match["winner2_id"]]
-                losers = [match["loser_id"], match["loser2_id"]]
-                
-                profiles_res = self.supabase.table("profiles").select("*").in_("id", winners + losers).execute()
-                p_map = {p["id"]: p for p in profiles_res.data}
-
-                for wid in winners:
-                    if wid in p_map:
-                        curr = p_map[wid]
-                        self.supabase.table("profiles").update({
-                            "elo_2v2": curr.get("elo_2v2", 1000) - gain,
-                            "matches_2v2": max(0, curr.get("matches_2v2", 0) - 1),
-                        }).eq("id", wid).execute()
-
-                for lid in losers:
-                    if lid in p_map:
-                        curr = p_map[lid]
-                        self.supabase.table("profiles").update({
-                            "elo_2v2": curr.get("elo_2v2", 1000) + loss,
-                            "matches_2v2": max(0, curr.get("matches_2v2", 0) - 1),
-                        }).eq("id", lid).execute()
-
-            self.supabase.table("matches").update({"status": "revoked"}).eq("id", match_id).execute()
-            return True, "Match révoqué et scores rétablis."
+            mode = match.get("mode") or "1v1"
+            elo_col = "elo_rating" if mode == "1v1" else "elo_2v2"
+            count_col = "matches_played" if mode == "1v1" else "matches_2v2"
+            validated, last_match_id = self.validated_fingerprint(mode)
+
+            # 1. Rejeu depuis le point de reprise juste avant le match, sans le match révoqué
+            checkpoint = self.get_latest_checkpoint(mode, before=match["created_at"])
+            matches, replay, elos, counts = self._replay_since_checkpoint(mode, checkpoint, exclude_id=match_id)
+
+            # 2. Seules différences : matchs et profils du mode
+            changed_matches = [
+                {"id": m_id, "elo_gain": gain, "elo_loss": loss}
+                for m_id, gain, loss in rating_log.changed_matches(matches, replay)
+            ]
+            changed_match_ids = {m["id"] for m in changed_matches}
+
+            profiles = self.supabase.table("profiles").select(f"id, {elo_col}, {count_col}").execute().data
+            changed = rating_log.changed_profiles(profiles, elos, counts, elo_col, count_col)
+            current = {p["id"]: p for p in profiles}
+            changed_profiles = [
+                {"id": pid, elo_col: current[pid].get(elo_col), count_col: current[pid].get(count_col), **updates}
+                for pid, updates in changed
+            ]
+
+            # 3. Journal : révocation du match + nouvelles valeurs des matchs recalculés
+            before = {p["id"]: p.get(elo_col, 1000) for p in profiles}
+            winners, losers = rating_log.match_teams(match)
+            events = [
+                rating_log.make_event(pid, mode, before.get(pid, 1000), elos.get(pid, before.get(pid, 1000)), rating_log.KIND_REVOKE, match_id)
+                for pid in winners + losers
+            ]
+            events += [e for e in replay["events"] if e["match_id"] in changed_match_ids]
+
+            # 4. Écriture en une transaction (statut, points de reprise, matchs, profils, journal)
+            result = self.supabase.rpc("revoke_match", {
+                "p_match_id": match_id,
+                "p_validated": validated,
+                "p_last_match_id": last_match_id,
+                "p_matches": changed_matches,
+                "p_profiles": changed_profiles,
+                "p_events": events,
+            }).execute().data
+            if not result["revoked"]:
+                if result["stale"]:
+                    return False, "Des matchs ont été validés ou révoqués pendant le calcul : relancez la révocation."
+                return False, "Le match n'est pas dans un état permettant la révocation."
+
+            # Le rejeu peut changer les gains des matchs de tous les joueurs
+            self.invalidate(("leaderboard", mode), ("rank_index", mode), "player_matches", "head_to_head", "player_stats")
+            self.touch_profiles([pid for pid, _ in changed])
+
+            return True, f"Match révoqué et scores rétablis ({len(changed)} profils, {len(changed_match_ids)} matchs recalculés)."
             
         except Exception as e:
             return False, f"Erreur lors de la révocation : {str(e)}"
@@ -156,6 +373,65 @@ class DBManager:
         except Exception as e:
             return False, f"Erreur : {e}"
 
+    PLAYER_COLUMNS = ("winner_id", "loser_id", "winner2_id", "loser2_id")
+    MATCH_PAGE_SIZE = 500
+
+    def get_player_matches(self, player_id, statuses=("validated", "archived"), mode=None, page=None, page_size=None):
+        """
+        Matchs d'un joueur, par ordre chronologique, filtrés côté serveur sur les 4 colonnes
+        de joueurs (index SQL par colonne). page=None : toutes les pages ; sinon la page demandée
+        (0 = la plus ancienne) de page_size matchs.
+        Toutes les pages : pagination par clé (created_at, id) après le dernier match reçu,
+        chaque page repart de l'index au lieu de relire les précédentes (OFFSET).
+        Le résultat est gardé en cache par joueur et invalidé quand un de ses matchs change.
+        """
+        page_size = page_size or self.MATCH_PAGE_SIZE
+        player_filter = ",".join(f"{col}.eq.{player_id}" for col in self.PLAYER_COLUMNS)
+
+        def query():
+            q = self.supabase.table("matches").select("*").or_(player_filter).in_("status", list(statuses))
+            if mode:
+                q = q.eq("mode", mode)
+            return q.order("created_at", desc=False).order("id", desc=False)
+
+        def load_page(n):
+            start = n * page_size
+            return query().range(start, start + page_size - 1).execute().data or []
+
+        def load_all():
+            matches = []
+            while True:
+                q = query()
+                if matches:
+                    last_at, last_id = matches[-1]["created_at"], matches[-1]["id"]
+                    q = q.or_(f'created_at.gt."{last_at}",and(created_at.eq."{last_at}",id.gt.{last_id})')
+                rows = q.limit(page_size).execute().data or []
+                matches.extend(rows)
+                if len(rows) < page_size:
+                    return matches
+
+        key = ("player_matches", player_id, tuple(statuses), mode)
+        if page is None:
+            return self._cached(key, load_all)
+        return self._cached(key + (page, page_size), lambda: load_page(page))
+
+    def get_pair_matches(self, player_a, player_b, mode="1v1", statuses=("validated", "archived")):
+        """
+        Matchs d'un mode où figurent les deux joueurs (adversaires ou partenaires), par ordre
+        chronologique : un seul filtre côté serveur (les deux "or" se combinent en "and"),
+        le coût suit le nombre de matchs de la paire et non la carrière de l'un des deux.
+        Rangé sous ("player_matches", joueur) : un match de la paire invalide les deux joueurs.
+        """
+        player_a, player_b = sorted((player_a, player_b))
+
+        def load():
+            query = self.supabase.table("matches").select("*").in_("status", list(statuses)).eq("mode", mode)
+            for pid in (player_a, player_b):
+                query = query.or_(",".join(f"{col}.eq.{pid}" for col in self.PLAYER_COLUMNS))
+            return query.order("created_at", desc=False).order("id", desc=False).execute().data or []
+
+        return self._cached(("player_matches", player_a, "pair", player_b, mode, tuple(statuses)), load)
+
     def get_all_matches(self):
         """Récupère l'historique complet avec les noms des 4 joueurs potentiels"""
         return (
@@ -202,98 +478,301 @@ class DBManager:
             return False, f"Erreur : {e}"
 
     def validate_match_logic(self, match_id):
+        """
+        Valide un match en un seul aller-retour : la fonction Postgres `validate_match`
+        verrouille le match et les profils, calcule les Elos, met à jour profils et match,
+        écrit le journal des Elos et invalide les points de reprise périmés, le tout
+        dans une seule transaction (voir supabase/migrations/).
+        """
         try:
-            from elo_engine import EloEngine
-            engine = EloEngine()
-
-            match_res = self.supabase.table("matches").select("*").eq("id", match_id).single().execute()
-            match = match_res.data
+            result = self.supabase.rpc("validate_match", {"p_match_id": match_id}).execute().data
 
-            if match["status"] == "validated":
+            if result["already_validated"]:
                 return True, "Ce match est déjà validé."
 
-            mode = match.get("mode", "1v1")
-            gain = 0  
-            loss = 0  
-
-            # =========================================================
-            # SCÉNARIO 1 : MODE 1 vs 1
-            # =========================================================
-            if mode == "1v1":
-                winner = self.supabase.table("profiles").select("*").eq("id", match["winner_id"]).single().execute().data
-                loser = self.supabase.table("profiles").select("*").eq("id", match["loser_id"]).single().execute().data
-
-                # On récupère les 4 valeurs du nouveau moteur
-                new_w_elo, new_l_elo, gain, loss = engine.compute_new_ratings(
-                    winner["elo_rating"], loser["elo_rating"], winner["matches_played"], loser["matches_played"]
-                )
-
-                self.supabase.table("profiles").update({
-                    "elo_rating": new_w_elo,
-                    "matches_played": winner["matches_played"] + 1,
-                }).eq("id", winner["id"]).execute()
-
-                self.supabase.table("profiles").update({
-                    "elo_rating": new_l_elo,
-                    "matches_played": loser["matches_played"] + 1,
-                }).eq("id", loser["id"]).execute()
-
-            # =========================================================
-            # SCÉNARIO 2 : MODE 2 vs 2
-            # =========================================================
-            elif mode == "2v2":
-                ids = [match["winner_id"], match["winner2_id"], match["loser_id"], match["loser2_id"]]
-                profiles_res = self.supabase.table("profiles").select("*").in_("id", ids).execute()
-                p_map = {p["id"]: p for p in profiles_res.data}
-
-                w1_elo = p_map[match["winner_id"]].get("elo_2v2", 1000)
-                w2_elo = p_map[match["winner2_id"]].get("elo_2v2", 1000)
-                l1_elo = p_map[match["loser_id"]].get("elo_2v2", 1000)
-                l2_elo = p_map[match["loser2_id"]].get("elo_2v2", 1000)
-
-                team_win_avg = (w1_elo + w2_elo) / 2
-                team_lose_avg = (l1_elo + l2_elo) / 2
-
-                _, _, gain, loss = engine.compute_new_ratings(team_win_avg, team_lose_avg, 0, 0)
-
-                for wid in [match["winner_id"], match["winner2_id"]]:
-                    curr = p_map[wid]
-                    self.supabase.table("profiles").update({
-                        "elo_2v2": curr.get("elo_2v2", 1000) + gain,
-                        "matches_2v2": curr.get("matches_2v2", 0) + 1,
-                    }).eq("id", wid).execute()
-
-                for lid in [match["loser_id"], match["loser2_id"]]:
-                    curr = p_map[lid]
-                    self.supabase.table("profiles").update({
-                        "elo_2v2": curr.get("elo_2v2", 1000) - loss,
-                        "matches_2v2": curr.get("matches_2v2", 0) + 1,
-                    }).eq("id", lid).execute()
-
-            # =========================================================
-            # VALIDATION FINALE : On enregistre elo_gain ET elo_loss
-            # =========================================================
-            self.supabase.table("matches").update({
-                "status": "validated", 
-                "elo_gain": gain, 
-                "elo_loss": loss
-            }).eq("id", match_id).execute()
+            players = list(result["ratings"])
+            self.invalidate(
+                ("leaderboard", result["mode"]),
+                *[("player_matches", pid) for pid in players],
+                *[("head_to_head", pid) for pid in players],
+                *[("player_stats", pid) for pid in players],
+            )
+            self.update_rank_index(result["mode"], result["ratings"])
+            self.touch_profiles(players)
+            self._maybe_create_checkpoint(result["mode"], result["validated_count"])
 
             return True, "Match validé et classements mis à jour !"
 
         except Exception as e:
             return False, f"Erreur lors de la validation : {str(e)}"
 
+    # =========================================================
+    # FACE-À-FACE (head_to_head)
+    # =========================================================
+    # Tenue à jour par un trigger SQL sur "matches" (validation, révocation, rejeu),
+    # voir supabase/migrations/20261018130000_head_to_head.sql.
+
+    def get_head_to_head(self, player_a, player_b, mode="1v1"):
+        """Face-à-face de A contre / avec B : {"versus": ligne ou None, "partners": ligne ou None}."""
+        def load():
+            rows = (
+                self.supabase.table("head_to_head")
+                .select("*")
+                .eq("player_a", player_a)
+                .eq("player_b", player_b)
+                .eq("mode", mode)
+                .execute()
+                .data
+            ) or []
+            result = {head_to_head.VERSUS: None, head_to_head.PARTNERS: None}
+            for row in rows:
+                result[row["relation"]] = row
+            return result
+
+        return self._cached(("head_to_head", player_a, player_b, mode), load)
+
+    def rebuild_head_to_head(self):
+        """Recalcule toute la table head_to_head depuis les matchs (réparation)."""
+        try:
+            matches = (
+                self.supabase.table("matches")
+                .select("id, winner_id, loser_id, winner2_id, loser2_id, mode, status, elo_gain, elo_loss, created_at")
+                .in_("status", list(head_to_head.COUNTED_STATUSES))
+                .execute()
+                .data
+            ) or []
+            rows = list(head_to_head.build(matches).values())
+
+            self.supabase.table("head_to_head").delete().neq("mode", "").execute()
+            for i in range(0, len(rows), 500):
+                self.supabase.table("head_to_head").insert(rows[i:i + 500]).execute()
+
+            self.invalidate("head_to_head")
+            return True, f"Face-à-face reconstruits ({len(rows)} lignes)."
+        except Exception as e:
+            return False, f"Erreur lors de la reconstruction : {e}"
+
+    # =========================================================
+    # STATISTIQUES DE CARRIÈRE (player_stats)
+    # =========================================================
+    # Tenues à jour par un trigger SQL sur "matches",
+    # voir supabase/migrations/20261018140000_player_stats.sql
+    # et 20261018180000_player_stats_revoke.sql (révocation sur place).
+
+    def get_player_stats(self, player_id):
+        """Compteurs des badges d'un joueur (player_stats + ses lignes head_to_head)."""
+        def load():
+            rows = self.supabase.table("player_stats").select("*").eq("player_id", player_id).limit(1).execute().data
+            h2h_rows = (
+                self.supabase.table("head_to_head")
+                .select("player_b, relation, wins, losses")
+                .eq("player_a", player_id)
+                .execute()
+                .data
+            ) or []
+            return player_stats.badge_counters(rows[0] if rows else None, h2h_rows)
+
+        return self._cached(("player_stats", player_id), load)
+
+    def rebuild_player_stats(self):
+        """Recalcule toute la table player_stats depuis les matchs (réparation)."""
+        try:
+            matches = (
+                self.supabase.table("matches")
+                .select("id, winner_id, loser_id, winner2_id, loser2_id, status, elo_gain, created_at")
+                .in_("status", list(head_to_head.COUNTED_STATUSES))
+                .execute()
+                .data
+            ) or []
+            rows = list(player_stats.build(matches).values())
+            daily = player_stats.build_daily(matches)
+
+            self.supabase.table("player_stats").delete().neq("matches", -1).execute()
+            self.supabase.table("player_stats_daily").delete().neq("matches", -1).execute()
+            for i in range(0, len(rows), 500):
+                self.supabase.table("player_stats").insert(rows[i:i + 500]).execute()
+            for i in range(0, len(daily), 500):
+                self.supabase.table("player_stats_daily").insert(daily[i:i + 500]).execute()
+
+            self.invalidate("player_stats")
+            return True, f"Statistiques recalculées ({len(rows)} joueurs)."
+        except Exception as e:
+            return False, f"Erreur lors de la reconstruction : {e}"
+
+    # =========================================================
+    # JOURNAL DES ELOS (rating_events)
+    # =========================================================
+
+    def append_rating_events(self, events):
+        """Ajoute des lignes au journal des Elos (table en ajout seul)."""
+        if events:
+            self.supabase.table("rating_events").insert(events).execute()
+
+    def get_rating_history(self, player_id, mode="1v1"):
+        """Récupère le journal d'un joueur pour un mode, dans l'ordre d'insertion."""
+        try:
+            res = (
+                self.supabase.table("rating_events")
+                .select("*")
+                .eq("player_id", player_id)
+                .eq("mode", mode)
+                .order("id", desc=False)
+                .execute()
+            )
+            return res.data if res.data else []
+        except Exception:
+            return []
+
+    # =========================================================
+    # POINTS DE REPRISE (rating_checkpoints)
+    # =========================================================
+    # Un point de reprise fige les Elos d'un mode après un match donné (cutoff_at = date
+    # du dernier match inclus, NULL = début de saison). Pour recalculer après un match k,
+    # on repart du point de reprise le plus proche avant k au lieu de toute la saison.
+    CHECKPOINT_EVERY = 25
+
+    def get_season_start_elos(self):
+        """Elos de départ de la saison en cours (soft reset de la dernière archive, 1000 sinon)."""
+        archives = self.supabase.table("season_archives").select("player_id, mode, final_elo").order("created_at", desc=True).execute().data
+        latest = {"1v1": {}, "2v2": {}}
+        for arc in archives or []:
+            by_mode = latest.get(arc.get("mode", "1v1"))
+            # Trié par date décroissante : la première ligne trouvée est la plus récente
+            if by_mode is not None and arc["player_id"] not in by_mode:
+                by_mode[arc["player_id"]] = arc["final_elo"]
+
+        players = self.supabase.table("profiles").select("id").execute().data or []
+        start_1v1 = {p["id"]: rating_log.soft_reset(latest["1v1"].get(p["id"], 1000)) for p in players}
+        start_2v2 = {p["id"]: rating_log.soft_reset(latest["2v2"].get(p["id"], 1000)) for p in players}
+        return start_1v1, start_2v2
+
+    def get_latest_checkpoint(self, mode, before=None):
+        """Point de reprise le plus récent d'un mode (strictement avant `before` si fourni)."""
+        query = self.supabase.table("rating_checkpoints").select("*").eq("mode", mode)
+        if before:
+            query = query.or_(f'cutoff_at.lt."{before}",cutoff_at.is.null')
+        res = query.order("cutoff_at", desc=True, nullsfirst=False).limit(1).execute()
+        return res.data[0] if res.data else None
+
+    def save_checkpoint(self, mode, ratings, counts, cutoff_at=None, last_match_id=None):
+        self.supabase.table("rating_checkpoints").insert({
+            "mode": mode,
+            "cutoff_at": cutoff_at,
+            "last_match_id": last_match_id,
+            "ratings": ratings,
+            "counts": counts,
+        }).execute()
+
+    def clear_checkpoints(self, mode=None, keep_base=True):
+        """Supprime les points de reprise (on garde par défaut celui du début de saison)."""
+        query = self.supabase.table("rating_checkpoints").delete()
+        query = query.eq("mode", mode) if mode else query.neq("mode", "")
+        if keep_base:
+            query = query.not_.is_("cutoff_at", "null")
+        query.execute()
+
+    def _replay_since_checkpoint(self, mode, checkpoint, exclude_id=None):
+        """
+        Rejoue les matchs validés d'un mode postérieurs au point de reprise (ou toute la saison),
+        sans le match exclude_id (révocation en cours).
+        Retourne (matchs, résultat du rejeu, Elos finaux, compteurs finaux).
+        """
+        if checkpoint:
+            ratings = {pid: float(elo) for pid, elo in checkpoint["ratings"].items()}
+            counts = {pid: int(c) for pid, c in checkpoint["counts"].items()}
+        else:
+            start_1v1, start_2v2 = self.get_season_start_elos()
+            ratings = start_1v1 if mode == "1v1" else start_2v2
+            counts = {}
+
+        query = self._filter_mode(self.supabase.table("matches").select("*").eq("status", "validated"), mode)
+        if checkpoint and checkpoint.get("cutoff_at"):
+            query = query.gt("created_at", checkpoint["cutoff_at"])
+        if exclude_id is not None:
+            query = query.neq("id", exclude_id)
+        matches = query.order("created_at", desc=False).execute().data or []
+
+        # Joueurs arrivés après le point de reprise : départ à 1000
+        for m in matches:
+            winners, losers = rating_log.match_teams(m)
+            for pid in winners + losers:
+                ratings.setdefault(pid, 1000)
+
+        if mode == "1v1":
+            replay = rating_log.replay_events(matches, ratings, {})
+        else:
+            replay = rating_log.replay_events(matches, {}, ratings)
+
+        elos = replay[f"elo_{mode}"]
+        final_counts = {pid: counts.get(pid, 0) + n for pid, n in replay[f"matches_{mode}"].items()}
+        return matches, replay, elos, final_counts
+
+    def _maybe_create_checkpoint(self, mode, validated_count=None):
+        """
+        Crée un point de reprise tous les CHECKPOINT_EVERY matchs validés d'un mode.
+        validated_count : nombre de matchs validés s'il est déjà connu (renvoyé par le RPC).
+        Un échec n'annule pas la validation : le point de reprise sera créé plus tard.
+        """
+        try:
+            if validated_count is None:
+                res = self.supabase.table("matches").select("id", count="exact").eq("status", "validated").eq("mode", mode).limit(1).execute()
+                validated_count = res.count
+            if not validated_count or validated_count % self.CHECKPOINT_EVERY:
+                return
+
+            previous = self.get_latest_checkpoint(mode)
+            matches, _, elos, counts = self._replay_since_checkpoint(mode, previous)
+            if matches:
+                self.save_checkpoint(mode, elos, counts, matches[-1]["created_at"], matches[-1]["id"])
+        except Exception:
+            pass
+
     def update_user_privacy(self, user_id, hide_lb, hide_prof):
         """Met à jour les préférences de confidentialité"""
         try:
             self.supabase.table("profiles").update(
                 {"is_hidden_leaderboard": hide_lb, "is_hidden_profile": hide_prof}
             ).eq("id", user_id).execute()
+            self.invalidate("leaderboard")
+            self.touch_profiles([user_id])
             return True, "Préférences mises à jour !"
         except Exception as e:
             return False, str(e)
 
+    # =========================================================
+    # TITRES (player_titles)
+    # =========================================================
+    # Une ligne par (joueur, titre), clé primaire comprise : attribuer un lot de titres
+    # est un seul insert "on conflict do nothing", sans relire ni réécrire les profils.
+    # profiles.equipped_title référence un titre débloqué (voir supabase/migrations/).
+
+    def get_player_titles(self, player_id):
+        """Titres débloqués d'un joueur, du plus ancien au plus récent."""
+        res = self._cached(
+            ("player_titles", player_id),
+            lambda: self.supabase.table("player_titles").select("title").eq("player_id", player_id).order("granted_at").execute(),
+        )
+        return [r["title"] for r in res.data or []]
+
+    def grant_titles(self, grants):
+        """
+        Attribue des titres en une requête : grants = [(player_id, titre)].
+        Un titre déjà débloqué est ignoré.
+        """
+        rows = [{"player_id": pid, "title": title} for pid, title in dict.fromkeys(grants)]
+        if not rows:
+            return
+        self.supabase.table("player_titles").upsert(rows, on_conflict="player_id,title", ignore_duplicates=True).execute()
+        self.invalidate(*[("player_titles", pid) for pid in {r["player_id"] for r in rows}])
+
+    def revoke_titles(self, player_id, titles):
+        """Retire des titres à un joueur (un titre équipé retiré est déséquipé)."""
+        if not titles:
+            return
+        self.supabase.table("player_titles").delete().eq("player_id", player_id).in_("title", list(titles)).execute()
+        self.invalidate(("player_titles", player_id), "leaderboard")
+        self.touch_profiles([player_id])
+
     # =========================================================
     # MODULE GRAND TOURNOI
     # =========================================================
@@ -306,22 +785,26 @@ class DBManager:
                 "format": format_type,
                 "status": "draft"
             }).execute()
+            self.invalidate("grand_tournaments")
             return True, res.data[0]
         except Exception as e:
             return False, f"Erreur de création : {e}"
 
     def get_grand_tournaments(self):
         """Récupère tous les tournois triés par date de création"""
-        return self.supabase.table("grand_tournaments").select("*").order("created_at", desc=True).execute()
+        return self._cached(
+            ("grand_tournaments",),
+            lambda: self.supabase.table("grand_tournaments").select("*").order("created_at", desc=True).execute(),
+        )
 
     def get_tournament_participants(self, tournament_id):
         """Récupère les inscrits actuels d'un tournoi avec leur pseudo"""
-        return (
+        return self._cached(("gt_participants", tournament_id), lambda: (
             self.supabase.table("gt_participants")
             .select("*, profiles(username)")
             .eq("tournament_id", tournament_id)
             .execute()
-        )
+        ))
 
     def save_tournament_groups(self, tournament_id, groups_data):
         """Met à jour les poules (écrase les anciens inscrits et sauvegarde les nouveaux)"""
@@ -334,7 +817,8 @@ class DBManager:
                 for row in groups_data:
                     row['tournament_id'] = tournament_id
                 self.supabase.table("gt_participants").insert(groups_data).execute()
-                
+
+            self.invalidate(("gt_participants", tournament_id))
             return True, "✅ Poules sauvegardées avec succès !"
         except Exception as e:
             return False, f"Erreur lors de la sauvegarde : {e}"
@@ -343,6 +827,7 @@ class DBManager:
         """Passe le tournoi de brouillon à 'groups' ou 'bracket'"""
         try:
             self.supabase.table("grand_tournaments").update({"status": new_status}).eq("id", tournament_id).execute()
+            self.invalidate("grand_tournaments")
             return True
         except:
             return False
@@ -378,6 +863,7 @@ class DBManager:
         # 4. On insère tout d'un coup dans la base
         if matches_to_insert:
             self.supabase.table("gt_matches").insert(matches_to_insert).execute()
+            self.invalidate(("gt_matches", tournament_id))
             
         # 5. On passe le tournoi au statut "groups"
         self.update_tournament_status(tournament_id, "groups")
@@ -385,13 +871,13 @@ class DBManager:
 
     def get_gt_matches(self, tournament_id, phase="group"):
         """Récupère les matchs d'un tournoi selon la phase"""
-        return (
+        return self._cached(("gt_matches", tournament_id, phase), lambda: (
             self.supabase.table("gt_matches")
             .select("*")
             .eq("tournament_id", tournament_id)
             .eq("phase", phase)
             .execute()
-        )
+        ))
 
     def update_gt_match_score(self, match_id, score1, score2, p1_id, p2_id):
         """Met à jour le score d'un match de tournoi et désigne le vainqueur."""
@@ -419,6 +905,9 @@ class DBManager:
             # On affiche EXACTEMENT ce que Supabase répond
             print(f"✅ RÉPONSE SUPABASE : {res}")
             print("---------------------------------------\n")
+
+            # La réponse contient la ligne modifiée, donc son tournoi
+            self.invalidate(("gt_matches", res.data[0]["tournament_id"]) if res.data else "gt_matches")
             
             return True
             
@@ -466,6 +955,8 @@ class DBManager:
             
         if matches_to_insert:
             self.supabase.table("gt_matches").insert(matches_to_insert).execute()
+
+        self.invalidate(("gt_matches", tournament_id))
             
         # On passe le tournoi en phase finale !
         self.update_tournament_status(tournament_id, "bracket")
@@ -561,6 +1052,7 @@ class DBManager:
                         # Vainqueur de la finale du Loser -> Retour en Grande Finale contre l'invaincu !
                         push_player_to_next_match(winner_id, f"WB_R5_M1", is_p1=False)
 
+        self.invalidate(("gt_matches", tournament_id))
         return True
 
     def create_ghost_player(self, username):
@@ -578,6 +1070,7 @@ class DBManager:
                     "is_ghost": True
                 }
                 self.supabase.table("profiles").insert(data).execute()
+                self.invalidate("profiles", "leaderboard", "rank_index")
                 return True, f"Le joueur fantôme '{username}' a été créé avec succès !"
                 
             except Exception as e:
@@ -590,7 +1083,10 @@ class DBManager:
     def get_all_profiles(self):
         """Récupère absolument tous les profils enregistrés."""
         # <-- NOUVEAU : On demande à récupérer la colonne is_ghost
-        return self.supabase.table("profiles").select("id, username, is_ghost").execute()
+        return self._cached(
+            ("profiles",),
+            lambda: self.supabase.table("profiles").select("id, username, is_ghost").execute(),
+        )
 
     def merge_ghost_to_real(self, ghost_id, real_id):
         """Transfère tout l'historique d'un fantôme vers un vrai joueur, puis supprime le fantôme."""
@@ -604,8 +1100,13 @@ class DBManager:
             self.supabase.table("gt_matches").update({"winner_id": real_id}).eq("winner_id", ghost_id).execute()
             self.supabase.table("gt_matches").update({"loser_id": real_id}).eq("loser_id", ghost_id).execute()
 
-            # 3. Nettoyage : Suppression définitive du profil fantôme
+            # 3. Titres gagnés par le fantôme (Weekly, Grands Tournois)
+            self.grant_titles([(real_id, title) for title in self.get_player_titles(ghost_id)])
+
+            # 4. Nettoyage : Suppression définitive du profil fantôme
             self.supabase.table("profiles").delete().eq("id", ghost_id).execute()
+            self.invalidate("profiles", "leaderboard", "rank_index", "gt_participants", "gt_matches", ("player_titles", ghost_id))
+            self.touch_profiles([ghost_id, real_id])
 
             return True, "Fusion réussie ! Le joueur a récupéré tout son historique."
         except Exception as e:
@@ -699,20 +1200,14 @@ class DBManager:
             # 2. On met à jour chaque participant
             for u_id, rank in rankings.items():
                 self.supabase.table("weekly_participants").update({"final_rank": rank}).eq("tournament_id", tournament_id).eq("user_id", u_id).execute()
-                
-                # --- TITRE POUR LE GAGNANT ---
-                if int(rank) == 1:
-                    p_res = self.supabase.table("profiles").select("unlocked_titles").eq("id", u_id).single().execute()
-                    titles = p_res.data.get("unlocked_titles", []) if p_res.data else []
-                    if titles is None: titles = []
-                    
-                    new_title = f"🥇 Gagnant Weekly : {t_name}"
-                    if new_title not in titles:
-                        titles.append(new_title)
-                        self.supabase.table("profiles").update({"unlocked_titles": titles}).eq("id", u_id).execute()
+
+            # --- TITRE POUR LE(S) GAGNANT(S) (une seule requête) ---
+            new_title = f"🥇 Gagnant Weekly : {t_name}"
+            self.grant_titles([(u_id, new_title) for u_id, rank in rankings.items() if int(rank) == 1])
             
             # 3. On change le statut du tournoi
             self.supabase.table("weekly_tournaments").update({"status": "closed"}).eq("id", tournament_id).execute()
+            self.invalidate("weekly_history", "leaderboard")
             
             return True, "Tournoi clôturé et titre distribué au vainqueur !"
         except Exception as e:
@@ -891,32 +1386,27 @@ class DBManager:
                         elif r_num == max_lb_r - 7: final_ranks[l_id] = 25 # Top 25
                         # Et ainsi de suite selon la taille du tournoi...
 
-           # 3. Enregistrement en base de données + Distribution des Titres
+           # 3. Enregistrement en base de données
             for uid, rank in final_ranks.items():
                 # On met à jour le rang dans la table des participants
                 self.supabase.table("gt_participants").update({"final_rank": rank}).eq("tournament_id", tournament_id).eq("user_id", uid).execute()
-                
-                # --- DISTRIBUTION DES TITRES (Top 3) ---
-                if rank in [1, 2, 3]:
-                    # On récupère le profil pour avoir ses titres actuels
-                    p_res = self.supabase.table("profiles").select("unlocked_titles").eq("id", uid).single().execute()
-                    titles = p_res.data.get("unlocked_titles", []) if p_res.data else []
-                    if titles is None: titles = []
-                    
+
+            # --- DISTRIBUTION DES TITRES (Top 3, une seule requête) ---
+            podium = {uid: rank for uid, rank in final_ranks.items() if rank in [1, 2, 3]}
+            if podium:
+                t_data = self.supabase.table("grand_tournaments").select("name").eq("id", tournament_id).single().execute().data
+                t_name = t_data["name"] if t_data else "Grand Tournoi"
+                grants = []
+                for uid, rank in podium.items():
                     # On définit le nom du titre selon la place
-                    t_data = self.supabase.table("grand_tournaments").select("name").eq("id", tournament_id).single().execute().data
-                    t_name = t_data["name"] if t_data else "Grand Tournoi"
-                    
                     emoji = "🏆" if rank == 1 else "🥈" if rank == 2 else "🥉"
                     statut = "Vainqueur" if rank == 1 else "Finaliste" if rank == 2 else "Podium"
-                    new_title = f"{emoji} {statut} {t_name}"
-                    
-                    if new_title not in titles:
-                        titles.append(new_title)
-                        self.supabase.table("profiles").update({"unlocked_titles": titles}).eq("id", uid).execute()
+                    grants.append((uid, f"{emoji} {statut} {t_name}"))
+                self.grant_titles(grants)
 
             # 4. On passe le tournoi en "completed"
             self.supabase.table("grand_tournaments").update({"status": "completed"}).eq("id", tournament_id).execute()
+            self.invalidate("grand_tournaments", ("gt_participants", tournament_id), "leaderboard")
 
             return True, "Tournoi clôturé et classements générés avec succès !"
             
@@ -1085,6 +1575,7 @@ class DBManager:
                 
             if new_matches:
                 self.supabase.table("gt_matches").insert(new_matches).execute()
+                self.invalidate(("gt_matches", tournament_id))
                 return True, f"🚨 Égalité critique détectée ! Matchs de Barrage #{next_round} générés."
                 
         except Exception as e:
@@ -1094,95 +1585,169 @@ class DBManager:
         """Récupère la liste de tous les Weekly Funs terminés (archivés)."""
         try:
             # On cherche tous les tournois avec le statut "completed", triés du plus récent au plus ancien
-            res = self.supabase.table("weekly_tournaments").select("*").eq("status", "closed").order("event_date", desc=True).execute()
+            res = self._cached(
+                ("weekly_history",),
+                lambda: self.supabase.table("weekly_tournaments").select("*").eq("status", "closed").order("event_date", desc=True).execute(),
+            )
             return res.data if res.data else []
         except Exception as e:
             return []
 
 
-    def close_season_logic(self, season_name, mode="1v1"):
+    def get_season_names(self):
+        """Noms des saisons archivées, de la plus récente à la plus ancienne (ordre alphabétique inverse)."""
+        res = self._cached(("archives",), lambda: self.supabase.table("season_archives").select("season_name").execute())
+        return sorted(set(a["season_name"] for a in res.data or []), reverse=True)
+
+    def get_season_archive(self, season_name, mode="1v1"):
+        """Classement archivé d'une saison pour un mode, trié par Elo final."""
+        def load():
+            try:
+                return self.supabase.table("season_archives").select("*").eq("season_name", season_name).eq("mode", mode).order("final_elo", desc=True).execute().data
+            except Exception:
+                # Si "final_elo" n'existe pas, on récupère tout en vrac (tri côté Python par l'appelant)
+                return self.supabase.table("season_archives").select("*").eq("season_name", season_name).eq("mode", mode).execute().data
+        return self._cached(("archives", season_name, mode), load)
+
+    def _filter_mode(self, query, mode):
+        """Filtre sur le mode d'un match ; les anciens matchs sans mode comptent en 1v1 (coalesce(mode, '1v1') en SQL)."""
+        if mode == "1v1":
+            return query.or_("mode.eq.1v1,mode.is.null")
+        return query.eq("mode", mode)
+
+    def validated_fingerprint(self, mode=None):
+        """
+        État des matchs validés (d'un mode ou de tous) : (nombre, id le plus récent).
+        Un plan calculé sur un autre état est périmé (match validé ou révoqué entre-temps).
+        """
+        query = self.supabase.table("matches").select("id", count="exact").eq("status", "validated")
+        if mode:
+            query = self._filter_mode(query, mode)
+        res = query.order("id", desc=True).limit(1).execute()
+        return (res.count, res.data[0]["id"] if res.data else None)
+
+    def get_season_closure(self, close_key):
+        """Clôture déjà enregistrée sous cette clé (season_closures), None sinon."""
+        res = self.supabase.table("season_closures").select("*").eq("close_key", close_key).execute()
+        return res.data[0] if res.data else None
+
+    def plan_season_close(self, season_name, mode="1v1"):
+        """
+        Plan de clôture d'un mode (season_close.ClosePlan) : archives, soft reset, titres.
+        Ne fait que lire ; rien n'est écrit avant apply_season_close.
+        """
+        fingerprint = self.validated_fingerprint(mode)
+        # Profils complets et frais (titres réécrits à l'application) : on ignore le cache
+        self.invalidate(("leaderboard", mode))
+        res = self.get_leaderboard(mode=mode)
+        return season_close.build(res.data or [], season_name, mode, fingerprint)
+
+    def apply_season_close(self, plan, progress=None):
         """
-        Archive le classement, distribue les titres (Champion, Dauphin, Rangs), 
-        applique le Soft Reset, remet les compteurs à zéro et étiquette les matchs.
+        Applique un plan de clôture en un seul appel à la fonction Postgres `close_season`,
+        dans une seule transaction : une erreur ne laisse pas la saison à moitié clôturée.
+        L'appel est idempotent (une clé par saison et par mode) : relancer une clôture déjà
+        faite ne change rien. Un match validé ou révoqué depuis le calcul du plan (empreinte
+        contrôlée dans la transaction) fait refuser le plan sans rien écrire.
+        progress : fonction optionnelle progress(fraction, message) (barre du Panel Admin).
         """
+        def step(fraction, message):
+            if progress:
+                progress(fraction, message)
+
         try:
-            res = self.get_leaderboard(mode=mode)
-            players = res.data if res.data else []
-            if not players: return False, "Aucun joueur à archiver."
+            if not plan: return False, "Aucun joueur à archiver."
+
+            # La fonction vérifie sous verrou la clé d'idempotence (plan déjà appliqué : nouvel
+            # essai après un délai dépassé, double clic...) puis l'empreinte du plan
+            step(0.5, f"Enregistrement ({len(plan)} joueurs)...")
+            validated, last_match_id = plan.fingerprint or (None, None)
+            result = self.supabase.rpc("close_season", {
+                "p_close_key": plan.key,
+                "p_season": plan.season_name,
+                "p_mode": plan.mode,
+                "p_validated": validated,
+                "p_last_match_id": last_match_id,
+                "p_profiles": plan.profiles,
+                "p_archives": plan.archives,
+                "p_events": plan.events,
+                "p_ratings": plan.ratings,
+                "p_titles": plan.titles,
+            }).execute().data
+
+            if result["stale"]:
+                return False, "Des matchs ont été validés ou révoqués depuis le calcul du plan : relancez la prévisualisation."
+
+            step(0.9, "Mise à jour des caches...")
+            self.invalidate("leaderboard", ("rank_index", plan.mode), "archives", "player_matches", "player_titles")
+            self.touch_profiles()
+            step(1.0, "Terminé.")
+
+            if result["already_closed"]:
+                return True, f"Saison {plan.season_name} déjà clôturée ({plan.mode}) : rien n'a été modifié."
+            return True, f"Saison {plan.season_name} clôturée avec succès ({plan.mode}) : {result['players']} joueurs, {result['matches']} matchs archivés !"
+        except Exception as e:
+            return False, f"Erreur lors de la clôture : {str(e)}"
 
-            target_elo_col = "elo_rating" if mode == "1v1" else "elo_2v2"
-            target_match_col = "matches_played" if mode == "1v1" else "matches_2v2"
-            archives_to_insert = []
-            
-            # --- NOUVEAU : Détermination du label du mode ---
-            mode_label = "Solo" if mode == "1v1" else "Duo"
-            
-            for i, p in enumerate(players):
-                current_elo = p.get(target_elo_col, 1000)
-                matches_played = p.get(target_match_col, 0)
-                
-                # 1. Sauvegarde dans l'archive
-                archives_to_insert.append({
-                    "season_name": season_name,
-                    "player_id": p["id"],
-                    "username": p["username"],
-                    "final_elo": int(current_elo),
-                    "matches_played": int(matches_played),
-                    "final_rank": i + 1,
-                    "mode": mode
-                })
-                
-                # 2. Soft Reset
-                new_elo = 1000 + (current_elo - 1000) * 0.4 if current_elo > 1000 else 1000
-                
-                # 3. Mise à jour du profil (Remise à 0 des matchs)
-                update_data = {
-                    target_elo_col: int(new_elo),
-                    target_match_col: 0
-                }
-                if mode == "1v1":
-                    update_data["current_rank_id_1v1"] = 1
-                    update_data["last_seen_elo_1v1"] = int(new_elo)
-                else:
-                    update_data["current_rank_id_2v2"] = 1
-                    update_data["last_seen_elo_2v2"] = int(new_elo)
-                
-                # 4. DISTRIBUTION DES NOUVEAUX TITRES (Sans émojis)
-                titles = p.get("unlocked_titles", [])
-                if titles is None: titles = []
-                
-                # Titre de Rang
-                if matches_played > 1:
-                    rank_name = "Novice"
-                    for tier in reversed(RANK_TIERS):
-                        if current_elo >= tier["threshold"]:
-                            rank_name = tier["name"]
-                            break
-                    rank_title = f"{rank_name} {mode_label} {season_name}"
-                    if rank_title not in titles: titles.append(rank_title)
-
-                # Titres de Podium
-                if i == 0:
-                    champ_title = f"Champion {mode_label} de {season_name}"
-                    if champ_title not in titles: titles.append(champ_title)
-                elif i == 1:
-                    dauphin_title = f"Dauphin {mode_label} de {season_name}"
-                    if dauphin_title not in titles: titles.append(dauphin_title)
-                elif i == 2:
-                    podium_title = f"3ème {mode_label} de {season_name}"
-                    if podium_title not in titles: titles.append(podium_title)
-
-                update_data["unlocked_titles"] = titles
-                self.supabase.table("profiles").update(update_data).eq("id", p["id"]).execute()
-
-            self.supabase.table("season_archives").insert(archives_to_insert).execute()
-            
-            # 5. ARCHIVAGE DES MATCHS
-            self.supabase.table("matches").update({
-                "status": "archived",
-                "season_name": season_name
-            }).eq("status", "validated").eq("mode", mode).execute()
+    def close_season_logic(self, season_name, mode="1v1", progress=None):
+        """
+        Archive le classement, distribue les titres (Champion, Dauphin, Rangs),
+        applique le Soft Reset, remet les compteurs à zéro et étiquette les matchs
+        (plan_season_close puis apply_season_close).
+        """
+        try:
+            if progress:
+                progress(0.1, "Calcul de la clôture...")
+            plan = self.plan_season_close(season_name, mode)
+        except Exception as e:
+            return False, f"Erreur lors de la clôture : {str(e)}"
+        return self.apply_season_close(plan, progress)
+
+    def plan_season_repair(self):
+        """
+        Plan de réparation de la saison en cours (season_repair.RepairPlan) : rejeu de tous
+        les matchs validés depuis le soft reset. Ne fait que lire ; rien n'est écrit avant
+        apply_season_repair.
+        """
+        fingerprint = self.validated_fingerprint()
+        start_1v1, start_2v2 = self.get_season_start_elos()
+        matches = self.supabase.table("matches").select("*").eq("status", "validated").order("created_at", desc=False).execute().data or []
+        profiles = self.supabase.table("profiles").select("id, username, elo_rating, matches_played, elo_2v2, matches_2v2").execute().data or []
+        return season_repair.build(matches, profiles, start_1v1, start_2v2, fingerprint)
 
-            return True, f"Saison {season_name} clôturée avec succès ({mode}) !"
+    def apply_season_repair(self, plan, progress=None):
+        """
+        Applique un plan de réparation en un seul appel à la fonction Postgres
+        `apply_season_repair` (matchs, profils, journal des Elos et points de reprise,
+        dans une seule transaction).
+        Le plan écrit des valeurs absolues : réappliquer un plan déjà appliqué (même état
+        des matchs validés) réécrit les mêmes valeurs et ne change rien au résultat ; un plan
+        calculé sur un autre état (empreinte contrôlée dans la transaction) est refusé.
+        """
+        def step(fraction, message):
+            if progress:
+                progress(fraction, message)
+
+        try:
+            if not plan: return False, "Aucun match validé dans la saison en cours."
+
+            # Empreinte du plan vérifiée sous verrou par la fonction, avant toute écriture
+            step(0.5, "Sauvegarde des scores...")
+            validated, last_match_id = plan.fingerprint or (None, None)
+            result = self.supabase.rpc("apply_season_repair", {
+                "p_validated": validated,
+                "p_last_match_id": last_match_id,
+                "p_matches": plan.matches,
+                "p_profiles": plan.profiles,
+                "p_events": plan.events,
+            }).execute().data
+            if result["stale"]:
+                return False, "Des matchs ont été validés ou révoqués depuis le calcul du plan : relancez la prévisualisation."
+
+            step(0.9, "Mise à jour des caches...")
+            self.invalidate("leaderboard", "rank_index", "player_matches", "head_to_head", "player_stats")
+            self.touch_profiles()
+            step(1.0, "Terminé.")
+            return True, f"Réparation terminée ! La saison en cours a été recalculée depuis le soft-reset ({result['matches']} matchs et {result['profiles']} profils ajustés)."
         except Exception as e:
-            return False, f"Erreur lors de la clôture : {str(e)}"
\ No newline at end of file
+            return False, f"Erreur lors de la réparation : {str(e)}"
\ No newline at end of file
@@ -0,0 +1,115 @@
+# --- assets.py ---
+# Images des rangs et des badges servies comme fichiers statiques.
+# Les data URI base64 de ranks_images.py / badges_config.py sont décodées une seule fois
+# en fichiers nommés d'après leur contenu (static/assets/<nom>-<hash>.png), servis par
+# Streamlit (server.enableStaticServing, voir .streamlit/config.toml) sous app/static/.
+# Le HTML ne contient plus qu'une URL courte au lieu de centaines de Ko de base64 par image.
+#
+# Le nom change dès que l'image change : le navigateur peut garder le fichier en cache
+# (Streamlit envoie ETag / Last-Modified ; un proxy peut ajouter "Cache-Control: immutable"
+# sur /app/static/assets/).
+#
+# Les modules d'images (~1,3 Mo de texte) ne sont importés qu'à la première icône à écrire :
+# static/assets/manifest.json garde le fichier de chaque image et la signature (taille, date)
+# du module source, ce qui permet aux démarrages suivants de ne jamais les charger.
+
+import base64
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import threading
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+ASSETS_DIR = os.path.join(STATIC_DIR, "assets")
+MANIFEST_PATH = os.path.join(ASSETS_DIR, "manifest.json")
+URL_PREFIX = "app/static/assets"
+HASH_LENGTH = 12
+
+_urls = {}
+_manifest = None
+_lock = threading.Lock()
+
+
+def decode_data_uri(data_uri):
+    """(extension, octets) d'une data URI "data:image/png;base64,..."."""
+    header, _, payload = data_uri.partition(",")
+    mime = header[len("data:"):].split(";")[0] or "image/png"
+    extension = mime.split("/")[-1]
+    # Certaines chaînes ont été collées avec des guillemets ou des retours à la ligne
+    payload = "".join(payload.replace('"', "").replace("'", "").split())
+    return extension, base64.b64decode(payload)
+
+
+def _write_atomic(path, content):
+    # Écriture atomique : plusieurs processus peuvent démarrer en même temps
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_asset(name, data_uri):
+    """Écrit l'image sur disque (si besoin) et retourne son nom de fichier ("" si data URI vide)."""
+    if not data_uri:
+        return ""
+    extension, content = decode_data_uri(data_uri)
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    filename = f"{name}-{digest}.{extension}"
+    path = os.path.join(ASSETS_DIR, filename)
+    if not os.path.exists(path):
+        _write_atomic(path, content)
+    return filename
+
+
+def _source_signature(module_name):
+    """Taille et date du fichier d'un module, sans l'importer."""
+    stat = os.stat(importlib.util.find_spec(module_name).origin)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def _load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _asset_url(name, module_name, pick):
+    """
+    URL statique de l'image `name`, prise dans le module `module_name` par pick(module).
+    Le module n'est importé que si l'image n'est pas déjà sur disque pour cette version du module.
+    """
+    with _lock:
+        if name in _urls:
+            return _urls[name]
+
+        manifest = _load_manifest()
+        source = _source_signature(module_name)
+        entry = manifest.get(name)
+        if entry and entry["source"] == source and os.path.exists(os.path.join(ASSETS_DIR, entry["file"])):
+            filename = entry["file"]
+        else:
+            filename = write_asset(name, pick(importlib.import_module(module_name)))
+            if filename:
+                manifest[name] = {"file": filename, "source": source}
+                _write_atomic(MANIFEST_PATH, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+        _urls[name] = f"{URL_PREFIX}/{filename}" if filename else ""
+        return _urls[name]
+
+
+def rank_icon_url(tier_id):
+    """URL statique de l'icône d'un rang (ranks_images.RANK_IMAGES)."""
+    return _asset_url(f"rang_{tier_id}", "ranks_images", lambda m: m.RANK_IMAGES.get(tier_id, ""))
+
+
+def badge_url(key):
+    """URL statique d'un badge de badges_config.BADGES_B64 ("" si la clé n'existe pas)."""
+    return _asset_url(f"badge_{key}", "badges_config", lambda m: m.BADGES_B64.get(key, ""))
@@ -0,0 +1,36 @@
+# --- benchmarks/bench_profile.py ---
+# Pages Profils et Comparateur pour le joueur le plus actif du club.
+
+import stats_engine
+from views.common import get_badges_html
+
+
+def bench_profile_stats(benchmark, club, db):
+    player_id = club["busiest"]
+    matches = [m for m in db.get_player_matches(player_id) if m.get("mode", "1v1") == "1v1"]
+    profile = db.get_profile(player_id)
+    season_end_elos = {stats_engine.CURRENT_SEASON: profile["elo_rating"]}
+    for arc in db.supabase.table("season_archives").select("*").eq("player_id", player_id).eq("mode", "1v1").execute().data:
+        season_end_elos[arc["season_name"]] = arc["final_elo"]
+    usernames = {p["id"]: p["username"] for p in db.get_all_profiles().data}
+
+    career, _, _ = benchmark(stats_engine.profile_stats, matches, player_id, season_end_elos, {}, usernames)
+    assert career["wins"] <= len(matches)
+
+
+def bench_badges(benchmark, club, db):
+    html = benchmark(lambda: get_badges_html(db.get_player_stats(club["busiest"])))
+    assert html
+
+
+def bench_comparator_scan(benchmark, club, db):
+    id_1, id_2 = club["busiest"], club["rival"]
+
+    def scan():
+        # Même travail que la page Comparateur : face-à-face puis chronologie de la paire
+        h2h = db.get_head_to_head(id_1, id_2, "1v1")
+        pair_matches = db.get_pair_matches(id_1, id_2, "1v1")
+        return h2h, pair_matches
+
+    h2h, pair_matches = benchmark(scan)
+    assert h2h["versus"] is None or h2h["versus"]["wins"] + h2h["versus"]["losses"] == len(pair_matches)
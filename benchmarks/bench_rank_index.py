@@ -0,0 +1,20 @@
+# --- benchmarks/bench_rank_index.py ---
+# Index des rangs : nouveaux Elos des deux joueurs d'un match validé, puis rang du vainqueur
+# (barre latérale).
+
+import random
+
+from rank_index import RankIndex
+
+
+def bench_rank_index_update(benchmark, club):
+    players = [p["id"] for p in club["profiles"]]
+    index = RankIndex({p["id"]: p.get("elo_rating") for p in club["profiles"]})
+    rnd = random.Random(0)
+
+    def validate():
+        winner, loser = rnd.sample(players, 2)
+        index.update({winner: rnd.randint(800, 1400), loser: rnd.randint(800, 1400)})
+        return index.rank(winner)
+
+    assert 1 <= benchmark(validate) <= len(players)
@@ -0,0 +1,12 @@
+# --- benchmarks/bench_ratings.py ---
+# Rejeu de la saison en cours (révocation, réparation, points de reprise).
+
+
+def bench_season_replay_1v1(benchmark, db):
+    matches, _, elos, _ = benchmark(db._replay_since_checkpoint, "1v1", None)
+    assert len(elos) > 0 or not matches
+
+
+def bench_season_replay_2v2(benchmark, db):
+    matches, _, elos, _ = benchmark(db._replay_since_checkpoint, "2v2", None)
+    assert len(elos) > 0 or not matches
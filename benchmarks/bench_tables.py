@@ -0,0 +1,14 @@
+# --- benchmarks/bench_tables.py ---
+# Rendu HTML du classement complet (tous les joueurs actifs).
+
+import leaderboard
+from luxury_table import draw_luxury_table
+
+
+def bench_draw_luxury_table(benchmark, db):
+    rows = db.get_leaderboard("1v1", db.LEADERBOARD_COLUMNS["1v1"]).data
+    ranking = leaderboard.ranking_frame(rows, "elo_rating", "matches_played")
+    table = leaderboard.table_rows(ranking)
+
+    html = benchmark(draw_luxury_table, table, columns=["Rang", "Joueur", "Points Elo", "Matchs"])
+    assert html.count("<tr") == len(table) + 1
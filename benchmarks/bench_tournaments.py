@@ -0,0 +1,21 @@
+# --- benchmarks/bench_tournaments.py ---
+# Grand Tournoi : classement final et détection des barrages de poule.
+
+
+def bench_final_rankings(benchmark, club, db):
+    # Rejouable : les rangs sont réécrits à l'identique et les titres ne sont pas dupliqués
+    ok, msg = benchmark(db.calculate_and_save_final_rankings, club["tournament_id"], "single_elimination")
+    assert ok, msg
+
+
+def bench_tie_breaks(benchmark, club, db):
+    tournament_id = club["tournament_id"]
+
+    def reset():
+        # On retire les barrages créés au tour précédent : chaque tour crée les mêmes
+        db.supabase.table("gt_matches").delete().eq("tournament_id", tournament_id).gt("tie_break_round", 0).execute()
+
+    ok, msg = benchmark.pedantic(
+        db.check_and_create_tie_breaks, args=(tournament_id, club["tie_group"]), setup=reset, rounds=20
+    )
+    assert ok and "Barrage" in msg, msg
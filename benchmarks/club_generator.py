@@ -0,0 +1,291 @@
+# --- benchmarks/club_generator.py ---
+# Clubs synthétiques réalistes pour les benchmarks, chargés dans local_backend.LocalClient :
+#   - N joueurs avec un niveau caché (le meilleur gagne plus souvent) et une assiduité
+#     très inégale (quelques piliers du club jouent la majorité des matchs) ;
+#   - M matchs 1v1 / 2v2 répartis sur K saisons archivées + la saison en cours,
+#     avec les Elos calculés par EloEngine (soft reset entre deux saisons) ;
+#   - archives de saison, Grands Tournois (poules + arbre), Weekly Fun, entraînement.
+# Les tables dérivées (head_to_head, player_stats) ne sont remplies que pour les joueurs
+# utilisés par les benchmarks (même calcul que les triggers, voir local_backend).
+#
+#   club = generate_club(10_000)
+#   client = LocalClient(); load_club(client, club)
+#   db = DBManager(client=client)
+
+import itertools
+
+import numpy as np
+
+import rating_log
+from elo_engine import EloEngine
+from local_backend import refresh_head_to_head, refresh_player_stats
+
+SEASON_DAYS = 90
+START_DATE = np.datetime64("2025-01-06T00:00:00")
+GT_SIZE = 16            # Joueurs par Grand Tournoi (4 poules de 4, arbre à 8)
+WEEKLY_SIZE = 12
+
+# Poule A : vainqueur de chaque paire (indices dans la poule), 0 > 1 > 2 > 0 et tous > 3
+TIE_CYCLE = {(0, 1): 0, (1, 2): 1, (0, 2): 2, (0, 3): 0, (1, 3): 1, (2, 3): 2}
+
+
+def _players_per_club(n_matches):
+    return int(np.clip(n_matches // 25, 10, 2000))
+
+
+def _draw_players(rng, weights, n_matches, width):
+    """Tirage des joueurs de chaque match (colonnes distinctes sur une même ligne)."""
+    n_players = len(weights)
+    slots = rng.choice(n_players, size=(n_matches, width), p=weights)
+    while True:
+        sorted_slots = np.sort(slots, axis=1)
+        clash = (np.diff(sorted_slots, axis=1) == 0).any(axis=1)
+        if not clash.any():
+            return slots
+        slots[clash] = rng.choice(n_players, size=(int(clash.sum()), width), p=weights)
+
+
+def _timestamps(rng, n_matches, n_days):
+    """Dates croissantes, en soirée (17h-23h UTC), au format Supabase."""
+    days = np.sort(rng.integers(0, n_days, n_matches))
+    seconds = rng.integers(17 * 3600, 23 * 3600, n_matches)
+    times = START_DATE + days.astype("timedelta64[D]") + seconds.astype("timedelta64[s]")
+    times = np.sort(times)
+    return [f"{t}+00:00" for t in np.datetime_as_string(times, unit="s")]
+
+
+def generate_club(n_matches, n_players=None, n_seasons=3, share_2v2=0.25, seed=0):
+    """
+    Club synthétique de n_matches matchs. Retourne un dict {table: lignes} prêt pour
+    load_club, plus des repères pour les benchmarks : "busiest" (joueur le plus actif),
+    "rival" (son adversaire le plus fréquent), "tournament_id", "tie_group".
+    """
+    rng = np.random.default_rng(seed)
+    n_players = n_players or _players_per_club(n_matches)
+    ids = [f"player-{i:05d}" for i in range(n_players)]
+    skill = rng.normal(0, 150, n_players)
+    activity = rng.pareto(1.5, n_players) + 1
+    weights = activity / activity.sum()
+
+    # --- MATCHS ---
+    is_2v2 = rng.random(n_matches) < share_2v2
+    slots = _draw_players(rng, weights, n_matches, 4)
+    strength_a = np.where(is_2v2, (skill[slots[:, 0]] + skill[slots[:, 1]]) / 2, skill[slots[:, 0]])
+    strength_b = np.where(is_2v2, (skill[slots[:, 2]] + skill[slots[:, 3]]) / 2, skill[slots[:, 2]])
+    a_wins = rng.random(n_matches) < 1 / (1 + 10 ** ((strength_b - strength_a) / 400))
+    winners = np.where(a_wins[:, None], slots[:, :2], slots[:, 2:])
+    losers = np.where(a_wins[:, None], slots[:, 2:], slots[:, :2])
+
+    created_at = _timestamps(rng, n_matches, SEASON_DAYS * (n_seasons + 1))
+    season_of = np.minimum(np.arange(n_matches) * (n_seasons + 1) // max(n_matches, 1), n_seasons)
+    status_draw = rng.random(n_matches)
+
+    matches = []
+    for i in range(n_matches):
+        two = bool(is_2v2[i])
+        archived = season_of[i] < n_seasons
+        if archived:
+            status = "archived"
+        else:
+            status = "pending" if status_draw[i] < 0.03 else "rejected" if status_draw[i] < 0.05 else "validated"
+        w, l = winners[i], losers[i]
+        matches.append({
+            "id": i + 1,
+            "winner_id": ids[w[0]],
+            "loser_id": ids[l[0]],
+            "winner2_id": ids[w[1]] if two else None,
+            "loser2_id": ids[l[1]] if two else None,
+            "mode": "2v2" if two else "1v1",
+            "status": status,
+            "elo_gain": None,
+            "elo_loss": None,
+            "created_by": ids[w[0]],
+            "season_name": f"Saison {season_of[i] + 1}" if archived else None,
+            "created_at": created_at[i],
+        })
+
+    # --- ELOS : rejeu saison par saison, soft reset entre deux saisons ---
+    engine = EloEngine()
+    start = {"1v1": {pid: 1000 for pid in ids}, "2v2": {pid: 1000 for pid in ids}}
+    archives = []
+    ends = start
+    for season in range(n_seasons + 1):
+        played = [m for m, s in zip(matches, season_of) if s == season and m["status"] in ("validated", "archived")]
+        replay = engine.replay_season(played, start["1v1"], start["2v2"])
+        for m, gain, loss in zip(played, replay["gains"], replay["losses"]):
+            m["elo_gain"], m["elo_loss"] = int(gain), int(loss)
+        ends = {mode: {pid: int(round(elo)) for pid, elo in replay[f"elo_{mode}"].items()} for mode in ("1v1", "2v2")}
+        counts = {mode: replay[f"matches_{mode}"] for mode in ("1v1", "2v2")}
+
+        if season < n_seasons:
+            for mode in ("1v1", "2v2"):
+                ranked = sorted((pid for pid in ids if counts[mode][pid] > 0), key=lambda pid: -ends[mode][pid])
+                archives += [
+                    {
+                        "season_name": f"Saison {season + 1}",
+                        "player_id": pid,
+                        "username": f"Joueur {pid[-5:]}",
+                        "final_elo": ends[mode][pid],
+                        "matches_played": counts[mode][pid],
+                        "final_rank": rank,
+                        "mode": mode,
+                    }
+                    for rank, pid in enumerate(ranked, 1)
+                ]
+            start = {mode: {pid: int(rating_log.soft_reset(elo)) for pid, elo in ends[mode].items()} for mode in ("1v1", "2v2")}
+
+    profiles = [
+        {
+            "id": pid,
+            "username": f"Joueur {pid[-5:]}",
+            "elo_rating": ends["1v1"][pid],
+            "matches_played": counts["1v1"][pid],
+            "elo_2v2": ends["2v2"][pid],
+            "matches_2v2": counts["2v2"][pid],
+            "is_admin": pid == ids[0],
+        }
+        for pid in ids
+    ]
+
+    # --- TOURNOIS ---
+    gt_count = max(1, n_matches // 5000)
+    weekly_count = max(1, n_matches // 2000)
+    tournaments, participants, gt_matches = _grand_tournaments(rng, ids, gt_count)
+    weeklies, weekly_participants = _weeklies(rng, ids, weekly_count)
+
+    counted = [m for m in matches if m["status"] in ("validated", "archived")]
+    busiest = ids[int(np.argmax(weights))]
+    rival_counts = {}
+    for m in counted:
+        players = (m["winner_id"], m["loser_id"], m["winner2_id"], m["loser2_id"])
+        if busiest in players:
+            for pid in players:
+                if pid and pid != busiest:
+                    rival_counts[pid] = rival_counts.get(pid, 0) + 1
+    rival = max(rival_counts, key=rival_counts.get) if rival_counts else ids[1]
+
+    return {
+        "profiles": profiles,
+        "matches": matches,
+        "season_archives": archives,
+        "grand_tournaments": tournaments,
+        "gt_participants": participants,
+        "gt_matches": gt_matches,
+        "weekly_tournaments": weeklies,
+        "weekly_participants": weekly_participants,
+        "trainings": [{"id": 1, "name": "Entraînement", "description": "", "max_players": 8,
+                       "event_date": "2026-10-20T18:00:00", "status": "active"}],
+        "training_participants": [{"training_id": 1, "user_id": pid} for pid in ids[:6]],
+        "busiest": busiest,
+        "rival": rival,
+        "tournament_id": gt_count,
+        "tie_group": "A",
+    }
+
+
+def _score(rng):
+    return 3, int(rng.integers(0, 3))
+
+
+def _grand_tournaments(rng, ids, count):
+    """Grands Tournois terminés : 4 poules de 4 puis arbre à 8 (avec petite finale)."""
+    tournaments, participants, matches = [], [], []
+    for t_id in range(1, count + 1):
+        players = list(rng.choice(ids, size=min(GT_SIZE, len(ids)), replace=False))
+        tournaments.append({"id": t_id, "name": f"Grand Tournoi {t_id}", "format": "single_elimination", "status": "bracket"})
+        qualified = []
+        for g_index, group in enumerate(("A", "B", "C", "D")):
+            members = players[g_index * 4:(g_index + 1) * 4]
+            participants += [{"tournament_id": t_id, "user_id": pid, "group_name": group} for pid in members]
+            wins = {pid: 0 for pid in members}
+            for (i1, p1), (i2, p2) in itertools.combinations(enumerate(members), 2):
+                if group == "A" and len(members) == 4:
+                    # Poule A : les trois premiers se battent en cycle, même score partout
+                    # (égalité parfaite en tête : barrage à créer)
+                    winner = members[TIE_CYCLE[(i1, i2)]]
+                    s_win, s_lose = 3, 1
+                else:
+                    winner = p1 if rng.random() < 0.5 else p2
+                    s_win, s_lose = _score(rng)
+                loser = p2 if winner == p1 else p1
+                wins[winner] += 1
+                matches.append({
+                    "tournament_id": t_id, "phase": "group", "group_name": group, "bracket_match_id": None,
+                    "player1_id": p1, "player2_id": p2,
+                    "score1": s_win if winner == p1 else s_lose, "score2": s_win if winner == p2 else s_lose,
+                    "winner_id": winner, "loser_id": loser, "status": "completed", "tie_break_round": 0,
+                })
+            qualified += sorted(members, key=lambda pid: -wins[pid])[:2]
+
+        # Arbre : quarts, demies, finale (M1) et petite finale (M2)
+        round_players, r_num, semi_losers = qualified, 1, []
+        while len(round_players) > 1:
+            next_players = []
+            for m_num, (p1, p2) in enumerate(zip(round_players[::2], round_players[1::2]), 1):
+                winner, loser = (p1, p2) if rng.random() < 0.5 else (p2, p1)
+                s_win, s_lose = _score(rng)
+                matches.append({
+                    "tournament_id": t_id, "phase": "bracket", "group_name": None, "bracket_match_id": f"WB_R{r_num}_M{m_num}",
+                    "player1_id": p1, "player2_id": p2,
+                    "score1": s_win if winner == p1 else s_lose, "score2": s_win if winner == p2 else s_lose,
+                    "winner_id": winner, "loser_id": loser, "status": "completed", "tie_break_round": 0,
+                })
+                next_players.append(winner)
+                if len(round_players) == 4:
+                    semi_losers.append(loser)
+            round_players, r_num = next_players, r_num + 1
+        if len(semi_losers) == 2:
+            p1, p2 = semi_losers
+            matches.append({
+                "tournament_id": t_id, "phase": "bracket", "group_name": None, "bracket_match_id": f"WB_R{r_num - 1}_M2",
+                "player1_id": p1, "player2_id": p2, "score1": 3, "score2": 1,
+                "winner_id": p1, "loser_id": p2, "status": "completed", "tie_break_round": 0,
+            })
+    return tournaments, participants, matches
+
+
+def _weeklies(rng, ids, count):
+    """Weekly Fun clôturés (rangs finaux) et un Weekly ouvert avec ses inscrits."""
+    weeklies, participants = [], []
+    for w_id in range(1, count + 1):
+        closed = w_id < count
+        event_date = str(START_DATE.astype("datetime64[D]") + np.timedelta64(7 * w_id, "D"))
+        weeklies.append({"id": w_id, "name": f"Weekly {w_id}", "description": "", "max_players": WEEKLY_SIZE,
+                         "event_date": event_date, "status": "closed" if closed else "open"})
+        players = rng.choice(ids, size=min(WEEKLY_SIZE, len(ids)), replace=False)
+        participants += [
+            {"tournament_id": w_id, "user_id": pid, "status": "registered", "final_rank": rank if closed else None}
+            for rank, pid in enumerate(players, 1)
+        ]
+    return weeklies, participants
+
+
+TABLES = (
+    "profiles", "matches", "season_archives", "grand_tournaments", "gt_participants", "gt_matches",
+    "weekly_tournaments", "weekly_participants", "trainings", "training_participants",
+)
+
+
+def load_club(client, club):
+    """Insère le club dans un LocalClient (insertions groupées), puis remplit les tables dérivées."""
+    with client.lock:
+        client.conn.execute("BEGIN")
+        for table in TABLES:
+            rows = club[table]
+            if not rows:
+                continue
+            columns = list(rows[0])
+            client.conn.executemany(
+                f'insert into "{table}" ({", ".join(columns)}) values ({", ".join("?" * len(columns))})',
+                (tuple(client.encode(table, row).values()) for row in rows),
+            )
+        client.conn.execute("COMMIT")
+
+    # Face-à-face et statistiques des joueurs utilisés par les benchmarks (comme les triggers)
+    pair = {"winner_id": club["busiest"], "loser_id": club["rival"], "mode": "1v1"}
+    client.transaction(lambda conn: (
+        refresh_head_to_head(conn, pair),
+        refresh_head_to_head(conn, {**pair, "mode": "2v2"}),
+        refresh_player_stats(conn, [club["busiest"], club["rival"]]),
+    ))
+    return client
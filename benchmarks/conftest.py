@@ -0,0 +1,29 @@
+# --- benchmarks/conftest.py ---
+# Un club synthétique par taille (BENCH_SIZES, en nombre de matchs), généré une fois
+# pour toute la session et chargé dans une base SQLite en mémoire (local_backend).
+#   BENCH_SIZES=100,10000 python -m pytest benchmarks      (rapide, sans le club à 10⁶)
+
+import os
+
+import pytest
+
+from club_generator import generate_club, load_club
+from DB_manager import DBManager
+from local_backend import LocalClient
+
+SIZES = [int(n) for n in os.environ.get("BENCH_SIZES", "100,10000,1000000").split(",")]
+
+
+@pytest.fixture(scope="session", params=SIZES, ids=lambda n: f"{n}_matchs")
+def club(request):
+    data = generate_club(request.param)
+    data["client"] = load_club(LocalClient(), data)
+    return data
+
+
+@pytest.fixture(scope="session")
+def db(club):
+    db = DBManager(client=club["client"])
+    # Cache de lecture désactivé : chaque appel mesuré va jusqu'à la base
+    db.CACHE_TTL = 0
+    return db
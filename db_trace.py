@@ -0,0 +1,243 @@
+# --- db_trace.py ---
+# Mesure des accès à la base : combien de requêtes une page fait, combien de temps
+# elles prennent, combien de lignes et d'octets elles ramènent.
+#   - chaque méthode publique de DBManager est enveloppée (@traced) : appels et durée ;
+#   - le client Supabase rendu par DBManager.supabase est enveloppé (TracedClient) :
+#     chaque .execute() de db.supabase.table(...) / .rpc(...) est mesuré, y compris
+#     les appels directs des pages, et rattaché à la méthode DBManager en cours.
+# Les mesures sont rangées par rerun dans la session (les HISTORY_SIZE derniers) et
+# cumulées par page pour tout le processus. Affichage : Panel Admin > "⏱️ Performance".
+# Hors d'un script Streamlit (tests, scripts), rien n'est enregistré.
+
+import inspect
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import wraps
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+STATE_KEY = "db_trace"
+HISTORY_SIZE = 50          # Reruns gardés par session
+NO_PAGE = "(avant le menu)"  # Connexion, annonce de changement de rang...
+QUERY_VERBS = ("select", "insert", "update", "upsert", "delete")
+
+_page_totals = {}
+_page_lock = threading.Lock()
+
+
+class Trace:
+    """Mesures d'une session : rerun en cours, reruns précédents, pile des méthodes en cours."""
+
+    def __init__(self):
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self.run = None
+        self.stack = []
+
+
+def _new_run():
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "page": None,
+        "methods": [],
+        "queries": [],
+    }
+
+
+def current():
+    """Trace de la session en cours (None hors d'un script Streamlit ou avant begin_rerun)."""
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    trace = st.session_state.get(STATE_KEY)
+    return trace if trace is not None and trace.run is not None else None
+
+
+def run_summary(run):
+    """Totaux d'un rerun : requêtes, durée cumulée (ms), lignes et octets reçus."""
+    queries = run["queries"]
+    return {
+        "started_at": run["started_at"],
+        "page": run["page"] or NO_PAGE,
+        "queries": len(queries),
+        "db_methods": sum(1 for m in run["methods"] if m["depth"] == 0),
+        "ms": round(sum(q["ms"] for q in queries), 1),
+        "rows": sum(q["rows"] for q in queries),
+        "bytes": sum(q["bytes"] for q in queries),
+    }
+
+
+def begin_rerun():
+    """Début d'un rerun complet (haut de app.py) : le rerun précédent passe dans l'historique."""
+    trace = st.session_state.get(STATE_KEY)
+    if trace is None:
+        trace = st.session_state[STATE_KEY] = Trace()
+
+    # Les reruns de fragments n'exécutent pas app.py : leurs requêtes s'ajoutent au rerun de la page
+    previous = trace.run
+    if previous is not None and (previous["queries"] or previous["methods"]):
+        trace.history.append(previous)
+        summary = run_summary(previous)
+        with _page_lock:
+            totals = _page_totals.setdefault(summary["page"], {"reruns": 0, "queries": 0, "ms": 0.0, "rows": 0, "bytes": 0})
+            totals["reruns"] += 1
+            for field in ("queries", "ms", "rows", "bytes"):
+                totals[field] += summary[field]
+
+    trace.run = _new_run()
+    trace.stack = []
+
+
+def set_page(page):
+    """Page affichée par le rerun en cours (choix du menu)."""
+    trace = current()
+    if trace is not None:
+        trace.run["page"] = page
+
+
+def history():
+    """Reruns terminés de la session en cours, du plus ancien au plus récent."""
+    trace = st.session_state.get(STATE_KEY)
+    return list(trace.history) if trace is not None else []
+
+
+def page_totals():
+    """Cumul par page pour tout le processus (toutes sessions confondues)."""
+    with _page_lock:
+        return {page: dict(totals) for page, totals in _page_totals.items()}
+
+
+def export_json(extra=None):
+    """Historique de la session et cumul par page, en JSON (suivi des régressions)."""
+    return json.dumps(
+        {
+            "exported_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "reruns": [{**run_summary(run), "methods": run["methods"], "queries": run["queries"]} for run in history()],
+            "pages": page_totals(),
+            **(extra or {}),
+        },
+        ensure_ascii=False,
+        indent=2,
+        default=str,
+    )
+
+
+# =========================================================
+# MÉTHODES DE DBMANAGER
+# =========================================================
+
+def _trace_method(name, function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        trace = current()
+        if trace is None:
+            return function(*args, **kwargs)
+
+        run = trace.run
+        depth = len(trace.stack)
+        first_query = len(run["queries"])
+        trace.stack.append(name)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            trace.stack.pop()
+            run["methods"].append({
+                "method": name,
+                "depth": depth,
+                "ms": round((time.perf_counter() - start) * 1000, 2),
+                "queries": len(run["queries"]) - first_query,
+            })
+
+    return wrapper
+
+
+def traced(cls):
+    """Décorateur de classe : mesure toutes les méthodes publiques (hors propriétés)."""
+    for name, attr in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(attr):
+            setattr(cls, name, _trace_method(name, attr))
+    return cls
+
+
+# =========================================================
+# CLIENT SUPABASE
+# =========================================================
+
+def _record_query(table, operation, elapsed, response, error):
+    trace = current()
+    if trace is None:
+        return
+    data = getattr(response, "data", None)
+    if isinstance(data, list):
+        rows = len(data)
+    else:
+        rows = 1 if data else 0
+    trace.run["queries"].append({
+        "table": table,
+        "operation": operation or "?",
+        "method": trace.stack[-1] if trace.stack else None,
+        "ms": round(elapsed * 1000, 2),
+        "rows": rows,
+        "bytes": len(json.dumps(data, default=str)) if data is not None else 0,
+        "error": error,
+    })
+
+
+class TracedQuery:
+    """Requête postgrest en construction : les appels chaînés sont transmis, execute() est mesuré."""
+
+    __slots__ = ("_builder", "_table", "_operation")
+
+    def __init__(self, builder, table, operation=None):
+        self._builder = builder
+        self._table = table
+        self._operation = operation
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        operation = self._operation or (name if name in QUERY_VERBS else None)
+        if not callable(attr):
+            # ex. .not_ (propriété qui renvoie la requête)
+            return TracedQuery(attr, self._table, operation) if hasattr(attr, "execute") else attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return TracedQuery(result, self._table, operation) if hasattr(result, "execute") else result
+
+        return call
+
+    def execute(self):
+        response, error = None, None
+        start = time.perf_counter()
+        try:
+            response = self._builder.execute()
+            return response
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            _record_query(self._table, self._operation, time.perf_counter() - start, response, error)
+
+
+class TracedClient:
+    """Client Supabase (ou local_backend.LocalClient) dont les requêtes sont mesurées."""
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name):
+        return TracedQuery(self._client.table(name), name)
+
+    from_ = table
+
+    def rpc(self, function, *args, **kwargs):
+        return TracedQuery(self._client.rpc(function, *args, **kwargs), f"rpc:{function}", "rpc")
+
+    def __getattr__(self, name):
+        # auth, storage, transaction (LocalClient)... passent tels quels
+        return getattr(self._client, name)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class EloEngine:
     def __init__(self, initial_elo=1000):
         self.initial_elo = initial_elo
@@ -21,4 +24,112 @@ class EloEngine:
         new_loser_elo = loser_elo + perte 
 
         # On retourne 4 valeurs : Nouveaux Elos, le Gain (positif), et la Perte (en valeur absolue)
-        return new_winner_elo, new_loser_elo, gain, abs(perte)
\ No newline at end of file
+        return new_winner_elo, new_loser_elo, gain, abs(perte)
+
+    def compute_batch(self, winner_elos, loser_elos):
+        """
+        Version vectorisée de compute_new_ratings (même formule, mêmes arrondis).
+        Prend deux tableaux d'Elos et retourne 4 tableaux NumPy :
+        nouveaux Elos vainqueurs, nouveaux Elos vaincus, gains (int) et pertes (int, positives).
+        """
+        winner_elos = np.asarray(winner_elos, dtype=np.float64)
+        loser_elos = np.asarray(loser_elos, dtype=np.float64)
+
+        exp_winner = 1 / (1 + 10 ** ((loser_elos - winner_elos) / self.diviseur))
+        exp_loser = 1 / (1 + 10 ** ((winner_elos - loser_elos) / self.diviseur))
+
+        # np.rint arrondit "au pair le plus proche", exactement comme round() en Python
+        gains = np.rint(self.k_win * (1 - exp_winner)).astype(np.int64)
+        pertes = np.rint(self.k_loss * (0 - exp_loser)).astype(np.int64)
+
+        return winner_elos + gains, loser_elos + pertes, gains, np.abs(pertes)
+
+    def compute_team_batch(self, winner1_elos, winner2_elos, loser1_elos, loser2_elos):
+        """Version vectorisée du calcul 2v2 (moyenne des équipes). Retourne (gains, pertes)."""
+        team_win_avg = (np.asarray(winner1_elos, dtype=np.float64) + np.asarray(winner2_elos, dtype=np.float64)) / 2
+        team_lose_avg = (np.asarray(loser1_elos, dtype=np.float64) + np.asarray(loser2_elos, dtype=np.float64)) / 2
+
+        _, _, gains, pertes = self.compute_batch(team_win_avg, team_lose_avg)
+        return gains, pertes
+
+    def replay_season(self, matches, start_elos_1v1, start_elos_2v2):
+        """
+        Rejoue toute une saison en un seul appel.
+
+        matches : liste chronologique de matchs (lignes de la table 'matches').
+        start_elos_1v1 / start_elos_2v2 : {player_id: Elo de départ}.
+
+        Les matchs sont regroupés en "vagues" : deux matchs d'une même vague n'ont aucun
+        joueur en commun, on peut donc les calculer ensemble avec compute_batch sans
+        changer le résultat du rejeu match par match.
+        Un match dont un joueur est inconnu est ignoré (gain et perte à 0).
+
+        Retourne un dict :
+            "gains", "losses" : tableaux NumPy alignés sur `matches`
+            "elo_1v1", "elo_2v2" : {player_id: Elo final}
+            "matches_1v1", "matches_2v2" : {player_id: nombre de matchs joués}
+        """
+        gains = np.zeros(len(matches), dtype=np.int64)
+        losses = np.zeros(len(matches), dtype=np.int64)
+        result = {"gains": gains, "losses": losses}
+
+        for mode, start_elos in (("1v1", start_elos_1v1), ("2v2", start_elos_2v2)):
+            columns = ["winner_id", "loser_id"] if mode == "1v1" else ["winner_id", "winner2_id", "loser_id", "loser2_id"]
+            player_ids = list(start_elos.keys())
+            index = {pid: i for i, pid in enumerate(player_ids)}
+            ratings = np.array([start_elos[pid] for pid in player_ids], dtype=np.float64)
+            counts = np.zeros(len(player_ids), dtype=np.int64)
+
+            # 1. On garde les matchs du mode dont tous les joueurs sont connus
+            rows = []
+            slots = []
+            for i, m in enumerate(matches):
+                if (m.get("mode") or "1v1") != mode:
+                    continue
+                pids = [m.get(col) for col in columns]
+                if all(pid in index for pid in pids):
+                    rows.append(i)
+                    slots.append([index[pid] for pid in pids])
+
+            if rows:
+                rows = np.array(rows, dtype=np.int64)
+                slots = np.array(slots, dtype=np.int64)
+
+                # 2. Numéro de vague : 1 + la vague du dernier match de chacun des joueurs
+                last_wave = np.full(len(player_ids), -1, dtype=np.int64)
+                waves = np.empty(len(rows), dtype=np.int64)
+                for j, players in enumerate(slots):
+                    wave = last_wave[players].max() + 1
+                    waves[j] = wave
+                    last_wave[players] = wave
+
+                order = np.argsort(waves, kind="stable")
+                bounds = np.cumsum(np.bincount(waves))
+
+                # 3. Calcul vague par vague (aucun joueur en double dans une vague)
+                start = 0
+                for end in bounds:
+                    sel = order[start:end]
+                    start = end
+                    s = slots[sel]
+
+                    if mode == "1v1":
+                        new_w, new_l, g, l = self.compute_batch(ratings[s[:, 0]], ratings[s[:, 1]])
+                        ratings[s[:, 0]] = new_w
+                        ratings[s[:, 1]] = new_l
+                    else:
+                        g, l = self.compute_team_batch(ratings[s[:, 0]], ratings[s[:, 1]], ratings[s[:, 2]], ratings[s[:, 3]])
+                        ratings[s[:, 0]] += g
+                        ratings[s[:, 1]] += g
+                        ratings[s[:, 2]] -= l
+                        ratings[s[:, 3]] -= l
+
+                    gains[rows[sel]] = g
+                    losses[rows[sel]] = l
+
+                counts = np.bincount(slots.ravel(), minlength=len(player_ids))
+
+            result[f"elo_{mode}"] = {pid: float(ratings[i]) for pid, i in index.items()}
+            result[f"matches_{mode}"] = {pid: int(counts[i]) for pid, i in index.items()}
+
+        return result
@@ -0,0 +1,78 @@
+# --- head_to_head.py ---
+# Face-à-face entre deux joueurs (table "head_to_head", page Comparateur).
+# Même définition que les fonctions SQL de supabase/migrations/20261018130000_head_to_head.sql :
+# une ligne par (player_a, player_b, mode, relation) du point de vue de A, dans les deux sens.
+
+COUNTED_STATUSES = ("validated", "archived")
+
+VERSUS = "versus"      # A et B dans des équipes opposées
+PARTNERS = "partners"  # A et B dans la même équipe (2v2)
+
+
+def match_pairs(match):
+    """Paires d'un match du point de vue de chaque joueur : [(a, b, relation, a_gagne)]."""
+    winners = [pid for pid in (match.get("winner_id"), match.get("winner2_id")) if pid]
+    losers = [pid for pid in (match.get("loser_id"), match.get("loser2_id")) if pid]
+    pairs = []
+    for w in winners:
+        for l in losers:
+            pairs.append((w, l, VERSUS, True))
+            pairs.append((l, w, VERSUS, False))
+    for team, won in ((winners, True), (losers, False)):
+        if len(team) == 2:
+            pairs.append((team[0], team[1], PARTNERS, won))
+            pairs.append((team[1], team[0], PARTNERS, won))
+    return pairs
+
+
+def elo_delta(match, relation, won):
+    """Bilan Elo d'un match pour A (versus : +/- elo_gain ; partners : +elo_gain / -elo_loss)."""
+    if won:
+        return match.get("elo_gain") or 0
+    if relation == VERSUS:
+        return -(match.get("elo_gain") or 0)
+    return -(match.get("elo_loss") or 0)
+
+
+def empty_row(a, b, mode, relation):
+    return {
+        "player_a": a,
+        "player_b": b,
+        "mode": mode,
+        "relation": relation,
+        "wins": 0,
+        "losses": 0,
+        "elo_swapped": 0,
+        "streak": 0,
+        "last_played_at": None,
+    }
+
+
+def build(matches):
+    """
+    Face-à-face complets à partir d'une liste de matchs (rejeu chronologique).
+    Retourne {(a, b, mode, relation): ligne}.
+    """
+    rows = {}
+    counted = [m for m in matches if m.get("status") in COUNTED_STATUSES]
+    for m in sorted(counted, key=lambda m: (m["created_at"], m["id"])):
+        mode = m.get("mode") or "1v1"
+        for a, b, relation, won in match_pairs(m):
+            key = (a, b, mode, relation)
+            row = rows.get(key) or rows.setdefault(key, empty_row(*key))
+            row["wins" if won else "losses"] += 1
+            row["elo_swapped"] += elo_delta(m, relation, won)
+            step = 1 if won else -1
+            row["streak"] = row["streak"] + step if row["streak"] * step > 0 else step
+            row["last_played_at"] = m["created_at"]
+    return rows
+
+
+def streak_info(row):
+    """(longueur de la série en cours, "p1" / "p2" / None) pour l'affichage du comparateur."""
+    streak = row["streak"] if row else 0
+    if streak > 0:
+        return streak, "p1"
+    if streak < 0:
+        return -streak, "p2"
+    return 0, None
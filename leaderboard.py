@@ -0,0 +1,81 @@
+# --- leaderboard.py ---
+# Classement de la saison en cours découpé en fenêtres (top, autour de moi, pages) :
+# le DataFrame est préparé en opérations vectorisées, et seules les lignes affichées
+# sont transformées en HTML, quelle que soit la taille du club.
+
+import numpy as np
+import pandas as pd
+
+from luxury_table import player_cell
+from ranks_config import RANK_TIERS
+
+TOP_SIZE = 10       # Joueurs affichés en tête de classement
+AROUND_RADIUS = 2   # Voisins affichés au-dessus et en dessous du joueur connecté
+PAGE_SIZE = 25      # Taille d'une page du classement complet
+
+HIDDEN_NAME = "🕵️ Joueur Masqué"
+
+_THRESHOLDS = np.array([tier["threshold"] for tier in RANK_TIERS])
+
+
+def tier_ids(elos):
+    """Id du rang (sans tampon de maintien) pour un tableau d'Elos."""
+    return np.clip(np.searchsorted(_THRESHOLDS, elos, side="right") - 1, 0, len(RANK_TIERS) - 1)
+
+
+def ranking_frame(rows, elo_col, count_col, viewer_id=None):
+    """
+    Classement des joueurs actifs (au moins un match dans le mode) :
+    colonnes rank, id, username (anonymisé sauf pour le lecteur), elo, matches, tier.
+    Ordre : Elo décroissant, égalités départagées par l'identifiant (même ordre que RankIndex).
+    """
+    df = pd.DataFrame(rows, columns=["id", "username", elo_col, count_col, "is_hidden_leaderboard"])
+    df[count_col] = df[count_col].fillna(0)
+    df = df[df[count_col] > 0]
+    if df.empty:
+        return pd.DataFrame(columns=["rank", "id", "username", "elo", "matches", "tier"])
+
+    df = df.assign(elo=df[elo_col].fillna(1000), matches=df[count_col])
+    df = df.sort_values(["elo", "id"], ascending=[False, True], kind="stable").reset_index(drop=True)
+
+    # --- ANONYMISATION ---
+    hidden = df["is_hidden_leaderboard"].fillna(False).astype(bool) & (df["id"] != viewer_id)
+    df["username"] = df["username"].where(~hidden, HIDDEN_NAME)
+
+    df["rank"] = np.arange(1, len(df) + 1)
+    df["tier"] = tier_ids(df["elo"].to_numpy())
+    return df[["rank", "id", "username", "elo", "matches", "tier"]]
+
+
+def top(df, size=TOP_SIZE):
+    return df.iloc[:size]
+
+
+def page(df, number, size=PAGE_SIZE):
+    """Page `number` (à partir de 1) du classement."""
+    start = (number - 1) * size
+    return df.iloc[start:start + size]
+
+
+def page_count(df, size=PAGE_SIZE):
+    return max(1, -(-len(df) // size))
+
+
+def around(df, player_id, radius=AROUND_RADIUS):
+    """Joueurs autour de player_id (lui compris) ; vide s'il n'est pas classé."""
+    positions = np.flatnonzero(df["id"].to_numpy() == player_id)
+    if len(positions) == 0:
+        return df.iloc[:0]
+    pos = positions[0]
+    return df.iloc[max(0, pos - radius):pos + radius + 1]
+
+
+def table_rows(df):
+    """Lignes du tableau VIP (draw_luxury_table) pour une fenêtre du classement."""
+    points = "<b>" + df["elo"].astype(int).astype(str) + "</b> <span style='color: #ffd700;'>⭐️</span>"
+    matches = df["matches"].astype(int).astype(str) + " 🎮"
+    players = [player_cell(RANK_TIERS[t], name) for t, name in zip(df["tier"], df["username"])]
+    return [
+        {"Rang": rank, "Joueur": player, "Points Elo": pts, "Matchs": nb}
+        for rank, player, pts, nb in zip(df["rank"].tolist(), players, points.tolist(), matches.tolist())
+    ]
@@ -0,0 +1,911 @@
+# --- local_backend.py ---
+# Doublure locale de Supabase sur SQLite, pour les tests et le profilage sans réseau.
+# Les fonctions Postgres appelées par RPC (supabase/migrations/) y sont réécrites en Python
+# et exécutées dans une transaction SQLite, avec le même résultat.
+# Les tables (profils, matchs, archives, Grand Tournoi, Weekly, entraînements...) s'utilisent
+# comme avec supabase-py (client.table("matches").select(...).eq(...).execute(), voir LocalQuery) :
+# DBManager tourne tel quel dessus, ce qui permet profilage et benchmarks sans latence réseau.
+# Les triggers de la table matches (face-à-face, statistiques joueurs) sont rejoués après
+# chaque insert / update de match (voir on_match_write).
+# Seule l'authentification (client.auth) n'a pas d'équivalent.
+#
+#   from local_backend import LocalClient
+#   db = DBManager(client=LocalClient())            # en mémoire
+#   db = DBManager(client=LocalClient("club.db"))   # fichier SQLite
+
+import json
+import re
+import sqlite3
+import threading
+import uuid
+
+from elo_engine import EloEngine
+import rating_log
+import head_to_head
+import player_stats
+
+SCHEMA = """
+create table if not exists profiles (
+    id text primary key,
+    username text,
+    elo_rating integer default 1000,
+    matches_played integer default 0,
+    elo_2v2 integer default 1000,
+    matches_2v2 integer default 0,
+    is_admin boolean default 0,
+    is_ghost boolean default 0,
+    is_hidden_leaderboard boolean default 0,
+    is_hidden_profile boolean default 0,
+    equipped_title text,
+    last_seen_elo_1v1 integer,
+    last_seen_elo_2v2 integer,
+    current_rank_id_1v1 integer,
+    current_rank_id_2v2 integer,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists matches (
+    id integer primary key autoincrement,
+    winner_id text,
+    loser_id text,
+    winner2_id text,
+    loser2_id text,
+    mode text default '1v1',
+    status text default 'pending',
+    elo_gain integer,
+    elo_loss integer,
+    created_by text,
+    season_name text,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists rating_events (
+    id integer primary key autoincrement,
+    match_id integer,
+    player_id text,
+    mode text,
+    kind text,
+    rating_before real,
+    rating_after real,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists rating_checkpoints (
+    id integer primary key autoincrement,
+    mode text,
+    cutoff_at text,
+    last_match_id integer,
+    ratings json,
+    counts json,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists head_to_head (
+    player_a text not null,
+    player_b text not null,
+    mode text not null,
+    relation text not null,
+    wins integer not null default 0,
+    losses integer not null default 0,
+    elo_swapped integer not null default 0,
+    streak integer not null default 0,
+    last_played_at text,
+    primary key (player_a, player_b, mode, relation)
+);
+create table if not exists player_stats (
+    player_id text primary key,
+    matches integer not null default 0,
+    wins integer not null default 0,
+    win_streak integer not null default 0,
+    giant_kills integer not null default 0,
+    max_daily_matches integer not null default 0,
+    last_day text,
+    last_day_matches integer not null default 0,
+    last_match_at text,
+    last_loss_at text,
+    last_loss_id integer
+);
+create table if not exists player_stats_daily (
+    player_id text not null,
+    day text not null,
+    matches integer not null,
+    primary key (player_id, day)
+);
+create table if not exists season_archives (
+    id integer primary key autoincrement,
+    season_name text,
+    player_id text,
+    username text,
+    final_elo integer,
+    matches_played integer,
+    final_rank integer,
+    mode text default '1v1',
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists player_titles (
+    player_id text not null,
+    title text not null,
+    granted_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now')),
+    primary key (player_id, title)
+);
+create table if not exists season_closures (
+    close_key text primary key,
+    season_name text not null,
+    mode text not null,
+    players integer not null default 0,
+    matches integer not null default 0,
+    closed_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists grand_tournaments (
+    id integer primary key autoincrement,
+    name text,
+    format text,
+    status text default 'draft',
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists gt_participants (
+    id integer primary key autoincrement,
+    tournament_id integer,
+    user_id text,
+    group_name text,
+    final_rank integer,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists gt_matches (
+    id integer primary key autoincrement,
+    tournament_id integer,
+    phase text,
+    group_name text,
+    bracket_match_id text,
+    player1_id text,
+    player2_id text,
+    score1 integer,
+    score2 integer,
+    winner_id text,
+    loser_id text,
+    status text default 'pending',
+    tie_break_round integer default 0,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists weekly_tournaments (
+    id integer primary key autoincrement,
+    name text,
+    description text,
+    max_players integer,
+    event_date text,
+    status text default 'open',
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists weekly_participants (
+    id integer primary key autoincrement,
+    tournament_id integer,
+    user_id text,
+    status text default 'registered',
+    final_rank integer,
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists trainings (
+    id integer primary key autoincrement,
+    name text,
+    description text,
+    max_players integer,
+    event_date text,
+    status text default 'active',
+    created_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create table if not exists training_participants (
+    id integer primary key autoincrement,
+    training_id integer,
+    user_id text,
+    registered_at text default (strftime('%Y-%m-%dT%H:%M:%f+00:00', 'now'))
+);
+create index if not exists matches_winner_idx on matches (winner_id, created_at);
+create index if not exists matches_loser_idx on matches (loser_id, created_at);
+create index if not exists matches_winner2_idx on matches (winner2_id, created_at);
+create index if not exists matches_loser2_idx on matches (loser2_id, created_at);
+create index if not exists gt_matches_tournament on gt_matches (tournament_id, phase);
+"""
+
+# Clés étrangères utilisées pour les jointures de select() ("profiles!winner_id(username)")
+FOREIGN_KEYS = {
+    "matches": {
+        "winner_id": "profiles", "loser_id": "profiles", "winner2_id": "profiles",
+        "loser2_id": "profiles", "created_by": "profiles",
+    },
+    "rating_events": {"player_id": "profiles", "match_id": "matches"},
+    "head_to_head": {"player_a": "profiles", "player_b": "profiles"},
+    "player_stats": {"player_id": "profiles"},
+    "player_stats_daily": {"player_id": "profiles"},
+    "season_archives": {"player_id": "profiles"},
+    "player_titles": {"player_id": "profiles"},
+    "gt_participants": {"tournament_id": "grand_tournaments", "user_id": "profiles"},
+    "gt_matches": {
+        "tournament_id": "grand_tournaments", "player1_id": "profiles", "player2_id": "profiles",
+        "winner_id": "profiles", "loser_id": "profiles",
+    },
+    "weekly_participants": {"tournament_id": "weekly_tournaments", "user_id": "profiles"},
+    "training_participants": {"training_id": "trainings", "user_id": "profiles"},
+}
+
+
+class LocalResponse:
+    """Même forme que la réponse de supabase-py (.data, .count)."""
+
+    def __init__(self, data=None, count=None):
+        self.data = data
+        self.count = count
+
+
+class LocalRPC:
+    def __init__(self, function, params):
+        self.function = function
+        self.params = params
+
+    def execute(self):
+        return LocalResponse(self.function(**self.params))
+
+
+class LocalAPIError(Exception):
+    """Erreur d'une requête locale (équivalent de postgrest.APIError)."""
+
+
+# Opérateurs des filtres postgrest ("col.op.valeur" dans or_)
+OPERATORS = {"eq": "=", "neq": "<>", "gt": ">", "gte": ">=", "lt": "<", "lte": "<=", "like": "like", "ilike": "like"}
+
+
+def _split_top_level(text, sep=","):
+    """Découpe sur sep hors parenthèses et guillemets."""
+    parts, depth, quoted, current = [], 0, False, []
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == sep:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return parts
+
+
+def _parse_value(raw):
+    """Valeur d'un filtre écrit en texte ("null", "true", "\"2026-01-01\"", "(a,b)")."""
+    raw = raw.strip()
+    if raw.startswith('"') and raw.endswith('"'):
+        return raw[1:-1]
+    return {"null": None, "true": True, "false": False}.get(raw.lower(), raw)
+
+
+class LocalQuery:
+    """
+    Requête sur une table, avec la même interface chaînée que postgrest-py :
+    select / insert / update / upsert / delete, filtres (eq, neq, gt, gte, lt, lte, like,
+    ilike, in_, is_, not_, or_), order, limit, range, single, maybe_single, puis execute().
+    Les jointures de select ("*, winner:profiles!winner_id(username)", "profiles!inner(...)")
+    suivent FOREIGN_KEYS (relations plusieurs-vers-un uniquement).
+    """
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.operation = "select"
+        self.columns = "*"
+        self.payload = None
+        self.count = None
+        self.on_conflict = None
+        self.ignore_duplicates = False
+        self.filters = []
+        self.params = []
+        self.orders = []
+        self.limit_count = None
+        self.offset_count = None
+        self.single_row = None  # "single" ou "maybe"
+        self.negate_next = False
+
+    # --- Verbes ---
+    def select(self, columns="*", count=None, **kwargs):
+        self.operation, self.columns, self.count = "select", columns, count
+        return self
+
+    def insert(self, json, count=None, upsert=False, **kwargs):
+        self.operation, self.payload, self.count = ("upsert" if upsert else "insert"), json, count
+        return self
+
+    def upsert(self, json, on_conflict="", ignore_duplicates=False, count=None, **kwargs):
+        self.operation, self.payload, self.count = "upsert", json, count
+        self.on_conflict, self.ignore_duplicates = on_conflict, ignore_duplicates
+        return self
+
+    def update(self, json, count=None, **kwargs):
+        self.operation, self.payload, self.count = "update", json, count
+        return self
+
+    def delete(self, count=None, **kwargs):
+        self.operation, self.count = "delete", count
+        return self
+
+    # --- Filtres ---
+    def _column(self, name):
+        if name not in self.client.columns(self.table):
+            raise LocalAPIError(f"Colonne inconnue : {self.table}.{name}")
+        return f'"{name}"'
+
+    def _condition(self, column, op, value):
+        col = self._column(column)
+        if op == "is":
+            value = _parse_value(value) if isinstance(value, str) else value
+            if value is None:
+                return f"{col} is null", []
+            return f"{col} is ?", [value]
+        if op == "in":
+            if isinstance(value, str):
+                value = [_parse_value(v) for v in _split_top_level(value.strip()[1:-1])]
+            value = list(value)
+            if not value:
+                return "0", []
+            return f"{col} in ({','.join('?' * len(value))})", value
+        if op not in OPERATORS:
+            raise LocalAPIError(f"Opérateur non pris en charge : {op}")
+        if op == "ilike":
+            return f"lower({col}) like lower(?)", [str(value).replace("*", "%")]
+        if op == "like":
+            return f"{col} like ?", [str(value).replace("*", "%")]
+        return f"{col} {OPERATORS[op]} ?", [value]
+
+    def _add(self, sql, params):
+        if self.negate_next:
+            sql, self.negate_next = f"not ({sql})", False
+        self.filters.append(sql)
+        self.params.extend(params)
+        return self
+
+    @property
+    def not_(self):
+        self.negate_next = True
+        return self
+
+    def eq(self, column, value):
+        return self._add(*self._condition(column, "eq", value))
+
+    def neq(self, column, value):
+        return self._add(*self._condition(column, "neq", value))
+
+    def gt(self, column, value):
+        return self._add(*self._condition(column, "gt", value))
+
+    def gte(self, column, value):
+        return self._add(*self._condition(column, "gte", value))
+
+    def lt(self, column, value):
+        return self._add(*self._condition(column, "lt", value))
+
+    def lte(self, column, value):
+        return self._add(*self._condition(column, "lte", value))
+
+    def like(self, column, pattern):
+        return self._add(*self._condition(column, "like", pattern))
+
+    def ilike(self, column, pattern):
+        return self._add(*self._condition(column, "ilike", pattern))
+
+    def in_(self, column, values):
+        return self._add(*self._condition(column, "in", values))
+
+    def is_(self, column, value):
+        return self._add(*self._condition(column, "is", value))
+
+    def or_(self, filters, **kwargs):
+        """
+        Filtres postgrest séparés par des virgules : "col.eq.x,col.is.null,col.not.in.(a,b)",
+        groupes imbriqués compris : "col.gt.x,and(col.eq.x,id.gt.5)".
+        """
+        return self._add(*self._logic(filters, "or"))
+
+    def _logic(self, filters, joiner):
+        clauses, params = [], []
+        for item in _split_top_level(filters):
+            if item.startswith(("and(", "or(", "not.and(", "not.or(")):
+                negate = item.startswith("not.")
+                group, _, inner = item[len("not."):].partition("(") if negate else item.partition("(")
+                sql, values = self._logic(inner[:-1], group)
+            else:
+                column, _, rest = item.partition(".")
+                negate = rest.startswith("not.")
+                if negate:
+                    rest = rest[len("not."):]
+                op, _, raw = rest.partition(".")
+                sql, values = self._condition(column, op, raw if op in ("in", "is") else _parse_value(raw))
+            clauses.append(f"not ({sql})" if negate else sql)
+            params.extend(values)
+        return "(" + f" {joiner} ".join(clauses) + ")", params
+
+    # --- Tri et pagination ---
+    def order(self, column, desc=False, nullsfirst=None, **kwargs):
+        if nullsfirst is None:
+            nullsfirst = desc  # Comme Postgres : NULL en dernier en ordre croissant
+        self.orders.append(f"{self._column(column)} {'desc' if desc else 'asc'} nulls {'first' if nullsfirst else 'last'}")
+        return self
+
+    def limit(self, size, **kwargs):
+        self.limit_count = size
+        return self
+
+    def range(self, start, end, **kwargs):
+        self.offset_count, self.limit_count = start, end - start + 1
+        return self
+
+    def single(self):
+        self.single_row = "single"
+        return self
+
+    def maybe_single(self):
+        self.single_row = "maybe"
+        return self
+
+    # --- Exécution ---
+    def _where(self):
+        return (" where " + " and ".join(self.filters)) if self.filters else ""
+
+    def execute(self):
+        with self.client.lock:
+            if self.operation == "select":
+                rows, count = self._run_select()
+            else:
+                rows, count = self._run_write(), None
+        rows = [self.client.decode(self.table, r) for r in rows]
+
+        if self.operation == "select":
+            rows = self.client.embed(self.table, rows, self.columns)
+        if self.count and count is None:
+            count = len(rows)
+
+        if self.single_row:
+            if len(rows) > 1 or (not rows and self.single_row == "single"):
+                raise LocalAPIError(f"{len(rows)} lignes renvoyées pour une requête single() sur {self.table}")
+            return LocalResponse(rows[0] if rows else None, count)
+        return LocalResponse(rows, count)
+
+    def _run_select(self):
+        conn = self.client.conn
+        count = None
+        if self.count:
+            count = conn.execute(f'select count(*) from "{self.table}"{self._where()}', self.params).fetchone()[0]
+        sql = f'select * from "{self.table}"{self._where()}'
+        if self.orders:
+            sql += " order by " + ", ".join(self.orders)
+        if self.limit_count is not None or self.offset_count:
+            sql += f" limit {int(self.limit_count if self.limit_count is not None else -1)} offset {int(self.offset_count or 0)}"
+        return conn.execute(sql, self.params).fetchall(), count
+
+    def _run_write(self):
+        conn = self.client.conn
+        if self.operation == "delete":
+            return conn.execute(f'delete from "{self.table}"{self._where()} returning *', self.params).fetchall()
+
+        if self.operation == "update":
+            values = self.client.encode(self.table, self.payload)
+            assignments = ", ".join(f"{self._column(c)} = ?" for c in values)
+            old = {}
+            if self.table == "matches":
+                old = {r["id"]: dict(r) for r in conn.execute(f'select * from "matches"{self._where()}', self.params)}
+            updated = conn.execute(
+                f'update "{self.table}" set {assignments}{self._where()} returning *',
+                [*values.values(), *self.params],
+            ).fetchall()
+            for row in updated if self.table == "matches" else ():
+                on_match_write(conn, old.get(row["id"]), dict(row))
+            return updated
+
+        # insert / upsert : une instruction par ligne (les colonnes absentes gardent leur défaut)
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        conflict = [c.strip() for c in (self.on_conflict or "").split(",") if c.strip()] or self.client.primary_key(self.table)
+        inserted = []
+        for row in rows:
+            values = self.client.encode(self.table, self.client.with_generated_id(self.table, row))
+            columns = ", ".join(self._column(c) for c in values)
+            sql = f'insert into "{self.table}" ({columns}) values ({", ".join("?" * len(values))})'
+            if self.operation == "upsert":
+                target = ", ".join(self._column(c) for c in conflict)
+                updates = ", ".join(f"{self._column(c)} = excluded.{self._column(c)}" for c in values if c not in conflict)
+                sql += f" on conflict ({target}) do " + ("nothing" if self.ignore_duplicates or not updates else f"update set {updates}")
+            inserted += conn.execute(sql + " returning *", list(values.values())).fetchall()
+        for row in inserted if self.table == "matches" else ():
+            on_match_write(conn, None, dict(row))
+        return inserted
+
+
+class LocalClient:
+    def __init__(self, path=":memory:"):
+        # isolation_level=None : les transactions sont ouvertes à la main (BEGIN IMMEDIATE)
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.functions = {
+            "validate_match": self._validate_match,
+            "close_season": self._close_season,
+            "apply_season_repair": self._apply_season_repair,
+            "revoke_match": self._revoke_match,
+        }
+        self._schema = {}
+
+    # =========================================================
+    # TABLES (même interface que supabase-py : client.table(...).select(...).execute())
+    # =========================================================
+
+    def table(self, name):
+        if not self.columns(name):
+            raise LocalAPIError(f"Table inconnue : {name}")
+        return LocalQuery(self, name)
+
+    from_ = table
+
+    def _table_info(self, name):
+        if name not in self._schema:
+            info = self.conn.execute(f'pragma table_info("{name}")').fetchall()
+            self._schema[name] = {
+                "types": {r["name"]: (r["type"] or "").lower() for r in info},
+                "primary_key": [r["name"] for r in sorted(info, key=lambda r: r["pk"]) if r["pk"]],
+            }
+        return self._schema[name]
+
+    def columns(self, name):
+        """Colonnes d'une table et leur type déclaré ({} si la table n'existe pas)."""
+        return self._table_info(name)["types"]
+
+    def primary_key(self, name):
+        return self._table_info(name)["primary_key"]
+
+    def with_generated_id(self, name, row):
+        # Clé texte (uuid côté Supabase) : on la génère si elle manque
+        if self.columns(name).get("id") == "text" and row.get("id") is None:
+            return {**row, "id": str(uuid.uuid4())}
+        return row
+
+    def encode(self, name, row):
+        """Valeurs Python -> SQLite (listes et dictionnaires en JSON pour les colonnes json)."""
+        types = self.columns(name)
+        return {
+            col: json.dumps(value) if types.get(col) == "json" and value is not None else value
+            for col, value in row.items()
+        }
+
+    def decode(self, name, row):
+        """Ligne SQLite -> dictionnaire au format Supabase (booléens, JSON)."""
+        types = self.columns(name)
+        out = dict(row)
+        for col, value in out.items():
+            if value is None:
+                continue
+            if types.get(col) == "boolean":
+                out[col] = bool(value)
+            elif types.get(col) == "json":
+                out[col] = json.loads(value)
+        return out
+
+    def embed(self, name, rows, columns):
+        """Projection de select() : colonnes demandées et jointures plusieurs-vers-un."""
+        items = _split_top_level(columns or "*")
+        plain = [i for i in items if "(" not in i]
+        embeds = [i for i in items if "(" in i]
+
+        if "*" not in plain:
+            keep = [(alias or col, col) for alias, _, col in (c.rpartition(":") for c in plain)]
+            out = [{key: r.get(col) for key, col in keep} for r in rows]
+        else:
+            out = [dict(r) for r in rows]
+
+        for item in embeds:
+            match = re.match(r"^(?:(\w+):)?(\w+)((?:!\w+)*)\((.*?)\)", item.strip())
+            if not match:
+                raise LocalAPIError(f"Sélection non prise en charge : {item}")
+            alias, target, hints, sub_columns = match.groups()
+            hints = [h for h in hints.split("!") if h]
+            inner = "inner" in hints
+            fks = FOREIGN_KEYS.get(name, {})
+            hinted = [h for h in hints if h != "inner"]
+            fk = hinted[0] if hinted else next((c for c, t in fks.items() if t == target), None)
+            if fks.get(fk) != target:
+                raise LocalAPIError(f"Aucune relation entre {name} et {target}")
+
+            keys = {r.get(fk) for r in rows if r.get(fk) is not None}
+            related = {}
+            if keys:
+                with self.lock:
+                    found = self.conn.execute(
+                        f'select * from "{target}" where id in ({",".join("?" * len(keys))})', list(keys)
+                    ).fetchall()
+                decoded = [self.decode(target, r) for r in found]
+                related = {r["id"]: projected for r, projected in zip(decoded, self.embed(target, decoded, sub_columns))}
+
+            key = alias or target
+            for source, dest in zip(rows, out):
+                dest[key] = related.get(source.get(fk))
+            if inner:
+                # !inner : les lignes sans correspondance sont écartées
+                kept = [(source, dest) for source, dest in zip(rows, out) if dest[key] is not None]
+                rows, out = [s for s, _ in kept], [d for _, d in kept]
+        return out
+
+    def rpc(self, fn, params=None):
+        return LocalRPC(self.functions[fn], params or {})
+
+    def transaction(self, function, *args):
+        """Exécute function(conn, *args) dans une transaction (tout ou rien)."""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = function(self.conn, *args)
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return result
+
+    # =========================================================
+    # FONCTIONS RPC (équivalents des fonctions Postgres)
+    # =========================================================
+
+    def _validate_match(self, p_match_id):
+        """Équivalent de public.validate_match (migration 20261018110000)."""
+        return self.transaction(_validate_match, p_match_id)
+
+    def _close_season(self, p_close_key, p_season, p_mode, p_validated, p_last_match_id, p_profiles, p_archives, p_events, p_ratings, p_titles):
+        """Équivalent de public.close_season (migration 20261018200000)."""
+        return self.transaction(
+            _close_season, p_close_key, p_season, p_mode, p_validated, p_last_match_id,
+            p_profiles, p_archives, p_events, p_ratings, p_titles,
+        )
+
+    def _apply_season_repair(self, p_validated, p_last_match_id, p_matches, p_profiles, p_events):
+        """Équivalent de public.apply_season_repair (migration 20261018200000)."""
+        return self.transaction(_apply_season_repair, p_validated, p_last_match_id, p_matches, p_profiles, p_events)
+
+    def _revoke_match(self, p_match_id, p_validated, p_last_match_id, p_matches, p_profiles, p_events):
+        """Équivalent de public.revoke_match (migration 20261018210000)."""
+        return self.transaction(_revoke_match, p_match_id, p_validated, p_last_match_id, p_matches, p_profiles, p_events)
+
+
+def _validate_match(conn, match_id):
+    row = conn.execute("select * from matches where id = ?", (match_id,)).fetchone()
+    if row is None:
+        raise ValueError(f"Match {match_id} introuvable")
+    match = dict(row)
+
+    mode = match.get("mode") or "1v1"
+    if match["status"] == "validated":
+        return {"already_validated": True, "mode": mode}
+
+    winners, losers = rating_log.match_teams({**match, "mode": mode})
+    elo_col, count_col = ("elo_2v2", "matches_2v2") if mode == "2v2" else ("elo_rating", "matches_played")
+    ids = winners + losers
+    placeholders = ",".join("?" * len(ids))
+    profiles = {
+        r["id"]: dict(r)
+        for r in conn.execute(f"select * from profiles where id in ({placeholders})", ids)
+    }
+    if not all(pid in profiles for pid in ids):
+        raise ValueError(f"Profil introuvable pour le match {match_id}")
+
+    ratings_before = {pid: profiles[pid][elo_col] if profiles[pid][elo_col] is not None else 1000 for pid in ids}
+    w_elo = sum(ratings_before[pid] for pid in winners) / len(winners)
+    l_elo = sum(ratings_before[pid] for pid in losers) / len(losers)
+    _, _, gain, loss = EloEngine().compute_new_ratings(w_elo, l_elo)
+
+    events = rating_log.match_events({**match, "mode": mode}, gain, loss, ratings_before)
+    conn.executemany(
+        "insert into rating_events (match_id, player_id, mode, kind, rating_before, rating_after) values (?, ?, ?, ?, ?, ?)",
+        [(e["match_id"], e["player_id"], e["mode"], e["kind"], e["rating_before"], e["rating_after"]) for e in events],
+    )
+    conn.executemany(
+        f"update profiles set {elo_col} = ?, {count_col} = coalesce({count_col}, 0) + 1 where id = ?",
+        [(e["rating_after"], e["player_id"]) for e in events],
+    )
+    updated = conn.execute(
+        "update matches set status = 'validated', elo_gain = ?, elo_loss = ? where id = ? returning *",
+        (gain, loss, match_id),
+    ).fetchone()
+    conn.execute(
+        "delete from rating_checkpoints where mode = ? and cutoff_at > ?",
+        (mode, match["created_at"]),
+    )
+    on_match_write(conn, match, dict(updated))
+
+    validated_count = conn.execute(
+        "select count(*) from matches where status = 'validated' and coalesce(mode, '1v1') = ?",
+        (mode,),
+    ).fetchone()[0]
+
+    return {
+        "already_validated": False,
+        "mode": mode,
+        "gain": gain,
+        "loss": loss,
+        "validated_count": validated_count,
+        "ratings": {e["player_id"]: e["rating_after"] for e in events},
+    }
+
+
+def _fingerprint_changed(conn, validated, last_match_id, mode=None):
+    """Empreinte (nombre, id le plus récent) des matchs validés différente de celle du plan."""
+    if validated is None:
+        return False
+    query = "select count(*), max(id) from matches where status = 'validated'"
+    if mode:
+        query += " and coalesce(mode, '1v1') = ?"
+    count, last = conn.execute(query, (mode,) if mode else ()).fetchone()
+    return count != validated or last != last_match_id
+
+
+def _close_season(conn, close_key, season, mode, validated, last_match_id, profiles, archives, events, ratings, titles):
+    # BEGIN IMMEDIATE (transaction) tient le rôle du "lock table matches" de Postgres
+    if conn.execute("select 1 from season_closures where close_key = ?", (close_key,)).fetchone():
+        return {"already_closed": True, "stale": False}
+    if _fingerprint_changed(conn, validated, last_match_id, mode):
+        return {"already_closed": False, "stale": True}
+
+    inserted = conn.execute(
+        "insert into season_closures (close_key, season_name, mode) values (?, ?, ?) on conflict (close_key) do nothing",
+        (close_key, season, mode),
+    ).rowcount
+    if not inserted:
+        return {"already_closed": True, "stale": False}
+
+    players = _update_by_id(conn, "profiles", profiles)
+    conn.executemany(
+        "insert into player_titles (player_id, title) values (:player_id, :title) on conflict do nothing",
+        titles,
+    )
+    conn.executemany(
+        "insert into season_archives (season_name, player_id, username, final_elo, matches_played, final_rank, mode)"
+        " values (:season_name, :player_id, :username, :final_elo, :matches_played, :final_rank, :mode)",
+        archives,
+    )
+    _insert_events(conn, events)
+    conn.execute("delete from rating_checkpoints where mode = ?", (mode,))
+    conn.execute(
+        "insert into rating_checkpoints (mode, cutoff_at, ratings, counts) values (?, null, ?, ?)",
+        (mode, json.dumps(ratings), json.dumps({pid: 0 for pid in ratings})),
+    )
+    matches = conn.execute(
+        "update matches set status = 'archived', season_name = ? where status = 'validated' and coalesce(mode, '1v1') = ?",
+        (season, mode),
+    ).rowcount
+    conn.execute(
+        "update season_closures set players = ?, matches = ? where close_key = ?",
+        (players, matches, close_key),
+    )
+    return {"already_closed": False, "stale": False, "players": players, "matches": matches}
+
+
+def _apply_season_repair(conn, validated, last_match_id, matches, profiles, events):
+    if _fingerprint_changed(conn, validated, last_match_id):
+        return {"stale": True}
+    changed_matches = _update_match_gains(conn, matches)
+    changed_profiles = _update_by_id(conn, "profiles", profiles)
+    _insert_events(conn, events)
+    conn.execute("delete from rating_checkpoints where cutoff_at is not null")
+    return {"stale": False, "matches": changed_matches, "profiles": changed_profiles}
+
+
+def _update_match_gains(conn, matches):
+    """Gains / pertes rejoués, [{id, elo_gain, elo_loss}], match par match (triggers compris)."""
+    changed = 0
+    for m in matches:
+        old = conn.execute("select * from matches where id = ?", (m["id"],)).fetchone()
+        new = conn.execute(
+            "update matches set elo_gain = ?, elo_loss = ? where id = ? returning *",
+            (m["elo_gain"], m["elo_loss"], m["id"]),
+        ).fetchone()
+        if new is not None:
+            on_match_write(conn, dict(old), dict(new))
+            changed += 1
+    return changed
+
+
+def _revoke_match(conn, match_id, validated, last_match_id, matches, profiles, events):
+    row = conn.execute("select * from matches where id = ?", (match_id,)).fetchone()
+    if row is None:
+        raise ValueError(f"Match {match_id} introuvable")
+    match = dict(row)
+    if match["status"] != "validated":
+        return {"revoked": False, "stale": False}
+    mode = match.get("mode") or "1v1"
+
+    if _fingerprint_changed(conn, validated, last_match_id, mode):
+        return {"revoked": False, "stale": True}
+
+    revoked = conn.execute("update matches set status = 'revoked' where id = ? returning *", (match_id,)).fetchone()
+    on_match_write(conn, match, dict(revoked))
+    conn.execute("delete from rating_checkpoints where mode = ? and cutoff_at >= ?", (mode, match["created_at"]))
+
+    changed_matches = _update_match_gains(conn, matches)
+    changed_profiles = _update_by_id(conn, "profiles", profiles)
+    _insert_events(conn, events)
+    return {"revoked": True, "matches": changed_matches, "profiles": changed_profiles}
+
+
+def _update_by_id(conn, table, rows):
+    """Équivalent de update ... from jsonb_populate_recordset(...) where id = r.id (colonnes de la première ligne)."""
+    columns = [col for col in (rows[0] if rows else {}) if col != "id"]
+    if not columns:
+        return 0
+    assignments = ", ".join(f"{col} = ?" for col in columns)
+    return conn.executemany(
+        f"update {table} set {assignments} where id = ?",
+        [
+            [json.dumps(row[col]) if isinstance(row[col], (list, dict)) else row[col] for col in columns] + [row["id"]]
+            for row in rows
+        ],
+    ).rowcount
+
+
+def _insert_events(conn, events):
+    conn.executemany(
+        "insert into rating_events (match_id, player_id, mode, kind, rating_before, rating_after)"
+        " values (:match_id, :player_id, :mode, :kind, :rating_before, :rating_after)",
+        events,
+    )
+
+
+def on_match_write(conn, old, new):
+    """
+    Équivalent des triggers matches_head_to_head et matches_player_stats, après l'insertion
+    (old = None) ou la mise à jour d'un match : un match compte dès qu'il est validé (ou
+    archivé) ; une révocation le retire, un rejeu qui change ses gains le remplace.
+    Le recalcul complet de la paire / des joueurs donne le même résultat que la mise à jour
+    incrémentale de Postgres.
+    """
+    was_counted = old is not None and old["status"] in head_to_head.COUNTED_STATUSES
+    is_counted = new["status"] in head_to_head.COUNTED_STATUSES
+    gains_changed = old is not None and (old["elo_gain"], old["elo_loss"]) != (new["elo_gain"], new["elo_loss"])
+    if was_counted == is_counted and not (is_counted and gains_changed):
+        return
+    refresh_head_to_head(conn, new)
+    refresh_player_stats(conn, [pid for pid in (new["winner_id"], new["winner2_id"], new["loser_id"], new["loser2_id"]) if pid])
+
+
+def refresh_head_to_head(conn, match):
+    """
+    Équivalent du trigger matches_head_to_head : recalcule les face-à-face des paires
+    du match à partir de leurs matchs comptés.
+    """
+    mode = match.get("mode") or "1v1"
+    for a, b in {tuple(sorted((a, b))) for a, b, _, _ in head_to_head.match_pairs(match)}:
+        rows = conn.execute(
+            "select * from matches where coalesce(mode, '1v1') = ? and status in (?, ?)"
+            " and ? in (winner_id, loser_id, winner2_id, loser2_id)"
+            " and ? in (winner_id, loser_id, winner2_id, loser2_id)",
+            (mode, *head_to_head.COUNTED_STATUSES, a, b),
+        ).fetchall()
+        built = head_to_head.build([dict(r) for r in rows])
+        conn.execute(
+            "delete from head_to_head where mode = ? and ((player_a = ? and player_b = ?) or (player_a = ? and player_b = ?))",
+            (mode, a, b, b, a),
+        )
+        conn.executemany(
+            "insert into head_to_head values (:player_a, :player_b, :mode, :relation, :wins, :losses, :elo_swapped, :streak, :last_played_at)",
+            [row for key, row in built.items() if {key[0], key[1]} == {a, b}],
+        )
+
+
+def refresh_player_stats(conn, player_ids):
+    """Équivalent du trigger matches_player_stats : recalcule les statistiques des joueurs."""
+    for pid in player_ids:
+        rows = conn.execute(
+            "select * from matches where status in (?, ?) and ? in (winner_id, loser_id, winner2_id, loser2_id)",
+            (*head_to_head.COUNTED_STATUSES, pid),
+        ).fetchall()
+        matches = [dict(r) for r in rows]
+        row = player_stats.build(matches).get(pid, player_stats.empty_row(pid))
+        conn.execute(
+            "insert or replace into player_stats values (:player_id, :matches, :wins, :win_streak, :giant_kills,"
+            " :max_daily_matches, :last_day, :last_day_matches, :last_match_at, :last_loss_at, :last_loss_id)",
+            row,
+        )
+        conn.execute("delete from player_stats_daily where player_id = ?", (pid,))
+        conn.executemany(
+            "insert into player_stats_daily values (:player_id, :day, :matches)",
+            [d for d in player_stats.build_daily(matches) if d["player_id"] == pid],
+        )
@@ -0,0 +1,108 @@
+# --- luxury_table.py ---
+# Tableaux HTML au design 'Snook'R Héraldique' (classements, archives, tournois).
+# Tout le style est dans une feuille unique (stylesheet(), injectée une fois par page par app.py) :
+# les lignes ne portent que des classes, et les icônes de rang sont définies une fois par rang.
+
+from ranks_config import rank_icon_css, rank_icon_tag
+
+LEFT_COLUMNS = ("Joueur", "Nom", "Détails du Match")  # Textes longs à gauche, chiffres au centre
+NAME_COLUMNS = ("Joueur", "Nom")
+RANK_COLUMNS = ("Rang", "Numéro")
+
+# Podium : classe de la ligne et médaille affichée à la place du rang
+PODIUM = {
+    1: ("lux-gold", "🥇"),
+    2: ("lux-silver", "🥈"),
+    3: ("lux-bronze", "🥉"),
+}
+
+TABLE_CSS = """
+.lux-title {font-family: 'Playfair Display', serif; color: #C69C25; margin-bottom: 15px; margin-top: 20px;}
+.lux-table {width: 100%; border-collapse: collapse; margin-bottom: 25px; background: rgba(255,255,255, 0.03); border-radius: 8px; overflow: hidden; border: 1px solid rgba(198, 156, 37, 0.3);}
+.lux-table thead {background-color: rgba(198, 156, 37, 0.1); border-bottom: 2px solid #C69C25;}
+.lux-table th {padding: 12px; text-align: center; color: #C69C25; font-size: 0.85em; text-transform: uppercase; letter-spacing: 1px;}
+.lux-table td {padding: 12px; text-align: center;}
+.lux-table .lux-left {text-align: left;}
+.lux-table tbody tr {background-color: transparent; border-bottom: 1px solid rgba(198, 156, 37, 0.15);}
+.lux-table td.lux-rank {font-weight: bold; font-size: 1.2em;}
+.lux-table td.lux-name {font-weight: 600;}
+.lux-table td.lux-val {opacity: 0.9;}
+.lux-table tr.lux-gold {background-color: rgba(198, 156, 37, 0.08);}
+.lux-table tr.lux-gold td.lux-rank {color: #FFD700;}
+.lux-table tr.lux-silver {background-color: rgba(224, 255, 255, 0.04);}
+.lux-table tr.lux-silver td.lux-rank {color: #E0FFFF;}
+.lux-table tr.lux-bronze {background-color: rgba(205, 127, 50, 0.04);}
+.lux-table tr.lux-bronze td.lux-rank {color: #CD7F32;}
+.lux-player {display: flex; align-items: center; gap: 10px;}
+"""
+
+
+def stylesheet():
+    """Balise <style> des tableaux et des icônes de rang (une fois par page)."""
+    return f"<style>{TABLE_CSS}{rank_icon_css()}\n</style>"
+
+
+def player_cell(tier, username):
+    """Cellule 'Joueur' d'un classement : icône du rang (par classe) + pseudo."""
+    return f"<div class='lux-player'>{rank_icon_tag(tier)} <span>{username}</span></div>"
+
+
+def draw_luxury_table(data_list, title=None, columns=None, is_ranking=True):
+    """Génère un tableau HTML au design 'Snook'R Héraldique' avec option podium"""
+    if not data_list:
+        return ""
+
+    out = []
+    write = out.append
+    if title:
+        write(f"<h4 class='lux-title'>{title}</h4>")
+
+    # En-tête
+    if not columns:
+        columns = list(data_list[0].keys())
+
+    write("<table class='lux-table'><thead><tr>")
+    for col in columns:
+        write("<th class='lux-left'>" if col in LEFT_COLUMNS else "<th>")
+        write(f"{col}</th>")
+    write("</tr></thead><tbody>")
+
+    # Balise d'ouverture de chaque colonne, calculée une seule fois
+    cell_open = []
+    for col in columns:
+        if is_ranking and col in RANK_COLUMNS:
+            kind = "lux-rank"
+        elif col in NAME_COLUMNS:
+            kind = "lux-name"
+        else:
+            kind = "lux-val"
+        align = " lux-left" if col in LEFT_COLUMNS else ""
+        cell_open.append((col, kind == "lux-rank", f"<td class='{kind}{align}'>"))
+
+    # Lignes
+    for i, row in enumerate(data_list, 1):
+        row_class = ""
+        rank_label = str(row.get("Rang", row.get("Numéro", i)))
+
+        # GESTION DU PODIUM (Uniquement si is_ranking est True)
+        if is_ranking:
+            # On tente de récupérer la vraie valeur du rang si elle existe
+            try:
+                actual_rank = int(row.get("Rang", i))
+            except (TypeError, ValueError):
+                actual_rank = i
+
+            if actual_rank in PODIUM:
+                row_class, rank_label = PODIUM[actual_rank]
+            else:
+                rank_label = str(actual_rank)
+
+        write(f"<tr class='{row_class}'>" if row_class else "<tr>")
+        for col, is_rank, td in cell_open:
+            write(td)
+            write(rank_label if is_rank else str(row.get(col, "")))
+            write("</td>")
+        write("</tr>")
+
+    write("</tbody></table>")
+    return "".join(out)
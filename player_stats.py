@@ -0,0 +1,94 @@
+# --- player_stats.py ---
+# Statistiques de carrière par joueur (table "player_stats", badges du profil).
+# Même définition que les fonctions SQL de supabase/migrations/20261018140000_player_stats.sql
+# et 20261018180000_player_stats_revoke.sql (jours joués, dernière défaite).
+# Les adversaires uniques et le meilleur binôme viennent de la table head_to_head.
+
+import pandas as pd
+
+import head_to_head
+
+GIANT_KILL_GAIN = 30  # Une victoire à 30 points ou plus = exploit contre un bien meilleur Elo
+
+
+def paris_day(created_at):
+    """Jour (heure de Paris) d'une date de match, au format YYYY-MM-DD."""
+    return pd.Timestamp(created_at).tz_convert("Europe/Paris").strftime("%Y-%m-%d")
+
+
+def empty_row(player_id):
+    return {
+        "player_id": player_id,
+        "matches": 0,
+        "wins": 0,
+        "win_streak": 0,
+        "giant_kills": 0,
+        "max_daily_matches": 0,
+        "last_day": None,
+        "last_day_matches": 0,
+        "last_match_at": None,
+        "last_loss_at": None,
+        "last_loss_id": None,
+    }
+
+
+def add_match(row, match):
+    """Ajoute un match (plus récent que les précédents) aux statistiques d'un joueur."""
+    pid = row["player_id"]
+    won = pid in (match.get("winner_id"), match.get("winner2_id"))
+    day = paris_day(match["created_at"])
+
+    row["matches"] += 1
+    row["wins"] += 1 if won else 0
+    row["win_streak"] = row["win_streak"] + 1 if won else 0
+    if not won:
+        row["last_loss_at"], row["last_loss_id"] = match["created_at"], match["id"]
+    if won and (match.get("elo_gain") or 0) >= GIANT_KILL_GAIN:
+        row["giant_kills"] += 1
+    row["last_day_matches"] = row["last_day_matches"] + 1 if row["last_day"] == day else 1
+    row["max_daily_matches"] = max(row["max_daily_matches"], row["last_day_matches"])
+    row["last_day"] = day
+    row["last_match_at"] = match["created_at"]
+
+
+def build(matches):
+    """Statistiques complètes à partir d'une liste de matchs : {player_id: ligne}."""
+    rows = {}
+    counted = [m for m in matches if m.get("status") in head_to_head.COUNTED_STATUSES]
+    for m in sorted(counted, key=lambda m: (m["created_at"], m["id"])):
+        for pid in (m.get("winner_id"), m.get("winner2_id"), m.get("loser_id"), m.get("loser2_id")):
+            if pid:
+                add_match(rows.setdefault(pid, empty_row(pid)), m)
+    return rows
+
+
+def build_daily(matches):
+    """Lignes de player_stats_daily (matchs comptés par joueur et par jour)."""
+    counts = {}
+    for m in matches:
+        if m.get("status") not in head_to_head.COUNTED_STATUSES:
+            continue
+        day = paris_day(m["created_at"])
+        for pid in (m.get("winner_id"), m.get("winner2_id"), m.get("loser_id"), m.get("loser2_id")):
+            if pid:
+                counts[(pid, day)] = counts.get((pid, day), 0) + 1
+    return [{"player_id": pid, "day": day, "matches": n} for (pid, day), n in counts.items()]
+
+
+def badge_counters(row, h2h_rows):
+    """
+    Compteurs affichés par les badges du profil.
+    row : ligne player_stats (ou None) ; h2h_rows : lignes head_to_head du joueur (player_a).
+    """
+    row = row or empty_row(None)
+    opponents = {h["player_b"] for h in h2h_rows if h["relation"] == head_to_head.VERSUS and h["wins"] + h["losses"] > 0}
+    duos = [h["wins"] + h["losses"] for h in h2h_rows if h["relation"] == head_to_head.PARTNERS]
+    return {
+        "total_matches": row["matches"],
+        "wins": row["wins"],
+        "current_streak": row["win_streak"],
+        "max_daily_matches": row["max_daily_matches"],
+        "nb_unique": len(opponents),
+        "max_duo_matches": max(duos) if duos else 0,
+        "has_giant_kill": row["giant_kills"] > 0,
+    }
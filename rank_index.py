@@ -0,0 +1,145 @@
+# --- rank_index.py ---
+# Index des Elos d'un mode : rang d'un joueur et joueurs autour de lui sans parcourir tout
+# le classement. Ordre du classement : Elo décroissant, égalités départagées par
+# l'identifiant pour un résultat stable (clés (-elo, player_id)).
+#
+# Les joueurs sont rangés par seau d'Elo entier (floor). Un arbre de Fenwick compte les
+# joueurs de chaque seau, du plus haut Elo au plus bas : le nombre de joueurs mieux classés
+# qu'un seau et le seau d'une position s'obtiennent en O(log B) (B = largeur de la plage
+# d'Elos couverte, quelques milliers). Chaque seau garde ses clés triées ; il ne contient que
+# les joueurs de même Elo entier (environ n / B, quelques-uns dans un club) : y insérer ou
+# retirer une clé est le seul coût linéaire, borné par la taille du seau et non par n.
+#   update / remove / rank : O(log B + taille du seau)
+#   page / around          : O(size × log B)
+
+import bisect
+import math
+import threading
+
+MARGIN = 512  # Seaux ajoutés de part et d'autre quand un Elo sort de la plage couverte
+
+
+class RankIndex:
+    def __init__(self, ratings=None):
+        """ratings : {player_id: Elo}."""
+        self._ratings = {}
+        self._buckets = {}  # Elo entier -> clés (-elo, player_id) triées
+        self._lock = threading.Lock()
+        for pid, elo in (ratings or {}).items():
+            self._ratings[pid] = elo if elo is not None else 1000
+        for pid, elo in self._ratings.items():
+            self._buckets.setdefault(math.floor(elo), []).append((-elo, pid))
+        for keys in self._buckets.values():
+            keys.sort()
+        self._rebuild(min(self._buckets, default=1000), max(self._buckets, default=1000))
+
+    def __len__(self):
+        return len(self._ratings)
+
+    # --- Arbre de Fenwick (position 1 = seau le plus haut) ---
+    def _rebuild(self, low, high):
+        """Couvre les seaux [low - MARGIN, high + MARGIN] et recompte les joueurs, O(B + n)."""
+        self._low = low - MARGIN
+        self._high = high + MARGIN
+        size = self._high - self._low + 1
+        tree = [0] * (size + 1)
+        for bucket, keys in self._buckets.items():
+            tree[self._high - bucket + 1] = len(keys)
+        # Construction en place : chaque nœud remonte son total à son parent
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _add(self, bucket, delta):
+        i = self._high - bucket + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _above(self, bucket):
+        """Nombre de joueurs dans les seaux strictement au-dessus de `bucket`."""
+        i = self._high - bucket
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, position):
+        """Seau de la position `position` (0 = premier) et position dans ce seau."""
+        i = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = i + step
+            if nxt < len(self._tree) and self._tree[nxt] <= position:
+                i = nxt
+                position -= self._tree[nxt]
+            step >>= 1
+        return self._high - i, position
+
+    def _insert(self, pid, elo):
+        bucket = math.floor(elo)
+        bisect.insort(self._buckets.setdefault(bucket, []), (-elo, pid))
+        if self._low <= bucket <= self._high:
+            self._add(bucket, 1)
+        else:
+            # Elo hors de la plage couverte : l'arbre est reconstruit (rare)
+            self._rebuild(min(self._low + MARGIN, bucket), max(self._high - MARGIN, bucket))
+
+    def _delete(self, pid, elo):
+        bucket = math.floor(elo)
+        keys = self._buckets[bucket]
+        del keys[bisect.bisect_left(keys, (-elo, pid))]
+        if not keys:
+            del self._buckets[bucket]
+        self._add(bucket, -1)
+
+    # --- API ---
+    def update(self, ratings):
+        """Met à jour l'Elo de quelques joueurs ({player_id: Elo}), nouveaux joueurs compris."""
+        with self._lock:
+            for pid, elo in ratings.items():
+                elo = elo if elo is not None else 1000
+                old = self._ratings.get(pid)
+                if old is not None:
+                    self._delete(pid, old)
+                self._ratings[pid] = elo
+                self._insert(pid, elo)
+
+    def remove(self, player_id):
+        with self._lock:
+            old = self._ratings.pop(player_id, None)
+            if old is not None:
+                self._delete(player_id, old)
+
+    def rank(self, player_id):
+        """Rang (1 = premier) d'un joueur, None s'il n'est pas classé."""
+        with self._lock:
+            elo = self._ratings.get(player_id)
+            if elo is None:
+                return None
+            bucket = math.floor(elo)
+            return self._above(bucket) + bisect.bisect_left(self._buckets[bucket], (-elo, player_id)) + 1
+
+    def around(self, player_id, radius=2):
+        """Joueurs autour d'un joueur : [(rang, player_id, Elo)], lui compris."""
+        rank = self.rank(player_id)
+        if rank is None:
+            return []
+        start = max(0, rank - 1 - radius)
+        return self.page(start, rank + radius - start)
+
+    def page(self, start=0, size=10):
+        """Tranche du classement à partir de la position `start` (0 = premier)."""
+        with self._lock:
+            rows = []
+            position = start
+            end = min(start + size, len(self._ratings))
+            while position < end:
+                bucket, offset = self._locate(position)
+                for neg, pid in self._buckets[bucket][offset:offset + end - position]:
+                    position += 1
+                    rows.append((position, pid, -neg))
+            return rows
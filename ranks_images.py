@@ -0,0 +1,20 @@
+# --- ranks_images.py ---
+# Images des rangs (data URI base64, ~500 Ko de texte). Chargé uniquement par assets.py,
+# la première fois qu'une icône de rang doit être écrite en fichier statique.
+
+IMG_AMATEUR = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAMAAAD8CC+4AAADAFBMVEUAAAAoMUImLT8eIzS1vr4YHCi6xchocXUQFByBjpUMDBHn9fcGBQtHVWEFBAoFBAkEAwnk9fuYprpzgZwGBQoIBwwGBQq+0NcFBQoHBwy9zdlGUG9DU2epudCks8F7hppYZHfG2ex3g5rO4ui3w8u6y+Vjdo+Bjp6Hlaxve4/b7/u2yd9QYHbU5/fi9P5rbnyXpLWludQwQV0BAAUDAgcGBAoEAwgIBwwGBQsBAAcJCA4ODREMCg8QDxUoKCsTEhYGBQ4LCxEEAwoYFxs3NzkrKy0VFBkzMzMvLzJKS0g6Oz0RDxIKCApgYl4BAAMfHyMjIiQtLi5ZW1kmJiY3NjR6fXdFR0gaGx9AQUFSU08zNDd3enMJCg+Dh4E9PkBbXl4+Pjt0dm9YWVWTl5FLTU1ERENPT0yGioMjJCljZWJ9gHlVV1OQlI1rbmoRDQwfHh+JjIZdXlk7OzeNkIqBhH1wcmtHSENSVFROUFEMDBWXm5NucnAxMS3EybwqLTJnamjBxbccGxvN0sTe4tNlaGMvMTYsKya1uq/Kzb/q7+HZ3tEJCBJ+gX3i5tebn5mnq6HU2cxeY2QIBQRAQ0VTV1lDQz7Q1crl6dxFSk2eopnx8+QWEg68wLWipqG3u7Xq8OoOCgXHzMVqbGU0OT2bn5Sorqfu9O7l6uOfpJ6Mj4a8wb30+O0WDwR2enhIT1NobW5xdnW8v7DBxsJ+hIP2+/ivs6ersKxgaGuwtaw4P0aXm5dMU1evtbImIx37/f3d492sr6OkqJ1TW1+KkY+GjIsPER3L0M09RUsYFxTw9/jP1tS1uKne5ePZ3tszOkP8+uTU2tfa3Mt3fn8PFCosMzyPmZuXmY2wuLnt7dqjpZkfFgaaoqLk7Op+iIqVn56LlZVXYGalqajU1sTEzMz8/fCQlIidp6mnsLL799ggHBFweH3x7M9nZ10/SlOhrKosJA7l38A4MRnOyq6Ih3erpIYXHC5ORSxAOynAu52DfWRpYkZWUjuVjW54cleOoLSfscZS0fxEAAAAM3RSTlMACRUm/jv+/lf+dPn3/u/Z+96mLrmOy/LnpNpac7DbWJhvgerJs/bB3a+mVfWJvNWBPPu/+8B8AAD9KElEQVR42uzBgQAAAACAoP2pF6kCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABmx/5VXIWCMIBH21NJnkAut4lESB3Ccuu8S/p9BIvb3FILt5oUJ+XUU2fggu0ilqcwWCRZQsj+KXZOZB9CMz8O+gDD951RpZRSSimllFJKKaWUUkoNVTBN4iQIJupxBMksiqJZMtWxP4pgMY8MMrKMPZyoBxBM49SwR2ii2ULDPn6+2ZmRiFAOmzTWjh853+z3jBMiCWZj0iTUsY9YGM8Msx+4JWQSCGCiuXb8aPlmR+Nj3uec5VhAQI6048cpmMrOznBPOPqMo596bp1F1j1+lGRnl5EzO2f7Hc65yjkHKIDYNLrHj06wuF/mhM71I69E63JH6IPOYO1/2eMnajR8szOCr3Ykz1ZVdzu1VZtb66Oe26xkMGmsHT8WYZz2n+b4M/K2vVzP16+ulbzn4CzkCACsHT8W0uyRMSRQELuq7W4fx3pX15+3rm1fX0uEEuTRGBn7XPf4wbvv7MhASP2RmZ/ez/Wu2O8Ph+PHm6T9LzQNQ9kwAjb6i27wgiQ1TAhw73ZkkphfrnW922yWT/uiOJzfT22ebUuGkrHMHLAxM73aB+znp6tPOBA5H/M3afb6pVj/eV49rdZFXV8vXVVZAMTSOnlvmyb6vdCxD1MQ9p/mJFAOWh/z865++Vesn8VqudxsisNRwt7lgP5mtzbPsmxrfmnHD1KYpNE3O9f23EQdhb108MEn9cEZZtQZLzOOjo4P1sS9TBqr8ZLVekEQGkRERaEN4oi66OK6UXc3a0iMktVNmk2Q7GI2IglJjVi6UUitTTttUUspEWztgBWGincHmPH8EvofCJSZ/ZLN9KkvX853vvOd3y/qzIwGrBuom58EZU8kvIRNIggcweHwjk3/9QfY+EnV1Lp1Q1EUUdb7r7n5qgvPs3BuARk4KHKj+xTyMKahbp7xUgRhs+FUGLj34nSzpzeamToGhm5QUQwAcK6Imnox+PirrGI/l1A/KNGtgXerKzuq8j+OTwPnBIFJEmYPhxNhinI6MZcjGo0iH//PYeUUVFHVVbXab2n8uQS0Qb0YRvL8TC+f8exRAtV3YxN2mx0oh5on3Am327XA3Qut/TiIvKJqGvR2Vdd1tdp3+Q03WsnsuQFo5mDg8rAxR6TDVuXnQZTGAOduiYYCDxNEo81ut9kwIN0bddCky+EC1seg2oF2GTiHrEYUQ31m3zXW9u2cwPk3XVLthtl8sg6o8noaA6M54fFQAAyz2W/z3OrB7U4n7sZIB+5y9PZGx6bG/gYjP6gYqq6Jot9vmgP9Q3OtExazHeefj3L2bg3N5MYkvOvKDpRnwLNjNszWaLPZGu02j8fhwj1OHG8mMdztcLlRUhONTsPUDlsYRVNNvynrZkgf6ptrtfZZjdrhZhTBGZOAfPdMGpNJoEENitwGiu702DHS1XLf4/e91UziTpJ2OkgC4jlvFFU7SmYPK4Ghqu4PQLH3D/T1XXOdpfGzFjXPbmjg35C4KwY8k7+eODY1lvDCC0gHQLFDwZMLFr338pLP3p1/Z7OTBDgdhNsRBfSuio6hZHZUH5Jln08eMociXPKny6+70Sr2WQl0BA4RXo/ggHK0NEfKDn7dQdQot9kIeLub1z3+1Ltbd23fufv1LW+5msplyYUTeDTqzUC190JrB40PyKDuvpA51BMB2udYGj8bUVN2iGNg5KqRjjaov52czqAEDiNvJygA9HKMwh0P3vny6+9s297Z0dG5c+dnW9bRdLmJJN04MA7Eu6NTGeTjRzkTWro5EAHSuWTf5ddZ49tsw6lrK3m0V6lvUAd/PfE3Cl29iUbCQ2Kozu2YhLlb7pn/3Irnl8XjfLJrfWp8/4GL3nItoGFuIyGJpxJuwuGCNcyxE4cH5ZDfHBjoQ6wncz0/zb3iKqu1zyLUr63UI3bj1KD2DwrgMsAjKDpYNxs49yYJb37ksYeXtm1OJWPJXFc8Fkun297ZtqVlQZmWaAeJu91u0k1GgXUwdKOj/khPCDjPJSM9OSbdMPcWS+NnC2aU/dTNldpoDgYug+AmMAyz27Em0n4HhrlWvfB06+L1KZ5hkpGIwLJcMMjzm8d3zW8pQ7HTIPSS2+H1ovlt7Njvw4oPqtwfSfYlOYZhY+mGK6++0KJ9FqDm2bu1ejOvcQ7K/sdf0zCmgWUnJAyUHfM0NUk0jT/49Mbn1wbjDMNEmI3tnJ8vMVmejbd17Fvy9QIJyh1ezrDX4XY1ezMZWLWPBoaFSKQHLLwgMALbMGfupZbGn32g0FWDDSqy60a+u67sJ48h/0bBVoUiapxLZfDozQ89s3R5kGc4IRRZsYbb+8IKIcRGYkwx2bHs0K4Pvit/W5YkuuzCMZwkSIhrMmgNE5iIJAVO4DgWar0SS197y2UW7WcVSNmrtXPM0MuNeuiKDFxmLOognRRsVQgKHqcEnD9775NHRipZIcYoI6tjELRyRxYWOJ4JJvl0z55933/w57fwxaBp1N1xF1l2eMEHTv87McoxEQ4qPc1ks0KW3zPn2qutVftZQ/3aCvRy7ZR7U2bWadGom7B5nJ4myV6L4Zx084JFD7e/GMxyMd7H3L/cgHzdb/qXvbS6WPKHklwkF//koh++/u5bqUzD9wNmODDzaNNeG9p9DAu8s1ysEIvx6VxDg6XxZw3Is1fz36CNmgHhG2rmaDRH9g0jJVij2SXahkA43rj7medeXFvkGJ4NrTjCGIber+tmv5lbs2pFrMRlmWJbOrfz4C9f/VmWaBD5crPkdLi94OcyY9PHK6PDHMsyjMDEOT4b60rPudLy8WcFFwDlNb4NDYn7IMLEiWPTtTEN2jlFEIhvjMAdq17bsHLNSCHLJTv9wZVF0UAL8wGzqvf3m+mHN/Ast4kPsfHcnENfffYdaDz4OVB4jCRxhwMiusyOk8LhCVbIZnk+wgh8he06tMfy8WcB6Dw77FYMxQDk61tz8OxTGa/bhuEUIHwbRcFmDUbzeQvX/L63woZyqeTrL6pq3lD79L6q2q9W4SPZ8cRIUIiwMaav8/s5v/zy40ctLmjsEMjXD8yiekfj23AsywQLMOaVKmyJP7pnj6XxZxgXoPPsF2sAoByuIaLriHBQIhOF1QqOY5LU5ISFWhhGNtcjD937XOumksBMlCpMa07VDDUypKlVHaCq/aae5BeuLDB8xJ/ic2s7j+7fPf9Z0kUD4+DoSLx2YjaaGdsQHB6uVEo9Oa5SyFYKfKqz4UqL9jMIdFMJKAdhhzEN9fPRQZTGoDsMUNs4TsDk1XS7nQp7vc2vvda+5uNKjPVX9vqWL43ku9Whoao2oGuGCKybQ3q/KXNr560uxtYKwt5C19EPPzmw/4t1rnKTVCZpYB1KHdGemDoiBARwciyTBdILwVS8y9L4Mwbk2UHYUTsXJw1FNURYmsOY1psIZxLo3BsFuI3CCcL14D0bVr7zcSHGCsVsbFMrq+b1gQFNM/W8qgNkXdR9MvwRii99aWOMKbB8enMqndp/YOvnrrLnDgdNOj011kFBpsZ2HMkOsxW2GM/ywDqQ3tl1yCr2MwJ0NqZbVSGO0UDYUZ0P/vov2LdEo8uB7BvWCJ9h7wOUe9Wi+UtaN41kmVC25Fu/hteM6pCqG5qpGaaqiaap6z5VVnXVF9H9TOu81XyM3TTUs/Zo7ocDP1x0XwvpIW/FAfW+HgYn/3brxHCWLfKxUpEH0oOFYvHKSy0ff5pRX61cnNdVsG4KuDi1fjYmE6W8biCbQkE7RSXC3nDvXY+//Or2L/cyfmEkwr65XNc03USc6yp8yn5TVWRZEQ1F9vn1EBPiNq2ctyIWgnwud+DgwaO7tr6/zgX+naYxDGj3Au8JOGTx0kiAg+SW5+OpQjHIZ4ud49b4dnqBcvYq+mkgXTSAdEWBUQ0180QCp3EiTOEeyt4Ivh3of2Pewvbl64sVX+hjVl7cnswD1VXN0FQdFblfFlVRFgGGzxfwC35ZBhqXPXFvCtzcsnSuc1/D+K4vnm1x3OGhJckJNsENixggvXfHM1kfWykU+UKhEizyfLCz66Cl8acRcJ79El2DAA4cOKQxogJ5zD/H6wddJQnz2CmcQuVOoQ3qkkfXFmPFUKUk790YVPNaPzyarhuqpvp9higjyhVFCYlKyCfLQpyLmBGm/e2N8fW59NFUQ9fuj5bs/mDRgjJMbjQ8iHacaHZ7p97+V/BXKoVKJQvUj4+ngsHU9Zdat2FOD5BnB8teBdInFRmJO6QxJ9GFRMobRqlrE0bYa6kM2fLWK6+2dRZKbKgksE+2mWq+qucN0HUVXJwpy5osKiKoheiTRV9IlAORkBDymaGQf2Tha63x7V0/pV/d1rZ426fPbVnnbKIRnCQpkS7cFYX57e+RAFMolSolPh5PpYJf7l1vafxpQf0XweAeOSxRDSTswPnMVXMCFB12ahhMavgDFNa86L3XP9kcTFXAdPmWr8mp4NXh8nm/rqEGHhDBuSsi/AfRHxD9UOUyx3HAvh8+kj7++Rceak8vbk/tatv86s43l/z4Xku5xjtJogcdqfImdhzPTmQrwWwBRrdCR2fH+L7xfZbG/+9A145VZNzyugGNfHRQqaUxSNohbrU3oj6OERLd6HI+dOf8rS9+2Mlz/spwZXWH3q3VQjhdUxQxEBI1UVcUWZRB4RVfRPbJijARCAT8XEAPcTJIvbDxjUeWp5cV17+TWrp48bbdX33eXKZhaJeA+f/Yu9aYtuooHuMrxk/qBxPf8a1fNJECtiB0U9wEpk471FJn12WVriDadpOyK3f3zvX2wm0vqK0tbaFI6YPhKLNYcZNWFkQ6HF20Fp1O61CRJU7w/Uj8/ctM1PjWb3K2sQxIl/C755zf+Z1HS1Czl5FGzKeLaT4Gb48lZoYBujdke385tcP+4w4q2SJGQA4ePWo9elRYWluBm3cTxg6NHW1UeLystGbV/XUKfdLlcaBxbppFZA/2dRH6huggiKzbKVhhBHMr6xCcLNAGi2NFpxOwYyrO7WA94Xvvrg4obV7lSGNIc2j/4PqK8nJ031Y2lZc1wCrh653dd8+IXGomlkykZpKBQGDkfe/bVy9rNf9lZL/ssJB1Z8nJADfoVxbttO+/hJsDAdC2WiK7lktQqHVP3LRx7R6dy2wRKYbvXesfRUGPPN53ANzPKoKzC4jqSxROSMO98TletLJpOH0a+LOYdRctdp93cMu2uE0XiPvM3vjw2LpXHru9tQm2skgmq2yoImtQnRNzm1Jor7tSiZleV8gb8o68+8YbVy+32v+rQddrp6ZZ8DbC17NZtzu/af4pZtQJ5sSKWmHSqu6GuW1b17bpbTGOoXnPZv1hHCUgFd4BKx4XXnSSwpzgbQXyAk+QFgG9NZfH2u3kebfgpHxxX8Bm0+y4W+mLWGyWVFzfrF3//PrXa9CCKW0qLSGuXlpaXtZNJiw4OpFwBeIzrkRvYPjtN949cvXZy3M1/97LyTjUeBcrCPBx+KmQ/XieqDFkMobwt6qiqqpijLmSYnpi31MP9xhcdkDuEDTV413PnXkmaN/hLrg5yzvzVVo/gCesHdW5O53LgsqlHU780ymInNXJpi2Uh94bCuydjBgf2GQLxVKJRnNocGzPocFnby9vInm9BLqsvKkCYg0a91/Nspaky9ybTNoD3hGNQXMEzr7M4/8lf7sYnD0oOnlB6HezCMvAHGoMxqGwcSxDDi+S1kqBexVC7oM3P1pvnJ2J0RQ16tmgPfDqSxDo+w4fQGDneTwwAjo0hL0dhYOzbjbrTPNsVoAuAxbPkk9ZRfRXfZFAKDI0PT7pGanftiFuz3i0Wlfg7TdOf/55otA1odveJC/pRFJvQITfNbclxcwkNLaQy24Pz2YyjYaRd69aJnT/NplPBYGXwBJHhZ9nl3ZQwd9KiKOvwc5KHvSG7Xeua9mjccUwx+YYVT06dBjXovpA2UH2R1krCjUwt74+eDkg5wUnSeKgcjkHi49WZy5tdQtRiqLpWMDigI06RH/EtWnbhkTG5YvY9raN7BkYbH+wrDVP5KsaGjo6ochjEapzZ4ZPJW3DXnMy48pkwlrzyJF3rzp/ObX/Q8hPhgA31QW0CcVindlsFpz9B7KD2gDIpVVSUqcVFsmlxaU1ENpNqplU1OPhp/Y+/c4BtGP6cFmASK4gc6PW/DWZYBAlgOggj09WtFpz4hKDs4pM1i0wNEfTgWRcRB2H0k3kGYc/YHrgEbPH7orNJlQhfaOi+u4KjFOh9yaVSUtKZViM6MY1g4dTXMJut8dmwtrwYnh2NjwydvUlpy7H+H+SzC++4qyp6T5STzmFdNrtzmI2Bmsr3eDsZIUBs1B5lV1SUFh2083rWnS9dpqixckPWto/wLAkHN0Jig4P7xoNdqEf50Sx5uzjHbyVJ9QAlBD+jZAuWBl8l0BxFB0PRCgnQBfcLMvzrBgPDAXuvXOT3WZOuWJaV6NOUf3ETRXlTSvk6MKg1S5HIwZdmIZ9ai6V7E32ZjKzvYuZXp3+3SNnXHXBcvn2tzG/+MLLJiedYNfOrileQIAmbg7RtRuxHf1TeDosX6GXbr9zY7VCq/HEocdMata/iVb7q1Do0UUT0EeFGoNU3jfq5NFjcUBzBd7pNMYuDkLMFdPWNIfv42iGsSRiDLAWnYIgOvDBEfcx/umI7p6dYYs9mUwqzCqj7siLNSvLmzA7VwrMweXLuoE6qoZeGnlgVjszG87MqjRj+9854+przl9O7X8vsl9/3mWTvMAIuawbcw9wdUBOCBxJ5x1opEkkEpD2coBfcdNt6Kfp7eiJilPx6rGp59BrPwwVzgovB+UHtP39bDCIFrrgQMmGLEGOfn/+w+eI6QgheQLH+D3JAEp7Bt/iTLMOt5uPRv2jvIiVN2/dnU/pvQqb3WC36at3tz9xX41UXiuVy1shy4JNwKDNbkhxydnMbEbVqNfYNAbdnnfOuOrS5Rj/1w2R/bLJUZFneVYQBQTa3Dy5CJbfQW1AmQbrKOiQFJfjx37Hrbdtbut1WTwW/9TkYLu/66W+V9EvJ81zVOOAHQW+AMyDOC3Bos4XCDXIbzd+ujmFLyHKc/TQkC8QGYeXk+4LNHi328FxYPWUnwGdj5jv3f6IS6P3hgzakYHdLevvu31lbS1O1aD3BoNcQ4L8TjVtmZ3VG8zmkZFGlU5pGNnzxlXnL8f4vwj5OWdfdi4WhNNppFUHEm6O/fjjBRC4twA5wjq09oKOfDYvb1q56tbVpkaN3WNhxNGRez7EiaEuODkqc2eQyHcwpwAqODpqdTLI8ezx+XnSmyOiPYi3KY1/0LTH4R2OOBx4xFC+Mzz4fJTC/0v5RYb2U8yQP974wESLL97oUqkHFar6ltV3PCQrRl9PXltUWVqCKxYE9okHXJw9rG1UaWx6vVGt0+8/shzj/3pkP/cDhhUZdhoUGkn9+Hw+skN/I6QdIV1K+iuwkooHH1+3o62xl7g579s8MI26/KXDZN5VEJDHYcAcBkogQG7Lws3nIedlvto1192AZbfuuc/CWTeXSpg9uDMyKiCd8yxxcI4VnDw2F/1YdPRTkb2RwMj6Wx6o9xlBHRpNqubquttuR4AnZ0bl6Llim4J4e/fE5mgqHG406PV6lVqnVe7f886Rq5Z5/F+J7Kd98AFPC5zAjDN8Og0Ct5BvraBEItceATpgJyNRE3fcurG6LewKWDx+h7d6/3jfc9h3GT3cdzhIYnoXFLwgDN3UfJlvFbLCPGEGX85huArzVB2AHZraYtpKMzyPNCLAoMwxjAN/MTCsM1Mix0Qie99+f+9IyyNPaUP6sF5j1ClM9VvvX1WDyk0ulSK7y0uQ2xGHGrZvnqEBuVaj0um0bapmFUnty87+Z5BfNH3aaZNTnECnGSoncPBysqjUjd8lTeirFOfpG9aPJ/Ztu/eYsdGcoGl62vb0fuBNbvSjPAuSWSo4OcRVa38Qk1GErLtZ4uXo03y1i7h4nglighKwz22bcVtzuTRG5QTQeQ+bRlGX5gC96JjiGUakIqERX+SDUwKu+p2rVS6jwuBVtFUrmteuv3llqby1WF4uzzt9ntJNdG6aSWVm9VqTaqANwA8cGhs7YznG/+EE3Hl+z9DQ+KTfz9JsLp07fuKIL8QvAIWRqNobIMbIYHdsf2RDTzhsp6MpZrq+fRIlGjoro05y67EPQita54Dc6pwKoo9CErs7i94cHiDMTOKVgHh5eTFQh39OzPWkD7rxYFih0nBWEfIsJ4q4QIFRGgcvWpLh+KR/aDgQ8QdUO++u11h6TRqltrmtbXfL/WXw9PLycnkp6JwMmJOX23cslZo1Ght1BoNKNTigaht456plPf535yQuP2Xa50DJzHGQQUeZ3DzOe0KMmWjIn3FdGn+DBlcsq7np5ntNxsXeBJ2KOgMbR14lakxehAnmx2Mw7ugk3VPeiTTR32WFent8qTfXDQMbAFIrCgtxqUBCenP7PlsEp3fncsgD+MVxjINHxIerA3IzZNnxSHyImMWw+q7V9Tqbrs2galO3bdi69aYaGQ4R4vJBbUlVCVGNAH3Hp9+kwiqdyqDQNjYr9rQ16wYOXbPcav/tOYlzTxsCh4rSuSjH8cjn85iTQF2OGo1IcEXF4G5r4JuVFQ/durpaEc4kUp6Uw9GzKdCHE0MHDoC0g6+Tnju4G4p0K5l3FN39kNuJskMeoLkODFoA9cLC4hUFBSvQnJNKkIwxCPNl4iBoXjrrZB1UmkunGZZ18LwnNpOkGAdNj/sskckhT2CvXX3PtjpzwNxmMyjq1Qjx6+6QFUjlpeTISVEVbk8WIcTv2vUdZVYpjW06g0KlUDSrlOqB6y5dbsP8RmQ/9zSRouDpC1yKQaV2/OPPkX87K1GlyUoK8iWapGBNVVXZHXfiVtBsBtOoPt+0dotqGm/ChE3EriCgPgG5gPY7iJmYg3jLBrusBw8uSTudMgm5E4qX6Si4cUU5PL28tAK+iaWlfQ8vHMxmWSaaE9MCRaQ5no7HQz6Wp2lH1MPwDsvegM8XD9nq77yvfiykVLWFjTq1qe7RVSultfImOYycoywDxeye696Zsbj0Oq3KpGtW7lYp69Um43XLWs2vCdybp017yL2HdBThPZc+DpSwwgDBlVyHkpd0wIjYXllxx92rdxgzMwlPNOb3Ptl+Sn5QApB38UFMyCKVw6xHrWDhOfRVeEhwWF0n1ACivaSypFJaUCAp6Fiz5sYbV6wolkhvlBeUlnVj7G3fV4vswSzFpJ0UzcIoS8LlE1mKdqCOdzAx1IU+SyC0d2zP4NabNipGQmZ9WGFUm0yb7lkpu0EuJWROXiKRlxZXNnSgDbM6mdBpdT1tOqR/Zb3ymFpxaFmr+TnkF5532hAFjwLctIUBbZ8/0UEl/dPCgsLaohVFsKrKsu2rNrYowr0zUTrFxevWf3QYFyIPAHErC8ruRibPwsPJNBypu1CodwWx6YYjNJ/i2m9FYdXSwyMtvOGGGwpgHQU3VIB+o8xGjCfv4fPx0X7GQko8jo7b437e7/MzNCOyNOnfecYDw+8eeWPs/RHllrs2GA0ZbUYXNiqrt9722O2lGMCGq0srqyTYdi0tgVgzZ0plwmqFWtdjUjc3t7zTPDioWubxP0X26wE5R1PI5Ay1kOI4TpgnszHopoGmSyRVxYXIwa1ypN+yh+7bOmAgXfMExSg37Udkx2RMH2g66Z06WcR20leDmE6jQQ7NFR/A2clCa3eFVFoqI0RQUliwovjGGwrWECu+kYR4aYVse8MuXHw/xhxEcScyFGVPRkV+yOPgmLRIpTjSa/cF4oYjY28M7w15DaadO6v1rl5zeFZnrKt7+okHVwJ1tH86MNfRCtSrOlEafraYChvzoNcPtB861Kw0KpZj/E86+14HF2VyFMX4PAsLX+fmc3kCJyNujhyM2wIFBTdIiuSlFY+te1jXqLd7fBZHaOP6CI6CBrG9gNlWAjnh67yAAt1JR3mo7DDhIDlVsLQDIzvxemAGMLj6mjXw9sJCCakBydXATmKI8UfTlpQnkRRFykPRnJijoxQeREvc53EZwmHX8DD2G7zexnv33WnU28IKbY+xrvnJ2565vUyKE4Wk0JDJocxWkRvE+x7ojWkXj+nUSqVpcLC5uU3RPLDcc4XOft5lpzgoGgtinCfhpxYWSGTH1goWlQhI+DlKYFUyZPMH73+yTqebsXh9/qG61SNYU4LkGhRQohHJVejCWpobC0sMlXbC47Owpci+C0WfDFaSPw9bXAjEl+wE6CVynAPGsCPW1fBuLt8l8NTEYmiw0TQlpmlwDJFB1zYS0xgak54Y9lVdXsw8GxW3bq9TahJaVY9qsL7lifseu734RhRuElJeSkvA5BtQDaJoT/Soe0xKtVI9eGhAoTbVn/7/jvEksp8SGR/y01yUQ9pkPNxxRHYyAZdXzXDZk3h5EZFey2ruWX2vwqiyhOyRccOWtiloMcHnRoPgbDwZanb3BXlnv9CfizJZKDNB0kAj77D51a635ro7KgEEqfSJEPcL0IF6sRRfyvs62UmewPWBhazA0j5SqFMcxTm4uMXvD/XqZw0Wykf7YsOB94ffdwXMjTv2bdthaLSp1EZFT/3Wdaseq1lRW4uWK9K7FAU7aHz3ms59Os+s0tRjMpoULW1Kdc/A889fd8n/19lB4M4F2lFqaJyGshZdWGDcOTgmaa3kNRSMNhcDpiJpU9kdq9Zt3oHa3Oey+OMbqv19rwLw4DS65qDq8HUyX0OEtygHLTUtkGh/Yu2J9GMrJWTogiT0X4MO1DFmB9CBOoG9bCWI/M5v0v05hqIZigHmdIzyD9tcGk2S4jyeeCDp9flsXrMtZDYonrpro9ag1aB2U5jq2te9hmujGMxFLbgkxzd0T3R0dm9JJuDhPQqFTqVobmlrbt/9yXX/0xifJ3CTVA70zePxxzh64evj8zjJD8qO4JgHvbi1taAKskzJyltuW7tWHZ6NRWeGhtRbXKPPwc1h/X08eBvpqOSXUFFfpXHYE+hbcxieiH4LyPGDB7mS5YdsJCdAh/0MdExj/AR6Kd7DpxLnpOa+mjnIUVGa0IxYxO/z2r0ajY/jPJaYPRn3hTR2jc1ldpnN2uZVd9UbjMrFRYVC3bL+tVce+wKo4/5gbW1t/ibGGjzBiB0JvVJnQnlnOrRbV7+hWv3JJ//HGA/IL0I7zU/kN4qmyL2u45iAg1suZfMOYhK4TJEEV0RufWrTDl2jPWq3O7x3KyafewmAH0AEH3VAggPePGDvd1Ie0YkCO9uPhsnBo7mltScpSdeyQimsqgiInwD9F1m9+CdXR14H6vl33j0GWZYSsZeKbrrLrDfb0XGLYcY9TsdtIa/ZaxvRmzXmkbGBddsf1mZci1q1Yu2Tpz/9wusPYgGqFaBjuoboCt1rELU6d+pSRoXSpNANDujqH95R1/7eJ9dd8n+DnUT2006JMCDIFob2cHQ0R8q0pdEYXGYtyNM3tNSa5LKaVU/dW724mInj8sN020YsoT53AFehIK7yAhgcmWEnmxBMirE6CeQYgnIv7a3j1UqbZK3Ek4uIFUskwJggjt/4Qz6c4HJLqJfC2zH+1lQ5sb3zq2TWjTV0ype0J3t7aZ6KJ+LJBAXcky6bPeQaDun1Gs3bY3vqdm7r6dEZtTtUg+2fvPj0C4/VwNFba/G8oi4gMb6DwP5Ar0tn0inDx0zqre27W9bufv70/1eMPwmc/QMfGUrhLI6Yn0Jonz++iDIN7K1SBopNuFsr+alJ5StvunnL5p7F2Zlocthh27R2GqQ9iHMx/UCbaK5kWhZkXYxSApqjViLJkdkYELhdu/JHYVvlrUUQxgF5cfGKFT/z8oIl1GFgDUuoEyYnw+5SWSV8fe4YfTAdTZh7XeYYK9JxrCXH6WRyJplMxGNYaHHZzDazZr/GoH5q4hGTrsfWrB1oHnz+5WefeLymtqhVTuhnYVEJOU8L1DEpnVGqF4+hVl/f0t78cHN1+ydXXvP/keh+JO9Kn9quoqi74zh+0Q/OuM44ftNRZ2QJJBDWQELDEkggxBCyQEhCND/IJiFNCJGESEgQGopAlTRYQBEQWaxFwCIqAQVHIyhWRbEuuHbcR8fzfnH7F9DXQsfpDLY93PvuPfee8y655/YrrlgdGED3C5N9MB/R71ByxdfZU/HPD4408WHcjFkZrILi3G6uWxuLQBs6MCYTnd59AmLzDQhR/SFE96O+1ke3/KR+i7ZuBwkfgyHZp3/p1lmopFFL30cyO3mZC5cFAR0NekJSISuRfEac45DfZBHYgTY5bBzg/sq3F/yPTu3vB8ARejwzEeJDRNZiA/PzO5GdSGNfRKlU1qubBg38vJZag9Y4qpeM690CmaWquAC8LCq6h+kn/xDuaNv7ufv7QpP8QKhz6zWCyYkX5z7//O7/yV4NMvtlbz+D6sjpxY9n5u3Rn774Ajz7O/1YfEvOfJhFiuzklIcfzsp4sDydV0NJjDFPNLA0ZCyzrWIFbpeu3+KX+VY7Ebkhs++ReTjqty3/dly3TjyBmZmZpKIC5GRnAqDjAHPgTj4VJjJTE5JIqgfoBBuceOuG8T0BH+/zLRxbam/37k1NOWeWl+2kilMGlpY8832dyqbBPnVj02h9TNnUIe3Qi9qa9VLjqFaOak2gqBXxCphk0v4gI5HBIgRBwZH7Cx9vPthBzyZXhBVCvmNibs7t+H/keKzA3f72R28PTQ04o+jWos5odA9DTxLmiQkotFl4KQ8j8yR21sMPZtdVVbnlakPAMzw8NMhVzJ56Af4hG7CGGmp/0v8xinagjszucaFa3wbpCuBJZiekK2HgHsy8775kGnLyFRmMOOiIbRr15DQ2cElMAuqo3xn0niPxlwGpgoNvmQKc/gWF/XX71NISiJqZ5ZmmkXnYiO00QdSwM9oYaTJElmP10o6OjsmVN1Qt1RIttmDDB/KwJpyTz+GAjs0gk/ZMUsg/wu5Hjm8eHTVJKDelVzj0Aj6l4XfN/ecLuosvvQlhftkzJwY8zqgHPNx3pICjSdf70/BkGkSoGK+QGvtebEpU8gRG434sMD87dkbWvbLx7LNQKMEEztcKth03eS92mrfRpgV7XX5Mw/1oz+OZHaUTiyAIbSN9lT9CvmJSUhYOEEZ0J6amFnAKkNOZCEi6pE9mJAMeZhrZai6Iw85mc7I5j3/244Vev9MZhQx9uXP4hGdmuW+nE9e8si+i7hxu2o8ZpcJp21nlilTf1qLQao1SuVxiqtXl9FSVkwRPBu1JDKR4tKHEeVIXix3w+RKkeMp0QCncfNncfzvHX3Ljtbdc9rY96pwh2+SB6Hc/fffNT1CtEObqkfvowGAAAEYGXHyL0pvNkyvSSGBpeGxQ9vTKGvL6Op5Ko6EmbRo0CejMvVN7vSE/ERl/0/rox1uxH0gHUABrV5LWkdBRsRNQcRDdKSl/Fm4sZjazIJvDLk8vamGnJiUkAnny/ZHKZCHW09C5EQEDG8K1fkhTq9WukAe3+PLA1FJkuS+yE4A4OdbUN4g6blQtdEuV9afPnl1RSvnH2sxy0DRCPsU36VSVlXVpyZDVEuQzIYFi0cqIB2pH9+V8hWMSkX5AibscE11z/90cf8mt197y9hlc4jPRGdfQh7N21G/E9+/Poj3p3gzwGnSNjc2G4uoafke9crhzcOxEz8m31p/dXSe+nqFT4GEwLO/dc4KEC3oHWl/fC4GF3WrF1mPrKN7kQmbPJo0yiXIEL0BHpRbn4TBhuTcRiZ2Vxmazyouyi3NyilqK03PrOIn4nQQGIhKJ+MG/UEc99xIH1t8gZtvkW+1TO9FIJAbJ2nBfpC+GXyJNWHvt0MtHAiMGw9mRsyvTk9OTZQvVRq1JL5VzBTqLCmKYtOSsDCQd3O/xWhF7uP0NsSYN36GR8U0UpVCE3dTEf5SPv/g61OznLxu0R8Gxe/AJbAz2JJDYMd/GlivrCKBJRWSCwuTU5dfwTZLRQKDpzDOT6Y7FJ3YXd9GoQbIAkQrCOhj0IuKdrtCjfi8kaj4fvApA7XwGBhcJG55iROlGEMfJAOJxzAE6+n+I3zjZ2UVFdZU56UUlvJy8kty6ovLUpJQkRmIyQM/E0A3uA8CbzWSx0zgFzBbsWJSNtvtmYsuBAGzjlvoiMzOg4+oN0g6TehDYB5pOq5Ur0ytvvPeGrqRFUd+koUx6h8KqsvLQtWfggKVLBeyga5j3v3L/K/ydC2E+JZDxcdyUQO+e+C/meMLGnL/i7TMz0QFwLDPOKMZpP6GXxmPmjAczEJkQMGADjvzDM8uP1lj0cmNsObY8tPLc0888sb5ItqF8m7DlB+bQoLRClgAWr/Ux71779l7rFsiY+JMO/WlgY4jbeyorDnoiKd8Ss7LioGNr4ggCmFNeVJRTkZOfm2MVVVRVVfHy08sLcAkQQpYceIPC5z+Tw0a4414vAEqvtCk8vcEICfTlvsBSpH4nggpOYhwE5iORvn3JqFq9Mj39xvS4zVxapgljwoIcr+MKrN35cdhT6IV9zFyx8XX/K83qWFjj0LgVuAjclFvhlv3ncjwJ8/OrwwE7+p2pkRN2ZHZ4iIBmB2sBgB5GXictNEZqR1I5xbwKgUlyYSewMzZoPfr+OhI7XrZGND/WTqQLLpc/iD2HqBPAh7DLiPMpeW0RUc5Ki5s7Ajf6IV0Guc5xXYCTybq3MJVVWPjI4y2wBCtOz7Hw8nl5FmtNlUhVa7GoRHnp2Yx7k1MTcCWgGrgvTtQw/2zZOYj6/pY2icu/VN83srwU2Y8t76vVwo7BWVzrykijQaLeNxgMamnHG7bpaUFDC18rdMvDfF1YQ+msOfARz3rwwQwGMwUFHd1PYHtSPGrkA22grheYxJRtoue/leMR5p985JmBYfbSjH1mBm4R2/Rjef34N6AnqMAczQ1QZ7HZedW1fIl2fye2PNbV07W6u76LPYkQZqjt9FQlGCTMm8fjAhmHUs6/t7cNCeqvCPN+5oPEGuRh8DEkynFI8KJBS0lB8ZaaeG/iIwnwjnjglTJeDu+hqorjXRaVRSOTyQQKi0hUdfQBTmEhC1s6yZiQ4TDjbDxYWaDOpjm66sijIWVkZjS2E1Ebjdp9bEka6jvrpUZDvdHYaGg0yI0dK+NYjKtdaJBL3caw8EDu1pRU8epewl8QJnfMRMI+kb0/kLML4VE5n6/R6ymcWkosk03+d3L8xdfdfMv5t88MD8/3zWPjaGpp6gs8lvcZfPOJkQSgoQ/Ni9HGMZSEbLRHxma7e86uP7G7u3tqbdH/BNjWdnw4Ce06MAArgeAWKPctQP76FjpzYH7/Ebg/0UQYjTgDJRwBnRTtQJLU78xsdkFRek1O5fGTvIdOviyyOGwWDV8nkAkElu6qvPRydmFiEiPO1Pw5dcPPNKBOSm+QNc1yX+vOfqRv1CBVG/o89fX79cNKtQGadEN9Y6PRWC9s7DB0mIxafkOzWShvNGmFqNRUVScrj74EgjElhZ2Mgy8PY1NkuTK5QUOJ+e4wRjAOXZdF1vMfyfEXXwI25u1Z5RhWTkbmlwNLUdKmfd0P5ULiEVLEZQCcR7CTDIaMXXS0SmaTSBFJkaE3npu7YvexxWdPba7BQwK7ihClYU8Vl/nAEFwKXBCe4Tp/9PXtqGIBkPeDjgEFR0BPJeIn3OYAnKxGIc4BOEQt7AJWSyWC/PjT3Sefe+vVladFVse4w6HXaPS2HpkoPz+/KDuTkZDyrwFMGvmgcc8uIEPSBfPStlM9alRLOwPD9crRyKDBCHWbdLSpvlGtlkpPG9VaoVqoNYTNZQ2UUGqiTApKZ7FYH6p8icxcUxhk7IO2PaEAGf7+Fq5BwtfwBSadTiBWCGSyrufn7j70fjWA/Oavzn81vNxknx1Yrl+ORqOtrReIV/fjLOZ9wIbI0zDnLsT3QH9LMc/CV0uVgVhsZrj7uStXr7761Cmoix4jfThC2zsVgrBwagDkK2RmG/6tPfRp3p/biF3rEQITSuPMh9Gtkao9kQY96d4UMHA4yYUYqreUVIqOnnz+5Mk3J9egjzjjFok0cjnCEbirqkitXVrOTChMID07CDpSyJO5bDzYmWzy/+lfoLytfaN9S4PzqNpxozcSUWMfVI1SqbqvswMTVrlEqJYa5GFus1mvFx4cINY11p66oqNpgB3EXyr+2qmkaSfd24LESLlrkd9Ry/N7BBaxuOvOQ361X4zW/N3zw4H5QODEsGc5ujTzE96xJ5xr4f1Hku4jCEFqAloUwpVXFhrMlESr3m9qHD5jOz53fv3qq9c3XYAbXBvRJzmdcIWKDoQwR/MFN3Cbb2HRNfbrZ/gOYjPTOOBB6LcWEekEdFRwdJinAHHgfoTNLEiv5Inqnn6x8uWer5594dXdtfW1s4pqnVxik3TIuTKNrctapXoovTwtsTAlkUGSMI06QCcHfR4h1LBg0Sb0+5dGd7TqzkGlwXi6U63urEfsCxs7DUI9X6I2GDqkEonQaNIca6MOjOEDoYCr48lUPB7nQYipGKTewGIIIeQLALugUas5ECsUYkpg6eGbxT0vXnP3jYc4xV9yx+1vvP32uTN98yMjJ1DALf1EWvPPHi945Ai5z+/LygIDRzCHwLuoBK25cHR0ORaZPfvll1etXf1Ee3ANonGoFwB5yG7f6231Lk2BhfOhgtvyu7Y/fpSMVojnC4u4+mUi1BPIdR5n4eLDlKwsgI5dxYJXiktyeLzKiZcfeu69jVdffQx69KENn1NeW803aPmUST6uFwhkqONz0jkMwsvingDmJMsT1OExQyp55GTMXH/c354ajQRGmpRnTwcaDX31BrXRsNOIYYpeK4kopVLsS3SYtFq9uLRBbBIqwh1cvoCvqsythPItIflhfOks6CKSUcWjjm+Wj8oPdDquwqLTacR8s/XpubsPrwTq4ltv+eStwUGE+OxI0zL80ffiEoaCpAdZRKaUgJl5Iuh2RnIaZisWt/aCOrYzuhToee3O669+dd0XDMJQrDeIBm0Li3S+Xld0aguOATCowGiFeEhcwKOqgPzxAjZBPTM5KZWJgi0OOhDHSSLhnkREEsUlZTk5qoncky9eRpRvG49thkJo/nwRyoxuwWCE9Fhvm9TIrFWVkC6g7s9IjcMeB53AzmGCqnmAeAZ+ppvaWrowqjw9O2JoVDZKDdqmJiPWnOWS/QCU6WEhGHihxGYad1Q8cExn1Ii1en01T2Q9nlPHSQbo2JxkJOMneCQiajcbjAd8BLtCp9Mdo8zWrhdvP7T3+qW3v3Xu7ODImTN9gdjOsnOK2HvSnCvdTbEKWfcSUWJhAsI8/XjXuFwNmjMSHX/zy993r97Y3Fjb6N3292Kf2YfFmmB7cMBjB/0KNSlquS16n/2zV+4nh1znmak4GYRrJ8mcYI7xGSi+BORpNvuVltK2nJz8SVlR1fvrkMQsntoccvl9OEGf03iMK++QhiVSbLk53BZRTUVOXTZpKoh6gVzsmYSsoXEH8Bza5p88vLsXaRqsV440GSBKnm3USrABNxrYl0ix+CpFfh+X2OTjcoe1uLTBJBTqzFxKLLByVUXlSclJKcCd1kaQmx1tZFs4IuErxFyF2WIR6xTiic9vPqShfvGNt5w7N32mfjbQN7WDoTkyO9lgwp5ifBWKiBLxk1VQXlqJMhpy7tH9eeXx597bfHV3yLe4uYl72w+9OPYmYfoUinpgFuDca0Xh7tqmH1XFOI1kX9yOgB3jcvogr5OTiDAH5ICe/QAru6Skqiqfa8vN7Vp89QUYFywOwR0UC3XA3Gt3LZurxe7Gzo5xh82hcbhloqru/LqCe1PI6nUmi/QEBPT4IUQNUCe2sBG/E8om7E4YhwNarUQuFO50Co2Yt6jVHaSak+ttcttEl0X0ik5vDiv0CrdOJ66sKMrmZKZivkC4Z8Z9YGXJ5LfFrFby+VyFwGqhFEjxsrsOaahffNv5c+dW3v3wQzDtAZCu5LXj+CsMuHGzMhKwmwrUU9ktJce4fIlR2dkxeKbrzWsuWz9l9+EtHbDsvqAXqMyEgLMHG3AQjgdxl3tbP8WjqnjG4ylYdQISfMX4lgTBnEG4mBQiX0GOxwSlgM1hlpTkVKXnOESl+ZOPvfDY4vqp4FAQXqFo+Fq3XAA+5NJWmzVI0h3Cae34pMbhsIqqcjlJhejdGKmZAB0j17/udhx86ifrVLVT/qXYftNOQN0hQQvQOFtvUguFUqlBKJQI9Sap2kRpNI4JG7+0zS2X803I32ZuZXdNXVFyJv6oJDHdhxULFHNkdZIaMWkUXEuXWKcz67oOa36/5Nrz75676qozsztT333zzW/xBXRCRzFo0LPioBfl8syU0KiOaBvPrJx8+ffd3bXgozChAOEWQrtmHyDW+zMzA73tXidMxkLeLcxWoIH5rB9jELyxSabmcdAZyTToKXHQ701NxHIEExhVVvJKKl+cq8ztGXvh1Mb6E4v2IYgc4Qu7HYTZTBDyxKHQMGU+5p4UGqbVEB7pNRM9Kh6Gb/jOQbGNbWakeIJ9HHV8xJ9g/axZuBXq0xolQim6tBGlUWKUG9UGoVaLdWeDwcTXaPj8Cf24I3zsgQZ+mBJQ3NpaXa2oO6eunA3YUTFkZJIMT7cFC9zOer3MIlLouGaZ7N1bLzqU59Kbz4+cu+qttwdncJv/QGd2JtTbyMOMLNrxhVg3F/FqFCbtaKzeOH+u+82J6zfWdk9BZAx7Zvi+hIZO2P3QFy17cKWHgghPpx1yYtTsyBlp7NREbM6CMiUt2pF4ARfXLOFWZ5FGjYkCrq2BV5nf/WJ3+UnY0sBgbnFo1deKHwhzrx3mz3AH9gbhP2AQNFdLpg1S4bhe7xA4rBZrTnoxO4l0f8k4GIj/A/pLL6WxkeUxcz0WaZ+SS9QSdWcnCHhth0Gt1srVkrAapIuAUmBUaLNRJoR5SV61Qi926xSKWrPVipErm2aeM1DGg14g6xULCv0zgzoRxeUKZMdffP+QPv906e1fjbz73icjeNz2G7iI9CPOk5MAegYOIEdrzi7Kr64VC6XGvsbOwHHR85dd/dHm+npoYG+rFRZ+TnsUJfuWfTnqhQmcN+RHqw7WlSzaYIaKuTcs3mndGGnS4mTun/vN9PwcVVL2A6Vlx5rzKueeP/rQ55svvLoBrmdoDbMbGH0jcYTaQy7UCS5cJf4h+7C7Jk8mRaYG6lhw4Ktq8h4ozk6FvpVmZrH0BNDBz8UPeXq3Hw3cZ2J7a0w+PKzE3SAxonOTq9VyuVbrdlMKyi0XkjYubHKY3LUlZQqTwM1XmDF7E+VjmpuWwSCpCctUZGWjpbpBMnyZW1FTK1ZZnv7gjdsOJ+iX3/7JJ+dWPhyORfe++xEESjJeNmM9wkiMxzkGjOW5J0XcA7VEOSIcdFQ9/cbu2ke7uLK9mxuLviE79IOtfnTm0aCvHUkdBhF27/ajn9KsPSY1aWmE2kFzTq+5MjJQsieRiXkcc0xX0jgtpbllzW1lFsdD6R+gT9uFjn11bRHHB59AZ4iYkyDU7a7edpd3CMsxSl11g2NS2iEkZZjGUZEnKqnkpN2XlZTFwN2Ow4q37XTAk1EM/Rxn805vCN5yWgxcoHAS1hv1QrUcY3KK0hulEkR5GJ3c+Pi4jFdWq1FQB26x2FpS8lDlQ1A335eBDXlGIgv7NJgzyUZW+RVms85S+fzz791zSEG/4d3Zs+9/WA/QAz+2FKSmobNKjOuKshKPFNxfmlshEggvXIioz85aRC+ev/qj1fUNyJz8GxtDz5w4gXE5zECWvXD9dhJfAJd361GEOZG6FaSymdCaYm5FFmTioBNir5BGHUw7mddxinJzKstKue7uo7z3N4hdxak1l299Y5MIE/3IGy67b9HnJWNa+xBuktkTs6cbxRW6SbVRKDXYJitV1jxVUW5dORNcDZo/GnX6emcWoH7kgOID6uQyPhjyj0rUKOAatcZ6uR5czwEV1ug7jIhziNiE2JlzawQOt6okXxZGBqgtqeFV1HSfBPkHpgL9AYvVks7jqmTTm7pqMcUVKZ7uObygn/9K+daHjTszrctt7JdeIsMQPI1ZyIKOm8luKW0+JjaayGMIneO8qunVRbi2DblWQyit7FNR74CvdWtqeSq06LO7nHD+sSOzozUnDUABk5RVOITFxQEkcYkaIIelCKMwCcLm0tK8vMp83tzTdSfnIGR/8tQTi4CamEb5vEC9l8CN7gDOkHAgCPkgTTwxu7gx1lGRR013vCF9DzKUmm58W6rys7MT8GcuBPMDbxFmZnzUjjyPT/H1+FcaDD6vWtJEJqyT0whzSnwQFqoBtm3SJAfqereG4gv0XV28Yq6Mf+yYDi25WITVjaJsYrWQnPbw0ddePm6RSRf1IgvXyhWbxe9dezhBv/GGdztPn/ukqXPJH1vglL8Ea3w8eYy+/F5WeXlxQ03twQXtTn2kyWY9PncZZmkhb2gvuLH6zIAnCh8Sf2hqyg6IEISwoIE7xetbhGfvJ8/YYyhNFh9xIIKJgx7XooJwR8TTpGtuDi+vW2B97rU3rsA7LhuLKNlcQb8Lv3h95FInvdoW6kMvROiA3GMfCy6GhgaGO23VObpJx8S4LEck4Cu41dV5pUVk0o4N3UyEJQ4d6/HD5qSxwRChjne6YhKkiOkOmZviHyDdmzQmucNmAupkmuKmdGKHbULAy8vTuQ8UFFVTU11RVZabzjmSwEh78+WXn3/6eUHHokCl6lapas21b1x7ONmZG68/p+w8e26wL7B9YSG7HKg/zMGzmPeCgKvLN+sOLuAZhJ1RXW2t4O3djaHQMyEg4XUOOMeCQ0MubE96g72QloScQN25TXZj0Oez0PPR5Xrqn+I0fPxdwOE2h2zlSOIrLey8nMo8kU2U3n3l6rPwpNk8RbwAwers2V1I54juEDwFsY3hcXrtIdeU0+NEqncGPCCN+zrdDekyWYXGMW4TO/i1tbW8nPT8FkZhAsrFpLgmIpMZPwh3HPLuLkyg7aeaJGEsP7mFYQPxGxOawsSMgNLp3BqNmbJNumWQOPSktzUoUMPruAR2Li+f08Ks++D5L695+nmZ8ZSCq1JZVTXHdIcX9K+Ug9PnZgcD2z8vlH9fl12UdpR1pJBdVP5QhQrC4wsXdnYOqFqedGP3mY9Wx5DX7ViX9ASdMGQemHHuuUIhT8judXkH/CSxExOaB19i0qATyOnEnkQ+aMhBsZNf0fk/0NLCy+Ply44/xJN9uPsCtjA218mlASsRNGlbPmR5PLzoQhEHzzp8E4SmPFC1B4dOzA/Pzg8PDnbOnhbkP2BbmdZr9Ba+xsKtwW5V7gMcRvK9DLQEpEf8e7MmjZRztOH7/f3Nja0zByYKEpfTUptbDlpWr5e4sSkn54t1Ej24fZkDezrWvAeaj1GYqilquNyqnPy8trzctz645pqne/jSXY3Felxl4ZrFnx/S9H4TDfq7H3Yu98rbir4/Wn40+3jakZai3AquSC7RynciJlO4rG7isY0zMPpeHPIAgqgTMIQG8HhOcM+FNu3EELRP8BBBm4YCjrxxS3L7X6AjxOkFuH8dTGhbSqsqKrsnqx56bmUdbdoTG2twcHcOuFpdA6Rqw5AF/t4Icxe0aRi5eKaiHry1OeNxzkOvtNO3vDo2OyJXpXOnpWDn3DqZQiOWifJ4xWws2SHFoHfDHwAFXVzmykSKB+79WAR6wDzfC7ep/UYDRjc2m94tEVK14rBbITZ1oPl3IMA1z6vAEjXniXUak05MVVdbUK6by8/Nvfj8iz2y6XW31XpcZK3lHmLQPzk9+N5XnZ2B7d8WCOgPlb/IZqbn5VW5TWF5bEf+8wWqIb/uk7HLNofW7HiKfAD3K6p3+/AwYUu8HvwnDEn829/EaAaXxX4JnTnKQMa/QAfmKTTXnlhYSEQMLf2leRUVOTLZyaqutatfWF9cX8Uji66BEIEc4OOVTYAexBqGJ+7p7olOhdp9noATJnHK+sjMVHAZ4I81OapLxHyb0Ipwh8rUqkovzq9jEmKXQa/TE9QR7Cjg8YnWv92PYG85cO3FtBL3+Bvj43qbJExRbhNfoVFLxG65TWeh+LXPy87ySvLTy2oVoOjydGKVoFZVdvL8lR9cM/eibHqxC5O441wuV/HeIU3vN13/7ukP35s93TfTHl6o+/7o92/WzXFa0vPEAiqs3hH+/PPPv/64UPTa+Ss+Wl09MWMfwJIscfyYmfECoTF7kHYq2ILS/JfPsGhTwMbUg4EGAGI33OnAnK7egDlOApp0MkH9g7orfWp6vcJdrLdOx8+d6TaddrrN9FOVRZZQS0L4BSIhGwkxIXvIVrKThiWAmFCLiQihRJMomGjCLSjYYESoiVo31FpboRTXWrS1avd9fd4Eu/0HnOK93rYDd3xyznvOc855TnXvdSZfI9MMDZ+QnYUu9O0HF3vG8UogVZvpA6MHg6cTMXf0apG9RwD5AJbhEF+yudX4chopBEY3VyE/EZSEGkXejvnBDqOXq2fThWoaj1kLVy8GV1MAHYbCHUU7US3BYBWapEdtqQMDKNKmps50KCaM1gmzUiyR9ovNTqXay6Zs6tPnLjfv726lIcLLKT1cX6mlXIznD89dOt0yNHhrCIncmFq8qUEPRB++mA8Ev/nK19rd2v3D7neaGvhCrtVgUgh+C8x/vejr/iEwn/VDy6VrAFPNA+ngQBcR85rE1MTMzE9+RsTeEdirqoowQ/y18vzwWwmAx982QCeent9hqUAZiF0oDdx8P8v9lIjSXLzZhfwAQrMgekipT1700X0I5pGufQdHe5DAoWZDSOlLB3U5VW58dMC/lA36e9IxMAXzRhvTeNZ7Bvm4Uuhur2W1aGpo5WQJitCyqNjzEiPlwL0Kq5BVpGg/jj6MNnsq4ZyANLiVPWHWUxMgZK1mvZaNXyFjx4XT9090d9NaOTyfEtNxePGpTuaJF9tePjk3NHTm4tCYe2xETVH6TZrIvRfhHZ6+Mh/Nfn3C1/r7O9137rxsoImUXJXBkFL89rd/+ONiHvSbKwv+TFef3w+xtjj0+g9BgBeRPZOdQc6e31uv+wbGXAsJHHHyPB9etBNtFQy6QuK1dGdR/R58LqoZDLpGJPLKumVnb3371LGLSAVH05ED8OS+n+T7aX2o0MG/RZZ+8nWk7LjbhzceH7cIuZwZxsGmTDa72nNoJotnxh9NhwVUo7y/w2zgtnRw5V5jY5uQhonZHUV7d5SWkuH4vSWVZWSrHVZYhcLDfv36Yn/fPoMChBxW1fUGab9V39FPKTvYGk2HWTv0zos7ra20Vl5DI1vZr8DD3klRF15su3cONnhLrx6Znh5xsbXnNi3ob5KZswsEdOLpd3545/zL1laKPSgxKSSr8b/+2ufzLdKubQXmidEufxe8PA2a5G7XzCj2mNMzPzmC1ko+gcMOA2YK0Z8jYT2vBFe8UaXtgaPvIFzc9aryRlatRsMaamluPvfsxo3bt0b79kEr6ABieA+6K9iDGUDOno/sPd+E6/f58aYjwZvpSi+vrmbTyCgy2RyKh/RM/l5XNHF1PGqmN2o72IMCNbuDaqArm91jtJoGqFjuBbVPGPmNfRgYQCdvO2QDUb4JDi6/eqVl66fOgpUxY8ja2yEUiSVKruLc9Isftv7+9w1NbW2dBgUc3fbKyr3w4v62J+dOe6W3TrvbL0y7nS7XZvX0T259dMUzOBeIZo+86mz94fk7d16/bG1ul6oEzmXcp/w1cXRe651nL2KZPn9sNBbOIdXCHYXYOEScsj37iIYI3Bzj8XXlXyvcTT4M6h6go2VOICe2q3R3yc6dddV1HCZYV9lIx/79J54/uHHs9qnx0X1+sG49wHYfBmfBy6DsB+xo1OFWD8SNsNuOMD+Q9WANNQNVyEguB+DxyCMJWM1lI+PjkVhQRzH5Sq9b2sISTrW4W2TdzcKGmoodGKcC6kQuDrYbVrkBOqI8GaNTHjjgcBosp/WA3Nrf4jVr3Nx+pcRpPHF66/nf/761qbrmus9l7A+FEOIp4drze/feOd0xeMs8MnZhqMVl5D7cnKMz7/3klkfzibNz4WT2iDUP+vkLL1v3Pzyrt1hS2dyff/1r3+IiD+F9ZQEIxKIq/3jfgZ4Z//hkJhbswZWs3/z1aP5cNunOFY5ll0CiApGd9MwR3EG64o9+1w6Mz2PqkY/pGPe5sdb9Q1dvfOfWg7vjByBhhF+RHmTvJLofhMrrqb6Zvu9/H1RfF4j8dw/5/UTQPZjDrlVfVzw8M+CPzERmRrtWg1kifxTxRxPRgFnN8ZlZdK+3o6VlTKZ20xiM2oYq7LmSx70Yxz8BecHTSQ0HLdPyerTabcv7usxKrlWBqXa93ihU61usg06tq+Xhyp3f//73TU2tdYtKNtNqBeauC2+eb3t577TXdEvvvnRp2k1p+9/5+KacooCnr6nCZ+cCyezXCeh37lx78rJ17F6HzqHC/ufff70IzDndd7ZuGe+BuyVG70IHGlqh4Uw2eOgImXqE8jfE/Ynce1FFoTYn4gEwgL4jb4jyO3aW1WCXnSmqFXLH9jdMrz24cfL2MVRnacAM4QPw6wPI3gYIGYMTAtAXQH44AMmKLqhZhNdNy/F4ED81HV/t8s/4Mz0DfUvh3FLXIVCDyWAGm2phlZ7fyzwjHeJOuVta1Ez1mFtGq6kpBujF+WZ7vmTHF4xMYldWlx+GBnSbNn3MozCL2aDjKPWIt11v0FNi871zKz8E6D+orr7eJteaQc8qXdyxF8+3bXvn9NTZi2e4ly6MjSlfuZ5sWtCfw9MXAPo3lZ3dAH363MtW4dTU5ag9nl1/hQe9jdba+sNnN2cHcnEcr57tgnMtpZFKHfzevvzlja+SDmoFWUUE80oMixF5Ag6gozInv91TVlXT1miz0entIydOTD+8ieM96JhD2vPAISiFgHwZPURaK30I7wO4xdMDYu4nAz/63sCrP1pnvvmufz292tO1mpnJpf0z+PHQtFtdDc6giohkw/4AlpbmF5Imh1LO03R4uVPtouZ2txt9HDqtencJKd6AOinf0GwvgL63am95XUVVOZqlPnZfHwbl2GKt0D3UMnW2nTIqFC1DW/KgN+zubUPob8Fii1g+9hyZ3LaXp8/eGhwBB6/narXnNue81Hs/CUYuMOhHInewAPr2cy9pY5euXLEE4/HViUXfIofR0Hp+6+TkcngcpXrM7+9ZDQZXv5+fjUH+dhT9pxKMC3+tvGxHWT6uY56QVGiI7gR0MiFFuuaNfJutnTtce+Lcyg30Vk5dJPU+YndPF/rxuLoEyAcOdB0c2Af8Z8D+4Acs//Hn3/oW1lCPjPq70sHYag4cPN51QI61jL6BpQj2a3MqU9gRxF7qQthuFkLmChtv7UNcoaxdKxQyyPGW0p074evI6PK9dpLQoQFXlm/F1V+HUKQttS/DFmuEXn3HvbNupLBs7hDx9B989wffbaruDSmx36B3hbTX3rzYtu3lmXtXbnXIWqZPt7uVrnOf+cB7NqG975Nb33iSgpgnl95n7ezuzoPePXx60DRvya4vG0lwp7UivD9VZUZHYwsLsUhwORifQdMciiQQK6jDWfyS3SVf3v3lr5RgUym/nLYBOoZcyY5E6W7QMT65iEXpZY0s4X3QMVAuGMexgNGZ+EzP6L6BCMpyVPwYvfoJnnaAum8Akxg91kXceTj8raN8z7EjfuRxPUjil0AGZVaDaVI8dmUAeWDdoZoNeOLpJMS+7Xo6r1Y2dJrdrmnHkiutllXbVlO1txiGzx6pJTEoTbakiyrLS/C8V9UTnf9Fa/CiFNRbh+CMmgIHj8r8/NYfwtF/0ITuHCXWstkisVikXlt5fu/ly3tXLk6NTaNUd7s0Tz6ySUF/hhWHwQz2uQ9aG/f/8Py17efudQunzgrs/vXV3/4V0Z3X2tD6+sX8ZF9fZGFuMuoJxoM/+d73fyv/8dH8gU2iLUA6qIW3vNBA3SjRMC2BPOpr1Sh8XDY+t6X7xIl3bqKFevH27DhYl3Q4jccZgoKj6KTiN6jeQOWnZ0AB/IJkC1iQwPg9EsBesf+nX59JL82gNp+JkJy9y4+6PRtMr4d1qVhM58lmIB2HLoyqg0tv7DjX3jLENfLlIi1dJmI14HDADuzJ7dq9u2Q3WZjFX/DAbxjpwxzlSw722SU6pVjbAQkCtss1/eE7wPwHNdW9dSLjhJGyapR648LC82337hFPb3lybWxMQwm3b2bQHXPxXHafEqDfuXbp5b1W9ZAuEU5hO0SJ3J3T0Ep7veXm1UgwOBmbT6BOO0jaadAqyKs2oy4H4Btrxxvz7ISPIaJg0Pssg4YIwybny4fGTvzwwhZE9pu3+zDcnAnnUIWjp9ZDxiX6MCAx8JN9cPKlQxib/94vVv/6c3ykDhfDoMl+HTH+mz3BdLoHAT2bGY/gZc/mskFV1BIc99ij2SDkIaEtFEVK55U1DncMdYzIlWKjiN3OZTEaGpoqiqFjUwIxA4I4luP/C3Wy7Xx8MZQ+EkRvRaLHtKVaaW3/8Jd+gPheU17Tq5nQKvspYz9XHl9YI6BffnBmevr8tJrSDE9vUtC/8CwaD0ozqlz6oJHf/cPzr7ffw5t+OqFT5SS6JSXe9AYOPP3Z1bmsP5KEbL5/5uAvIO+JNTci/QwrkG8EcZKm5w0aj8jj4O/oyvf28m0um7hF1jz86AFZVRpFoR8JZweAeNeBn3Qd6ALW4GTQX4P63+xoz9L3j2BHgghMk29DlICJt4f8735zqWs1jRKPnOdZgm97PB5LLOHxTCb82MCLx+MY153HhipFa2yh9FNosrO9LSIsNzMYTRWVkLIh/7qFJkzFf8NeV46mq0/3rmnCzG3RG7G+Yp3a+iV4+ne/W1NTrpGblS49W0vZwnPP7z+Ep5/qEA6fHwPowtebF3R4emY9nN0nru3+4evX2x/eYwx3GKJSZ3xVoCThvaHh95eeLczi4l08Gkks9R357S8PH4dyJBbESVQna0owso+GX3nM8+LdOKhWU9PE8ckpG5+tqW0euvuhbz+4fRuPeFcu7h9F/wxXOLrQPvUfOogq7fs9/pnY7fHMT773o9+RBA6L0fV4KIqI4ccdtekOvduTTUOmNh2ZQdm+Hs9Z4pGwKpGJxoLhYHA5FQ/HMeIzH7jCruWx2Mr2DrNZy22ni2TD+4W0OrRcS5HIk4RuY7LmP/rCR48evu5b7TGyjW6tccjYz773zy/9/rvE1SvLRWbK6sRGq5ofTzy/v+3svSvHzhDQKUrj3rSevjVpCksXTOHsQXEjAf3Sw3s04dRTryAXFwSNi762BixtTz9byCyH4/65YE+25ye//tbh43v24IhHHnNYweOJp78FHZTIN7A33MTku0K+kL52//4rt27cunn7KoSas8v+SBfpp0XyawwD6NQhfYuQs2pLXV8/8v0/L36LuHl9xQ6o0Oz6ClJDrMZ/9XqbMXHs62Dge9LxcDDuWV1P+buWPcF0FpCn1w2BNEQSTFD/tdslklAnD1pxg1hkYIncwvZ2Db2tt6KeiJURirgYsuUF2MlqO6ziMDYsBd9UiJVGvXLoTL9ZDdDxplcjvLu0oG1c2lCjfHmSgH724bEzw8PXSHh3X9rcoHtyb0Hfngf9TMAjcMRTysX8m956YUsykU1nocWYi3//N9/CODyI9a9U5AsyouBbXKDZ32ry47e44FMNQTCNhu9ShmrHrtx8cOvuzXHQKVh/xz0GsG0Yt8H1ldGBCGpyIN7Vdwg5+49mnHIkcHsOf7Ue35m0ZAuo19cB9kVjFLd14dXQBVxfz/pzlnDQH0incxAcyATj4bDOEzfppArogHYoOT6t1WlVs0eGvHo3i0nnNPTWlJdCxRhdIFK8FWxDuaYK6Zz4mEKs1/ebT+utyrF/gpFDeIfIgZGNpXQqpBWLpZMv/rHt4cOzxzqGr50fE1Iu92bN3j+3NarKORKqXPaAlgbQ82+6++ycWeexpOJaUqdzEN5nnwaWevwZTxZdtd/9+HjRjmKyhFgMIycSdyFxIx6exxwG6Y6q6jYaU6NlCFuYNNnDZ9+5fftiZHR8ILuKs11k7ILcycyP16WRv+PUEvx+4MiPUAf+/Hg5BL1A73y5FFlBoQ2/Ey06rLXXXV9UBo8cyKTi6+uJSHDdFAz64/60zgD8TZ51XTxoIrsMAlUgETbprD6eFttK2HrT0N10Jp1U7VX1ZIojX7KjN/TWQC7V1x2Vn7Sw2UjkvFqlywvQyZteWV3HVyopl5yCt69Pvljb9vDKw5NnhscI6NrNDbruqSe4dEDM2H/n2vbt215y2gMd83ZHMO50bZRsFxbmxrHUmstlBgjoh4uITkzFhpgr0eqGEdDzTg5VV8yz8zrlVKfcKGLsH1q5dePZqbuk976eRro+g0nmLvj5PsK8RQ51ZXr8owciIOD2LeNq+nFcioA3ouyDEVYPxR+kCkswQ08SOp+z693RQG4yYtKFc6tpUIOKeCQNkRFkJXGHBDPsjnA2KTXNq6QCea/G7T0zJDJy6RpKqdFwGhp664iz/zfo+YRuN6Zq5Bc9EI/ystWo0Ib++SVg/vvq8srrGi3Fd4mdRq3LMbvyHKCffXB6ePraBbdWO7xZw/vnniVVycGEJxfcp2U033n9+txDlGz6gF2XMDiWrAR0WlPrk61X/emleCYSQQj+3bcOFwGQvDI3IMaIxEbajrKofk8RHntMTzPlFJ8vFtWeGL5/+wY41/HRSAQnF3DbLYLmGemloFDr8w8c8C/1dGFeAsM3hOE7Xg84vkyywg0D6vgJpV8mOBEl/qNtfMPtk7P2lCqQjqf9YakhH+YR6OMpg9QpMYSzq47UuspukgoMRh+HkrcL3EK90axW9zbQabTeunrUbqjbS1G2b1RvaMRUwNNvB7QYjBS2c41Kd+FNhyBlHRWSa7Uo20J8x+wLgP7w4YMzAH1axHYJL2xW0LcmVWFdEoxcH4Xs/drrJw9f0kauGKRRgzToDBFGrq0VoM9BTnsJR7D88V/9G/Q9eSuEdkBDBmP2lO6BbGeNT66hYwWBThcNPUM77fbooT5/GpB3AXKCOAYn8NXlP9S3RDabZwaOEDFwpOw789rfRH3orZFv/RWCOgxdHZApPPHTk3czsViwy78u8Axk7csWXWbVIrDgeKYpll1fhyKoSqfAUvq81OXjU1y2l9tBiaooqlFGZ3Hq6jAnvaMUhA3IeIjfEL35r1XWHbXdjgqUIhlUQbniaXg6Ab2yrq0tZJ14pXSFGvmOu1sA+uWHF8/gTZ9uV29a0N+P8O4J2zH2nhmlGM0g5J5sO02TDaoGzaqgcxVvOo+HTO7Slkm/PxwZ90Ns7Bd/+9bhfBDfAL3wmBfSdtTURXVV1b6Qjd8Oiaj9F1586Du3n92+Ox4JhtPYiUFeMD57FasR6KAOYA4y4od8RReGb76f+gNEgut3FkEJIM/xbHTo3iaHb1EnMuAVdSzv+LuTua719VQm60nFpdncusHiUEgcyUxcqkqF4ziNbTI4AhazYCLk47n6z4rpfCVdpBayOA0MXt3OPSXFO1BvoPrI99/yoPNvRymxmN0yJKZcwgLoTXtrym1OpfiVku8T6+HpL+4/PPvw1r3psbFptXHTZu8EdFXcEg0E0wdctO47AP3x6caWjsGpBYsz6LChZGujNTSdW4gG4VjhTCS7+qu//fgwWHU4+n95OnI6YFO/p76quoomkvNdWgw3D1958J1bs7fRmUOV5UdzZcafHYhA+v0QePYlkDJLkchPDiwNfO/gn/7i+9bRw3l1gS/nCwGA/vbD9N+oo8TGbGt5PU1kP3UsnlpHvZaCXwewjWiQSAJ+nOmxx4Mpgw4agUk7W2IfNDjEtja+S00BJC2bwWBBkYzW2rCjqHzHjsKGM1rtRP/oKPNAQKxVGtkg1QnoJHv/WlN1XUjDnhD7XE6rTTD6nIB++da9sQuEkaOElz7y0fdsQnv/57YkPXGdx5TNHNAwuu+83v7k/jmaqEU3N6UIehDee9tonKaGSysL44SGBfTBX/wNBVsejQ3QdxK84Z1oXNeVV/FELJqPcslYzUNbbzzYevX27EBkNb506FAWxRrmaAfIQgy5rXvIj3/G2uMREHB//NbhrxZhF5xoumPpCZhvgI45DFhhFwp8AFydKDli7oVnTL570B9XpYK5pBTXsHUK1VzCbrKokiqdwW4a9Ji8TsugIYWQr9A2No4M9VP9Gprb7WbKNCxWU00pnJ28SPnpSVybqjjaeTduJCOQlIbSvn3Tq6uqfMYJuU08gZJNcQhvOh7122fd1y5caNFS7s0K+ue3JsJB+3wY7WmKth+gn7s/xBFeSZrnFxyu37p8Ph5y3tYnV6+iJM5B1j249Is//5iA/hXijAXMi/B3MusKPfi2WhZWEt1CFtP94uTJm+N3x/1L/nh89NB4NhL0k+c83y/HFlRPLjiD1/z76N38lVxN37HzawR0Ug7s2gAaRtgZ/D7/UwB6aUmeUKkiM2585/ixGF7vlANubVAkM1GLTjXvwYXkpMXhmei3gJGVGhwko29pbBwWeunqfm47y+3msqp4TW0NdSUIV3kpOlhl+VHfgVVU6CKhUO3StP9zex70qprrIbGPYrND7H6b4cALsDMPz158ODyNN92lHb6wWUHfEjDFVZDT9AP0bgL62hDN3TH1VGXtjy9pf06y9wbahZVoLJPLzAUSXTP7/ox8C2iQVhpsF8hXuDqG4irqENlrG2maEdZ+4RUsrcwe6OmKpHPLGIjK+WNZnPvC+PKBn4BjP9QTzKZnsJL4ox8t/eXXx4/iGN6eepRm8GbyUdq1ATuYmbyRDxWZgCHkHyHNi75K5Dt5odQ3+xwCZHAOqcWfUdntqnmdwCtNQmiCbcE/QgzUIBCQGw4twzyeyKvXC0UQCeLxamkyYXMbdrJhBPYvl2BG1ndoFePtSuiMu6hzG6CjTl/kK19pxU42n6/45srzx6jTT50du3BtGpurwk0L+tZgOKFSzWcyffLa7vMI72stPGpwXuFWBMKv5CjZOHD1c1tiaLUkgwvp7NKv/ht08uoS1UesCIOBa5TV0hjuYVr3hYVjJ6+Ojvb0pcOrM7iQN5kJZCNQpulD/tbTg4kZNMsGvt/zk5/2Kf7488PH0ZOHihVIGExK4xv+B/SdpG3zZYAO1EnaUIqCDl9kVw73AK/zuKMn/UjhdMFMQmrBI6UzSJLzOiiPBVQWqRQ6Iwo7DqxaFWcGRY1MDVdDRqkYzFohe6SZx2DU5C9KAPVv4HoBQI+7xNCadquR+P1zez57JwJI3AmtlR3SuFySi1ufP358+d6tK2PT5y+0i0KsTQr6Bz7xIpnEgZtEMDIuZ3af3w5Pb2EYTWa2ak4nXg4RGpbT2nBuZWEyEU4kevzp1V/9HaADAYR3EneJGhxRmaura6aLGlvdXAbEgm5+e3x2dHw8s7zuPzTgRx8+GCP7b+QWLqnbsulVDEogaV+y/vzwV8sLM/L5kemNxxxWYHuKSxFFijeYPvwsoI7efYFXQTO8V26/fTEh9QcDFo/do4NWFLaeBHpV1ANdIQFkJ6ROg0I/IRhkG8xUm0/O7teAmvO2aHgsd3d3a1MNLkXszIuNgvYZjxMdULdaPOEc+ccXCeZ40+uM7JDzVUirpEKKW1vePL5y9vLdx0jeERA06k36pn/gE1uiKo894EnEZjWM/edfv35y/xJNbTwT9ehfpVf5Pl8bDW/6uZWVRGbO35VLL63u+/PxQskGKyoB4KU762A8tLN4zSPgP6bnb52Kjc7O+lXLsUMDyNDDyTnc7vwJOfGGVz2WCa5GoGWwD2rgf8CORDl5q0sLeoLwbFh+AgOIkzmn/Dgt+S1xdlCoyLwIm1ZoloA053Azpy6iyxpQqSQClSqgQ5k2R3SkBpHCW0DWONlONF4M0Jvg2ng2eaPMPKVmdGo1ojF3bevu6t3FmPHaAH0VOmGUWqk3Gx/C09FlQ3hvazQqQiGlS6ykvLe2rN2/cuXK3csXpk8Mq0Nq2fbNCvrKm2DU5AknYuNygE4SuRGaUDrXrzRlJFY5D44O1J+sJOdis8HcTC6b/tHfjx8vgA5qi0BRj7NKHJ5ouJbHddNOyM5sPflg8ur4eECXG49k/FhM8c+AgxsdvxojR1vTwfkMNpjQQV3+6yKS9oqdX/kawizh4AqYwzYqNYI0koV/d+nzNG9pQQ8WRmp23FvtlCChg0KYQqXyBCwOtj0scRjsUofdIFAIDFa9QWGUSqQSs0HApni9GvsUyEItrkUg22ytbaipqSiuKykrB+gDWa0GRKze6XIO5T2d1Gzg3l2Uy4UQIPfeWlm7f/nKlauXh8emhaKQhvX6E5sU9BePwqZkAOH936Bf4pwO6A1BwytFlt/mI4wcPH32aiyczmV7lld/8epbBPRiGLCBAHx5fROTKRRxxriNHDo3evHbd2NXJxOeMLSgcBzPk0N9TjaQZhdmyYJEPHPz6lIPLmU6/0iGY6ATs7ckPz2Lzkr+ugMBnYBNsIa2RGUZCBugD7Z/T1GhrUc8HUa6YyjfrnPk9ovHgpKww2PX9SsWUlKHQAdBGsgHDU5YpQaxAgceIDWBLwVb3khjqt1ssZAaaR9urt1PY9VWlxfh83MUoGfQW1GyuZTDOP2PL+YTObi6JmQTa60uo7yRe2zL88fI5MYvXxo7f2LYqKG//sTH3rMJ7YMAHUenE8lET0TD6yagr11qE3LtOrNTFcQwrI/D46FO3zr+NJHJ+YM4jv69vxw/XIT3t4A65MKqaSy6iMPkshpl6vlnN25NXj3kT8a7xv0J3LeOB8HGRGb8/nF8EmJYn0LBtkRm7FyLYODQuKnYW/IVEtoBNnCHAXNYMQF9Zyk0vaF3tRsag8T58wUdcng87LAypN/kxE5dNUccPnZbZzdJzIk5gU4iMSChh7tL9LpBpR7KphMCBQSfcRpdIqE6GY0tYkqvb2cI6SJqqLa3vAojkgT0riVyoEetF7hssoKnf62pqYpJaY1WlxgCWMYHk88f3394eVY1NoaGi1zO2r5ZQcd6ejAaDMzFJuWMfPb+fKRhSIe30JQSS/i9i41tHOLpc5OZuUTK05Vb/tFfjh8noAOfsmIceoDmEr+R5RYxWaLTVx88mEVkT5iC4xmMqwaDOf94lx+j6j0R/2xsMhodPzSD5uyPfvfXRVyNqIPLfuMrO4oBKUDHS/4WdOQJpWR+uqwckCODhhZg2c58dCdFXP6Qc97wkagHZii4mOy5dyclg7FBqcVpMRgsaLY5nRKpUS+AmlQ/BEElZsUE/mP2skONHM2E1yZUM7QtSlp1HZPDq6kE6J09fr3Rq+3oF8ltY//4bD68V9f0MkKv0GHr5PND4gdbn99/fPny7PyF6bFhmVwu25ygv/eDH3nzKIgztMlMZJbP7L4zDdDdHDVkVFUKqzTsy5MznKbTKwsLfk/Kn16Or/70r3nQSYTfU1eNY3k2H9MtZ9KZ7ijGJG7ejOEOHvDGYrNKlUCHJjaJ/+ATAAUJ/2gsOPOL7828+vXPvwXMd5JW/FdKSkglkJ+m3LGBOvAms9NlRFCgpq2ppqmpuqoM0X6jci99S6kUVZYUV1Xurqmrr+O4DKMXg06LwokHnbi50+DQGweR0ntRtDmdBr0CYiOYghNzhZ2+kLzfxbd61b29TCG/nVVTU5cHXazUOtksERWa+ucXkciR9L2Cr5VbtT5byKUR33qG8A7QH4GbkclcfNmlTQl6PryHw6jaMuOxEGjY7ajThRxuu8phNahSr3y8RV4Dr61haMvKU4vKb1pOZ3/7o7+i5w0uC4l0ZUUVj8Hr1IhozNrGwcmbsduzC4kk7jFmgpFYOoU8oSuTiQD0hRjhdrBlmiWRHV3zr5KL3F/Jky3Q2CahfWPVMd+QJxRfUVkFQG+i0aqrwRRUA5fSHflGLgzsKQyejp2F3eTofRW+eMboqVmpxCS1CwSD/U4pbuOqLHazRDAhAOowCRbS0UHTCkW861Y536uQYzSborxKW3UN5uR8PRF2f79RSGnEAve/PR3NI2Vnp8YWEofkF2++uIzwPrl2afjOmNAmb3+ySUH/yJuoKplMeoLjfhujGzMUxNPd82ZJ0v5KIiXbi2izoU6PmvzgPNMpQep7xNOBUQmkHXoZzMaQiN+o4V4/O3lz9u7TRNIe8Cf8mUgwF09E+jKZWCY2G1mYjEXnYzNLgPzgar5rDisp2hilJaMSSNNI1wb7raic4eh7yshl3aZWGu48NjYC9AYapp2KSTgguhbFJXuR/u3FhdT8ieXCde1en3PyFFJ3hc45YXDgPq5pcEriYEsGBdAAFQgmcE8Pk49KcXuH8brPqpD4OkNsrdEMn4dSON70iJ9SGrUayitwDb8FvbLKRmGYV26lfHLtxZvP71++f2XLGup0mcglEp77x8c2o+gMPH0+isHmMB5hOb37/KXtT96oOe1alURixmSCjQfQ0XB5Z2FtPGpPhAXx1aXvoTuCJ70MIpwcZi9f7uvk9Xvaq07fvb1l/unTKNy6K5PGGJsfGXsCbe/IJHZRVNEIcvgjP5r5uw9nHvKbjggVcFwycAVP3wjvQLUILM2eHdARqKlCN6yhtraZQWum0fHXNl5VeRH5vyGfAOwwFG8bMxDEkMdr7RfvgpwR6Jxsgclilgx6oQKq75+QKJz9OJnKxeRju7mD4hx2WYxtNpdS2+/Uu1wheDoBPaIXa8XcQS7fteHpmIGu5vFtfAptNitfefPmm/uPrlxeeTMyzBLK5dTIuU9sRtDxpj9/FEyEkwA9waR1n3+y/ckLIWdEJVBITRaPg3g6B9H1Cc53BTOWVCK4unrkrwAdshJVvb3gsOUcuV5ilDsP09iXn92dnJtLJqLJnGc1HelKBEkWNznrzyyvLi2le360L/fKd/SruBiA/I1ovqNbh2+EgQxAuWH5XKGocmdNTTWjtZrW3SzDl0wkHGaxmLxqWltNXVkxUC9syRWm2GHE1fELVXubVjc5bnfCyx1OB2q0KUEHFKQE/dhKZYsxEdNibpFxcBufwbGJlRAY6odwu5XbUFN1nYAupjAqrxFRVMtb0JvKe20uKhSixHIx9+7t548e3788+UYtJJ7uatn++U0K+ov5RCCZjAfGE7ba7juXAPowb4Srmxfgz22Z7yOe3kB75+nTSbsg6k+uBuPf+8Px/KnzGkhQsTp7xYKQzWE6gyya5r5888b4/LzHoxoA7bbsj6XJvmNi3rOEe0AHj+QIGXMcylME8zzoQJiM28BzCzRrKcpzqPZX1JU37G+oakUVzWIMXxhpGXGLNLJaEcVsBOzloOcJZUMGLvLOjqo9P1xBzrfi4GrIcvGux4G3vF+ASm2ixdthhgaskgstwJYOI6OhBhHm8HWIAStxeNE1YXWK5a01+AR3Rrq0ykE1XdjuUgL0gqNX1vHlnZSSqWSLQ66bF988vv/40eQctAPdIsoqu7Z5QQ+qAjhp1JPgFxK5FyweV6qAWvJySgJHZ/A41U3vbF0ReDLhcBAb4j/6w7cgAl9U39YsozP5Xj3TanJYNdhkrK6qbXl66+SkJ9GX8SSwaOqfBOQeT3omuzTwo32pX4OM2V2KU9y7gDkZpiwutGZhBR8H+4KxxfKauiYsGdMYtNrh/dMsmmxELVS3qEVgTkQhOZPBq67Ic0Ok0bORxu/+9ywzOQlaa46dShgG0VUVOM0dXkGHkg3Mje72Dng58sEicAtC3Ms1m7lKgcJhE7MZAL2tMzIwKJZr2o34SfmS7fff/e7eckxROOWdbKNYq3XdvYjwfvnxlpWRMfewW+ySnf/8Jzcl6B9+vhYOBxK55Hge9Nd400/Q2FKTArLoHl0numy9HF7rmbWzC1FMUJhQeX8PhDmcs7yhlsmkzPKQRcfWSgK4jo3Wao3o9MqxB/5wLtaVyET8/lhQlfNncl1Hjsy8WkT+VorLzDj5hYF2gEYI9v8y8o8le4ob6opqaZXQuWLsF46s3Lh6+kSrTNjuFoqNYEmMoE/pjLaqMsLQEbIeqMM2xtgR4REkDtdxtKqLhyw6Q79C2qGHo5/Rc41cHKARMvO7jBVYnnC36PsFYrNB+srmpLTNTTWgc2MDIapdqYZonHh4A3SE907Kp50Iia3aTtvVU/nwvmXB7ZYNIbzTr21S0D+Ckg1wmlSRYGctQH9y7vkJxkjHlAWHTtYtnYuLDBo8/eXC07loMuDJ5JbSP/pjvk4v5zCZXKGN61C80qo8FFSfi6qgtd00fHb25N10IhfriSRAyKUznuDBIz8BAYcarby8bGdxyZd3ETKG/CKJ+05YHnDiuzvAxDTUImlntNbShWcffOfkrWdrl5poWiOUQI1irJVSQllzY0MNWT/Oq47mn/b8oS5898oi0DXgc67zrP5jMTMUYDvOeL1eXMbnsiHl3lS8t7wCWT9oPKFZIKX0EqeLmjA6UvS2arzpSz1KbbvIjQOL/07kvlZa3dapBCWvdcn5ttsP3ty///j+yop6rEUm5odYmxX0Dz/HzHs0qfOMZxoJ9/7kHYDOHgRVnYrrSCJH8rjW00/nns4nE/5gOpw7AtDrQX5CSJTOnVBIjM7cq5CgDcoOFWDQqmp4btXdY5G5TBQrhrlYNt73029mlb6jh8u+Rtaf8hpERYcxEYEzh/D4AuiI1GRJph5rot2cGgZ0+/Y3D81+59u3Vla2PHp0T9MmFrDbkXxTGF2ERi8+h3UleNg3UCcxvoTcQYZ4WAnmJstwDFneMXssqvCavRCSULa0d5wR0arA8heV7t2NI5AV/Tq22GAQdyonJqQSBbO6Gm96JqIVu9hKrtjlOrcBOk688VwUgbzT5eLffPB87T4SuS0tl2RCeUgue71ZQX8TDmKaMJwbiPMbT9x5fe7c2okG8aAOl0jX1xU+Xi+o91aUbFDgXYhmYrnV1YN/PAzQi6r4TEpvVRisKWno1bIU8+SFchkHeGlDsWNXE8lozp+NL33zSGSiszd/8quisM6M2A6/JtV5noLD195dO0p3Hib7oxwM2TNaT5zoHoau4KmFhYVkEmWgScnsZCsgIqSHLIRVa+M38q5zqiowo4XAgfwPH6bC407+DYjhM9kgNN29qevAxUa9umXwHK2msvASIJ3Aeb1+LXh4OdVvdeIh09KB+aIvOEBp9WotbCIPOqI7UAfolFYEWWCAjjcdtrJlZGyYLpcNszYt6C/iUkMyGVjtW+2k/fDO9JMnL07w2Gad1K6SWkygYckMReuZF08Xnib8/mRuOXfk1+iyFZVXMLjUhNRqTL3SSpcNis76qgp4GRFfrqyuHn588+JkMBpf7vvpqMHVe7Qee81FxYV9Zli+d76LTEcAdTJjhwSuFIXUdVp1A6PmRDPtBHQFHzx7upB4mgzYVYGAxaDtNHZ0GLxO/YTRJaZ80K/hQJMe2f6uXV/OH90HpAXYC4aXppn79FbC3N9CCc64G4iA5d63x/nrv6qB9HOn1aqUoA/DtjB7Yb7guN7FBuSU2Tq8rZC9YzSaybdpbHIgH+q8+2BujbzpW6aHWaJmNWv40v0vbE7Q3zhUCRByqwMmG28/yd5X9nPaTQKpzoFXHZ7exmmAp7+IJbBd4MHh5exBkDOVKNM1RkU/JTFpJ1LLDmnKV1VUhAQashQVu9EDYejnLt5NY810WevLX2AvQhqADVeAvmHoym60yPE/7N5TggvaJHuoxlpx98jst29cnZuDzLdKKgmrAib/3Hw/Ughuv1cBZw+JxEpZUxOjpnrnrpJdxWUo2gtiQoAdtgF6fXm16N7sM7NewK2tgUJK6d69hSPOOCNSb3bKUaazJWbJhAEN197ett7FeB/c2eviSij5iYdvPb2612azUSFK63LZrt5aWHtO3vQxlkykpo+NXdi2SUG/HI+akkmdpSfcCSWKS9PvrOxvaBm02J2DOhPEpXiNZHLm5crKbCIang+Yfrt88NfH64vKS9rUeg1X1x+SpFICi87sq6uoJCIF9USQc29ldZNcevXdb8cmCBvzVaQAZHu94n9AB+D4Igkdfl+JONrW29rEGabRaGeO3bi9EovFAiqpPZDATIw/Fp1LDFIMPrtDKdHjMKae1itjMWWtuNKME447CrLDiPIbsJODj3UQEiqjcaOzZ1i0vcVlu4tKdu/a2Kgurr9OyZ0QDFSwdU4Bllw1vSS8Lx8Qi61ihZ7ZaYOnF0DfXe7r5FNqLRVyyeHpC+BhL09unT4/ppEJZReuPdyUoEMl1BOdw5seH7XzG7p/eGH7y5UTtDPeKbPJBBb7523gZmichrMvtiSCnkDYkEqnf/Trb9VXlFRw1CKp09XvMKRMOoXUIK8rIskUEVmHp5fvBRVODXpCvUfJ1U7CmeaXmksBdt7w97ebUMVYd8T6UFMrva2J5W490bx28tbkwtwcVhgGk/FcSgd5mfBqIDMn0NvaNFNcM552Hh0SE+rm1gZ033bsKCuM1+GnECNTdLvxVUHQr2G006qLy9GyR5a/gTk8/ahYYbX1v8KlZAc5yKdpa7i+2Lm8jy1mS8QauVws27aNhHewM/XXbVpNe0hOga09dGvhDWZnVrZcGxOCJnQPb1LQP/jpR8GA1BNOLY/GOxu7IR34zkIzTTgosZgdFqejkwzOgAFHyZYMJKWDwfh69sgfv/XVkrLKapFZpDc4JbhQnUpZLLR6ckkVvo7Z0t1lKJzQuOrllR+GkwPZvDzJV0o31lCJAXQgDwPmWB9sagPR3jzS3VA7hMmbLQsLmXmHAARCWIchDDRv4v6gwhOz6xuZXBRvtS1cCuJRQtp+WnUNYEdCWFQKPr4URlAvgs/nj6qXQpuUTGOU5j91uP9fCO97eim51aA04C6XgHA4VG9D7+Ji/BDuNWlwD0ajERZA/9p3y+oWQyEQM+BhXZ2jp7asEe792fR5GcatWMPXNmd4J4cd7AkoLoa/n+I37iegv9hPc7d02E39kpR4kbfI4LVyWh+uJeftBkvUDnLmp6+OI2krb1K3ePuxMYgbZwY86tTOMgRwojlUll8HheA2HL60FKfIkdvhSi22Fkhwz6Oe76gVxAugYVJZ09RLa6xhjO2vZggXTn5nfHIhE7YITPH1dGoZRwTiq7nVpZQjnVHpBjsoGl3Wcs/bot4vE9aOQSFwf3VFVQkAL0IZQD5d+cEa0D/AfnclCoI9ZZVlu7+Bvn1Z6Y6396Lqj4bYRji1AOw85isMVG/bIs8XizhFtRpRO5SwRu5vA+ZI5KrrF+VovCG74y/6rl5cePNo7QpAZw1r3PRh1vlNCvqnH3tUg/NQZjpg99F++MPXxNMbuVNnFGyT4JUE1Dunt7Wt9eHT+UGDKpqcgwTEwdWffxX8RoOQO6XrkBpMhrjdELbUQizkywVJl28gulZWIrRi7QxBdScRE0TrfNeu0pINTyND0wVKrhiDMdXQL2jiCIdbW/efhUbJ5HgsYZGkknEsH8fg5uu51Wx8ItyzPGixWAa97ZzaEb17ZFjIFbaw3COsBkZtTWVZfvYCrzUZscifxS0r300mm0misaek7Cvf+NpXdpWicb+xeHnUxlZwlYoJnFk2oDEj4nDaeK5TSbmYLqRsnS4xAT2P+u66Nht4OrEcBwM7R2/B0+8/Xrg6BpkhuujEiWv3v7AJFYHh6Y9MdgxMqZb3OToboSh27p3nzbSRy2c6VIqJCQVRhiXjUpfX7l2OejJzQZ1que+bnUcrKstxK8lrwd5QWCdJYeacv2MHWuEkiMLF8kdPSUaHP3gCOIzwMHnl9zwBhw5Lnj9H/7SkuoHT2MDUcLq7z929cePmltloQGpJ4Zp7PAu5qVQq7Y8rlmeWpAq7RScVDE5NuVtrReoOqHpCTKaRJ2QxGJwmDG7hycC3LwbqwLxw+Dx/jrGktHDJmbADxAjo18VGFzlXgp4rArwTu6w8X/xdBeVqF9LlGrGxZds/yIgcSeQWwc1TnZgFF2tHL86+IYzc1ZELQpGMxWJd2va5zQn6ZbsdLuwJH3Qw4emQkVtpRni3mLwdppQToJN+euvDs0+fBqJJ1WAg4AkeCbbVV1ZwjIO6DkPS5FSldFmTpAWY78oH7bySBEnogPreDdCB+VvQCcte4M13lmB2ugotcxqQa6APPz1548HKlkTY40ilcp71IMQCPcvZnrgutZTOKVLLkJJR6OafXpnyNtcy1f3YSWxhiNQMhFkGDjLhWxbB2wu+/n+gl8JA+f4bdGhJifVc/QQbuAskEisLtOPguwfkWqOML9KylUoZQM+H95r6NjFe+U4I2IR8o3dn3zx69Hjh2YUTQhFLKBsb2bYZBd8J6OvzqrlkPLxPwmdAc2b7O1tqG9V2i9dgx1YgMKe1QUju8f1AGHKCpqjKokr1fUfKK/9qrdI7ZTGZ8ZEJ2x1xixrZOyHYgDtAL307zpSHu4A5AjDw3njO0TCBjAyEaZowF9M4gjrt7K3vPHi2sICrmpb1VNgTXor05JbD6bDUEYzkTM6UQAq+VBU1DV5RXbli1DD5enJxky5kuYcZvXRab3Vd2Z4i8s1hXy5M0RUaMaBei2GFbKLwoTtcJ9dSVrbSOUHmqPo76L101clj/S45yy2k0J0R73/4D9Jv+Rp0Qn18Ocaq9GIbErm7428ePb685ea1YUgu0LHG+NnN6emfvu9JeuaSHs8+JxPqUtPb31mh1Q6eQX/KYVCtd2J/kShGvlyIBVI6VWB+Hl0Xz4HvzDPqOOIObA6pDCYpvoFE4GU0oXTKN8gRSgsCkmBENkAH5IWV88IlFwJ6cT0SfFobvbHGrWlqbZm9cRKzdNGkQ2KxeDxxrEEFoRQXhM/PRjGbi4dEIkglTAaTSnXFEoga1HQGS8Rt4cqGWDSRiEGHCmxFTelGHfifKToYKeLfYg7QCRt0mMOncGGLi/bqBC6zGUX62Mm7+hDO7g2rvXoqtCgC6GSEAmeZe23MXsqrCYltneM3x1/gTd+C7F3IalarT5z/7Ob09E+vhZOeZMC0/E1zJ5Ef2f5ygdYonBIMWhRSxwSUv9FYbWq4v4b1MCx/R1X2eVUwePfdWdd1sdOhMwnmAyqdYzkusAzX1OxFcQQPBqqF26rwNRLeSalWuJG/EwQcyZ9JqVwHN2/gNdMa9RzOMM7x3ZyLLdiT4PZwnAfn1yA7nF3VST2RqB2tcY/dbLBA5NChUqmkJsxpSAxeDb+R6+5vx9ADnd/OpWi9nKq6MqBeGKmFqxeM3BUpJXR/AfM87VveWxvSUvB1tt45oWSzF65+J8mlRCIhxYXQkI0Hlf9/btTplRgC5+rlSi3f1nn19vibtUePV55dGpaxhGqW7PVmBf15ct6TjJuWj0x0NkMm9MnL563Mjikp9kHCDvHPAToHoD+6P28HgWOyR1WqYNRhyZw6FggpJYbAvF0FHSfpsopN0VuxjAJYibPlkQfqb0EviJPkQS8mSRwZtmpqQ3OWNiKqbrxy98YxjNFC9lMqdXgSqmAka8plPeuGXMSP5SSHTicZ1OFH61RoDdlN4IgU9oTOIuYzZSIcXhQK9WIWKjnsVCPGF21I2QF1UkyQ5t2u0reYF/7NSqqqZHQbV2wkunFWp/TisVsdIF80lJp9ZkRk6xQ73V+Ep+ddveK6XG+VG222kE0+fmz2+dqjyy/uXmimt2uYwrFNC/pazoTtP5MHJ1yY8PQnL9da6UavbtCpeiUxkE1l1OlN9+fnA2ETdsVM81ETdB/iUf+7t1VmaYddZbAEEH+lUxpaa201RpHJH3ohyBLiBdl8gWgH5gB9wwcxbtHL4fAYHJqbx3PPXvwO6Jh5zzyEmC3xONbqTPGgZz21HsuYsJGkkBKlKHtSqrJAZCYej0onUh6Tw+SxSOQ8mozV3n6m3cbXtgs1TCYDPVfgnB+vJcEGgJPWzn90DfNpXkkFr5FFuSglLqx2mOduHHvqdiOJk1s7vGo6Ta7vlzO/+M9CIldZ5qOQzjND0DrtvHpq8sXztcdvbl5jqWV0ELGbN7wnsb/vSIUBOuMEPP3eC15tCygL/GGnrPD0BtJxuR8NJAM5tLsQbC2OlMqjyq32nDqgkjgHVdDl9JgG8TAygGJ1VUXRW6KVAFzAvOitVgkCO2HgatDG4fGQd4vo+rlTx26vbHn6WDXocCyHV4OBDNbgwio7wnvKkcKWuQVL51irdajWl1OmsEcqwQfDkkrZ7dhG7q9taG5vF2mVXC1Wh8UiVi2vurysDKAXGF582nZh+apg5L9EJY+8vqq6UUYYF6NxauHYbVULzjmIQ9ops5EFF/ZqmZ3qdwrhHasvDXKNje5C16Wzc/LU7MKjx49f3L50nqUZ1gib77yzOUH/8H2TymKxh8PvslGydV97cnah1+eFeoM05TAqMERBQ5ne+vj503lTKgGBD4s0ng4D8tV4Mpo59W6y4/IVqdQeNzixt19bRatl0JuKSiAmh3BaUrjfQuryDdCLAHtFTV1DdWsro6FZzWFST4995+pcLGoxmSwGCzYk14N+z/pyzmT3+3UkrOMRx2JaOIBD92ELcg+DAlWjXWJx2FNOu24Kp/KaW/ePtXv7MV6hBGPC4ckY1U0VpIwg6/MkqOMTsGcjq99ZsXMHWjRV5b2dTEoD4aHZkydVSq3LCPFXiUKDc3EaNpffKLK2vIPsnXh61e4mPnqrcj7WmlyxU7Nzj9YeP7p17tqwTDNMbz7/zmY81wTQH9tNdlViefldNpS/Ed4fPm2zcQcF2BJ4tcommgRtAH1tTWVKpB0pnc7uCeM+mmc1HDAF5pOxb9+dGrwsdVhSCqX2eiPFam6sptHq6vcA8FJAjrcUhknngs4gOXBeV4PFhdaaVmEtx+gYP3k3kch4sFaeciYh+aiKrUpMprgjF1mWpNYFDgPKRkM4bkB096BKMEkUpjAeFGQRCgXGMY3mqTNedy2NKdJ4rVa3urFRKGyk8XbWNe3aUVZ42wH9xnMDK4eWJdnLaWtjiJgi7eCpb/utuIxvhcrEoNgmR6zQ60VMNbdfeK7g6TgvWMMMhZidrpCSWgTob+Dp9+HpYyI6q5m2WUHfesVkgpDcevxdPW8/LjtcAuidXr0U2g25VxO+wn46Erm1zHwK4KqiOO2SjucgUxM3zYcDyYsPLrcYLAJJv6tTrObLODQNvYpXQ4ZaINFXyJzg3nlD+lZeXt3La+K1lqub64RTcw9OgmZHYa5zWBzRQNqezhkMOU9YFcmhd4cdRAxnKkw5iwA6/iYEA4EkFY7aU3apRaFQmZxoiRkU5sGzp6ExwW/vN4qZbjbu3TfgyO7emioymgE1g3w2sVEpIv6UFJdWNVVVc4iI6fyDqwq21mqkXFbphEauwX6qt72Wr+Ua1bVPthJGDuRMVQPT16mRi6FH58ucis09fnxl7e4754fptXRZ8w+/uClB/9SH74c9AUzJrB+xNpK7Pf+i7sp+20rrKEtZisQDvCAhkBA7Ek+QPbHd1Ot1cmP7+l6v8b7Fy8X7UtvUGByz1KSExNAAaVS3TZMgkxCXlAkphdqEEpIqCoQKpU0oI1qBgBfEM5zPTtnEP5BvugwzYiaT4+/3/ZbzO+fh+RdhtuTzl6YsdDJZhqRYeEI/cfjy+WYi4Ju7fTW0vHTV9dtsBGq881NZMOZ3Fnd4v6/OYB1QqVToPEItiyxgaBAt7z7yjhLQOyxGzFbEKrE6LBVLrWJDY3NnEV32rC9uifvi8fklbFP4kCJmXbe+uGw2I9RASsDim8tyFtfUvCXiCpiXXVD/RNQPFEKuZDBorGEpueKLZDmjtqxhPR6+4JfI5W4N9EAVsr6egR7ynOCWdzDHGcBIGOxN/aNiWFPZXtzADoTXXjVWzFWkdVWagiy9xO1MG+SmewAd45YrAoFaXo6xRif2XMo/Wfzi1uZh68X+225KTMBc++tPfuSMgo7a2xX6w2/uOFkhPDcfnj8MV42FQJbmfmP5MwnvxYkJ1YuNJr73c1NZksUvzSHU3v6hK+RC0h+aur27uGEr1BmPQufOVMvychkUNmFRNEI2F9piY92kMG9baOuLCnVRbNXoCpaVxd3rW1NZV8jXBObYnP1hvOLz/XDqtz/8yTIXqHCJCHZs4tB+jISuLsfnl5OWEB5+S8AVrwWet4JBW9RnCVjwzsPy3ueXj4i8hVwqTxVSGjmrk6jgMSXoJouQpIYkVOn2dBXLzSKwc1Ra443v3glEg8aY1+uII8SnglTQycTyVidDKSV2HUBvl+kikUyOZhz4z3m2unH3Oxt/JeH9R7+G3qhSIvn5284m6OeaSwAu8pvfLATRKXn88x+dPyzmg/xSreJzBGvtgQtGqy8OGlNLc7eyS5ubt5eWl10/vL2MJx0lui/rWp5CBnxyLZ1m3DrcCvi1yFm5ApKDApLJkQS+o9I3KENUVRfD2rRXLWU20IGDKNAygdyH0uD2Elo9c1ezcE52cKGKOcFxcUR0c2VqLhu6vZx0xENo9+IdcJSgCwiVP7MPwSA7xTlrkQpj1aiGJGmxhy9Jy3ajU2m6ZhVOiEfAlyWYd7/yZesVt9ee9Zr4nV9c99JByl7lfSXKC0F3T9RP5fNe/DcYJHb3zO/e0xYfgSaNUFmO0nk5a6TyV+9eh7nDycnun34O1VuJ3PDwTIL+pg++tbmEdPhqglswam8SUYKTI7WGc9UslWjyDwA9HC6q9CooF8CrPuSCIVLIEsLaShx5HNQ+IkubkZ+6Np8/WNwuKO3ohHuqdvKHQSFXqNWiPhxwVQjkoEuGMcBUi+RBRUFdLHrWNnb3byfQ5pty/TQemrck0PmB4+tvoNGf4B3IH/BZwOAWtmu3fMlk5NZcyOILBCx8ZN7spOGBbKkEQnM+uhaKOL0aWS9ZUefNbNkJZXaFblZnMImgGy8ahHELfrT5PAKBXgaKdp9qev8Xu5VMwe2R01Mcyr1U1ePNeVm5hzamKXTVU56bD9ugX5LBiFkStd9PgUYRK89/9zsbx8cA/eGvZzwSDdzZzmR4f9MH33OCzsxUxXLrm8by5ceXf/7wfFNP+R0Wf+0PiZrxj1qgjuz95dGUayp+Cw+vJXK7LdOH5M8HAhtgD4WmQksrCwstu9qZ9nrcVitFxRD8NKQ2G+kmPAlgLhKrUJqLwza3pBB7BE39ooFbefCNONq62dDSZg5ij0tL89mEmYsnkqQLF3ctQ+4TVVokYE7M3wollhOBCB+5bTHSsLe2+Dh05sx8JMsb5cWhwfG+r4/GzRovzQSC0BZBV1asVcP1UT0iGyF7zcPAHKEaRF0RyNULU4zTT7GehM/oTFLYUCwFy3aMUJ0Zj1xJQYnC2r7pP4Odh+iyJ1+mADmbZ5fu3oB3z/H53d+9ppNjwOe5/LuPnEELxjd98NyJaznuWHLFiZsHcVo9PAm7Gc5v4f8c8KXuA3Q1CvUnz+dct366lEVi9Tzr80Vcc5sW39LGJoc+XTaERt3c7fUf7/u1ciZjSNsou9utE6olEu3QiJhQowUjIr0WXdJHHpvd7aCCj8B2hggZ1dren2+CwZFwZTGznQstVzigifGKZTmLsmx5aj6UgCNLaMpVATvXEjDPuxisEpYS2eVkNlvBda8zBjUs0ocH0Mx3ypP+ZBLLMBzNCoXyolY9o9LI1SODXViCEMlEWDaHq8za/t1z4MLBraFqyRkcRpaqos+aN1CMH8+TwpBRSmKGm997DwwYsQKNN0mMSTqK9Fg1P3935a9HL86foE43Ka1unfTnnzyToL/7rU1c3ilffO6bQeEk6cgdN/UeDuvcCa4WDbbrdL1qYv0IPOmrIZBn5lw+n8u1FPJNzWcrEUiMwgrtFlgUGIx9d/E5pbbaMobMbEGpNkhYtVgtlBVFQ2KxnlzzsIYxKGk6WnCGPzMKG78RvYbZuLPd5HybIVKqR9CLiQR4CLVH0GL3hbLzrgQXcMy5QhYU7yBQbLpqUboUrcfjy5YfciX/WnPNPQHPT9CzoFszmq7QDs7r4SoetUEq17K6jBCSz9h31Iq6BdCUQLARf+/cLx7k3GC3pqrRONJ1ux0NeEPMwNCo9iQserqsFU0a68OdX/3sys8EeBJEkiCLRCVVzZfnFm9AVOzZ+d17N5XK2Vmt++dn8qa/+d3nDmHWYslGQneM2suPsdZ02JAp6biDL9X+kGT/qA2Htcjet14uzaNOn7rt4nyh5ZALUX0KI6+f3gotA64/oIBLgLd648d34gapbtXGmDxGiSSszcsVcolKBfAVyNrdNgOmmQFzlS9+BgR5ECwGVR7L9u4KggVp5nKJOMebfT6LD01W3y2y4pCMW5YiuPqheMAccXGQFQiWUKaHfhOvJf0Ri80kHuy7MHwRlHZwr2k+7jcG4o68PaWNaWGWiXVEViPSmMRo+eqRs8uEJ4u/WPLSxmjQXg0kopQz5gnSXjbF+G02Coa8HgQpicEQ89y8954r5KZj+U6thO4CxChQuLm++x2QKM6ff3rvpiFtFXp0k+88o6A/g+Ye9pJ/eydFDBj/8vDwQKWj+UCglIhG/1wGYVAFOuzRuaW42XU1Wwlg38SVwDVH72Tph3+Ih+DCa1kO/eEPP+XwcQh94+62TSiZnMzYDAottBoMVEyo1KpMBmExnFaixcGHjMasszgI0AeJt7VMm57f25tyYZBbiQdyZrPZEongmlvmby2bExU8HVzCgqtfw+Q+WaoFo4EsKjmOM/sdLtvMZRE4j1cuXRH0D4yPhjdDRmzmBLUwnrFTPEczQdDjtZRUKiHcfb1KlXtwd32WouhSKhYNme14qY10MGUPOv2MW2mXKGk/K7FiQ9JeVf7pH3jSrwzIwO2RVvNVT9kOxdS5uytbL47h5/G2n6elBuus9PIZBf3lSeW3y5hf/QZmTTcfvwbQ18Qsdn64yp+Tt6rQ+C+GVSpZa7c5tYHPBpFTTyDnmqo4QhtzCaSAtyJm2GXNXXX4fmPBO3H9wcLWzITbLdQq0oRFisioyesy2rAhbQd5ORGwW7hYSTsyCqoU9gkF41hS5Vfu3AhNTeUivjiaASgI44HQfNyCbbpNKGJEIN4eqG3G/TVnMAohUGLUUkETNjdj1YsugbCBqw6WxsCYJhKMZJMxTUrOepO8GZ5sTm04iIrCKmExC1LpVn6823S7qRqTonwWcCiMqSCTjlFM1ElJwHu2MUQVzeOxulk2d/53ly5hkQ37eUUW1Bm2yuar+dDi+hOUbOd3//SayWpgpJrHZxT0F89Cv/nNVMB39SsxoRW894eHb9Pb3SVLKWrxOaP3i/cJc0b82pOd26FlZFabkYjr1lTEElmaR80899MsNNYxaI2bf7OMZqzr+sbUF+/sNYV606yfLJim4HJrd9ofGWhQFkrmeDSVSFUty9oR4rUOsIYFssFBbSoOoc9ChA8kNkNQbq7Ep5C9YaIKNQzEoICZC2STNd7rdMSzEfyNiINvNnSTEz1X+tvE137QbQVjA8VoJGAv25lYNVlZ5v3Rmldr4OWetNHDCqVS0/HCL57YdOkgH4z5p5JV9NIh7uwxBP3GlAGdFsavw123enQGg9JZcP6cVGwi0r4bUXjZMsbpCPCuxfUN0GHP7/3pssk9A+Hjyb+cTdAPTyKkwfaHuQdVhfIyfHtOVvWGnNmYiESTv6E6tmyqn+kfbmyvZxGF0Qi9hSLe9dOphAW9uSyH8vqny+bAVUvIzF29usxbQq6duzvXTLY09DqM0Nh0esv4BruNBSzDxEoBtpa1OLWi4eGBC1cEVy5d6BZBsV/rzO7ubmCJifOhGieJm7mCX5MOsiWPKZsFylBePx71RDLHcblWcxYbTQPw9YRJMgQnQcr6NLbSXX6W9VbZaCAe8JaYpEbLR6u2YNqglGrK6Qc/3oH1ymzBmYpFpmh51Fl10k7WQ0chDSxXuFfTSmy2uHVWypCxee3av1+6dOVnlyC0MBQWlqu46d5Y/v7y4o2tvx4+e4bmjFUuN8AX5GyC/v7jZggTl8ryrW9UNeBQvPa7k7epdQwd4aP4Tjvv403XQterV2ytbDyYjwP1OY6/NTUXCcSXwEtPuuZcWbNjc4lL8K4f3nIkXRY01tYXdm16SSpqxIKvvxqDz5mfKSV9tD0QjHHZPzsTcjGWUBCUr1y4JBgeQox/JPVv7e5fNccjAZ+LFOrxrAWCf9lAsuJIIr2DHlBlM+LIBRoVcyCem5mQ4Rm/1JGhu4gA3zf+6a5iKl+NpihHJRKsOaLRR0GLERpCmLHLJSy3cMeV0bmnc56Ud85chZRYiq8FY1QUxi72vLJQMGhwy41YbbG63Vbto9GLFzBtuSIg4hrCWD5GCLH5WHxhG8tsh4e7f3qsmJRYIbN0NsP7hw9baHq1mvGffqkqnUSdTm76jG2zVHI4feZUW+5dfVk/Pq7Xf+/w9RUoauVct8FqQamWDfGWuWxgyhy5auZAWrzt481zgcQfQr91TW3fXTHkU/JorRTzRqNRbwkFOFXCa77s+HMkG1KI+wbQCCfs+PFTn9uisr6yuO3iXEvNAAg06Kv7MVWhQeXAS4Ol6KmQw1ypNCtrrQNKKLh0pU1yBtmWnJ4LRHluxOMvUc6AhaNrNd5+3+xI8TSGphKlwX/jx9tpt47xB40pvytoZ5ypKM9QMa8NA3RWEsxlFAqot6fdRA9cJxX0YssWcQjxfQDuu2WwZuyxcp5iEws7Gy+Qvu82TKjZ5Pm85IyCftyMROabzdBPv1E1vfYY8iPN1YnZCsMHSlh2QMaKN31CKunpGhDpTatv3TvGgtMSSqYsMqoaKrZ4KDnvMmPt7Cdxh+NW1pGY+u2cD2SXjb2FTTsG1RDTpY01Hw+N/YoxxSXMIMMkQhpRN0jKAI00xIF6z8AIROlmWzu710MY2WGukshxU2BycAmXOeoMljBi5wG/j6+0ZhUTogud0142J4x2TFG7xtQZaIlkHRD1tTjLHl/UyTmDYL65mfm7dzco6ImlYb4TcbBGaIv5g7i7ziDBnMoxcqnSg8UJkJrTGZMYGxpEWF4gEECWcHhUXMYUFpBHY/nlBYT34/OHew2lVXlTgQTv4dkE/cWxKzL17Fnk1udZ4ePHj9GcWRUbbFytra1p/+N9woZV+PvGuy6NX1TBJ3d7qRUARzK7zFU2Q9BattzywQ/tJ7cCgdAtDnS5+ZDvlq/i2oz/cOEBj+2QpKOEFzqJxDuVTCzzxC4tm1TAzKEfFDbc1jboIqy7jY+LhRCn2l/C9DQAgowFcgGo03iMtxMhjndwFUturbUK3am+XrCqyTUH3sAcvxFyztigkkEi4vXTgVjeYaZKvNOIBN2Y27+7x4EOFUQu6fB5UzTK8ygVk8Min6SZ/pxBK7fimmes1rRbOSEAlbOtPK4C6MPDstGv5ynE96CRjZWXv7ty/Rg1237jmlJhleRT7I/efyZB/yta3/FnzfjVr9mlryG8PzyeVmXoAgf13GSgCt+esFY62Rod6INp3bjosu3F/kpzE+ORgGsqi644euKBxG+uZs2RbMACbtu8JbtcC23EkY7N37h73Zun/MmK30sHSikuYK4t+xx/QG4mHYMIRXvdiAy/oF7RNjKHv5d8beXpdouI9MNbLwB2HE2VHJuJWiXniORK8bpOqB/qG+4lcZ387Ds9gJzsnFdqVbpmKcXoUJAy+5102mgs3L67sIlwE4xSKXqTNzJMyuj3GrCJ6uQNbMxrdgrlEgljS0vk6WndZRlUMuAITfbmLwN0AfZwi3lWjrQEaqHlwALEyw/Pn+y3biolN5UYJ/7lbIL+wheJuw5akat40x+3QbepMrlcMsAnHTX03sFNF5rmxeA59WATVSC4ee/49SeNRrN54oNyATaQyKwrYV5Gj24Okzg4KixfxWXNZuMuwL7wHRoG6jS6KuYKz4MfY4GbViAgGe0C6N19hJVO1lDAlRwE7kMYX5tyGzvrrVY9kLOsFdBmr1jW1vg6FNzXKnWdQjw01DdwpX8Aozuczt4KTg84MmNqMiKtJe3eWhR7GHSJhjrsBmiP0SCkgoxeh4V4qxHU7R57FXwZlnXyUVYj8aSZjNI6a8NjPj5w4SK0Z7sIVdtKwrsAkhtqu5GCzBBIFAHc9KOj44P9Z9abptcMMTl7NrP3Dx+3LNxSoxX5yWcB+mu/fvzwyCa28pwD+ugRulpEeCegsz2jvQN9431w3hiWTj/fe+thc7UBE15fYhn0VLTF0Z6Z9/kQ7l0/yaLFMuULueJgU/3wG3dvlNgqHXHAQ8XHRQIc5HoDCXdxtI/4MreN9gE7RKGA+fBgDxS/xJrpjae3Iw3OBofURpxnOL7hK+TidUojHujDM9AO6ITg3NXfBp1oyoKc9XV1ykuVUvctJbrmcBQKGMatfHcv4gw6IfNbjUZKQWfQWPB7YmmD3e+IsXYj50eD3p72e0zKaZtEJUJu2XsBC9XtwNHlJuG9FwbqVa8mb6zCt6rsW7ix/vL42fmdE5N1ZlJS1ch/fjZv+uHJMrfU8vl+8jk7iDNYYDzMTDB402lMPhzVP4YxZJMqp+yjY10DYA8j3kH16+bbzj0996xVr+OyLwF3B5fFYw7jOzN0okGLJwz5SGgqbpmyxOf3Fm9TVNDn4Il1UrxitiybLbQU6hSEpNzRCcWNJ80a0Fq6oGExIjO4nj44stmM8eYaXzrI1VfpRsNv0KNZLxjvIZvQuOUAHXz2zsI7WYiEfLzca7zvTHprfDJXCnqZqYW716NB5HIlOKj6glFv1VkyxpxUPs0b89Uqb3bn1WzGzyiVtmm3UKwf6B8gy+1kj35srK/7IUCHlvxoUQPmbJW03vOBhe31vx6dPNs5mbFalRLQ7B+fRdDf8uETtLKXnh34fvClmPTXr4ENezQ74a2XiLKq489Uu2STWp/LR78+1gOhoCu9EAUSjOtfayCRb7Rat+eTwNKVXZrzceC0uTayPpCWLa44Ia1m59G5ub15fWE3lKqaLQkMyXnY6dQsvM8YFg2Sa4rTlv8jUVsw2NMtQGcWDXlp4cmd1yubnK2+lms0puutVbdJNjDYXn9HBH615Q6ma2dxpbt7tGtM6mXzvNfI+5OI70x9/+62w+j0VEtRCkMecGOgOII4DxXvAgzRnY4gq8lTkB9l3Yx7Ui3A9SZ7d20Tgf6xsYHeafKmD0B3tGy3g/QOzMvcN3fIm94B/TVJXqN5fBbD+1vee9zA0KrVWP7JZ2OKX/8abNi/ulW6NbBba4Gag4VCQ1gltG7kR0Fjhhh7J/MaH7+g+tHhzvbxcaDiModAjww50Cl3LV1dNqO/FwfbZTPgQ5d+yjUXiUxtrt/ZTkLYx4JbzsE6DTq9JbZIvBrGenuJEzOE4JCKw5eFFHAI8+OD+pnW9sJWLreW862utuo2q2qQCLzjLW8vIhPMT5eeATkkKAZGhx6pilXa7kzSNdrI+JeeLi5FUZYx0aDTHIlSGKDy0INDbV4wyu1MKchickYFGcqaZpSqQdQDBO/+ziHEvqF7IhGmbMMjn1Gz9mo5Zs+TRO4bN45gt7pzqDRYTZNyqfBMJnJvee/540gl/qyCN52V3kTJ9vBlZiJDk343bUnG2jf9FHScCx3PHMCORH76r3tPXK0KkZyqcDk87rddDu7WUgixPYspTBb5Paa2KN42s/N7d65TTDLpiyDnS3JxUFk1WGYbkn16DEqt0CcAkNCrwU0Gq4k87gKZcHbq9d1N/1rmWWt1Rqgfx9/7N+htOTrADsYjfnb3E8uoETWU3kjrzxmNJrafPnBQMWMQ+2qlgMOeCvpRsBmrhirNGDQUT1fzyC+rfqfdPe0RFgcGevrJliVZqG4Ll0KfeiQnkwlE+FI+g3efzSNpq7K1Oze2t2Ch/voxgvukSVE+o6C/p9lYToTqB5arn2NJ9o6bfk3t5h28o8DV4KQdxqMutG/kPzP29bHunvayP87F4SvDl0TWxvb+xlJos9FyBOLgTJmx1oY5HED3hZYqlnnsGoZw0V0J11Jl/s5CDY1dM8jWWIaNJFlWrhYhYg/1tCnKQJKo+52iPozLPiSS5J4s7B88O7BJxAMXuy52hOI6VVr3KeiQfu/tRT4IS4AurRT29k4v+HP0xp27cxBtZqDoDuHXaJV2RtGbwQaisUDlNdGSIZayw0S3IJnxM5P6QWQEuOWd7dr2jSfrGaK6WIT4Dpf+cj7MVhEWynnHl29cXz88JKDD3cukKSvOJugfarXiIa7RgIiTXHuzHd6t+gyd5PGHL8qGix3Q5aKxboDeh0O8koYvXRgXoDX7vePt7UPLszqILyCwxrMuUF5cYD2EQtg+A5cV4iQ/hB7lVKWAhvx3QxQ4jxH8RR98NewSKUS8RbjnOEQ+Ai57OO3XY0CAuz7SK1LW13fWrHrB6SUnT3r79PzLyQvPQ//4MDjWI+rBMGuHV2owWltfWK85vfBM9Bv5CNgxVDWIK8/KvbzT7knRRoOHMJ6ZoMLJGFSgTn56GKC/iu9tb5Ger39a3BALBJgLiT5TzFft9hRmxMXal7+DjtyzZ289Vk4qJic1rPV7ZxP08ycYbD2zWK5+Hzf91yjZ/qpUO3M0V6qUSmY5LrpKK7VusOKv946B1Qp0CIV8nCiHjaOKvWx7vv+idTyPYg1JWxbl+VLE3ASpBgzbZV8ifjtrjs8l+ArKd8sP7+wmaB7bcNg+hmQ+ZdCEJ8KiIQJh24Pv3+J/vVcQAQZFo4N6HSME5JistEM60SnCIWVa58C5jRjtg8g2An/MfCwVjJZce08jVBCQl6LRiJkKRtENNhrdeXvBn4IanJ+Kebzg1PhZeSFtEkGxdFjw6Y5O7alzEELPaE+XqqkHj1KA8K7GWNVu95bvx8wLN1Y2/voMN11pMk1qFAbDGQX9sIFcu8Elrn4ResAA/XdPrCqKcTjQBDXTchRsbdBjxaFefGva8PRAiA/fKdz3gR6BaOZgZ+dFrmWJbGLqCtN6cyJUSWALCU12NGXN5myEB+0hwcXxtq8sbEPGK8BbePRO8jGPRyoVqjpODQR2ANCu2smkXdCNsSYUCMW90Izpb4OOc9qP6XplwYt9taHBvgHZ4KharNVoUikjv313NxcMemkwI0oW/A6Zkag9lZIzOcpjgIFumYXGkIenNDbeo+3DR268q//Kq49RVxt0WJWM9Ug39TIZPtaDnymzebunXM6juXvnGxsbxycHr7+wAnSpXCc5k+H97R863/K5KgD9J7/Ma4Vt0JV6T6Fmjhbq/iQbxgHoz2PFwe6eix0HXPwK2yTE+uFhAbTDJu69fLrtspCrDQtESEBVmlkQayLYkIuYI5iaoGMT8RG+TSWysX/napQ21ywOPkpT2DaUY81VBlxxZXva9/1UNqRvcGCoZ3QEwI/29UC+hFx/HFzyzmkjhAWWwZHuXhmIyioVGocgMU8tLC6l3SkGj3uUC1SNFJpwCPQeZYnxGPHIV/NeZwozXwVT0En0hMjR309MJk5B7zkFfWhsQHKklwnaGojhmNeQL6di+WryW9/Y+uuLk/NvfWkwTU5OSpR409/yhjN3COhgmR6sJX5JHLraoEvUadpRox1Rs59t53Eaw3NlcaSbMNjJt4eoNgMaEuF7LsArSf8YRfu5EGRcfWA1cj7MXLmAL7sUd2A8DgZ9IpRIRCJYU0T4n1pf3DEbzTDARGOUMVDgn4CkCqcGIgWDn+S6E9B7BvvaA9ch8afHe9E0wU0nH4dXmPd3QO8b6h4gMVivKqqlUmmsvnd3259xex1Br/PP6MEHq14vfPA9VXfOm6K8vNcuTxkx6jXocoxEKxjAgh3ecvLj9B/ZDdDJbyNdgpnnerHgElzBPsNWy1q2iv9nvvbl/etbx4cA3To5aVIqNWcS9De+/V0tWMvX0U79/k8gGElWlbduTuh4f8mMZI5nCetdqEBzJiwDyv9qhiAKE7F+knUhystUPzre33/RXGsGOFx3wnxwzVfgjuJy+JfBhgn8AW7HkXZjdn5zHnuDRpr309Hg7Kx7VhiGOY8QBBUMxLuwwE6qsIvjnY58G/a2VhHwJr6LwKgDOtk77yGfu+Fw7xDZTStqw0Lv9cU7WaPRTvtBiqk4qpQzFfQaKbfHQ68ZdBkjqdOwvZbLGFb9OhBv4MzeqfLx81XVj79AcFf1iq+9VCGTA/H9kVqtSWGbzRgr8mjDHh2ePzz3BFX6TSurNf3l/WfPVhlCFOdDvnqkFTB//5cxAvprs1AJTTt59GZKgShADxPQN1g9aA8ddfZ+ck4NFTrF86BAf3n65f724Rrm8hizQ6liqgaNgWWaw3zF4UpkwXRcBvENsPO+uR8uPuCM3gJjy2Rs8GlxA3M18vgxKLi2b9u/P1DkjGOYRnpw+CyQyqrznA/095PeXNewrE8v0gtVeqhUNR/8Yr2WSgUDcGcwJ4zYaKMoN6XzGiBGhE0GW4plwaGI0ko6lzapBcSyHUkE3giSriNt76jidBQrVL0Ts1t6kUBEzFxhus56o/aytpq8s7MCF5fz584ZTFa4FuUnXjuDXtpvfN+7nvmSrkijHvjc1bymXbJtadTpaJIvmdEvzYeLbdC3rOHwoAglcfs6vMq7iJAQuZIorn+m//Xb3rr7+mYz5zfjNcc+GhfCztEyVwuEsrfMviy2SxNZGGfNuTazli8urtQYWmdzKzKFjKmo9RikYbFsFDevLUSE4WYnoSPDdrwiRJGM7EDiqgOa05vePdw3rNILZCJwm3HRkcDt+TJVbDTZUafVUpCQYWnYKVYN+CupEkPnU16PnWY8TKNgVYl6ezqf2W6cf3m2/1ulRDo+aXuikgmGkS8M5mNg3uXzdi9bW1xH7/08rB1mJDdvoveuOIsG6m983+6fKnFfq8IFvv/bvFz4GBsuW9IJNx1NcklHIlUuEtAnrVuGonpQDDuOtoEa+b50VGVI4YxFMXS0xgWqmdb6wvMKsng8GOAmAm4uGYAcFFrycd8ciBcRRySLP0XTZ/Mb311yp026wqxVq8hYdRKlRBWWiaAagH5LDy786RhmHLXhv0FH+408Le0Uf7inS6waFslkUlgQ6JmtxcV5aIIZHV4KcyIjgnE1RVNGeCwWDFUsuNEeNObTuZS3kdOpxYPD3URmHr+cOkb9J+ikVDcN37SdUyPbILYFYdB5y/Djq8b8i+vnIDpz/BKgmyZNIMl/70yC/qE/TVVcAD3xnVt5RRv0vwqlbgb1WoWumv8FuqeoHSn2IpsdaGvIdCI8CfGdQDw4LkOQF84e7u48J5NWS7xWiVSSDqIKDjoFdAPiILNjsThr4XjOB9b03M5ixACiuTxtzBgpxEolWjWwr8dgHOlUG3WcUyG4fw3OOyI2Pd0w5RWoBAN6PSxfhFr55u7iDdxniqarfn+C9iBJJJoilAfMyFjQW/N7wXewJ6PVViQj1wtww/HFEzEaAH4qKdjB+9TAt0ci0917Ai15UR/qB5ClYga7EWOX4ML2dUzZICQ3M6lUmli7/OcfP4Ogv+ND5xuW1uYBZ/nsb8oa068J6BNSXZReLlFJh7EcDrdBv06ppTL9gFiMiDfQ3U5125pd7Vyb/Ogf7hcJemSKe1sP1ptrBUcN/GXM1QC5JfHTBKFUWByQC4JDdy6RiEfM2GTYWNimVQbbNA2SkluJXFih1XbsFTsFGYEdgOMA9NMbiZyrbQvSMySW9QpUKjzncAna+fEdiy7jxIISBEk4rxHMd1g02L1eY42yG/1m4q7FOusex5Jfri4O9BI3CTi6Avf+00SuAzraujik5SiR2tae6MVYchXAkV/rSUFkLlUuBxdunDs6enbYAV2CNfzXziLoH/jQn1qJZvyA4z4Hjf9JAvrLCWG6tmkslYwlCwFdRW46pYWjNVb69eEiOiEI8h25JgB/qgcq6BkYHL8kk83UX3/68qDSbDnMFt8UAI6HEi6YmJvNriWfwwHrjFAlV4fiSKTZ3L67ZdLZ0jYmOON2yyXgFMuFeEMxJe3kDsRxpSM+STK4DkB4UdryBoJBfDEq+DQqny/++Aj+10GaoXg+gAkq+m5G2gvBsJLRTgXNzhhbzds5Jr3EGTBbGRv/9BWSwvUSllU7RTjNDjtakoAcpr0Sw+rBOb1ehrX3kTFtFd7pXs99iALjpm+ctA5fvnUG0V3JapR/OZOg7z6rW1qWXCXx/T+UpZPQnJl9qZau1jyOKIbQJYR3gG7CTZdq9MVBohJLLNGGICvSPoAduLfz4MHx7nG8wQLV905e3z+uFyqbWbTh4lCj+oPrDw4sRsRhdout1HguV7FYIF1XyUXmHyzYhE5KGWTchmu6a1BmU6qxXNrXKZ1ORejaoBNM2qGdUGgFYrDp9BPw+FZJ6gt3120Zu9vPu6N+f9Lp9XpSFIMNBm/SX4U8YKkKBTi2VKHMoD6Lh7ph+AINSyIcjJjxCnScUwHRDlVzUOlePXiCNHFQL+gekWNlFasOcnAp7uyvHB0/a4d3000JG5OcyfD+gZ1GyxeP1APmz/0hr30NNx2lisLgNzuTZi7pL4dxhKaZ204NeXL1CqsSFrcjo0PoWYGVRppXnbQaWLSrN/RqUL692H9yeNTwnYBeQVQ9ccunfAGOg5ZsBKSIZsPiI/k9VIV81xdcrIfouDFMOpNxp9UquXYE5RtqJ2BCVKn62h0ZAjj+vGtgGI32djsGqjYqjeb5j/fqulmqVHLaa9hw8Bi8RjztaLqVaLTjYLjFggBBcdGYry6XdhISwpl+lbN1fnulDU2YtegFCoZHlO5CY0uPVTkR9pqIdjCLky8bF/ZWbjePz798/dpNCSjQ8rMK+kHF0rSsmQnowpuXSXgXX3Y70ZgxY93hFegbRkxHVCMKKKsLtSKYa4+MdBGJwE75hAt46n/fO0xm7eJfP3z5+l9PmqjaQ9hFM99y+Tgsqph9AdxumH9txhOOSsUSCSDjc+08WHIixy4waTotkVqxgmTQjoyIesdwADtpz56mb6jVxz/dK5MhZVepw0WhVNJ6sF/PpGdnS7jgPBOtopuPKRqedmRxMQoT1SoSODrJUMmKN4ySsPNcYID63zXaKRcDbAGYz4AV1x+2B+utFaFeoBcMjcrsHsQKdN7z+dTCHlH5h07o9yRkyMayZ/NN32lUuEhrLZf8nC+vJW3Ye1t6IVVgHEkjtgyIoFh4wqRb8qdYRXHEIC9CzhVG5vrwiFbbuTidA0RwoO6Cb9z4xQvjwj+9dRc6TK0KSFNTiQAYcmZ4MmAJzVfJttb8lSZ6gFwkDjHSenz77m2DmwHLQe5lJBASGJJDvB0LbkSKrCMx233628AAEnxBGAlcEVuxlt3FzTQDejNPwWKNKIRU4aDIG71OpycPVpSZ9WjkBc7DVkJuORIR0HTaqxGAvEO8OT3Av+0ng1G+qG0vptc63M3NdRWa77B+HSoDXI1dLkfZdufB9a2jg5MXO9dumgB6/owmcjt/wvd+rcFxX/pbHqbKv348/UR1mYomnbwjWvPDURnWWaZrSzxfo6SjKq1GbnAqhJqwxmCCZULXKeqvKixIt2EtcfjKJcH4xLWTnb3D5qYluxnAXC3nq8DvxdVqRFocvAEiaPhb2goEAYvPF9pbTNrdLPQB5IynKHRrTFaxKDw6KkAe33HaJoZLyBQHZUNDpP+mAkPX9vovtm1BxuP0pz02XG6v3Q60+ajbE8R+tN3DM2WDxphz5v3zBY16FPqgA218T1kSr0A/fcsRBGDzI4AVhWpQhp2LWmR9Q68SiAQw8NTK86wC7BmM6+/srT85bD37K0C/aVKw+TN60/ef1ZMVy4HZ/CWuDNAJXUpsSjMlP+3ng/BfJNn7TR0y7huWWPiRHKu8UpWkaMhAJwoF3BDqN3I63ziSZ7XD/Dgm7gLQqXZXmqA1Biw5c6OBzkwTWnS5ElJ3S6UOBcBazRdJYtO87mv9cGEFPXMqRtvhzqKwWsMmbVEkAhWzDTpu+gA+YLh1IpEekE/ohdb5u7sBt99oLBlRntW8lN2bgqFigUkxQQ9icYnzAKSkTeLerOC5GBvqG+sZHr7wH723/4G8dwiYC9CCG9RrW9dDof2WTo+bjje9+34+ppGwIFHcj30TisCHLYjDfg83XWFHeP/oB99w1s4bP/Cet3FoyGGZ4POBvGKSLDtsidEpMyax00nHSRt2YlJpaMb3qJXnEo087VZjCZTxaBUStcKklQmGusmj3v/qm9cFq0N0Ty9eIhndzbe99enKwcHadB193jVLxLJW4UtI3TkOcmCBGpd15BJmcz3BYd9577vZqifKQpfVOiOR6NBLR/kmw8y1nTAAcjgqIvZChRwucZO5p4vPadpIwTANFBgGaTplrMFtG7WaAR470QCNvItO2q11l1OuguzF2KeHeoAwQjvOK8DJeWXGDa9QYI5wrvesu/gbn/XK5UjkyJsOC8Z8TGivsve11MI28fNovCCgXwbo8jMK+p/AaWnmctyXzLjpr5Gbrld4jOZgio5zwTJAF04qZ9ZKkQ3b5q7NKQlTbIFmoSQDgX0l+t5iwI5ZyCnovYjEpKVyqfsiYvyw/ud/2tk9flujztcDvgpXb+X4ig8Cws0Kh7Grz499xlrSEiCiMo5bCzt1rdLPzDBYKVbDmkUhBYluBLEE1HgyQsV7C8AhTKZn1n+8wzOMO512gvRk9tqNVQBudCIhdMrZfL5AoxsT5Iw6Z6huCId7oFkJxu3FgX6suv7nU96F09GSxFrViIAcvSp3I7qy48jntfA2EJM3/evFMguh8FgxVvUsfGP99tGzZy/2kL1fxjtPQD9zxmxv/MR7/tQIcI06F/i8+TS8v5ApnFHAztEBksipJy7fvFagaX5rqnSjIczQnEeqhEaHXGdSGSYm1GHZUHd/FwG9ffrQ7AJxcuBS34VLFy5dujx7uLdzUm8etFqBuoXnLZZko2VZy+UsIUfJjIweC685hyNRSjoCt+9sBD0Zxu3O6HQ6j8mKIgGykwgmcFQU6weHyB3HT+vzXzxtUW5n0O2nUJHzxPqWpoNRpG8MWqVab8Ftr1ZLAY+Ha7mlosExvDgk57jY30nb/w/moN3jnpOqwH19Y+2Bq4p/jFYjU5MAj957nlVK7muNbLm6cGdn4/C4ifCuvAnQWfZsgv56w1xJ+NYCid87ylLFrxHeXyok16hgpVAJUHkt5CKFl2/OFGyrudWjrbWp10soVz0eGBtkpEq3kLViex0CT6Rh/kp49yLOBVKzky7HJf3k6rm9tzYab7vXaPBcxAy9MKxRHDQrtlwlZ04kSCkXQM6YNOP3L96pmAwzuhk35ZETLx6UiQqFbHBANCHuDev1E8jgJg/27j7BJfcyjBcG91CAgyGmHzEeqRw+i/k87ffY25V5oeWXiLE80c7+AfbpwObV6WpznsHkJ67uA2C9QnRMOLVDb6xTeRSmOBjkkLQFG4x24G3M56uxhW+s3D48xk2H2JxQI5GcyZv+JoBeD3A45s8n8wpIimHDRWDS1bGxGgQzLCzGTVdYZ6Ztqzj1501mZcsur7JBD6aiCqXBoDCZ1KSJNkpkITu2PGCi4PKQA1NtiKvrX2u9vvvkT42DQgU7y5ixJROR1nSukUvWOfjg8RzH8xjp4YBRdWePsV7TZQxSb8zq0WiVVjV0PaXQ6r4sU5F7PvPk7v5aGgQ42uMO+knzhYxWYJ5noyQ6HYZhOQrdGOxSeCMVamJkEDx5FBj/8m95dcvbBQfJ4y+AoANhGdkAJmpFejvu2J1DN1ijuCy9LJyYEKrITS9j5YOqlj3Ufft3v3J94/Dk2dFu2iq5PKk8q6C/9QCL30irEl+pkTYsRAmORJJCkCvJU15DqvgoLMQ4/dr07PQ0VsrWNtd9pe2m2m7QGRho9rBCCVWUsGKVSAwqYfcYwmgfuC/guAB1crBJPn5pfOJHxzs7h7k6XhGfw4mivVBYzfFmSwVbkpja07jmXCmJnXTObFm/O29Iyz1OpONaKi0NqxUzQjEeEZVQBfWi5tNfHKdts7N+zMW9Tkj/VZ1BkGEoiPl67WiU8gUIQdnMdrslDjPlITJS6QxUPv1fh+QfnXnalUFMB/Gey3rV0q3t4PoKw8L/B4hDmgigq8XDg92PwmWvwU7Bg7G88M3vPDlpPHuxm1ZKLpswZ3vtk2cQ9I+dqzug4LaWdHyl1jZVfu3e0YTtmr+KsZIn6hST6K5Qum0Pp1dt99am13IbKznfA5vWo9NRCAUUfPu0WgzbtcXBga6x7lMrhYvtqSu574LxfqwjXZr43cvdlcZBy+fnI5ZcMkcgBzkSnFuoH+B/csT1FOb1vNMd2L2z5ja6DV6lU6lSmwxyoUmthbqwRiOc3v7FOdv0bHqaCSJpjxrJ0jgauE4KQ1Mqb897K0yMRREXK7lgxznS1dfX/lraa63/c7r6OioW0C+EhCluuZR+4OMf1FmPWiNXKEC4UxDQUaqP9Dwqp0j/HkJD0W89+OHWcevZMUA3aeTQfD+boL/1oO5ImNdy5q/W8lIhbvrbXsikGSVZAqOd9EgRvBnJzLVpoO4v5FZzudX66xurWysepdLKunVsLKOwS8J2q3ikiJIKmL8inXWoDv194DxhDerSz26+bWWndW+1BQWZtdI0h7rNkXNwuOZJM19DgDdDDjDp96AnVN+4s0HpDDqjVCp3exQmqRTfYHR/rUe/2KtAHcpPY6hCB9uQl0qYn0bplB30NzZZAMWFzlCGesMg1ct6ccGBK0B/RbLqiL93tR90QqkG5OLeQdHXB0ceCTe2jesbKTZvEMrlcq1QMUkwRx9INDRWtuft4GvjvlfvfGNl4/gA4X3WSkCXnFHQzx1wSch6cIlv/rksvIyr/rZjsVKoMATTRrM5KBoTw6w6nZmdnbb5V6dX11anbfTR6weV7SmPBILJbqM8CJckjVirEBZHhuDL1ga9E0DRqRF09fdeBD++X3Bh4ntHu08arYP0wXTO11hzkHZcEnMxRw0kHS5eoWslJpUs1XNrFcveXs5g1dg9sxL4YJnkHqtEo0iv3z1KM0zQVvCkIB/idXrsXvhjQsXZCI8VCAyYKYPT7Q0aGNe0VCXrIhybgc5uWv+/nXVPyY9AHLcc1Mse8cjXHxW1ud14ZZsHF04DJr5cKm1jLgXmgp7esUfactnDgj+Tl2PZ4Rgl2+GurQO6HKCfOe3vN33sSZ1z+HIItF+AQxfsPL63eixWSSia4RPYFPj6YI8I5sGIqTYbjWzu3vS0zWZb23hS39opyFmKNSSN9qr2kdWqFYWFWjXp1eD0n3LoQLKAzBsYs5fG+4YFl59t7x2vNe4dNA9yHDJ3cwlJuwO/J7lAbs3sdDvBqivkKvVC7vriuo6FDFBGopQbdEpotjUX920lI7L1IBZW0G/FNfcXjF7c9ZiHLBc6gjEjAkDa1GhkhGLojJGS/OL/gv7Kwgf3/ALBXAYVhJHPxNbXvetzKdZTlmoUYTnoudhkwKOuFg1c/HTv0GfC1VTxfjCVL5fvfOPGxtGzxuEuAz0xhYmAfvY8ugjokIaogc7y5T/nJ4hb09uOREJd1MjTHkfJOfL10b6hSbf12irIq4wNmK/+CJd+uvngqHDjerrsjrJVqgxekjgsl5oMUhlp1Zy2ZdtDEtCmezq81kHBJeHs8f42tPcO3rZWz5mTTtrhqDmAPW8250oeOrdWr9BrAZ5Zy636tu8eSTyGmWuGjBsOCrn9H2/ZaI/N6UULBnkbhQrdD4UJ8oCTfmstWaXILoOhEMJGoghpeR8kJa4Q1Ps6FNrOeTWnJ2Nz0N+w3yx6VA7t1Hz7SbwQ9nJZLdcq8F+CR02qlkFl6iIylaJc+22wpfL5++zCnRs3ID/yb9B/fjZBbyRhaFF3mOHFZ7p8GW/6oUhJURxdMDrj1GeGMI0ckGZ0M7ZVGzL4h9P3fvTw3uz06vTWdr25bylrPXkW1jfhvFJC6cRi+KbAxbhNa7qIbfbOFIZ0vIbJEcgm7z3Ze+uztx3ULWtRGhEelZoZuhHJtDvN47oXctyan4bN8fRqbnNhp2SFzpcVwrtbi9sV6Dsy7qCbIrfcC0vUIP6Eob0xVOVpB4UGPIVQ4Vo1TIjHu3HPO+unuOcddvPpIQy8Pqxq9PcN9/WNdOMxL/r35hw3QtUqEjUWbTiNUGgSTlyWTuA17+vH7svY0KNH9712/M37+dSDB1vrRyeN5lObSQGBIvnZvOnvPrfKQb4L8/RvRUGXQnh/W1MkNHJJ2lkxl9Xh0bGhwe4+mdU9o7u3inQuPf29hz/Cu87k6jsbzO0bTg00f1HDet1GocgkDcvAVIRjT3s7DRe9M8vAgnHbxh64629i5vpk7YCx8TmgnATAZp5OZ5g1wA3IC34+V6NthXuFtcrrd58bJIbMtcbu0yUegjFetGPciOjot5doQzToR/Nd7pF7c9hYouC3QVXibrl4CP9ugNUBvf8/QccXM0Ym6ujjC7AANzJYHCoqV24EV35oZPNUHn5P2rLQpBFOSgG5APQd0l5GHf8IEsOxGCCPxR7srl9/DjPtpzmJYkIhUbJnFPSGIxnhG47Ad41lqfDyX/4yfTxqDVaddTpYZnntKMYdRN1HZL1mmj0o3Ju2Ze59b/qhDQXcanNnzb/jitntWmMhZdcqNGptGNmdeHBo6NQNrfeVwzIOAX78yvC47NrJ63uN6bVGHdIiPA+MncYgFCfqmMYwpVydt9lKPO1fLTGzzacPGrrp9R+vN/w2Y8ZvBNWRodKUx+/3Qt/TESSEFmvOhkTfk47qCi6/Eli1O4Id0BFvOucV5oR0R3Zjh0Q9IgFYdmHXjtl/g7d78hifQgASeiJKOd5ylWgYvCASrxDdRx+VY9VysZoq5+UPHlxfxwLj4YOcRqJAeJecTdDf2nCYHTxX4L7lzJsmITTUeC7Sps0MHS16Ga16FG/0YO/w2NCoasY6s0oedTRqZhnbw8L07OrWTtC3741VeE2UZZVytYRxK8LCyyrZ8AAQ737lgfdqKYLcdoxhJu799elbDw4aq/V6IVlyUtECqdtzOTpXz6HHj40nur7Kp2dXC76Np7uLu62CzZ8GBQoCMrjkXmOJ5O4FsF0NMTtVoNCqz9BpqmnxaAfJjmMnrJPIfsprJuc0gyPrGhjLDw0IhkQytfT6nOf6fIxi5RqFBAo0eakErDAV2nAkMelGgY/PTW93UX4fK+pECTr/lQfr14+az8hNlyjaJds7zyDo7z+HyM6bG+bAl51I5H7+65/fOwrHYs4CK/fHpE77Z3qGQBnuHezBHEqqm5nOzX4PifzbgLvt3j006V5vTt+wsFrmkSYWlhqDMSHsERRCkYpQECEt0nV6SP+bgC640IOqncT4pyerB37cdFsGl71ez9kKfAUqYCWCud9vK7hthek1W66wceSfZqYZP8RhsJqEzTQ/gRzazak0Ym7Gb3DrMhBqb7jSCvEgaFWd4Wln6vdv0DvsHnxJZCIwiM5uWCwuRvc4y40gyFD2mBzkT41QI5dq0XCXjZ+mfig++z7dK/p2WIsXHXpU5fze3o3rf3W1mk8LOpNUIVGcUdBfHuRqXC3nd3zLmJc8RkfuT41RuzevCRrvU0mnUgSWM+iIXQNErk9sVWZw0dPI35HS2X60hl8219eu3wiqy4YwE/AIlXYDYbDLFRNEYoJw6Eig73zLL7QPkasZFEx872Rvv3Uvl8swOT951Rk+t0aXCnzJT1Dn6UwBkd+2Wsgxs8wsbSulrRRabxkv5AQ8MFpypqDXrfH6bVavnaaVpeerVqEIkPd3A3RUax2g/7Wxgqe9nVsMEEqUABkluu3W9W3v83gMiSjyN4UU43v4DEHlPCzqbb8FhLSDfABTXTDDkOZ52fus9sH++o2l1sHmIg25cI1Jyj7+1FkE/clazlGAXaXjyzXW8PjnP3/n25phbPcrY8Fk0GnXqEWjIEHhgnQR3AelCoMO9y4zfe3hrO1HNoA/Xdhcik/Nc3Ij6OUeq5dSKg3YA8AQRi8eJFGy8x18RSlH5U70/y78TPXz1ltXmrZVfi1HYnoOrZlSwc/gK1kt2Gb9fKFQoP0Ff5oJMqV0mqIyTCadQS8m5Y0Sc1QPlo4LXoMHnwTD2lHdKuyB1tmnxztxnQT4/2S6krbcvzYiyQw1rHJubZld80F7vhzDU63RqNAQEOrRTR4ZIOECWWhnuWKgt0ek1cRYaAey+PHgG9s/XDr569YDm0ShEZpM8sefOntmq2/68F9zDryntNn8jSWP8trPf/SXg+ag1pCPFozutCbv1AlFQ6TqxmOJRTbkvEKrJFOYzvxo9ke23z18OHvPxhTQj+fje4Uw1n7cSoPX7ZlR6tUmpVCM9QjA3hZ4OCVPXrwy3NuNEHvp4jimb2jWNNfqBVuu7i9hYl8q2QoFf2GVSa+Sp52hC063H2VZMO3J2PwZr9+dQQ5P0ykPSHApKEOlGF1GUt/ISVSDnxZ0fRofTqB9ivl/g04qxzZDG0NzkWjCurIS3VzBViKGKCA9oh0zKUHTVUxuObJ7LFK2O7ZE0VIggmVkrMoiwMPGZWF964tb53YWOTv68xqlYvKMgr66yuf4tUJh6p/sXd9vG2kVBREoP1bQB0DwxgOCF97SxI4dj+N67BlP6tgz444nXmfGJOPUJg0mLsQOjmxZistDo4DxFIxEUgVraWUUO0pQQuqgSknWWaJmFUWt8hC6TRSplSrK38D5xi6/f4OQUvZrsrtCtNvt8Xe/e88999y9nXK5UVvf3szTsqCpQoDShFS0EAyG+8w9l00mQ2Fy5Yqd4srquq7WVDzuQjFdx81cbs5PLFRHp0f5UU2OTrqwF53xs1yi34rbPnCFDJ6Tvfmtqt1ouiLMO6ao2nsHz/T1pfp6Bp8dzMRncupMXBtfwgcph4psGJOHgjclS6o3hd+L5JkRhBweYWhdhycmox4pJZSOt9OU3UKmmw37kvZYRM+fkDHGRDJ8XyHZdLr789S1H7z5zR9gsNU1DcQDLIXnmcLyOZ+7t00ptR8GrPe3OPPv/DICyAOwH0mu3Plxc3Pl7sM3RwMsi/SFefToXIL+bLmYufqtYVWYOd07Rtcyc1zN05GxnCRyOW9KUmgW6hGwkZ247GQrMVAP8iWpXiymgbm+rqNwT3mL9/aGlg4WkrIn6mHyyfFBXqLpd/IUbjuarsRugFRwXa2qCWEely+MBS7OWP3sI0/qqAiAsookDn5QE0vx4VzGqwrDgxOCOjGmSaNjYNyFUWnY60WtJk8GwMDC83FS9UrCqarA0tUoEVruJd1/0kg1RqNwui5BKRF2hzGdlo8vXp+ofiOK4WNedDF8gKFYMYaDwcbfC7qRg7aMLO2woZ/Gaw7IA4N78CRo7v3sx1/F5KIr62IZ9tG5fNO/+PzF4TJialzNZE73qqtLQ9V9JSkI4k1kWIMewZsuxaBhcJAZZbjDIgWHN6Pdx4X0TFGVtC1dK6bWdV0T1IXm0ND+yGQgz4+PT0spkYfFBAtO0w0R8QAOuplot7cLd1MYCYIDwwvu2vOD3y6DisllADSC+HgGzb1xIeeFNGZiRtCkFKRQaXXYE4UMTvUg1eYnJwSG+Lhr3Mh82W+zmrqRcbSdgQ0G+E9Ab01A4v8FfzC73a9sVieuVwcn8esk4e0aQIMFDEPM70POTp4hcstbAxwmiyGvyL+Tn76JAO/5xoM78z/+wd2714fRc6PZLMsyTGHjHIL+wS92vFhW6zOkSkplnpytbB51HDzY5sXk0ldh0uOdHBuWZQqqIfTPDO05bF6sIF9sLlop1tcbjS1B1XJ6Kj2s5Yaam8L2/tjNq8nkGMd4/FyUoTna5fNbESXNhOzofjUkCIU0pt/I/lOTvYJ1EdsXMiQnROhYmoGd57cmVFh0e73qmCZ4BcgfBchkhJygYWaNgR+YNulJjg/L1zrqNPhxmwFuu0D7E9BbEikCH9q+GHnEMPvh/ri6MuuB0zvDizwrMrwLxCs0ttYuYN7V9jBqGR71QiuZd76Tz/tvJqPexZ+vzN5b+WlzXJ28ySdpIrMIsJV3v/Ll8wf6l88OL2RyM8VcETK4F4ene0fV6tl+c3xiJjoMNTnEZ5rEEEEUEcLh3oC+RsXea7IGOVqCsEJtpMpbZb0hlJHU32veKy5UA8h2MU7kkXFokhhTVALaRrDekKW2r/olw/DT5HB0wp2qvLp3trxOisBcPTU2kxmHGGZMUMfGhgfjgFzAa56Kz6TTUUWRo5og0IpHVZX45pBGBTuRs1svO9q278D5D6C/8qrCeiDi4I1ywp/au6+traXlaZqnIzzqNIrJUi5Smjsu9ZAqhUBOcDcwx0ZenHw+z0ekaz9dvPHt+4hmcQ8/GYJoLpuNURxfePdLXzh3/fQPfuETL+rIo4rFGUGt6xfq22dnx2vN5t3N6Qlss3tTwE5SlpYjmA+1XzGTu36JUNe9CKn9/hKXWi/qur6VTm1Jak3T1cxCM7P84CqmwWGkL0lp9ER5jqZdog3hAYRu5yuSBJij52oO90w50HON6b89OKrr+G0IuZkMPB+1dC43po0Ne1Vgjs+dkEupqsxJ9LCakmnJ65WU+5sqbzUNXIK52WWkiADaQP33NgPGHUfdDp0eUkZDBUfdbw4ONeOjLo4JcCJk3AoFOY6PjKGbCc7tmWWjZQCZPUHcDQl43h+IjhzcvzE3tDLvTY4xAWTuXCgboiiFL7z8ysfPH+gfP2peuLC+TmKrXiSiqAv3m5s7pwt3V5K349e+is7WbWjQ+CgDPXLeegmKKBPITFwDCy48V9IgodJJJl/TK416WdWXm9Xhe4tj0cjEGDYo0IpEs4rst/KwCEQ617b9I1YG5LXtMoVtl8Jhs30q++Lo4FlxfT0Dpcbg2Fg6NzY8M4bQnhaICl6Ip/RoSVPk8bJCa3JGDWUWDrFl1YLfDMyEwZoRzNs67FegG9aS6KZZsZ4Bx86O710bXLkeidA0QKMYFopXNoac3UkSuJbJEAJZa/jBQjB3Y1Yy0Z+4yYwvNodGvnp9/5tjHmYyySs8zbBUgUKhp+w++vgHzt35eOUjZ+uIrXXgXq+BWl9/sXx08Nbs/YMH3iTMmL4V/8nMxO14Mhn10Pl++xUAN9Bt6gFNZbF2hZ1cRa8Xy9BV6A1JlUDXNGbmf7U6sbLpwcOL8C5hRTGdF2l/PuhP9JsHXlk9dpqw2KHlD2XqdhBmtrxzcPbiwnJR0FWgPSio8eExvObpNFl3nBqWNI0bU5VSNJqra9LpPc3vxmOBK962pGrlcG1PsJZLCQlMJmNuxY27zK+teEd+4RkMiDJbctGhWIGKuXwQVUNwYSIcnEHBId1s5QDknruhEIT6j37r7unq8uzinAdDsAy07pitZWmqwFKKXAl+7qMfOHfno5+LPf5IfX0dX431GrDX1eULO83m/WvVO2uRgPe296tjnt8kI6PeSCLBQBFlwQAxiYXG0x52xCqlrWID9T3e9bKk66jex1ea4zcWscmIGSO77SgRVz0R4lx5e/8VmEwQqFpiVPAl7WMG7Nmt5/vPjNo/h+vt9eqqBsRTyO5SuiSlGEmXFJkWllOhnbVlNmgB3IDcGD9tj9cYZjhtAQcEL11IP6x2K9DDIu9QdWd1MY7B1shNhmYrUMag5iKjFFYTyBu8O/jl2hkcHnPsC3ODlMFXgl/ab14bzx1XZ8aSUbRcyEYHlitAegD7QMoW/tT5Mw/8wIc/5bbVD57Wi7jj9UYR6ZSuA/rj/bncyMFPZ0dn4gGYOYzGB/npQNKZcLkwFYCau13RYJ+K01VSi+DnisWaDuD1tDY2OLt3I7f/Ju+RNSGAqyH56TSGnHmfP488nswfDyCEtpvtLeB7sC6FmJId7BRzORX9O62ol9T0sCQIqpqOCh46pcoVSVoWlGJ1WwKNYqwCwVcL89+30tpjKwPwHUWzAJDbEKSd/uWHq5tz2A54O4m1qwVXNuvCN+Vzknqv5/fCScLLAPR+XPG825lI4EGXF+7cy3iXV97SRiM3bxOXWIWmQyVXpZAt0NRA2Pzpc+gN+6FP29y2d3/7HDd9a31r62RL38Jf6+v1o/n60sKdxeHI+HD0W3BJxxLCfEALUCL8OweMQojAbr1ksQYVHU+6Uq6Va1KjnNbSZV0f2Ux/ozkciIiT0UCKk9K8yDB+Bg4x5oFehApEUXJaklmCO/YwQh/v1nfOqvUtHSoNPOW44poupPS04GHkohbiyvGcQhK4WNAEqJGlAab2Rf+D1rXbYFVsyBfgTANfV7vTadcW12aq6NDdlInyEYGZ3HJSmttMuN9G3x0/mUR2krTbjMfcnnD3i9TsnYXZuHf+YBWTHYSJDbC0ElIgeGcLFcphtna/8ZlzV7GBnfn8GzY4/61/5PFW8ULj5AR8+joY9cZyfe1sZHXkB3fmB38yOxwZvY29dZo3KorOoOgkQ4VGfEYp29sdDmY1Va3Vao2GvlVOpTRZnRleWrwxsXnqSiZljU6lWTrKsxIq4v5+p5OwsgZEJKa2NRbhzikHCDNzVj9++FhYV9MCSB8ML+Hv6WIppHppWksVNW75bJVz2zstr/qmPe1zqY36qzn53s5eN9iEK1an287PH+TmqrIH/X6ODkH8FjJoVxCNDhMp8gjohjTaeM6tBHKUd3bcc7V69xu5+OzBaRyPuGtahGaDCSF7w06HEGVHJXjJ/Klz+KQjff8cZlD6HNmdjie46yd6rXGy1dg6KV6o75z9dufa/YP9WRlcCNzxJ+KRm3yC1qg8ZTXsmAcAmgUle7/VxyGfK5V1qaGlNU1JqUjG5haXxhffZCYjKueiNV5SXCz3TgKONUDd+My02O3W6TE5gHx4yhTM1jvOVrcEAcWaHk9pQJ1OxyW6JAF87flxOebsgc4aQBmtlT+fN29jDpc5QsXYEabFzN7I0uL47SSDCkTmoO6msoUYKc2tBPJWuo9v8gXI+212IB4MOv1udu3uAvqPayvjGsPTNMfxEsuEmEq2Uii4nBZTGA29Nz5/DqM7HvXPurGQGnbHG0dHuOgI8UW9doLrflJffr7y9Op29e7aIDc5PbwkYE6bTg3zFEcWMgB28kc8YLESjyE3x0EnW9ZrSlnXFD01KMAUYmHeO784ngyQ8SRPlKdpOxPl/T5YQ7UaG5faDDe57+FLpnA3wd0Z2326d1wsCnVBQGxPKdG0LitSua6XDqtFOojLiHUObdD/FHGclpuhBcOIdlzZ/q87owuLE2tzyShzc1rxh9iSgrhOuciEddjcGsowUn3ymCPv6yeX3OkE5m5/5sHBbC4+tHdDgvMgMnUXHwDHyPOVCpeN2TCYi3PrUx89d1W6Ed8/80nHrTDO2z7E+Ma6XtvaKgN2Xb+A2YaO3+6sHu/dXfVmvuYR4bKEAC9rPMX6MZZuIklPJ+ybTY5eS2csVKoXEePxtJfwrg8KWKEzu/KNq9UFKJkDw4MMrfnlqOjHTKBf7LdajMs10HrXDRNQ8LI2c48p3BnMnhyt1NUUyeE0RUNQL6VS8ZI0/5R2QQMBVXJb0E7C+l9ec4J5P4Hchv0e8w+uvlkdDGDqlAkoEDZj7DAWA+lqt5qQ6XebW89Et7nVXbERyIM4zphU/dVcfHxmYSHuQSqKwlwGgQdWJpuFG0EwDIag53K4743Pn8MX3bjqn7ZfJoNHyKSyj8+e6Ljs+hZe55OT4tZ68b2Vp7M7mw8WUhE+MjzsDWBIlI1IHBsjCvfWODpWK1ihI7RRirauo2wrl9CAwYMs6MMza9VvLe3NUpEID0ZWk/08J+ZDvBPjzZaB35vMAnRT2xEU7v4wCXm7/HjvFBIdQZLAt2r4xYpSvbruD5pJ4mUmkJNvuEcamLUP0Ul0GeCRiqvfnU/kHsx5v3MVcyvEBE4EHeMKFbI+krR3tRYGGIwt6cngL0YC58QJwiNz9ddnYCmv7X1zVEZdL0MDydGoPbG3pVLwhfvAMoTN3eaLnz6H9Vrrqn/8UxcdFmPZmsNWe36EPF5vbNUaWyTQF+uzRx1P0Xp7eH0QMqaAlNKQUaU4pENB8qwRx07wa0STYrK4s0qx2GjUSmkd7Cmk7GX07qod6tzKZAIZ3aTspzlexJgZT4tXur/u7hogRTsUlIQIewV62EKkDll9c++9rXJtfXcXj0ZRTz8/LftsnaZuHGBlJF9AbIC8x+TKk8ybVNiOTocN4+w2QplPLjS9I9/x3I4SayiedzFkOiGL19xmam8FaTEGOGD2rM5e5Pn5d5ywVlKbD0e8av1sDcI8BqkITSNZz1IFlPcFym1srDLh83bxnAb3NupWYqePsmlqKngBeXzt5OXJSQMRXtfWc/XHK8eZ5XsP9q8K/qhXiyLmMozMiK6Yy9ZtvTRggj3bFXPYaiXDDNQWWm8lXS3XiilJg8AJwzB72zPNb0MZ70lISOmiRE+Y+Lro8l9B5o+7Tso3XPcW6q2q3WE1w8vg7OxJfXejXFYbtSdny1mnFVPQLawM5aMRKAbaypgW046bbkN+AZsSa4K/8cPZr/04npR5ZNw8Dli4bIxEKAf+LQZzZ9Bw7QTO3W/PI4PL+/N219zdlYxa7Diol5HtixRUr+ByClzIhTGI4NRlLPiFdM5sfuOz5xdz1Oof/9Qb2F6Oi4vIOkWtP3tcb5w0akjidUwuZtbVJ2sjs1fn4fSbAQ3ugU1qkuEwVOgk3tjWK6TuJkW7g/TI3RTSgnSqXNvC+54qp/Ak60Pzc9+8N+cRPRg5VBRM/uX9SRFeNn73JbPxsht/9mi3Y6y97Sptu2wLFpaff+TJ1klD35mvF5yOMAJ7e5eHUaD/sRzK3IIcbRyooXpRp0lzp1ev/+gnkdtwf+Nc6KbxELpkqUTQHsYdJSn7AE67h2q00/L9znwQfxPjK6eZ+NLa4lKGoyD/8YtsSIG4ZqOQRZkGOYmxvw1PySc//dFz+qC/Wurx+U8iqppM+Axjh+7bJx3H+MMmoDcaxijT+v3m2uzS8cOOlARJTFIeHU1FRcz6ISF3w0fT0EJ1Ep67x2ZyZCGnkWqNFInv6Jak0MyZXbwxU13QIqMuWhJFSo66QNZQV0CdWJETAfUWK4sGXgs8zLnCk8z+6LDZVIvPdJezywpi1dQi3NpNtFb7HJCTNcikADDo016LvT/hPG0K81VvchJSdQR22iWLvAtkTNBuIqvl2iYkBHSDdCUkO8pyn9vu96cODmYzuereksxpIcrv4kUEphCYmGwIZZqj57LFYsa/0PTGpz7+oXN8zw3UP/yZT71hxaintW/KYYNUdefsBcr1MvK5XYC/3tCF47P3DndWHsShXAJlMhoQofQfjQRRgV3p7jUE7iQXgxEboejUYk1KQ0qH7qpGorygjvz4q19rTiT4APxcpaiLj3KJXtHfL/ohoiN8vLEUpsXNGk7iNhuyS5O79vioWEGZhhccmCOHw/lj0JHXGfsyCSuMpftEK4Hp2YXVTPNr0xHCmiZviiiwacpFTIqwJ8aoyrvNBiWIb9JOIzm7lSKfXpHZ+enp+MzVu/fSap6KMhRVAJuTJZRrgaTsZhiJ4rdgNl/83OfP9zVvP+wf/fTnLiIxs2H2D/LBqXLHkwbgru0CeJLUFev1lY7V1dOfnqqC6h1LJkc5vO15kKsu0WptPbU4RHmANXqx8nqqLME7ppxOlwQ0TrDE/NsL43trmAqV4h6/orHE9RG5lRhEFwZQvKJlgQMJ8xiKsKDVbnP4KkGrYUqIgIAK/fegt/Ju/EAiB5Ftl4lY/1nJXfdj0HylOnn7JhSswPxmkmXJ1DmuudXQVBnFOUBvR3ZgTjzE+/NBJzXWfAht7vWDTISWXTx6RGwBYm4KRlIhjEXCnMpsrF3ue+Oz5/6aty/7hz7+2U9aMaxo68I8+a0wyjcQNLWtl42tDcidVWglnnY8Pny6d3db0vJRuPt4/KKE6hvC4Uv2XgM4GOe3VndZ3YViJi01JI2TFA9S/tG0Z2x8JXf14RA/Frk5iLYb/CU4hUHIRW/DiozOiLaAos3WdELt2IdDfORNoF0vG23yP4BuYAfISd8FiLec/wB5Yqw5N7r4rQDG02QXM+26yU/7uQQXi2HXFjEKBe5tebNxza2EgHPmE7BKCjL3757GBfV0QYhGWM7PKgUWFR7iOi56zIYKLWy+DKGO5eKnPv/h1+Ca/1GM73LAx9tqscAvc+voGSg60LJonOpbeNvhe3+8evhs/8ybjs94p3koolgPx1Lw83PbDQt4Q2NhtqLYtsdKUMeX0mm95El70mlpUh32bi4IbzUn/MlpbFELRWUo42E2ikto/zpsZoE5Oa2iDDINQGnqM4XxGSI+w8jWSa79io8xvrsBOt6CbvzbcGzogb/Drn1vDBqO6Sgcmkl0v4lOT4JlsBWoqxuQA2sC+SsRHBqvNlKag4fzUbn9vatedWjxenqM5V2Kn1FCLOungXqh4MQ0Vh/SN1ImfPKzHz+X1Ovfi/Hol5KcrgsLs2Mvmk+2UL/tlrdqCPAkyB8drS7vnP36aDian56M01FBwZ2V5Lzo60eoRMvU6KCEbRgqcLLQSJfSFRA1UjolpyQhrc4uXh1vziffuUlzuhRyi/D5CDB5H6HoIMYyuuwtMWNXOx13WPqIH5DxTbK1djMNuLWabOQzZrJD8QA2DQ6fMwffnPnBUOQmbLoZqH1cHEnaRXhKGxtBXnXi8A943eEdh545jLH6oftMSGt37sWHx1cWZC2tsCgrKUQiVwFCuEIhGL4MuMnQsxkJ3Gc+/FpE9j+77BZixoIKzGwOPnr2/MLuSQ1JfBk9tF3E+9WO4/XM8f6vl/jlmencMONkQMuyaGDZg+6Bge+3cjJgFcYd8it6TtO0UhqgpyUuDU3E2Nxmbu7B1enUDJV3cdAtyXyeZZ0JUHRmuAUM/KEjjmNs6WrtWDUmk3BeZd1dhus/6fpADYsMrtfttjrlanX0re+MTsMYiGTtHEMFkH1T2EjRa8j72h8XQ8JhQae91wbGFU0Zt5sfergQX87db84KeU4Gj0DRPEXTaMZVKjEHkgxjbTss6T53zuu0v3XZP/8pbOswuDHQbMFGx7EOvBu12hZyui29uHV4tr26tAmTPzajiTysOZko+lciJ16x561Xvj8wgLsKng6ydoszK60Xkb/DDDBdKmkaAr0Q39wcHNlL5SmVC8ic7HfRcJBH6Q52yIxkHJD8Uau9r3Vak6hGaG9hjoPXFWpGGIiSp9wJwsA3dHd5uTojR/1kMIFGpUZTIfRWiClYexOzgTkOPpZ2S68TCi4nMH/Hrx40l+LjswfzY14443EkOw25QB/iMaecYSRvAJzUFa9NAvfXEro3elFzhw29qo3a/sgh0njC1eyeoGyvXaivbW4frj5/+Jj3yx4tg2+ekiQwWVQCdTJwwwHsDsLxBbl0TsVtB3tbkrSyJuO2ry4uz5yNiCHVg/AbSPIi4ih6oE4U/GTisQ37n2AO0F8dAjq4W6OqxwNtc16ykkItLx8sjC2MEP8ZcZqnycS5QkP4iOLbbIG4+U9JeguZYvAlEtDIJPLM3IO58fFctToWFWSa9zNQPcYKrK8ACs/n6DQhn7Cgusdr/vnzTMH94xh/savLoMEdSJJqR89Ptl7u1nY3ag2U7bqqP2luHtYPD+DXCZVqNOVXvCEf1MSsyOaR0BFq3FjACytGLO3i0hlVS5WUmqJJZVRxWgp+NfHl/fg704MuLsKElKgf8R2cjR8/u73jkSwAayNOyqSW69vlVoOk3U6DUD2MjL0rSLTp1NyDmaEVNUQuOMOGGA6NbznrA2UIp6Mu1Pl/GGkk0g+YiDsxxpRHnZYXHuwtz6hDB7NpGewy5/JDykkFCwUfy7H21mfOjAMG7uOvYWT/A+pI6D4JBZzJDF7VFg5TFz5yiPBe2zjZ3dChgMSQw7P9x+sXjn+9qZUC6UAmLoqhAMRjAWOxmqnVKkUMRUIXNlk5KZUrl9MNDpCXSwp0rd7cwj1tfi3KRzV8JhhsV2Pg3hYitXS/xbjrBoOCQ2757w9AM0A3JhUR3kmZBjrNas3HH96YWfxGVGJ5GcYCIMsBuivkczodFvxWkAC8sn0mmFtQ2SF1C7rJo8Cc/motlYuvVFUIPUTyilN0iPVD1B6qBC+HCRljtvT1mEDHvG4J3F8cUrQj+7FcIkLVS8HKe0dbAL32stbYBexa48XWUfMJtDV3lqLSOP0OV2IUGR7MiNVBMFt94KeJ8LwbwKBr65a0ogq4y7VSqiTJWkkZ8+wcDKmL32C5aNrl9FdCLk7hkcuLhEIBOW4g9Ae0/6CQwXc7yzP3AnFSJMAsCJH5rYXbAYiZ/DSTDaGyRhc1QZYik3uKJ6Nd37cgB+aEj0EW4PbHD5o5LT7y8BsYTqMCFMeyLGYa4amABM5GZvJx09HGdbyeCdxfSeg+d/EKyrdwty182RE86XhaayC8I6MrI6e7sLV++PBoqX68vyCIVJKWdC2qSWQ+LBGEKsUBCUtLAmexQCBviklbWlkvp8vI58olGb7hqeG1hbGRAxWfEoaVaZljeCaE6ioGGZPljyWuCO1tzFuOIq0VPsacGQ6qNfHG/tUb1TeT03yEJ/o3CB0KbIwCG2OztB4F4463QO+2tATtTsLGOJkbd0eE+LcWNkeTPK+gEYeuGuMH/K4Chf9qC4j2LjhodCGBe+2v+R9fdrI+12SCc0T2cccFoI4vUr2t66Dlj5s7uasrDzMRXZVAu40mA8w0z8K3JWG3W6COxxdJx3rJxGhIV9MlWVbSJQ8Mi0opTtDqHSPC4nxCwv/KaazCoVlNPNZjMTsWqpBhdmBk2Lh2GagbbB2SMEO9aMFEpQ3Jpj0xsXhPW9lOQpTF44aKhGeHsSsSOGSipNTqfvWS45gsSBbtuOLY/IYOi7bYhNvFjea4MbYcQG0uKUyBIpHCZzMbTT8zMofXsDT/O5f9w5//nB1F+61btxxTl98OgqFrgJV92dh4t3wCaYNeXFpcy+W2m5uldM4znAYNlkxGuADr97lgRzDQhZ0KJBQbc64WJ5eCrFmi5agi0RKqOF3TVquZ8WoyIgzqLg1ych8bgiFrDJRJEEHCEFi88ghorwshnvImC6aOgu4pu8OCpP3bi56RFaJSDTA0zwaQHIAxZ30kXpgIm9MWzRplPzJLzJsjslt9mFkWR349Pz6RWZyflGFNQD4xtEviGNYHzG1ksyBpAOE3jxbqa8XA/aNDEjrSaLfcCjt6HFOxF3jZG42Xuy9fknZ7WRfKT6GQeLLycMclSb7k5Cj8wm8nWU5Gf6r3Cum9IdE2OO5eMLtUWk3jEZBLGquBkC9J0ajndNNTvS9SHp1D3SYjgaKpPDIwcpGRn7eUqgQ5/OOrDTugU93usN3YsZPeu/aTH7yZZORpfhqguxCbSYD32a1QM7URby/uMKSuQNwQRIFtzz08WBoX5vbiTBImzyjTGFQfkNBBXuPsBhcNEoB0Yf+vrvnvq7fPvmEBL9Zjdl6eentq6+hjJ6T19u7Wy/JWo1RMFZeONpczT8/2cqxkLC33RBgZ36I14bde6W2t5URoxWW39CYUNS4pkkJzUQnVPTSuejpX9b65+DWRBgOmgEQLgdRl+51swoYPSlerB9OaYmnZQ5kNdwh3r9uKdzm7tjf83W97brsCARYWUQxLSNcCDUFUl6ldmbcxb42h2ojqPh9MOJFHrP38FCzx5jas+yM8gyl15G/I3qGQCbl78PQjpADzi+ddKfHvJ3TEVsqKtoa57+3KxzouvKzt1sjT3iiDlE/nts+Wtg7XHlaLsgynoduQRUUDfl/IhfUbV6wADF/IgrsdTlunvVCuqyVwcxLMPyWF85TSJbW6OjnSnIACK8GALZcUn59x4ar7yFCqQca33vMW6L0EcoRoFGrBw4Ol+MpX4dMrsiwPxHmWRXDPYus55JVdbdDbm95NFiKVcCN5C4IwTsw83MsI6ARkaFkUXVBnsy7yK1CFLO23mS2dBHJLuOvi68rA/VMJnQkHpdRU2PF27fl7YOFrL18Cc2TymE5+AVXd+s7ewXXoZZOjw2OTN/NiFJEalLqTyGIMxMJWB/Kubh+rY0gNRyrJkhKSaE2Xbrw17l3ZHGUiisjrDGhQhGdoHhK+oHXgVYXd3Sr8CeRG0m4X6ZU1z8K9wSRPCDjehdDOEFYGCmvE8a7fjzsZCb9hMADQcfKQx/BrP70Hp5OFNXhnMZSf4Sn8VJZGtQfbQ7OjE1I7FPcozV+jFuq/EeM/12sBH487EJ7Cy97x4mWt9ggyVUgsdkHVlJ8e7dTra3f3hOmJiWEZbXYVfnMMq1BuZ7+lrZDouUTIFIs1KxeLpVIUkEsSK8kSl5K8a5verzZHkl9nPImQDDrMxwIIv7vX6iYjFT3G1DEOWZ6G3rsT8mbxaw9mlvfiERgAEZUE6BiGxrQSjw8KPhqQ3r0aiW5Pm+Nz0hI4g7zzPlyBP939latxVwgqOApos6jSaFz3mMnR02m2XLpsgu7xNWuh/jstVxs4WQvxAQvDQeD4icHT4Gu3xkm14vp2x3tLh6fNtYmImJzwRnnDQJASwdBh2boxQkyoGuzWB/LZUjolIY9T6BJHl2gJRbv3+v1vzZ4ORUQe2bOPUWgG5kbBmN8JgC0mHGOGgegXQcE5rczXNq9/43SJC0Rg/cfTeIcLHDg9HpvdzUQ6D6xbMttuYi5lhPZ229zJzjYXZ+v1kbeWNBrBwUWoQHD0FXhFZYO2y8TBmJC+3Rf//xK4v+zCEA2dxYwCmbRc3bHDjgtAHAEeP8pcCYT8e3trS965B5tewfsOkxqTPC4K7RQ0YfJwZjaR+0rmFIA5ivaYomIqQiZdGAWwl+TI5Nj9tTe/tXhN9CdEoURzgAjJFfH5wursIEg0kMJOn9WYYvCt3l168wczEVoMMKivb0ZDLCRsLopYSvSSpL0HAb19x5FNmGz9ZKgNl9zuS2T2FzPx+LWVHJemSYAA5wqXKOhcUZo7TNC/dRlkv/mN/8sE7i9gR9GOe45LhxIOlh4bx89OyJu+UX63HCpvgZqvby5uz6xW73xDnMwMgwaXZQ65EQopFM3mzi4zcmIz6BHSvgtbKUkVFFqROLogh2S5FE3eHh5ZEEaqXoI5HRRdMNFPsFnsx0tAj4X2PmqtfmRi/T51bz61cAPDRpC4Er9uiiMUHBtzwpQfE3ZG49zQPOIY88oYOkYLFSN0fn7l4bW4MDO/mYoyCsdi5IXcdDCvLEaVHN3YLAaHAsut10cD919puZqhqiEKi66+sPvkaHUDgtmN3VqB+EtVVHXpbPMwd/9gZQniZ06W0dQOEX7VZdDcpoEeE7LwHrIQe8pqTYCrkRS863KJk2Q6EolMDsebc56FKkPBoxU5GTIs0RkDLjF0bKHIwoprDJvTc3vCzqIwGQi4oNdJolJDxsiiEepGxuEg2Z7B3A8YEy+G+V+QTK8msI1ZXL6zKajC9eo4nRIZlAohRoRYC3Gd5WJuyK8NN/hu07lXtJPz35XVGKj3Ovqm3va96Fgnl71WQRJfKumwB54/O15aWts7VRjk5QFOloCnvz/Ps0F0y+GyGyblG4o/dER7Y+DkSrSMt9246XAgG/QMrcSX9oqUk1ZkhZLhNkqDmu23+WKsM0+A8+f2hjIrSzTHR6Ce9zE8QBdDoSyMKTGdbO1p2Y8AdEOdS9gBIoWyx3wgZJSjh0OqIFRnZYZR/HQgSiPXj9Ewj+GyNnweTWFy0U2W//cE7i+qNzB0JryuYEIdGHx7e+PZM5LBV0p43iWujJmW5SPYPz5t7o/DlygCg08ZHnScRAcLMdJHARotqssCPr7byaJLq1RKMi488j5FRgNOWFvQ7i9IrrTLp1GshHcdgRlkesLnsjoprnqU3jyORshoGpizBM/xyMUgdbCFux2A3PR7xyFjjtHI3xBm7EE858VfHWH4eXtzLA47/6TI0gp51JEOcBVfn6G2x9gKRJb/z3Xa39FJA3SCuqXP7fCdPF/FbDJX29itKOiWNxrq9tnj3Orx/mkUDr5CFO+uR4LaOQhO3dlvwG7YzJjRpzdb/JyeKgFtjmY4JSpH6AinjVfnIm9dg6cTS0ucgkEiiM95iN3yLmrn7ni9qrI0S7Ju3q+gLIeukixPu9UHhwFkDfgyBLWgY1qDx24bhLAxW8L1ZG+2nspVlz20xNOJJKnQaER2kLYxu6PvcjdhcxAe3o/sf4uhQ4scvp+2vh6E6ezT5ye7lUaoUVYKMJGuYJfTZseLw53NFfiAgVZVdElUNJ9Mi+hmtm47qafgEmu3QYwVK2klDrccBR4hZ2no5EevV7GXLeoKMZLoD/poFp8YNoFm+8KpsLCqsECLUXg85KWYQvpqTit6A1PQJiNRbGmju7sI0W5MHifcQUyjUqnmfj3lvXeaRkhRpgOuACnUYEKCIQa3A+36VgsP/bT/lxbqvz7k+ulPXjQuq+NtLEgHRbeMuL5R3qiUauXdSlHfWj07zmTmHpyCKUsLHFvmXGWWAmoxpw2oo3hGMCUCDZut1xoMaXqZk0MSMnnEeYWWIp6ZhfvDazcokSzI5zg2ESrgZ3v3Z7cXpBIdUkQGHVyOxQpW+Dv5odTpI67S3S1BFMadCN8PLS6OE6yrOxELzT0cSamHmxlkGCwHnp5C+5U0ZuBwbeo09+EHUW5f/NxrrIH7ryR0iPCYaYd0Zapv4/h4a7dUrlR2K7VKRa9VtPra3vL6eseD7VzKp+iynOb5gMyg5QorsCvmSy2nPgRgpAcOd0xSdcR4uHpUoD6mlQjU9CPfGX3zB/FfikmPIuZlzB4kqwve0yVEZHRQMcPAgCqnwJpirRIxlIa2pad9yY1OrAXO/DbgTfrmTviInOVSY6dzaZm4loZcNCMyhUqlgBZq0HTZGKKD6vHK+3XaP2borIigsJu57Ji65Vt//qTc2K08quwWSlKtUioKqx1Ly+vv7a2kNFUBB6NguJ8DTsSarb+rk9ipQyGPXpgDRTsuu9qoKArEFRgI51GAK4M/qc4Nz/8Cm9Bd2hge/OWDn3xrMccAtABNlBo83OCINB0aOGAO5eKr3kpXS7XhxkVHN60r4fTL1bs7wvBsdSjKMRyF202RnxoiFgPUlLFX2Yw8//9CA/efJ3Rg6LqQzTluIcRPxXaOixu7u48a2VK5XOGkUqP4kaPD9eWVh6eywoppj8Rxhi+Ay+832mctEoWM0RDpZIzTdchpKhwHUhb5HB0ZHby68E3v5g1/MspB4bIy/OP5SMTP4c5D6coCdgqMStDdS5qtZHtaT1sd0xpWIiSeD31Uf951eGczJ8TnF7xRloH7CYsfHBUk42lZN+ZgSVzHl+WTn36/TvvnEjqw2p1hzBZCTGWrPXuq7+5ubDwq4abDaqjRgCNZfXn7bCVDS3Q0mhYVKFRxySgonZ1uU9tSDJUVEdcHC5VGI0T2PJUiHC4zNzk4OPjNt4bvN8cZ+t7B9hCManHDDaacZO8sxYOOwWSj4QSHQtDop4Fm7ySSdsK4JtCbTVDqyv6qoH1jcRkmtS4GYngMK7FQ1ogQVDmQBpB+GhiZ94n2f6XlCg7M5EDFA6Pl2OHzC1BX7CKj2yhzZcidG6dnj5eXTvfe8tAM5Gcoj8mbSokUL7rxMgyQxadgU0xkh1I4li2nFE4pIYsPKAz4ueRYaqJ6Xzi9uz+/VP32dCQphiggHqIZ0vhmqWCviQzJGve7E6flKI5CrWX4COATzP07pzPeTHUkSiSTPFpxLvJ5CSG8u2yWcCfqetKj/z9VSvwHCV0PjBksjj4MmL698fRjW7vvbpQrj97dKNUalbJyePT8cHl7b3+Hh62YokmYCcRFJRtZfW7I5hDfARn6tViD1RlE9abBmoQmn5AQF5Gxbc/zrYN7Oe98dXgSnZUACBkOPxuyWR5aV+wCBW3aspQwMDf2CgFxHCKISri+9nANqxvvb+ZSWOOAIg2o44mhSefc6UD7Fbu4LLjn71/zfznGf/KiqQtNlFu3pvqmguvHL16Wa4/e3a3s6rvSbkjd2vnI9vLy6f5ZkdYkIpygwcm7EgnRhxBvxbI+YzStO2zrhGGNzyWBl6VlWQqhG4+Gu4Zzbe/BbGBSFHkiR1dchQK5s/48BjFIZCeJwQDOJcO/Ako8AN5yBbOnzyCsEZZWhkD6iAEKPDuchgjTTisxu8mEoh4OCp2m18RT4n95jJYrNnWELVO34DuJTjvpvb1b2d0gJTtXhmPNs7XD5dXqr08VoBkF08758mzIb3exeVCxuKPGphxMxHeCl/UVyhJNiBpXiFNCHkWGL1E0EA1g9Pgm0nraL3LAjcJYNBHBkfn0dtd8AIGdOAxASQXA884gdXpnRBCGN+8Nj4l8EiVeiA+FcNeBeSF4yYyXvPWav1+n/bsxvtdESNm+MKo3xPinhJN9VEag3w2hfNcPN3eK6zsP9lVKge0QLAhoOQ+XfDup3vqxtNhg0MxmCzJxu89Ha2XF4GgYGhm/jPKNSrqgeXQBMo7UWrAwsOBJ6Otqjy8MGGRPNyYSbc6WGywcBop3m8up9OpeRvLAlxShHWk/yQRYLhSzAW1Qdijn30/g/rOErssyBcvJW7fgUXRyfPiyjHTu3Y13SyVkdUX9yXuZ9fr9u5sci4qd0Wk4e9BuiGowztKLhxmiV8BokD1hEOUQS3KKUoZSUuEIVUO7UKEhtrsgkYEPHLGTg1bC/ErrarTtsDUMA06GOiZvd4urd+4Pe8YX51OCn4YILsAyIpl84cHgQU5FjpmI4N5P4P7DGI8N1mQn/i04kmUPn6F6A+iPIK2RHjXKWyfPnhYzh2tnEkVLHpmXYSRN8xx05kjogDpCdMtdH0InEGmsVEaE50DKywwHLgbHBcTQeMn6g7jmxuluY25Ioq6AaO8N2tyJhBt6CXntAPueRlaWRj3Ei8KPOSUxRNaocTRZhY8yrQeyO3hKvF+a/6dDEQAcHPitvjASutqz1d0G7vojFHBZMuGsP6m+l8mt7u1AG5GIShQ6ZHKI96NoB1WDi9tliNrIuu7ObrcvmJWQ0OErGsILL4LAJRedoiCecpgQE1o7unsI004Ktiu9/UREBXkzvn3i9p1qvJhZmYPvNEWzAD2Ix8EP08cQ5SYx3WIiFPD7/bT/Uoy39BE7sh5zuM/XeHKysYs0HvcdEb5QVuo7K5vLxePqe1KKTjBcCS4+4FFpyojJ/QPdrXIbqle87ragj0tLSlSBvBLOogrNh3gGU252Nz5Y8H5pL0Qntxyvu+HXTVTtiO9BfnXxaKmYWZtLKRDAhYhpGeVjCR8DBs6CuUpiHYi9XRffV0r8jr1za22kDOM4arEKi/ZCxe/RU5KaMadJ43iYtNGkDCG5sMp4VfCmCQtTBOeq3oTkYm7UiwGFQjthAw3ZFoRtbXHZDUtJ6UXtQQpbCPgd/D1v9Rvo2sM8tl1E05tn3/d9Dv/DvwarEf2AeGyqPpUqdc/Oe4MeCd/ye/v82Wx1L3Ywh3nycPaDL4u5ZiZXM4BEzdlaRUM2RpTdlLQUTr7gXs1SpvYFo1uueZpzi0mauZQtJ+X3X6nCknWlOqNqdsausM1N27z/41FQbZytUQPqQlQ3c3N5ku7wO96PlOHQTiptybE3wj7t32vak4k4ev08zgCl+wcHf+73fMcbUMhT0J9XuxcjJ8F3Ixfr6HbmjcXKLFPZvFHJxs14ekaV8RGSzlFMJZmx6IsfGLIkyTfhNZomeCsUOpUOLFkXdSnFeUEv6O8tqm26e0871VawdumJhFHeEBtVHcSd41qmzABlAicjuBAQ9S/DasZjSSjtZVT/EqXz10fljh+Q+x6LV6+5ePD4eRA8fLpZ0z8tsojJaMYHmZJJYtJgWbniCbFv5tX9CEnB3AfQ3WY1WnthoZalAPvbDV925gR9nnCVsqIrYdrtH9ca1dr2WtebQ2CAFk1GMTnbNmE0lpMiTZWKoB1+q7T/rkGAk35zjHMuN3SkXF8dDHe3/I3Bn5z0nqNWp/PHD9bvHxw92zEyS9oXjOAyZiE/V8ibDFanZU6mJnSk85MI7q72YrEC8YRzPpNcZQWquDJqHkOjzQBOjrlYMcSx58gcXex0G2dPdppNDbErjWOuAY0Rsrr2KyQG/ioBihLiSnizE/92HT89pZhvU8nYamn/cLjVY0zT93Htk6gFD05Hhzi6FpEhqC1q+QJjVVpw18xm45J1RUyfVPKFbE3o3mwTxsMq5QLIN3n3+V9IufIHozcXMV/ynu88PbsfdBGNrmXymTymvuqQu4Ru1vlsDNAk2/87yDx+AaGadlac7M5mplm6lrqvd/+UIt4BGtNsOsWtjdORYff+4YNLy8ildaDxFgRCEiROt+VkBK++6UlRDBOyYvY929KllU9EFNlc3f5kXB1zJSRipmHHmrULLpDG97/v1rycxegNcozGIXccw82/D5YqgVg8asfjYZ/2H4Vs2kmeqPSCoEykB8PXOeyuw7PeLFpu091qjFy2vOHRLytpsVyeq7BX43rnaecan6FnR4+MBdx7SEhmTfTjhU4lNTvBUb8CtGPTwkKNiJc+NLXj33fXG8Heg6Zb4SVPM4wxwUXbGHHopXI0Ck9JpKIj4aD9vwvFhYklpxEZGk/Vo/H0/tmQ6r3vU8w5lHRo1hxcjG6xgfujNpexDADQvMIAJHTVtSuesdqlcNxx04kr3iv//s9BVzavsNQp4ATWbgdP9trB8ud77YWczdA2YwLPQcZEF3hzEoiOrFdYo5bDPu0/DSE334MPCBYqxYOaNrsyq+kPBj3H9WnbgcqfPh9uNS6f7uSsBQM9MURjMkYhu1Qo5L/JfogylTRl09zz8IaZqAjbXLEYBF3HAI6rXSWdnFdGft/pthoXfywuzlnpDGOcEtW6jYwIS52YgrlK4V6+986t1v67DvEyhz0ZwXM7jqUPZJj9k6G333M23L5H484ebutg5DR41Dl6FdMMw1KGSPk8fTtzNExO5Y6fUIW80gnkDxWKiMrh52qXEA/c6m9rKw3v84sak1vDFicGw9QdG/KxZcKvTfJhPhQSV15IUNC9AzoeOBX8sHpitXS+0/Vo3DjsPbYx5N87fvW02+08rvpg48h6oYDKo+CpNCTJIn9vYZTQ0JWs/5VIsEq5ynlaivaD39tYCz3oFJs5o8n7YGQQ5BfPFV/DoicCd05tzt8I+7QXE4KTFoH+ssj1Y+fqjI7u9wbOvjPwvT7P+36zPfLqsDHc297iireWYMPAI9V0gDE6OpBAoajhSXWUUHJDUrZLvj/kG+gj+5XFiwfd+erR2qLn2BY8RPiIqIPaliUFHFN2PiT93di7YZ/2wkIR3wCj4dZRj4KdbJ2c9/u+0+uTcNA1fXdjdO8wGF4+PqlovOtFgc8h7KXxsM9kYZsrOBV5I+dK8jlCZx7jLVecxHQ+s/nLbqt1+PTEM1zXhp3maqaLXLdWsWA08kmChyFkHr/YUFsY0o4rDGVdou4HQ6/f56Q7PRAW+36z2np+ORztjGy35r7I6IagIqniC3oWjxBW5Mqnj+Bhl3MustJU9+kleczzK0+2q9X5te8XPK5z3dZdNGfsimP7lVxWycdGqOLK46Bjwj7txYZM6GZ4W+WGTyV+LXnDhu/69G/9fo9Tb/X2hxft0YPDix0brZ/mrKW04LKG+MLgozR+9ajLyFx55sVRkMsjFmSmF7afdVrL6087UCMzBZ3hW0Z46lDd6NOknSfjUuqHuMf/IdSEDuwqfsnvr6bidadxsOHLFmYAUNr36dqrR8eoC18eVV2KeLfC+FQraml9KY4nw/ukLxKR1dhHSmZIbPOARC3lOz//8FVtfvtxtaIv5XD2s23HdZGHMgwLTqJSdaU7v71WDNc9XhI96cn3kviwAKRLlL2Tgy2fS97p990+x77idUc63dHDo8OKaxk2/9RM2xJh4KXseyiScbFHkmhKMIFTdCUGMpW1x535WvvZcbE4Zy4BsECSio2aRb9WolmIIvdNhLjH/zOE3Ewhxo4ELkyccXznXE1qAM3uO2zLi7VNxvHB4VEb1+N0y9B0cs73+/Gs8kaNJBH4vNKB46swt/vT5lfV5c21LxY+MHRWdJ/OkXRIqDzq78ekMce0j9I/LOD+17giNwNzSaArjFxNpX2yPxg4g77r06Q77qIXvHqER//p5XKzpenI9GOlAS8JIbksbbk65WxQ0yI8g8vO42+rNVzZrQqwSbFDzX2tg6BwmxkbAisb1OkYOLqxUGDgfw5kxN96Nzk+MQPEAhJULOsdBGoo2+cHObaKrcO9zqPGweaxkdcrUB1gPmkaShT5Avh4gM0z+SVatVLJ2AYd8/E8br1GgUWN6EPNMtHJO74B8zgxqSAYE7GQuHItQrYwLDeTsWiivroaL/WCUW/Q87X+wHUNzWcNs3t82g06Dw9aRiW3pGs6wLgCXzmN847MbNosmRubI52P5z/7YbMhjLd8cZb/iORcRkgMWbFBxX5EBjkh7vGaBHc8Fr5T0enVaDSZKMfT/fYokzmGdD0UAgDWbHlICwf31087LvJuSA6I7D4dnM7fgKVCGoGpoyfr2Ps+2PzYyIgWmJnRGcKBjckY+eyqgHGjwmgMC7jrFDTtEN+wWyM/RNx5dPJo4JuOy/3uMy1vNjeOX+1U73fOWqLYX5hbyIFvZDKLggUTuOXfj1aWlz9/dv+DOb0ESgJ1OcOhQ89VrFIyFU3E+I5ORMIJ3PUKtWkXV5jJhEQ07o8O97neqbxt37V9UO6jRzvtIDhrGwVd7NUs5MMyuHXnC7PtZ53qo+8uHn7xBVc/aBnQlLmcb9uGzzoNix0lMhQJoa7XL8QXZozmLZUi6cl6srRxgCqVsE98nY2J4Xtbx5ftYKWzu8wkHgKaeGAWWLPXftgLWt3Lo9anlgHVHIVozYGvJPUbZi4iN5MCLRENFaKuZajB7DjwOTKVkHn8wbkDOt7taXbTMRzf2ur+8bzbDnaQ88xo8JnyHOyFh788rC7vPg6aCwjBa5plOraZ52b3UYsUse+ZCcFFh635dQ1p2pN005EYQOloPZnuDj3HsKV1s10ed8332pfVRrC7Mz+Lj48Y6lT31pD4/H5tOaeq9bwGxBUkZd7x/NK01OuR6CTNWgh1vcYhm3bALARPMQWdfx40+5TwA+CrLofe7bUOO62VzsOTImYNFWP36VkjWBk5Llpc6rzl1PaalO2+kUsKz4nfQ8pjt9n/9haE4sIAqYmi8LRK+2b2h4+avkOQdJ3Czvcaz7vV9d2zoNIsHj1ur6x8/7STK9Kpa4XcnCkpt8FUm0zZU2Bdwc1G7q7Jzo0J1bS/NxONofHJYa/bj4YbVh+dbx5139Esq+kdn3WDk7ORzQc7wfp3e58vctMzZwf+ZgvFWYfZmERKTDlqI+cbYuBuQkhBNxWLTifEJptZjRt0qeeEkeI6fLmW137OYPb0dKe7vn0RLACnsTjp9OcaebdYoUKVlFX7JHpDb4R92s2Iv23aU4nVVHR1FejkRtfrI97JZpwJHS1cs3ayvbO+0j7dOzO0fEkz5/hpmyTd9TNmeVpIL1NEKAp2k0I5N0ciZDyh0u60Wj2f5ZtD2tmN56xm7Y9nT376oQFVqVDipOv5NGRGhwcAtXjoq7JGvasuiTc3XmHTLuCKRD1K0tGmOt/ok3G55cV2AQWS+Z3lxdl0jkksAgaaGbe5Cyx7CjpijFYNvMTdsbm+NaE27RHG8dF6KqrkarrMZWnZGcIi5C9waA44UMlC6YrmqDtGrsw2TVy/ILmG4s03MqSggwpDrx1BbL9cdh9t0bz5mqPOu2ODo3FNFEJLmp1zKNpzaSX1rYQoJsNB+00NkREX/UYRM5iqJ7Le+b5j6K7gn6Cr6HlxVRdPduZ1vitkczT9p8HER8JjfoND1GoiIhSRwuqUnDpbG5Yr1ZwNicHmB225w0l3LVRd2azQ2Y/HYp+EQnA3O4BO3pP7PTJRT6SSqfh+g6kshx10pCaZ1yX5TgWoK/xn+ObIR4d92o2Pl2TlmkRtNDqRrDOic+Ww06/7pm66vmm77ODccqqcjEbxB6BVu/dWyDy++SEFHVh1mchzfad+9VseSbdKDn05w3ajaY7HUinSLb15yFW6JaG6NxEigN4gajVpf8tj25ozHV/mdJz/qHTnsRDRfqtCJnQU8ROMXhAHwjXAaEFINP2m79Zlf0oNN0XK74XH/FaFYOi44dF/ZySfiDCr8ZoVcI+phGQ8FRWaeigdc9tCFXRU8TFVyyMvbFd8Ez1xlfLoRGxiLOzTbl8owCyoGoWOYCyfrCP8TEQlJkLiyi0NOexTTGAIQmCuq4no1fUeTl1vb6jujToeG3RJfop0M61Ljb0ZTl1vcSh8xQRaYuqER6803unTwmN+q0PhK2jYxycAU5H4SAhvvgMhFr5kPTJJzqHDhOOYuxGqe1MakWOh5/HdCUHH3xu798Y7b4fw5rsT3PFvv/32a+FjfrfipZdffjlMeRhhhBFGGGGEEUYYYYQRxl/swYEAAAAAAJD/ayOoqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqirtwSEBAAAAgKD/rz1hBAAAAAAAALgFypmmTwJaaUEAAAAASUVORK5CYII="
+IMG_NOVICE = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAMAAAD8CC+4AAADAFBMVEUAAABBPDpbSkRFQT17b2pVTkmulIG4pI/Q2c81ODtsZGBXUUxJPzeXjIKWgGQ4LCRkcXefiHOOgXUuIBjOxruQd2UlFw+RqbQxJB2ahHHBzctlZGJ8kJuRgnVkXFeznYZua2hSTUdHPDSYl5a9x8itt7kSAgEgAwEYAgEcAwECAQMHAwMsBwIXCQc3GhE1IBg3DwU9HxUeCgUxDAMoBAFFLSMkCQI6JB0MBwcMAQFaPzNUOSxGFwgdDgwoFQ8qDQQvGxUvFw9BJx4wEApMLyE/GQ02BwEqDwoRCws/EwUnGhkjDwlIMilPNCdKJBQzFQklCgcXDw9zV0lJKB1ONy5FHRAkAwFeRTo5FAstHh3+97pNHQtqTT4kFhRRJBJCJBZfMB1TPDP7/MEwBgH+87QyIyFRKhpVMiM/LyxhRDNXKBU9KiM9DAIiERAdFRR6XE/5+LtlRzptUUawdlX/+MBcNihlNSJGNTL+/cZxSjiAY1T+7r5yUD/Cg2OocE9YLB3ur4RhPC43KCe5e1xjSj+GalxqQzP9+81oPCf75KvLjmr99sf+5cVWQzxFDQKEb2X1tor+7LJ4U0L+782mdl1pMBVaPymJaVP48LRlTkbhwahwOR7+17D7xpj/4rlaIg19W0X7zKr72qTbm3f3v5J6TjeihHN+Z16FYE3SknKQdmeufV5kJxBXGQZdLRSZc19OEwSjaki0gWecemd3YFeaak/mp3/CjGWEdm6gb1XsuYyTbVVuW1SKW0Z/UjyHVj2Nb1+bY0KpjnmCSyxwRSlpVU78z592SDD317z/+9eYf3HEootoSzVNPTqSY1C2kHqshnCmgGfjuZrrv6G3mYLIlX6PZEjPoYHgybPisofsybHXuqK/nIXCjHPzxKXLp4+2i254PyiNUjB0MhbPnXC5hl3bsJdlGgT10azZp4qAPhuRXTraqHrRrZXvzp+QQRvn1Lx1Jgnrw5PBm3ahTSSFMQ+nYTbf3MXy5L+8f1Da0MGbWjK2bD3QuJXErZ3Rilf8vQJDAAAAJnRSTlMAC/4b/i/+/f4/Tl119viTg+Li0PuG5t6zp+SqrcPo0NO+2XTCnKSQ4GMAAQMCSURBVHja7NgxasMwAEbhCJOG1sbgQIZQQu/lUeQAHjwYdAAR5KVoqMiQsWvv4E1kcAIZSh1oLpA9S0rlXqJgv+8Kj19ImgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8G+EmGBcRLx8fiT7qERJdmrmCdVHJEo+2rprsySaYCREkqZf1nanlOpjIeL02Nmgaxqqj4OI531zra39fE8XVB8BEb8dr7W1Rnsfts4JPwIiTg/fdX0zvq/ut23D1odOxNkxNN8pY7QxXuv6lFF92KJFczjvAmV0ELLbet8spxMMVrRoj9edUhulKhmyV5Xxvq/O1gdrurxc7ju1eVWuqHpSltr6288DWx8oMV0e/ppv8tzJkFyH5qXx/SX+YTXlS3aInlaHdquUci7Pi765rsqyLIz2vu5OLzHVB0fEWXPeKuPceu0KKUNzbULzqtDeenufZVQfmmiRNfubVk65IJeF1EFVyrB5o0P3bsbT7Zeds2lxGgqjsEVmglUGunDRRfEv6Fa6EhXc6EIKkkiVEBREMOBVIkHFhcZ6RYhFDKKtKBQXrR8ICrqRIoOtCxW6qFRwoaCI2FZsTWkdPe+bKP4BtZV7TDPjdGb1zDnvxw3zn2kuXa8vhZ50Ax1W1wGdnc7QbduRqOydedXO/VdKZuYrnWJDSjsIfDC3bcR7A0438Qmynke3dqueSS5T+j+0fGWmXm9jNAtt0wZyXELA6QxdgDsu6YG6Vk+tVBH/XwjlvDLfayDaqYmzbZ2YS4HNDFzuSMeEhCDqX5fqqrD/D0qsSNebS0VmbkGBDebEWBJ1T0ggtwk6UQ87rWfppOriZ1yJZKZS/0bMId2ydMg2IY/kkMdNlgPsWNO0tfmUoj7bmludetHqNbwwjKAHugB0yPFgbMxqpgD1KOGZeqOnaaqLn2mtSC88/3a24TJzuBwVHfsYyHTQvcuGtNnrHPG6zhFPe5p5FfEzq+WrFl7UL8G8oR0Qc052gk5pLj3Xkw36zOSAxzuQw138krZmtTL7LArnK6m7rbYnQ1dgJ2OhntvMW9fpVrr+Ubq8gHcAm6A7wsY7HjI+/KZpaXUCM3uaW5WqVF6HDUp23yfmdiTyu3ALo8nkqM/jukPuN1l4jzLAQz/XUmafNSWS6YX6016xGAaQb5Fgc2IOS1v+vcmw+2UyeqALz0PC82bOiVIAkh4ej1aVfbYE5Knnr3gHJ+3AYgVIcAhcA6twZzgcdAfdyeRtQUrgth1GHkPnEzjM7NoalfEzI1rB1TtPqJrLwAVvque4c78WmDqivTvoQ4Ph6Pui8IixjKALofOvBrfxPTR0akE3E1qeTFfmvyHZsYKz7XgLx8Vapynd8RcnQ2L+BhdF/CfezqGfi6FH1B1u6C691tTDFdMvJDs9LHG2IcOCLgJ07eDNozkNZI6uF16OJ124/F2/Cu4DUH9ZksDusEyJ7zKpCjg8tPc0VdqnXYk5OlzpnPWkGwYkK4IuADEQjuvKwpnxeADk76q1avVd/0O/Oxm9LXkS0FkmvcjqtqDFrCx2KOMV9qkVIV+ofwt/Itd1btp1SNCxOSh+vjP8Mui/A/NyrVwuV6v9fnc4uv85Ompl5rgJ/ISDSuDYkp6fo/FNdXRTqURydYaQSzAPWBZJZ+i2GTjCLb0dx8xr5ZphGIS9P+CId6UHgbjEDdAZOTXytI7HYlZhn0JxsFeWeg1C7kOWb0XJjkUbb1l1+engcNhFtNeg27cBvVaD16tvPoD628uyAejRzK5TRwf+9GOSdjW9by3l9mkTu7y51Ct6XgAxdGKO5s0V/BScLtyPQ9icfE7Is1kje9so12o3yexfhqMzi27s9bio8+iOD0Rdhr0lFfJTJXJ5s6lhGeO5oV8A8cCKoAMe0OEVuIsjMIfLCTmYA7qBy8jvy1dBHbPb9yu+wE5GwuIeZEKc71ISdpra51tr0kk1t0+DEkkgr2vt6AS1QNCDaCHDo1oA5qbwXwJ5t4+ePWbOMrLZfD7P7RwV9nsFjniPxDtZYk7sJQTsbZzDKOz/Xom5ZCbVrAC557rkcYJOvLFp50mNUtqyFkfjyRdO9ts/mW/BK5fblIXZuYsH9cn3KOJj5rE472PsaOlaWNeolP+HQq5nUgtNDes36RYgACfoAXp2UBcktOLuy+EY1Zya9lrZYOJbtmw9fmjPlh2ADur5fRzxk8noYwlD2u/Uf30EfC7uOIhRg/s/E0yOhr2JIa3oyaBwrcDJXrB8ynY7oDNUAbnyClfzPif7uXMADhn5Q6fOH9mby+UAnbFfoNkN2K+UgJZP2SGCbbO4wkvHoT9Uo1FxV3b/+1qejEzeLoJRCchZPhS3cBBB1/2Pwy9IdrRwBkyOaCfm2eOnT526cevAoe2bCHtu69Z8+UKf+7nJx2vCg6Rk6AwbYuz4CgUBpzzZfbni/teUWD63Mp1awCamR4+5lkCbqXM9B3OGbtoBqOuL3MBRNQduQD+3H+Fu7H78+HjuxMO7J3du3JUjGXma2CPs3x+43K970uEmkJfxuOLs4Ecqw7amuP81gfiKVekMkLcuoetyYfJr12KjRzYPgNwCdMfUdf/leNiNR3Oq5PvP4b7fOPz4cB7/23ux8ujA+u3rCHoZIuqc8W8XXdmQwM59HFE3Y+hRhHhU91Hd0cwr7n9asDilenOhonXOSvRu79+DOaDjH0PH6jXQIbK5pbsPjo3HXXb57aiWZ8/hlT98+rCxf//+zWv3XL1bebRzw7ZNOeN21MXHbfzk+jUXzGlaj0/nCDiL6ZsOuKOZ76C8g/vKOQX+jwgO/8Hemce0WcZxXKNOnUfUxBivqDHKjFje2o1FaFbotTTalsA6qzUURSHFGnQccXuZuMxpGYiWo+goh7ghjqM7VHToDiAbsoa2k4mwzTGOgYyBAZ0oYvz+nvet1CsxRv8Y+u3L8w7QLdvn/f6u5+l2xfU3Un+GNy90FOdXVsLkUKjRiTidgiBSj2YeHJ6lbD7CCjgdiWwub2pvT5JzWrw4mSZnt393ul5qMlggATsL8bThirQuDOjQAbCfkEF/VhQCATSD9E6Gv/F/8P8GcDgctXpna/dcRwEatNGamokJgXiNmM9phwURnadZe6az5l0UcLA5iEPUl2t0dp3cku1w5Jo4rSwZL7NMs6Er4N//nNoK7gYDbcE0Ngx+S9iR2p1I3/kQuAvFHIHH+15ZbkdHCO6YyxfQfswiAfzl/4P/J3CD92Iy+FWdtYsunesrKCjg+Uo38cYlilVwQmzH2RgyZN44XC4it8jRp8Hpds4uT0xyOJIS5XZOFs6ZORkH5R7qCtRuAnaNxsSoBwu6c+jaJ3hWxwvvbsULekJw+6N4gTu+B/T5MDxm84sW3XbrjdcvvuSi///9gL9N+5JLFt8J3tddfXXtop+OzRTTBKbDPTE1NTUxMXEwCJzkZEIFx8TXDOGoK+bsYjIHc7ndDptbgJxVcJxMxmkkVk04p5Fp7Yl7A77OTTa1RmOBsOda1dREO66T51DS1WAyy8z+RPAMXYjI9XjfK89TqIflv8DWe+u1t912552LL/lPR/sL//JjfyF00UXEevH11994463A3dlZ29oNfxcXFxRUukcnwHuq4mBFBZAf/BV2MrkA/cmaoVkgZyV7ITEHZErlOnmao92RS/wB3ZwglUikUuZ2u9zR5W/d/pgVPbucKjqLAQ0cw05uH80nqzPqLMGjiRORs2CPVyYMj/4dwoM58wWifSuhv+0uwIfvL4Lz/1Pev3DxlVdeecXiyy/5Q12+OERXXA8R6uvgbVKg9fCxvo5KiPEWVLG1AswBPCgiLgiNWuaTNevh8slB1qQVQnKN2a7TAXRidns7RXYdVXAGk3TVS6uUEonVrJJpCwsbDnkWdX68SmkFdrnFYDIlplWN4CCdWMmja2fY8QHRyCdY09FCOZ7P5FlzTz08DWu/2DJ3uLu1ddEisL/xxhvvJC1mCv39X/R70ZfP9yhxxS0XX/zxxYI+BM5QfSjo4tegd9557bX927dvRygP1Pp9h+e2jII1L+Le09vbuwfauhXIwXweuhDcGXLMZJwVwwNI5Ziyi9squkI7ZwZzGseggLPoCmF0jtOYUuI3ffzeY9FWuN2otRfuaEyqrl302sPLlGjZTSaUdHKM6UdGxEp+qAYBnnHPh89xQ1Bn1RwjjwW/ON4sB/7s9DQTOsqZrwl9N3xfW9uJIvTqzqtJ1/5G15FwE3+I9apbrzmfqV95w08fXgygmzatW/fOpk3vrPtF+AqtEMEWnN198tiWjg4K5qBNuI+A9vj4+Acvvvg6iTE/SNBDiOODHYB0OrdmUFxHYN/BUrmdLE7SmVIEm8vtkFaXokstuvrSY61lNpteqZRKOK1dK0/c6+/uTI+SSqXYehMbuBERO0r5rbxwUPpZNowHdtAXoePG41enjpHEQyzgi/SLC2aQ7I8dxgiP8AfmtZvkIW3fD+ETdCetrZce++mqO87n/dsrb7rsh87t68rqWsqCamkRlhaPZ3cg4G/tPn547tiWLe7KAh6sK0dHvzxy+vRXX/X09AyRgsxDodfMQxe2Uul01FTG5CRNXGn3FJE9CByXIetlqtmFr2EHXZfraDk88UbeSU+RLVoK7KrkZDRzpzy+7u1rVimliPEkOk4F7IMC9vVTiN9I63SkRrgyIRE6nB7UG/yjPEQr1fqZjL2Y8Il/X9+WY3MnDx8+fry7u9sHtfpa/X5/bcDv8/uBvP/wsZ8WXXX7+fw+uituuuy7mWPH+j47cuTIaWhu7hgAb+nrG0WyRv8lZmzos89O90yTTkDTJ5qbN29+992ht9/+ACLoW0kVodAJOATkTz5as2dn29jAGIvrDDmiOC6OE2r2rBS5DqGevG/QWRyOljn2pExcXbQhSi2NiYhQJdvtO5L27vYt2r9GDbdrINqAwwFK0e00r8FJ+ucRt8Fb6NwzBe7i9s6TQM/cTujZnS082+wT4GP5dF7FEJ4DUR0dHTP4ZHR6urv1/IZ+OUEvPus7ceIo1NNzkunw8elp37SvH/IHoBKm+vr6XbvY1XwCxElvM+ihyIPBXdxhYeycBzfPjn0D5I0EHAJdjqTV2nW5mMakmUTf07mJJEd2yRz/5MR43pNvzPjrbHq9MmaFxMohtcuTqnf7avc/rIyIkEhQyzO30+lJYSR/7sehCSdtqhNzQIfmmUPM8JTgRYncacUX4X7E/sxXRBF1LPM3rMXYP8obHu5vverm8x36d8Wf9pV89P6Bz5k+gT6vw4eorvfff/8jSOC+i9QM4rgYcVzM53sE5ILmmcPrNb07x8YmUb2xaatWp9VyomScPDHXkZ1rEXI5pzNh47zJ0e7ZwvPOF9rGnZl8weEym16tXqY0So0c7bNnd/m7a9979emYCIkGAnZ2fBKlPDVw58C9ggf0J8QddtxF5qyKhxhqSFidsLwg8QePBtM+W1gUoCEPiR3OyRs/V9/v7zy/od8A6J/OFG/xv99FuOvquupEdXV1tbS0dEEi9HrGfP16RHZCDjHixFy0+QSoC7E9eEymZk/GLJCPibsqdqEjkxFxGSCnZG3INTCT41HQoChHr97eD7u6d+IdLtN8Pl8815LjUqv1yxDiw2H2wqpDnla0b48vX44gz7I7i/JiB/fNuW/ONW/FqBfhnYkV7yJ0xjzoc1ZosEAfIvI8q/nE7wrbgoKepTiQ1/z9bD05/Xwu5AToGK30BVrAO0RldWVMcDoRx8XC+/rmEyeAnEEXXA7mAvSQbg3ZHH9g7j3Ds/D42CCAs6hOMoM2EZfpDCno0hI1nJZJk2LQJCZlO/ZO1zzKu89UoaUr7a/EbvyEx+vyulZFPBUTG86hGpDnrvWgxfr4VaVEysxORy8aWZSn7E7cf3wbe6/ie9rzhSNZmYz470L8r4k7fyOx6EfvQV0nhj2Vw22bBxYKdMxQ+3YL/ibc4E3YIXidfB5M6cPNxFwM7aLNReS4DkJBm8PjzQfGAGGQOjQCrmWGTmbMseAMXFZWignTNy2w63AG0pDrcLR/3pvnzKzZVyW3my3yhvqDvNM52lLtdUU9FIFEbtZpkzkdUjuwb38vSikxazQY6AmyNIphHucyZjMwl38+n0IyVfEEnSQGdQaeVpDGRVGevC0g5p3CCxfzex6tgP7EG5k19WOT6xcO9AJQ9yCi132CZV5AHkzohHwY0JHON4vMAZ0E6ALxiiBz98HxjW1jg2NjYw0I6nZSsjY5WaZSqRQAnixjgLNygZx208I5k8GUaMhtym5vmQKIyoEGiy4iVppS1XimgsoCvzfHFR2tjLVKJAqVLBlHa1DI+1t3p0dZJRqzWQexo1bB3n3sG3A/9+O7W/P4TCrqSKAO0sDPRDcRu4gezBnjoJz0oofjDdydbIifV48OZP3ArtbWq87r4QygUyGHfqQAXu8KFeI6iJOCsZ2M3nyUajiBeTCh/+Lyt9wQiGcMDA6ODQ4OBpFrteTwcEWcQgHonNmQumEDuVxLj0IyR+1XSlpi+6FtgQkMUqYGqnbI9W9+rOeqShvaemG5yu4im82b6lJGLI9QGWWclqa2ez3+1s54vVRilGBGTwcw4HZ2xgZ+RzUPTc4299Y4HwV3tp0LATebyrME//tQD8whYu6H2FgnM3OipHxsbGDzmV3+2gUAfQbNKPry4tESkA6B/pEY2RlyqtopuMPpzOikEKNXuN96y13pnvpq/YGxUiJeSnkcuFlMh4j60qVLFTJNCpDnJpo4GTyOl9mk0RhSDIkOx97+muedlUdO4eiUK/21zk1ZcktVaXlvXiVfMFeds/Zll+vhpyOMRqNCBe6FcLuntvO1Nx9fHitB3Ad1fJjNJhbnqawTuf84tAfgcbaGlXW0sg8BOi/cIKx/KIruhD2z5oXyQYI+u0Cgk9NHMXIbDbR8HgpdTOYU2knrT0DvQvPQ94hTOPfBtyp6N+9sGyzF+w1PkcULxZocJieFhxNymRHIs7JQsXP4MqDLOJMZyFNykw4d2juNYMz3lDYW6nLSr8Y0zAPqTU2lw27Uc1ta2qtd8PpDCPESKQKGlsY6RfuR2+Mfx6hWYjRDwE6et1hQ2glTG2CfnJx9oRmlAg/H04EL1oOJM3mINXXM8LhCa/nQKv/R58F8DGpDePcvmPDe4R7tKO4IeFpILLZTWIcyYPONGzeKhbvYqgl6/fUKptff3rgTNfpI6SDUgAkMqjbAJs7h4XFxcStXxkWSyc1WIE9FXJdptTLyvswotSakpuYmoVPDFA4t0XBDo13nLfP4Pjt53OfZYEpsKC/9vMaZz09Ue9faXEL3Bu6wO226Zu/z7K7dnv4wOrpYlRHUITvI24PcR4i7QP77oT0H89jwlbpvcn1Qou3ZFbR+SMJ/lmJ7/anBsfJT5ZTTfec/9Mvg9IICsrp7tKDDj+2Fko8+AnLR5RkZYD68cWNofw6PC5P2ra+/+PbGWerCGxpK4fIqcjjxJuCrl8atjIuLhMLCIiPDgRwmzzJoOArsYI6vmCXWaHUqiLdv+3yOx7S2pGqHPbFo3X7fkZ6veny+wFoLRfgzU06e76srqna5XFGPY0QXERsTszJSodUW7kha27W7tvOdN1c9HYEozxF0LBw+xFZuhFX0BB4Dg9mdzeNTbiebugj9O/iHOB53Hi9IWKnGQy54viPQ3nbqVHn5KXJ6//kP/TuU72COAbsb6vCVBOpfeKHkIw+IZzDiEJBvJgmdOQm0N2fMoiGjP1Nk8NK0RIvODncTbVIYXaSlpHAZBjFZNGLnwmXJqqWypauNZolMqlS7rK61SU373p/AVOTgAbldm7S2zNO9pad931dHp33+tSmg3jDQ68RfGOjZ9onX69XHR0v1SklsbOyKSGMy9t/SXkaU79wUjw4OCd+MwY+ZM+MGx2OrFujBfgR/gc3YJOnbb2H6jM3jeybymJ/J9bC/IOERYEM8fMJOXIE4X1zsa28vP0XUBxYQ9IIO91sQEnvf8ZL6jRkv1BNzkTf8HZy+ffDB5vUZO2fRjzXA3RTORX+DN4L56rB7oLC4uLCwMNxBXLEUS7jZgNlblkEHIOCtClu5WiE1KsypUivydIqjeltJzfN5zok2bK6iPGvp3hLIlsv3Hu052u+rywX1qvKeSjSVyOs56N7UXoleLVmxImZFrGI1SkHOlFVUh/3fddiAB3eVymjkSGYdRzNfYr9DTPJAzsTS85mdw9PjvVOjlbwogo8gIEjcrEGbl198ctuhcohBP7MwcjqDPgrmX3456i7om5t+921Qfpc68vUQHoGdBw4MEGioCkqDctMSE+mNSJyMWZsoh9Fy/5IlSxh5sEdcR/FmokSemkDlugyex8uoQihOMFhTQNyb1L5t2xymYXlDpXKt3PFJS+DwWU8aZeakXcDu++iQJdFRWvqCm8+fOW7zVr/stbls0eoopdQqUaxQKVYrwsNlMqn+ufRN+/evS49atTwW8wCM/CCA16KBYCqEGPuqhlJ6WseYhNvAmQM7X/i+efPQ+AdTUzjfR7sGPE9VO0LBK5XT+4i5A9DHFhp0txvUJ0b5ymHKf+h56OQi0whQN5RCSQ1pKQaTxoyZCjM2+VmETHe23n03/SgMwFdHKiTWVCrdrEZZOPvv8UVU8MaVMausVq8h1ZZVndS+t2UC7prYh4M0Sds+D/SfPtKlk9spPOd+cuLo9Al/S64urXwkw52fP9NX3V7kyLE95n1Ob3tMGoXkHvsgigaQVxilals6Dny89t7DqxKkRiOqRCzhMq0okT0nPgBC0Ad8hP22tsk2sj8p+DjMzp7Dbu33zUNOvueTQ4CeDeoL0OluxPfRiUq+GYkPgZDF7tLs7KSmNCRsIGEVGtCBnUgZuhtipOfF+IcpjBKrOjUVDwnG7QpFJIWBJXGxUqnCuGxZhFKtNnuzbNXtHzkCM5nP10y1WSy6FG9L/fTp0+9b7HIt5WYchD2BTXx/WZa8qbw0YzT/lZmOsqSyam9ODur41Bx11NMRMcsjYlSoFSmLcNLUDfF05if+pceXIX9A4UQfTxwWwfqMvlYkL8In9wu5CrXeb7Qzb7T+k7Zygp4tQO9fUNAhUB/lhyaDNt8B0oQavhZZiwLmUC0JxU6xXaGSKPXR0alWM/7QFZH4X5dERi5ZEoPQa03QK6xKPaDZUl2pnyRNv0HvaTu1w4JDUrsDPaen91rkOi0nRXbG1uuh4Z6jR497XpY3ljaecfPF/Ggge9u2ale8S4/2zbX8oaeXrXgwViJV4aFCzZhsNhs25KTjoFf8m+COzo6EUED8mZKZQuxfGJSY+Fm1DwnMvxnKe2vXPiRzUM92APrGBQQdsZ3py7dG88cnR4TGS5uMvgtBmSiLnENhPwBhYfoF/z0o3ozSBLVer7ZqzLKlMLhQ3C2JjIhZGRthNUrwXZdBjcFqmavMdTKf3q5cvsNi2lC323f27HEwt2tN1M09F87JLe27er462h9wyNMsVWe+LM7Prww4qlvqvK41CTlea7Q+4vHHlRKVSiKNjaTScWmy1mxSZz23Jj19Xfqahx9SSmJiMSWIi1y9Ok6xUrWSuMP41FCQZMnakIdgPvMH+Q8OjDvfqmfQsx0C9IUR3n8Qq/egisdnR+zJRAu4hRAuKpQvbiJv6Bfi9z+okiYkqFP1CVIAhyKFrB8WhxZrZaxSqZCi4YrOMhS51C5vTnXOpXifuXOoakejfEOd33fyrK9dbuE4k0ytj7JaEzTYSSkvoZbdX2TKrmrcd4THKdZpx7Y6V7xtzRrvOpfNFRW9TB8tleB5in3w/nvuoSYxWWU2JUQ/tyY+/b333nx4lRIJgE0M4rCshiIhfEqilnI+BEAh9gf+8jPjTveuBQid9enz0N0FvQOlutVhIm2wDdW9oZ8Erc5w3x+nkixXJqjVCQCuEOIDYj19Ly4WJo+MlRqtRn1UxGNSb1JWUda6HG9ZdesrsG5zQ6FF97IHh21P7nLI7RqkhISEaHV0Kn4us86S9j5OYR71O9Lam6ravqK30Zx1VJfZ1rlA3FXnskbb9Kjlly1bgYkNuEcuCQuLCwsPV0mRSKJeWrMmPn7Nw49jfKtSCJUFgx28BUcJqAgYfWwLickf1arGse9zQK/fC+iObBbez2w8wGbvF5zH+j30L91878CgXHH/fQz4n+luXEK4X3L/gytjJRFKZQJkRRpVKZDC6ZlhueC+Zx55ZMWKByOWL1+ul9qsVmW0dENu2toUb6qt2ntpPpjXN2DavtbjO372bEl2odzA4bS7Xu91VafaoqOsBm2i5cBRUO/P1qU1NTZN8/i3neaKcqpt++Ojf+buXKObSMs4rquu5+g5ezx+06NfBXSZdIBpdKa0zXRKLWQadpLuFBmYRtzGoWXHGQjaaewanZQqLdVQJgawxAttDSxdaBGhBUIvgiXSFgRkuRVkkZWLCkfd9f5/08rN22f7JtCysDT0l+d+eZ2oE9I1WAtRpBi4h0s8hcVE3JdC0yNchNaneIFjDVtRDI3lBJW8OgIb+EEcJ8ccKmDqQAlAA+ANUFaGfxPPxhPT0ME8d7Zdn8HQV1YVzSPYINqf/AR5PqI9fYjDBnFZ6qMgUZBvVaVLqxCzF8G0Ajae+LMvvLxiWeG8JUuKXfxSkfJTfloQ4X6t3lmfSGjPZS+iiXH7wdWbylc29YydvHu1vXrT8oIqleZZEolH45zAiL7SvIIdR3/45vmzB9cvr97x2p4HLehV/2t9ajybiGSzNZYoZrIcJzJeziV6KVchEfiPzZ2LF4hcAexLUQnCCL/AOZqmRR0nFKpAw4aviAQU02dK3c+Zh5zSPHy2AK5+CayF19Yz/f3nAX0nJjGac8xnDPQ/PQH93vZ1F67/ek9lVQnEhVCffoIj0eHz8GMJvrGQbTdUqijmxLuqpOh5uOg4c4ixz6n8uS8vXrz45blLCuGyL3F7eErkWUOVRMtJNWebs/3Z1C8w8tixf0dBQUWq8+cnr17tWV2wsi6PpimZ4zRa9ztZTZNZfwhzbkM/fPOHZyeOl2/bsnz12GZQ35rKJoRURE8oWhZvIwdyrNheL8+7Gde8QqBfshAvFf8A8uacB/C+UrUCWaJoEzlalAuJApOrzvmAn0CfNS36xMgXlXlqf5bsQ7ZnGjpUO1HvW2YM9N/+9jHotwj0P/9690oiDbMgr3PKCpeWFULb4VAUepbcgI3D8zSJqmAoiYs0b95j5h/AF7788sIX5s5duGKFG/9LLe8VeUZQJNpkTTEeyfakEs9Jv8Vl+A2osJSv7O4cPHn10qk9yOaW+qsEWe1jhWfVzmycs8yAVlqDJMG1y5D1iZ0r1295bc8ESq0b76WGezT471kzG4s4MU00VY3nODroYop5d36xx1O8cO7LLyycOxf/CMQeOREuqaLonGISOVbDYaNhJAtDxA8hmooqhT9Bgr8S9xefwbRXW6bnIfQZJukEegdCtu3Tkt5AoO8A9ZIiSEq+B3BxaLSokUPgo1QKwZiVk+ycMn/o5cEUEAlfsXDhwrkrli176SWXi2fcIkPJIu9XeAUymY3D+4o4qbfI9PADVM9Xd3c+e/Luzw/v2PRa3XyxSBM0UxUNWhH0RFzgYqrYVImK2bbLZ89f3rdz9e4ty/f0N+Cg1gppV7KcX9D8nAYFbwqczYkCL1IqjTqcZ97chS+8sGLFijULoaByXiU5xIVbiuANlVi6UvU/PABfUwM7RS+dVVbbOjJApvvS6SehbyGO3CSgv/8d/8fnaei3UHMh0FE0q6ApzxKYxnya90CYSbgzHcE9Havnzic/+clPw4QvfvllSPjcNSuWzCuudbtdHkagaVhmVYBzJnJiSkilIvHsYBsWvk0xX58YH3zv3UuHsZ5gkSqWiWpGVRTdlGIiK2mdUY6TRTWEbsjj50F98igSwq/u2U/q4m+ltN4UlIGRleJ+SRFk3WR5mxMEQeI5d4DxFLuLi+fBzySncAlME4T+YQ5pFjk5a76gqAynCAn70qrSUIB+cZZrmnkOegccuYeSPmOg//FxSUcKfjOBvqeiQlUpz8LZs/N5wUfE5CnM06A/BdaffmHqQK7Ae+GaxYuLi4sxjuB2uRnBJ9Acb5iypSq6FBFSIT2kPecMbtwMOZ8E82unJmDPx46/RnQ77Qr4JSobDYdGDXNUk6zKbEozFJb0OpcfPfvm5cnLp17bAurHvofh47f6s91OxklnrWyvxtqy6JK8opAVVcHwse6Amwu4vAxmoooJ8MJCIvMvr4EOgsZ/4swhB2HeUt/zVVGWnjWrNgnkYP7jtgygE0kH8pkp6SCOB6CfBnQUVjAkTi2ZPXupEI0+PxtwPwEffsqbxy+A+uUp2p/G45OfnPuxFz62ZuHixQtR8IR417rx/Xbz7gBysY7id0SBFhQ1K2aUeLfVmU0Q3d6xb9trRM7H7l6dGEaP06JSQfXCM3TqlVDGH1KQflG6I5EKSzA4TqiqrDty9uzly5OnVq7f8+ru27ca1m387XPdKcRuIUcLa5YlSBIXYyTBdDgR4VmQE+CrMe7a2sJaIvOFs3PoFy5euGLxmhUL16yZu+ZjxMcnvt5U/WBe/os1GaPkxaWfHyHMyenJQT+eg16dk/S1ewn0973j//g8CX2K+0PoFaVU2eyPlXGRUxVzPvaJj3/84wT3C5984WUA/ySB/ckXwH7uC5+cu3jh4mWLVyx+admK2lqPl4ch5xlK9NoBhhVETUCozGVCEctRsmomHNGstzAWdmLfNvS9dI8jVkOStbyyrjJP9ausInTDaTe5hBbhLElLaKloXDEENVRZV3D88nkM3fUXrN6ye/fQvXWouiW64/WJiK5oCifoiqMIkm04Cqc5tERrnE+jRS9Ty7i8bnctU1xLnPp5c+fC6Vy4Aj7HGkQXa1YsxjNn+FcULl2Q6FRKZs35/ACQPw29eRr6sX0zQdKJej/xUNKvTEHfU1OzsqKSQPeEui83zZn9MpFpHGD+FDDjV6D/wktQ6i8vXPwSvnPLVhS6XS/VuhiPh/EiahZpHi5+QBFVVlAMXfBrmhBJKSnnufRmjAN27Nq2qaDm8Pjk1bsT1eWVpXlVpX7Vb1IZR6vH2yLjJGIWJ2UqB0MOpziaVFVRsLz82tk3z16eaF+5fP2ru4fu4wbeX0QSiVRcS3OSmaEES8PX4CTVMUVJZWXOFjja62V4ePRQOsXFjAsvsXgelNGauR9b+DFii+B+rFmzcM2yhYtXFBeWUZfGIr4noT9S7zMR+nSZbRp69SsEOl2Gylj43Pkjs2Z/mqh1YtJf/uSnYLtXvLB42dzFLyxctnjNshXF81yw4IW1hW6mmHEzsKe2283SXs6btFkkTkZ5TVClaETRHBRZOqHb30IeblNBKDExdvNsP9bGVSFD6+dEE2UYKQpXT9IMTZEsNjoRTumRrGIZWqgGQw7H951/gPLLK8vX79g9dKWjYfMvUv0pJ+5Y4oDQaYR01mB1MeZ3DE6BpAu2KDqMN+hCwOgtZpa4eA8iTngbLxV+tbgYaYSvLoRjX7zmYwuXzJ23ZF7ZUuHuJYl6DHq65yCg73sC+t6ZBH1KuyNkewS9gvbMnu2Jnjp/dMHsT38ahnshzssrXl6xYvHCZcsWLnxp4UtzYS9d7mKvqzDgRl6EYV2M7AkGiySv7GVtt8yJiux1sZKuQHylbGYwmybMtx/cs6lgfff45MnL+19ZhKYaoUjgfaYqqSbdG41ovZyl6ooq6XEno2iDhuNI4XDe8vKC5n3nz14e640uX7/7V0OnGzY0XKw/srM+xfWJCq9zrG4ogsnFRM7UFFFzNJKIcwDe4Tyilw/Q6Kms9brx/nQXu19y1RbjMdu9rPDzhbD5xe780N27gD7vv0A/NgOh4zwOXSXQm/afPzx/Dlxz5FoQgS9bs3jNS5CS4mW1S2qXQWzgKAWKa4OuoCfAB9yyjGKn1+Z1NsnIXpGzJcaMCXrcbzmCpEVCz72FSz22H9uxqSB6anLy6tWDqwvK0ShbREElqFpIskdL65ssbjA81sN1slpTr6NaghNJaNlwuLwir2A9KbWCekH17t3XTnc0bLy480hWiwmWyRq6psG6g7ukSYIkcxovs5poOEjFOLLIBQWWo4KugJdHER52iKin2iUBIvsM43XVMvmhi/8C/Qn1vmWGQr+Sg74N0BGqq77Zs31NB988N3/WCuTY1iwmAvHVhZ9fU1tb/MXPF/7sJZe31gvR9owwLttjUrwsel3JEcoOBJgkEjKyBEdONFkattZxrJjzXCfm+jd+7/bu1+qau8fHz5/sJ3vjSimfyKimqJiKqnORBLhpPeH6hK4M1oSyg46U8QuJqFUTDVflFVTvQ/VlbJxQ3wK73rDxr8PnuuOZmqwZE0f98OAVU2MNg+UMmAgO5EEc2B3WYYlHGfTyQYZhmUCt20tqNAEX4y70Bgprofjzw1vv6k+p98e99y2A3tg4E6HDpv/hN9PQK6gc9AvHVr24eDGUugt+0EuuLxZDOPDwFgdI50qA8RLHzc15ZT7o5ZIu1ubAOwgRF01GajWlUCQUhxfnJCLvhQ/X8NchJN+OnxqfvPTg3Oq68ioYdFUQbc0P4IZiRbsjimmlhk81SToKqFkrElcUyXESISNU4S8v33EOSzPGOy2yTO76/QaUWvtTO4dTWZ2VUGVHRscxHOBWDNPQIOkaq2iaCIde0FiBCL3XRqU1EGSCAW8tlFKQwb8AZinoZfKdmxctes5/g357ZkD/0x9/u/nEw5Dtyk9ubT7zh5x6R2ec6ptDoB/an7fg8yuWvVS87IuQCjhsX2RcUJMQ80Bta6B4oLjV7Rpxy0EXgLO05IVWlfk2OO0xrq81KUabQnov91wiJqGs9taGB8NIve5sn5w8P3ZkZV2pj/hwomZIcN3YtBEL91dk9Fi2/eipU5puRWKKMxrq1eJpLSSkSeRWU7AJTjwWAPWu3AEKb2KtVEf74Z2YhDAN5PE4R5diEVbKOpLIKpxkcBJnOKbNsRIniaLEcDYri0GGS0LcbZ71MhIv413LuWy5RLi41aKW/gv0x206oM+EOP1J6Feegj6Hqm8/tHfRgs+veQk+G4C3ulzJ2tZab7A4GGgNIAp+pnggkGxlgjzLysFW2fZyshzk+yhTl2WxK+hJ66HuGkFXdeci5BzMX9u08kj7vskHD1KV5ZU+D0+LnAEXTg/H6JgR6Q1fCom93TuPtR/vVBxLS1n+hJDWnYilcZLfCJEJxeOX3xzDyqcdr27bfe1NaPiW/UeaUxk1qwkxJYsEv4Sfc3Zd82s6XDoDKRtFUliTZTkbrGWehV7ibLft0mxmxNUH5gEvN0vbutWil/5nSQf0vTMJeo7409ArpqE31j1f+9Val2vJzz4PTz1Y63EH3YUj7qAH3zAmCQ2PFIg36WpbMsJAe5q2mOb5URh4XQmwA4JU313Rn33O+usG2PMHzeV1qw+3T0xeunyYyDlKcLwIZytVX6GrMTZSE8s6vd0Yf9h7+9yRbjTXhLNZJRVyurOSpgudPqOydGX58mGSh5+cWLkD1O+ig6ql5/DOekuU4LTHNN3hoOizoC1YDmcAtx8Cr3AG3pWo2hqGaCqCrcoyY8K9E2Uvx7KMw3CcD9Bj/x569cyD3gLoVx5CP/009B801q3yvlToKv7ZF4tbvW7vnGdcQbfN8J4kEww+s6S11h30jnhrR1wDLrcMMfeYdJrjWNGk+tKcbmvO/N76nshzuIxh88nhcrLhd3Ly0tjhlZsqaY/bxTKcpir1kYila2mhpyLiZI/0n7t94fK5c0fQJtGdSEUrelMRLaVZihoTsqGqV8oLdl5GRnZsYnn1lt3bTjfkqNdndcHKGKrlJBS/QkmOouEhsqxmALhgGHhFEidyssJy5D0gyCIjygzHc0lkjjg7yM7SXifQ5/1b6NUzCfqfctBzAy7/Fjo9Bd29LLmktjjgQmTjHvEk+aSbD+KjNxlg7KBsQ2W6GZPxDsBO8mmvZNicoduc4o9GnbSayTaddN766cbNd9EDt3znwYnJqw+InFf5+LIAL3NSVLCietjyoyWiJ+30nzvWuOvWlYP7d+5MRLT++kgq2hNNZbN61vKl/VqFWrG8btsPkZv7eX/djl/u3vbXjbDrWFIiSdH6MGnTgFKQxKyEnI2jGYahIEGrALOEqjsyvLxFwMtmgIUpkljZFlmkiuWBQFFk6+uZx6Cnn4a+ZUZAf8/j0J+W9JXT0A/+YG3dKr51CeMtdAULWyHrtXJrmQ0fKBAMemSW4ZMQdCbJBgOw7kFJomyOsnTKjClSOjRRkbUq+isSv8Vytr9uW1638vjBiQdXLx1eXV4K6LRMy2zGH1OUqNBLPatmMuqzkYO3/7z2weaW87d3nUukUk62vz5TE49H4iF0TYScbEhQ6wo2DV1+cGlsLFWwbcuO4b9ivXdLIuvovX4rpNNZEvNFRFHLWvDd4bDDpiucAxvvaCarKDSq7lD1SeCW4eDJJLIX4MGXaICu/kdJr54p0D8C9f5I0vGchv4oZKOPE+jzacRoHqbVxTxTy7S6A95AqxeeO0l5iHSXx/TCPFIDwQAnMbwE42ozuiwxCI+tULS/oley/krkfPjVuuX1PROT5yHn5fDb3cSJExWONbNOLMvG1JgSz3DK4bV/ePvWTzfeO3B9f30Y2OPhpkiqO9TrpKLZRI2FyK0G4X3z2ctnL106WrdtC7I0GHRrSfRHNMOxHGh1R0KfhmKISpY1tawikg8aPLssa9iMHCMaXrTFoJswp5MsF6OkYDJYxL5OoM96HPqb/yrpEzMfulrfSCSdVCyIZoc7lyyW2Vav15v0MrbEBkzJozNpGq46Z3tNkdGZQJfCjtLgbrGKU5lK9abgxDVsPH3ktbrXhhPjP4duX44dQz4KLoAZQlCfUaWMOEpLupCo6DV6bv/57z8g2xkPvT18+FxTBO5ctLs+lKrJpLLdTQ4883hNTSlSsojXc7KOmhtpiH+rux9p+pAUkRQjyzkR+OsitLoCXc/Bmzc0FGtJmhbmxEb1HdbeTJKUocqwaprSbL3I+AWgv/iEpN95CB3nn9A/OCOgY6oJxMnzHoH+eyRniHavQJxODwP6pqogz3u9hV3F7kBrMlicDI7UDniDAyw1wvJSkE260gzXxyRH+DSXjPGcKasZixfSBhzxfuTU3otli/cOv1a3qfncxBh0+0oyreYv8hbC3daDaTYCq4uSuDrIjNd0pg6uPfR1RHc/3X5n7/Wjw9013eHJ9Uf6dUsTlASKMSFJaPJXVhTUNV0+D+pxyPqvhu5v3Lz5t9nu7lRCsRTTZC06ng2lNclEWkZh4b1romSops6aiCmQE7Y1I8YooimzbUzaYP0RZPJKOED3z5lT2/fjR+q9AXF6LmKDqBPoa/eN/59Dfxeg//bfQP8loJM07GPQGT6AgYJnWgMjS2QZ+cuBJRgP7Wp1cTISryyUpgjXKBlgdYbTdZHTiyxFV4RsRbze6X8WVdCOnoJFm3BHA+z5qZXl5YtK1RLDZfJC1DZFOxq3pLDeZJkZp//Iwf13vr4ht5H33oE/X9t/eDwcrz480RxlY8+G0SGbcQwjLoTJ+rjjRNTHIpswUnv7HvqvtjbvbO7W/ayML62pGJbDa+BYDUE6Z+ocqIt4bZwgcfjEUGRLZOGJiH2iZRiCX1CK5F+83uOfM3caenrapk8Q6NU5Sf/lDILeMQ0dJwf9109AX/sdQOcZlCk8gWCtNxBIMq0jnuI+JF1dsulNupNyUIZd9sWSwaTs7WJ0VoF5FiG9Palwd/1z731rw5caLoVXlUdP9UxeutT/CjZFzFd9DCXLCsywCDOA73uiIgI3u/vg/qHG725u+Sk5LYcarw81p7LxRKgmlakXIpFONQ5xV/VIZaimpqDu8MmzY5Nj0fIdu395fTuWil50UvGsLtqcFdESkYgWAmNJ5wxJhCJBik6CdjdMWH7NEHSaRXzBmJxgioYJdWAWya//gkB/TNL3n++41X68eYr5+hz0/3v1/rikT50zT0CnHkLnvB43n0zWIlBPltl8MM3IMgI0Dj9LrqDNJCXRdCNL0xUTTdFvZjhS26yoifciv/IWbmK8OrwoL9QN3X72VA3seYlK8TSLcFkzdCHjNzJCWkvEU5bWPtR4/UZDC9qjySbmjhuNv75d3aRZPdmmpkhPhe7v1bOdpRHDiIQrKhD+taPkNj4WLVi9+5fHvtvQsPlvDinGc1DXGJQjFp5GaI74XhKQjtdikG+/xCommXo1NFbldKgoRhBYgTMsY6ly8cQj6G1T0BumoYdykj4TbPq/hU4yco9J+nECPY8uG0BBWg6OyMGyNnewtSwoJ6EcUciW+T4ZoTqLY0p8HxIgrG34OE3I0Hp3yHku8gukzO4O163ChYqTd8+eWo2WCfhwHpKxi0LVCr0VMVMeFbsruhPxnuG1v/7z/YafTkPfcO+NY9fah1OCk46EuldOxLWo0CnABkejWqiioqa8fD8GnsYHjbw9W3755+0NP918NYThdQ0evqZmm7KUmaaRcjdQe2MNQVDTvpjhkwRHV+FMoABjCLYs65QMc+8osofdeiLzEDqop/sBfXv78eFHkn5shkNf/Th0I5DPgDQzJyDbgda2QACJ66DtDXqkgITcax8vxniJTUrolxF0Q9VjhpIhcVbK+SsWuZw+jvFjLGu/+mB/dQH8do/HlWRELRS3WK63IuOXArbk/3lNffe5fX/+89u4dwtnQ07U7zRe33YqAd9L6TmSiocGFas0FTJ0SLoWrqmqLF9+8PzlsfHOaN363b/b2wEXfrCG9F1YergJmy40wzI5WHX4gJYeQ35GCyEfb8GAG5ZDLIuh0QpvoUqU1TiuxP6npL87x/xfoW+bWdCvnLly5gyYPw19zj8lnffWumWUoweCxSNw5FFVQ2Yu7ZXdJp8us5ku0WYklgu2IeOpWf6QFYrRke5oT+rBlz7z9UNHX1uU5/SMn7zaX12OlWI0g5KszelCk6HoWiqcFjsZadDf233w8LE/NN7BRWoEOjmYaQX1nd2WJdbs3FmTroxYSo8/wioWPPAKbI6uW91+lsi6kAc53IvL1U+k4k0p1NU1vb4pCmWiSYoCnc4ZIQHvMC0D3lIsFNU41N8Q0ssmDQ/UppCyC5Yorz+E/kjSb01Df6W6eqZJ+n+F/rVNeXyQd/MufoBngojTbXbAM5DkB5g+VuKTKFwgzc4xghwM9nWplkArugozmdUizsS6hm/dP4ZbmfyJsZMn+9eX4zZNikLFhuVHKUuLGJIaM7U0nRYcFM5PXT/WeOB7uTt4QP2zuFqp4f4bx4aG1oclC6m4+vqQpUaiSlrMwEY7SshfWlG3e98PL6Mt2V+HUbNJtM1tfaW+WxFEoTvRJDm23x9zJGjvjONEOJr00muKX5AsKaI6gkXCuZgKm54udSy7zNwK6PNmuwdykv4k9FcAfdqRG/3g//OO/4fQb936Log/AR3UiSM3R81BLw3CSZOZATdls6wdkJJMm6uLY/r4PlvskmUz2CdzVpfdRpmCZXEWa1qSmZXQqtqw7nvfAfNVFfHxkw8ONpevKp3Pl/gEDn+PKomSlkEZRTbE3p4mi3muv/FrjW/f27gZ0EEd0PGhAcH69aNH4pw+Xt9T06lZoSZHyCDXoouaEFJLKzbt3nd2cnKwk65q2vPLb+DimTEnm03pUqUhSDFTifjThhbThXAsRt5gqpGBS18KC6HpYSHmZ9OqJck2rSuiVCKfaOl93HsH9DenHbncIep9La5xminQc8TB/P5/gM4GSG8JZSYDUpmJbqOAu6+sy8PbvM0E2tB9AvdN0C1mUBREpLp1ix50MGqWxf0/32l8tW5VZaT35MmJ4YJFeUW+fFamFFbM+FhLhdyxXZKeCUcj6Uh//9D1tw81wIfDXdg469ZhTT9uU/jDr4f2wykvTTg9NSmtu1cZFBBpQ0wdBwM0lXXbdqHQOtZZUtm8+9fnWza39DuhVKSp1xBUVtGjGTUW1RUJS48kv2XEQ34lbmlSqDSt6lZpzFQNQU4bHJS87TO2Avoj9f4IevUMh35v85VH0H0PoZPKqdfNmjzKUwyF7pg+vos3ZYWXZTZgw5GzOZul+/LTSHzKtCVINDrcnXu40+uNPYsWVWX7f351386CVXkl+RTtEwQkyYSMhboXxo3dg+5wb7hf7Uwdadx7A7shYc6/hCeW9JOrNBsOvQHq1Sk0zoRr4nDkHcOPqrmmOTHV5GgMStdd24Uszc/TeTXbdh+5iZ3Wke7V1RGUz3SsqosIMSHqN1Csj4QNPzK0hl+jpfCopmoo4Kh463AcrDpniuZscxr6wLQjl8lB78lBDz+E3jsz1PsJQAfxp6CvfBy6GFjCsIEuL4VkpSSPeoO2zljEmMvoenUNuLtQyOJ1fPP8pqHrqibokuacbNi+/UE1bmPQEoNXLx9ZuWhBERpleMH0C/h9v6KYYqpJGA2khdBYc2/oXPv1nHLfMH0x+kaysHnDl771DawuPNUUt5ReNVIRTYSkELI4UMsArzACTy3C7MtlxOvddaur9xy+tbnl9eZzOyMomEtSKhqOaka4UwvH/XSn4fcn1FgmrIdUzSdprKEZnBnRJZrHXzXKlRivn/if0NtnDPTXXwdvnP8Ivcoua21lSEcZ0tUBmbPRBGlSEiMj89rlbqNR2zBYHUIlswo0PSTYSQ2f7/j6T76xLe/5vCY47iiyLMorWYLJZ1lDz4IioL0dmVAYWDbG6j3hxM7D+2+/cZ9ciQToGwn0DRtzF+xv+PqBvUPXjqe0mD+FRJtgSVFJYXXLr8N4yyqLbe+bmifP4hxeVL16x0Hshz89nIoiXcDB1xcUQ1PoSDQsSWEjJoQjBqfjpbImHHrD0PAGcEw0BPCKiLczgT5vXu3A1H2j0+q9B/WWaUdu297bMwj6lf8AffYsAn0f0rDoivFSZLV6QOf1Mp2JKbKePyrnczY6nlkKHzg5UBYzWdYv66KVzdY/wNL/G9sWrSrVEuNXT/bXrFpV5XJB0DnaQKiMGlhGUcTOqBijOxXh2frJxttvXGjYCOTToo6Ddbzkpux7u44NHamvR5SWskIJNQSHzDGqMpJqqY7kDXCli+qac53RiVV7qlc/6NjccrqmH811/pA/EguF9QXoi68ywn5VQngfUjTFVFk/fBAWKfeQowqSTSt0l1Sivd4yBR3IH9n0g09Ah3qfGTadQD995gyeZ07/C/SdOeiUmwlSfRTLdVG8yHLwxfoYWhJ5eL4mjKdp84Ok+dDN9pk2wGec8fGW7T+4MFSH7GsCWZmJ5rznyzAyTsmGT6czrGFB0DJKukrXw5eq0G+h3T629s7X18Gg4xrFzwI6rsLH+ULuPUBSNEeaUqGQGu1UBzVfp5oJdQrCKLQFcq4enpq//Nrl8+fvjtcvWr9jyxms+P2rkIo2IYqgfWlBUhwnNBhSrJBghCKlqmGoFnw5RJYSq6VUx07SaUWRmDJjStKn1fu/hX5s14yA/seHkn4ajyckvcIze04OenlVX1lbsRkcMQOSzY5Seprq0k1u0JaSOtOVRHFUjtF9YrpL6Aua6qgcozqHO35y4cKxTasWhVI9YL6zYEGJpxCThFyRRet+FDkUyaItCeKaCEd0frD/2LG3D62DoIP39AFzhOpE9r/1YO/Q+qPR3kgmgrxKJO3ooVEqo6kRrSLhiJyLq1q1cic2lFwdr67bsmPozMaOt3pCaLUxddAUNEOyopxioGEvHYoM+nURXz0tZDRNkAzgH+VNieaQjtVy0Oe6B6a998yMhf6nXxDoZ4ikk3Nm870//OaXe17B2OpKAp3eufa7+8pLPX0u3JLFUG7eY5bIXk8XzdsiH2CRr0Hg5sIgE8MEGZHtCjBIaqrPObd+cudHX1s+f35FvId0uFeSjU08JZawflESdcMw4QCMCqh5jMbjPaHB+qO/fvvG9g2PmE9r9y/kqH/ue7tuH2kejqbg/+mO6oRDnT5J9yO5I8GuC7ybmb+q4tRZ3PvbXrFpy6v7tzc0dMQjYb0i6lMMOl3lVzM0K/g4rqoqlBfRkeIJ+xW/7o9qPlvF0jq2pKuEkWYZRL3PyUHHg0A/+NeGK/uPr0c6DtT37NnWeBvQRz/6/3xD15R6J9BBfIr5/UfQa6ah7/rulzeV2m4X+tw96UAg7YmRfIynjQq0FUlBKdjmsrvkkcCoS5aSkk9o6+MQQZ//yaHv//CX8/Pppp7Js5fP1cwvKnOXuemSjAoxz6hpwbTEDJ/uYtMCKqfd9ZO3G9++3/CQOa5FBm9QJ6KO/9hw4djQwZ31NRbFpknfVJNflzi0t6Ooo3Hoh6KF+avC/aB+6dQmTL5Mwpl7vaI31JOXmC9l6IwZLYVcK6izmPF4FFPTUkZV4dvF/DFahBZwj3plCftuct57LiNHHjnoLVf2D68PE+jVMwz6VkCfPk9DRxr2u18uKEW7VDBQnC6T5TKbloIm34W8trcP+blAAG8BdyBJSV18WoypUrLLSSe2X/j+D2/XzS8NdY+fxQq48ueLSlzFDJWhLU5myeiDhnw7y8ujutHfFE21H4FF7yCa/JGYE/2OZy5Yxzz7sV+eau6mM7rqlPaG4wovxSQRQbijcKLCyLw/b8Er+7Bbcqy57tXd295saThxsSLh7/XDVTdYTcnQHIgbYsiKhtL+KsOvWz4jWhoRbMWfZk2ZZ5R0vvGLlv8I/ZWZBf23T0G/9e+go3fC6xpB+6ub7fKyjEtibORqPDKCdJNFySwZ5IMcTWtZgQsErHjHoRvfbyyYX74y3js21t6ch/scKCR3ghTnF2yO4zTJj0RPJ2MrJZ2hzrHh27cPHNi+YTNcdRCeok0+rMtBR7C+YeOFvUNb+iNoaTesVE0YnTaU5Xs21EllJdMvyQIWVuatWr/v5tnz7eUFO7YMndm++cRYZSSs+MySGKWLqq77FJ8hKsL8SHT+aIh2ohFTFThVUbELL8Ag60QXGSf+RdJPT0F/qN6PzjToN3P6fQr6asJcnYL+Hah3c0mg1W3TtuxJ5/cFvaMebxoJGabPlLsww2b2cV061yYZTqhCHhjgth668cMv717gq2jG+s+J+oIFWNnpwnyrW+dMUzIzAj5a/mf5UUuxMKbavP/A2jfOEORIwq1bR6CDOfmBzyHpBHrHG9evXWt2JK7X53TW4L0VE9LgHjM0LWJqgqKWlq4qOApnbixVDg2//1ZHy4lECNkAIZ0v2LbBqj9HbC5YYq9Gjaqo0tEsi9E3ZGYshbN5V0zUkZz5p6S/+99A3zNzoP/pceg3wX0Kes3j0OHIoSuqWHZ3ye42ytuXL3mCIy7bZoJpDxt0tTE0y3iQfGdjSqKb7eobPHPg73/ftmo+/cqp8bNj8Ups+S+h3W5bRDAnEiWLXJiuWKjF2qFOQ+pfufb623d+iqGn3KXVn80xR16G5OQ2ELueK7ddePv60NFUWKnMxKsyjuIIo7Qix0i1VKMxwGZwpZXzy0+dR0K2qWDTnup9uGhua7jbMER8RQqJBI1CEZ3SqigkYktYi0pTquSTyZxDqcbaps+SZiH33jMFHczhyOWgnzmHIhvU+4yC/qffbv7t1q1nCPGL/wn6plKPm3mGsRGte0bZoE2nKabNhMgjFS/rXnsgaSZ5SVKRCtc4mrt49ht//3Pd85RYP/Fg8lTNqueLikrcPIt0Hp6cLNGyKUmsaHWZUk+NLTUfuP32ga/jmt8N5Mq06dvu793/NhF0MAd+nC91fOPY0HBzb029pvUKCcdCBpWVOEV3OCfkcKLghNWqvJXt2FQxXl2wCXf9gPrJmrgjiLTcx8aEDPKIJSZL9tOxo/4XY0KfBDeOknlN0qg+W1L8RQbq6Q8lve0h9OYc9NV79lTPOOjk/GdJ7yoc8bbKMgpqwZIuvs20ZTv/vWyb2GlLYtrkbV3u9OkZ1opp0Xjv6QNfXvva/BJeg0E/uD5vftFSD+8ig2O2KVoCSjIovdJdnT5TMLrDevfEUOMBrA3CpYCfhajnCK/71l/P3wNyfJr7JbhvuNd4/fq19T1N/X5BUzS/pNlKkNIsQM8NrIpkU3he82VU3NrzClaTPRXbT/TXOBFINSuLthiLqYMsS2q/0EkZjjYZWVfsGJfNCG1BitWkoiigP5R0An3/FHRi0HPQZ4oj9ycSp2/dCjm/ezdH/UmbTtqlfrKrvIoaYYIuSqaYPqbLzfM8rQeCboa36SBaZIu6eFr0sT6/IiSVWPy73/jy17Ytyqe57s6x8eOV2K+bjxQu1D/fRY3yum7rismmObrT7NKj3YPNQ3vfuNDRQEIzEpgT0rjg48KhC18nwIF8A7ks7UsbSdg21HwkHu1V9SxGoAQk0HWONMn4Iw4XQTpVpecvOoJlc2Pdiwr27D56paXjdS1bEfXHZIamRapEpPwMS9F8SR/FyxbNergSjlMpmqJdXUV+5UUDTRRTcToOsjOxcwfPNJw+TNQ7ob66etvaKUn/f97x/yT0m/8Kfdp731dQOlBGxhzKugKerrJYMM3HPGkZE8mBNuZZG70TkmQykiwbotuUbt758tdu1y1wBSM9Y2PdFXkkWKv1BCmFj9EyBg0oOVbUZSC8MykzYyWOtKOg+r2GjTjEfgM05P3eHVzker8Bn0O9b/wSoON3vncAVn3nkaaKXkFRImF48rrNKioZXEeGxpGw31VdVNdOrnOrXrRy95b27R0nrpamBJaSmb4gpnAyvGLxz/r1dMmoTCPsTKMDhI/pzqin04u8sI+FpD9MzrS1tSX2HzzTcvow1DuQQ9S3zDDoNx9J+vYnoFPDjQR6wNWK7ROdQXefx8Q3kfMgD48am+mxPSi0B90xSTZMXYwxoz1nvvzlva++SDFyYuzZnlD5/Bc9hW530qOpEmKrYNofY31dLKrjz3LvZf3Z5tu3j924T5gDMA6B/rmv37nzlW9+5cK9nKgDOhF1yPrptde3rT/+Sqo0q4z6lKjayXAObDEceceBP68IAl26qB4zbpOTK+t27NhyGfNaPTXxkIge7T6RT9MxqsT2yTRNUxIEXWYZVhUFn071uRnJiRVFAF34p00H9dj+xpkI/QNPQr/7L9BnU5B05N7pZ9zPuJN8iVwMmeGSlO6VZbNsAIl3nmpjRktQf2MkSlct6cTk2rVDzy/wsvr4pd5o3vz8kmKPN+A2KE2BbZU41DefRUpE8vs11dQTE2v3HrjxdURrDcA7xR3K/Qa53vPQ/W9/9jMkdkMk9xlSWm+5c+z6tuP9Nb2OWDoYSkR9pohAG4G6rirZLBcSWRVm/RTZMNgPs/7q0M2WW2dqoopOe4NUsoRmSzjRJI+0j2V4Bn16jCixfkH1jrhoESM3BPo/JR3UE/sb77WcPkqgIzcDo36t8Wj7/z30dz4JHedNQP9LDvrKJ9S7WTgSkJPuvqQdRB7OFPvYgaTc5xrx2iNpb5+7q8/myI4XK3rxwRtrj21aQAel3p93RlQqP58qho4gN3ZpepClLMoXK5FsnRuVtJgU6R+61vjGfYw3NkDUIc3Ec//MfVyFCOgXLtz/DMnHQdY3QtQ/u+Gn29+4PrS82XHSYvr5UCaaNixVyjmGuoAZ5ojoV0Pq8xWT59/cN55atXz1q+eudHQ8qNTQsZnkbVbnLFkXyIAT1aZzfSzXyclpxHwSl+RHZFl7ET1yPcJsIuk55lPQbx5tJum4GQj94hT0q3ffvPlvoVcywWIsCRwJukcYs4gJ0GxRgKL6vG28tzXokr2t+UmLVRRe6f3url2N155fFTYSYz/vDpXOedHDuNxLkgxrqJTkk7D3S6c7WZGLadgl6KSONjYeuIOrshuw6hXCDMS4pg3MAR1W/cL3kJvBgajnHPiNp/deHz7qdKOkk2mqCYVEjCGKfp0sI5MEJxLSOCzqX7T+PER9vGbR8uXr9+Hi4Hg0iiwSJjNEXqQ4HyeKbTJXYmLqoYSleYX2q8JAIIBQvcT8LWz6v4U+LelDMww6QZ6D3vI09JxNp7zPYGjNLXsDXX10FyMrUnC0L3+gzE4GWkcCaWYgQNtddiby+oGv7T1XvsDfRJR7U9WCpW43NjMmyxSJ0wVOMjlDDHQKkm6ZpqMISv+127tu3GrImXSSlyHQG3KC/qNv/uibhw7d/9ZU3AbeDcC+oQFNNHtSTsav+eOJFBLrEh2z/Wnaj/WCYUFDgheXutYdvnn2cntv5fzVr117s6PjdNji2KUyT0OdswYyQzynwhOERYoJtMQLiiG4RpA7kDHL1gLoD+P0aehHctDRiTUToV/FeQR95UPoOZtuu0cKR7rcA7abLUlj0DMpy8lAsI9PE9XugkfXJ/Oi5L97/o3GvdWz6Gi859J4xI+Uu2epyxP0eClZRGscZ0JGkwGPrPtEVot0T+zcuxYhesO3vw3ouMmYWPV1DTfuQNJh1C8c+uahe99CuY3U2oiGR2Lue2tvD69v0gzdqgw1RQSNtkhp1DIEpyIUReej6Ah5pQUTb17eN949v3z1q/uvdFwZyzPEtiCdNNuojK0Lo6YxyrJKmjViSMx2cXaaaWN4XZSLWEj6U9BvPQX99oyAjjxsyz+hkx83WzoAfQuBXgPos3K597oq/mdYp0p2ercxI25azrddrOzqGgl8sTZI8e4BmhIZk8scPrR27f7j818MN+Fu3ESoZBaudwl4bNTgecGAk00qqVLbM6MsJ2VYJRIZbodBB/MvEM3+7c9+Cc+GdYe+cYdQP4TzTVD/DGz6hi9Av+fCNgTr14eHMbLajXpsFSsofqRhWb+e8Su6XwqhHZIrzZtP9hXsm6hfVFlTfblj+5UjNbzbtDCk4/GQm2coWsBa0nyWzd1U4hZoHkMaS4J9+WiXyjBz5gA6Dpz3/nONtzbfxaRyDvrqHPRdvaMzBjrhDfV+8urdf0JfvdL/EHp5VbDWlQwG5QDy7TIXMAMmL7H8gLsVG+TaAiOololm0Exc+Vpj49HyF9Wm1K7L/eGSfM/SMjfFeJG45U2uyych+W6TeWZZN5osLZPatXfXha83gDjOZz77GTw/t+7QjRtT0C8Q6F/5wffWfRZ98PhN/Jl1X8Ig621kY+sjNfF6Tdc0wdAFBU/BVDANqcHKc/6q+VU7sXNs18QreRWvNN/c/t3T1Q7LlLCiANPtlngFGWBVlmmOtRkbpp6VKFQSgnZ+9uK/g358PaDjTEFv7x398YdmEvSrj6DvWf0kdN418nlsCcReTdZ0taHtPdDGt7lHRgIjXYU/9poYVeFs4fXLuGt99awSLtVzfrwpbxZuNw0ylBeCzom67BsVLVHUOR0fJE03up32LccefH0jBJ0w/zauqP/Stz9z7wCgT+l3QCcpmu/BqkPayYHZx3Tb9WvHz4UTlY5qanDIVUR/6IEkXjkdMQTRzwml8xcdBvWJiby81SuPXtn+3ZMhgZHRmae3iZIoZjjTNyiaMU7l2pg2m9JLrGBrcESakvRZc1yPoLffarn6GPTrMww6IY7nybsnWt7OQf+nTR/O9ci1ulqLWzHHluRZXh4J9mGnahIldjfPPNP6TNDj51BtGTy5dm3j8QXz/UY/toKULsj3lDFLPYEArcssSwkcSzOmu43RFYhnIuSkzg03vnGvYR1ofw72HNRRb/n6DXLufP/7P/rmV/Agwfr9deismIb+pXXrNtxbe/3acIUUTiB1j/lzI8RFQ5IF3ywU4zTN0fxsaeWigvabZ/eNH8Y1/K9Ofnf7rSNRNhiEC+flGYHhWYwx8pQp8zKNtOwoZaJw5OkTi7JbCfTHJX3X9pbzj6BvuY4W6J7e/3Po7/jAh6eg35yCjudT0GcT6F8rr/LWFg4EYdLzR5ngwBzit/P27K5kIMa2DnzeNehHakx6fVfj2sPlCyrD8d6TvaEFZUuLXUsDLC+R+9J0lnRLsslkQBcSKUdhI/Hug9fX3sAFPIA+fb79uS/d+caNbxDmOU8OT+LB38u59aQFHrX2L5DptqFtKSekOZaOMWdaCmUUP/rn/RwasUo1fDER96Svxy0Q7ePr6wr2DN+89d3L1ZW0lymS81EMtAW6hMVgo0+wyWZTmkfpD4N6ZWK+trUlPa3ecQB9/64TLQ9mJvQTJy5efAr6nqehB34W+Fmtq89Gbq0rOMqPwOMdCHpllMef+eozrZRhsdrNs2vXHqt+cb6/KQHP/fn8OUvK5phlvCiWmQZDVnR2iRbTV2urIfSwKlbvztt7376w7gu4Y42I+ue+DXu+7h6R8x9+//vfzwVt/6TeAerEAnyBfMBVnQf+PLSzBg3RoWiM4yw/q0YFOiboUV2jdYU03gtVeYtycdvBuoLlq9uvfPfM+khUDna5LbLyOWbKHEsunBB9Eh8wWYUOckmvKRc5v3gEHZKeAfSOlrFp6KsB/c+YcOlJ/79Dfz+B/tY/oZNz9d9AR5UtWfiMB9t/5RFvlyvgZrz4KdDntgNU4IuttaYouaSJMzDo1xY9XxpN9f48VZk/p7CwuLXsH9yd+1NUfxnHayubavqtfqmmaaZy2Rk6h104e2rBvQI7uGeBgQOrYeDJgJXVSEg2QfG2GBIrIou6yF1wVbyBCwQuIMIiYYhXCFREBFMhKqwmu78/ZyG7/gH6WbDLfL+O3++L5/k8z/u5fMLjzImbLInnc3LMKsN1wxod2mV219eH//xQ32xr7hyiOJE5gQ47P/xmrqQEyAG9u2nyKA4iuaNNS+WkfYZwxy/I25bfzl4qxsa461HhctRNI3NUiMSRHmAJaOJWdLWT3qlospqkzdUcnRSb96R6embz/kiOlmscnIWXx6mwNjAtLh8L6XWMoKF2nKc4pmyT5njV/4A+MxiAnhGA3vUBQV9lDugVewKBXOBOTwP03JgQyqaV2PwcI2AhLDJ0UrYqo50jrNdSZvNiuo1PuNXWWriQkmxI3H177PLOYKVJsd2Ev36HPNusikw0I3Ay51tUHgGrQH9+/Hh9/cOFPfOTPyz4wcmCH5I7/SSu9YLJzpISGDqBXtPYDTMnp+koHLyoz0KeQfEVRVayayx2w6GoTdlmLBeAEFsE3UeOTVLnqQSzHItlNqSFbDmEh9xcrojQ2NTbLxru5aUmMr5wuUVQeRneQlGYkqGoEYMnQY8hXAqyMmWO2xqI3tP/DfodVFb/A/rn32/onxahlz76K6AD+K3Hj2/9puLvv/s36IU1uREb3HY72YifQ6bXBJ9X91Otl6clOj/v0PI7juPpw0/ea/1D67MwqX5//d2ZXUnJSrXJqqbkBixejrMk6BFbOzzUeWMROtOwfurq5ZYLuWh0Lyj4wQ+/R+z8B3DviNxL5uZKCPS57qaaIRK9i9S7lw+TOjvudPRFk074w51/PtVz7Rh2huVQ2fl4H8BMFYWj0mqBcJSWHWnO0VNRIdG3X020uW6HhmRlzUw3tG1GLLfJwRpVxhz8cfAjEkmEV0oeLmAlOEerPKKlX9fLgv4J/cT4TGnp3cFADwWW5Vb++c/9rqvnf/pev5mPjcDvoItm/t/Q5QHonERLQ0THJne4d63A2jitW12m5Zycg5HnC353VVvrH/4cgRap3dfGLmeESjEdpKZZNFhgzY+eOq9HBG/O1pdhEzN/3pGwq7g9921JTcUf4dwBHb79B9/7XvkcDL3k3LnTc6cXh1o7QX2yiUAnEg3ue5xAQAeJZrnwz6eydkGDkxfBieRjJY08PLIIE8lUAsRdeUJiXHhIaCqaY134s0Rk9U02TOfFmvWUhfYbVXHyRJh1uB7bvvXZDCPnw90Cg9mbuJ8/Gv436Nf+FTpOZf+f28md/l6/r7sCfbi0agV6wNLPBaBniXf6CnS5luZ554iJ4VVenVci8fM/pT06r59zW7Ba3eE986i18A/Pt4QmqrA3rDdEGk9rFQIt+Kkz4XpMNMox5ZrPn9ercq5b3D5H5rGugdw9k7UVUOMIchzUWSbnO0vOATtiuZq3pwZKqqfRP7Ni6ksB6MjaThLq5XOtA4MZ4VvrEzT5aeGJVH6kI5syFMkxKJ2owqpoizlOviGk99WrJ7cvR8ekXHrYMP0wKikSsmF8mc4bbhHQVomxRXOO3AsFQR/v48t4ixLuvejfLf1NaamrGNBxPhzonwD0X/ymtOrRU0IcXw9u/aLi9H9BP7LBrS3jOSdW8ridej8t4bVu2kN7tYzfqccKAmrTozu5rbNXQuXhaJdx7QzTyNTQ2xmGpvGchsWMZhkUrt0s74g0o2Nm6/G7A62di9U/gaGXnxSh41pfAvMV6N2Lryt/OTtZvdwdgN60vFwO5PDt3wZ30k8x9PbPA4eOZe4/nkOdT0yIjCRL/PFU9yYmHGuf5QkMVskZwmJdrybudO2K3lbX3nD/3mBx5iYO7orBJS7I0ygKnZI5ynAYuiAYHTqfA+6dQH8nzpzof1M63CVCxyHQZ9svA/p7/YTL/4D++P9At0hk8PACq1ORV2/A38YJmGDD/zOij1Ql3HnaldtfGR1s3oSHNOtDZGoag2uRFIeWFUaVM0KNKHPC3WYvdrY6dNfNV+8Mwrk31hb88Y/lAejf+3b54TctnUAu5ulNs5UXLz4vrCbXesDUu5cKSNMUoj0Y+w9Qh0XDXN7+Qzt3qKg0c3Y2tUOO9d3ZFCnqm68nplnkaH6LCz30+FcTXV0R0SnPXjRMP0mNoXjWqxWMtFtZpLKQWTyNxwIVARP3HMMymq2Phov0UgRyq9Db31QMX/sn9EuA3kWgv9fLpVag/+JfoT+uquj4H9CNtECzft6j97JlfnqE+Sn9WcHiYUY0CXo0Vpyoaskt7I0Olqtg6Ndg6Ca1WmWQWxiOyg/Xm+UJeDyF4SHWM5Z8Nn/n2b7+1s7JWvj2gvLy8u+Jp3xxvrOzMwC9prDy4hVQP91YA+grwlwtaaSAuYvksZtufmF2MC9zxw50SeH1RnmRQYVOvUiBYsi7DYlevZ6lgqNuv5h42N4cHZ01c6/hxWCxmfdrseiwjDiCBKwmcDB6BJplBr8goB3EIFo6ZNh30CdE6CJyAr11gEB/vzeKAfrX3kEH8QD0fb97/U/osgD0KMbt5Hnawfpwk+tVLIbXOAHWQSU4kLiX3XhVmNu6OSwufMfZmTvNScHa9dttSlWmnuVUCJSF7DhhhyUbndOmMgeK2HcGB/rnMbn2x5MFh8H8JEL38vLl+QD0zs65jtO/fY6ntS9emO0ub4I4Q8A3LUOwJdCJkAPqeN0NutxgxlaUUSyQ9h3h5/U5aXrsKM5Bgigvwg8oJw8L23/nxURbV0p0TPOr6fszSZEsKiwWtMKq5AgE9HqmjOVydGYG8QpbxkOG/U2RfiVP93gI9MWKqXECPeMd9OvvPfSPidArCHRCHHf6/4EucE61IDA61MbPI1X3MxKfU+AxxWj2aq3ZCN1be6PDmPDdV8du70Tonv4dGx+3NVHvNyNaErC4IBKrw1UOD+/hdxxqJoY+/ZMCXOVgDucOOz/ceXAPmIumXvP69xePbDsCU39bM9QUgA7qhwEc0MUDSy+YXBi4uStbb0YLDN7ZYww7VBqHiiFNc2nH0+Q5Fp05TbOlZwJq7LPomNSZ6ZoXm8P1vJZXu42o85FMQpcQl+OVM14lOgLgwTT7q4ZXoYN62YkTha8qpnrg3slkH4FeOOD6MKB/bgU6mIsu/q8VR/9AoItLCdYGUYOtTWR5IGtzcj52BAvkjCP0iNZjE3ysz4QhAond+3iisLV/b5gBL1+O3dkVpdGqIcsY8WYXk2PArrkceNPIogT9CM07aE/ktWtd/fOvagnzk4cDrr28YKJzfs8emPl8ydy+kue/vLItelvElV++nmsEdORtMHhQ/9FJBHNEyMEXFlHOD5xKzQzfvfXnaTo3HMhWKj/fEg7XgswNL2zqVWl6TfDeu68mnnRtw5v7kzX3W2IyecGP/IOSmzVeAZcVlWZwQJ7VOZ1qH01trRr22AIFlzJPmefEia57FVX1xZsvZQWgn2oF9GtlX3n/oRNLnyKWTg4sfRV6xr9Bd2j9VquJtdESgWUFTsvZbLzNbrdF8k5J5PDBwtae0OTErQmXH1/L1Mi+sdZu0qrQjJiWwHl1+fIyiN055HUfmHzR1sspfS2dLwtQaDlZfvgwiH874NxL9oi2DkN/fuXItujomCMXf/uH7sZuKHNN+GpCPwV6pmDq0HFA/Yc/WWp/1nwsfOehQ6oyOictM3tHOMM4diRQKshyceflaVjvLAs5NoFNBXnRSVlPmronshITWbXTRJvl4XL8F2OkBZU3ucWoF6AYu+P2P3oHvYhAd92reHQsbxX6hVOFAejv9SIKQP/6CvRb/wK96T+hI5Bz2E3qUd8IY3OyXpvH9FnG+VPOY+M9uiLbT888PdiKSotmx+7ssbtEjDPZ1BzP6A3ZKkql86koR5z5vCEHg0X5WL5e39zf2oJ2mcOw8/LDCN4PI3LvnD8I7Dglc00llVeubNsGUycOPndoaDVXJ5X1H+JWF2szuN7L4eAr9+7fj3ljswrrCOUqOZbMo6neQh7gisP8MqWnwmLvkmQ9OunIQHfTvdtRck5Pe9Gejak2Pe80W+JyBMQqOQlsGYc7He7936Hfr/jr7g8V+m/+BfqvSmsIdHj3VAI9rrgQ0KMord1ntXN+QeLGmLqbZTmtU8JJFG49569qy21tjk6WH6u/HLjR1RvVHK1zI2JPcGAbyQ2mCFZOWieYtOsZl3taD0J/BW/Y+eHy7x0+WV6wmNs5j0MMfd/R5xeuRBNLj464ePHC67lq4BYrL8jWy+Hgf/Dt7yEQQM2t4Id4ef/m5lj0YR0Ph7pLOfAuS2K4YEkMv44sMhJdkgZ5cGjzQyTrKREpKQ+n7z1M3SlX0RzPMeFGt59FF5ec/AygjcqvK7P8F/SzLdMVf9udh6suA4dARyB34r2H/lEReulvVt37A0CvHfrLv0M/StaE+rRWu5VhTQKCOAHyKidhtVbOj5pp0YsW3OjJUtWxs4+v7kqSaWiT3WZ1Q/rQQOTGegpNuJkpUjn03rjrOTvHLvUfzF0GcwIdBzHct5daCHIR+9zQbCWc+zYC/ciVKxefz+6rDpg6HDxRY6HIfbv85MnvnjyJvG1y4VLficjrmkS0s+uK9Pnou8zBRptEpYpswMLGUp4oNDD1Q9FJET3d91/dTBQcLJwQ5dXLaQlH4W/k0U0BwYHV0dJNgM7KggLQPQT6y4pbgF4nQr9U+ax1tuvaBwD9SwT68DCB/kCE/uBpbcNffl15KeMd9O6DkGE5p9XmlDhZpLQ+pDduND4LaIrmNiVMtbkKB0Nk8vz6Ow/PZgZLdWrxSVZehSFHuQVvYCHEF1Q8XnbCS/jXBl25nZNI1cBbZA7qjfOAflC09HNNhRcuHImIFqEjgr/yy8rWpsZlUlcXo7lGlFxOEug/OPnD8pM/PDwPB4/nNGN37rdYaAtKeWYsirRgcD0SroVRmTlWE3IIpn45ZEPS5ofTL1xRaXI3A0tPFBiOc5jTzFicIRiRx3FuR9zxKQJd9k/o423VFQ925V1KJdARvA/0L7QD+hff66HVf4cOK3+Ac6u6GgX1Vehr44pb9x2MCNGrteslEqea9MVp8Qsr+GwjQpmzzHz5Vy3t7SlhyQnnr926XBwiNbLqUbWb1rMClU15dAnKERXk+jOUGxMOP999s711z0Rt+Qr0RkAvr53PPQjkxMGXdJdcqDsSsyVkSzROzLaIGNh64dDQv5Tb0FaFuB9HvNsbCwc2J5HFznGRKgel2RGWH4kuObPDYabgus3oiNEGx3QhbdsZEhPR1T39MC8kDo1eXIJA5aD3y70pbsSvRwMQg32YlrhNj0To+gD0IhTZaktvHMrbnBWAfmFgtv9DgP4REfof/x167dtZuPdYHAI9j0CPdrDeUZqlfSaetiHUFWgneaiNdquz780UFjZvCWNHrt592JMVHG/UWbVWrVoicOfjHCoBhRAzpXcICY647OObzgYu9MPvDi70QiCHsb+FLtP0/MLFI9EbtoSA+ZZt2yK2Xbly4XVJY5Moy+GQ6QcR+fd+iIsd/VWLC4OpmSFY/WnBGzz5ei8Fvw5p1puWnSOHFstaWeOWm+icOrslJGZwsumVK2S/nqaVOhXW1xt1lDxHo2NZ1NfVAuONI3c6GxSAXgboYpENaXrW3gD0WQK9qOyL73dlFf1SK9BvEehw72sePH5ZOy+OuMTGpgG6Ia9w30EUXJyKUavVK9AeH/dT7YiTH9Ghe4LzcvnThYXI0ZX+G5fH7t6MUcbTahNsXSvwjNxi2EShgzZnRO+g/O5NOfUnxhcKO6e/HTDyxoB/H4Kd78mdn387X9I5tFAJWSYajz+ERm/Bf2yIgalXLkzWTgK6yB0afPkP4OERzYliXnnLwKni/bsNeEfzvMaswooRxO5p2XqBMmfLixjGRuulWa6JiTtJYSFZTxomZ2KwxZz16Dmed7gtUBAgGPIOnVfFuRnNbli6PChIhA4V9uw46i1XRUEuI5a499kBEfp7Xk5fgT5cCugPAgfQCzpnV6BrA5a+B2tCg0Y3+iUsx7MI4NwmhtHSKLEKfubqRGFh+4Z47ciNqzPtm7fIaIXVqbY7eTdKWZoiix79FWZHNn+ez0mrP5Q1mHvwVUG5CB3MySmAcycH0Dub4Nwhy0SHGkK3BG/ZAuhwyhF1RJibbEI3NIHeLfbJg3a5GMMXLC0MXsrbmRNOHVcW7aDQdhvpgPmqeErQp8kdHMvZ4rb0TTwdOxQWHNE13f2wOVRDO+MdDKdXol/fEK7hBI/WbOTKWLj3qql8QLcFLB3QH1cMX84LQM8C9IUPCTrKbE8BfezB4zWgvlQwN/u8kkCPfQfdYme9JrvT69Sha8rJkZcdONrmpotutRxsbQ6TcX87c+dub1SY0aZAhM/RNKfDNCuvKSN9E3IzY2Gp/P09460HS5CWNwL5CvXyxcLcFjB/C1NfrHl9gcgyW0JDQ4NxCPRtMREpdbNz1cvL3asOvuDkd39wkjCHpZ8sKFicHbyUmYYW7PPBkN4dchWVo3FYqCK9wLs5jsYQcljxzMTjE8HJITe7mx7e3mvWCaxRzzloBOxuJBgcjbFrE83qiaUD+tpV6CeuPa2YOgHoZG47K+tCZf8zXOlFH3/voX/mC4D+CxH66qkqmPvzv0DfTKCHyFmnepT162ifxM1b3Tavjfejq8LHP8pt7b8kVfj+dnmmPS80GW8Sq/26eCejc8DcNGsUvEownwEN+fXMu8ULBw92//CwiBwHDr68sXW+JbdlD3Hwc92FlRe2kcsc1DVhyuDQkJCQbaB+sbK/G3nbSh989xLkONHSReg/aSyczauP2mTOTsNDi3j4K23E4LYgjON8mqJwHrVBeXDU5RcP70ZJQ/dO1HS3xMThyVAtg7zCgjpLAnbP6JWMxYvOL2X9VBWxdOaf0P9aUXU2AD0D0E+tQH/Py+kidLHM9isCHXaO89eCxRXoiVqkbJv79+2JCGGcCruEZfw2p1pik9Bat9aDVgq3w/yr3NaFGKV6zQPXTF9sslSrZmkFryfGhjTIy9AjrH4HFZkvP2O+mjfeknsakfsKcnxDioOhtyBjg6UvLl6ovBKNmxymrlEqpUqNISQmZltMzMW61weHkLYFEjfsovm2GL9DtAf08h8uLwxuPpt0nFLhiTiM0DAaVY7Oy2BNSo5B76UpjCWH1T+cmNkpC45quf/qyd40BWdCrm40Ux5GLdfoGdaj1Jm8qBPsniLu/Rucz1P2U0Afv/aooqoX0ANx3IcD/VMi9IoV6GvWPBgD9Mk//37V0oMMgN55ZYvc9tMDavh1uxUDLV6J28/xWhaZ7plbhdg7obA+OtPSVix2SdFaNMsasjmor169YDEJHupMWrj5eNrOm10HOxsLGv95YOjLrbm5IvW3b0uguV/cFg3zDt0SGiaVyaTKUEDHSUGR9XQjgS6Gc8vdaJUPhPDQd36E7ouFU6mHdjp4vSY7Da/1U+FGj5xPQOdOgkqXY9YzTNjOW6/GjkmTQ8aXp5/0hrJ2G8c79CQu4RP0mLlHP79bJwjS+qqpbEC3ewn0MkCvqvjrrry9yNhiU1MvXXjWP4Arvejj73m9ZRV66T+hj409eFrQ/YdV6EFBmkv9HZ0pWyysabvbx2jL6DKnyU3TTgTx9AjtfnCnsPVS2Dc+/uhyW2vWFqk2CC2TrM6A7c66Ih3DeDG7rszHxmbV9fzd46757u8dbhxa+TTCz3cW4oGmFpy3b/flPv/lkSOhhhAEcqFKmUKhINC3kYd0Uy5W/qGmCdBFFw8HD+jiKQf1gh9Xtw9c2psp+Hi35rg+3CxwOpUUGSU2FusjsfpZx0o3jL16c8IgDb052f2qPcyi/qmJoxxOn8B64h1O3ksbGZ2F1ivPDldlU2u/wQN6GYHumqq4hQbof0JfmAV0z/suyK10UVS9gw7qTwuWV6CnaYPWKgG95OIWA+uX2LSCkxVMvF/t4Tmk605ecJRey22NkX3nk7jSeyLCZOnpLK+DAzCG82U6rIZGaq/3QhyVy69n1Le1zCF0G8JZagxAH1oxdPj30x2/fX7kCHiHkm+lYt06U7yGWPqRIzGg/vrcEIEO6mRw/fAPf7DCHNBJZf3Z5oxIGhspw9NUQqTgwXugtICFZ6xHk5AmCHTw1RcTVxOlwZkT069cEXHadNqppzFpZ9PxekqLPQt6/LNYlPlTj469g35i3DVc8aC4mEDH4DZU2IW+9hOA/r5rMyu11dopQBeZ37jx4FZtwx9+f+ES0pQ0WiZCP3dxm8O+zspxHsHk87Bu2mexr1FyvODcet/l6tPIbL8Ya3ENGhS0icHyMMYp4IE+hvVSgod4A+pGwqYbaZdh6EuHG5cIdMIcp3q+tautMFf07jWvkaJvIQk6LD1MaVq3XWtc8e9RSNt++Yeamu7uSXKtg/tywbchxMK9ixJ+Qe38QOXgscQcnQqLSNA/ER+OKVkk6jqBsvAUr9Aqz754dXdnclja2P17LXmJ/He8LEOeAFeP6DxeHYf1KOgISVBen3qUoAv6huAtg3uHNnOHaDOk3pIK6nUQ5Hqunf0goJOKy9TwCnQwvzH2eLgalo5EXXxVWZlFoEez6w9osYDE5tf5tEiDaKyG83CC+8aL3K5imcL/G1euqxjlNcakc9oseh2t1/EWzXk6/jztFTbFmfFGdrGr7VWBiFzEvgRLn+vPdbW3teQS5n+ovHAkOiQ4lITuwclS08Z0mjYEI0+P2hAVceVi3amSIUAn1PFBBI8GWlKaBXRQX2ofvJR1KNJMC5tQtDdYKDnDoPNR77bpaA/F8cpNL148ORQWtuHM1P09z0JN3nVaxsRxZsbEOpX6MtprMvnpOM3l4aeAHkSgQ4clgtzw5VXoWXUXZgfGr41/CNDFMlvV8PC/QH8wjAn1AHQ5oGcsdJyr28JAjlM7GY/E5Oe8Es45oh3hvCbHJ2dyuzJk6z77C1dLV4iSlWm1cPw0C3fgQQiPOI6haYvDUhR3onm8Zaa2dmmoZgU6ztJCYaHL5cqdz33b0YE6C6Q4EAdzGLrWZmP1ckNYSFRSVAy51etmuxsnRVPHF4ngSd/Nyin4yZu+U5c2JxbxTg0laM4byygMoqqwm9QtqIwqNEhkvrj3sCc4LLho6t65AQ3/LavfTfOUg3O6lQ63TGCdEhsv11yeupVjCFI4vWU4yNjelE7dJld6agB6/7Px8RP5nvdehf3IR79KoE+9gw7/PlWR++sLAejStcrUhY7TF7bordbtTgjuJp+Es9E23O1aQe0RSl0t7VEy9d/+5mrpiZKto1nU0R1GhmfRS+ehLA4OZWq33rKj/vLNNte92qUV6I0i9dzWXPj2rpbct51NAxfqUFqDCAfoYclG2oYiGNZ+JgdTSUkxoH6lrvIvQzWwdBxwn1wuQCGeUC8Xqb9sH6hM2Zno4C2YaJJjJ6gBEs15gRbUKne41maMfHrv6e1QTfLuew2n++NoidUINcGvV7M6P8NyOkHp5IRs6Znhf4c+UVrVs/k/oX/8/Yf+kQD0UhE6iJNL/RcVb99Bl8YCemW0dnS73an1K3xODLF5tGh79zsxtTLsausJVbB/+mRXW3OwwqY1xqPQzjsExsN6BeN5HRpgfZzOm5Y52N4yQew88AHz5cNzC4U4oqU35aLOgnQtGnIM0MRTjBknPDKRkhqikiIioqIiUHj5O1qngLwD0LFsDEm6CB2JH6jfGxioa97gMDFkU4afM3oMFjmvcTttvMZiY+g4QL+8QSPd+gLQo9Tb1/uMCtoI6UagjRbdCI0tJMo4zdjw401GQPesQH9R8aj3HfTK1lME+vsvyGGEkUCvKn1xC8zFc2fsUUUJuihWLT227zSgU1avU40ITsdift/kYf1Ot9/kK/tFS1tvcPzob9a4XINh2u1qKJw2nY0WeNqHPndNjqA+z2AlZ+TVPteb6uqhoaahGnKGCPV+V1cA+tvT+35beSQ6OjgUehzRZXSs2RyZEZWJ5gtjfFxSUlQUieV+O7uvtrsD1MFddPCHAX1Vza2df3bqyCGLRa/EDxrr9AbhIU3KomPQ58pimlrz+P6Lq2kaqfnp9KuuKMpqhWXbVDx+dGmfWYjXsW7BoqduDI/tiA8ySVah36/41a7NYoso4rg6aDO3z57N//h7PtQkQg/osI/+Cf0MoJ8O3OmxcuVaWdTA6dOnovn1G9f7eZvaQ0N+H5F5tHDkbt+aX7W0HAoz+X9zt8W1N8y0VqLW8qzbBlPX8cYR9jyj5x0UHi6+M4gorrpxqSaAXITe0t9V2NXlKizMfVsze+EikdxFMS4MFXnOHBnbvDf2uJlnjZooAh23+i+ftzYQBw8XT9K2pfLVwg1J+AuG+p/lpWIaHkogSzNaB80YPAxWGGPFEc0y0rH7L85EKqVpT4dfdcUabE4F+aPix9Pk4IwC7UUTgF4T+nh4zKJ8B/3yy9LHhzZfSiWj+oD+bGGAQH//BTkk6gT6VOmjp/9q6R2/fn5BhK5ZK4sB9GfRxlGnhNb5/JDbOA8G1W0SG2ZWP/m0zbUzWeEZvuvqSkpWp5uMAjqlSTpUxnkx2KTzWIRsx46i2Pa2zobqoeWaJnxwwHyuv70d1F2FublH9yByF8ssIQFDZ3hzRtbEtdhMc7igS46TA3pMCiL4gc5qEsqtbJNc+t4qdfKpnewdzNuduIPh3aQ/X2DdZh3L0AInl9NaQXrn/os7ZqVM/mB6smWnRr3dp6YlGNNwswzKcTlIMm1ufdyt4asWaZDaHUjTCfSZQ5uzUgPBO6A33z5xNv/L770gJ0IHdUB/HLDzG3du/Kqie2AVelDQhpslHQPRjo0b7azP5tSqPWqB9qk9drtfq/rFWJsrNlnxWVh6e5QmyKp2q42C0S9R+41+2l3Ejch5LBmMPNvnalskzh1T592EOU5/f3sXDqCXHH1eKRZUyQnWyIw2RhWZ1F59rzn2OBy8TkqlbYhCKHel7sKf9zWI0HE64OABXTRzHFBvG9xcfCzRzEh5P8q+jCDzsjm8jTRCYXbt8tS9OyqlNG6s4V7LToPzAC3zBLE6NWI4b7ye1ZHn/uXyp8OXVYDu90CGLTpxdqa6Fi0U8O44WVl1AwM9sHTvVz71kff+fOJrxL0PVz19PEaQ3wD0W6U1syvQjYA+SKAb14+u85rI9A8r0ZWpnenr/LRHVXq1rStKqlgz5Wq5HSK1f8OnRtzuYVmnQ8freKUHr5Kj4HGmGH1xDY2wcnKGCPXq+YWurnZ8unLfHv1z5UUwF6mvGHpkUvEEVvlmxe5UmVmTiUpLisBJqXv9dghv/InYjy52LxNBrnHlDNUuXSvO2hwamVamV0rUXift0GODsd4flKO12pQn7t8bI9DvTN9r25VMb6dZhc/ms/G8XwfZrsykZowGedXU9XCZTEugkzQdj8VehvKOK12805GmjwP6+6/CEkmOWPrw1NMHYyt3+p0HpdV/XoWOMtvgno6+aJ19vUTrk2AORCLwqLvYnet9dGTp3bauDfGmv1W1uLpCKFRV0bMgwKUKvJ+1qDiV3CHfgQc3ruW2TVcPYXlMzVF8cBrnFhba2/sBvaVw318q68iFLkLXSBGIRZqTMtqrq2uruzIydmaiA9coB/QkqLEXXnc2dHesmDr2wRNTDyDHd8G98bwru0lzFk/DwgU9WSDmjt+kQ4Kpqb9fNbY1WRp3d+peW2+Y1q7Guiw77dY68adlLTrOzlo0kb+YqudIX6QI/dq1iYKX43lZgE6idzFjO/uhQP/65yDJQZ35ZyB3Y81wQf/zyr1EfDegoH7qYEd/tN5vT+dNiOAltNfNO5wS+09pfc5v7rS1GxTqRy/aXD1hMus37DSNUI9zKy1GDytY5GXmTTeO/3y8pWWydhkDqDg1+2DsjZNoNsPpQvjesQeyDCmh4xg0ShlZRxWb1PyqcWmpYLo3ae9O3k4rDEkkhCcSzcBiw74OQMc3qIuR+1LjisRXMNF3KaRItQNLr5wChi3RKyGYvJDlkLcdq6p6sCNZFnd5arqtJ8xol6B0YPJhbNmmM2InAe3kE/Buz6N6Ria1BaCjml5wr1e80lMTiQqLjI1Af+/bIok6I0KfAvQHAeb4nvpJ6/PKzRmpYpNc6ObcjtZt8Rs3bkSjjCl9FAs8tDat3brRr8j+zVjLuCFI++hXbbk3g00brVYWc44chmDIFiqUL5nIhJ8fb3a53jQggJs8ClvHV3fNUP8CoJPTerDpObplROQhBkMyBtsZ8/GkvJbqpaWl6tKZS6nHw3lOraTAXLzXK/ubagBc/OqYXC6HpQM6Ofjra129sRmhKoZi48nCcT/l1wtqRjBJnMrdgL4Jli5CD6Xxg6Sm7dsVLMu7aaQIRp8gyDYNP83Wy6ScF9CxhuLyvYJXzZtFS0eVTUzTEbx/GNC/CuiI5P76+AFBLkKv+knu6+er0DWXWjtc2+K3+0aht9m9tJfmR1jJRonVyRchkAP09EevDub2hilG1wc5aU7tRgUDsRGLXkNdTtrxs+2utuXqbhj6PiA/Sgx9frZ9/DYMvb298OgfcKHHBIeI0MOSpWAeuTdlYRKFmZdLBQ19KXt3hvN6pVIO6jFiw9zBhu7FjsCBRFN+eGlJ1PdqgL12ebw4aWuaWe9l/DqssGMNHMfkBNm0auUuQM8JS447QaBvMW7XOjkdq4UYKxjRyE/raa1ZmV369BAtk/KA7sHCmctLBQ9vipYeiw/SdEDPP+v9ALQZSHIEetU76Pj8tWAe0ElBnQJ0VFwORsT7NtokrO+APR0tsZh6SHfbbaqiKkDXrGN/Aeg3pex3Njp1di3kDr/O6/Nx58N5JiE8v7cdKfpkU9M+MoVI2p2G4Nxh6bfh3ds7T/+2jmRr+MC5S+N1Ni48M3Wws2aJnNrSN8XY6B3Oa2U6OQw9JgqTrAOLQ5MB5jB2RPDE0lHHEUOFgpnm/RmZ4ZTSa7TwrMXPeI1OP4Ol5XGH7t9/vDssecO1l9OIOVmr3a3TWv3x8VroTRq0vSNjU16HIEcFSYWApV+7+7J2phjQkaVnxKZceoZA7mx29ocDfWqq9K+3/hV65+vnl0ToQRDf+zvaUqTb1zkx5JI+avNrGc6vdq5Pl2jPPwJ05Toa0A82h7HfsZt0EgFxE+3WO1mLFlMF+bu3drV0Vg9NYuCYaOZk5LgayPvHu8bbu1pb970mU8mGYJKrGXGhs3YufGdW1zL0m+Wlly9La69F7N0fyTNqGRUVA+joiL7QP9REkJ8m2Bch0RBTD0Afaqy+NhiTsSOBoYxIIPwy+HheYdH5bYYV6HFnX0633d7C2tVBmMLRxnvVglEX7lDSbo5Sjgzf+bkuSCF4AtDbakvb8uDvELzHAvrAQAD6Zz4E6JDkSMWl6taNNSJyZOpPSxdf//5CKgnfv7FWmtR/+lzKBps/3aZ1jvrtdgnnsx6Ao9/u/ezTNzO9Ghn7i6dtB59J09E5yaq1OifLMkYOATTvTYg8ds3VMkS6GptEUQXV8KFORO63b4+PI3wv2YNhxWiiy2g0RpNMSaOPSRU7OCEiXGpYqq74a3NKXmY4YyOmvgG1dVRZT70d6gbyfeSre7GRRHIQ9YnqszRUO9F7KSMzLFvv1HF8vFvAmCXLq20Kw/6q+w93B0sN9cOw9G1YcodQz+TUu7WCWRdOlZlozqy5MXznkAGCHJiTl5relP6xPY8M7yaBecqFWSjvuNI/BEHuX6CvWXPmDKDjPC6d/DWBnhErD/qWLGnh9Lm6ZCeKFKYRhdo36me5UYmPG91o/ezTJ4Cu0P9ioq2wV/odu0xH85wPhTWhzDZC+4yM+dCu9pZX1U2T4C1Cb9pXMznQ34cLHdD7c4++rosAdPIup8mkkKmhv+I9jvH71QT69NDSy9rau3kpxZkco4uXyzdEhUSEgDocPFkOLp7FyfLGxuUhEMfSiqaaxlpXcWpmJkPxLE8zLC9IsFVG53MC+j0CXZc9db/tdrSG1yoUvFZiVDJ0DhWuoXUSS2Tc4+Gr+zVr1SvQW+cqftMjNhDhoE1vAdB7zno//gFoMwEdFtH7FMR38Ab2kTNjtcur0BXfkkX1nZvIC2M3flztU1j9VjsWEljTWZr2f+eTj9/MNGtMDKAffCZLV2idJqdNp5ejkE3eastPOLPrWsuThpqAdoovmPpQ68DCeA+Qj/e3Lu4RszVYOrHzIBMN/TUzqfhNNQyXUF+ari5YGk/J2hnJ25Csy+Hhca5c6G9qWgx4eMBfKieGLkJfXq6pbuhNjTm0waLz8hYhng/S0ro4vZbRBKArdQlToqXTMr8d2wn8lITVMOZNSlZBx1FPpy7vV67VukXo+V2TpMYG6KKl19X1E+j5H0SaHpDkQP0l0WHBfIRAf9nwu99fyAL0KAK9+cmrU2F63zqJ2uPUSuw+C2+3j/L+dRvXPHgyczPeyP3iIaAr0zfaGF5ttGDAAJKcGsOjx0JOtLTdq56cBB6EXQT6UOfsQk8PqPf3t+Z2PL8YTUZZSBCnDJJpWSsfnpHRfl8U6fEFY68umChO2ZlpZmiZLm1DREzEtpSIulPzQ3Du+JzuAPZapHcB6DjLtTN5sZk5nKBT0GhvL7NpHRRnZJXHCfTQeF09ondYOmfVjvIQizlOYtEwqB9hZjXt0dTtndK1tJ8w9+S7ln/2lATvsHMReuupnp6e7A+gb2ZFkkP0XjX8KwJ9ZGTkzMiZO/er0QR9aS8s3bRWtmHwyauBZN16e7oHnTGjChs2B1pHrbTf+smxCUBXB6BL0w+MamnMAvo4xFA87825uuuYq2UONRIx6hKZ13QPBJgT6B39lZDiQD04OD4ehs5arfzOlMEJJPUB6DhLtdXtWTB1xqZQUBuS0AefgkfxBzqGFglzUD+9OFmLHB2uveYooV7d3ZwVtVPDCJzPyKs5GqVybJTRrELfPTXtup2kNKnXaU2Q+oysiTVaKKXO7wiK/EXV2Z0yzLcE6i0zjRVjxSvQU1MgyAH62ewPoG9GTNQD0GsJdFj5GQL9Xu0fVirqJnS+F7e96gk2Op0bab99RD2S7oSCqRVs/vV/G3s4c1Oj5n/xcE/uwNp0K7QOvVRPM2ilUzORUfsHr7V0NjQs4oA6OU1w7n2A3jeOAL7kXF0dYU5OmBKat5Wzhyddct0fEnGDuqjSl766mZKVCdP8hlG+ISJi2zY4+crWmiYAF7kvzkF2X1oGdVEE6K513cyIcgh6Nh53uo62GeNYXZBhpxjIxesSqmDpIRphu0SN9N2nFzATgaYqmzFc+vPfPDqWGLSWIdCLrp94U1t6OW8VOtL02Wd9fWezP4S+mUCXnAj9r4/h3XHA/e7T2twA9CSI75o816uu6OSN6RKYt02LIM5n92h9yNjJnT4YgH7wWfJ2Bc+yRPH2uVmfV7Xjwd5xVwtSdJAhbIiYUlOCNuK+2309fQv9ufuguYcEi0cTLyNRHM9HRsxONjT984D7EGK5zanw7zaTgkK1bVt0VNS2i6c6m/bhAYjAQQEP0KH8EOqTQw19h0IzlWjjYN2jSMcTDA6MrGX+C/T2GKlWcsCGuQ2jjlW4lVpe4dZZ8NLqr3ZjqAnaDLoii07cKqgeX4Weklr37NlAD6B/+QNooXinztQ+urUmgBzQb9W+RRtFakZKkg6J+t6uVy0xYQdGrXYo76ib2k2j63i11v+dv81MiNCnAH1AegAirM4td9qcNtap27o7Y7zdVdLQBCjnOrDOmxh600AfgBPmC637/vDLui3BYbByMJeuVdAMx3Npm1uGYOjdq9BRmHtZcb95c2o4h1tdI48KidmAAeYjdbMdNXMlhPg5fEPZB3RQR45Q0137cDBjQzbPG2mEZ1DcHFI07q1C302gR0i167ZbUR9S5qjdJj3PYdJeJc0vvbUf8y0qkqaT4cWfvOwl0kxSUmwSoA+c6uupP+v98geRsZGc7XOwdORsYwHoOA9qMbiKNrmUNArQM9pPP4kItdu/4xwd9ZtQqiiTfGfUiaLbJwH9psYoTD3pxJ2+/QB2C+qoeD/tFIw5ifW72l3zkN/OzQGMCL27oX+grxfuvb6vb6Hk3MUL28KCw8KC41FOlQVpGYTuiVELTSQeC0BHSQ7QiQQ/mAJT54yyeATwG+JCQo5Ag6/pBnX8zuCOFwGWu3GlAzr0gKHa9uKkOA2vc9I2KAcaDYc+58wXgB4m1W1CytYeIrWm21EcwiJzh82JAMTJ0Crl1eEb+6kghQOjDh7U2O795MUgoKeQ2B1x3EJlX09vvffLH0TGhvAd0NEFPRWAPgLsyNkmA9BjKRlaI2+fPpcabNv40/US2uQftQu2dV7s97du/9tMycxNZQD6KdlG9VorpxK8QWUYEs4pSuptny+pnlzE0n58SjpOT9Z0DswS5sTSc7ufP4cUlxwfH6bRKKUyqCOcOXND8ZMhUnWH3ZIDjoC+XFvdl5eEhjm5UaamNsTFxYVsu3LxWWfN4tw5gvwcqDcOYcUg0fzIY53Vr/o2R5F9Mz6bFpV1jYZWaALQlbqfV91v64rQ8Ou3q1m7k5XRRE7CGgV3JNoir6qgzbjzCfRx19JP3hTvzQD0JAL9AoFen/2BZGyr0KeGocOK1Ena9nLoz68BPZVAlyX1nTudtYW3bpRo/X7WjZ1So+tYm9a67pMzczODyfGATu70AybBhkBOxbPY27M1o7nLNd/Qffp0yTkcQqepe2CgubenD2d8YXKBaHFh8fHKeDh3MYpjImNTuu43wM67V7GLkdnyy4qJm6kZmZGcNkhBUQQ61tHUDUzWAHoJgV5S0l0N6GJLPHnPrXZ+MCKWMnBSI7o6NHI+XiJa+jFA3111v6UrJkj9HbtTZlM7jD6TT21zm3jWEPd46rLZGKTOEQur4221FS15qK5BkEsC9MrZU3199dm+D6HGtpqzEehPAR3Mr+IX5Gz94lqxJEq5Nijq5p6OZ2HGAxvtvIRTo4Oi7Bs/5Z1e9SgsnUBXidDDcOXzJsai11NxaYnHDiGK6x6ag28HmXPw8Ys1iNyb++p7ya3+5GEdOifCYOiEeZBs+wE7F5kRMTAHJQcHuEU7F/eI1SyjZorCSybPrgsyUlQo/Dt2EGHt1D7yW5/G91zJ0JA45wYFCJ+aod68qP1YFKaPNzHmNIESpAHo8bD0aVi6gUs/cIA8NQeV1qn1oQfeoYx6NHXCDG3GL+px2DxSO55H6msB6KcGnvXVH8v2fRjBO8L31UR9FTqM/V5t4YAIHYk6GqYOdvRs4UZHnTSGmpxWtW17OqYRJN/4W1vJE0C3BKB/Q2FTOBkKy7R37L7a0+sqhHOfKyHEibEvdncO9N3sxelBFNd96lI0ojiceMgya0kpns9MqcttqgFx0OsGcPLBwQU/VDtNaqxmJj1IpqPiDCGgHnPx1J6GwO9dgoMdg9hQgiPW2avfDKbGJlKcwPgVcsqoU2syf0Xce7x6Eywd7h1rqtev265m1CxW5Ji0JrU7LqPqUUKidG26mKaTpd8vey8BOYEeCN4BPcH3QdTYAm0UvyHQXwD6CA6B/qvaThE6GqbIVrHCjvZtxo12Kzei1frZn9p8o2ovLWz828xc56Ay3vILQD8lxY1Ps4whRx9+/PjezSibNizP4X2OJ1jnTSy9ZmBWZN6H0H2y8OKVbdLkMCm4w9CD1h+wWoXYmNnTNSi9HgV0BGQB5N1iHjZU+mZzVKaZs64PitdRhjhDaAiJ4LsnS0Ac1DuJg8eCEhxSetvX3egqToqN1MgpVquKg/yuXIUecO9SxWiQxGqVCOoyk1sC5U5CQaj91TH0+du8niJSbplErScrNkOEnkSC997eYwkJvg+ixrYKHZFc1eNV6Ci51C7OPheho40ieDOKqzHGUbtdUAsSuxNtkaN2NMbaPwnoh+KNlirR0r+DDSUsH6mSJyZk7Opx5c5Vz83Ndz7pfPJkD+7dxU7c6AR5X29/7umL0F/DQB0JWzLmHtOtVntk1KVOsgE2cDUHPhhlaSLl2KXq6vGYNJ7HbJXCSBkMqMXGbLtS2do9F6COlbKdDajfitBP71tEyb25eMPO8ETG6KZ2yNy0CH1XmEn986qGtq4k/eh263e+YTXRRhSD10q0oyaVrH746Q6k6VZvEaCTrbDwFrjREcgB+qW+yj5A930I/c/vEnUCfcXSgf3qg9pu9EYS6FTQt5KzZk9PxGisB9w054SJO9H1Tgs2jsWd3jmo2Q7onXtOSTemp9tYhscrKvvrB7vQ6D6JTd5tT/YAOl7o6J4lzJsJ9cJJyDJbknHCwjRhiNw3HrDa+ajUwo4aUFu5mlehBzb8L9e+yYuK5K32AwqZzhCKEw3qp+Ym4dlh5uRXsiWcXOikCtOxOARkeKhHz9GMXM9RmsynInS492lYutJkX3cABfV4Cc1yavt2p9osvTr1eL8hKMiOppnr10+0vcSUMikuE+YRqZcQvDcT6B9I8L4y5DJ1f/iTovguhnI3/nj4D7++sBcNU/LtKLncPPfqUrDR/g03+w2J1mvycCayFjLob23nOm8qtzsfPREVue0HdLzA6yKPZz3LPbhnerKz7UlLy5O2J51w8kOzzwaam48da+6b7T96qu4IppGlBDqkOKWWttrtkUf654aA+90BcnxwRAffMJ4RZebt1nRFkI4KDcWWueiIlNmaxU5A30M+eAhoeVLUe08T7kOdxbFRsZE6Nt6gpxJD9764/3gXAjnH1HRuYYTsO+u/b9VCDrK5dYzWuf0Ax2jGqu/uj1+rwHjLeSLClr4c30z6JxDFkRLPs4He5voE34dRbvlX6Ldu3AlAv3rmxm/K3wI69CgR+rM9pM62fhTiDNZpMh61W/BjAfjTtpJV6HueBSskB9xGRpmTtqu4P/fg5PSTmbY9LW1tMzPY3N90EP/WROiQZQ5ePALfLpWCOYI4qYa1HbDzMZV7SAQHU3138D8D1HHTV08MRkWaec72nSCFLo6MOobGxFSWNJRgTfw5sim+s2S5EfW8VeqTNX3FsTEbwimB1vHJYZtf3BvbpTTpHFV44z06zPtNyTdsAsOpJaYyhSR9o1oeN1F9LVKxVuHGlQ7ovyI6YAqy9AB0xHG9x44lfDDBO8nZPgfo08N/XbMCHdQfFZz7dSWgx8rVqLPl5U6i5CLZODq6cbtbj4qXW01bFcpHgD6oNDmrSCC3hbUeoBkK2/bP9rTsOdfwqqWlDaelrfNgyeLkAAy9F9jxqm7HL+u2wdDxCVMq1q7djlF0Gx97sRXOvSMQiq3yXoVOqA/VuvZGRQqcPX1dULwBjZQI5ralzHZ3EyvH6dwzPzdUA1MPaLN42u3NYF5MFEUz2EltDs4E9E0orhFL7z8SvO771vUmKY9/CrwlZjONcrq0ey/PpskC4y1F1y5XVUwMAnoqlBmculnEcSL0j3wo5x/cnWtMm2UUxw3x8sX4yU9+Mya9REqhW1txtLzAsELrYAIK6bgsplDpOqPNaDqhU9BKGqoRwQY6bmIF1o1yESt3EGqNWBggICCTIuAQptGpiYm3/3nbunn3c/9937ZW6cx+nOc5zznnOQ88OXahvv7xDeg/P/sc2yuUoPMOFQ2sDhyK0+VpRUYvyiN0HSKbtMGWNBOE/mAj/tqxkJflZT/y4CMlrWWjLs+bC319dcDu2qzz7Hia9mlwB3NM6QtTKIWEocPSJRJe/MN5GpzXe/RUoB3DeajcEbrZ3EnIni34UgsfQXurdAE/MQXQQT2hu7dtm4BXEfadgzdWDw5AHMIZ7OcHq9WpR6Ryo0wu5J67trBpIujrNLxz/XkP+0UnxSflXhWiTRS2O7O4aIpDNHjkRYI+f/W1TUf3Dej79YBe/tTInbdEikLQ1xpvQP9wprkpuMuFjumKLp1crUtLlPvz32VQ9Nih4nUovdoo5rMNa8W0RELQqwJPKKIYVZzkzDm109W30rYBG68D+M0+z86qxzEdYj611NeiPvVYNJcVnxd/Ok+H9FrqJTNbRbcKyDfzDkOnIlpUTqVmHVFpK/U8riIFj8RDpxICG1d2ADwIfafpfUAHdVw4ImLBV5aTgf4G+kphYvFeEPozjYtVvacO649r0v3oicfIeQ0i7NfRccvXPrPE8NgVG9It6DYzWITQjBrZFpwP0A3oztpnRiIl3RJ03+8m6Gsz5MgR8wsffnz+fO+XF7FQpb4zj6nHu5YSorFSq5RnNyiENiMN70zijKvrd+ifx0oYORN31HRubAAlUitk6HV9dXUudAUcckz7nKZaYJ8y7LXAc8foDkMHc44sHcs1VdZDU11NQ8+F6t7+ztTpFPW2sYQcrNW1eSJ+ooKEAb50ami1ogpHPUE7O9tvDB1sBzNviNe0bUx35xQ28G1GRlKwt9BH0J9cWOwdSODrNFjyK3WCKOlJEaNB+P2x/rW5M4kcgRHQkWL79LWr493qYwU5Qej1UwHWj4uEzYt/yLOtNX7w2VwYev/lr5p3vqwvPQb3XcKD+760UnQoSeDX6rwNya/o0rVSePH8z/o2+qoJegWt05NwrM+R102ly30buwtoEzY46EJHmT4M7pMw9FpT+djY1P7qOBt+5dHgzuVxBMRcK44t+BEVk5jS8YDwQqLl21BICMG/X7NZCn8cpi4XSUBdrlCgdWzRZJsVzEEdTYUNq++vspFfXNbt1SvL3QU53KQ8uTCRoPvQl/zptcXB2VNcZX58HmMURYlsqOXTRtnEhz5d6z8q4Shtb58FdPfuaz/78LPFCTk5BN3hcI7Vtj4aMZF30m0sdNRRzFEc9gJBn1941jP1eTfSDdijzotF8YzvsMro1/iTVGgJ7L/Vj8Zij1/b/B26IRCdqfTrUlLLnHV9S21983V1g3jMw9IPPI6Ab7oc0J3jnq5LajDnZj5G0DkcAaPRVmqTY6cQLw8m0JtCefQmPIeEonY8oYjm/FRC2tFHtOjhHjT1TJh6QcD65g6AV+BhMOyc/3bbSmkYis0iDzfdnZCF8wkkjwG6y3k4U/Fk4+LAbCo/D5twjXqtXk7173qhXJJ6rdGeJeHJo94+O2G396/VzJUVFCcUpwWhB4ooNOP1Ro7zHnbf164uEHQy9AsX5j97dnWLoCM8w+EdPuPaG30oUYeARsOjQnFlerpUivY9v8xvXC6R8I+s1VUYyqIzjcLkuDO+OtfGwtI8QXcNYoTf2X7TMT3tM5WXY7k2OYSWE7Rck+CS8DmC05pKGHrGpV/bf/1v/dj+TgsGeLFKKpRwMwl6NGLwGOC3ydQJOh3JvoLcWygev/2G2dGdGqMSSqPVn23WmZDUe7yxcXY4losUYV5+pcaG40mMer8Q+fY1BGF5KIWFpds7MaUPFyGteiw1lUIzamf3OEZ3b8RE3m/y5L5a/BiGDuT9d13o/7T5K2RXS2HqMRzUUZjbBx86qvcyHej9efJWzbuid3Gyx9nW8dqsTKX09rHR2aLDQrnqkecL9g0VS4uuOrd7cADMkV69so/B3WcyldeOju1NtvSQofOJOp/DkeVpdFpxYdrWj98F9TXpu7D+8uGvX/eklahUOmkSV0LDewoCcwllvU0eMMcF6oahb9mEq7UC3D2r304VnYtJSsrMTG0te/4oVyaQ9vcXn4kTCQRYiBg5PAYzut+LCoryD2awpYknxYoNlk5TejH8dsTjUlnoZWNOWHrkBGHZTYz3EPTFq59efou1c3CfW2s2B6Hn8iiljuIZrhf5NSn6LMoZJgp7SRlpcU5OBl/APxqbUPAQVyk8cvTctKFvY3Glrs7d755lG03seRy+afjuJjjvro2eHlqiE3RiLkivROuwrFMXf/ru6++hb6Dvw8JbetwskP/iVNYjoJ5M+94UigyEYxPUjpVVQs5CN+8gnUsnckMenP10vbo4SyjiifgSnkTCEXD4XC7e8ozpMr9Mr3lb2SDNF6A/Etf9weXnFfjc24HIDFp+7/qKyXcHdEq3+KZZ6JEThCXdx07qC1dn3uuHpZMQnqmpQGMxrFRz+ciuoo6i5ZBc3qAdQcVJFNqFJeqURiGyZFyBTCY5HHv4iUwmJu75soG+ipUrrrrh4WH3MJgbPENg7rM4TU7f2PhefU9oiQ7Bi9NrAP2RY6cC3wHxF/+ub76gX4ivP09LPaIyisVxEkRVaKn+RE5a0fhQFxrGE3NQX32TzcKwkVl48ANFxzIYPYJAPF78/Q/Ex/M4kEAv4+TrKzVKHl9qPI3mU7lUQSGhFnJk6e611zaqCTrb4wjQA05EEyMpCPu7J9e4cPWz90KWPnGh/1rNwVY9oKtTRSiDdlS843vsZIP+XZktW4jGTIqzCm86hwuzFcgEPG50SgpfkfF82rjBs3FlqW5wdnbY7h4YcJnRuN9nsdSanM6praWBHvVD+Ak+OXE0uMPQdeKjOZe2vifkly71vPxP6qEz2r4Ad0dP7BGkeMXiJL4oKSklI4NO/HDULdKMXmUwk6kj0QPqdHLrj1brt6vOM3ExcoGAIwDzB+4XcOLjBQ8fz8/XpBuNeVE6W4M+SuZNyV1v7BTzOcoogr48/0HzQDcl2FKP5QC6ut7h9DnLIykIG/bkCPrPgM4yn7hwgQ3PtBB0JfYrOwzto9HZcqMAjVp0r2Cb4VElk65FniIF1QgaYZwiSanKKnWYKzwLCy5AHx624yDdXrSgc/hMT5ebxqamzBvEnGZ0/mNIopMXp9PhK9Lqv/zmix4I7QP/pNAHOJuPBX/pi3qHOhZZF6MOTUmoigbQD6WeKg2srJKdk8zm1fe3ydDx2KmwWptc0yUZCAjcDz2AO/74/Q8fv/+4ID1dgCoKdBiXnZaJ+PDjThTCj/MisUrNZrBKR64lIWTpDgfiSuWPRkr58w1PrrGxcXGx8WNAJwH67Vff6P2SoOcgpf5YS2973RNJlXk4fljMMKrkjDixpvI0XxKTJMsX5MsVVAf7ZNFkVVc7Cg+X62Zn7TiTuK7quSlHwGJ59ITFtzXVFWh5+RSlz0VUPsHjHYehI72mSr148RKAQ7RRPaTo4DNeHqLPQB7cW3ouXizIwaYqnAUpFoqoiiYmgzpUFO0PWcGbrl5z1Zur2x4YOhuj8xw0TZWWSPSC4w+ffuDh+PsfhrU/fPq4Jp8iBBq0rlfloX9ORu0HH5+Bw1o58jbbd6Tmmq8IEdhUCNN6y1QZQX8qovw46D4WeuPap/Ps8D6B+63FZsNWfWlBQk4MPDn1VvtGbKY8ShOlHfE3eIUn4h63ybC9LVvIaHRCjLbJ2Fg+DuZX9mhCn8Ve5OHBgSFDfcBnOvH0CZNzy2wIVk4AuoSCcYJ8DaCjeqJQ3ZIWG4tYOuqnJNGHg4pmxb6Bk47Tm3LpREZ0mDp2lKAbVegxzssUxsTQDuYCtcPVRMTN7FNFG0ydqFd5dn60vrntKM1RCI4/APs+LchPf+B0Xl76ca3eX4lCfaUwKT+9UpTRv/ZWFo6b1I50TJy1u79CN4LuY4Cekwbo6pZxdngfiZRK2BsxuU9Aff38ymUW+isXLrjnP8OkjvFdTbsYeblT1nZ1st+Ynq5kopS65KQYoVwqVzIpySK5SiSMS846mjZtrupaXXTNLtvts9iVOmC20uA+bbLg4EXfVLAUkq1/zRSRF5dXSciN2NZSGJOSmBmMxfP/Ki4UTMRG58ZlPZIdkk6n5AmFcXFk6djdtndghpnT8G5Gvg7QoSprBY7yfKO3u/iwUhB/Op4D912Wf1wmkOFPz9fLZH5kj/JO2xQZM2utYiTT0YSCVunYP1dWitE9gTV0NX5xwbw8wqZ01pMj6Fd350PQJ9z9H9dcQc6FoCdiUq+ueKfssFyP5mtR/A5VR3IHenGh70AKurUIMbRHlxzzTZKhX8dsbrd3gnqvuenzAFz3apPF6Rvfd11KgKHDelEBy3pxrKGrIJ2UUeAziPeP4lM0Bm3kqTs0iKuyYeuMSJmcXIjwOAaAov3VKrJyCE9Nqx4YOsVmd5DuedNRlJqp1x+P13BkHD157RoE4/RGnWaE4+VHabySwvXd8mQ+R//C2Rcnhu0zry2iJjIIHct0dQBuicn0TESFZkKeXCM7q7OW/i4L/fL55skvL7YUHEtNEcSj80z7eKwqKt/GKFWMOAnHdDQoURKHw3sa0CP4kRPl53x9VuubGNw7O+3Do9RzAJ67YxprdATkxgKrn/eENiticwO2qMqFUgJohLRSRq7MBHEOj/MnhZHzcWdmyhkU4RJzFjsN8FJxVmEhQigY4PsWggN8L06EtDZt7xBzQK/a8by/U1acopPl5QlkeenplXqBDDJWCvJlAqVQJJApsZH50ycxiTHPUODd3vjSSnUprdGD0Fu2LhL0RyMpxXbDkyP/fbPf3U+WDuoIv1dN1bcUIAAjihflbCEmF6OV+f3GKPlJ9I3KRPswHZMkjEtSxByRPHnG6TJ07bVhQq/ttNtHRwcG+/bqHYFqi6na53QGKqqwREdjGUA/dJjPFyGyIwV1sRFDvE4jV+qVIkAPo/6r8COZSkCX6mDpQelUOpESzaiysmgvcdHUXjtsHNB7ew2T7zTteAw7IE7XdtP+uUKFXCbg5GHlJjOm+7WaKIFRhipYP3Y+GcWJ9g/mS1D2q/OeRRC2/+prdWUEHZ2NqHld91a902Q68WikTenU6/8TsnTy5Aj6BNQ/U0ObmwA9VxnPywhY+x7iarSM1i+yUad0r1QsNYqFyej0nCw+ahob7esaatuctbfWosUeLN21R3kW05MWiyUw1dvF9nnORDpUoYDnrmSkOh34ibUEXShXKDNF4dGd/zcKYU8KWbqfLowSQqUQB+qWlNDBOkX7exVk5r0kw9DQDgvcRU+re9XnchOV6emnT6enI+YuqMyXpWOlLosS+RmNMSnl47XOY/i/8o+QoX/cjIp3+K8AHhrdAwTdG0kptrAnx5o6eiX3uycmaIP2hHuzuQ3jOya3VNqw3G1YKs3A35LXqBtR2Zhstp0QeqarxC/EvFgyPOqxtl/ZcHfaaztbWztHZwf2AhR/tTxpspjGA3uBi+giBeApUCY3k5iDHysxukUrJPDoSXxuWGEfLvwx9j+lxCSD+ZGTUDY9VOKYjKPPQ2eKcPCCo/edql7y48yToP6m1UNDe9VOFSz+TXNRcaFU76dFYqUgT5Zv1EfptVqZgNGimIr/+vruR6l8pNiwSu8cXq+5Vo1FSypETuKlrUvjyBc94420Kf33SX1hbe536MPzWLR9XU/QU3jxomMDKw5+jI5RotUqI7ah50RSQxTTgP3ozzxeaOneqGhfuOK2d9pbO2tbZ0eXlwbqp6t91ZaPLCZLYGmUTm44lZuhiGWVGxdXCGWxwvfH0lmb8PFwkUKvEF7D79AOPjc151gxVMLqTAn1Ryk+d64Iugh9XlHRazaQqf/w00+eJgTpzBU7LpfBULV94KiOTZbKZJV6pUbvtyG3V4m4YpRIJ0gXJSWeRQEFAjiV3rfP2jvnP6iZx+ieFoKubplqGXeayhsibkoPT+rr6x8s1bHQJ0Adkdjtrz9vKUbOhR/PS3W27z8Rc5LxMiKk0rMfH0mWqtAzOyUpOSWueHjQ03XQttkJ1da2traODm50V0OWagsux/hF9AJFTyF2F9opQKelEHXwwc0qIe0UwB/CA0cwhnSI3qHfCERHriK1Tf892h/hops2F6qDQsspqOXzikkgB/PeH8y9z71DqTc6vddQYRiadJRkxIg0+Uo4EXqE3vUiozKPJzUyKKDImGt0Fx/i8owjHYA+V/PBaHdBCHoa2hoFilD282hDpGxSvln3IRC70Li+uDfvnrgAS0eyyX29+Qqt1AFdEo/NTRsVp6KFNpHX5tUxaBSH5oBCL/ruPvjK0/1FfZ7tK7tujOxgjmt5c3l5cH5+vn9+vo+VyzA4gIC82z1/mdXmJt2bc3N0eDf0cfBdWDMzwYuEf8S/omdo7vr1T0nXb9Lc3Nwm6frKwcH2yvXtoFaueFwozSToOBloKFCdIxbybHoNTxCVD0fC79dWdmDrLZPEz8KGpkIJn2t7G9Bbr9UsTCMMGR7dewL1vula0zPeyMq23Dypry8s9MHUg9AnLl9t/gGTegHGd058ZklFV2l0po5hRNmid6PEXnF2FNo8PCI++Xp5Wp0Hnvt8Z2drbXkt1DrattjWtkZqa2s7f76NnoNqbq4JCm/+j157jZ7w8vfC+Yu/f9+zz76KL22G0Bsaf9QGoNMBjwacGDJkLSpLyWaEIloiGo2yfJFILlOKRALl44mWtZkzqVy+4oWOF8/a7WuvXS8jN45EjaenLiI0c6IhoqpmwrqNzbmsX7u6SdDZSd3ev/7azlZ9S2lOaq4IOXXz3tgTMaoR3StJNsRJklQSRqV4Ji4lo6R0rK9r5coK2TkJRTJjlEL3wYfDXxgJL2PjrNCXa38ZGmA1OFDHmuNm36bHs7mxsbm0sURaWVnZ28MV1CppaGHh2wU8kb5d/BY3CcVzrFZJB2Tp2xBS6TuGCrOhyhxKwphRhV10LIUvRJpIL9JrZEY/4/eLXpFFvR13+PJaf3EKnyds6IDv7m6uGei+CXr3VAtVgHgjcEoPVs/A1K9dpUn9xdD4/mnNc1vsSj0V0DP230G/IYYRyoUqnc2W/biwQ/d29tMPfmQf69vo2l10d3aGmJebABvLNchHxHGNOUkEnjauBrW/v0+dgSfRXQwuN2RwIT1KI3IfpmMPEiYhWbtI7X/VdvCla7uLUujEGrRx7ZDTXgWBeJ2ByP94sO04l3tEYpRjP5zf6Nemw8gZHkevlOTONNZmIV6kerTDbkfx85qzRQ3oQeY9jkCZCQu2iJzSqQV44zoN73suQO/oeBFL1on3zr+BSKyaFm08fmKgfaPnsFgaZcvWeXUoVBMKdfIHY0osCQMbG3vnNzvDdk7UQ0I5pNOEZDp9BuZhkcWzmg1ZfO8gC72KHnQRdERS6YYIOp5I4HwTc/oAN2QNFcaBeAXWaqzCdg7h3fvm7uLcbPSq0+TB2I0iG6Oz8aI4t/JLGq89GcflZ9rehqEvz9TMVBcQ9LS03FxAJ0O3lJ9oiLjQTGhSZ6HvLvZheA9Ct2PR9uOXF9UwdaxouGXW9jJuNg5BkIuTlB2iV1Tid6VvZz+/PLDjWWlbsGN0L8ecfhN0Sxg9fYDJHthrWbX+zn0cI/3sLA301P29rtcA4rghCqOGFAIeJgzTBnA8wh9YIfYpFHCnn4Z944t6KRQ/iLX7ZNX26lRBbIpIqZdpsdNaW8lopVqdXCvk1mLBhuJ+pgHROHtnY427CL57GHrLlNoJ6JE5pdOkvk6O3DVEWNxh6P0zzQdTtFLPiUGPkAI0pEhRMipm5KTwXdGICH6RV/eCpXTSal1tm4edd5pYQ3/mxIkT5RYL0f7oxAmijp0OIVt31o7VBo2dbUMCW4eAfZBV3QAgAReJyOEKUSeB7g3yJGvwvTUsIA9D7zOAOYCzGiTs5iE0Noge0dgaNH49I0NbJDlPjwrsjMuLsyU4lYpisMgaNDc6u9VYsBH0tAQUzRThlxeje+RsaPrzSn19/efdtiW3e6LjxQ7kHuC/N7+PQmi1Gr1nePyE3ndcuZk2bFNmbAyO6ULTIbH4iHPfiuXaDDufgznZNZiTraNMygLoNwulZmTwNwb58dHZUYI+AJG100ltAE9eN0EPUYcJhwXSN6DTFcJNZROEPAgdxFn1gjhRx/LdvHNluShXgdSciBHp8pFjM6q0cq+o8LNdZ6GEJzCOIKu6PN88U1YantIB3dHtQ3Tp6cic0tmVOob33YXF3Xm3+yzN6mftE/1rzT9931KAXk0KASfW2dV+hhsnPFnp1whHJB3JNlXDg+4Cg9W6sGYHdDLzIHUa2C0QjfChF1Y+MnqYe8jUobFRGProKIt9lj2zixAZwrbOQg+BB/ngHcQeho15HPcOdq1aQfsGdPoS2DeLHMzxdmVouiDlpELqVXqNWtTNMDqBPI9vWbxehu2qeuxt6excvtbsLi1gc6qxOFJA3eJTo8QPfty9EbhKD+bU16Hd3cV59/CLgN5xFkUkd9CW5RZ1TlyKgM2pOw9lvMAfsUVJk08yig6l+Eixq8L6TttcZy0Gb+fN0znhNj399NOmEPSbXbvffTpADwoze2hqh+iA7TB1FuMNgTquG/LgJjefUMOBC4v133CRpfeaB3rpgTS7q6j4sWyRCAVyeiOTpOP5GaNyeKHuN/LOPaatKo7jOqOLz/iHiYnxHx/pQ4EVumE7i2Ww0hZ0tEOgpMC6GBhgBymGEnyAhdnUBXBBJplDQCfaxcE2pi4EGeI0NQF5bYWoQ5gPJjO44GNx8fn9nXP6YKAzvv6o33vPvefe25atn/5+53fOPefcmmS5JGcVtcH2ff3lsXwrPbQ902KEods8NkDPzY3QIp01vxP0hY/GGHQITRXvPPYyukdSJJfGHuzRrIhad19tWsO6t+7fsyfx1XsrRmZ37jwx19dBXpsiNlDNhYaHHcMOd67DkcvSMLiTeFiHldpwAJ0mGBMhHau8E3caJQHy4P4aFhbNi7IayAM6GsjAzsVVKg1E+C9KcwYduGkdRPPs/hPHa2KTtya+KikoSMQs0BjAuCZ9dGJgU5Y8uoga3jvG6ueciN11kEJnxx22bk+n2+2IxIb3YKEO5gjfh5oPtgA6M/Xxr1/6iUavZlpQabMc3zdtU6I36ntp+iT9g/rspA7nwDTm/ejpb2LQGfFhUjEWWh2kKgfRHq7KJeQh6BCgA7lgTgL0gLlXM+gEksy9B4sQq8AjYRNSXRA6/VI4b1g5JYa9epBiuWnMSRKTAEuvTNyz7r5VeYmye2cWPDoMYmvYXAb3voCnglk1MHSdRYEiHd79XXipyC3SL7v8GrJ0VNomxgH90ddffxTQ+4ba6KYLaurpconWOf3mQJb24aI1W59Jfsf0Vva9m3xHv8DwsQH46WMEnUXsXG6+OhywFG7m3M8LZ4/CgIxdNNQx6pQGBwGd7JOY8TieWe9ST78zxJpSHSVBnETEYdhIsG8Ie1p/xFPgjjsL0ytrc2pr71OnJcq3V2rfnhsrTNfL7tlRVubtOPhl22S3Bp0nLDoF8+6nS8i779gTeffSwzrKUZk+88kYWfrrnPos7/5uzbRI1fH51U9WG5WJ2+9/WJ+tvz8po2WymqprvdTM1okYjWnYvYLCKu6deCUkynRGHImgo4sVBDyAxqFXE3RaAVYgX4YdwoZBFxKeHQmwA9gpX42ngtsy9AXRZklDwxq0zkhjR5/v2IRb+feXl+HOwWhb67v5jLnFqMNYrb0lHp+7OHfHe9dFaJFOU0cS9IW5iSkU6sLURftMe5dVp1XL6FnqJfKHi7ZuxaRM7937lHtv3c59Lx7tJX7gyHD6fAAbYOwTQlc5kcFCq49hRyA/wLgLJ49WWSaBCAraO9FfLmHeYbixMvUOMtQBocH38CBOvTxos8XcU1lQGR0dt+a+ImnFqaFizDqiz96Mrh/en+vnbVZA18G/w9JLTnf5AH3Hjoj17tAdv9z088cLE1MT430tjwJ6WRlCuSEa3tTedUiHwQAKZ92+zihTIh6YH7N1Q27NseoL+3ft2lmN6hYTPPTKYv5b6A1WL+8Vambit116erDO4uYLJqbqmZ6e9iOR9uMWzH628LYZam4X8nPhpXwrVggz2LF7ukKBGv+bp0tcMWibqc1LTayUZo3MHdmYLI+LyW0C9L6P6pvbNVbcukeBrrBqSnxdPs+wI5K9+2WXXXvLL78szM3Nn2DQHwVzUB/7ktrfcQ8Co1eTNRS/a7duQN/nVx9QjHx19Nc3nzx/9rO9NtKB7u4Sm60GTyetqcHK1V1CwhUm7JaoxrZETpuTRDknO+YSOXTKcP6hbGHq7u7mGXH6QPuBA7t37/7sfN3efJd+DbrDJsgaYpVjE01b0Pv6ARj6ZMdoPSpsMHS4dp0SRbvH5jztK3ZkvxepsTvp6ptvAvSF+Tk/g/56Gbh7Dy48/flZVNVpTFuW4vQT/pq1W2Lw1I5s3Yiv7sK+Xecw+PAQfCINRms0NkJ2Wu1Y+Vilf0QPCVGWL1zYh4uuLFdgOBz+iWfO/Fi927ot5uFSc0LRhizXlN+FFubk9Y97Qf3r+lGPxgjoFoUC23y0zKDnz45VkezdL7viVkBfWJifmjvY5yVThxDKtaIplqDjnnNUV/X8iD1qHR66F+ttPHxh564nMbR8kUEn3kY7U0oQtUIh9gKckonxob0YsYbEhB0TrkSJa4EzwT1OBcU61q0NHkGhvFAIOph3dX127vzOwd0Kiz71gxy9VNE3N7JFK5cl5XbAvc/Wt8LQOXOgt8JHcOiR7N0vu/zGWwT08REGHQta5SbaHkEoR/G7RKs5PjVtVZTH3L/eVTJ44cKbL/z03fewdI2R27hdwSjTsEOuqN+Vnu94P8hQPj6w8BM8H6/VmrCNxyGOxJKFhFdw4WiZBHwx/pUGvoL64rlHdh63GVGsb38wtnDU70nHdAUPPO5Fx+2J+imnlWJ3C9XXNPk+TZUH0LNXRW7szv37L6COPivTIyFL7/v2MYRygK6Ll8RFeabnfXblPQ/HbGs/DOe+7zuMLUdPVwFdwcRtOGCbySTKaaNMgqyW5gnS6nHCRPi0Ji2ErSlei2WJlp3JgsIOgtCZsIvHJvAbCINu59DPdC1+h+eJWTM2FK3Rao/5DxYmS2Uxz1FvzoPvt/VSa5yCQUcY5wZ0N6BH1gQUK/h3gj4z55/B4CQGHeW6d7z1pcG97fg+lBJJcmb/3GCjIvueJOOnPyGK++nc4iJNJiDcuhJfMfOyHHq4pZvC+zQL+BDAkQhguIJUuU1nBQ5NyEME1kTnpUyCOLFHnklQD/l4Bh2mfmbxx/2fOjM3mkwPKJqHqjLQ0rjR3YHe+qfqT7zbTs6dWmZQtHvyK1wecu+RerMloBsZdPROa27xMkNHvc3b9+HTR4+z+F2ijrM490+3P5TUsM741YVfdxHzM4BuF3auTOHixbUSC9hjDfPkSOKQFMiFXrBMa2lZy7fLFYAtFO7bIcGcQ+emfubM9+frjpdYkmLTt307VqHLkunXV6HXdstHaILt0hBzNM1o7Pk+o9vtAvQ9kXkrPaRr7yTqU3Mz4zD1MtJmQJ99+hsK5TToKSfR2qr3DaTE6DMmD1/YdeG777/HtCGNkCjRU+zQ8qgbCkJEXmzDJE5BlKUNVyhSW/pqIQGddLELCcXzgG4X7p1BXzz30yOn7bGx2paZfvSIlMcONx0bwL2W9wfaD2kUFogMvcaWD+gutyOiY3fSlRS/z88MDU29AeiPEnTciLjh67bqcxS/b8BIF83AvjqjcuO2T5/Yxwp0QD8Ecep2vk1ZQStXseh8sOS9+KKIx4WWsMe1i5wDdoR6qUToHmAuJq5ZPFc9aLVEpY9+60mSyuILq+hm38fPDnmsh4xGDr3R6sx0u0DdsSOiY/dA/D40MzNzcq53RFg61paZ+jc/3Q3oaH+PRlV9f7dik+04Z36gHeqy5mOYSUAY4kuyhEkRVDKTQhF2iY6XvpDlAmfTMZ1Q8p+SJdkS/DO0wRAZHUlDwkCYLugMo372sM+4duNMrw0DlLWuTkB/5MsfDpZoNI1GCx4BRrG7J9MF516cvSdSHtvyB6Z+8+qhmaEZ//w0Ijli3gRb7xhvbT1/Fs3vOoznXdt+eH7Anp/fU/cZ6mqwcFazhYAmRFXPFy6T3nSx0rDShi6lpaWZ+Iv0vytcQ9Kafld4/0oK/h642zaC/qF2tM7ZqjKjHj/lK1wrk8VWUc+tqfqPfVb6rygYdKvNWUjQHZEeuzNTv3X1zBC8++wcK9RBHKu3b67+KHrFZmZiegKp3efvadQ0HStpPJTSiEk/s2iSMFlIkqBkWLjUEnVQOPo9hd74J6XmabnExwUUGgRNMQCVJ5mKqCOvVCjksviNnWD+xid0J52YK9LJvVs9Vg+go5IeqX1mwnXtL6sBfaZnbrzfy5kD+uTsYxjVZmXTE8ijul+bcmqaXCmZuozkmDQZ+4bvZhL7u7iCeWz+UHeHZf9A6pVOht7DOGO/5HNC+dDvCkkuTVbqRr2FUXJ5TDHd6ZvFsMV8MCfo1B5X4rQiinMBeqTH7sK/k4P3z/onO6hE31wOF+/FhEt18O+bYvBsPqlxYP6NFF1sUoxeVpu3PZq+6bv+jojNpSQQ/mUt/Y2oJDK90j3qskTJs7YM073dE88ueKwo0BUQQXfm2zweV4Wj4bbI9+7k3wn6qaFmfzMsvaOsvHzz5sc7Jr/FI3cP5KP9HdNHRjl7/JqHNiQm5phLS0vNqr9FI+AQ/g397qdi5sh45cjYNhh68rYqdOVobmtrLrHaBXR0jnNq3BWY7KD4f+HdMdLl5qswSPjUrH/WW+Zt2lyOBU0XN3zZdvizdo0Opi6RZvbPe9aa8rZXppYC+yWhX4Ioc7x4zX8ogyohrnBsRCeVSWPd6MyBMO75d60au1HJDd2aD++OMr04e1WkV9IDTbGr2TjxR6ZGmgAdaoLQl2KKQjlLukQtT3aOHtRKUmsTzAaDOVVlUN19EXhxoAqWrwCPF2GLAyRSGPRotSgiVCsYJa14/6V+POIvCgdOh6HCnV0WOyQVkjr+8dEqJQbobfOh+84kHr2Hhhkl2t2BHN7dY4dzJ+iR3gQb0I2rV68+OXSq2T+GiUTAvJwGMXSMtb74FQawUqucLCtzZCxDKytIhZ2bDWbzXaUoJtkCtrQjGRhF5AOERQ7LUqlKaz8o2s5CMEpLLhNGA1G/O8eMDI4vqQBjVYCxWHABK5sY1qAqlW3pO1KD+lq6iwbUzrZ91N/VaARyJajbM602K0Ff//8I40QoR7Y+2zzV3wHomGagHD2W+xbq61hTrB4zgSsrRpukcXmplQkMuwGcBXRKxF0FUhw6tzl+HYeCC8fPpDIUrGq4/z7UARhjLnoDVqADc8zYXVsAp7LMsFesG4izqovPiZ/i3Wb8O6Lljlc6LFkyeYYbw6j7T+ABvocawZxBRxPsphoy9PUNEd8EG/LvgH7y1FCfvxdjlci5l5c/3uQde3/+7IEujSY9Hk96iG15JV2O2RejDQjmAB0enuMVG4LLzgRsPCzLjwUboMFbixqyBfVg7UwN0sJPIFdQCY/C3hkGNlRhW1oHQJZDXqEiaJCY8WkSuf7RI64oqWxDBXXRHK9vnbQyQ2ctM4jdjYx5dkPEN8EGde3NsPSTJ2dfm+4HcWLOTP3nFz89gIKPJg2VayvGXNK41LzSHANNzmYgczeosMDAyJyZiSLLjRrsDGT+woI5IEp0RGQTPsjO3hiv5mchfhpJxY0z9YNUiRne/VIivuyv8z0Tv0AfFvjoPEmcdP2Rsi2YxDDD09k50DlRP4/6Gia/EtBLCvPdFcy7R3LnuGX+/SpM6XPqDX8vG5UI6Lko1WfbviBT1ynloL6p722tRA1LTzVjpt1S4AFmLEBvZsmMb5e5ZkInQjkCgIMlUtFZdeJWhyMjXh0o8OldXMRcba5EzCjBtUuIfm60M+Avo1bBw7dw6PhAij0la+KfOnIvhtxruaG3tfZaNWiWoTI9HRU2p93jAvTsVf+LSnrgrsvqq64aPTmKqWAGQtCrWp7/5vxiu0ajNElQV3eNrY9TqWoNtTnReai4gTJWldmMhC82NafUzEt2ghBiCE8QEKeAHwiV2bLYCnfxurRAuEVXuO7CO8yVRZi7WRQJAm8ohbkHEu3hdXJSS9W8nIECn8eY42qqxHGkCYOvpVtcnaePeSfa/Hs1RgZdqU2HoZdkuisAPdL7SS3VtddfdRLQR/unezF1BJ9lYHNV5+hjR8/uxh1nvQzNcoqOVzZIYNKlhoLSVDXsKkeVyly82kypqLbWHAjtiCxosHAPIib8y+dZrNGYxsjlyF6XIGIwlXgp/AU4fVC5PS8BZwg5DwaDJA0qIXaJ8TdQrFZQlKdGVMBeIHhzwd2UqhKS3n4qQ4tOsBVUSR9r+6jTak0xKlIAPVlphKG7Kph3v/3/Esb9xt619jRSheGE6BpvX/xqNMYPpzOwp6UDS5nWKS0FKVNoKQWXyTICIQPtwpRU022qRNLqNtWIRkSNlyjRgIgXdFmjK3JxF3XDHe+662U13i+Jmpj4QePzFjRRoz9APAUs204bec7zvM/7vqfnbFu5C/dsbBx/Y2b08blxgN5+TTuienr2gVe+RoGm1AeqMyk50y7JgDrLw4jpoBaLy2pxOF4SVuMllUa0r4/LxHXkRyWEHwAkpEn48R+CCP9EuNLjSP6rnTfF7OKOSgO74jA0Go/5o8O6osg7no2MHzmEP2ZQMV628PL0gju4xsNFHpPLeBJhvv1edNcPJSoOV+pC+0wuaBHFjhiOA53DiplDWDCz3SEMlV4xdHVrAfTYf3sV7N9T9Qv3fLSxZ8+ehfffmk8T6BiD6bnPHqBeW2mbj3oWrSPTVlaC2AkrB1WXmRJWw+F4scHlOBDDVu4OkA33/JXAhfiOIfvxTwQGXVcJuCjGEhxclhr2J3IdrEBYeoR8IaaJrBUZusLl3+MyvSIgpDmBu7gSxgHPw/e2myCq+4sMgxp7cTyT3pbepyAuFIFU2b1v5p5kmyg0NeZwYtzmyQ8WDtYT6PjyIV/rrO+9+26Y9//2Zxz+Ps69ZA9hvrH++OPz6ZE0UEdUT49vPvDKS588iQq1BKqLNdNEddDbHwYjVdUEsiT3Ck/hT6/jyA2PLAMhgj0O0haCPeESB5bEWPwSJ6bjJoe57O5KtLs8jEAnZhZ4ChkoWjN1xv7w537ATeYPYO/EijCeCQrTuxcmWJyvram6zLj8ssKBeBzXYJLRg3i7uN8daJ7IdVwlMmsm9+r4wuu3vtl5gAI6UMeRX/VXH6zPJAn0XVON+93Kgep7jr+x+dHCxtz8YAF00ve3frn+lq8eghRSVBe8g4t2BuOuxtW4gT+mjJ9gJmi5hoAqa6nUmilv12pUhNltdIjp4D2gAWaAn4APq4CdMWbbn0i43JSeE4wUfOP+8Nq9qqbIOwJAj9A3feFRihVg/HayuD3w0kpfUVZnMpdTL0rcX3gtmgsAXKV4Ibsjy4cbvaIgVMfwecsjD35BPdVSYjmN2qHbhpIZCum7ysbROO/CC/cc39z4aG50dD6dJidHoGMFzXdfI2sr9YlMloTIdYOi4Fcr1RI4dyTrKiqqmAOcrxUJ0P9saq1BZCWES5gUwA82Ek70l8cduktwFcgK+ONM6NufaG8MkBMAQRk9syT7clYH0eU/MjkSgR30t7W7wPZtVSjIiOw56rBxmnXLLSKjRwvTDQNvCOht4uJEwiEJDOqOJP01Inr/TkjHAqvgwfr8EEB37o6m6l+s3PHjm5tbm+MbY+NpUL0duKMs9y0M/OdYMdokyDLzJqaDrEQFUbNxXa3UwqShWWay1L0tTIaDTzn3sW03B3EnzCmb2gmtBEBcw++arIH2uBIWvmF/brVB2vb7sg6E1KIGj7qDecHV00wI01dBrFUicLyAN+YdBn5ybHjmljEp753Yh7lJ9oAuUjHTkF+oirvmjetq3IzhIw5Qd+xpP3cA/0MEeoiAH7piKJ/clUQvUH1iY2tzY35rdiydBuaJ9gSiOqj+0/dP17f5QGEm7ZscaeIyyXNck+HiVL3SwF+Yde1PeGV/iRptSXgEKq4SKBhAihrwxHS6hWU/6jqFe8R62WTulkw60ccJ3TgmBQ8XDXs9CmPbCf0fvN7hLeDGNzL5gm3HaxdMQupehwHMBefh6+wCkxH848CdnADeVufuihkQPcBYoCaTS7/1+oNvHjpA6+f6C9U4ePf6fDKfjDmHd1W+9gfVJzYxpue35tKEeuKmRPvq4NiHoPpDB/p9EqssYd78bIsgqyUqMK3UyC1xNRyNCw1wZCIEVm1w3hQAZJSz4Sk6uAlsCSrCmChP5IO5It3HjcveTKZ9v1sGVECUycMvu214AYT54t8rPJAEulE8ILUIh4nwkBH8ToIRVl7sM/CW8r7mN3rtuJRSAIrpNCXDYe72uN5YbIQSMFsmn8Zi9w9A9CsJ9QLo/cGrgwWid+2yfG1nq9gLJya2sDl7fmt2fCQ3mEgQ6un07M0PI1fvDzVJcNBScGygTgZ7NZUbGp1yp5P24kOgsWa7UCIzW8NNwwGZTroEOJwUHkxXMU2AAe4Qxynjo7tEWjnM7DFnwikKsh/CzfpedHi9EiAk/w3gigthnhz/jiPAVdtfBdlHIsGVoiJDqSyR3QOb99xdgZAuw0VSWhnGgMmUqpaPx6olBjuXyb+KTUE3kKMjWaP+WqgM/bXSTC98nHP4P7uf1L9S/SIcpX58ZmY6tzlGVL8JsGPjqLEf7/jmqyeuKKsC6MWsLbNYzeSCQQPm8TDXQUW/4m0fjF0TAEHdti4K76TMFFWNEgJIViuzYSAHDPwFhSgwscBTmQVczliiWmT0TP1oi9UhyTJJdDGpNDEahFbpCiquG4U5QJZdw69QCq6knu/T4fD4y4dPLwVFVozKADEdw+C6pniqYivXuWyyLDiSmaXxjZP3zRXaa21lAD6EJTNDrUlgDtB3Wb72R4FmeQJk38zPzI4D9ERhrK7OfvfwS3cdqC9r4iXFsqWjuRnyq8VVckkUncnUmd72RG7AKSHRClR3vYzKHApqcRl6TkkTfcnk4VSAz1Vgj4wvXmKAjCqQaWp0ZgY6GMMjRffa7XUCRfSCG0MyTtzWieVhnWy/HEbqQKYuW4JgrnGFZ5cbNI4GzvDhlclciMHV88IVKkrxOnMEPPbjO0RvRJL+FojeiZNE6NTPsrayNiTpV/QA817n8C7qr/25QLM8MTUxMbOeLkT1HdBjYz/e/M1XyNrqAvjjsjrnYYfIeVjXoJ+axnRKyExP48hg5nCHSA6/oetFGyBkYQBNZDZKNKCM6KoBPM6BubZtu1XSC5lLNmcyPWIXBGX4ZYfdLlKXPUxmjcwg6IwbPVsu2Di6B5HAfQyFm/rzN+1TEPqNwyub+aTEiPMleByzTOPcE5AqBj+8xoWILjqcmfSrIPoY2mtXAvS2vVSRO9BTmrz77t6ks2h3Eh0Fmuch8DObM/ljx7BP2DboudjqW9/d/MxdT/b7fBLwkOzXDTQJzEDypCuqEjeyflXlAc9NidzIWAiI0cFp1/iYxBmCso7oKmu6HqcgC9ePBRiGGkbOhhmgInkD3XGxPYOdhMuY49EWR3VVgecgOlUCqHKPb9SDMFNAXt1A+Tbuz2I66VzBjJOO3u6wKZXF+qNvnJ7PhASGOcHDnDwjx1OkPsn6xoRrH8TD2xjLrI6h6n4QRCfQQ3RMUH3PFcGky+WKde3CfG2nrX7R88szGOtLWwt/gJ5eXf0I24E/QW0XQQbVk1OJCkFVVT/TTB001nVEVqmhPZefzdUxJnirG/df08RkXgLDZrB4HMqsgt0apF1mwFIOx5HhG4ARtVhIAJOcAD1dPnBT9T47Ej5qoVAWL0OoKb/jGkWFMHpoIL0WZ0bY8HM6DN1Uii7EOcno3ty757M5dFQ4gwbRjSIKNwMBT93hDwcbkaNXVLuwpeXWra/PowBbaKpWbVv3UsLc5ezapUQH1S9+fmpmZnFm69Cx2R15z2Gsjr3+wLWfPHlbqMrCimWx9bpFq8TjlVElqihwch60QXVdit396tJ0RAHq9khvcxf58WIy71SC19U4wauoBoRXo1CuxvVKTVUBJrJ70ZrIp2fzI70d1RZBpho98jNQlvQBQ+eI7Xi6TikYBXKFgeeGogdSFw47JMYrh6feW18fsorczxjjSphzFudGwOZpqv51uheRg9kbM7HVwV++ePwpsu712BKnLET9NRC91+V0OXfNesi/j/Mven5qEf597tXReaL6/kQsk8u0r44++MKJJ56u91WIcMG+zPRAlQw3pbA1ns1yTYoaZpzb2pP5ucN2KGmdPZIcqBEZxV7iuA4lr4SVDgMNlQNQ6tIZcASVkAEq3ysVrkx+fnQo2EjiDsjRtFHDcGnhON1UXS8Yxjj8oxJWIC0wglANm235qM2NaZZ69L5nj+UigsC5+KIb16ksGoeLY17r8TdiNZCfpo4Y9jG95+RnSwcoXesG6CTvrUPdmQLou2nFzN+ytoufB9enpmaGptdx9D1Az+ToGM2xzx78+ZOHbiv1CVBfKTg3nRSVLKiucMMfzUrVN9XpXI/uz+SPzO8VSgRrJJibDImItYXCCkltVtHIAYSZ6o/CupOnQwIWVrOk84rkg8Dnh4LWQv21UFGXZU4CgkCg0nMNpjNTUXRTyXJIvsZsgtX66HKDwWXmPvrt5rNzETgNbkkcr8P7cEPmmikEQu3fLqLTwpjNFcsNjqycnD0IopfRKPTYekojyUyvq2t410Z0GudddNbUIo5Tn+zcms/nYjEclksKn9784pWPsYSmzCewYqUtf2zWJ0BfU4rO0VAL2BMJ+DbeFcstvZ+zMKnJ2tMzMlIux1UQ1gDKcVXRWZRn4xrwRhQn2InjUURpmHyFidWJZLKno4KhuQLESRE0lUHBVZlaergky1I6B+cNppH5MwRrVWJPl1dnftn5xuln13NW6Lw0sDlWIemweKqq9AneyOmNTDVqRYF9sfb00sx7p3IUzguY08BBwkkM1/Dua7X8mepnPb8I1Gfy87NpkDwTw3oSfM//+OA3aLEWvJxsqR3fHAPqqkpRWotKoYRzn00R61y58TObmXJBCFiDvZPNFTIDfuAnB/lMjavQa5V+khHnWQa957ijIQdnTfZkpKNKYNRS2+6m6BwXcYWyL8OvwO4rBpkHBW+rZ+OKx3bNnoTdC2XoW37j2OPjtULAcfT45GRS5ExXcLnmlhzLKyM1VYIs9XUlVgcn7zs5E+zvB+Y0sFSqPljaA8xB9F0c0Wmce9lZU3SA/vTB2TlQPIMRw3f+rS8fvPauA0Bdgp5WBec20lUMVjprwCsLFde4XNXVgSZ7by49v9kDrrsR1hd7KwRTNzVFz3IEf1PT+XAYkyS+xo0sUxVDXlPWeFRXkaubQtO+iFUg0Eug51plicY5VFpXNROazqHtJmiuZT264nFzPKYN/5qwU8NXO7ry7JG5YHmFd6oZO0Z1MEVlnLJIqbr51GIvtEm0de1vb8deUp/lS4nov8t7sLYWAR1EX9vVRCcDf9btt08dnp5N5/EF1GPguxO1rGMP/HACn+Evq0OyLoSGjhzpqaBiHM9q2YDgzNT0dEQqquyZwczmdAioezuG0tP9FlHhLAtqM5RmwHeumyYDhBysVQ0dd5gpa5Tpy1JdSxN1ZdFBkTk3TLAaZo0pyAp10NzMZmVD0WRItxsPqW7br80NbWTdXt6zdeTZpTILu2Z1aXx+skwgJeGqh4Wcv+5xVlOKjmVZgyPT753cuvrK0u1BmNcGy3BSc6PLtbsj+g7V6QTOe2avnlxYyueczkRmP0J7fv7t65+768mnS311aGhd1Tr+/mwVM7JAXc0GxOpYsqenwyr69mUG86cHrxKRIwWHRudKrxINBWQ05BR6M1pKz0Y1I8tTPKqYKvOYMP58DXEdvo4zD2O0LEeOc11jGuYHggJ8gCR4TEM1mKkZBlszs0Kfxy0FbBMT+62iKMldyyvHRheGRME70PnqwtzAVZJiIr9XJa915tQ1++oE+AVnYrUdx+iu5NBdI8RpoC5T2poB6I1du7Tq/ueofhaOaJtezOXm5gl0rC5wxjLJpWe/e+VrWg7tpWaa7+D6R4NNSIyIlFqgLn2o82BnpMJibURhbiO3d6+lzhrMv7lQWsE50vISTa2kxpwpud2qzjVdgZtHwp7VDYT8LC2ToNyacfRMwW/EbR0hXNchDWpUcjA9C7h1Fc5dV1K64rDZJ04nrYIks76pb58dffZgt4W1r46fWFjPiB6ToxwEdzl4aqYR3RvB60pgEf/EyffWD/T/Lu6UrgW7Ie6NjS27PaL/TvXDGNPBhbklAI7RSGF9CXU5rIztL0OxjYm1h0ZHOywMPhz4uZty+ac6D0aqJdGezKWPjSaxKU2d9eozX86GJAZJjvr9IHTWVFNeh64M8yiF+qypS6aSYlGWUqlHYiicauosa/IUEryCpitRJvUF+gwFb6MaWc3ETPDYbDWnVzIURJCtnfPRsWOv1oqi9Z78ia/X5+yiqCh+jaWaIisftkcqGEqx+2PpkclTJ9Fp6S/1Ae8dondTRHc1tuxu6/57Bf6sR4/SaYwjB9fHk0AdgDvvdmbyCy+88vj9T95W5qOobqmdf3+hu4kbYci225fM33VXZ0/EU/gIyf1H1odEkQd8rZ1vnr7bKklCwAMLn0Xd1B2QNIMZqqmDtCkFpR1uaiC7oYWphB8ma65wGHc5a0Zh3FQ9ajCV4doiTRJTtiIJkFsX78MpLLRSU3r5nA9funautVywDKSXTsytpysE6ryxqGQ/fOqe3pAgc0dLIpbGxu6nRlph3fcS4Li1tfZcmUzWuBob1nZ9RKdx9mVHHz366GFE9fH5fMZVAB0/86/e8MALHz/0NHqskFVWNXTsyKEqIatpqum2dIzff/+hoYi9yeJrzc8vvL/eakG9+6qe4Ppn0zUhVPKa+mw2j9ujpTwG8ntDj8bXmG4yFVx296nosELY4yYiPQK6HjWjqgI916KCphtRtUjt8wTcjgZHnWh12Aa+/XCktk3kMndfc/zb9WtfOtQtCjVjSydwtmMEzk6mqntdzanjOXsFZAYuDitB3js504stDku7fTtpOiI6Eb2ha23XR/QC1S+49OhRHMc4OXlgPQeqF0An1Jfg5c48dMWV3RB4lODzo6NBEaGZZd11oZH8/Yc6hyLWq8RQT+eJr99c773KLYi+8mDuyGebQ/W13ZYqQezLIv8SHB5BS5Hmp3gRZykT5OcgNZyeSa4NCYFpcC0ruFNSYC1gKGGNuwMN3psqQqGaSKT5w1MzV/eXiuCwWTT14bPXvnRib7nYdDh/BqA3N4m6ggzBYQktn2quQVFXMrpuSgyOrdy5kqvFlqZAnEAH0VsR0Xsh7muX784++t+p/iKojh3Ae9MjWBqMgU5UJnNoaeGLB555AsXrcoAulB1ceH88JCiQZzREe9L5Q0C91WcRQ61LJ156cz1pEUWhvK324KEjH7yf62nttlt9TYahOQI2t2b2RbmOG0jt0fqkPm6oDK1axXRICAIaxF9zR92B4YA7FTXUbJfX5wtFajs6Bk/ftzVUWoqtnxnXX14+PfrMS2du6xYszTkQff46G4k7eC5aIyuLLiuSCBuI3j64dfK9ySB8ezcQ7ybc23rKggUb9z/R/+i7XAqBx4nDY72T6W3Qk0n8yKePXP/NiYcO1O+lCo2IauxWb3kF6mRRr7c8V0C9hw6DsLZefealx46M7y3s3Nd/4IrOrfvum8nVtlmtlqY6q8XhCKSYsqZFofTg5RpLBUzgr5qqaQb6bB6PtiZEPVEJeu7osnhsDrvVWtYTDCanv31vore+rByzSairbl/ec/rZr8883V1u2Z8mog90cabIfk2qC3UsrrRXi0wM7HMiR7/nFE7tqN+m+d699J/W1jIiek3L8P9E/yNtA9WxZehi7yCiOsiexLg7g098vnbHp+TlquDlmKV1fmP6inLw0uP1VnUMvnr/XZ2dQbtFEHxDQ3d9/ciX6VrAYxGvKm/tGZr88OS3s72RDvtVtKNol4gT+BXoeUqLUhkmG/AYOl9Tog4v6zNTbmFNSqWiHq/ksFmvsdhDrbW9V8+dfu/UbLKtbK9FBJrWzMjGh28vnHgSmJc7xzqB+Xy7xLmOnq9HqM19Nu1Cc010tBDR37j1vpFW2p0cH1HdS2xvi+ztIdBbWrp24RLYf0rbLn3xxYEB7PlfO/dqniAn0J3OZP7Ywz88g+UUVaC6LFb1rL+5UCYpmkes9lb05s/AwQ9FqpuYxRe5+okzN742d3Up6bDAxL21rZmZb4F7JtgWsVstdU0eLHU2pIBHN1CKNdxaFJqeBep9pkdy9Hk8kuTu87zsAMeTwYOH5n784IE3X0Us77YIosxsje33fPnuDXedeejp8qt81ZOHzpw4MZ+2wcMpuj8qhHpOf5i2wt67W7DosnnqnZMTPf0guq+qCsCTda8lovc2/sbelcU0VkbhxAd50fjqk4k+dNHu97YV6N5eOm3h3g6d22lTupCmt6WlEDRtwwRtimODRsYEQeNALGpGUUvBUeI6bsMIcQRmcZxxmI1RUTRjJvpgoonx+4tL3PXZ/myzpUz47jnnO+c/5zvd3f/DXve/Lsa+Xt/R1i+MHPoJ9CSoLkz908e2NlCM1TkJl1OPjJ8fwdZSdCVZvVQOpk5QVzth62y6MvHlidMHWCTqIrhjMa1icmNPXVm+OM2yAbXap9NaujV6i16P4k6QJOwwdaThWJenedRkKbSb9Bmtzsw5hEjt0KkLj586hDlTGVnjoAGUA49cfPz8xscYrYzHaftbkcnJw4cP+DTNO3bIRe6dHvXc5iMOsE1jAUMY789cfODioIp4d7NZRxE7Z6K0kMQBjWuka78x9RePQDN02vDGGyNw73ivf+QPnZx6uzbvwsULqrFOZvH8c4LfhCszi9OpS5YnJ2u1iBAF6jQfma1ujJ+4Mu1Tc2YaCzikEiluZMaOnQXuSYjMKsxOrVRr1RtT9RStEE6MQptQXrB4PO16jXaXTcEpkkL+wDcnpzY/TGOG0k9eQ+K1dnQB8tOHJ6rV+TaovTPH8xMbGxvlpFiOK3r03mXtY+trA1YRUvT6RQthcZFe4tzNOLK2OM/YFXiIBVh6oy7zm7Tt9SMvHunsn84VZ0bKwBtv9VMef+z0ZGW+l/bKRWDwkbfPr1KahDxhEit1kHmYAOpp1gehD1oVmSWwXzh5HHuNORkNwCRif5zNja3tP3t0JhlolZlbFdaMPmN0F0wmjckiUbotFgw8W5XO3WqOAXV749KJqdOv5A29bXGZWOYX63QKW//a2QvnD1exbAQrAiiZby6fn9zIx1iJkQxLueUiU8e5K9MODZorSEDvemv/8rEc7LyOOWWWxV18VNbqgKE7Wkcbhv6btO2mI6+/DtDH2MFDIz/5d/I5tvjN1MIEhODrDF6nqo2fWqKlKLFlPEqdmMVSxGo1kmbVsG0VH6lUqhsLW8v7jyNlY8g4HOKsn2JyM2tnl88NCg5Op/fq9ZZC2NOu7LbolaaMVelRdtscbXw+NvnKyeWT4yMhVxtlJxs+aFWAzwHCrYWPsVtiFh0wUik1OBbKY01jMSCWGNFHLw97PM65zbmkAs5di0Horj1HH7pSNqi2DZ3CiTM+mc+RdOD9/9sN+RfnupuOvNgJ1Ev8ahl9ZCVgXh//yb/x+UekXw46NAjWlGvjroOCTILkK2jyOMXqYr5SnY2EBLXVK6VYHr+pVicXNpc35/IsH4UH0EmxhsMVGnnt4tmzLyQ7OJtdrbdYMtp2j7XdojVb99psdsYn5DfOP46wnTa0AW+oy5s5ni+uHl1+/LkNrIHFItheGeKFbShXHImVWLUZ17F9ZGo5oVEMXTlWioJJKLsHhro6n3pg/wyLW3Q4BWBOjk9F5QA5rloa6drvTf3ma14/ckfn2HQkP42s7VdjH7n0GCYa9xkCRIdGR4XefOZNgzOMbjeNyOIR2dn8RKUyH+JtSo1Ex4QqVWzTqFQmxzcfWH+2xLIheGo4+Xi8N5Rf3UR49/FoWlLbJJaM3tpt63DgjrvIxz7cmjr5pcHQBsjriKsdrf3nls9uvVIlRo5HjgbkYkcrngSBjdrRnEuUD9CS1Wxhjx4dS5qbRZYO3LN0Pru+fDzJAHLqJ9BV2yzO19HaPnpDw9D/UKE5cuTIHXeMDTKDg8TUtzEH/5n+fOruCbROcVKgLg7U7t7akGlwyWopiEwZvx1wRkKYglIoNSIp3TZfnZ2fxanmITu6fOrQBMRmXQCdptsMxcHjZ5ePCZGQimpXYtBFRvNJPhQZOQi2vhQxtJEdEnYzp4j2oCxz9ujqSGW+QjYGAXJ4GW9HlGeL2NcgFcnJHPxO3OR4gtYXNh9pVYDFaVvKg2N7mh46OsbDuccpHDswD/hoJikIYO67GunaH7nczUceBehd00lhqPyzoSdxRp7DxQuqsQG7Fymzl8nf9UxMZtqxEz0uaIzAahVVvLcXgVgqgTFikwYvROZngXwlVJw59fjy1mqMiH+QnWtx4P7m1vKpckTgAw6OKhX53tjS6akLz8XSvZQYNo56Ozu9tn/5xEF49UqILL1WycQaSFMpW0su8jKAXGPEkCPmkjUWk8nSf+JYWV2faBkYGOp/58yZR8DiSCWOMtdBZxRmX5IVHO27GizuT9O2ax599FGIkPiSQ7DzbcRh7MIiGW6rRXoZ/MDRMMdPPnPQgOs2DL2gNw1aYE5fGSuywY5tSqvTD+jsPPYm7ZvfBwcQyS+c39xcW80xjIrCQq192Iw1fuXKgXSMF7DAfOng5slPD4dcvXTc77VaW2c+wEL/42/EQvOzsHA0NdI6qQmXcal2GztyCEKH/UcKchG66lGWEWWkFuXe9UtLPjB3TXtLV1f/e+iFzDGEuduBOTkBnrYlWdC4XYVGuvanaRtA30tQD5QGfwnqiIexA6fv+2YSgVvllDffKjFXNp5cpXVBMkOK9kU0Q6AFOj2Sj0RYFM29SK5xZIEIz7p4vs0A+EIHzp1d/mCMcSEX642rIqE3z15Yzc9XDp2eOvnm7Dz+TEYxjDC3f3lzHFyObH3DXQlq914JjtSDBpyWt15bnJxEKQiztDswUZFCZ7RGae1Y/+ANQYdHsb21Z6jzwR8eemrQpYrHSUCXycDmAj5/1OEQBEdre+Ma/c9L8Ddfc801e6EylQuMlZO/uPdirvbh1+8+P1md7w1IMWDmdVXePhWROYOFvgRmEgq3h7NOSogtAXYs8rLbt5Hy+2UUhsKZ3nkYt8EQmwZ7XyuxfFvADxZQPbi8+fzW1IUPK5V92KXHQPLp+AXka+l5MD+Sj3N4HVLZk+hw36b2+YTaxMRGvqjySjD3JEJ/NJqvMkrtBxcfqY8xBrtbBrpebPr2h2kWDqWeotdvWngqoHWQ0964XfurtO0WgjrEI9XC2E8x3ZHMFZPCyHHMOU1U5hks8EK2bpg4fzBk12eHw5YVNLqiQ1ZsZ5F1LS0tlYpRmy0a5XECOgnX4eANZGUj2X2XwyXM/tcEGdUW31fduOvxBy48NzFroMkSbH7s4vKJhQp2N4O8a5xOq1JpFZk8KMsyjCEUSccmD1++vJE3oF8L4RyDFInmjDxo0T+1fy7PIOaEC7uRrl3/3dV7R5AtUDgAnTh3hvZ12Ajm7Q0W91cO/oZt0LsGqJ7BuqkjGOaSmBBYPP3YS5PVWVdguyM6cnhroVdsgoeHxAtmDbIJr50HNiOQ039tDnOw4+MvvLCnG42pjmQxQpw6WYIHnn58//K5XFvbbPXjy9+8vVgJxem2eCB5bD+IW2h+Hzi+2WsJooFWnxVJRl9864W1S5cOHjx4591vX96Ao0G7MxI1xBSMv8hNVs+9Z9YGeT+mm6Amf0fnW+vfPjXAA/PtWpwsEFfx8YDD4dM62htF97/hcnVT37u308GAyyXrR0BYL8YWLjx+90Qt5OKAukiiio1vHQigRSKcESk1mmHMoHhpVOQisMpKOh1Jp8G8eeR4OoeDcMEiD34P2F0GofzCnCsUqk5+OZlWgeszpZlzF48dSGN3ltcr9eq4AG7h9RmiJqhgDLOVz6qhCMn9KxFejTkmSF648RYMKj16Xc/60ZmiDD21CdyzdO5putp0R5SKY4s7OVQcET0QR++NQ9u+q9Bw7n/D5QD6o7v3dnUxwmCpuA06eYstPjf19Ze1ioGXkY45cWTj/Kk07fQEsynSBxMOZ1NOryzARgB6BdiHgLkdG/g1ClS9BUEoFlmmrQ2gh1x8MRSJxA7EIsjRdGr1HZtDMVLBiUs0UpNSwbEs69MqPfAnVqqXLMzFi6Eih4s+CaSH0TMlzcgxLWNSmnPn1iEAKxFBfbSlp6vz2jP7+x+GlQNz7OEnm91h6AxAT2rbC41a3D9wOYC+d6AUKJWL4O5AjCWWXlv85IlPDtfQRuMEUROr0tjMydII631uMmxqdKMfHh0U+FH3ulB1p+wKp8eI8VRJaxKHwC4IvMvVS2A3YA1eRAWW5lT4fbm5IoOsGlZuVqjNaq2aZQWU3FCAgVCUDptUZXaO0uEfi4jgKCbeLBJMw7p3mfm1zblBdEjJ+1K7MYr+7Jkzz5YCFA3MCehmUAcmoPLhIKAXGrW4f3Dwo8B8YIhlBnNFgE6qWTDUYmzxVSzWn9hnIGFdKu6tvXl6wSVWuvvQn44Yi+gOe5dKdeRClByNxAhfLDdaW3P1l6jjDtB79xkioZwLhM1rsfuj0Vy5n6e9Yq9CAdUvXzSK/MqnEGNEeieZZwVtlIDCQ9HmNqI3SzRQPOieFaWU3Nzm2mBU14x26d09XWOdTVevLSOgq2hz/aBjJsBTUYK5DyyukaL/vYMf7R7dvRt3lAw7lizCtTtAhQSckTenENaxP19Fwjodqj7/5CFKnA260beO+TUJWfUQzpqkJo2EaIWIshCbCjeHNT5c1dUdPGy9PJaL7zMUi9ii5DXbZWiL4nmfVuHHpARAZ1hBwPfbZZU2Z+U7oCxGRp52yHeKoDoJSQMiTZIgwzLD4Uw7NbP5wZDDg2cCHVIoy7xw9YdOX4Ci/DI7fDsN7x5nGMoX9Wm17e0NFvePDn5ldBSgD+RUpVISSDnqB6jlxx/7CLrgEKggDJ6a//jO80uUddg9PJzFGyZOofnV7Bbh9ivcTLREIAgLtET2XIk4inRRwMnNHCsX2YBU7DSb7cioGCZq80p0CgXHMTxbfzJsGRC2Zkw+kRoMptmJoDS+4AFoTpDZCLRTFiyKkYtHZ3pMGIazdoC4dz575UynQy3zUxThcTS+4MX9285d23Du/8LBjwJ13EyzTLkEv0ws3UdsPZY//djpyxMVOHg5bl5653HLGqOdiTC6nhKkQzFhJNNI+IopcwgPBI19kAAKKmjYOkE9XYwVI0Ly2Bzvl3GkbsMEGLWa00h1VgWHNjahmI4Ui0mlRGREqIBdE8kiIjlOfr0z2BdG7TWM3umUSSsWLp2YyymI9Im2pauz/96mB94poXMDh6LNNA3MVbyMw/872tGubaTo/yJZB+iw9a6BgK9MmJxv+wCTxZOPfXoYBRXOg4YK2lU5fH48pJMUsgjqiTBGENHxiHd3n3wYwjOw9WYyxiTVeW0o5aM6XwPuaZYtrx1PUpB2A+gBu1msMRHI2VAEByRC4RXB0N3NOxO396UgSAWu0AcZoR3kmcq63QVROKU3M8dPHOuxkRaNOuZ73rm63uWQgUbKgLfMjy8qtYr2RR02rbbh3P/VzfqNKwR1MHgqWSZErg65T0D2/eHUhec3qti8TFIq2lB9+5nnXWIU5sLEp4c1JhFUoptRohMlENbJuDFsP4H+ZS6ZI13yMZLCR2KGNy7GDAae1Gz9UhB0jkGGj7+I4FvZQduRjQcx0IbqW0Iuh5SBHJG83iWPSQm9qeBR8Kuba2M+D9ka0DEAzJ89c/WtJEWj2wZnG3gmQPtQvbV12FKNFP1f3azfsrICU+/p8iFvEwjodQcfKdZqCOtfTlaAOrntpAzV5++/rJLaLAjs7pTRpDQND/etEOECeQGPAoooKRjpsNwj5tgiUCfGXiP4Lp47FAKTp2i/10nMnCWYp4uAXCIXQXxWtNPtTiTcK2SGOUsGWOUr0CooaNA6iz4rbmlza9phbZaIrK0I6P1vrS+/06WWUYC9DjpOgJEFHGqwuEb99d9yuRtWgHrL7pYBRj1Akq26obMsbB1h/ZMvJ0i2rgFxpgyTd96/1CbWh3eAwxXkGth3FgUyCM6RS1ds6UgFh6Esl/DoaMpXjOHUagT4UP7Ya+hj84tldjuPe1g4EVbgOW9dSXAnoYEQjzMiYqSgUyDxuPHa7lQWIzBKZUbBFTc3D+XsuNt3dvR0YkSjabmpqwdI+3/BHCpiMjB3tVarbTj3f+vgbwHq3S27d7fQyQGBoI6TZGGjtZGPphDWKyGQOSgQqfZ9cdddMZnZnXIPA1+3O1XIrkBk0B1cwcxxGBE9aNwBH63xWMXg02wSsT1dqyG4x+ZKlB90y87wJJrjieIgOwTIyTYP4iuyo6JRoxEZWsKzkk0ljCuazIoG8oBOdWD8xEIejZGo8fZ03fH0nqeurne2cMSp/3QoCs4daYGNRPQGc//3Dr6wMtq9u6Wl1fxwSYCdk4MCKR/KH/j8q7s3qhWypfE2kVg1e/iZe9IysSVM1j4gjkuycqgMEVEo8PhgkCjNkIl0DKVaxVIzzUeTeTB5JHC510g2zTEBgM5H1XYwcbJ3qS4hvhN5ehYVOREEboaDJpPEHZYkNHqTUq+1qbmxE+Nl3k40C0vvDz394nvrV/cMqOuuHR9AvO7cZT4bAb1RlvkvJRqAvtKNISE11wMuV8ccoRccu7bw+NckrIPCo1xm7q1cfmYhJFOk3BCkWTGGC8OpcMGdWMEnRPVCEJhDcwYEvM+YRXImpSkeyR+St+KgDIfj0PemUuhI0Y3sUf9pG0sQMlapQiJFBKYSlgyG3FOWFZPeaVPb1INXLpWTNErBXPL9oc4XX/7hzLN7o9uA4wOf7LIA2uPVsPRMqtBw7v8hrN8I1Ed3dbe0ctEe3/Zh6ydUO/jYR5cn0QlfH2Dy8pXvn3zF5XdC8Y9MomqgKgHOnsU8REFUICoRKfwBFOigAh2UJzQ63LIEAj4Bt/SM32y1KhRmM7oejfDqpLSOyhvk4hHQ8VpBT9aYslhMWc0wqcholO1OlOdLm1dmkmaJBFc57w9O9z/YdPWDrg6KpoD39qEpVOAZn9pGQL+hgfl/dvDdu3aTHmVS5CBkjsUBmbs09c0i0ZhzepG4BUKV50+t9trbIfqWGtW4U6nhQhahHWy+gBvXRBAGD1ZH1nn0iYxBjUaDVceYY2DQFK8z4XcakQdbG2/d3sQCrCEYWZAXhsOwdcs1wSB5dsIYb89mMvoOuzp5FKOsHK5fLI6e8tiePU3fNXW1BmDiftnPhwvQHDDX2jKZBnP/jw5+pVDY1Q1b93EtyW3v/pOtRzD08ulkDZU5O0GdMqQXTq26/N4E0isiHgYKR1I4RHM4Z+Kom1NE5xdF2j6gT3QhpV4pkjWRR0LERpvlWJsOjX/49TDE5yBRM4w6T5hoDQWDGqiQFRLBjHs4YdEqFNHcxc25skKCicmO1oGxPW81nWnq7OAAOf0L5naO5qJw7tpMpuHcf2TvXH+bqsM4rjNqvCS+wBj/gnOJ7Wl72p26S09Pd1aPa7f1aNfak9F1xhx23DwSXaDBcMmKLItxviAgcZuCUfGGI5MYgogwhpeIRWEigzGBCcSJqNHERFH0+5zi5a2KwovzXR3DGDV+fH7P9ff8/naJxioWB+HWawOBusZCurVQIK9eyKCQMvD9yNgwEu7f0/X1Ow5uW+HRlIjNRNBrYxCBRcwyVs0USwbAF02Mzhp3lip9k9tp3XOSY2zKym7zYh8wPZRMS/3NBGhHmCJj2SZlewkbYbuoiKKVkE27WUql508fW3d/AW03paUWYxM426+d3xIIhdQ/mQdzoWCgUGgAdMuN3P9+Db5i6nW1nnRXI5k55t4KhUJgQVPHnsPfjQ+PdtfnovDrur9905mXYeu+hFmVh52bZVxBp42uXtgreMNPgyKsuOzFb+D77zJAn55jpkd98Owanl/x2mK+BmvFBhMWIxsRm3aSlFHglY2w+JZolJNlLKWsOzu9fUlAYjiluW4pVdzRWmssICnwwNYJODGnfm2AXLp7uP+TA94i6viqjnbVFRa0QoUAjCi+oH39G5ijwfRUa04VOQbraNaPz71Rz6K7ZnlNjtoiNrL0SKSI+B0eumwihbOA/UFAp01ieeyPo0e1aiJoyiVoaXRRLCL6s1HNNSzEAZZiRaC8bXCou8pmsjkpC417h7ZsaCU7r26bv3Thqmt+mn5xUcbDBrMXQndIzbEC/VsGGsLFG9zD/R8U5krFNmBvbgtLdV0on+B4h7OMO+k6NgvOru3oqA+mWGdScnh8bofHZ9aYCfGtJJKtPA50RHTgV4XZeAbVc8TuWA8H1ujCYpSRQdUtD4P2IiOHhUdsMEdlJ182kONZ+ZKRHJTLChd+Kin29MhKcyyc/mRoy0uNYC7hHvrDC1ftnp7aVdtAsEMQmTratQKbChRwuofDbuT+D916ySrCsTffq6YWpTMUzBWgOFx7/XvfP3NyYrijPZOr+PX2E2OHBkLNIC1zPuqwlmyUym0LwJGmV5GHNrADGjEauqVw+WjHGDWmwaA9h21SBvYKgjX6s2CP5JxTRMNWDCRsPZzSlhQHZbk6/RHsvI7jOT7QUvvU3as2nn//lUcbQ1Ey8t8T9JSQVQOkcLjnVrcs8490w7weQG+GrUuBLord4dQzgQCgw63PPfM9qON+Q5Ref8h1nxh7vd2jW3daCZg5sjVkbYOWXbRKVUyZsfM1ZcOwENuXEL3n6eUHpkQvN1C13qDV3gm05MsWqjol5HoWY4mWrHBcWJabk8mqZCwQ2A07r0PxlVdbaucvfOSD8+/vfrQxq2ZDjpwMPSWE9EChwnye69D/sVu3is09zc1tjaFCV2MGtME8Dfaone757Nnv93R2tMf9zm7B1Irhlb3tISVxexHvNDBlI2LYCMFh6FSKBUxqjsLaIxiqI/gmICfMRDFSRqJnv4Mgz0LozwA/fSsatikWfVgArUR8VkwLZPYf2b+uTqLdYtX3gPkr5xG4V6sqq/0JXRWirBAggbmbrf0Lt25ZzdgHU9cgpbsWEPRCAaYOdYxOPPvsq3tGuzuaUlGMLfKZztmXe9t5C/G45X2LE8sl20JIV3wHYEsWg2+JPOqrKNokbHh3gEU7Lg/IhuEU6qso7GPeSpQTxSp4ePTXgB1/zjKVWDq+efLjfU9KCBq1htpHF67ahcB9YUsKg/N/sXRBY2O+yuHuZmv/0q03O9Tpxm+aaAeEAPl11GM/HRlZM4HELS4k0Xzh6z+feHlbPFq8M4HSK7IuxOVGEf4ZG7zzoF8yUZ4zUWID8Tx2gOOMp5XwZQR7pcFI3kBAhyadF15dhOPH/w/4i3yyopRMX3V8++TBHX0S3ZGrrn3o4UfAfPqRxkCUzXqy2ewF6DmVVcNhX8Whu8z/ua6EW+/BJEJzQ50qpBsLgB4PQPi1vn7xG89+9sbEQEd7varXgHr38OzBbRkW4ZnBVOW9b9VYBoy7yqSuazFRok3+RJMZtJGMl6jUWkQrLUHnulGOVFnUikWeX7bh1ZHn1VRxZVlBcw3r+48c39cXlGrAnMajXvlkavqRFiEblbK6BOjE/D4Vvw/4wj4wD7sZ+r906/N6mvHV1twcTdEBjzYoidx6/eiakQNv7BlFyy2H+Skmu2J4dmZNa1CIGRY2vHktuPCikSfjjTARG2YOymYJNRv8gP8xGJh/xLINivAY/A5p+VMI6GwTaT38ummKtpKsEhuEdUNHt/cFOZ7hfHXz796w6pOpqQ8aC1EW3ZssPgT9vmAgGxUEH6iHw/PcDP3funWrp8eq7oG1swKydZg6bB3fM/Xt7c741J61uIHuJ+oqqD/3ensojdeUy3dhh5RZthGpmUbZwgeGjKDNYvBFG/wxCoN8nhozRp6p8lahkof/KxDCeRUbddu37EExXMW1SS3qS0c+Wrc0Spcewi0Prd7wyEZcZqkrRPVsVtJ1HUc8ZW05TzTlg0C9x3Xo/77LWgJ2hHPVDWx6EUw9Dur4wiViXDufeXzuDG0KwTB8zW0cErdzj62s97RFHrytbPRYPE1TII5HAOdF0AamiOWA2YRVw9wpWbNoqqoUSTDUkSfq3qIvmUCwV8XJ94r3cnXqurOfbF4dRWNNVOqw1fuRD36ZeqW2oMKZsyx9i1J1JkVJuqAAuevQL4aum1cqObZeLUjosWaIeY6snQaXO48//hWov0bNl9tr+Nymz88tW9PNhik+R7JdKuYHDWaQMUqRp+xyEa6+WKJOWxlXJOiVnnLJKtloohpVDnkzUmUW5QisvWwni1hmIjWkHhnau7mfJuIYXxvsfN2Wa7/dDeYSgJP0bNQTzXoESRN8BD1suhn6xXDroG5BPdXVKVAHdEgICPF4Jt7a1DnzDJYzY34qF8MwPHvH6NrxGWya07EG1PJGLOq6VDGDVHOrvJPrZYy8hTtuTtpuodFCbp9Styr8SC8ni1gcylmGPMiFfQ0pYeHQ2c39Ofhzr9L26PwNGzYfnTpf2yhI2BorgbmkR4l6KioJ8OiQm6FfrGDuFrL1cHNDdUxrTBfIqQfiggBbx1hj56H3v5/AUEV7XOc4uro+vOPgTEdWrbYNxOeUpHlxWOfxfk8CbbOqfFWl7YpkPQEnj5/yXovEmfY7+Sq4fa5HfidpF5N8G18XnD91bPPSHCvhbG++Zz6StWuGphZiz2wWYqFsFtNxUVVjVZ+igLlbcr+INRpQR+7WUK2raVBH3UvAF0w909S+eO6ZrbPDm5CvqyjNMf7uEztnZkZDgoJHko28UrJwmNu0SgDfDHRS0GdjDBtJnGWYFMiX7ARlbhZieNMuUngnJk1D4e9hG3J9x47umi/QwncNzJcu3PXJ1NAHLQGy8ZADHWEcZqVUVvcBuYLJSbfkfvGCOasE5mFs85WEQrogxAMC4qZUnI74+J65ka0TuPjSnuPxRjK2Bg9PLFu5OKQYyM4smTHgrs2qSLmUGMRbXHiGcxBLgFGARxCPUg2NOycG8wbCujzl7aIoi4NiDxfu4QPq/Xth53GOoamJviWrF5Kdb0RRBlkaUQd7SQqpiN2zsQp0t4d+EXXdraUSFvJD4WyADvg4kJNbxwGfaRqYGzlO1JtSIh7u4/3tw7Mrlw1kOfOuB4viO0zeoMvM9JIWyjG4AlOTQEhPRXe0ZpyKDPGnequJMnyinLSwQxS91ECqb+/QxqV+lraKtdXOX70BzL/dXZfWcLLrsHFdJ4NHzT3ExoQYne5h16Ff3BDeLAE6DZ5nc42UrDsRfC6HH0D9NGwdA1RNfrqxgJX/nbMrDw54uHDEMCPJpyLlYp56qLaFcQmjlLcsyuKcUo2RoEf3LAxElZNyWbQszEz0GEWuJ9mSevLY0MaFKR7QY80oxN2Ns52YC9gJDvGsBOKhrAbmKMuoYG6WXObQxazMlcywr9pX3SBEc+kcpevYCQSLz+GWcf3AzMjJM3tGO9pzamWr5OjE2MzbC7JhO1Gy4bUNM4G+OSoy+BEfgxpvcPM0Lot+GyzepEecTNuQTR9vhe3mWKzw0tm9m1cHgFwSWu5B8fWDa6eQoKdVDw71CnQ9hB0EmiSpQoqS9HDJrcpcbOq39Jhh8uqgjisKsHMhJ9AfOX88c0f3tpHD46BeH3eos/4Vm2ZXrlnhUcwSijOcyVnWXUWE6wkk57DvCHoyhD5i41C38PuELYtmBKOvHNfGWUqyIb0fG4H7BZbn2QY82EBDE1NTq+oaoqEsQYckKruralbXMD0fE3xh8yY3iLvY1G+6xULDC+2MaoFFziaAOJTDJ55BcW4Nhireg63HoyzHMGy8c9PszOsrQskHUYcpy1a+poRgHnXXQYOC+XykbKMAZxmGHUEnBrR5q1xS3uLL9/JVSTGW/ujI0e1LgrzE6cK9j86/G0MTYN6SjiJ6g1iIKu+qihgupqkCBXHuFSboolMvmSh+9PjCDTG2kBb+EHn21vb2V0denaATnmydYbg4bH3Zq4uDRYOJ4NppAltFiw86D3QxYF0yUINFhIek3TIGxTJXtBQRPTVF4atlX0PLx0PHt/fneJbRGuoeAvMte7+d2lXXSFE764h+zUY1nVVjMQrjfGG3EnfxRc119ETCpolaZzQawFVCx9Bz+A73jvbLoZFTs8OYka3cOeZznZsmel/tZH1osA7CqXuLNSbeBoAbTxgI4FCYLSUwN2HStDNT9to2/c3D4QYpFuv6aOjjff1BmpMJ1IL5qg/OE/N0KMRqvwNHSU7Db/SYqhJ0t7X2HwkjFYahIJ7zNbB6QyBA0HNC5ReseO4+MLL1zMTweizxZ2soiO/YNLt8eWdQTeZxK9FU5LKZwGQMiuwRqsnQG10JqrsqllFU7KIcFu9VRErVuo6if97vwV4xLtDS5/jzI0Or0FhDgk7ML0jXJF6KabB0RO4u8/9KSNwMk854n4/VfGEsiwH0VCqXwveMv37gwLNbZ/GW1vpMPEnFObX+tS97Vy6+I5TII1mzFTFBFx9Mr1UsmyXcPEffFbyRocPKkWYr1bL4FB8Qntw7uX9fn4qiLh/rQhlu3UbY+arGtCfkePPfsWtgLsoXoFs3uoH7fyRQN4A9DPl4TKgCeJyoCwLAI5wbnhx5bPwESrIoxFeob/pyZe8LTboZwSPKluIt3lakoiytj7KQqZNrt7028Mu2oiS1hnC0JXX/2dNrdizy09p4obF/9epdG88PHdnVElAJeUVUjgupONzlmAzmPl/Jrbj/d8JUNJk6QfdJUVDPpS4IJ7y/qWPt4WdOjk8Mbxqtz0igznme2PRN77IdD2R9uHlqeqvuqrodywYxPIGJehNDMgwaq4P5QbMkW0yyGclgIfXS9NnNby8K4mznBZqZ2HXhbKf8nIQEXddZMNdZSZOJuqK4Cfp/qxtuIeqEXWO1QCGXA/aKqQfjrXfUDx8a+Qp+HeFcfVAEdT2z6cvemX1NrKAwpZq7SjVl23jHsNBK9SKQ91YlLLrIiCAvLLdpApp3xHz1Ig/PcHxgUT+Yf3x2amgX1dtZ9FHxgaFTzV2LUhAnQ4piumMT/61QpDFKihIG9xirBpwjnj5qiky9vakTGwY/BXV02FP0FrNe/9rn4y9v6whpyoNF80FLNE1cb0H7pVw0UawzaAoShdhk8ilNLcQL6444zGnuVVi0ZPVL63afPTK9sLFRAuOsTqk5znaeRa7G65r2O3M3WfuPBeoJJRwmW5dZFYkbRNyRvAUzfof63BsO9fYcUc+2r187TrslJSwStRQO0+5lC6OxcOZ509ndXqLxeFmJ1gVb9w/tXbekK8vxjER2/tLmLedp8JUG4lgSFejwk4RkjddiMklxR2X+B4G64oOpQ7KkBRqEC9hVIeDP+ONNnd+PHBgj6qOtlSHZTOfaiZXL+j2sbEfQTMljERE11ulag0n5O7bEWcq9vBB9cveRo/v6qNzOSYW+pW+/tH3/XtxGpiFIJzd3vuEThT9nNVnTHEN3k7X/Q1fdSAkWfcGvx8jWBSdvU3OUrmeaOo6PHB7D4FzniowgYmcv27T+8y9XHnw7GFUSeZqkMTA6h4p8DTx7oioyiLsQTDMmne8/evqjHQNgLjJsum8JXgbZuHfo/MLGAB/lJdaRJFXidsefJ2XYus/tpv4/QhneJ4M7JpQ0XhOAXKXUjbb85oLg3vHqM4eXnzkxvLhzQTx6m7eGrV+PcG4O4ZyGfcEP2sUS2FfZVtkuo/Ruo4lelLXoh2enP9qwgsbhGC29aPWOT2HnQ9PzWwqhKMvrPHtB2RASdFaKVcxcucVl/v8I81MJQ5HJ1n0xJhZGjysHwdihXA5PN6wZ+a53loL4jgxtHuP9HZs+X/7c8vZQzALvCOZmbHTbnCtrZawCNZK+1MCxs/uXLEjxPMcH032rN+zb/PHeoaFVaQE9FbJx4o2PzjrFVy2ZjBF0dyTufxOo36IkfARdVjg9HCDqRFwFdGyO8rdvG3n3FIpzw2u7A0kOqZvajuHol5d1e2ImHHqpHLGwmESmXxDU9STZ+NK9Z7f1L1ApbE819i/dsX3LR3unhlYtCvxZhwNySNMlCuTAHNDdew3/ozA1ZyRg6vCpviSvUZruUA86pu7HuOTOyc9Ojc3CsXej6wZjDyF1m52ZGQiJimljMC4hNyPpg283vWGObd1wbHLb4lZU1hk214WwnZh/O72rK+7cUNT/oK7rMUrWIDB3izL/r2DrBv1np8FjDT1vCNAhqsf6/Q/4O/ZMPrt1fGLiRGd3hpZV0Cvca08sO7jTI/VE8nfdGelRYrGknMduyahn0b650/v740EWZ3tuRf+GdZs3ws6nH0nTKkhAd4J2ytKlKBXcncA95jL/34WWW8IEdAqmZB7UcbardMDjFwrim+qHD4+cBPXhxd3otTJQdMHoiV6soQo1m6YVCeuxhti9dkmWPAPbDsy90Z/xgDkb6OtfvW/zlt3npxC3C0EgZ/GB6BdJ1yWeTybdQtylEk5453gHdY2e5BAc6mo0IKh48BLURw+NHFo+cQLUWwWJdpRImbWfjz22rSMrMJGiHW7TfFguIvmXfDw5t30gk0WLRU0vWvL2S5s3fgLmD6MUz6o84XaIOzUZiRPFZIW66Y64XwKBuqlQxi7HkqAeg7ET9FQUhRpEc3fUd3x64EDvGcK+Iq6BOs/6F2+a7V32tl8Ne2kZiRKWol2fHjp9vL81yOosF+jqW7ph+5aPjw1Nf3JPIMZnJQAn6lDFzkU+CaGdKpdc5pdC8OuK49gVfEROUlMkMncN7Rd/E15XHT00+eoZ5G7DKwpUp+HZ+5C7jc+84Y9Wo/wa0aRg/+sH5tBIVVme0Rtq+6jy+hGYv5JWNR51txC4X8CuI1fjeBmWLlMH3WV+iYTMDcCBHV9JjDaBdiqKj0bsg/74A02jh54+NT47gVewFwQ81CKP1uNx3ZX7OoINckSWAqsPTs7shJlzLKc3PrRk9brtG685P3R2VTpHY69Eu8Kc5bMqmOswcykpKzGX+SUTqOdlUXHAx5KiBndOqTqW+FE0F7zvgXp/5+HnT43jiB/oXJBRWQa5W6Yb09Fj3X7Bp3VtP33g9fcyHqrI6A33L4Wdb7x2Gkt+0/Eghe2/91ggXUVzDcjJo+Of515fuoSCrRs2mENKko/5Yk4wR/IgX8/576hfe3Lk5FjFsbcKOqhjdcHa2d7e9fXxri2nJ1/vz2TBnAulnex897XT0588HKD3Gf6cdIaQnrPIz8Fck8jOr7/C1SUTui954KbjPRYTec1HMTzZuqZCfo+//on1p0a+gmNHxr6gAOpYXeB/be25ZVvXDnw0OblvICjBzHnPgv63UWy/5trpm3c/igMjC7EVScCuaTpHyCt27pvnnu2XVui+yBCuHIA6l/QJMdCOOtQ9SN3ua3qgc82zb66Ese+BY8+ojJfhHujAFceZgyOHdixuyjI8z+cWLXlhx+b915y/+fzGewKpKIj/VZKm86IOM5dlQPfNc+38Egv99YRj59QAuUAdQjRHwRxF8Q+07/zs2a3LnSO+syPGMxzrqV88u3Lu4Nsr7uARkWfjfS+8/enmjyk7f6UuAHeO85wnVSI5mnXmyMxJMXne9W6T5ZKLpirI1mUYoshpiiA4tTkJ8RwtYYdrx2XmZ1/uPTf75TC2xMeztOC1qfPE2M7O+1Bs50OB/h07yJ2fn752VUsu50GixjkCdfxMds6LFehaLOwOR10WuvKGWyiOq3wYDdCjJFXDtxSsHSFdJwYmV47NTnz5+drOTAjGnvV3dLbfwWb5LEI4zEvs3310evraR7oK9Hwmy6MiC4G5Y+cc5zCHZMX155eLbpgnQ0nkbYpNJVlVBe0Kenh21e+PY5xmcuvYuYkvgb07iHgdwVmIheLd7+3cse3140d/mb7m7jrcaHDa5zzJqb6SmfOSKOoaeXTFzc8vH10/T1acGXSQ4fkKdax8AnTJQ/1Wf6513+TIyeU/zM6iB9MRzJIpg6Yn3rlz5/iaV48fm/5l40O18ex9f6TnjjsPabqIsx0FWD2pi7LbY7msdN08RYShOwbP8xoyN3CvKBgNkpreOw3qY+fOzU6819mUdUw52D2w88z4muMHj00PbXmoFn8tkf5LTUYiO79wssu24fZSLy/hTqucxBd9OE6DsUeB3RPVoiQ15Q82wbEfPrV8bBxJ++J2mHSoaXTizPjYqdcPDQ0NffBQQU39BTePX+ls54i5I/kWl/nlpqtvVWQHOfAgdVOQuVH0XonoNDUVbMKc7OMHtoL6udnZE51N97UPT5z7YfmprXPTWCxyT9qjIq5j/xQvoSYD5hCwyxGX+WWoq281wMaRDeoxgaozFeg6TN3jD/rbd3zx9fe9Yz/8AOzDa0/Mjv/889athw/gEkttg6riIrLOsRURf00TuQpyQLdd5pelqDgnEveILdPz2aqGcYpoRWoIoZ3fE18yOfnVqd6ff/7h3Pj4+Fjvsq0nD0we+WR+m0/TUZDJ4jSHWEe6LnIV6HS2u7POl6lQpkEsB0J5bBnhRPLrgF6xdY1CupzHcezLfvwZ2H/oXbnssecOTA59fH+amPO8juTsD+iaxjO8WIFuy+6dhstWlUI8GGH9I45mWVEBPEoCc6Ie9Nd3Hx/5auuP0M8/Pvby3Okj0xvvz+S0Smr+l1YqxXCiI+qnuneXLmNRcY6SK5vuM3Bw7IBdEZ31USd1wxPsh07++uuPv/762OkDR85jzhlVOImnxP3Csf4HczgJSFTmXecyv4z1G3vns7JTFIVxkkTKQMkV7HetstBDe7YPEodWsRFlYGTqZGQsZeQaTCQTU1K4AEPFCGUkIwN3wLP28fcOnGP/+s73ve/7DX+t8z57nXX22crmnGOYWOoTaH1kof/JkbM3rp97ef/dp4ff7j189/brjqd80BYvsTTn2AS5BnzrEEM47/el/uts3z8cN9D5NLgpTp78W/rR04ePnHr05uOXh89ePPjw+O6haMdeoXSCdnYP61D90W8f0MdeF8D2/XZ8sLZgn4pk9mjmfiyZr7zxdojbz+9/fPvx9cWDY61hmkc4J7KpWUV/L8+v9o0glwAn56bozpHJKXEcjzVCOqlHjxw4cu7V5/dP7pw/MdJxaNbmnTTnolA0vC/VFsK23ftm5/ABcboeSa01N+rBo5youXzr5iWOVcVkuyQJ5806xk0rc5Mwjrqv7xW2FBjnnLROPETqn87HrOMxPl7p4NGTOZzLJoL6fFFN4VBREsbhXKpt6SwGhni0IXWfCkT8eNyTxJLPDtqv7MaPNdOy6A82QXVPIopIcxt370u1ZcEQP3g+4V7CuubhWD1WWecI6fEylKsI/Ta0OYeKGTz2iFP0iYnFsX0PJyocLc39PsVT9nw00cHmp3T+szmfZyYqhu58ebAn6wQI65rq8Fv6JucmOrz/tM/PVQigWuuIflVtkTDED0NID0QQpX5slj6bnqXPr1qZJzHlX7h7j+0LhVfdSpNeiAk8tM+VrrPqX2BEKDdD3oD05fli2bprrweFTEjKBN+k56zAH9Jzq3MxkvkOvr/H9gWzc6/DywxE8lBz846/pNc6Unmhc9C59wi3cLh0cy82Ta3WI8RHpUN/TDnz0DpWpARNIT3nHuGWz/b91wqsGHGHgIqpfZZ+pfLXfGoHf8xMvB7vzpcPQzyVR5SDu6YI8cj155bOSueSRBDFbuY9wq0DhvipJEPxUjwldcem5h/LNYcKMYFIv6q2JnbuLQ6gkMmSuGe9MkuHqyQBzFIZgKEPyayGrTtjiApmhVhKdeQTkefBKCoXI2myBHTna4Lbj4HYhTMXaF0qp2m4S1iFpiQWlATf14dk1gW3JIoIP/EoSJI5Cp9bhEvULhKf9s7r6uBgRXEEZrAUq3NNxPhaBSh9W5EVwp7slNwVUew0vZkbr0kMZNrfna+S7fsL4DBSTIgFIuG8f52vle17rkF8SjZJpHgzHiDWO68rht25CWWATE04EShje79Vbc0wzlkBCoycoXYkKX3mdeXQuoNYkATpROm7hK2erdv3O0ZYIICXHuH+B7bvH6sihfOae4T7zq4d2gAMw0AAVFUVBYRmgiihBoVdIKSLdH/a7OG7FayX3rKTONuzIqL3uB3V0jjrGmPEes08kf0TH3Oq7bnshT2+dsl5KkepRYVLR8oBAAAAAAAAAAAAAIC/PTggAQAAABD0/3U/QgUAAAAAABgIGPbhJvhlITUAAAAASUVORK5CYII="
+IMG_COMPETITEUR = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAMAAAD8CC+4AAADAFBMVEUAAAA+W2gtQk3O7/QkOUMgND+98fvV8fptkqXk9PuftL9ce4e63e3n/P9Oa3YSIy8WJzHL9PzP6/NioLTD3OWCscEIFyJxk5wKHSoPIy4LHCmy6/iGpqi1xs0IGiY1UFgIFyJutciG0N9AWGTD2uVskpsjP0txiZCe1eO92uWMtsACBxgDCxwFFSEBBRMHGiX7/PsCAg0CER4OHy4IDh////8cLz4RIzQXKjsEDxYMFCIcNEP7//8kP0wHGysqRlMXJzUhOUgvTFgVMz8OGSgyUV0kNj8GFCcNFRoPKTYQLTz//voJJTP2+vokRU/4+/YQGyAuQkopO0YMChETJi71/v8zSFA1V2IbOUU6T1UQHycJJzogMDdNYmry9vQFAgc+VF/39/FWcHhFXWTo9PXv+foHIis6XGhdeYD++/NAYWwfKi7t/v9cg4sHHjN3iIpQanIVHy11goIcP0pQdn5EaHLy8u5pk5lgcHNHV1uDj45nf4ZYaGoWLzcbIiQnTVZKb3hsc29TXl8+SUrZ6e1ijJPg8PLq7+tpenzO5ekvNzcdGRrj6efB5ut6jpIOMEPk+v244edVfYQyPUBvjZJGUFGJl5bs6t7D4ORtmaCWvsRoh4x2lpo8QUGuzdFjama62+Ciwsapx8t0enZ0naP88+uErrQrMS+Bk5mTnpuKsrjb4+OLm6Dk5Neq0tmrv8UWEBCy2uDS3+G3ztPa9fqiu8Hy8eS909iPoqf89vmHqK3O2NiAm5+Fi4TJ3d+UsbeZo6Gdr7KctbySuL6cxsyXqK2z1NimtrkROEqApat8oKakzNKqsa9SVVLE196hq6iQlo/G09MsJCKOrLHd3c3a3Nm6y8x2o6qyxc23w8S0uLN8qrGxvL3V1NCFpKXAwbvLz8vLy7pMREHV1cTEyMWCgHquraQ/MS+lpZxnS0pgX1qZkYQkU2aem5IZQVaKucHDytHAvrFBcoW7sqnRyMJHg5JaNzlWkaL76N0tZHp6Xlnm0MuWfnDUu7OvnpGY4O98JpOPAAAAK3RSTlMADSD+OlL9wTvMWEps4MKRaeGv/Zx73nK/rO7b2pLPwPX++4nrqtbPvdbMrRFKCgAA3dFJREFUeNrswYEAAAAAgKD9qRepAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAZufsWhupwjhuo7Du4t4s9bLf4bl57o4IXnjzcDwgjC+gB45m0JEUl9WdulLR1G5HYZAguzsWqxVqYJc6CrpGYxvfQERpMUKCbuiYLElKaehFbcSVXYvPySr4BcQmnd+0oTnTu1//z0unNCXlP2bslpTDxu13HMvcknKoOHbk+PGJNOyHimNHwM0dvyO1fog4dlQ6wsmlWT9EsHMpWbqTWj803H7UZedWu5NW+EPCsaOOIyQAoi/Svn44sP3ccYHAI0KZWj8MHDsqOOgCjOexdXBS66PPsaMgHCmAvCJL98BJ+/rIY51LgdZ5HFvtAtzU+mhjnQtUXNqLUbHY9khK8lRqfZQZzHAs3fOuXStuRnHNR208grSvjy6Dfi7AEDu/tn+jV4vaBuw4l05zIwvnHKQARV7Ezns3buy045ohz1MyneZGlEHOAX3jRRHnnKX3etevRz4gAqV9fRQZszkXguhv51Z570bvejs2AohS66PIseOsHNSgtlvnLNxa3/+zVjMeeYRpXx81OOcghfyXc8vOwHpc84jQPnQ7mlofIcY45xoRQZlSVNq50e31trbaLN3Sr0WeRyDcXJr1EYJzXgZiwESlqNftVqtbjVAlO1uDuNf6Jc/zlHBS66ODzTkoQ2TAL0b7S5Vq9csrgQuqztaZ/dKuzToJJ+3rowI7HzxgsVcU7XQr1UtfboSOlgpaW4Os78TtaJB14RRS66PA2J2+BAAse1Sslbby3Qo7n3UcR2gFza1Na30/6kdFjxCETje3EWBs4rghAsSyKcWlvbyt7d/OsXLUqLRi67at78ftmLOORDLN+tAzdqcLihQRlUtRsc/OL13amHNcLCOSUqAam5s7ld4OW68VvTKmf1Ux/IxN+BJYLZFvYv/qYrd6s7YjU/aJb5nG7k51h9Me9+OirQgy7evDTWZCaUQiZUwxKu1ucz//5sqsI4CVl8mwdKVMo1mx1vdrVyOfymAgtT7MjE0EbBWwTBTVoub2qcqFTz+wM5zNucfS+S7qcI2t97Z6O9HV2CCSUSK1PrRkJiT4BFRGL4o550vPX3jP1naBfOKRx/cAQWN9q1mtVuzmdrVGxiMj0r4+rIyNuxLJJ/JMzPv59qkLF23OhUAEY6UTARkDUi5vNqq8uVV6u7W+8UxqfWjJjAcCpWKtXhLF+cWnn7/46dcFR9l+Tr5SKiCwIzwokAFnvcvSe3u1qyUignSGH0oy4xoFIBAV26X6Yv7Uxffe+3o2JwkIjU9KmSRQrJ8MgvLDrWal0uOPvWiv6PFZmvUhJDNRJpDCUZ7XLtYWF59eXV39eNYBJNZs2Dl1kmZIFqPAV+FOs1rp8kC3aa17BKn1oSMzXjaEAECURMn24qmLq6tfv+pKVkzG5xdKEhU2bZUn4k9g652K1d7bjPeKRc8MnrmNp9aHh8xEVgOiIq9Yi9n5K6+tLnzxak4IUKR82+dbdWVUvRkQGQKNAFCvdipLVa7xe7XdqEhKOrlCan14YOeOKyRY51EyM/3KxYWFbz63+zlwzhW/JHUg36ekERIBKADAoF5tVJa63R5nfdP3SDu5NOvDAzt3c05OoOddL8UzM2+eW1349EMHECSqwChSSUIKjI/Q6oSIgEICv69XmpUuw7+m2YwMCeFmU+tDQmYi0K7L0sHrF1vr008ufD/12ec5oVgv+IbYbqKUQqVBYb0ZIpAAZdOe2Kxz2Cvc10tKSSGc1PpQYJ0DCCGk6l/rr8+cXJia/+6NnINURvSBpXPOiZ3zG9Q26xJsESA+aVWabJ3jvpk07YwP2k2tDwGZCdfRAqzHVtRfnz55bmHhF+sckUBpZfu5UoA29yhZdqsTCAECNACoTrexxFS6W/2+IQ9RpNYPPrafu44kMl5Htd468+TUu+d++TznCI45mYDITxJFmoUD4OCTrUv7VvkKtb+ytNbNd5cqld1G3yuWQTiF3OXU+oGGc551HGkfotVM8/zMY2/OL7Dzvx+mBsaYVmJzDsjGGZQgZauFWqFSOlBCr5xqnFpiukmz7xOB4xZyx0+k1g8umYnQzQohWHASt14+f3Jyfn7hk5zGMjuHQW1PApvvgXYBIFi7DDod0Hziaz4IOktX8qy9W2HrRU8ph1e3W0+k/1H0oJIZz7rSdQTX8iTi2v7Y5PwUO3eRrPUQjR+3NCpCIJTWOqvX7D5sthQB8n07sHfyG4v5pfxSpb/bLJLd3NJ9/eCSGXfnHCkF+2yFwcyZk+c452/nHAfLRH6gtDJNf5Bx4FcLgpACFYSNFimDSvtCBmEnv5YfVPh+c7fkAaLj5grjt9+ScvDIjM/lnKyUaLATZp97+OSb8z9N/Ww7vCalIqPYeWh9MwA31dvNToJS4VqLQCOYUEiRvZJv5BeXWPxuf9fzyiSdHPf11PrBwzp3WaIisxuG0w88MTn/09m3c1IIREFxyfOixjJKdm2RUmtpC7zm+6Ag2UqUIYU6UKCzG/mNfH5psdtt9ndLRQIhCrlCav3Awc5du6yBzfOH7Pz1+fnJ9wuONSt0aJhGbFdzYYOuwcT1gIjQRh1RU32rZQzxFSjpcIW/tLiYX+wuNZtNto6Oky1cTq0fMG5j5xqlJMPOw0fvevD1s/PnfuZdTbNjFfqKgrXYENjcA9oxvh3tcfpJ8ZH9gGQzUQAG5bKQMtxY+mFxMM61m4Nvs7+bu3wktX6QyJyYnRPgY5lszh996MFnz/40+VFBo7SdOwyMChp1AA1SCD4ir9aO4u5e0QMlhD0DFEmjaZMv/WXtCn3p1A/Tr3Bbz1/tD56vk8imFf5AcfuJWZ7hBJTLcSvcePiBB5+dnJp6J+dYwSjrgU/1hk9KIbsd9PBau1Rq5/M7sSKiwcYOvkkanVABcs6lK4MLr3y5OJ3ntG8mmxEv7DJXKKRZPzhkjszafq4l1BN94d67n3pqaurJj3isk/YKQ03NpmGd6mZxB+rEpVJUy69vVxJFClGisBUhqHRCyV9rrvDa3ZhZe45LfD5fjXbqXBP48frl1PpB4bYTy1oLwY7rHXHh/rtPPzt/dvJj3s+1dZ4E4LcaPijUfNmYU5Odx1G8uL6+XmkRqcEap32D+vlOoBSgrmvpzG3MfMXWeZ6rRlttUo5d129NrR8IuJ8LCaAD/eOK+9r9d53+9bezz35REJxgV8iVUOpO00d1cy9Hg6plcx7FbZbOWW8pAtsEgL1jWGkEyNahHkgn++3Mt9PTtsRX4q2+IV9ks6n1A8FtPMP5SGUlV1bci/ffd/ql336f/KzgaAMg3VaodacTCI1g82zK5NdjrxSV4ri2fX6GrXc7iuhv71IGlWZg7I9IqB1n9qsz1jqHvVvfbJcMKbdw+dajqfX/Gc7551mhwUN15cfcay/c8+vpybOvf1bIOWUEJdi57DQDIQXgQDuZeq1003l7+/yZMzbrMRlkzbaZSxV0mwaIwA95TJj76sw3Vvp2fina6Rc9krm5dJr737ntxKuzjrA6OyvZi4+8ePqP36Ymv7icE9K26TpX6VZDSylt+S5jmSip2ZxHca3Wnjl/5vw686UP7BxAgJBac4U3gz1v2c1l5755+Kv8zDS39m603/c8ctzsXFrh/18yR16dzQrJ19qK89oLz7Dz+ddXC45gy1K3VoLsj2taC/1P0P2kVvJsQ4/btavbLz/8+Hku8dtrGqxmIZHDruuVBgYa5PJyNufOvWezPmPnOZv1v9i72p+m7ii8pUvM4qfty/6KpgbilmylZXWwsUlrm94Ll5QG8N6KehcIzI4iUGmvt+14yZ1QYAMswjYhQNhqVZRaVx1jcbzIWwMMBCYyw3ARlRi/LHt+t27/wEC/9LRRQsqnp885z3nO+f1ufiaFDB9KZPiXGOC5j4L1quZGg1xRevaJE6jn36Cek/UIamjSY5icyISwxxsKDs1Z/3PMZ4D5qst9mHa4gXpg1EDqPfForZi6z95b3w9rjhpikeGFIkfU5XJtEK4/WCIXj7FsKMH1lxao5z4UdLDYOjIpFVVqTxzZfnrmdIiStyE4YG5dG80kfhv5DBoz7ErJmJPkvnp3ucKdxzAOh9/lCixYMWKPT+DsnwD1BazTZXLBIMfxYhM9GADVNwJdl+73HzXsV/Niol9/aQGeX4a5DkxHiIYrzTq1/fmZrySek1ffgvOsnNuR+5Hr48eSn1yCiJPr+erW6no5Q8LBPOc6WagA2Q1WcL1rwaDG7tRsL8uKYjczXOEisN97cr+Z7M2xrC/B9ZcTqOcRngOLuYcP+XCl/siJR0+3T4d4ku+tmZ5RkRuaqEVqJ1TH7gwGaBiYPec5MN8KBOoZZxpD5zFuoL5gN8iFXV6oMcxWr9gNWKhYmWUpVihxDLv8JMXff/J3c/7R/ftYwZfo3F5GgOeREA4qwTQd4est+iNHgPmn0O0cmZ329gTFoQmWIkQnUCK3e9byLyFkoi9vbQWmqryFWbo8HcO4HWMbYwukrgNzK9Hw+2arZ/dZYdGt9HqQ4b2OKKrAxsbG8pO/+9G5obCLvgTXX3gA8ws8T9ZiepvQq+mOoJ4/Oh1iDVY1RVG1PfPs0ISHouI23D7oOPuWPV92X0lu33ocmDp/3FxYmKXVMQhAGkAdJ0Qn7braYFjoGsJWNL4ptVaOFYroQceYC0J/a+nBDDq3TFYUElx/wYHcHpnj5U2ZYBO/mGrMeiZjzqntmQBdaJpkg6O1yOvEfQXwwG+1+ShoLmO++ngrcP748eNmy8lGXVqaLo/OczgcgYX8owR2slaBMW1PYJbsRWcuz3IsMjzd44KX49pYv/tg5ls84YkTfXV79r6SiBcXMs9ZCq5LsI8NGk1Zx5Dbz4REMkWjOF9TTBJHe9HKEeqS+Squi/uWFHTM1gA64XnVcbPZnGMpbEzTZgF4QvbA8lHUa/JpNZnVAHUrbiuwLgZZlot4mb7DDDFzFoD6JSxfwIaveyPB9RcXr+1RdMo853qLeIHROzcfPT1zChqOA16cUB8TxdFJ+O1WYsup4cbVruQT8/U5zx9XA/MqgJ5qPtBayOi0Oh2T53b4keEzyafJGwLw9gYOQKnttaPQ8HykgulzMK6xOOrf5hsoXkz06y8uwPOWTig2YD5Zwgl0dtomcvsZWbdjcVXonhekkRFODcbKzRs5o4YhCyBvnrlLCvq9qaqqnByz2YZXRmuhTpeGyu5gHGOBZTXKP9iOv7Lvs98OLBlg5vVOBFmJH/ca+xzuMf/YxuO7D5bIjg0M2QTqLyjA88gAunEKmJdzApOtJ5h/JmHEgik4JRTNi1J0ETuSMNjk4bhVjbsH+lHPZ/rv3t2SMQfoZgRAB+oFKdo0razmHBXzkO7yyiwZ1lp7Akv77VZuaD4miNJkWUO93+0H7OtPrs0Q1DmouURdfyGBej7CIpNztb0lrMBUOo89e7p9SuIwT1FTfNA7IIrzUZaKH2Mg9z9aFz2eS/nEcAfPlx9fm6o5fshss9lUNhIZla3F2TqdnmZo4F6xqCZCACM6+WLB8o0lzFu5+ZEYK1LBCne9201gX1/6EztYVjUn+Hx7XnslEbsdr70+fhGmOMtRk2WU4MhwZm0+3T6hkNSfXLGq+cjJERG5HVlAvV8NV43sNK/Ukl6NaLhV5PZrU1NVMuYZGQR2MN7YWKxPydLRNES837VGhB/MHPnQuvXexkompWYXJ2Isy447cusbAPqYH/fJwofHjqwgKd5MoL7bsXdP52WRpdA89w3yA8Zs5+az7UfEh8NcjOJGijpDwvBDiuLkcasB4VnrN9ib5V6N6PauqZqqQzk220FbPHJQ2LWNuboUHUq7Hj6NawK7dnHI92E+t44ZHIfVqRGIeCnmoOsZd7t7zH175c+FSzjATsGbS+zI7m68uvf16x3Q7VZO9Mak6crsLOej7e3TEo9nc2CtJdzYEfINRiiEnJ9xSWj/ih1P64l7r8vLj8fO1xw6dCgHqCM0mpwclVllO3igsVCrT9PrnDrG7feXs1D9wBxvjN1WxspZCqtTixOTAh/LrexzGN1+99iG5956M7w5ThBaEmpuNwMa7lxHKCSxlFgxz984mJ0Fnm9nKXg1ardHaiwE5uFxHpiryfQER1b6l4/am/PjMxYk9+qpmo8O5agQGtR0OUiOVx1oA+rAXGuk/UDdo5bnL8S0N1jX/Lc9FDc0PDwc9LFzTHp9XkOD2z1W3dy13gwriBMVCdR3L8DzN+rOhXgeky9XjB88oNc7n21/mtbCW+G4ZbLhT39QtIQjFHR9/ACbIX92Jb+ZeDIzAB1Ev32+pkomebImmWD+wQcqDf5Dhv+4rVin1+u0KOwM4brs6JDNOqzdjLpuezhqvufHHyOsMJdn6WYaiJ6rru1a77fvoyDh615PaPjdir1vdrSFJAmSyjEg3cj4uDRrc/tRWh3PXcFdzrX1BT8r6u5EWEBOum1o909m1+DDxedqhOcPzpNeTUnyerIKofzwA/yLH802zXttp/Ad0upSGIZ2+JtYaH/5sjEArx6tvgbpONLUMxyRhChj6XakE7J32bse2O2ZZPiS4PouBTRcS5sCmHMiMyddrzzghBG3nVUnUcCGk+qLO0OKtgvo363EecXQxD679l89h4YDz6dqSG4noKtk0JUq/KSxaYB8xoFwgV6v1cOmMTJ+N1AnNg2+OmTmNupq8nBcX3lfdFIQRxhLH2MyGtvHAvbq+/24tYBFXU9wfRcCuX3Pz7cUIVGSBP9F/kZGRhYxX50dGK9ega5rPHwupAhflo8yXSGzMru6fzkfyb0fsYqCvgyeQ8TFJdxBTY4qKUmlAeiaJHA9Wakyv3erGFzX6bV5KOzuUfT58b05DGc9i65rLCWUl5cvPgTqptR62mQE2as9QB17tJiv1yVmbrsQe18/d0sB0AWBnmOH33nP+RdE3OYPPA8mslLjqa8VisEYR3HynUKYlRlq1wx29OeE5mRp4sF5uVkDzEqVLOKg3JWqD2XS4zf4VUrbCa22VKt3Gmna7xjC43jRriOIhp8IlIvUUFnRNaAuROnKVppk+PYuqDk7cWRDdR2J6ctOB3q1i211wFwU6IvSgCpDX7r57KnzVxR49Odi4bGbIcV0jDJkEshlP80+mm9vtjf3A3XC8/vtgBy9GkAHwkqV0mw0mgH2h0qNCm+NEmpOHz6mT0GK19O0kakYInfDy7cQqmHpA3WBi5aUlI8S1E3pRUy6qaHdXd1fjT15NdRcS0eiru88zxs7FJLACnRUumjLQCI+ctqJSwfsalgnJ3PB86vzPHFkDFfi14ss51+yo5w/b9bu/1FDNJxZ7tFUAP2AsTWXtqmQ3IE5QEehtx3UhXOz9XJAxlcMkTuJ4ksVcPgmKopEschbUj4CI37YZCGopze4A2tjy3ZcLS8Kvo5Eht9hnt/8tCOkwJJ72bDUCcyR3L9y3uR5q4GjpO7D10O+vnmOs5J7fcF0XOW/0G8gczWAvopY/72m5tC7ObaDyQBcCdgzTMVn2xhthhKgo7YjkAA0ydrw4ewULcheqmcYF3Zn5CNw4DrsmeGKelbwektKRmIRYTg91cukmiwN7T2jG8u1IDvr8yW4vrM8v9541ufziVK3V7qgspX+Asz1NyHkEVQ094ZPER6QOIp4KpmkCFsxSyWtWtx7XUVuR3JHrya7MmaVMttUXHC2tTAPGV4OVHWS9QnX80r1gFybYsS+5KwBXCeqEDmeo5pcI2ykDLBH54RItzG1iE43Wb5oX5sA1zFeZ0PjCa7vJM+vFhLMBaHeKF7QJJeC59vO74gzhyX06OFGBTBn5TVYssyKRn1t6ROyMvHvsnP798R8lfWbLSlZlZRiPHmy7cadwtZiJoMgniSDLgs8XVsWtJw+pVSXTrtdk6Sky3M3Ts2xw66YFAPqRdEB0ddnURXlpZq+aHA/nPAvYKjLk7qe8OF3jOe3PutUtIyHRK/J50t++/2//tp8tPldiAfRRT6aWxbxdUd52XwlB9YwYFubtX97KQ46ye2yhkOzptRAwtmSVO/RjcV32s7eCLedLKBt/1IdoVEetOXdyipNAddTaBNtBOqQ7sAcZEdSKSmL8bGKMm/JYCwSGUzPKWIs6Zbz7vkJ/yicWqzNjScy/E55r9+cOVt32ScKFek+iTn4cRp4/uw3hcSxFCuFD3vnfIPygB0qWx6UqNeGDDjJEtftT1a32r+vIoY7aI52DR15OlMQni642tkSnr5VWKy1JSUplR/KRg2ZsVemXdWlZKcgZNSHSKcObYjen2JrXWWXpbmKsjJvX2wcXDcXMakWyxfuoZ6xBY+VYoH65YRLsxM8f+P06Z++bBn3ibmmCF9sO0By++ZXClEE5my4uKAzFI2y6M8pkoXJe6XXarfjOZsz4PmTrccyz1XxIYsKr7fp1jsF09cbLyvC1xtbGwuMtqQ41ZVKDVSdzZY3rS3Nzk4pzS7VGo3+ICc/rnUfUgh2aFzecXEgtyzXO3ghEuy25BTSqZb0L/yTPxKuZ2LkNn4hUdf/N8/feuPMZz99+UOLT6wwBSWvKsNJcvvpupDIcqwYPgbMLw+C56T07kfgHsBZq8f+3Hu9u7z++/dVVR/lyLM0OTKY1jt3pq9enO70tZ27fmu6rdiEmk5eGnn6Arl3DFwvTYGgy9YbG1xBcF1epYFA5CYryiJiFDcVlA0OjEeaLOaTxkqL5bw/2APU1UDd13I2sUH1D3tXFpRaHcabnGpaXtoee2imlyaI5mCW3jQLwgtZiSEJQRmgUWpiWopoixJ6yoUSjZBOnJORoXnS4+kQEkcPgrlEC0VYZnvT1LQ301RT0/c/NDXt2yv/6+Xeh7s8/Px9y+/b/jfP77sjuZQO+T1OVcI73lJbCV0TgDnuscGbcziIEs7nFsXXQoc73G24DnW+ol5n1PkqxnBIbpdWyZFtH9C7YgfjMYGIleBZgo8F43FLvQyTwsOkcpnoBORW/pLGLmD65V31WhWoND+tjUaZ256zn/NG+839I9FNJrGg0llMBQv//NRjMDhncycyVBH1/8lze3dyaSftx82mZVuHTNb1ye1ffNK+4naPDnvcc00OsiTky7SJXZAi5le88/qttz75yOPQBCli/vY9hw8frkNFFaS3KmXqJjuc8YnxAs/iBOXn2WyMd1m15bKzAPUqDMVzwPfzm4QLGwH2yxu1KpV2cF78lkJch+MwgHrCu2Dtt/Zvbr6QiA+Udeh0JpPpwdW1oTXw6153wp8+9vji0uj/EcPZ74ilicUQ3qTiVjp0yKHfcnv7SsI9Our2zFmtFM75YOoBuXN0igctiLsfTaw9/tLjSJP5/O0nDtdBEAegI8OtxIwGy3bcFz/geYYN+bN4VqBiB3GHWXW2EcI5TDTvCHe5I65RdCkUl1fWw+sfRaU2RPVzoV9u3dnv9o6bzf39Czku4Ruod+l+iuYm14bRvCPup4rdkv+D5zdeFSNIIuS3qnB3vEXW2PXJjZ/ch2fm54dH8aDezJbkx3MgyoA4LqJ+zuvvPClijhy6iDnEcIdlSHAXQ7VOrcsXi5FZSsgyTEkJw5J8Np7lg74mVXk5mHcZVtBp5FVSV7CxUQHxXOPlKn09+HV4gDr0VYAgO9ibWXGZreaRhXUuYTGqxqs7TZ2tQ8vTk4/BlSiv28/5zzyqyPX/hjl14y3hjWTaL6j6/SWu2trGrtuvv30bz3hG55dfGNFaqBIh9QJaFYkmU0Eov/XNl0XMC0GcqMPVSYHnSHlBXzq9xRfMZrN8lqQZ1o2zDEeSFMFngy6HqM2JYbz4x+XnubIXIdC7NJc3goXfa2iGam0B9Yb9wX7aHbVanf1z6xnaUa1z6Y0mU+vk7ubUw6ttsFkyk8kU/fp/wvxU8uLuSCBA+BeMI25c31I1cfvt13dthzj38vLyC06VLx2KrydQMRU8urgUcHd4+LpHQIkr+POPX0QxnFQmB8BFwc0EmMd4HnhOUYA3hwt+gWF4QYhTQYtdL8ckyhpk3cWg7jyZha4cOASOXVF5kdakXW+AKQjI1qHsBvOMg86UlzZYzc6OVIbrrVZC5qbrNLVOz099+G4zoO7nmGOOK3L9X2N+3Im3d29tbGyE4uUdbrx+oGXik0++eabbn5tfXV3Nmetn8v44ybWB9g6dTWIf5PvDV6COuMd/4vmLkKuVF0CsQRGazmCfgRiOJHmW8nME6/ayTIaimDh7EIyDX9dLMUxSU9DnxOqbi1VpnpkA1BshnpvcBR8CiZt4Zbt52WldX6H1TvNgxyaD91bLXfrqal1r6/Ty1LM5QB13c/ljjzui+P4lz0+85PqtQGDj3qCsw+1ukiPMr3/mDjy/+sLq6r5Za2fwcYrzNiO9HWgOHnf31iuGb4Vc7adiKvLnh40IPyUmVUqxaoPFNwOmnaQAaAS325v35wmaohkiK/DZGbNWKkHSHDwMZe5SmV2oVDwz8UwXWHmVavI5KNxeCrCj/vq2ZbMhupIyOAcHx/MM59JhliYjiuIfW51y7iHUcY4+tsj1f/WOPOGMS7p6IoGNpVnMlXA7q9RXf/LJVc/c6M+/AKDvOcGf+11MDuVqgLi4tf+50StgGBnidrDtoMp8CL3OMimqlcOnUio1wXkPHwRtQpalBH+ezbCJFZYhQxDQkQzFCrEDi+XiWgyrQVE8sg5IrHGxjQpF14TiGYC9fnIfrEmhWxKqK5zVmvWyCPXoZo7r1RkdBllnZ6vpsfmhqT3QjRKJIur/kuennXHJ5e3hSCB0l8yVWNbLzp945pPrNdfj9GcvfPZZzqlysfgMnWtohplSVPGG9ypgjmh+v6jJfPXhi4C5KLEVnknvsATjB0EBIjc2TfgZLg+NrQzh9wskwbLsQdYSdzkq5VhpqRjFYyieU549zlcqFM880zXR1XgRoI7iRXiXngt7BTmDni9J6c1Oc5TOcw6jsV/bWQ2or68OPbs33GxbxjNs0a//m/NqZ1yu6A6Hk0vt5XZ3Qis/76aJ26+fuCpD5z7b+2x/cNIicD6SsdkKewPRoOKr87fCjCLALoqvb314z5WH68C0izxH/rzeDIH7QTBIkCyTTpMMnc+53QwFv2cZJh0j+YPsjM/hKKuRSFD9BX3JJFI55uMVGoViolHThSz8agMCHcov6KR+3uxc9xzATrL+6c0cY9HJLHolcL11/YWhwVVYVFO08P+S5xcq7piNBNLtLS480yS7SdP1yVUT1zP0Xm4vtzlV38/6x+mctw2WwkLcjgZRdkevg0kWsO2AecG2HzbKEOhiKQXT1VtdPgCdJwkqzVBA9EyGdrujOMcxBBMiOFIQSCEWDDoukmPogWeHWF4iP6vKzh5SAO6NikMXqVROD9LhCzdYbVB4MR94xmHCuT+6nmN6jTKz3tgJCy52V4fudNvabHgmIxS5/k9P8JxRqbijZ4tPu2T2RMIpq70ajPvEJRS9t7+3RxtMDsFvEXJtDYX0HD6v2R294Tpx0QTK1b7/7lvw53VGNL+CgEf5udkOkB9s8wQPqIeoLE25Wbcnn0hk8hzH0RmCpPgsezBjN2vPA6ZLlMqzQL/DgOrSGaFMfQhQB8IrVCO2W885By7vov8WGqgMjgPviNNqANTpjEUq7W/CjNU64+byUN88jF4B6vQZRdT/Gc8vVtzS81qSjcssmQzCHJqjNFfR7N7eq6/megcsAu6i8iCWXIb8OSp9vQnbup+84X6I4UR/fueLTxxGaVdNjVQGuBur660Wn8+XjcViASJEpSmWFPxc1ItnEjgLpM/jvIBi+mA86LNYUfVFIsWUYOYh5u/EJOP8oTINQN4FdB8YaYbjnTdcByYerQZeMDjWcQPsGu2Nbua5Xlm5WQ//n864t/no9Pw8oJ5g6DNPKKL+9zxnDqmv73nl0ySptuMZA3ZeLSRrN91Iruf2X311f07ryPpdFG2DuSOUQsHnBaswmFogumjb37vnHrDtYNprpBXIO+tUBoc9vh3b5pMEEuDS6SzJ4FzGA7VvGqdoN0EzPOEnSeEg6HM5zIC6BGXsEvSXgfDSeOr8skMKeJrGRtNDsFASbjaLR7bd+IHBzHAGrdMAimyOM+swQF0Hm032+kzT8+4GdwLP02cUUf8Htr0WYR7YUFiB59IqcOhdV9/BRvd29/d3p7UGwJwkvA3NkKbBKR7YCzS6ex2aaijYdoQ5CHHSqpoa+AKqYkbAfCYYnAkGyCRieQjILgC/U94Es5LicC9LA92h4iYEKTIWtLsc5yPQpRg8mfhL1bhwSK0oPFVrrwekOXTfp6FtxY/7mlwrtFZvcI5EU/lcvwz8ulJpNA55+u7u89jaPIkMIxS5/neYc4qWq9pnPw0EFAoyYYUiuKbxmauvElL7r+7uAuZaH24X0iviQXRQXmExzOgH191awPwlCNtfAszrIEGvAdBRkQUz6vUWy0zP7FZsOwDRWoil0ln45HIpN07nM4k8hdNg3FGVleVZcgva5sx6uQTydQS8qNTIagD1m9QojG+Ejol+WwMMv0CuDtebiLGZJruX1tcb9CPTKVpE3YDJdHVTzX2TNy+DYJvJMEWu/02uxqlqL7kPqTJqTTJklirl6gsvBNs+t//cqwjzehdnOfDjXrTX/ykws1c0j74Kpv0RFLgXMAfxtQ5DREcRuESqM2ntlqAvuBXZiGSXCCIdoJCN5wiOxjmcoTIMA9E8RRFCFkk0ZDAYtDuQX8cQ4D99YJIFvgyCuVqgukk10GuzoW3itraVkjEydKN53EtroZ2uYyG1R5tlYOExcOuDzcD1VQ/iOseeWTzK/Bc8p8sUXXc8EI5saBTJkE9aXaWuPNTiSHXsv/rB+7vTepVLSMUziTYbmlhDTL9m/o1bb30ECXHIn3+OML+nHGuB0jkwHWQ1uUpvNwe3Z2ZnI8kkFQCKhwLJNJFmOErweBkuw68w0XyWYgQ/wacpaKKCbxDXjVZQZCFvg5/l5eVGTCfDFlLnqWs1Gs2ArlFl6oWL3WgniXfl3p1w6MKmuZV1Pcy/jUAMn2+SYVatEmp7zubp1r5RW5s7wRW5/pcxnErW2H3XazsBtSIbYmul51VXamrNqfHN3TXg+ZDKzuY7EgjzBrTnF0aSR3eHr4Nu55cK/vylh1+EYmq5FKx7aWkF5OeAucU1M7O9FU4GAslAMpSmBCIN/juESqt+Dqc4IZPx50kOJ9MhgUxnt5OBWHzGfskhmRjKYSLbz4agMM6Xnae5SQFvQAGo2yB495aUjC1tbCxeYp1rS9Vr9RDNRWkWuN5UL63rNA7aHrv7ZrfNtgzFF6HI9T9b2Z/XtXTdcdenG59q1DFOGGipUh+qVZtTc5vPIcwnVWZBcG26YVMk4jlK0EefgxoL2hwlDi+98/QTT4iqjBiAVWBGaZne7HDZ24M9sY1kMgDKDClskaE0uHCWTrghQz/wU0wIvgfifoENMX6SCsQisWTQMmOtxKrOKqAO6Rv69+aE89Xn14KNR6i7bJ5mD1j3o+/deW2HqNTHgesmrR4s/KZgBQuvwuoq6py2xyb7Vm1tGdCAhDNOOPKI4vsD265qGbixPfxpQFG7RfBlsip1o6LWmurYfW5t7bnHplT9PG2hlyGGOxcVWaALcfjVa1Cq9iTQvBDDQbKGxFdplUSGHcZ0Jn2TPWhvn92a3Y5RBOToJE+mWT5EgBPnUjhOsCvCCkcyWdJP+nkhHTvgF8lIoD241W2/+HzI10olEhBjwdSjfzIVlZ9/PghFGgjnWjsaPAB6yb1LS5FXFnm9nl1hoZtOezNYeNaAlVuVWEVnZ3/z9KPIrycSDCOccVIR9d/zXJAbdTfe9Urg08barTQ/IKuRX6RoMUc71hHmzzlNzgPCQdA2dF2zMDQ+DAd3nnzyuoL2+vk7H93zxBNPSGFgRVmKMC+vA8wdPrvPtx1IhqF4EwDIWYoPpQkQ4Dkuv5JhObKExymKBJ2OZUiSZYltcntxtqfH1+64qFpSc1apVAKpOib2z0mj0fPkV1+tmbhaU2Yy9cFkA4B+78bGK+0EqdfmPdHJSYMBUN+krWfrzMpOrK6uv/mxR0Gba8MTHOTrpxVR/+3aKLZFJ7+k/bUN4Pl2iFVDEFZW23JjdGTtubXpx9YGTU3xfG+O9sD0EmivT8Ha12G4yYMK6D/5c8D8nicOy7CamooawMhYZ9KawaHDpd1YJEIC5BGSypLpGPCdTJMEk/FnuBKKIViK4Pzgz7Ms7w/Bt8ROZDYW3uppN5edJymVlJ4lwdAXqrxVpexiNHe1Rg2Z27h3xV9y7+JSIPJKe4g3aFl3dNJkGEIWftOAVfdLjXXGzkHb2t19y22QuXGMUET9tzwnYcjgQsA8qWmZJdgywLy6uqXpoHf9McB8elCl7cg5czk3zKuBSxeXDnxwK2wdGB4u1FJf+hhse91hVGKpUWI14IWr9WYzJOiQose2kuFkkkxuEAD9GEnBDyLtj3rBsq8IGZz3A/1DBJtNs0I6uRQJQFd0LOuz2CvPRxG8pBSDB4yHt6mXK1rUVwPd1YqBoBfnQvcubnz62l3di9lGA+1JTZqGhjqm1wWhXnqeQ1lRoWzt9zx3d8cLnjZ3JsewJxZR/9XJex+MCYMos/GApitLxM+XVFWVmeSWufHUGsLcqTLPrffmcvMNzYA6ao865+U3xJGG4TcfR22v79yJIJeWV0kxoDrSzYHndjv489lwz1YythOIkFvhcGAnS+0EiCSVZNIHfj+xwuN5hmFDFEmSoSQf4kmSz/JgFvit2ZlbbhlQY2dVSM4WNVkldpZUZso7ZANqxPWrFZoBC+4mFgH0VwD1CG/QRz30kGlo8ubplBBVYdXWTmVphdG5vPfgnS/M21Dmxp5xShH1X3g+LpXXXnXXp0vd0ssJwgLTKLIyqE+PzKWi09MLfUOT/S7anMjZ2gBz4DlMNrz5Bmz4heK5uO/1y5fevufa286uUEJmDoq7UqKUmVQOq88+07MV3g5vQLqWjCQ3yI3kYho6oIkAxO9pFgfxVeDzNPRM8bGxAD8Wo9hgqGcxGRlr3+mebQ/Gb9SeL5MgCV5ylkQqOQsCOiltl8tvAsyv1hxSH9Iy3vTOxqefnvxAzx2+kia9y706CKPLvQvr61HI9B1aqbKirnV/fvDBzzxtXlBpslQxmvvZn9PQm3RJT3ixW1bJkr4aDGy7Uacfn4tGYY3XwlCrczzvSDC2NpSew2I3uKfzxq3DYjMcovnn77z9xBMvHpZ0YoUW5rOUmKnM4bDYZ3ztPWGkyyxBhyWAntyJBcZCyZ0kCeF7vsRPkH6cpSjmgBhLjvHZsVni3uCKb2k7uzgbCEdm7rCb9fUYYA2+veIsoDoGASI9oxPdOjRkqwcqmRVi49PTXzv5gfZb2kuatCOe3JSIegosPCZrqseMxrrWvfmpoeeQNscwWbaI+k88X4elIJX3hZe6qxS8MF4FdFWZpProSGphevqxjiGdY4Z3MBkPsBwdSbz0smte3h1GhzNFxL/88q2HUX5eqoTySk1hIq1M2wSYu3ztwdnt5Nb21mwkHAhvAd8XwcKPbSR5iiUOMrhAUByDC3wJxafJQDpJEbF7gyXZCDm7Ew6Ht2ZBh68/X3qWBFAXca/AgOv5EZn8JjVwXa3WNFbiXjLw6emnn/x1+y3dfu3QiG3Z+ejkg/2I63pplaUek1YYWz8bHRpcm7d5OI7hhaKFF3m+AHXQy2e2Fu+TAuYLMFVWXW2SGRZ6wbRP9/U5W3tH4j6WSQDmsH9fnFH84OWXX3/zrTdgefuX77//1gc/YY7VVGHKUqiFqlRmq+sWe7dvO9YDDTjhZCQSeQUBDt21AP3OTponGIrxw7CEP8uXAOH5wA6ZTGdDZHBsZiwS2dpajITbe4I+R1O9XLTupYB8hUQCsqwub68+T30TqDQatXpgMrESAft+8tdfd99iyTuHOjyfTbVOTt28tr6eqpdgjjKo79bdvTc6NPWc2+ZJcESSL3Idzi5FwSYPtIcX7Zhii4zLJHKdvEyqTw1GAfLpvqnWKdcMHafdzc0XoG5U2OH+ct/Lb77x7htvfP7+++9//MPnH4AkU14BYjvSyn8k71qfEqvD8NQ23fvQbfpQfai+NCnagoNCRax5AbNCIg2TjcBV044gYQfB9Y6rtrqJ6HgOiLcT0tEozVpD8xKoAd3MiuyU3e8XqqlpmprqOXT7G6ofF3dmZ2fVh+d9n/d539/vJ5UKBXwz1Wx2ubyeGBuKUnQ4Gmfhw0bY5GAUPA9F4iHf1tR+LyTc6KRvd3dqKrzonZzCBqrQRCg6TwzG4jQVTrCk1eV26K/LFvKYY2UgsUtUGRUnddnZSlnxXbycq1Cv9vpZP6jutBodXaWllu7XO/v6hkfWNzY3SzILdSX46TQzr8+OdTxfeWR2dSseCv/vUT/trCV+8rTRHySE4v1nQwJ4K8jnJUvNcwEc0Gh6oa7T3vzG3MmF+/h9LE/jVszrjz/z7jvPv/n8S59++ulXX3zx6ceguUQlBebYdSqA564p0Ol1bR4X4yZhurNhJhwNhyNwZ6Do4mEu0o+vYZ/v2dEDa6NAf5Re84XpA+EwPHmgHotvRfu9cZaLhcN+r8dg0KtzCjPSsjLw4IFXKNIaXjSIsjHbcRdwVx7tuK93N8mB6oSrtmZU29nTtdc3M/YCDpJd2igQFuoKCqUCRd83C50vvHXHLV0TvmBo93+O+mlnBPIEOC2KmfcIld5d3pPBFUqa0jndQMBkt1s66oZGOjY3Xl/gK7VbUrNRldN7z6+vP7L+8iPPPPPy9FefPo5iDRUxOujIn5ByDQVao8Fc2+jxkrEQ46f8/gTeEixsnwTgjrD+eKw/TsN63ZqYCMGsAdZ0eKqfnkTJ5qNZPKL9UXj1JIMij+TH5kTpfy0JVoa04UWdKKe4vrgIFfvRoyag7gfqPxCNtTUn1eqeytfHZsaG7XObS5tA3SAWSCWquoWdoek3K+97aNTnC7H/a9RPO2NAniXMvJMKEpnKldCTGswfiDQa9ZxuxG4xAfOWIXvzwMnNhSN/HveDu5hM20j1/Adierp9/KOvHsdm5CwEd2GqISYRVGh0WqPeTbSRjJcX7n4qyrER2LDI5nSCnQ+yPO60j57snXjSB5dmbS1Is+EtNto/xU6FgtGtSGyehM1GR5go4SHdjmpjAVpu/EoD0yWKLIlQnkKdN2mKlOKCkcpVoP7jjz/80FjW9oS+1NTNc71pZG5zc+k6odCsEWC79Mzsct065uG7X/QFk/7/MerQcBJJZtVNscmosMq7NqkUYvxAk1mwqR0IWOwmYF5nMlm6HL0PHTlyC5rn/D7gubmAydHT09NsG8e1uC/ze5ey0sFzIZZEotIc1ep15hpU6ARLRplogk5QwJhK+oF8MsJxbDBIo2jfHX1ya3Frip6a8NG70ckwqvQYy9I+kHwr5A8T8TCqNr+T9BDVNcbU2FwaQE9Lk6RlpEnSsypeNMqKc4qLi+8qqs+pMFWurvgvvPDCH6yNZTX9euR1e1/d2PBIYG5pSSxAz00qgZrbeb7ukQ+vveW+0Xgwyf1vUT/1rCXoriqlO7iFt5APm4UxcqJRr2gDdhOY3tzSYhsxLTp8o4sPoUQ/fAdmyTc9nhqU4Eadrqmzs88iUdyukGblFWILmjDVY0FsN+tqGgmPywuqh0jQPMrMsyQbpJJxPxUMgsJsZJCl1yZGt2DE+cIo2SfYQXo3HmYPxLZoNr47uMvOM3yPJhqORsmYVYdhyTxezQH09LSstAxplrRgVSfKLr6uqP7EXeLsOqAe8kPCu1zWssYJballoX2mbqxjZG5uaa4C/fUCfCAVQ8v2mfUPD1d2j+Jzx1z0/zyO6LQzltKzJOVV3viEsqpmbUoMYwVEL13SmgImi93SPjPTtGHp9YaC/f2LONsfO4AXQ4bGWr3RqMdJ/CVDdRaVRMFjnl7455BLg7rECIgMZo8r6iQSJAw5LpFgnRys0iAJrgPxQZbz05GwL9SP0alJdFtp3+5WaGoyTG95+5k4vLs1Xuz7QfQoG8UQbdRtMOsLRDzVU5hnAf6DkoIufXY2ttiljPg6+32jfg5U/+67xmrrlnropQVLZ8tQx4g9sBTQCGVm5PU8SfMd03Xrb1Ye6YJjn0xc/X9E/Zyz5qRp0NoOevBopn73SbAhExfqlM41DZgsFmTssZbht+yPhdzYxTh4Og6AfqhrMWSsrm4ta2298dYbbirQ6BDOFRIgDsgFAhwto1E3gejmRofH7AbLSY5MkFyCJpMJMsj5IwmOYSOUfzBOoWZHOl+MDrJrW4NTsUl6MobuWqifCTIRlg7FJpyAHCZejAyTqT6rTluQmYaVzqt4aVqaNEtR0FUqug7DNDDnlEePBh7qDSWoH4E6n9e1wzvL7X19Mx0jI0tLgTxo+ByU+ZJHKp+pe/nDw0ce2poPRsj/IernnLEJyKXlA2+M3iS4PzSlzBAgoQvUm1qTJQX6mGLspZGRxwyQ3ZHg4GB/f2//bmtZfmsrf+wT2h0i7CYBuQWCjPT0whTP0UBvMpqtbWi0WMkYw5B+P8Ukkgk2EfFTEXhxNI0/Uhw9yDLzk2x/vD8EyT717GRvbBeN9GDUH/XPM3E6OMnMI0bA0QntEi6CcLk8OqCeh/AOskvTMrLSDkoyhCVdpXLZXcUwZEH2AlPlTiiREnO1ZYZeHCb8LlBHhB8A1wtFhfqSdKlC9chsz8wj7+JKgt7BePz/x/VzztqAwSUVun0vHhXcFKKVaF6Wi8oLNowDlhTPZ1RDPdv2t8xexp8E6sH5idFQa9mtOKz3uTvvhGhWluJfCGHFCPGVt8oUmoJSvR61mtVArDjdjCdGolJLkoAeUi7J8tizibg/SNMMO09HQhP9zFY4PLo2+azbF/VNhSPxKI3o7xz0snFyKwZJH2XwomKM1+Mx8KinnDme7ajbJEJJwYJeriwuruLr9eIK05HVaOJCHvXGfMNmSdPyu+N9M0PNI3MDgRVZoUgvlkolivUuHnWok9HBeIT6f6GOI343hQIod5uvVyw4ur9mBmMz5SL1s6UDPUD8o/Y+VUHPpmmvmXAyiRTq81vPHsoHy78+AZoXiURIsn8MpsMPz5IoMLSqQQNdZ6xts7a5CE/USRExxpWgKC5BxZ1+EpSnOBRrDJv0o4ILYzK2Pxqmd+mt+ORkeN4/4UdHNeyPM3EGNn2EoekYFw9FsdPGu+JxDDhwOnydFOkci+c7L+Gzhrq0shxRlZKnelXFXPfqPgPUrY3VZbGaoReWl9uB+vgI5FxAJBDoxOl5CtVmlw0RfvbIfaMTQZq65v90WAXyeTpAzzS80XtUeDSwFpCgOVYuEiO291h6psFzRYltYGPDZnYRCSgx1NZB+s4b7//66/ufew40zwHmaTzDQXY+tIN6FXU4qQC2jIEg3C63y0WRjCsadXJI5AyTZP0UTcUTJO2f5xIRjoa3vuaLQMVPMOHdcNQXnfLTTJzsD0XjZCQWYcgw449QMWR2hlpZCThqDAa03CqyeLL/tVC7AXWRLKceoNcD9SWgjrTu+u676vypgaGOnWVwvW/cPjIwN6CRCHTleRi03O5qR+V2DCNU/eD6Nf8brp9yNrxXAYwUHOWLe41Xng1IJMJMebl8s8nU0w7IwfPhZvv2iM7caIWQSvBzL3Rxa2srID8BQ6RYVKAB4OAafvd4AfTycq3WYMw1mj2YeHbFnC6CJMMuJupMEImIk6FYKsmCwhTHRYLw6NjYoDve7wyG/RNetN9ivGxnIxFvHOYrGaHi0TBLO2mGJOHhPhvY340SVrNRpxUDavyPEPHgepZEKumEmsPu+fq7lMVKZcFK18kY9eOPP/7UWNbqW9E2vwvU+/rG11Gwm8plmXpBeqaqZX3B1vLIu8eOHekdnU9Sl/1fDqE6+6xNTCSkCW0vntRIjgaeDeC0xmyRpmKzw2Jpt7S3WyoknbZnHnnLVl3d5vrBSVGJ2LOTN916//0ngHnRXcVKWaksLS1PkJGVlZaCXSiRVjSVGuG+GlCiQ3g5PZBxTjLWhmzOUYSfJbkkybIUfBkqwSQxEhWPrcUHmWA44g1Gwv5otD8WjYcQ9yPhKAvTPcKwZDxG0/4Qs+JdcpOUk3DUDGhLxVkZaXy3LS0jHWIO30Bnb0k2fPhifFNFYuVS9xMxqDk+wt/q83SOL384PjTWZ5uzg+sCSY6uUAAvYbO3Z+blt297oHu1Pwiu/y+OGeR5LhBCwxlXV48Kjgae3BSiJyoTVSw1Wabbp/GsUHV0WF7+xqarrW1sIwgn5V2bKr619Tmsu27CXciyG5DLwXA8/2h1Qw7AlCnVGgzgeY2bcToJcJRknH4XlUhQHAWiUzTh5Aia42jWmfBjvH1qKxIPJ+MxFghH6Bi8WDoci7Jxf5hhQfQozfj9IRab1vdXvFHK6SQdBkdZbrbwj+Y63jNSrqz2MVF9fXaxDCq+Xnl0o3I1SlE/fvfdT9WtU46x4dnl8bG+Phuf1k3i9EM6gC6VbnTb+p7BFMiRVXD9wquv+u9vgzjl7DNq5EKFVGrpmtMISuYeswnTcS+aSB1otrW3T7e3w8tqsple2rMZy/IbG61Wl9NNrxTf+twfoR2YK8WZ0HC8jIZVwj+FefKSUr0W7qvH4fZ6rE4vBWqSJICiKCeVIGHTJLkES3FJZ4KDNYNIz9Lu4GAMko3Foikkbz8v1/1+gB1m8R6DO0NGd0NeHDUYiyFquD2OtrIytVwgRL0OuPnOW0aWQqJ7TJ0tkymL6+uVyuIK+0Ivy3P9u59q81c2Ojr2XpvuROVmR4T3HM08pG+Q4iNq6rIPTb/7wLHK7glE+Gsu+a+jjuPhdEI0KPFx75Eomjde1Eoy84QNDfq5JoutHah/ruhrmra8tN2kza1ubGxssxKurTbZrVBwJ07cdaK4SpYjxp5x1MrpqcXbY3ngud4Iy3130+R1A3ZYpxTpbHQxKNOh4imQ1sqhYmPAd8oPCc8n8+jEFhtPRAA1iTAehuKDX0dzSPowcFgnivQwQN9fC4Xc+7ve3f2JFWtbW5m+RC4C6Ph/GzLSgHyGVNKxqs7JrkeA5x91TQtdzyKv8y5NraG3qenN115OdVpRsAcwRW0sEAoU5Z2zz3cOf3js2OHuwWCcuew/vtHtlIvPckNtqxTrlRaFomlpVSsRYo4sU81j3jPe3v65YqYDmO9ptWVlZbUA3WXwWYtRnPPpHOVwsUgOmqdlQcOlMjpq5rwKtbq0VmvUOh67b+dJHNvvZQh/1MWyJOJ8gqQYBnyfJ8ika97PJAA+laRJNuSNz5PhCMNbrgmwGk4tTTE02q9R6Dga/RlyMhyb9KywsdDu0iOv3zfg9pBtbWZjiVjIKzkp2I7onnVQoejoVWdn1+fIeJdGXtdxvDfMpVD/rtbcOzz85vL62EzfCyN2U8AjksmMYqkEP/ns82MdH84+cPihQVRul/2ntzydevH5b/CH7krsR+wKRed2rzE9HXv4VS32Tgi48R7buKJvvP2j57/RavPz82trqxut5qkaWQryE9cV199VVaURIK6C5njxS4IcWVACU8ZosDUPLRx5cWXFse/2eokoQVmJeCOCfJJ0JRPWJEclXQxNUgA+keQAdiSeTLqCBIgd51mejCRYmoyxYTrujFEsC+hDa7Gp3Vg07HjpvXvfKTeTpLUt36iT54gA+h9NN8AuOSjRvXiIhzxlzWXXjXcdCPNcB+zorzcN780+0jcz02G3BwIOUaFMJ87E2cNNXdszw++++0DlQ0/M09SFl/93uX7qRef7RKJMiTRQ+YxC1bm3OoyNpVLcqTPSZEFGt9nGJUPN7dMv7SG255e1VtfWthnfcFShPD8B0OuVIIo8TwCi/VMsSxR1FQBdqzUbeyrqOmbve3Fuc2UltB+ykgxHNbIEicYLW5twEknMxSYoP+nkOIpEMo/NH0hwESqCLM/Fk5B7qbROMf4YGWH5TjwRCmF7FTZK7O598NS3MxI96Worq83NVRfIs3jAEd7xDswlUtsT4pxsWX1xPdovmrr27l4/6nXA/kNjzYu2jrdeexlqrgOdwwFHdrrcmJMJG7F5+fmZF95+9NpjXVvzkSu4/+y45GkXnT9/HUbTpSPd64qW4b2uJgm2ozSoFCPD7eN4tHeo+pp7LOvfNJXm5sNmR3ivftLE85zH/K67ZNmFOSIotxTofwKfKdeo1cjoWnNpT/nBlunjR2bnNkwDbkfICclN5pNoqicagWfCihTvjBAcbQXMJIMyvJ9MwnyZp/i+OQf/hoF5F/STNOdk4NQT4VDI+6R31xveWL4Xg/UVDsJpNdc6dKV6sfwv0DMyJBk88j1vFKTKdaBepNF0HD8ZhZpLjVC5e5ubtxeAOt9zMw30iArr9YcK4UyNv/Z83/C7x66t7JroTyYu/I+ifuoFB+ZvxGypynLkEYVieBuYS6XSBlW5HZjzjw5Jnw3XWi40afNzc0H1surakLvwBiB+F3R7fbFIWNCA33ZKRvHaHS++WKvQw3PHFqamphbJjOUwUF9aWvF4SGR2PqK3kVzqRVEU2m68HQst70Smh0sDRcc4aZJX84kkNB66sPOcNegMEyQzD2d+0o1xye3j12Kw/u5mD4NqHVe56Q7p1eoU11NE52uIgwd7Xhdn1ysR4+uBuqr9uM+fuBDrR9LFHKgxri88Aq63P2PHwI+g8K7aokKB6vbx194aGn7znuuPAPUId+F/0og/54IDg2XFhdK85srnFS1jb3V3ZEjSkc/LTcM97TzmzZKh9ubpkQXdjfkw33LLWmur3V7ZjSA5j7msWCYsyMOvGUMMAP0PsksbNAUFpaUw4nQ6h66pQqLoe/m248df2jbte0Muqs0JoBNt8GJdJAlXJkg5YdIgkhPowcQicZJinUESnVdX3I/PA/xeLtzGRYgwjJwY/iYMpr/x1vGbX/38wcdbhs3YO2ElHAazzqgVNQhS3wHv0uAbUhw8aDopR3u9ig/xygrF+uIEy6HBfsWFaO4ecNg2Z18a6xt7Bly3O6qA+iHkpdunF7YrXnjn2C13dJ3sh6y4+j9nzuH288UD1UXFeQ3D3S+pVEN7sx3ohWLXj8LS2YN0jvuPVEOo2dZ3bKWtt7a25ue31pZ59oV38ukcmbJeVpiZk5mVkY6VIntKS5VXFIi1xvzS3FuNZgPcGYHk9hc+vfbY8Zf2AisrHpJyuTikdKqxLeGEGw9BR5EkTTJI7KjJIvNEhJhHZOeSKOWScGiR/ZmIkwg7/RTphyHrxSmD27P3vvrR47ertPoaT1tbY1mtOfcGvbpEnJeWWhmpVwYSu+UJMQ+6EiVGlWbo5OKU338FVjLJ+Q94besLQL3zGXA94BDKcvTiPDSJTKvbfe3Hj91yfdfJ+TiXvPQ/dvPLKZcAc2tRkaxBtbynUjR9eNyWcVCRheBu6RzvacelhsOqPmT1l3ZsJaU3tn7Z+uWX1bk1+5l3QreD5sBcVigXYS9hCvA/c7q0XF5RckOp/kb0Uw0Gs1mv10sef/z9N29+YGFze39lxYViDf3wRtIPxjOQcQjPDDB2kjQKeGxu40g2AcuOQ3XOcAwB8c4y0Hgc5FyMiUe9a8TkG7MP//zL449L9TcaPTUGF0WgjMTszg2HctB7QUpPx/NgxsGsgxkS03YOLJpsUTE/VjG095AvmbySX79F6AMrPY8sr8/MdNqR1gOOTKHImANtozAh7NsfOH7t4a6To0F/8tL/lE2D09sXD1AnirIbyveWVaoX9mZt4HkDj/kwf5+hzTasGuoA5q/bwNpbeaq3lpWtZR66KYV5dn02r9v5XJ4KqH/QPKtBXiFXl+aKbyjLb7M21tTW6LUFtz/+4Atv3nN49q3H9t1hioGKSyQIkiIJP/w5vDjKBUsWdI+40OSiCY6ErOdIjvfsSNCc81NhMs5EMTUTDnl7p44/9eqvDz5+u/q6aoPH7XA5Y16Pw+Cu0R1S8/oitVC1IdFkSA6a3sA4fCGMGvQHNEM73T4aiP/22+nzg/HFuZ6XFuxDfUDdYg/Y8jJFOjlfuloWLEPPPHDs8OGuF0eDyStPv/i/I+dOOfe8xcXk1ydyGlrePDzc0rn82giGC1GgpzAH5LYOxdAL0+1vrdpAcyzAri2dPHQDr9vBm/rswszsBvQyAXpq8fBL8+RisZgfnECjpczcVmMwo+eiUklUL7z98AOvbe+jh864CaeTIa0JbDDkXCR68y4uSZCgd5KgOMzIcgSFPI9aHn+DbpwrwiWcjN/rB/Sx6O5jG5X3PPreK48/XqHW1VqtbidBWF1t1prq2nz9oRJR3h8anl8gPEZ3Ao9pRNmybF7EKzXa1UWfL/jbb4Onn376gdHVjebnl21DQ512RPiBHtw5oJPx++4GXuwcmz78wNOHu3nUI5f+Z3awn3nR4uJi/Ouvn8tRPX+sveWFt5ftEmlWQwPCG8pyxPZmWx3P8+Wdnltvzb0Vq+xWbYlPWwQNd6KYt14zRfLU2MrflRq+5jXI5WJ1CYRcLur5RgxDevW6JlypoVC1v/3UPcsbsSjlJRinywonliCjLsLqtEK3WxOkM+G00kScJiDi8IGgWMg8is/jcGtBe8IbJSPR2Nrm68dx5MErdz+uGlOrzV6ntdZKEG3IF7Xm6hsPicV/op7xJ+p4Bt6Si7LlYHo95uaMvV1PTMwDcoz3Lb64+nrPWzvNQ2PDL2MaLIBjZEVGhK90ydLO8NgzDzzw9C2zJyeC8eDpV/83Ejswf+ih+JetRTkNm0eeael897URye0qaUOeome4A9oNul1T0dwz/e5eT+mt+QjuYPqNpU+UVN15Am21E3C1ZUKxiDfZ+bCOlXprEInl6hIMxRpvwA5VfZnBox14srJr5/W9veYH2x999NjOvpfxRBujaLJZXXy7FQmeIuHTUQxFMhBr8YgTfAf3KRfFYVEJCkqPIGORKGr26Nr+9rvYA//JzMsfVlZ2V+JAUE+twQymYwgOZqFZqxYj46RQxwvx/SCecxuabBmIXgzQlcbVxZP9gwcOPHQfHjgbOLCw0w41x+d1kw3dZD1Q1yi+eb2z0379sWsPzz7RPx8cPP3qM//9qKOr9tB9i4Nffn2nUjNSaa/DHn377RhcbpGqejo7enhPprm8QmezfLNj0956PzAH20u1Pr3yBr5WKwLkMtl1eSl2/7XA9oaGbLG64FBOaUluvt7QaPQYHCdxBcAstjkuzM5OTx8/dvj1pZCXCTldThTlSOZtaLAnGCvFOTkI+VouASFnhS3LqzwXGrAkixYcAVVPxCDoaPbZ19+97eGfP/nqgcPLx3Al2Dc7XQPuGoObbLO60C7Pr9XrReo/NXyK6wezJHBq5p6UZ+fUZ1dVKYuU1xlHFzHFi+FtXAlQ2d21aename4be8EC0AccOLBKl1OYpdK8vjPc+cwtQL37JOYlB0//98s5YI5x9QNtX36tlFtumZuZeem1dUVGRosKQfiFjmme57Y6TbNtennBVHZnKrbfeGPpoSeNyuvuOsHbcFXFIkFBA2DmGfUXz7PyGrJFavWhG3Jz9Tfo8816h9Y9Z3ms8nqsW3Af6sLIR2hh7SztuhkyhLDe6HeC4GA7kbSSGKpoI1iyjU66OAJSHpUa6ngo+wg6slaU6AkSTRZ6Y+/ap37+7Punjy/cceTaW2679vBO1wbGpkgCmGOV3XiopEQsz/orqR9MP5gG0IVLj/GbG7GKThTdaexd7Op+CIjjktbK3t6BgdXlaWxpRbU+4nAICrPN4iypQP7iE8jrDzxwyx0Lr/f2zwP1i//dqP9O3bU+NZWf4bFOt522X3Z6nen0Q6df2rFc4wZCOJzkhBNIkISEkFtDDJBw4IQI5IIhXJIQCBizyCaAuws0bZEFBatFumU3guKWQa1UWVe6UFRqZbu1au1up63by/Q50V7+BP0tRGcFiXnyvJfnfX/vu+sLL2I53VyMPiKXevOP2yNXp68IivOai4sFwRAwB9G9UlNl+/iNZBvtB8m5T0J9qjpHSBzBgcJVkCHlcYrn/w4wzxGJpCJhB6mw6KsZmmrTYvnpcDjfmp9ZlZ9pq1ie7rp2482WrbPXR0ZHXgO9PY6DAbRWeMB6dw94j1+hxPwKET1oD3keAZ3j1+4TrwV+ETtxEMXWt6+fW49Wnfz9x0d7H9m4YQjKqqr85FLlaB28usftCaDKShEqkVCUl/5f1FPll/Tln/J4mn05clgpub4uHLXiSlaF2QzYZ7tvNS4mExzXfb6ZxuqC7JxKEVZJSX+2PjR0LbO0N3/20aGXXwHqz3UQ/9lvvNiAKGZEQYpz26xXJiNXbkxH0osLBZ3FiaGhFM8TqtqauuCVpLPG71LgQ+8nVPMjaUI5J8qAMAVpwpynATvIDlOKiCkPMVxurpCwUATdpiC4ElsNFG5MIeIWMb5kw7rlWfvH75VYl66PQqMJoIvC4T7ogVu/HIAs48BvHLDrv8BdCGB9zOEA0xHLXXafOOF5+9il11Bqmd+KVt28s3Py5G1rPrf6zYzhw9alNn1bk8ON2l+AhVchKTont/kJ17NSWftetMQLllcy+AUHoMJjQLy0z2ztxfBgJZ5Whe3Qofn+ZNIbQckNV/VmWpGHInMrzJD+cisUuoZ5t6WzZ3ZzqD/PqdtnvzRQAcyPKegOUV/F1uTk5vZ0qLissDCvs6s9NJ5S3ONGS513ZtrXmkrVuKPq788QAnLUz2W1mCbHS+XlT6meEmUKNSKRSEwI9QoUvUjKUlmdo7X0zVoT49OlvVVKbNU5u946tH1TaZu/cGuw7Tpght9GzhZz/Bre3O14rQfvgnf+6IZeB1+PwkzsDcT3PeipO4dLEgjcr6+A53cO33ywnSzFDLPuKNbwK80zbR1sE1jOct0dCmhBlFYECw87BKID9NQTFGSdX9aIcqAiyjB3zBTsRZBWha0AWEdgPbQ4w/n1eKSrsRFkrxRk8CwFuMksXVwfCvnM5kxbN1bAplB/TpX4XZ/99hwWJM69rlBITe0VG5H41s2jq+XFzUjW2tvjzsQ4srWxsiFv34x12UJyyTlanBWquqmMjhTPJbUZvEK8qE/BfnqAeTNPIxWL94lJkqB0NZTFoi2QamfCka6+dqs52qLMb1jsmykObt6w2WYuDA6OINsKxHrciNjcgZ5fIaKDhYca88Zr6Kr3vBHrQY7e84bHcSl26SCytZ5LF+Y3ksqTd04nfOe3sB07imc7uZEZtU15AmltuE3H6AIoB1kYiiBV6hxeNozP/0JM5OtLU7wcyAsp0E194LlSWcLt67RVzB6ab5xNOiMRcN3pG+4SZKi0mIZVFprlYnhbqc126Myrc7uB+vPZHA3MEbiGrad0fj0w34qMbU2fTJSXlxkL87ztYynMEyEO8+HwD6tpnQsk9z/0E3W30jpg3LlBDzmiPCkw//+4HQINEvRcPiY7ETSpp1lKR9XUpamlrUszhl9iC+v05Ie40nxI9VNBefDDaGl4agmbWXpQVg8cdLth2AOOnoD7oMN9qef1Hzu4eD52DH8ae63nWAz4j+JS+6UL17fuVh1dPb3fqbqw0l0RDQ0vdl+1b1mn2zxsuqGNjUGC90CfYWiaFAtzcZXu/96SnEiz/1Rl7oEDQvk+TA+WSsHgqhKgzi1/tq6H56fA9cmxBK7lNg5zI6MN30UJYigJrp+32eAD1rp3vwzUn8eq267PfWduriE8sGwRi00+2/l416NocvV0mb2zrLkvNIRuONRS452tXudW+HqAS80VaHJWCPvbOjQdcjlXWOMV5qmaOczT//eaQnzlQZQRikksudYxLgW6a2q02VhwvBRfWVtbW3/UZe+FkTTMCMpQfLlr616aHxyN9YDniNogrkCXix0Eyj09b5yAY4fIBqEOn44ex+UeTA5Gu8zUSrLqzXuny4v7ay+cO1TRtTZ91TffZ19/vzogV6c1VXNdXCxTbWEpkkauISwqzEul6tzZmw2tMU0wZRHh/oNsX0eHRKp2TpcqS5QtmJAExzPbvT68ljyO8vqCc9jZ6DVmqy0ajJEd21rvCzUewkjx7vXdyHdeeOHrz92ep12f+/rAAPx5v1ilFm1YfZNd0eR2J7fmuMw+M+nFjQaulmpv72uc7l5uAuY4er+r4/s1GlmHRA6my2tz8loLYTkRv/0Xcth2ZOg5uXwxQRAkofAwLsbSJE3HRryt0PqZXy6uhYfKNg79qF/bn24v3j/24d0K66n5wcsxNMc6YoHXYniERwfnmZ5fn3BzuipaLw86ei4fjF16J3Z59PL1W7c2osqj9zCxKqst7fLln3abrLNXnd6RWlyL1O0TZUvrADrXv1dH05BpKKFYnYNOzacHUSYckKBspQ3PUibZJ5OIsYh7GlwvqcpUliKGD8/OOteS62OovoxDkvVmZ3RUon5YVnYl2WjwJnvzbcjXB5DgP3eoo8ICns/NXaAovnrF6oskepPJSPnhss5O+7C93TmegOJeZm/3NobDFzypu6h+EF11ylKLtRnyfUdk8toCY2seomGOQ+D6U54X8nh4NbE9CZhTCsZFoYHJorG3th+3mtZmw+HZYYH61tsjTR11e+ydgqzVa9tW28pPR0cHHSB6D9PjAakh0Dlg5C+/AXaD9D1QasH+y55Lx2InRs8uLUWVVYnT+yeL0yvTAj3HXjXNzG5cHTVkBABxgVRgqNZ53AzjZwmWxmFoMkeUm/afgq8AD4jg04tPVUOlqe2QfE8slmrbp0taSrhgDpNtU6jPrm3FJ1FpBerYTSSsRLOl0b611hbyrlnxFT9Dbn/ohRdefK5QR6Pz3ACY/j5F6nOX8p2RRHT6ZqS8sxN9Mt5I0Ik7DU8wnwLmbYwf4iuXsHUstafpJZBeL35PxjNmGDjS/Ddux8G1BoAuyuHz9XqCgk9XkFxTlcUo8PnWrFfjsxvzXWW1dcjHVQJvujFeLMgKLiRtVlj4ttEYZ8ghnMdY9DcGYsewp9txEFwP/MqBYjvs/uWAAxtc5pdmq1oS5afL7cY0S6HW0TMymNa41KiWsDpGJ0yTlknh05n7Ho/CQzK0n5bg3SdSF+FuIw6gR4MunrRRUPaoUiPqgETjkqtU8fHp+okSJTbz5gP26elu52JyYywyFHQu+IYNGQViizRtj9G+segMOZO2Cqt10Tow8PLzZeF3ffnrc1iEOvCqjtQTFxpmIsHp6M2xw7DtzRqDt3V8HK2v0OFavWcHwqfqaigdCuiI26XLfXahOCXEHREVGtUmXEh98kqmP+ERBgqlbLsQxl3MaXcMvpNltZqs4QXM/PfZ48XFnXXAj6o1hgRSkSaveH/QieE+S+fQDA8B3gOBho3FQPaDAQd6nQPQ4h0BaPPw7Zc8lw+Ojt6a71a+mTh8OitPig51bzaswmUDWiQsgfuP/X6NvTivppL1sG6EEjSL+q+fIXWkJUeK4b//te9wQul5xYJ1r0gkO3JRTkjjoch4byacOgbVw8Rjh1N3P7gOC7/jHB+eMRQViWt4mrTOzq1kY8g7C2Gxe3aA8+uvPD9cB+YDAyhSDFSTpHh5YEbqnY7eGDvc2dlpbNbOhJzjnCrTaTf0zYfnvt9Ww9L++w9h3tVTUyK481SnTA6vUN3K+fCnHh2/pjCHcYcqIyQU4JfLRVMUDCyl1Qjag6Xm0tKkb9y3NNoTY+RpBkGxVitqFgjKFxYw8GN5amQkxfTYSE+MxTUItid24lLsYACQX2YPHnO/PRp7B9eX3l4O97YEMUVcIJIJs9ODe4VuTBCss9S5GTxHvWAyXVNj8fiZAKqr6KLReRg9LRaTKqTrqZIbujZTE0owqaJMsN6XKztyRAKvLg0NjfcqMR0LG5mV8OsN67O+RaCODqqFRt8UUCeaeBllefatpG/Im8QCg3CYQ/358evw57DtNuvcWZIQX8j3jQWj0d47HOZ5dsPwZCqGC3Z2YlWlteHUSIDR6ZCpKRTq/qkCIQronCiTe6BAXcPdQ/5fmQV1rDzMFRTxZFh9ikyJdlEw7zQD2BXojbt2twrbMHujs+u3HE1E2t5IlsigMpg6iwXFC8iZpq9M4bICjDkwHInFAojkAsdeZ8BxN+M+yPQca7o1WjeKK0zTVRM7aIgTaIgagifo7MomGVTSkaMh6sjNbt4r4JOkP+DXMZx9d+kUOkpBUUIhlZNbkIP3J4w7h3ve3mx0dhevezVSrCRx6QlVaHVnor6kBNv9gTnOxuLw7NoK5s0twMLPGAozCHRGFxba19d8Q4lpc2YmONMwANRffC6EeFxoGOBytbmzNaR4qcI36eyNRldh2zuxa2FqMgV50I5cbdna8KORAMuZaGCualuuJVyppokDfB4w31OUGuMF1J8wCDwvzCjg8WW5wg5CSBF+lw40JymGFkvTBWMPjtZP1Nf3WhfPVWvT8iJ790gNBrXBZMwSdPoWWvKnV5b7Rwa5+I2rjQ46YLZ7LvUA/p6AJzbqrhtsG8QtieuzLfU7+9/F2k4twVqk6VkhdZqYcvn9Dy+S+3Ky05vT0yQWHev30O6LDKPw4w1HUzR8jVy8j59RBJbDo6dAx6CsNGPzel+zCeLiQwWH+h/eRLYO0DnYbeHk2nD32vGxyXsLO0/8OmkRFeU2S9dnj4cSUfNL5lLbACLh5wN1YL57Lozn+zZLkucaro6NT0dbEp12Oz4iw6YEQIc/r231rgwMnBpxozit09EAvfrcPtc+eEAI1rmooFmyCwr2oKD6P9TzUuprrkycKyP0CkwoIF1+WkcqdCQtQUPk2B/eq6+vUpqTS2iPtCNx1moVlQaVVCPYb99ZMJcml+bPAnRgHfPEPFDmPJdf56J4D7I2jBcZRad8/8qitX789OH95WUmaD6EVlCeHtfu2ZMrkx2QZaTtSTeV7+FBA2yioSv0KDA0jsFAFFqooOHGiBwh9MP0p6CnZXAro8qat7x2oV7vEhNaFS44ccpcSSaMN441eWV5dvF8ZDKY6pY0FGTQltzCZvvko7WrXb5SM76iouE54fqnvrx7d4rnb+OVGGxYisO2mxP2STuse+R4JIgz7rV3tFZ/f27g/UHHRwx7n6OLqvIcthaD6BLJvn05RcLqggJsTQFxuPM0hsvL4CGGEwrFEsRxXIcNrLufxgdFGAXl5e/ee3D7RnT6uEqQIWres8eotrCKGoNBYxRk2Z0+qy15qhHg9rjRTBOATWc8PZdwIxbCrGNwsA7/DQ6uJEvN2PgE0VCqhRGpUYtQLbUPmdKfBJLN9qz0vRo5jAvLxhiFG118IL2O0nEhJZIJPl+UusMMo5SGg1FZIkz97jMhvRQTCoNhKHEDGg0XzKGygiB+zblkTW5G4uPX0EoD1NNqKnnNxk57cnapawmQQ7/DOtfnAPVdX37h1TlruGHuHeY+2WRbGRs/icBoMmK3mzpDvs7gzjhANyGtPjMw8EOH2/P4MXNf56cMraekpEIuFPOF+4SyHHH1gaIDBQeyU+PhUjNeOJ7zEMVxxbVcEgkbCdSBOUUqWBdNiorLcQ6/+7vfvXu4zFQmyNqzV2ShWbZGq1VpUMadDPoqKpKnpvrbIMx5YsjcdD2s+wQbA+MPekYwGb5t5OyttVLlwmFoMsVStcUiZpu0ojTgnd48GYlHYKbSs9LTC3MIGjEI4w+wLg/FMnoGXp0kKQmB2e9IJsFy7rlihzePxy1ut9vX2k1qPoHGEEOoa2daWfIWdsQCdtDdGnVemU4uTMaDC8ON/TMqI6+ysrnZ3hxfXJxp3cD4YwzDzecs/O5nG/WUbbcix3wdmHvmHsV3et/svWbHaTYNIYYLjkNxj9di/3RDw3JdqvMIua7eYHhkkEpciOGwvVh2QOxAzoa7a8C9CKDjcDwv4uUAc9wGFstJOUnKKRh4Fo5d7ydd6owU6vvLOR0NfMz6bjOfAg+ZSouqQ4M7hmPBYaxCXJoZHO2BI2dQEofq+nO32xMLBEar2+pw1/XWYkXLg9OHy4E5n2LB5qYaQ4dgT1ZWeXkWHrKAOdguVnjoAOOKuTwBF+uXBDjUdQRB6V2I0nNyeYWYt5CGVQOIPjJEfJ40Eo8mIiohiW4gS+u9BxMAHQfrpjC5viXqvDqd7LKHguNOdEZr03IqLSKTyWg4NOvs2sjHWlGoOWEE8S8/y6gjbn8ZmDc0vP74/n12zpoI9vYqj4PnIHrrcTskGfA8VGaofN9qPd5eg6FvbWdn5pe2lhNr4Ubd0ytrctdrF9FEmbq9VnSgKLUUrahQ1Ayaczznw77LwCxGD+/qohiO8YSEV8ahDnj2l6fj5sHe5hwSfpf2NDURWlEZSiChxHHUuJbODrq5WM7tQbKGmTQMonjMFWnDas75923maynbrpFSbpZiUKS3yDpgsDnE8U7C37sngy9moMHp3K4e/Gg9glAWwTuJTxrejE+iLFCA9ymIDshlGhFfaoqEpr1SEiI9pWod/9ffcCbqUwdqzZtHg1eTa132MQxRw+1GVaGo0pKhVpu0j7p9XY/eyszk0rsBSLKvPLuoA/PdYSsSTGD+0LPb5rvX29JyJTJmN5lMrTN2pxNED3YZDdU/arD1TifXV5aGva0qE8aBFYewovgXx/6KqR2eh8ce3scB7EAdoKcwLyyEJsOHS88VQ3JHSdUlofErXnAdN1yOlBkxOxJcBO5oRs7O4GkpRIgBHcNU67Uc1/cPAXXb2jKkG7A7dszj8LvfYUZYdMh6ELk3Lq9bSx8cfvf0/jKNCQgiSbOgp1on02QgEQPm+LsxAUtG0BTDRZ6sy00HdAQnz+hIinYp8JyQoKpzkXgA9CI0z2g6OqRSdXwsPhZ1qlQ1Tf1L60cnPv7kk0/+8Y9/ffzPvx+dmJionzgaXFlMtndyXEc/vLSQX23hq/imvunehcS2mQv2oc+Fd+/+yYvPaOPcrq+++Gq3FRNcf/7R4/ue3Q3Hx262lG6MYc8Bdo432qHDAfR2k9Q5/7MZ79CYvSw18NGoMeFEvDYbhMefv+Z+5+doOjny8CEHO0x8AVYf8grhz3N5/BxZrkQolMB/isU6WkaRlEtP0nqSUegJjSgDtyH34qQjiKqFz8fsEiTTtK5GKIWXL06hnr9xYdQRQ0XNE+jRMSfoOtxccIwEBkeXN6zmD9Hgvr/YKJXoFNx3NnloxuOSFHRkYA4WEM/G4jg96rl+hnK7UOgJKFhWQjMKBHJkKpuQiPm5apG4gJedLcrgMEcxXYpYYLIvuTXb3R22Kif+9Zff/wXn9ziffLLzhwcf3u6eOrORDHaG8OqgH17aoa02qJBzrMz2+oLbykwlEntuwecrzyjXgfkPgHl44McfwbYfqrga2lT23u2SxuOdkT5nxAnMkaFH7FOnhkLtxgwj97Ko1AShUuBmUrvd2WK2NQy8PEq9zX43deWXc+vyXNwI4BVhfhNfxN+HI8sRCuVyhVAipwgJqmyMTsySLgXpEgplxjReNqqciJ8khITSgeUehmWg3qjUaYjtilcTV/Kj82iqgIV3QH4PvIPLULdGquscI2dXwubNFOZ2jRo6DOBm6nQ6F+1RuGQZGlE2zwjrIdNzkr+fpcmYgtbpAwp/QEKnOjkZ6M06kpARMjWPX8DPThNpRPgHaoz2OMYMXYn2IuuuMD/BHOfOX+6kzuqdyPve1lOnkuOTq0GuqWJKampq0hpaVdIrszcWxm+C6iUvKc3RAQ71Z7CFCpj/ZHc3Ussff4SQfPGlq2O3S63bXVK11BQPOkPjTs6fByOdx9e8nXZppQISJtI1RvfkWJyd1+qroEcculBzwVJ0AKegiDupQZJwkDk8Hp9PSAixUCEkoIZQQprCXGAXSUCdcREuQi8TSmr35WJHgESiV7jgz3WgOg2FXGeRmkTFxfsFicTVivD1H462uWOxGBuI/cKP/fhtWOR1btmq3Hz38On96UajuoZmHbqYZwS1NPwVCBVd8o4CEfIxsYTUs6SOJd00yeoUCOQoV0DOwNgjfIfFEUqQtomlEBOas40Q5IxGTSQSjw8hE3yrxZxZVf9PQH5n7MkJxcdUcZN0qVKlNvRvrV2bvDc+jq2DyypTe2Wrob0rfn56+tq1G1X1JSjKmqfn5n78DLZG7/rq11/ZPVdhHeAwv/9qxd3Vj98y31joCg21jvkWVlFE5KK4SOjKmi/ebNTwq90xfCE3jYdl8KFrdx7+oKqqtCEcXvcuqtN4vH3I0AqLCotE6jREwYWI2xHE6eViIQiOyEnOykkXRRCQRUgKPNNLSIlYLJF16IUuF6mA16W5skiACehwL0GlMSJdzwq2Pxo4NH8d0x8RyTlGzulGKvta69o4wf3uJPy5wC5SERIdRaO/xjPowHfrPHDawFSr5ltIEvhSXKwA+4HADVos5XdDioVPJwiXgiIJQqpGHIa0C4h32uPI9ca6VtbzWyDAVk387RMO8ziHtkqFqzlaccclliKxD2Tj7o0PI/d2doaxVDbO3fLq62t0buSXHr8SrerFt5pLuwcGONSfLa7v+jwwHxjgeA4sXxmwJv6EhDTaG7Um19a2Vq9dOc7Jr6Gu9ei6N95R2yESQwnDuLXU8Tz2eGq81yJ/KmmBGQyvN66robFnAPQ8Y7Oo0pAGpoLncOkEcNWDcWIFKaHEtJ6iIOzQYpJVEHo5sibE8XoJrDNwYHVkzI+7xYCfqFGZRMZiXJMNem0Ns/PXR1gHyi/M67jePNLe1jgTtt7kMM8q5MksBKtz+5mYAogfQ6cEDczxE8RCFqZFQeP3FEPQjJ9CPZgTgiXAXEwx3FNxiRUqFVDPbrV3olWES+3HxobWtmzm+vo36yf+9o/f/+VOBKCnjhT3sfhTNRYsC7ecmd3aNj8Y2hn3Hb96xZdMJqe7w2E0TptfursRRQMVVNsouP6TZ4zru771nZfnGhoa5oD5R3/95kcnvIkPTk5MtLSYp83mFvPtnc3N4wuJRGQ7HLWtGEy1mtoOMYsWJcziAeMBuyfQ5PWtbleV9FbYrBvD6yY4RY2Rp0E/nHTJkiHqkPL5KLTI9XDXYuJ7lNxF6kkJDYJTSIcgxYN5ejkJxPVyBFUU1+TAKgIU4/F7dGKK0vJN2eB6cZfTaju0PHq2zj1yzPHDOm7vh7dxtuUmRJ395Xk8oUKmJ9tcDp1+lGECLjdQR03HRXHEpigCNoWG4M9A+A8oGBqw61gYBqGCwHNANCnUGrRSzYzKBMAnJ+OoqK7e3GxBk2v9E8x/hyEkOOo4wnqTSnq2koboTF34kfd8/s07d6DHHr+yuW3OLDWbleZecz5Eu77ln/6soaHClt87PbD7J88U13d9+juHGpBRzv0cAH4R+Rouna6Ovwcl4qVMZUuJsurBBzdun3d2jbVb10JDiVBHLY66MiWUxNxuNx5w6hoT229BfrRVXJlfV/H5HZidz8MN9NbFGjQ+avgygi+HSquHZ4dbhzknOOEdVlXcRCng52mE83DmwAeaGSwwS8G26+poppqmDVK1BgW3rFBXY0XDLzEXrs5TzV4nmnD9uH+r9+Qd8Ly8TATlrIlldXX6ulGFm8vldZzz8bCI6AC23x+gKb0H3hwOgBPdGQV70a+DBSBosZ5FHcAgVGlNS+2w4NjCiDsNdxI3/9RSVVqhrP/b3/4F2x7h+A1bgAchX3KWVUgkEv/1y4bGio07Y6sLDz7cvHKDa53NLClpqXrLHJ3pqvY8/ugN0MlmNietHOrPznjJT3+H0+Fs7zs4L/0wdQjVnU/+OZEJ0JVKoL55+8b2h85QJJgctkdatUDdaJRq27iONUcKcdQ4Y3VO511cBUEf8PrKeh38nhSez2Co7D8zYxSpcU1UqIBtJ8T41LsoFyfKgdUKIE6DaSAiAeOLDx3cLdJpCmgx8L/wwqi5q6R2IxSBrq6+2YZD8/Mj1Y7ACXawaXRwxbwNzMv3F2tAdHwx/DgbQJTJ9UkwiDdYP4P/xwB24KwD3pSfoqC90pwv11EuHUdzvN0QXWgN6talRu9Q19DQUOje6r2F3/6mpSrTrFTW//0ff/n9nUhcLU0BDoVJonDoXAg5/YN1/Mbw+dWxOzsPNjdv95oBOiBHEv/WXWd7JfsYL6nj9VfPrG3f6EXm9uxw/VPfeeGVW86ZJeLh/ccPj0BVgaLmEsfH7t3GcntlPk5mye0PTv72g4WxyaEtp9GkNcg4l62xVIPsDgeQj3Gnrq2x8c8TJZlIb7qvTi90dbW2YlcLBpMMb6xrcrS5QlKoR6MhPhApk0jLkLPTcgXgRkED2RRcrotSAHWWJrhHCqadBl4eCj6AVPNMedDmDK2ts7bw1Jlz9B//6Gma75vtjd6Bbc9C3VcvhpLP0G4qQAc8tCLGSgK0x+1ikZojN6QZ0s/V/mkGbh2yP+FHN66cpoC5kNa7gHyN2tC37mzs6sIMxATOx+/dnnjrrSplPYZZIHAfiwNwoM4VjWTkoB7NgC56hNU0Wnd+97vV8aubm3fNqMaUcjyHWvtBopVhoFI9xifedeo7N48Ov/HCM3PR7XOOi7hza+x/G3Dff/i97z08gt+4IEaN//klZWZ+JkDPrPrT5nvbV4NjnaEVQ0aHSssrQCLWoa071pPqPn56RhoX/lxfxd0K6N2M+hLtQ+24vM5NnNr6JU9EknDpQkKikBMSOdqlEETJKb1YDEhpCQ1UaCCAqB11L72bq4O4kVPrEC6QNP6UoEgRH+OBBGAhUG/8KQZKBgYbt9Hgfhh6fZqpA9aDboLxZjzguIsZpAMsFaDoEYp1MR4SliNV0XMDcDAdDzTedowQYOMnsiQnB6ja13y+hcRCIjXk9k/v/WaivqqlPoU5gjiAnjrgOZ8cFOolepffwXQ0WseBefCDza27SvhzwP5SZkvJxIf3hirZ+zgp3P0uw+aNRBygv/CZZ6Mf/tNfwUwYbE48dbn2yMX7nGZ+UX5RLwbqOzdL6kuAOldd2PzTe3ev3sO03xUt0FbJMng5ANLBjej+D+qQwJ3XtqFG5JsrzNu9551Q8IJ97X19vuFHi1I+XLlQLBRC7kS/pVghUSCaoyQ06qzAXUhSYphbsJ0EWQlWr/Po3VyKFSBQ90ZkR4rV/ObmPQJB+5A33HCo+gc/RN/ERu/R4O/eBc/tJpXaokcQDp7rHExgkGW4wwZcyMfrCA/Hbgp9UsjUaK6ErwPSEGhYmBCuiQI/1WBRVf6ssXHh2sLOtR2c35y8W9/C0RyYA3Ik6LDuCNkBeS4xKBTL5S6qjpYabD7488SDD25v9iqVpamXqqp+4sG9oVYL9fAp6gwxdPumU3WZG3Hw4rOxDeJTX8McIAhhpjP9BUcu0vswGAidbmJCHV/d+e0E2gY4A//Sv5k715+26jCOe/elt8R4SUz0rWJxSAVLOZweW2nBlhZsT7FgAW2leEEqKN06NjBiEHURVjRKeIHK6kSNV0DrigkxI2CrOOKIyIa0FCZxuHm/fn4F/wcOyxSULuPb53m+z/e5taUXFheSs01NT086NGa7jjy8+DbFwIjBFupkUSzufuSR5GJublmRqDzex23Nlv1DLfsf4dLu/LslJnrMZUydMptMHZYuJeHaVYPMuwDcDS7ZhSJvxfDpjRZBuNzVKoh3xz7Jz3/0Ou0FVY/evuvmJ7r2HDjwRf2Lj0x9e19dCswrK/ZWl5i8qqs+SFeMH8MVPNBIYCAXlx7D0tVWo8XvV110ezDfgLIkdDjVL91DM4BqFDUXp9dZ86mYVYoOx5KnTsWWBlaYb6jL2vkfayI/tzuEaxfdXmo/Dl7WGZobwlWHQ4ODy0On0gsz3dD8Ii7Et5U1vvbP2mxnuyT2Mwg9+gdr59nFpPPxtyiun3/5znDv51x4XfEuDQ1Cfe8e0uTpgxw0MZufl2W5B3ryZyO2TvqRX9SW3lzaBPW9nWMODRsF2MNwW7nF8DL3E+g95wH9/v7nQtFFVCjRSdbbm05nNmLs3ItGWhJfzlc57GAuKYrOYlat0DlMTJElQe+sVtlgxuGimUHrRD5NekVJxBpg8En83qqXdG6no6SanTQVT9h3H3j/7ec+TtxfO7y8SrJGSciudRhVPRSOJBz2Z23dB/iux6yYtcto3adKLiEC+Xlt3IFKwia+Qq2PL8qEda/XtOfTSDwUi8ew9Y2N7weWbOJU6Gvkan9g6H0OHsw8HCaWv6yY0Q+NDbTAzjO+vbx+ivvQ3bW2IjHQXEtAP7M2O9tlp2JrAPYffgi2r4D5Yzdc9Oz751+8U44CnHvpNeWaYpY7Dx5ueVSjqD6zr9z8vKpz8CY+9SdyFA4eW6/LpDchc3s9nW+aoOPa27D1crOh/+gr4M7DFAonyz+JgLotl90CuW3d3EcXEwGxaDKZPP7uHSa7Xoc6oyeqK9h3uai4mRXCNW8FyR/kny7VqFhFeBdtWMRidFMoN0otYOHg7SX0NhaC+gNP3TeTLGsbnl1FiKNj01Tilb2Mrigk9vUG5lL9+gA0ntANHfC/oLiwZ/CVRGseCwlopvIbCOsqft0FNnY2lc5/HklGE8mNDc49bw6c5K8gtFeBOYZud8hy1rfryuV+CKhONXidVZ75FXoj11OZdPpYHc2yODggf+3PtbXZgyaTXiYpEFP77ScGQn2tP1500fvnX7ZzVtKcd8k1OcU5moqKg737KzRhWSNqIxaVqL68HFukDdRWJFjpwEZ6IbO/p7AJ1DUFpoK8PHOeL2x8ebp/+n/QaT0/FEkcE0Oed7XZ6gY2z6Q3kqEk1hONf3m4ySRpC3Dx5OkWxUzrgirr/Hor7l0lVRaKbNAvNePzRZOqX9mHCfolxDNUFr8AXdKGNU2P3nJ71RMN3913X/drqdllKuilQO5s0DZI8LH+4EMEdYnuV/I1I8Sfik2ratinujBwfLtEGJFRBHhoh3TpVbIII67d2TAfj8RmotE4zmkzM7pZR4msruy13/4R4msWdDI1nrC+n80kFsXgdpZUf366ZwQSt5HOHIPx8mxh/sf6bFefCfeVdfCmgydGU57WK/4F9It30lbJC64uB/TCwmc6u/eXgroPY/dRT+4bHJw9JTx8bj7hqmwglk7HcPB7QT0HW8fUzb4qb/8EoyUCcbHl6ZNDb0bih3MZAsq31bV9eHJzM5OMhVLJeCh6+vCjYjzZrNObVTopdOTsfOjRxi0GxWoAfSPyrIpOiongmGm0bVACxuALdF62YpderVc2ldxB4uZ8uj1a25haWxMBvdpkcptY89uAvoo1P6Z/QAjsImXXizhude2zouUaeEHsnT4duq8VRFfwJzOUCCpeU417PhGJJuOxZAar/efDs2KygdgM5ti54HCArijasFa3W2e2MGVNPSDn2/nB1dXl/clM8pjNlg+Jy0W8G/9TfEufx4EYAeZGe9fKQMz0+xU3/HvRTrLzLOqQOQ2nL0vXe4cLq8M6H09VmKy0bzuuizmuotruWCY5PDtSsbc94qkuwdbF6Wytt3+aFY2Pc4hBbHb85JM344neOgI73qGu7eyZhQzOPRSNRxNfflolycAsk7DD5PU6XZbaQejA2mKVKbLjjIFCFNklOJ1LrVGkF8x+wbWNUG3w8Twq0vX2zmO21Pr6V5Vc0gmbUXQdpuYaSaJ25oKit6K5BKDmvELA0spEtN4V0CPOSFmRHXGAGOK38HKqFbN329vb58e+DSVnMhtgfuafgZOjOPdtzJe3MHeAuaILgzk+UEd3bEnOt6dHRlaXh2IbSfol0DPonBsXvl3wPpPHvo35wZWBVNj/6/UY+o6y86wSexVdLjmlFZXrh4dLc8wKFqzxmWXRO7L211lQF+3eRbbRZDI2fLCHzd9vevKqHNrq6mKfxhz4ZO6TV6dZ9jfNr+np78biiW5igg0XX4etL+DewTwaTc5/kefWOvQFLKGgi1JPEidj6EKUJYsjwht0er/wvEKlk43GoDGgNMPHOoSgajUoMgB5mpoKm3q6emtjs+ur91aWVpeoehi/V5KNzQ0PGa0PkJAF/fukYADV/TF4OzIdiZwLltghwd4QAVXIu3gn8JbgjzM62h3fTMVjiXh0g4CeRoY6BuYI7tt2Dm8XJE5Rwma5X+YGjdbuNlVXHz890jeyup5KxlZqbfeR2I6Lh3jOt4x4HBSIaazvO7jYG2py/Xw9Wwh3mJ1voV4M6mIqnLjORi2NhrJKuWrq61ldO/V9Y6Mtl3SkyHYslWwZ7qIO1f4m/SW0ARbTbFBQw/HiV6anX31pmufo0bGx+MwAheS7i/Lr6j5cSmewdNK2eDL+7pTGq9MVYOZ0zigFdlkW+owgctRZAwph24KfF/Td0CwZ8MfNslDJLQEl4A8HwoZmhxtBtqv9cFtSYD4YrfCGQVGvGv3gznKJh4IMnwcMrX6ig+IKuur1AZlimgF0LSKUo+BA3IzkiQYRSpBmqLJ8NJmIR6KJ+EI6vZQ5dnaR9jbB4c5sYd4H5IK4w9xf1mnCBbLT6Xm0YvL0YM/I8mzqVOykTSgTRbkC87NZzHs8JlVhjlfYeVtI+8PPOPd/r91hdr5F4a8D9Tt3lT4z2/1EocasZe40J6woJhK3tb+YRMCBCS0+nYoNDx3cW9HUDpur9njyNCiyUs3c9BxLILYwPzoxNhXPjOLeRX5fN7AkPHw0EgolQpEnW3LcJny6bCX30bESgDK60GwIsxTbsHZMXuITyVhOwG21lpOz4dpltNiA1w/LxsqeOPiuLb0O5vfuefdzR7MiWLie7levkTQM6ZU2CWtHQPIDPBGCLBCwGU+FJlLdgSSK2i48QjbiZtyOBsfpqTgMLhlNi2d08cR42Tj6yhbm2769QBsG9X5FY77N5MDblE6d5rJLD849ddLGmhwCetv4+G9Z37480uNxhFXyBKd7qTdWAuYY+s6cahOo59x5Z2nhO0P3dxbuqtJi6hpfmAa4nlVUGjx8GVQlty05jOIyu7d0b+dzJZpqk7ZKqDTGholpzmdMb6P+3dhUYqY7F/0WRoeHX5iJR5PRED/axFN7qr0CZwPxXPJpZXw9Kg10zqL3C5eoNxsw9nJSKYXw66+XMEuJCC2AYycRt9f3uD/OzWJe6dn13lOf2t0Ggx9W1tqAIiPm04IEdqMI6R2tVkI5cULxBxW+H6T1KokUX7EQDfSkCW6n0/HF1FQokoBykKplFhdXYO2NVEzOCFGmS5RSs8orBaNXyn23Fch27Lww8SXFV4H58AJ0tQzJfTwbz7OuocnjUMPWDpe963h3S9j40xXX3/DvtTv0pNO5l17JVnY8/L1DtXtKd7EwU+PTsJ7b1NOzla835ufy0Zva3zK0PsgO185DVZoqLcvxucXnrD8yNzE9d1TgDugTY5OJb2v5v9vyy7D1hSyZi0cSyWT0QXeOAS3WgjInC2XWrBLUVYUgbsGxK6CC8yWyw7gpsusAFM1GblY5BCB52532GueXRZks5qVPOz3vv/9Rc42zgdSeAmq5FAjwfcEXsHDs22r1W+vNvGf82SYdIf5IZGyS+HcUGviEEUb20WQoDuTxRDSzkD47utJdm99GPP/7LwDcdu68LX3h8G6uABRoaa2546ZJcrURFs8Mp5JsqCvLHc+vbcsnV/sFzL/CuYfNqEDurpXuFk/wd0jcjsU8m65rNGRuFe8MHe6qwMrzcqorqkpMDvzYmkCdYgIJeO/+bBsNV+5r3gzjEbR5GsovhtYPpt84OgHg3303MTE3MTc5uVLWaCuj8jQ+PnCS9DdE3IwB/IM1WuM94MhFbQOO3SujaYYlfbkiWUHD7JJl2DyES28MblVAkd4N+oChXlcvrrfVfHT3wvr64L33Ft5463M17gMPTjU0S81GplYM9WgtRhQeJdAqiRI6TEoRIR23zzALdHGrPQ/GCP68NqqM89AHAnQCeiKxkln6fgn/hOC+hXlX1+A25mHJt9tZjJ2L+wC3T2Uxp7QWG+6twxjEXzF3K56v9gjMg9i5u+tEd6rEKgL6DTsX8y3Ui2Fzle8Mdw8W5iC5ca7DZ9aZ0CBA/bUy3DV52LEhQO/sqiit3nMonKPZQt1nbP7syMTRiezDwcsjc1MzK2W5BHZIESpNJgNZeiQai0anDjTcBpuTqa1aGHLS6s2SGfSNVgUav1WCofSG1QviRaWFsgynd60B7W67lzWD8/evZDHn/MrtJWMNDfc/9dyeehklroOimktIrUi5foAPBv16QjrJuYRCiw4DcyOeW4CbP1shkshOe8vnhyLxmUg0mkhk0ie/PjNgu+t+QM9iftDu3Cbu4XDV7gYOMOv4bNetETgczn19f2qIWEAwoNtki8P9MjhCn5UnGOzwu/tWulNNwR/oRNrRmGdRFy2spe+8ExvtK9VoyzWYvq/Ks4162TgoYuwnKD7yg6/IueOJ56o0AvVi4rq7/rO5IxN4+QmOYc7NHZmc+nyFbJ0xT5jAwFI6nYhGkkl+vsfva9dgb/h2VTEjyCKOPSypZit1doiWokDkZIAXpNwgK6x21Dk53eZolrw1Tz/x+f2nZ9e7GFopLOS2hHbCW3P/g4ce8He8YAhA3B6iDGvVBcjDCeTGe1qDerJzkZ+pst9CoqZIOqNZL6H48xuQPn18cgxDjyWSiaWNk99nBnLbgHGryLLcZc92gmjDarj8AS/7y3Wy3XN74ZsrTV99NTKyTg12oba2DLJDnwy5GjX31ZEmDxFdT5bZdbxtuMnxw+8/73TMt1FHpHmnMjUwWJpnpvpGvu4Jj/Ssrq79M1pWBu7Y7regPjQ7SKfwnueqNXmOkrw7Qd25+7Mjn00cef11IAf0I5OTn58os92Vm13NOrqQiYdCUZGwRxKg7i4hruuEbWtphifKW3RUWwXfAnasEqrnwqtD3JWAV6oJo3Xr/d7OxF0rs0Ndlax7Y06p8uZd0mfeQwcO9H9CecYg7FuHpzD4XPsMSrPV1WqBLrpEtMfbo/9JeBEV8sAv4eUdYI4QF0lEZ6KJhfTm1xujNIfhrn87lRVlgNyh1cHgzOaXvSyt19L1VVEYOd6zd2Tkq9mh1DrDy9RXoKqN25gDOpjriCz2422pJk/H78K573DMQf3qLOqVz1QO944UVml9XMPPoet/BA6//s9AI3v0avPvsiXW2R3YPkhcx9a5ZKPN47JyiXP3B2A98frrWcjFx8wJsbOjNr/O1ja6EE8kQ/Eo+Xp86kBNFcvBC6iykbbJWkkuR3tR+VSREGRlF1QbmTZswNEjzdqdNf9Rd24/bdZhHL/xWi/8A4wXGhOo1YLt22Kh5dC1hY221ndtV2oV0c0Sa4s2UKCGghah6UgQ0OkkoAsQamrUTnROC4osEQRRDFtYtgmOhSnReNZo/PyKh2g00Tt5S7YsGYft2+d5vs/3OZFa2Q/K3bO3n17o6IyBOdfBGHAuKPBPu99obHzq6X1sgRS6zH2Idw9RXqGOIvjAXQwfunihuMMVyu/Bl8AjJHWZw26XH8hMDQL5BDzuTO7M2UtgfujQn4Q4tayWAP2pKgWYmxySRxt8/yjD+ssLW59szYM2GlSCZkLB2zc/3ozFuC2oF8R9bujymPfhbVjc/x9zBNmrNIR1uhB7T567Q6swGJRFNIGL0SU82sXnD1XDzWijysUJ6ws9Nq2nO+hUaNQSDF4hycFs9oMPcO5vimdmZmZ6boNKDXs7IpHk5MZn5MMIstFobraxxVCPBmvVW2tKpHIJX24VA8Oiwlri0oO/HvUEB89vRj/7+eplU7PcOn73xsCzC7E7dIWAHtDeLCz+rtfbn+jre+rp/Iqw/Q/RHuOCtolSDb+6BEdoIv0T7VnoAjD2ekI6byb695ozU1MTgydzS0tE9HMrn531RX7DHA5nF4I7kDN+/biftBRCa9Bpmz/qj43FlimtLVwiEpCo3XmMXI3yK7x9mTmQdkcTVZb5BJhXfIqh37ALMBfFFw0qjXDxJ8+N2VQGDeNGNptTbepHab68flzAjmQ1TytZPN7pMSvqxuVCNn+SuCmd8sGZmTzgv6E+t3Y6UVuNfOHzJVfOo81RZh3ExU93pZwm7Jjqi0iBSdbJ4aDxFqMLgoVYQzoH8JIfSZYsy88JiJbu1KOL8fCAWQw5FttUXps5H9pbP5CnG/s+aKU17tN7GVUru89Vjgs3IvFg6miuFagyTXp8ep4kiGiuJ1WTg3PpqXR6cYki2eLS+fmJs3t9tccPfffj5R3MHWBOYc3Ubk/JKmWpZDIYij1TEzHsnGStY+tiIuKjrMQpj+9+Eq4dM8c22sX6c//ayvCyt2T7+6+/vfZ/qcn8HeoGMXjIubnPnl/WepwaJRMfRXQzi/rCyXVcmhjNv/X0AjOsLQMBj8okZrMltUZTqiqV60dG3szjDvpvHQH1+TORQ9B+ChKJr1YWFydyOdS5wVy6K6N000NltVpE1TLfUEFoLye0o5wIwMHaXlZOnVxf4ZfrWSo527A4HITD3WbGzj3OzlDI/AKoK1NZOdXY98rBx8sepMnv3ocZn9HT/mih15VMH7Qt7CNtEkqvcO5lxHkZDjc7NR0eHEwjxV2cmDixNL/iY7Z4Jz/HtYO53kiuZnLWv6lUFDEX5XWqQp93xwI2MO949ij5vGDupGrMuIE5Zh4LgDkVdPcaDboB9fb333979f+kD/LflNwsWK1W+0LvpQ97zDbm8z2VilLm7ccg8RfXj4miG3rEmYXhYeJ6wKxwjGvg8CxoUiqobGcy2Rmet3iOzGSzoJ6orkWzwi7OnRf+nQ/UuVTXqsoOuFK52gLqWKakt0igLgZbsUarpcxeLslGNRQORaYlnr59pW1igK0DN7IsQuXxtog7r2Y2DHqnsqZ0Y9/qQ4+cum97/7YooeuNLiP1mnv1ZGtYek2VlZ4oxB8ydaKJrLZ7p6ZmJ6ZzgzmeS5+dPZnbgHigxH21k5/3C9BdJSUGg39GoyiVsHgDCwWDWLktcHR4+Oi5pK/aR3905NVjl5lrZIdGIOZtryCcPyznzi4sByq2hXP/H04t/rOtW0vvgc29sPzlSkwbovFVPIz6CLn5q/XjxzBd4vo8qMcH+gM2VR2o72FyiVUzRfbmTDYL5OKZOTKCg8fWqTRD5u5MbGzQnJIjqmPrrO9U+fVSWYmEXy/RSIR4/DmBnZIrBil6JuQyu11f7rA/4K5rG2yYHIguQDZutIW0ukqPwa3zVoI5Y8jtH8yY5voan7nvuSZa0rb3u9Bgqb9j3szRYO1W8K7A0F1C38enmGTT9Gx6kNmzKOw9l9uILp1LiJ6JnfwcyMGc/nxribplRqnQGDD0kE53mtlNzLk/PtyTSyYiyK+RSPV3l/HtGHpvINBuctFvK+cSHcsBw6ntT7/+dtfY+Y6tc3xSaTaD+lk8vCePuQdJFti31teHDuX1iL2LnW1t8YHOmELZOs5JQkliq3+pztG8mskeeYvXCIbOMze3Jub46DHYm1xZvEQnzQRnS/kf71otJaTrEbbxpBpLidqiNuLvmWkT8myZKLczFergTGZ9PHr33VufdNjYUyG2k6mcCpPfaQix7kBsMZDfnDGtgvq+J5s+fXj/gfvoxDiw37qvqma/0PUqQB6/boUs0vmHE3F7Z2fTEAsqa3T0RN8PfzKf9N0pdLgffljIp2p2IxS/pMJSP1OkQIiTWFuvHQ9qGXKLcY0sFk36kvj22qFq7FzE8x3f7qrCzhePXV6OSaeEoV+3e+x8B3VrTalAvffi+jJF66JSj0KnKjKgw49tfbj+vFAkEOfYmSbGQZxaZWtKeHgLqCtCjvDq6OiRt94+IjA/kh3JZtfOJAXqBM3zKxg6hdaTE8Ectp7VyEY9XUj5HcH36yUJUCzk71XweDWndYzQKdltr4uHGxqGw5/0mLm5UanjDiC9G/ViMJKLA4w2KtwzM+0vNT6aeeiRe+mlPbx/3+Eq2pVc9x24F/5Ofwao64Wto8rwVU349mBuMIpwAPJr4eh8EqaCDrdD4QDdyA9ClcWddRbk96aEKgta1swBMB9rG46xNjWRIAsF8y83BeZi4tHr1EPb/bnIz5sx54FT27sOc8rredQVNlvvl+svmM1E68pKjrGRuQXGttY/HDomwnRibxTU4/2dHo+nNV2kKpKsNUqWjXi7V0fffvut0awAfeTIyEgGW6+tzncIn0su0XEqXGsYPteVUTmEnUO2JYu6HEzI3moqOPtQpbG7HfSu2cWwUUv3o7c/G544ettt2gJmYSsryaAcD4jeTA0/Fh6+sm7ktfbHGvrevO8h3LoYekXHJSjD4CHtdOJYjS5/GXbukB0ink/h16MTPLnofDCcm/QRzgXmmDkBBdbOJ5ic9jmDylBkkGjHLBx4scdmZq9aPM5t/0lfsjqSOC7qaoLCIUizo0G/DztP33lxMxYyCEPfbZjn43pFzT33KPDwX6z3mpUWgwrypNMJNtez9eEFUE/cdIuv9mTnVryls0ercKZSSPBWi0FRXBxytD4zOjIibDw7MvL22yMja/SFV9M4SDVqY2VpER43yI78aHrqsYxCxsEbJRw6axtrJKM6PwHDn+mhLJdNGHpLW3PD7c8OL3X23oada3WKIvG471Kb2HHBQLRWyyX2B0ZT3kcb+l73H9RzZeLw9j4xiwpJwKmTqVmZkKVyb1djxdh5moAeFe5GiEXN0RMNtdUCc5RXQBcZo1H49pa1kIrvYAiFlDr5RCfmbBsbiAcGTryYnIxEhoZePfaVoHBjsZgTzF1ixnrQ99lYzBxSn/r0+yt3H+YCdQ5aWO4x9y5/cSGm5V+vqLThWrlyT8ryPHG9upZRN98nA8MLA50mj9YZfMqjKLWQuZHle1tXR0dmdkDH0jH1uTMJWopoMk2sTRJMuW0WDAo+91hGKdNZLEI5Vw+lPKsrq1KXSeWc6jOZsPbOtmHfrYsLS/EAi8F0xUSZUvaZaPwPqB3UdTW8E8UZV8PBZ7pbuhpfft19UM+2srLt8n0lNUjsxgPlLku5Hksn6RaQm8anU+lBjHxRuJpwriP4eYISSx5zIMe1u6DtbFAonwkUhDSsSArpCvu7+rXmmK2/pS029n4S7177/NAxeiaEb2c7Nv2ETeU0O6cjl3soTxqM259e+X9pcP+PqF+jP1zT7oyB+lkbWqyTLbk6BmG8/WNjw89feJ6iIqs1Ih2daDRQeGw9qNpzgFN2SpWiMhB8JYOx//6Mrs7NJe6s9tXe4vPNnxcsjrmXdHhwMfpiRlGlN/LQcO/SgD/yLJU3o4Tbd6sZBG+LJyJnji4txGy3FUDiFAY0A/6e/wGjqcQkFpuEdMXc2HK2rtbV9TV2jde1VrlObTeViLIKSQBp/34YIY13kl0ts982PTWeCtO+FQb44Bz3SJI7dk6bk90IiQDxCkzdveqFJhLQK3WF8osDZk9MGwBzTlCeIKKvDB3Dt29uCtpu87RbKKbK9vHEpc0XbMoD1lO7FXOB+j7YT3ssNnZhI4Yiq8TDKxUhTL2/p+P4F7A5pLbaRHwg3kLidiM3hoOlew5YLej1xYHA+EvCsf/6HBnNZubmxdtk715fYu3EYDAYFpdvugex9cdhcFVWPcd8nPjjGnJ2DR8QehMIyHVtk3vPfnxpIWC7EUOvLCbGFvFS++/CHB3oZIT1Yl3BzQWO4Dv+ulsb+p46SLNN07ZontUDO9Bb8PXqMr2slk1y93Q6Os13FgJRsOO0OzzXddOhHcz7ZQZqRSIhOl/tL9l1hZUGjaFIcaPjvTin6MyBtngsdvrFE8lkcugsn/KNgDzWaw7h28Uh6Wjy4uYLkN77D29fc8VuStb+gnpVGbgHzEfPb9jMtDvTYcENbS+wj3Uc/5LeR6axI8nho+RtnYg0nvHWPaU1BAWlgoN70y/9Yepvg39mfv44CT6NpklW10wAN+EUk5t9mY0wnM1wMUMAh4LMS1g9LUp2eLa7uzmxd/Lo0taY+eabC3SFoSLkMcwP996qMRoNXg777cEWxd5ue+oVeZyNdk89/QALD8jHEQEgb/ntRoCvtssme3A2mEoNQiiC8Irw6Zbw64813AmA+a7XCn3esfPhKltVF+qKNGCuKjR93mKOac3OgbgtMH2CW7DJlQt8CrkaMpzZFjJYXLh2e9B3cbMX+qM5cOqa3WrnedSvFCPEZd7Yxxe+6NUqa1BncbBKp6i+PDsE6oeqAT7Z1hl3g7pN60217kGRtZRqWKgrv/JR5t0RGN0omAvUsXUKkZw9TUzi4XGwqfHuKGtVZx9zGGQKG8y73C9JpZLERTSrscwB03b3h5M3+RY+Ge4xU0vNr23F9EqoxqrvuksYpaBy3MSuFDsCdfbxVfsc6/oyfj/6W1MVsq6+hgTdSL1F0rPt0948HZxKBYPjoB6Ndp+Ot3WfZqcMmDOtRtTnZVSLR15Vq7hDwdcuVHnfG6DoqPW44x7zxPsnBObnBObL8PbeF2weQOaAjT2auATmxaU1NYev3712voM6y37urTLZPr5wDkG2phLWVKxiYyD5+rPHWUxDdbH2psmWgbaBX1HnoDxiBnOwHO75/KPRZ0Z5skCe5/BrZyIRQgKd1OfPMPPS3Z0Kp1OpdKbLoXQT1A8fFikbq0ugYBYM00sDdsveya2TC5zhgaLrdCRrSrVJLbGkt/5xyjMldkkk0ZU6VTFvCl1nOuufa1jr6Z51wNpP6a3l91SR/Vn2k4SVE68PfpBKRce5itzNe657rq25eQ45Fd/+zaYJV1NhclkRAw0meVUq3LNHE5KKClTtn8dvi932C3nnFtNmHYZxj1de6I3HGO/UxPZr5Sv2KLVI1xZEbUuttms5lSnYSaEqtlBQwYzKSD0A87TVyVwsWWcnKGXC5jACUycTFGRm4GI864xGY4yHxN8f1BgTvRe/zTIZOMfD877Pe3Y4AzGngetcMH1cYI47F5jvc3oaD7Pw3hvp/u65rUarufHWjZed+Z/GHNQvfZRV+qGu5waWjzkMbH9UFBqoorcLE3/gsU/IzYlRlvd74p0+BhEMciBVK0mNjeUkZNX+xNxSGg03mF4DfTCXm3n/qitrroTsy3MEysloMpJJJTOp3INei76ISttGU5HOAtOK2ou9Jq3NNhnr23XkLYE5oEP0Zruo4rq1+OnqIBkUt1ZLgY+Qymg1sGfUHx/L9nUWJDfPeGmVOnwNo4pld2PgKd5eU1rkrn5p+0RkKLltKJXJpGKT8VhsbLimgTzcpz02m/DkXBRiikXrydrYX623aKyywjKXKOQv7OiLBQytcwfnhnvHj4D5/Dy03krq33PrneLGQbTlA2S80cpM538ec1C/nHsKdzX5wk+PH3NKdovVQPpbVmtF49yXj322ANdZrfN2T+eA1+UKSFJ7pomNi6TmyM05O/O5Ebj+5hrmPMeOfkOfXUNN5ZXjJ0TTCmFbMoWsyj8YsHmprhMlYrJB2+1u13pd2c2bo1s7dnwqVsZCdAJGcWzfYnZrXKZgrbmIsiwfrtE2Y4FUSr4xjLFWR0Xf1Zvqxm7BuBdvLHromo18FKGbyeVrH2OUWuzuTW5LwfNgsAmHvmrbe2zFAnMTqVexP3AspJQlcrxc+Ah8M2B08je2dfY5WufmxueGPzq6nzwcEk5A7lSXl1E/97Z2f/dpB2N1ZnPjJf99zE855axLmTx/qj4WSCwcMVgZY4fpRru6tBg1d3L0s1GaaWgY4lxf3Ov2BiR1e6pWaTfrGHfiJEZieGkw/ebgm28KxF/jNTc1Vyl64a/snps7OhTZloqmkqmpVPalxYCWDCyrp7Q6t42aljbAWEOibvOe5yqq2ClTwNGFVZeuVWt1epG3q61HcJFS1+i0LMUwYuBV1FmR+BVHDvRujrC5phjxLjYblRIRCJ2fTWUzsYiI16KR5DGWWG+fvUlgDs9Nh0twKjwMLXkybQpJ3Wxl74Wy+ZsBldMg3+pO9BgGDh7Mzw3PHd2//7t5LDsm30BMXibOELbybbC1wCnh1NYF5qB++RNsHeiP9XTued/RbGXBLl9hu7qdvdjzX+4+gJoTYi76HGuF4Los2yK1sqQrpZNGVjs680vp9POC5RAe7J9ZnDpx5X58wtWbxscPHdgWTSYzkWgkO7aUN3uoiBSV6elWET2oXnqkAsnuYzvEIvgCcQVGyZ1WflOjMVlc7tKmWlEToVpjMYtsLFxHzIn17m+/9dHQkfjp/U3FxQ8VmxDk1Xqao7wkXyORSDYSSUYOte4aijUF+0fqGkSw/ZzNJK4yaXmlZ8KTaoPnHqvFKDCPi+Ktuj3WZwgfz+cPHpw7VNkC5oBeBc/lWzeKi3SR3u+I1RxUpcznnbMuMBdcf+K9J+7Zntyxa+FogVPtwdPZZbI0TDzNfzb65WOjFCtqOPoRj5PPCkiyZQwLr4HrGpkFAvmRNBJeYM7zGlw/Oi4mIK66sfvE+KHWTBI1l0mxJH9piUCMHbHIbC0F7/Z4ZsvSgMOxdUDwHNBFcc2i5UCMCN6LNa7qWh2QUpBloTiw243ivBY7vnvmj7zdUZB7+MUN9cUiXmNlERsw3LZUdkxcR83iz6P3D3WyrD5Xd+XuH/HnAZIxYiYV0Cmc16cUstRsbCb2N+YSQO502mI2h3NyLv/49FxrZcsnW1cVXAW/pSm/k7uT0f3fkpMxcPdFs24wB/WLn3jive39yb4De46yjR0bL0t8LQI2knOf7f3ysZpRJpN77+8b8NGRYoHr+HW1WUy+GBxScnYpP5gWnn31eWYkd+jEjWI/cuXV38wdgnqtqVgqkolkZ5f8tmvLSq4BdpocXIEHOR/RUSVW/1esGneas9kxq9PbNCZMgS4YohQP2XHDhNOk6bimtkr1eQ4qOw4++OIzJbUMKdIBWyK6o/iDOADNtZXItkj0QGcwVJvbUsNykU/D2jsfOmzilK54tLZQSqng2FYzdsM4kzCgYBjbCzj8R+YWD+bTkcr9nwH51n0cJcDgacrg+VpOxiGx8Pqis9cN5oLrrz/77MpEtKu1rtNBvU1SGvDsoE59/ZO9X+6tqaGjoLezh7jNhoY3uEEdrjdqmJwwRuF6Or0G+fOvPf/MyLFDH12PiG+5vvL4IgXOKCFUFLZPLY1I7RuIqnHC7e6Af6xuLNEDycGcaExRyKAddRabjsyrSVNcVF2/QXcN3l2n15lNZosVA1+oRM1VsUmw42jkgXR/0NVGwaVIrCC2Na1kkQ+RiUiqdVf0QCIUvOudB2788cdfPgxrxRWKMjAvA3N901Pc8yAy5AijKhdTOQxouKBN5Z9azM8uLrZ27z45vw/Qac3jjpem5AZ43gvPHQZZMtovOvu/WGT5Zw1/8RuvvzGxEokn9nSCtqSWFTSi+sOrWZrlT0TjHLf0ouEuOo1sNrUhEKm1SBhds5UOy85FJPzzzwO4gP3NdHrm+PFutq2xXHLu+JHIGBQUgGSzM7Mu2VvEgrZbvK7Jzo7YeDLsQMKh3FVW4mZOgsBpojSXnrg7VE+Qh3oXBl4P9FBdwK4sqKoKRw7FDaGXXkz5ggQExfx46mW+szDukUzrgfujiaZQ/TtbWAT506fzHPgHdWZYwLxd21atUltlK7keZSAXV4oFN32hsKFvMj87sshM5mO79oG5sD6SLJtvwbYf6j0pMFfbpfWG+SmnnnExY6nPrmxPJut2VaBa/ezx4/H39IR7vtj72WNsDyYjO9TRNbDDZbP4JTmSIiOLrJY4W9q1lJ8WeGPiwR1bnztytJc1e+w52HNoBikdbYvwmkrNbPFJHNFhju2lLVueK3CwLEwQXakkJWTX2S16l8alMbksTLiTexcJep3pGj2duHp+06xrVnIxlSEIR1eHP+V6ePOWg95r0e8bSl95uT+ZRTdgUFqf3uarvb12prdh97esxcOfi9MzeHQwt6QCsl02NluRB96lgNFINNDV5Ze9IvBMT72//+cftm5FwuFzVEz+cJTMNtTyMdk6WcL36NYZ5jxnXvwOZH9jIjHUcn8FaXYrOTDiYg9uPfzFYx8/dl0L4XfN284BqO6C65q2WnJzZsbhiHJ9ucfT4hkEc35ODy5OHu2+nlHByk17jky2pmB6kutm0am5Op8HyIuf2vLA8DfCmTs5viJusLM7XrKQdDepi22od1Lp19Zeg3l36c1aPeZepGM5IoHcU6hEY3RwJtG2efOWJXorQ+2vbE8J3RDBp2efjvhYHPtqr4jV5sOmMkq6CDgBe7E/ZVMCXjM8V7iXApzUNjq6upxG91J+ZHr6pdaWn3/Yhztfxdy+ivkNyd775ysq/LK1UNJd+F9OuP8z18UA+vauQ71fOJ0ShtugMhqMYgyi4+29H+9lThsT/3aHaCVlal1WZ3xquVwn1hIWyL6R/MiIgB3QQT2dXpoU24iu4zb1RzPZaAauRyMY+qHJh73t1xbbxjYdP35/h0rY9rVbfkqr0Go6ojmdF56XmjShJr1J57ZoXWTLy4v1KHgqL3Y7xXXxfeJOLiXmtmx6yesO2iYyK/UxTAnG5EBnKsidkJfXMLeVcV1Ky41/AXuxJmIrkGWrzohud88GhCVzdsadKltuZCSffinavbyKORGkqPyU38k0fWzPya0VDqOSA0+adYj5KtcZSl1ZmRg4WtnpwPVJdqUCp8cOqvBzHyzD9YZRuH6gwxW3Ebk1K9xZn2Q36zWSh9pc39zsyHQauIVfR82lc1NHe2ml5p7R4rFkaizZ1pbMEEcP5TZ7aMXLth75+LmCHqgucu7o8mar3mwCcyw74l2c466uLSrSuEjD01in1xVxGMhO570E1cU1ruZ420zXeGdzQPamUpk2AsNorDUV3ZWov/32u994YI3nOrA2act4OC5garMpCq08HA+yfONWgTlNE07JNpOeTg/mYgstn+7bOg/PqwoKJbn0cEnJDbHh7z+tMKgNSqusuWBdYk7f3BUrK6C+3TtzU6fDIGFNFQpZWRim+NIxDuqATufY/U5f3O12ka+tHnNJantpOSMyDkcXqKenkXOAjol/fnrx0MkWQL9q06aZ2SR5ubYIWfhoJHMwpWxW9NzfuqNqq6MC+AxEa1aNVYNq15nMxRqtS4Mvp4BSC/Iat5ZcfXGp3kyJHS1nVxO3Cb8uu4OxZB/xhT+WzLRFWFCd4nsqFm9jhej2PWCOP7doS9mICuIlrCrW1tqwJ0SF4njglFcp/Hlfp98QmErzzCQWdn/Becc1f66Uby27s8Sd6D2xYx8OnftO6nWKuUAdCy9U/MBM5VsGpxX/J/Ld1nAAOffR8sd72aBLlgbUvS4mfCVVddaFxCklOce8TDyfn4YzAC8wf+3NdE6gzinDzZszAvU2nK7w7NmD3DxV9XwoJDKWGsiFTAJ0LHgpoo0uOg36rUgUXGiY0jAozdZOuutYUMyMhp3MHLBTXe8KCDngO5aNJqNYdv7r2zrbWEPYD8/B3KKnQFe2seSWsodA3RQMrPHcrlSqsgmFEpHqGnCowjNpcksvdS63fDlfMb8Pd4NgkMyHD8PzbnjucEB7tfqCM09Zrw9cn3j5dSx8/Mj1bzmMMpEbqKuM4QCwr6FO4bSbO2WiGc1iVcWzbqVkbiRg5ypfcHYEPfR8mp+gTug2ePTt0QauFIL6IlzkTIPAfDI7Y1SQGeHLyw9op5RkpDkiTpjxRr0O4054DtN1ouOBMht7YemkoaHGzkCdHQMP2UnhOStgoe14ayuYAzigx7Zxu6f/YGUD+fZm/UNlpe1lG7kjpmdMvklPhLAa6isMkSliRIfDG/cb/FOD04Ppl2LL+7/kJOg+6j54HMOtZYcP3xLsXea4ADqf5R3rJOH+LxYe0FOg3lkgeZh4EzpLCtiYfvno3Y8fu/FG2N79VodPTHyyx3Ug61bL9DE2NjIAHXpwNj+4E9TTWHlsfDp39OQomx8oim3LJ1BbqTYImZrMjTUD2+rlRDCnacMv1strJQvUxJ8DOxzXEbKRiwNvt05rdpuxAWKwio+0K1FifG4Vptibis1EW4kJRXAQ3+a69+anZitFfB6G5GWk4R4qoyiv14csVHPI84K5nJwUtXlHV9wqOcdyI3T1xsZbvhS2HQlXUMEobynCvXbPiQ/3VSnRcIr1zPM/LLxAPTPAOgkDjc8ivClU+G19gY6e5RMHWmp4GvbscMQx8DaPLCdEadpMxK7hIHlsGNQBHNDFKxp+aEg0Ut+0eUsmn4hEWB2O342M5LJekmvCRgvdTgcLk8IAq9HriiE5xl0H6qGgVm8xEcRZ9LzPhAGg7gLbNXTMCaqDj6PDG8eb044nsgChZGjDzXcs1uz+/ov5DosW0LV6DHs55qJaq+CPIj5XSMrkVKFRhfKMk6TJ5uj7ySU+ajlJsn1fQVUBVJfVJQj32t4TH+LexSeoz1vPPF874HbxyssTKyvb4sc2U3WUSFmqkNdWG2TfsXDi45aG3Q2jNd0DYZ+Xd3kMcm3WBtfF+Q/J4I8dzAstR6aGF6pv04NDQy1Y+LqbtmQWiaTrycxFMzP9TdV6LDxfYohOWsaq1ulkm1QMpWml4g1k12De9Rah58nNYNq1BOokaEU6qBDw0HKgbvB7Q/WZ6K5dyVg2EWvacPNTS5XU1ebD7RTzyjDsZSU8eh9/mlHis0gIxKYKCx0Gv9tHZTizRNfPTOzY/s/gObcEeFQSO/G/vqV2z8KHVc4Kg9KusK9r2/4n6jB9YmIlfqyui0HCta+V7G8XqPeeOFAjDs+2LOwIe2kxD3jUclNWSwHKQrjuN0jJuZE1mhOqT4N/emTb24+JO7R1W1Ij0WSqjciqv7/Wp6GqBvmshQTednhOEG6G4FoxB1Nu0pmL9IRsxaJVzgzeJru2WCNKLyIPTx28mc9ew12hqU7Cc5wGrVFFX92RqxO11A5L2caNbP1EwpUx1ODVqjAOSDiCkaYjfK5K9laTaIiM0LWfi32z/zNoPl8F6EzSmQ/zNC3s/ZDSKpZItq57nv+BOrCvpHyLN3UpjIQrOMJC6VZbIBDesfzBgetGdxOuL/d1eMVFK79saMrYFGrJozF7ZINhbFaIOR4BusA+H/1ktOXG6296+IHUSCIz1vYUp7FDHlmS8a/8sGKuV5sfhctGxxGdgbrJbMKnI+g0ejd4Y6Ax/DTDU22D6iLWJgBQEuJLOh/qEKWQSERcRfc9ualh70+0sOo2bmS2opQ8HHR328DZiOhHPwaPG1Wk+23VqLNkDuOeSxwXmM+zbrqqilBFzcHwe28fBvN9JCQRmf8Dnv+O+jtiWVyq85stfYTraklJmCOLHVThAbgO08nEL/eEfSwPb9fA9TGP8Ou3Erk5A4v5/AsvEKZPr1L+hecHFw98QKMdGv6B6MFYaoLD2E1ej6yUAVwB0ZFwhOjgbdfzyltysAxK6k3Vt5fqS928x0wro4buGbop9BaiNrYe2dHhgutKlTngS6XQccGU+867X6lr2PsxO0L0erqtyyA6oOtdNhWVcx78c/Vks9KgMHq87FCM5pYYwOw8vv8kur0DyPHnKnX5nYcP37xl4a0qksukpqT/Bc//9OtwPdM5/kCA+jrldcScgr1KYVD/6ORunoaWE2H6nXhQcE1ZiuygJ7oqdnwzOyLcOjx/gbe49sVdCw01N960Ca7na/v76+ubqm2oPsmO6zBj20ng63DfKHUQhuyE5mZ+eU2tGGrXY+FX/Tl+HvNvt2hEQwWorypxpd1qi3NUP9oZdRfd3j+ObmeMuPwhUC8tK6O+VtJuswg3AuQY9+oZqwrb7veiRSI5MWbf+f5+Eq1bO4gEREZYAvM7Q8MLbxENGlRYuf8Jz39HfUKY+Gx8fDhskI2UGRVY03AYEz+w54MvV0G/8aizz+uix9GjlmqzOtlO5Ea3pLNvLg/gIM5PXkB9Ztcy+4Yr6zbPZvJNeHRAV5MEt2tNSow1sPOZQK/Tg3tjkY7sGziTe9cBvRbAMe5mi2ivsMD21RS9VUNjtCRya5ZAKNgU64x6bri9f3a3wNzCkW/G5krgOVc5LDb8OY8CtOM5oxLh7vHZDHJsifG7ydgRbDuxGvl2kTOQRXweWl74kIBdgeZY/7r971wHduL1ueEeldFpVShxooVhxJxAHQvf0NDSfcAgrhS3i8itHq5rzI1MPBmNXZTXXwDwVaIDfTo9dv8yXCdJMzKRbnrqKUBv1ljV+tLaa81oOI3FAtMhtRDrJjP5OLGXSL+hFrz12lWygz3v0pHAEWUXYRt4h12mJBuwXdPUFEwFAjffkb/+x5/mt3pKG0m9lnCkZuNDpnaPV4nmQ+7joHw5K9WaQr/XJklBVqjkXk0M7f8EDUd8LnhuVQnMfSf2fs70rNAx/yeer6G+Fq/3B4eHw+Th/bIKqhjCAeL1zpYP3h7dDe7du1Rur7hZqJGltjGd0g4Ydr9k2EHgBsmnsfECet5kd52gV/KmzQ8PTgwG6+sR/laNx3LNba9vsIM1BhuPDd+LdY1oOAS7Ccm+IciCN5QcOTleNL8TXYvkU7Mphi661TWWWlaLxlO2og1ti5WjrIjwtJfBdFgu+K4NuCWlDNMVgO3LWfgrGK1grnTNzLAOLX4IzEW+nVotlkxZXvJQSWj83S/2EaArKv53mIP6uVj4lycmtseHh52FeDdpNZnicWPOE9d/8KWI3Go4DeImSaN3m+1yW4blUzpstex07BjZCdOnHwd2BPwjL0xPw/Wamqtvevjh/MorTW1N3Dv3aNtNt9fnqpUiv4oBx2kX23VEaxRYLBpM+oYm8Ma681Bq4UUId4y7hcxNyOctBnWNlryL15divrDt2I27v/20o72URw/mhx8qA/MAZt2IkRKp+hkJ214I5rLcPJl7aXLSB8+FP8e2AzoyD3/uXVz4oooiCxKm8H9l2/9q4YncEt8MOx1WNLwC1CU/zHYmWr49KSz8dd33G/h3btjhmvszklXWSWwTdzgG8vmRnTun0ztfwNALsqen7ueGRh1tDyMTK1xGpn211HtN0e1ts9VqULfo7BDe3oh9B3PqaSC9obpUi58Xkp4Ynu8MInaTxS4qMMFg0MfemHattniD25ttL9lwR+7K0e8+7PCUb6RmU74Roh9+CMydKqURrLFStiVRR1Baqm2SwTq2NDM12dla+T7Fcmx7Bf6cOKCkvMQ714uG40H8/e94Lp7TzsXCC9Tjswf9CiulJuQtkRvRuefp3k9ONjQw+7In4ehzCdRpkYxkZAXjAKVqv9EwMDw7mwb26Wkgx8bvHMnGFq6sqdx0E359+wYOapW43dXXhuqferDabhLstWsatcWkYYoQbhYduG8ImUohOvivfleAtRY1x++WNvlCXh//2Czci3FNcO+j9qVNo7+y261U1FfaRazGL7SWZkQcCXdMt20pIFNYa3a5ZNmfffXVsZl4a+UH4s5fQVUFkPM/fmtJu+9Y99P7CgyqCtIA/0vM17iOfV+ZCM7kmo00BkpKUFdY6F8Ov7Xw/UkWyXJ1P+nwuN1CZmsMsWxAyfEPs0wU3XPs4OPTO6d37lzV8dj6/FSMucDrrt/0wPTLT3BLmdN7vmpfqHb7bEpGqAkb3qht1PELAjYdxdTq6nJBe94P8GtVOLOOd7AVPljNw20Wjq34aksO3/zoyOhusQpGR5y2sVTE6CJA11vJ/hCqkfANZi28MYb7mMtyT73y6jtjA0f2fyxse4GDPpkCOuE33tIeHF5+C3duICdjv2R911j+hevnXzy2MrH9jYnkzJxRSe6MRCbRbnPAawv3Le/9rIU4rLJumzNsc5sojnjkgRmt0ky6xWp0dIRnHt85/fjOnY/Ac57pF3bmOj/BI6Dhd773JCevQz6fr5r29PqlEQXGW8De2Ghu1OgQ9CRjOe5iNjUKFSegZo0nYk98WHFtfag6FAqGfGKVSCJ0y5033/Fg9+gvxGo68KaALhonwNwmxP1aCieWkZQUcwOusKyozr366juZrvGWt4SGE5ZdjNGVk6QP1X30qcC80KD8/2m439g7s+Am0DqAz7jq+KQ+OeqDOuM4PuSiSchVmqZtyFHTbtKGbJM2EJISAsU0abGmJOliW9uktOVoC3ULUheRYmCBsmy5LAWFotZyrGUKgjCKLB4ojj44jjr+vtRbx/FYnFHzldB1V3Z2+PG/rz+X9b3f3rv326kbN3wiZUrkQ8KbC+uepkMP7v9sbdvzbatXb3HaasroNqVxqmuW3nWFVmGOs9fhGJVWcI9fOcGXkPiX2x8x+IwPP/D5l14MhAI1XOAI+cfGTi4qtTUIdH20Hqk2ItesorCX+hltQYPwMSH8Kp2JnyyWGBFaAB0hfgylgvbWlZEbz+/51RvbTPZ6h1DvPFrctfm6GjU8qkX+I0TnUpnF06CXui6xyPpy6kEvtnvbNoBTZNFLrFe3Y8/vi0FKiRiZ/p/tk/kHZf3s3vPnByc6J2/EDfm+EzlBrc/icjUdWnhyfy1mva33gM1XzB4Tu07B8mCJRCUmG1lC1rA4PY2gv7LzyjjshTt/qvPRayyI37TjymdeKed2FtBjXmR9atFqppxaX7xdU0/LlAtpt2tK11NcF5pdhRaAObV2haZhjFnUWMjvD4W8oXQi01rxYhDmT97YFtdGgY6UC+aVDo0S2gRrOO+hizAvkjbUxJ00R33u7OunUzP931hDt1ZRLcyJ12iaqCyfvfdG7XGsuZ483H/30oE3pfqyd3jifGryqdDwWrOE7gUqk64ad6b38U83rH3tY1CXu8vY8qBLK2QTfqXU7Aa5jIvtTyen4J0Xdh4W/lLnXBuHXTe9Ov75z6/f6g+VI++hWCQ5dcpMtgVs9VDWySykdB1lAay8ib+bL7KAPq0qq0kK4u3+lKBeHQtyJSLx8OAvnmDPdRj0cH29iM8rMTZWuRKDTngubT9tkBKfW2oalBILRwpOT3QeOPOD2uO2bRTV1sBcYmQc2XWtjb9XqxcVxf9rOf+drJ/fi6gPJrrnlXKzaCwsktNcwjYnxbXXHt1hbT6tNAmZmzPzdRqNMXwqIJWJfRI+lgc3HIO6wH1i5yvjML8ycHHkDjtaV2/a8cpLL6xfLzyykDcQGI7MH1Ni0ov5EQW4GGzQlW7URrU60QErKq9gp9hGgQ5zHkuF2gOh0k9s5TxI8MHBX/yQWqrDQXkmur1S6Hf8QplcZkXQCb8bLpthbm1wxQ0yt3Dhmvf/4Mz1NcfpysRvJ1yTWOu3t7Zea/teLX2aQrf/n8v576nzBs+Hpm45pXStquQ8may4tMZ5eO3j+2tFuN6b8vk01ZhSTrOfCpH2UnGlVWbwDd2eB/ZOuENcOHWjsyN3+AXrNj330lc4ph3wez2BwMbAYPP0JZnZZdVp4Gw0FRtV9MhtFB59vrqm01iI5hk4DcaCoRC/aCTkX/mJrdsrS4O388zdMLdrdbS5V9Rvr9DprHhv9NKJevhu1kirjRqXiZ2E3+ZCwWDn/jM/p0/GJheCDncjY0/Vh/d86XjtUifP/2Z/+z9NfUJQHzvvn543yOMyIz48Li8Txxbn4dWPH649iOj2skk0XcLokEOmWfRLrUyjKMw+taHrxvT4wIkTO2FOgo7vWWSd6gvUv/B1jmETeBGtBwLBSPcxg1nEa1EdeKm/OIoDdlQ7T2uCfFk4XZMModzR62yYDHk27mqtq47dbjv4G+rnqnqg22EOdUaSZXLqqOThQD/RxYIiqabMhKNx/tLZryZHOo8u3FxDVgboWCq50nH16ossBUS1S/H1Zf/3uv0P1L/NodWxwUTurlPP2KJVIn7DfCwE8821PXrw2kFmWvu7DD7Gyirq7GHNSQ99tCqtLG4y2Fzz81NIOJKel/jx0c/Odt1h8diqHc998aWV69fDkGg9EEuOdV+UNtBhKWQdVc4880qRmeN/IPsq/PaaZNDvDwQDIb+3PeQv+XhdRXXoLrc53tiGoLMNxZFPuoudB6JxmzSchObqiUQRUbemRseGjcFLX/1qsmvkzMK2NccRfzneCQMP6PYXt9AXqWeAVfp/7rf/GfWPTHxtmBPqzYncHb3UGI3yu4oDZHJVV3Tc7X38YEPbhmVV57rcbk0ZkyRhRzHUlWZV3GzFsI/MT14BNm/nCbLwSPzsyMMNH1u9asfAF19ZSZu68OUI2IPJ7ssSE6G6VgV63LnyEI47ThyPoM2kiUSQcvS7n2+pdMTe2hq6uwfmHW6Vw+42ibIaBp08HFlX0RuvpoSSTMjx5RosJsaSJk69/rXQ0Ehu4dBxxDzvwfFnw7H9anULfZE2iVIvk36owPxPqJ+H+fBgc6p/Vq+0alVA51qeaWW5u2Nu3fUHG7hhBXUF6bIKNHy4bNEjpla0CiMp2XY0PK4c0HeCfZy/mt1HfX0F4fqXv87x+1A+SxPwD09kT6t1aHY6XpFwe2kgv6xXZOh0xnQ6EgsF/QEUgysUirnGqitfDF3bswc5dzsqsQJuO5IuBN0k7LlaJBQMkkRGopfLNHToW2WDL184X+rqWlg4VCtUu6is4anXw7y5nz4KtZJer4Kc/zl1oDMa2uLfdLfIZ1bH1UAvUlaUe33u2d7r98R+0LZzQ04z1Csr6sOl8zWMp2nJ0zDJ3Dk9P3pi58A4Fv13Kv70yIMNq0nSjH/56z9aGSC15g1BPdLcnQC32EljVemATsnVjIyDVJMOCiknRg9hz/2W4Y0VraGZo3t+hm4PR1lNjVIgRHfY0xqad0WsBnl554QUlc2/0WCWNl86NVZqGbrRy/yckzt/uO7sm6282lqa6X98HOZAtxWY/yX1YcL14bHIurnaIgMDQihIvZLz8jLL7XXX731sDyduzg3F4zXpyso6RzQwVUOTkiytULmdtpbJKeHMjZ8YECp+5ytXRg93LawVqbmdL339hfJAzI9+37gxljyfNSlE/yvojbryEpQ7dXcMvEWTRK97gl6UO1F6OhZM14WO9O75KcwJ1uq1wnWHOVVVM7hJvYqKqv+Imu5WE3GkwdA8eylYYhma7N+3ptZgyE9K0H9trP9xaUvvk20U42Be8OH+mjrQeWOJ3uu1TrNURY2awYC0y+NuuNE4c09sEVvxcMhgcuUTYlbPvEUqE+PrSp/z0Nz0lfGBcZDnE3MDA+Pzu7v6ycxt2nTiJ19/MRDApK9cH/D7k5ezdhl1c/JvZfZAKb1zfBl1aVOMfDueewwfrj3l9QfDFaEtC3t+9p1tTW6FKo1mF4k4LHsaORf1c7gzcmVg9MmMg6Awtxw75scXnG3cV1TkFA33SHqRTFHxYnWw//HNWjbsAL3A/G9QB/neTw5nPrX6+hpb3Gg1Cxdemfa4fJYb/V+6x7K5ZVU39hlMZQwFVWhU3qcMN6p4HA3pu5sdF7UXWisGTgjyo9OH91dVVa1ofJW9gysZKA8AnTLK2MmTKoXFpBT19ZCLrDu/nkpOMOgn4Y7nzn2f9nZ/0F7nTeR6fwpzhyPMAv7KvAtnT7vjRGki3w5u74RBzjeLxmQ1BudPeUwNrtmqfWuKOvDba+VgZ5FYdUmq/zHRW5FVKZN9oMD8b2v4T35ybDCTWLe7iDFmXHimAxSWgEfRcG719YUNuOTLnlpkJny5Snux1YusK+JA9zXJh+5mpwjTceWuIOg78eKnE9fZDb9q06uf+/rXW0nTlHu9OGn+4MvzbplGhR8XLfcocOq0MMWY48PFgu2xSLs3ENprb/WmHr728+/cdLrraZpwY86h7qgwwZxqKk8i9VwUrfFmTZzZm9DJC5a0r2+mqquo1iDR48KJzlefvbTEf+POIcyUlH7f//F5tX99BdXYJ4f3jo1lWlZt0UvJjUoJepTSsgCy/qD3yR5EfdmqQZ9JV0eCxK5VBeY1EqkZWZWZ9EO3hTcHdZGqycdut7oOP09TxaYdLJb90Qsbg0FwkmEdnD5pNrqw6VxtULndKrdOFYr4Y96gl3Q7X17PhKP1Rf+1137OBSW3vT4atWu1MCcro9Wq5XnFjifnumhQy+XxBurwZv/8WXrt+mbaRmprSdqIfDtButFeXR66cR85Z1/c/1F/+z/73oFdT2LZMy2bMnoZCp7MHN4Ql1hkQ+d6nxyllLJqnV+GQSb/XaE1+k+apDKVmHPz2fbdmsakC+Y7kXToz9+G+rIVyPpLX//Cj9a/ECMcY7NnMJFd5Ki1mHApQ7kTqbuSOO1BPgK61zOoKimNXe795ndu2uIUU3Hf6nXMs9QTrCHkwocjm2qZNYseSDfVWEUoe95hd1i+1P8DYjUxIM0si1yirKwubb97++ZxvXi2/9ueiX9koaiQdOYVkpsSeiqtUjQ8RariQKmi78GeJ3uWYadzfrNKU7G9rtKutfqfxqVWQd3ndLqm5kdH4Y6KBzzh2+iU6/CKM8uJ11965VvE62TVydMEk8nsMS7EkXsvzcdvlkzITwaOn9rbgZ60w/xi7rUfbHOGw/VLz15fKdx3MRzHB+pDF+OiOU702bpruk9HHXZXZi1NMWLykSKLvghfpNrjnX14UxBXG2wFOf+71PHmwB5p3pQS44coS6irSgM1hq4H/df7lz2/fMW5EZWWze5irsgafGrOe3OKuN7snZqfHwU57hyyDvfRxZprZ9ZWrdr03IUTX6BtbiOFVrJuqcz0MZ/CZAyUkIfX1US4Bwh14nM0gXcinS6PHelv+94hJ+kYgDuQdbA7yOjQCicWzNKePxtHz5tN1GsU7ksT1OnSmaofsEEoLhdPT4bBVOPy3l3oq9VjzfX/L/Nq//L4OtTHeJHBngkmi5aEXW6uoQ294XbvnXu0SCzvT5hVFRVX6+odOmNgsUZilcXjPm4u1VycpPqycwm5gD8+lWppW7FiE+3wX3mJXTGxWF6JJ5qnTnpUnHKL6kzeTAb5FtVzwLv8kXSJ1z+39uinDtncbngj4gK6g9IMqwr4khZJ5akJkaAxxzESqppTe41h09DMg+/UIugS8u2ibqBU1LSnblxrqrWRk5EV7Pk/Qj05JqYQp5uVBpz4/JJehaa8XBe/1vvw/pnly6oam1X2yuJK/Dm7SjcfkKtZv+ujm6bhSBbDzoP7wIkBMrPTLd/IrVoh2ua+cOLFrRs/4d9I4i2TypzqcRlrPCZFIJHwQ1xgb095IqGK0oDw27+/zeezOwR0SmvYdZjjsIttMkRpyRY138wmMri6muxE2J623P85Q6kGYkyeaOkNu7wpevbZJ6PkfeB/Z8nvM3pQHxzjJYf93d4iMyMtavE7qaj7UWk0Prfn/j1utC6vyrDOtUzMjNqNxdMBtbip6DYb4k2XoT4gnHgE/hUys+M3Wr6xrlf48Fe+eGL9xhc+sTEWQsf7By/vCGhDMn8kBfNgkAg9lfAm/GXlK4N3XhNLB1TaymheudsRdeHDyUWgpib3mhjUy9Wsv+P0lk43dV5mTDfdvUddjZZOoPPkBoXLlchd32Zj8IWNr/9Di52f2YN683AyiYY/v8krZlXx4fmdtP74hRKtc673/pm17JZsTOiilXUYdqhbphvUBtbIu32G+NDl7vlxkC+5c1dIxk+lUiRpEPbxLw6s37pxMyo+FokEh09nA5b2TCThT6X8qRjq3ZNJWDxe/+21jJp1+BwAx5YvldGFbpcsVdDlqd165srjyLlPY1qcsNrdTQ9/fpNF3mYBfY2oqArm3TM2tjxbkfMC83+I+rs/Osb7eDJ5cVOXmXid6IgCZrR4fZmv4e7C3AbOlK9o9NPo2EqPKcdZvcfoQWJ9BB/10MUsPjzIkXdh3tHwqU+tXl3FIPP4F3du/MQnYp8gyx4MRr59snswGeOvU+0J7sJlyL3CPHV7LXJ+KAxzePMzbjtpW6WEghkfibnzNBN3Bl/c5FbpLIuDSqOj6c43xRZI5puI1gjW9Koar/fpYc42sAmyIOf/BHWYf3wsGby7qstgtuYbqCQSa1mgxtx0Lkeb81rservWzp5G0YBujJwmSRM3C+y2odvZaXx4gX0gH7qNQn3ZauHOjb/+CtAj9LUTtyUHF5OJCPz9qc7OkcSIP1jGTda5tm+yRChudKDYgZ5Hr4ur4c0HUfecVqPoic9F58Wp88qww90iFoMdz1+AkYu9A2GL13vtro27LTj4sgLzf4J6UkBPpmbXdTHuxCaRIgk+sWZ9ibk9d+4Rsr6sal1Aq3PUgb3SEb50mtVOJrPPzVqartvdwptDypfUvJD1/VXL2phuHL3w0satsa2xZBIN33w5GUlEgmL4vHN/p58Dq97UnYMwj5ux5tAOa+0iVtPGDTAnz46wN5wmhsSWaMXo897zLMdo6KI3SjQ2o9zz+6YVLs/I4VwfSTgFbbsF5v8E9Q8PI+qsj0kc6+mS+eJiSy9NFbLigMWQyeUePd/Gxf1Gj9gFhrQ7HBUXBhmVyNt1n63r6WT3uMjLjefB485Ntbe0La+qgvrLX926NTKGsAcR9dBYgu5of2aEa96D6epQ6vZBFso447/34OziJy3NW+BmZT/SPhEnKEOjqJh5GzttNMosXQufYhyRw/sw5+lhHtjNkKJebeZ4z/sLzP+Z4suHx5B09n4ET3b32Wxxq3LJmysJNcgG+3OPOOGyvKrbZdZqaIyuRAUvJjG4bp9okTWMPJ0eFSYdgy50PPynRr60+sxyZP3l8b2xzUHxbwY67BOZUCqUGEltqfGu98+27fkluVdTtD7q4AnyDpNWIZUL3S6kfWIIuPG4WCCuGnxdZjRZhhaebBNFFgnQxcZwmyUwMtM7QradvVYF3f7Pyvq7hpMRFPxY7HZvn55wXRzQIgLSeN2y5lz/3BmWwq7u95hMyHorGRTdyYRUwjFXZL3J9o2nVFoHroyOCjkXmv6z8yO7V6xgs+SmC1fOB4NbYR4ZPp8cCyYTiU4Scs0urzd2qhE57/CxnFLIeT5Id7uXmqMI1mh5bU7pqabHxcUXx95LCqO7yTX5+DgBujDn+Qjd1uD17u79Bsw5R/U/d6jhmT9kHeLJXZvHUndzTTIantVQp77u8hpNR3LnkHW2x+VcaHiubTgcVt2xoIShF6MKb86QukWlNZ+N5SHpdFW0715VtaqqsefCla9FhpH0scG9g5FkoiWTSvonPO3tiWu9/Z861OELq1SCuFZbCXqTG6c8H6kxbJzMwFxNtw0bRSPHjEpTQ9+NOZijBgRyPj58uJb+H2DP0TeK/6kjPP+RB/V3Dn9816ex7P4bWUGdgRK6yOWqlR6rdrCnHx+e8kt3jVYLdUZOwpr5WBH2VmVUxH3O/TeyU9lxYddHhazzbdEzU7WiiurLpYGzY3vHqOV9m6xfJpXItE94Av7UtY/t+dTNbXEHqJdyccJxV5lBLuUHopwZFMdY427ape3BS5Rz+5qeCuY2NSK+RvynKWo83pYV+7nBYwb6hwpy/i/a9V0RDG9sahK/CA1PJUMv1wbKrfGZhT0/Pbhh2fKqbI1Oy4F6Fq8rNPN+qSRutOdXVew/lx0V7jtBO9QH+PHZoYsc7Nz06o6XB84mh8cGxwbFnsFUc/tl0fJ8bS0H1jrMjqgjHM7XWIBPTgbgS+vk9IkJKim2uE+b1jiCL4cVpoamB48YWhG1VJDzbBZPILl6v1NvYDGerCDn/5pZf8s7Raz+8V0fj83fiEvYHKgW+3qs2sBKY3zm6NGfti0n5zKvMeHNsaszrap52o4PrwqHfc6Ojs5pJB3o4wOjS3Yd6nfFbvgd3aeeO7+XNvvzGPZIpvM0VRh0+55fMpia99t/L+daE0k2iOeb9VJHZCTbTHFWw6eDL7OotqHhzh2ur2DPBXH6o/TY82T3geN6GT358YKc/+u3eZMg37U5EsvecsqU4qahqGdUrg9Ym67dO/rT51dA/akpriuuq0unwyrXfEACdR7CfmQyjx0hH8Wj442eHJpdtW7Vuk1Qf33v14a/NhZJTqRmMjRWXOz/xffe2ObTLnnsPL7R+Io9FxV0RLzztBKrbtaJYyDekz6Z1tJw7f7x2iJMzlLjq0Sm8Xoyue/ZDCBXyN7/vgLzf1XWl6hv/ngyyEir6Iu2qgV1TaDc6JtbOPrT5aKr4qlJJXZp2+lQDEx5MLtsHrP7fE13u+cHxIO50PQEcIuWG6vWVa1Y13Pq1bN7h8+OJZsTF1s6/ZnZ3jaYO5eSrwAXj3MSEp5cqG/1yIy+iLl4LWOv2gAtGEZLfOYh1zy52fG7p7SUeBKN12s5XECF/0MF5v9O8eWdw7t2fTxCDmXHFAkuK0YWCyrRrH+x3ne79+j9tR87s2LdZZPOwb28NM0Mge4auVrHKQiyNEN3u0VCNs8c5Pw0/nJ7I6fXidcXX/22OJebudac8Gd29x6EeYcbYw7031M3SvNyLkfS26/ZCBfNYv+gyb9o1DoamuZ+fpPzXzDnPyffqo09772OD8fxzALzfzch+84Ille8VxcpuSmsSjEwJNn+o3Kj+87RPT8/eAaGEeHB6xB2k2Jk3iJRqqJMm5ud+6AuBB3eA4Afx8JPfGr18x97fvWmnmM9E0e2HJjbnUg1b9lz8Fdv3PSF8x4c1PNPpxAFlnxyVT8yE9djNmiXZ8v3MVM0WtY08/M3iM8ZZ/sdc7fLk5i8vo3wXDAvDCP/u9STIpMSDNI2d0yhsGoNYGBF1/b1P45abuPNbdhQtarbFTeJ0+Vpt9vQOWmhMCemIMwdQ/dz0yDHmSNShzz98IkDbdztXrWp8W7P7O65y4lMZsvCL374nZs+I8j/IOXsC8WGS+Gu50TDnBMHksk5cYBt0Y28+2ZomsCJkxeRHIa5rKLak8od7tCrRbBWGFJ8E6iPRfLCHkzuWNT7lAarWmCX6tb/2Nhwn2kzwvVVkzW4WHX2dJqauj9Ls6SJxZDmJv2++7nJqVHhykGdL9LwqQNVq6nWNDbeamw5R25md4579Tfz9lwb/T1zmp1BzgN632WRdjch58X24gsNPqPGPXPvDSI0Ynjic/4EiiZI/+TMcT39XQans8D8TQjX35WB+eZkMHL+1ZflNoMxapWsQcCKNyLrD3r3POQ42+pzQveWVaTd5MqTUxxmALrK57R94/7kNL67mH8QaVkUPG1z66qqKL803rgVHB47zXaR77+hR7dHeSj3PHOVQeh2kX+VD83GKeuyn4RNVJphndvXYHt8Dznfxh8FLA3MZem68liO5ZBOA6sEfYVm5zeHenAsAnZkPTs1JLNGrWobUZJk+wulCgvJ0wf3NpxZfc6r5eZpWoNEytrv7pPnqauctr5rk1nhyKHaIZ536IYTPSvOnKla1bh3eOziwse4pGhzOICuhXk4r9vj7HiFuoTXucWJKBuZcGY96GBIpWrqm3tEMVWMPIgIHQfPXe1JTreIA2s0chaYv2nU/Rh2UnOR0OiOBqsQdWFLJdGVKx3h3bm27/76Y73rejxsCbNQa3UrnIcedsrVqqid8+s+5+4c1IEtkvD8BUW3C97cGWpujRPJiz1nfvb9bU4F0FX5OZZ8LTUulQumokaeyXCPT6lysOVbqz0WMPtMffeecDmT4nqe+RqpGLZr7u6sFcgNsgLzN4/6+/wRHqIenJ5i0bJWKRPFF4m29IWw4vDRX/z6Z2v7G6ctnN7hK53W2/bd65IridyiJpWz43BuOivCNp6Qed7rnf3LzyxbdWAu9/xPaYIMh6mlqiDLE8odzU41FaqGRAtopaZwZSXll1OueLyv4dxjmNv4p0vQ5XaYN6byw9Vqs6/Q7PzmvbdCXeh32pt6LrOEN3+vE+66leVhw9zR1x4dWOjpnmfsvJj+KXeT09a1MCSVoa7ZC+o8dHghNz0N7Tz0E0LF7+5sY93co6MHhW5X2Out4tpfPv2qdavACVI+0syERC5mGiodtOecChg6Dm3LPV6DPcezly9tEUoXu1r69zPOZDCYC81Rbzb1WBDmvIncnNwAIlQ89c7oylKz89qe12Y69t+ePkbjWjVb2E0+TtWfM0lphqiEuq3jSf+56SywCd4YhoB+tnlk9dq1e/LMTXYrQxO/z7nrhNumRr0j56kjclFXU2lgHr4Q9DU1UWPZRqMMBZil5ih5GB+u58Bxmw3dbv7/OLb1H3zIOsyDdK/O9lyWWZcMexEafr3H0PGwt79F3zQ4dclorC+xVxK56W0j11i1rLPikiucTU9650cHnlty5ET5ZTTb3NW7gaGGN5xuY5RYLW/P3W57pQnOaokB5Iau02puXOevfRgd55PuDmfH9Z8Je27ISzlyLg3XtXrOHQA5xM2Fxtc3+ZGGf28M/c6X/1jPoKBuVVLgor4e8NAs2d+/X+8LffbL9UZHSXFxpd1t029pkRusOqHi47ZDdyaz83m7Pk7d7TmEPZvhVMwPKLLYjVE2Tv2urGYySWh8XNo10X5aLS1Sq3Tizot1OCIqd/vJt9d2oPmLljJx2tZqz63DNkYtWEauKDB/86m/7X2xyJKwL25qkdIZLZNRc5NIteUlSpol+zud6ZUvnTUao2J3cAWM5g7USoSkk55zN8xOTkJdqHaoD7ydnycOdR6y+UQ6hpxMHnq9KU6OnRFkzDnXOdRFDM6iAtgPGRw0xzs6vtG2D3suNHutuKwnc7e2lt9+2Kc38xQF5s/ioeGDIN+8OeJfXNeiNnDXi9wJBXbtCxpZZjKXG3G6q1//an4R6/aKtM/WcX8/w+2o7qgxrOiby9EtyRvns/PtwO+e77C5FZVRB8m46O+g29ZQQTeI5Kv6NN+kcRNuu8YauRyPOztG2j5VS6wm/929ZX24rnrlxXP79D56IAty/mweGv59keDmXYL61I4EByvzy9yI11VelTIzOTk55HO7Ln0tGt3eypSbyeA8dCfBtjk0fDSskPXdzU1mEXWg51tpss9lFTJSMsDOP7tDpaG7Pq/abUW2I/skxOdsg63UWmMXm5o6OvpyMBdL+5egy90V1dVHuvfZnAoKvoUG92f2kPVdW3flG6h6/JxjXhofw5sLmM3NucmHfTZ39YXPW6NXW69WFLultfuedrIGJCrAKnxdtyezWRG48clDHxXQ+UdR0SJlD6c1BrlgzkIwve1Iu7yIUio5magsdgTktq7cARZH1eaR89H70q2tr/fsM/hkRGsF5s/wEbnt2iyUfHC6p10m4xSEBOxyqcdrlu6ePPfgUJOm/PUxh9FRV1dZbHIa+s59wyAnvgOr0tl1q5vAballjvcH6PkX1pkUhID5ArpaPtNZJFWLo2yVUaP/ogHo+3LXqavZ8ODEk5Nwr3adznXZDE5ZgfmzfULDI+h8+bOvBpRWtYqaGwjknnazfnf/uadN4Yq6s5ut0YqSClx4PXf4RyTSvH9uNJq9t7Lk5gb+FHoUL048u0pjYMaYWI2aiXwwI8FVoKWeXxY41dDkdB5amIE5afjaJTkPp0tcg/0jThsH4AtDis/6vfWDzBwCnjR8d8BqVhuXNkara0KKoi39uVsN4Yri14NRY2VdXQV2vXbk6QjxelQ8lYIbn/NL0IV+B7qKv70EHeaS/FEW7mGnmqm0yHS0t9dry0+amny2vgfXbDjuiHj+CLokXNFa1tLYaXP69D5Dgfkzf297ZwTsgI891+0SDVRWiZA/gzeg8B3u7591hkuKP7c+aixu5RAEx447n45I1MAlI6uVddIYPQ52noBupXCeR04TZFERyA1igCmRIGTDh+OQg7F80RI3OPseIOd55r+T88q61uF1IzanSMs4C8yf+UPWRcFt89ak/9XuGpirRNsc043ekFI2k2NjfLi04tTGqINpp0qXVi3Z/3QfCfR643Z6qJzNWQaesOt/gO5ga5iYQMeew1wUxBMtMOeUr85hj5acbHAS8T+Yq80zh7r4Cqcrqpt7Og0GGztP9AXmz/5h198Z2cwjP5ftrlEa4Q51BDUQMDuR9bvucEndpfVGR1kdFXatUt250Ccxk2hF2LXuy6PPicTc6B+h27V2k1HOkBqqnU+K+VelNcr5NbvSNW9hobPz9n10O/3OOA982P7JBaeelMi2c6X9PYWhhv/Ie+s7k5t3BYEe68nW6EnISoWoSwyBgMw509hz0eeuKHl5fdReRrxerDWof/CgT6LOR25RleZiFimn9gL0MOk7oIuhBhLuFEdx5NpnpDKJkTxcpcNYctLjQ4XP3GbpQJ55Ef8/ZdheXZHqTticSjOnQN//7kLj63/mIetbNwepuyWz0xarVWvFv6LkZQ0E9M6ZntwRX7qi5EqJsrLiKvfKTVLbgYVDEgmCDnWF61I23z/zHN671WSvdKhMcWgazMKJU49MkOVTWaPFlOfKFl3MRzlnntpqkXM8OL3ob1fYW+sSuYRT36SQyYyFwdT/2MOu48CLSmuyZ8oiU1rF0IGIspF1293J/iMKe3H1WbsxXHf16vYyt6H2wIJZrYySq4vqZK7PiXBtNJvNqmRaJN2kNSDnar2M68jtl9XMqlBiQc7LjrkMPn3HTK5jSbfzg/DcaK8oSeQOOPVOJ/edC8z/gw+7HgQ7L/PqfFqqEDkamCDrHr1trr9n0F2R3nhBQZIGUdfEbfqWpza5Vcg6IVr1JcGcp5XZtQ62hRGb48MpzUrXZTNzLDDXOaK6Y+3Cns+c6+DEWq0I1DDnErRHtb8ngwJwKmXhwsDaf/Qh6wL5LgpvU9MhqVGdb5vjJp4r5PRtyTUe4chP4FKJQ5Tc6urCSnnqaZdcbQQ61Ou+OpodnUbSFfBlcxQqwsBIuTzVbJZjLHT2ehLxpz1OZ23f3NwhmFNTy8u5HjmvGJzstPmctMMpCsx/y97V/DRSh2ExejWe1HhQExMvnbbpdDLtTNM6tZOZacNh6IwVylSQVkSqLF2p4WOZFGgKtA0QscbEIInGFAMGAn5F/MKEuAdYZQ2bQtao67cmxujFo89vuvonuIDzND31+PR539/7/V/j1ntTiNswypzaKrWRxxyPzAlqbkYqyQ8Xi1d0Q0qsJxCDI15vD9PUFBlphdiJ1ltfgs4/nMUtEDRBkgV/TlrlmblJpGSQkfGxKMaup3OKhuUiqLGgb8Jqb8cA+nigfWe7zItJPN2T9vDSfw9ofQisk+rLO7LMhChypBWdTFLKrQ6vrh4lJSm4Fad9xK9HWJ7Z/71mpeZAu7N17FLpw1nD7feDc9npdlMcj8ZXinL7YvPECXzxvtuFPNxPGjZHwbYDZCkgG5V2DlA/53OooNv+/AagBaw/h6IbKq2XGm4ZATtj+XWHlEpyE9PVtaQUD68nnCGw/kyY5bX97SkHTQx8ZygUOlcsFg0nSyP3KtKQOofGV46mCec4t72yS/Gox++B8UpXV5N1h7N1PLyyOWXSIhp3bM5vECytI2KfOT/7lhtveNEFsSOWbkvhgNN0qZY0AsGX28hNgEh72C9Sk9UlSiY6bg2F9LXZjCEgMKdICw7Njay4KBRgYhHEav7nd3hVqxxjaAUA4xbcrZH24Q87eNFNiSF7idCNArTe91wBKwuGd4o7blmmkGSx7HB8kldGq8Vacpx98BXJ7fM/A9Z9PDdxmEWCFWmaaMgpjD21mMMTTnQjrcZPnUefFNbIR2Oh+c6xt0ROqRx/vdGlKBpx6IDL3RsLJ7ZrqKqJbjlnc37D0HLrAzDvZPLlo+IOLTLkDY+Px7WIcOvThWJHsk0Kv8JS3nC4PRJgee7VPYwhYXwJmTinuMYjJyOLtOx01dAEiSljNhALdcZ6PnHznDJxWNFg3cE3od0FnQc6Ds6TPhmnbL/bbyDA+r19gyQNP/hW8V0Xj/cc0+xIXxrhjUuZYk0lb/gw7Q1gQUnA4D0fj1rNkiFSXpdI/ZywTiWsnIzgQ10tGh1cdzvRQf1lHbVUcA6Qq4ADF+cf+n3PVJNu0V46cIPRcnvTrw+lsWWAxoyyDM4BaN2dKGY2FzlJ6miwdCgAreMNb375veZg/KS6LotofBR5lFONT0XOiXNdrB+XmdINPalwi4fLyMNdf8J1uZwD8xfDW0eX0TMhOkWb8xsMovUCQje0yJZmHLIIKl0amW5MxKmRzcz2lNPQu7cE2YuU+TOswCxhlytDIjfZJzI5ikc1lZrjHXi3R9vRLO3HAShOUepf7mkEMOwENDiPXToyFZUXvW570cQNR8vtDwwNPY36S3qrdI6mZRK4uTSEbiMSN7k9jRbZONu95aWxnQRXW0Rt6XAS99SQeAthpbgs05zj/CRDO33RCHaO+Lu3dJ4D518hVtvwXM/KEM4D71zNcmoOx/rtRRMnANA6lI7nXLqxMEM3LzyRKQi1Vtf2V6ubUhJabwhyKAzHHlC5GnY0e3K5EGSNcJtHgE52i8QiUVztSDRYEZx/jUkWBf4cSr/OeWT963qFF5H5y9k6Pwmw/DrQ17311DADZiiHdWXB3De5C5nMgZ6U9MGGl7A+/0zQye2vXuvSRC9plwzJruFRlNhIWS2K42qNhKho2a+/QgH9n2ZnFNbA+Sfb5Q3VHZIHbJ2fEGDxWA+0/lxf+lIpxYu0NccMmdZrqnmhmjnI6uPjPY2cGAogIxt0c8vT1zQxhyRMyOsYWUP7hOCP4nByJNhI8IpifvddZaMZrAEcHYpdjHxUXNwwk25k8mydnxRg8Rg4R5om/U5mEl5dpihy/FLLjqjKcLV6oOvQ+joc+TPoqgir2i+HZY7HfhJZTu1wZEGc4MV5nmiT8+OvL6OoZpFOxmJbY7+1v1udQoDu7g3dbev85ABat6TeA613o2sOi/+saKtcM9WJ1eKBoce9qYYYar3428WIpGrL1TLPi36mY91J0zT6Xv1RVmogo6Nkjw9RTLWMu1VM7UV/5fPFaxWMNPd6ZVvnJwmEddBOhiCKCdpHywwMPHJzxpRinq9mjrLuNr1nPeTEWa9g0FC5C6uLjJjr+F2gKCfhHOPIOxdUj2J+XK03E+4kDYd0fG97+1hmslKhYdttf37SAL9eKDz3XE969sU2eHXymiMtTvUpzRxdLR0RC9+3LnrD7YFIkPVSM6v7Wm0766B0Ae485mc/mVE0Rfl8ta4hK2MlX8G57AsEejLLiqnCN9icnzg0tQ4Tn5rdbONlwDqZxRlLauX76erV8d7g+LlPHTwbDKPS6nYtP/vDVyZHiYIfL/dAdPcco1SU0dWlDUym4s9ClM6huh4ZLk0oquiVEZ/by0VOHNA3h54KVFpTxdk4IzOWhQdz9SWl8n0186neLjlHz3MqG/wNrKue/Z8qLo+TZf3R1gi7suKC0D/A1gGP5c8t607jh57ijKryyOLkbM5PIsA6xtdJ5FaclWSAclnDjfWyYo5OZz5OGpL+6ZJLDPx28beApHo4FFmi7UjJ+IWxdxUUU1+t7nfBxP8zgO7ujMUGSzOqIiL2t3V+QkFYh9gLfYON2RSD0A3hOhw7Y9bNysRq6apkGPGrNXoghlM/ksFTlIxTT/MxH3tuhvMolQ8Or21ovOM655yztTP8/IcjSV7lefo++wL6SQVhHVJHvP7Jm3MUReJ1B6GdsL54UNxsMwxhvYemcf4jzgouZ8A/H4PS5zoYl3J57+vL0LnjusxdzliA3S1KvBOk2/78RAMzrc8RsaffWpikGMYL0inE22a5Yk5to9Jq+KONHtrNsmzcTzuxJZ7V2fQK7VLMz1BAV5R/miYcoc5wdHc1q2LThJoUbZ2faNwC1onYO9Y3swwx8Q5L60q5ouxvFjeNB+dj68M0L7BsgKJh5nUDCRonl/149UfMNDBg3OKcli9G3q0uKZhjQQn9Lnsw9USDRG4I1xG5XfndoEhThbVPVKssVbTaZmltIBZjr1xgZH8YNbZw0GdMHekKZ74+fa2ra0NxNXujXFhbE0PjqwKhq/YA+inALbc9PZQfGhqcKW6xpPbSXOPqqcCvT22X+qIByWjMUE5foJPBe27qqK54kJO5ZjVHNf05GqrmY4OZGqcmSafMPTbnJx7QOim+DOXH3twSZQa0E7FrnkpZqUDrF3Dsnl0fpuSQn/EnOg4WMZL6ffWXDU3RXE1/7mE65+fboHPSEJe0lwidDtx6GyG9UHi+dEUl4bpVXydar2jfV6uTSdYff6cb8ZojPrJa4zRt/+1lcO74h3NqYH7+oSvnNdOLUqpo6/x0oAWs//H0UOGJudJVkZG9DNnj7SFar9R/mJ4eYX3eh7YSNNa/rk66eK1y+CrZ4A7SrUcc3RmbDzauKKYzBNg6Py0gFv6PP4aG0udKDS+NeL2ZpdHMsnb5p2pmRAgMPPhOzVXenuB4tfLVD13It1vGAA5dDs374ztHiu5Fn7TXXi5yegDWC+iWzKfOL7wly6TZ2WG1UGFL/+XjTKlD8AvxK1MvfKC6mNzx9GUU0K3qOb7Etsd3vzSTuNkV8tqDLKcJVuRWGBpMz735iZuywnWSiXeYlUoZSZqOnOCWDkY1xTSPp5cQrMGVA+A81Blhd7ZNxRlttTk/bWhWWvOF1EppDbONDAPOQbpDynGL3z26Ws4KyRFFVcy9R2sejfc0QQronezuQVY19ZDbZw8vnTY0szSFwdTcwrsyBQvPkIwsxUs5rf7VG4f1pB6iOXPvyX1yqgFdlICLGQDnawd1GHfdrds6P30gfv2PQiGVfn9hhWaYXNOtO0SW18rfvP3dou5M5l5/drnLozAw/FashtUjgblNbHDXcaDX5vw0AqyTHE2+/4uFObS8Wke38AkJOWbpy7exJ1zde/LVLg2Gv9kzgSnmGHuuOMUlk0Kv9267CfJUouXWvgLQk959eIyneIpxUS7O4/T6eOXat48d7r8+/WuXwsPsW5wzWBMZfanUxgm67tXtq/enFS3398GtFwa7d58aYxwMw5M0vIPJGTlP+fjtt1+b6NJyTJNyxOedUWG4WKONJNw9a+v81KLl1p4CQrf8E+8tDFM8SHeQLLwjZ/Ba/c+/fq44GJFr1lJluTXGph6f9Oi5pCHYOj/NaLm/Jw/WC498tHABk4084nUNus75eWXjx4pG5XAEBkCsNhCJpjLLXFbX/Xi32zo/zWi5sy+PcL2QXnv4AsMjNWd1w1M5SdQwsSaC86bQB3oj6eKEktMF1nuH/W4/5bj5/p4hi/XnZ9d4l4jGaGtETRRyWCYoWnU1ovPW8eGDmsoL4z5Bsjk/9QDr+QIwmCqu5xwkI+vhSOPjwPM5R9d1zrHmf+WgrqDoGmVtzs8CbsYbHsjnB2cbjCx7aY/Leq6P+QjpsPVyqyCMrtbVrJc0TNqcnwncfP/YYAGv+HSqOMeIELvDWhTe4XRZbzja3ZudOawr2VzQ77c5Pyv4x6/3d2cmwbnMk3OpLt46w4NTDePG8nRZzbIBv63zMwRi4YeIgZ/L1BjKx/CMdWCNTDPLsp4cri6pquBnw7Y/P0sgrzmw3tP9aaaDoawTfs0BdEr26lPTNVWP+wMBW+dnC9B6fihf6O/YySQclMxA6hp5t8uhXPa7mpJlo5Fw2Ob8jAFaL4B15OFLCYaSeYZBdk4O+ZLJqx/An0fag7bOzx5uvq0nD7ee6m4U40jI8k6KorxeUb96ZJos2x4M27nXM4hb7v+XdQm+XKRoCD17/LtiRMfbww/aOj+TwHBjf6E/P9jdmBVg4X0O2SftHWezQiQcfNDW+RnFLbDw+Xw61f3OJYlxGDwj7GxmTX0c06t2LfXM4pbbQHp/PpW4dMlwiJSxW8xms4YkPXivrfOzi+usp7s/3DSU7F51MSsIUlubvSzsLKOFsN7fP5ju2Nxe+uxwqm6MxyXp3ltvsnGWAdb7+wvpdGI7Uy1ns1IgHH/A5vyMA1rv73+iP5VOPFVWCefhB+yFMmcehHXyhO+YlZKS1B60Of8/AKyn0+n+9GzbeDgYfMAeQP9f4G/27pgGQBgIoOhSJDB3RgYQNDCRNOnGipmOlcr5uPcsfAE/qj/9fsdx7pqnEevGqD6vT/NMonqbTfNcltpH1zyXGHttVfNsylo0T0dyAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD+9uBAAAAAAECQv/UAK1QAAAAAAABcuGMnrLFu2LIAAAAASUVORK5CYII="
+IMG_VIRTUOSE = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAMAAAD8CC+4AAADAFBMVEUAAAAeGxv389U+OCozMy0qKCQXEhQmKysfGxodLiUaEhMdFhggHB0zKBqSimPm5L379c6mnXjKxJ1mWjlPSTNFOyeclnjj3bbz7cXDvpnPzKgDAQ4GAxABAAsOBg8aDQ0fERE6KRUmFhIqDQMhDQU1IxUrGxH+/Y4WBwokDQ0KAwodBQIuFgcmFAsVChFLLw0mBgIeCAxTNA9EJhAxHw8tEQ8wDAP7/v0XBAL+/uM1FxE3GAVSKAX9/vRAHAYIBRX+/us9HRNLIgZcPA1NKRgPAgODZjf+/c3+/cWbgETTxm1WNh05Igr9/NzazHPOv2d1SRBJGAQ4DwR5WyMuHhtZKwZDJQT9/bBfQRmMbzmJWhN0PQhuUCn+/Lp/UhH+/tVpRh9oOgaGZ0vk2YDHuWGTdUJLOR3++IXe03nBsFpoRzRzUz2VXhJnRQ6ggVBBMRz++5lAJB+5p1FnOhWpi1pdRil7XUWWejNAEQNeMwdTGwRZOiyBYyhnLAWzmFeSclP9+aSpjUtzVBvr4YdpTxmARwh9VzKJbSqvmkYrKydTQiX88JiiijxNLydzYDH5+eSbahldLhnN19tdIATBqW8SEhqQSwpNUEbx6JBlPCanbhnWvXfN4Oy3m2V3QyTAoWCQWSmvkWZoVzOdYzFhTy6pdDiWfGH39L/98bD27KSGSiKsfCC3hDmpXw/8+XGgUQfX7fi5aw797Ie8fB10MAnRihrsoxXh4Mn96HjHzcmghmr44pXkyYL53mnhvmRaXVTs6c7LeAzgkhDHyLRqa2Dq1I722oCFhnjTslmqlXn0tRfS0rrGmUjPrGuRk4Prx2K2zNmEOQb7+VzOr329vafxz3GoqZZ3eWvFijXMqUi6v7rZvort5LWYjVnX18SysqHktFO4kiXo1qC+nXbe5uH85A7JmDPosjSHfk/boSicno/51VhBan/TzJz50RK9iVTcoUXzw0f50zIUHCz98kDCuIZEQi7s8uw0VWrq2VEoPlLdxUQ4PDwdLDyWssNwiZzYIGZVAAAAG3RSTlMA/P0RVGXfQCXqwJ197jHf4V986eTtlqG7qcNll8o8AADjkklEQVR42uzZu63EIBBAUQvn+JPYW8kTAdJkQ0INlEQZtPkGayWXsBLcg6jgaiaABQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB+ZD38grn4c9uOBTPxn6ZlP9YF0+jNtel+Un0a/uOKUarPw5qHWrMmLVSfxNNcYlBVqk+iNw81SlVVp8VRfXz+6rs9xiiaSinM+gSsuYQqT/TWo6vuF880Q1sv15MbCa2VriV3MesD81epIhK7oFpMKq01Zn1c1jxL/AqaenU1Tak+Kn/n3Mf8Lxp5o5t2U31I/nbBmlv0Xl1ysuhUH9uxZanx641utCt8ug1nPfZQn9Vu184b3ahJPMSPZj33/Oz2V9A3em+ujer/7JzvaxJxHMfDBfVIqwe19Y/EwAeyYNPgyuMQ00vdKKHA+aAJlpwjbZcPijQmhzS2HEPOuQ4RPXtQD9LowVY9kPVg4O2JQasHR4+kp72/d/6I+gOm416ec+zpi/f38/l8v995ooDzaROc/9Z9X0FVJ9IDgOpZR+5FY5vmBDExFaCw2w7deJOPv6QPnNvFObvRzp0YsPVK4YiFgLQDvXvHkj4Muu4d1o127kRwfjKg1/OhdigPiB3cnqEoTXk/7T5RNO5QnQAmzluwtuNcbQAKe3o6oGSjr8S5aQrnbPoD6cS60c6NP6RtRz0f0tuN62Sfcal1xYSomwK6eUgHomIxzl/GG5Rz3Jjoz+YAHzbbdKC9n/D6valNhSgfjm1Euqi8uWQU9jHGPBlI97p1/Bjk3KTCOet3cp6EQno5E5zrkB5eUd4Yu3Nji7a09/KNVw/kHM79PA/rqaij0yvpQ+tY4RWLUdjHk4kLJhyqacYH4DCdEtX9As/zNZ51+jOOw84cka7Rn9dFhN3YpxlHzJfRteum/3Y+LXa+ZPiy0GrFWb+f9zocbZgO6BDpetZVZfK0EfYxY+L8Zap3MWqo3Za2UUp72RuqVCsCW6uVBEHwR6PrGNgHzRzwoZsTVcVy0bA+VphRzm0Yzof81so5pWQL/EtZ/lkNsXGW35Jg3RuNiPY5vZ3TlOvzeke1GF38OGHW7z+Spn14xIKgU8q3AluVm/WfMu+HdaGMrGOJjyjathzc2zV8JO2q+sno58YGnJ0Plnb47nfvGNU661G++rNer8tCqLCwsMCGJGjnuWCk0+vf7To+X9HnU1TVYvRz44EZXXtf+ZWheWy3q4mCV24e1esNfqew6rIS6+Uyy2Ngd6i4FjuHu7F6VdcQFYR90tiLHwPMlyg4Rw3/B8rUTmSE6tFe/ahSPtiKu2jaxbJsCEnnWYZzdEX47u3LwbodUUc711UtU0bYRxz9ikz6/1mNUrqJTAjl/EiuSAeh+CrtekHTGywL6Qusk/F4slphnwNEutuNB2Hvfn1jhH20MV+C896/Lf2tnLTtUe9LublXlxtl4jy2sfTCOhNbYmssz7JO1p/yRPR9Gl26rp2EfRf9nBH2kQWDGpT3TsyB1rXj9zRFqZFoiLTtTVmWDvKrsZmNTc9D69IDOr4B6zyPd54Ld0jWRd06cGuo2a5ihH1UITdkbLpziB46t1Hvu5GMIDeae025Wj4QYqv0rWA7kbx61WqNxUsLxHkLE3sq2MZNOVi3i7De1+7b7u5+Ndr4kYTEHJNav2+H637kTUrX4Q99l+W63GxIn1ux2EMmGSkuLy4uzj+kra48ywuAD/k5z76d8I91EWHHGn/2lMFocX7SZEIHR4LeR6/saVPnW9C5870qH8lHDelXjXYtMJ7Uq+KyZ3ElbF2aeUCsh8rQHsr7mYgi6pck7X3tPtDp7pKZ3VjjRwkS8zQE4w3XA8hfKHUz5T+oNpr1+pEkva7FrEtJx/K7j8VXHMMx4YfzM7Q1X+PLEtG+VXI6OkUt65r1YdzV9V3VCPsIMaHFHIbxDEa1K3rbjnLOeOEc23BNSTpgaetG0pN9d/1acT/BpRKL6yu3rLSrxPNSGQhSgeX2YZ0wmNeLbvf2o+3uYffDZePobTSYME+dw31XKIdkzTToxT39fjfsz3yvwPmeXK6+ZmPz87PM/ft3ck9zawwXZBzcyuwtOhYrlVqSJMG6UPD7Ex3U9F7URZ/drbOtHh6qlouG9hEAX/hpMunDuY08Wr579k0fNj38TrXSrO/VG+WKhLX9JsN8ufc4dzdXXHsenA2uB8OzN5/QD2JsviZUKiTsL0POVNs+wAfcj/ByF4sIO05cz5wyOFZwbm6Cc0if1vOd1pOuBf5995ARqprzZgXO47GZ+WTizo2nN649zrnXVlbCycQal+XmZ2doOp5vtSTNeiizwLwqIux4hvs0RWKdhF25fNoo7ccHlE+dg3MS82nQH9IAibn6LchkDiqkhZNRreE8Ns88u3/7/tO7uVzR3Q4uezxhJrm8GF564qIxsAutMqnsvFBgnY639sExaxHayQtPp/sDDd2UscYfG1jZ50wo51rXrknv7b7qzjc5705Vc94QylulGG11Bj1r15/mHudu57aLa0kuEUmsPUtkOS745AX9YLUUYgUUdkngt/LOaMcORB/oD28Iuxth/9H9hDXe0H4ckGL+h51zi2meDsO48Rw1HhNPF8YEY1Q0IkSishDZ5rRFO7YGXRVx0s10Ko3CtAxLWdtJiZvThQaHyxgTlW/qQlCMiXDhIZgYswsyL0wGMZk3eMHl7n3+7Q5qTDybqLx0k/XzM5Efz3t43v/2CSnnZL3ShA7kNnPs1MSRp7+xmH8G+a4/MjsTYzmxshcKReJCqVQ/VTUqrlyiYmolVV0oBpw+p29k/cV9rN1eX95ff+vxNXTxVoZvc281dEfAftLR/fOBzH4FkIM0UvtPAw6N9a6l8Xe/KW99+Nn3qNPl9W2f05UIU5WcwAslprRXOnXK5AxDlSlWNmTD5BaiQR+c+PV3tp9eXy5v7i+vP/J4tG4hh9x/xDx+6qFSI33UODhR+z8cmMwvhsiR1nEBc4c4SfTwXcWHkdrLW59++CmQl/eXZkeDHlgyEYHnS3QpWyqVHjU5MVGQRVPLGYrL5DzBBYeTdPEv7q9jeoNR8/AjbLEO4ADfgR4nviywH6K2n2D/B4Mg30Bet4dxi7vtxFnYH/ioEZXHUc23Pvzw0/JyeWsZHdz0arjA66Ekv7fnLfGlhwC9wXmi+aiZFyuFikopYXlhwpfx+2bX1rb338Lf2n9x7Z2YVqx3jHiCHY94HBNcqXH0xtHxydL1nwmck7jy4oPTHyN5vcn5ToK9tThH085pT7/3QRnMtzaX19e3l5aW3tGkwhRNe6FzRtAFYK8/aiY8mpjIGxRFKWwqRWnV4MSKY2bGt7q2P7e8CerA/nivB6XdBm4/t/VeOgb2r08c+X8giMo/6QzmkDmAt0dzbNRMioXMy+VPP/10c7+8/s7S7KxDY6Xc4tSUwNCgXirFs3qpfp9JUXKeoyRKoRRZVQGfiy6MZXx+uLLvbG8/jXZu+5F3Jh0usd7er+NqBeQOtQM7HPkT7H9nQOUEOVQO5lZ0iCPPY06LGuOYzTdRzbcIc+xRfbGRhMosMkKSjjNZeHFCiRT1jUaa4grGrqqkKqkcRe1Rcl2Oms6A29/vW8XRiuWnl/fn5kZGpkdZ81Szrpce7SDHI657j944xNx+Utv/trjwkiZy5HPitZOAA4c833RfD74Mjz/91nubYP7pFlqxNWT20WltMleZEugszYO5tyTwJV2IQ+lpWZPQuacUyqBMRVILRpjiqLDT6ff7lla35/bX3tmec8RWg47ecG2jtWjtSN0CXzLTBPulJ0n+74gzsD4lQ1ozo4M6LPZ2WccNLNREWVt/b3N/E29bwtD19PYszjnHZHavEsKkluXjuqBD42jj4M082vAoMqVA6EqBywG7xFHipEl5wgGnwz8zO729NIfTso9jFRt09QaKB4+2o8ncwl56qH5oYb/6khNz9i8OjOVA/gl4W8ihdDvsLQtu4Rhc0aM9/NbroE0M9P3ltSUgd2iGsrs75fVG9Eg2gt1aSafj3pKulzbymkzJVE7bRTUvqIoq7bF5VVY1MTw/uDLjn5lexaA3Oh1zOEanXY7edO1U25prBbiDfKmupN84agD7SXH/S823K4nKbVVb2R3PCHxHkFunXRthdvzV18ugDeL7++jglmb9Qc2oeCOLAqPz2aTOJ/VSli8JWbw6fhR/QZRlSWbRzLkU2ZBcBUozVJYLz4u9Tt/MDA7MOkdnHaP41YlN9z7osnN8J8lbxJN4AHs+/eaJO/tXipwgh8jvJDmcSBytO65mgDgp5mjgXnz49dfJ6Rcgh5+2itOPTg9nRFJT3iwvCLxXR/B8NqujfUd6R/ceFqmKhA5OKRTUgqKoOSNvUtXJsKYFxzC7+f2ZJ53OWXT/EHtssvfWAPr4zrzejGT8GQK+bqafS5NdzInc/xrilt9KzDZb4TZ2Gzm+f+XOB776Ljz+8OsflJHYy5bM1+DH+DJaOOX1phiBFoQIzQiCwPACzzB6KE5nj+8zE6yhqZKaKFBySk1QckGSJIMSo1FF48SYwwfqfS9kHD6nwwIfi/U6PB2xN7X+TDz+zDPJJOSOAS6RPjr+6KKrTs5L/yniqOR2v26zbkYLOEns+HioT45FduT1D4jHvgXm22vr20DuHGUpKTSF1k2naTwnk0mk9ySErsd1nszphwYXVidVVpEkCsM6MnuKokRKTpipScWzsDIz0+/3u1fcWMWA+awTeX40IB43obewI55BWNj3FM8b6Ub9oqsvP+dE738MuU0cCb3ZuP2YOOFtMX9s4zjPjT/97tZWubwFrW+/s4Zqjt0JK0sFJsXDkWGyMOFoXeCzeOh4Bvps6b4GS4lcjSogt+9VJNWUTFVRTLVQUaScRFUXpp93DvX3+weGV5xE67hGY6OOBxPRun1szmbewh6H3DEY7OSO3sA2Bmn+pLz/AY3baf0Bu2YT5ORqat7esli7lboZ1kgDB+TEjiGz9RJkHpMnF720wIcYhqG9Op1FcqeZLM/zuhcVXteR3tmEoXGsZKiSpFWwaXPlDVWRU4oKY9Ywo2LwbffAQH+Pf3DYjTc7IsX7gN3xoAPYYdX8ZGAnyHEhSqd4hQu8eYg3t191ovffQdyaz04nyMlM1u7ebIlbljuQWz77V82enaj8g/L+/ub6NlSOQUvTFhcZL1q4JA9ZZ5PkS39GjyPHx7PxuBAnCxcYr3lZMQqKtGsUckZFlXOmgZ0bpndWRps38dTKYP8A1O5eyfgyBDt6eRfBXiRqb2OP22LHf3xnZycLudcO04GJL0l5P9m6/yaJkzoO4PauHHAt1K2s3l6jksEcG9R5dvzp18ubMNo/IMOa5bTjPStBrSBEIpB6RJ/SdUHwMkjvEDgjwIQNJb1Jngf0BBsOhyuSkjMKBix4qWCoKqUqVI7lFEUxog5xLPjl8EDXAMSeyTidmVGkeCca+ZjTwVbroN5etxKpN2MH5EulPfMoEUA3f/DV1Zefec4ZJ+R/NamDeEvVhLmd3Dul3GriCXJKA3KoHKarldlJzz7jcKxOUhWvFKJ1L3jzuk7rWZLYYcOiovN0kskyvH4MpbOcxmqsAVVPFgwJTg1rpAxWwhomnFAlg2PDruefdw8P+Hu6BvuGgX10dBS/U5lMbNTp8FRLnaVbM8BcT+7s7SBK9b3GYTrxxpdff4S+7pKTAv8LuAnvK64kEm+dhyGPjsjvbrO3MzsSu0hUDuJbYA7k9nLF7wi4qNTiVIrZyaF6o4WjmSSsGdLKJbNo4uIMrJlnSCNX84SjXE1VMaVTqioWlIIpFSpGTpTNqFpjkeNlsTcwMTzc19ff39M/6M44YNRkZn2+2cz06Ojgj7BbjmxL54gv9hBgv2cevvHSc0cNFPirr7rkzHNPFP8LwHHkDUTbzXoLeSds+mjfgHyEJHYQh8xxjPWtd5aAw+nuBS1pKhWivTmvd4oJeQVviA/RdIg0dEjzkSwd4qH/LPbprAaRG3JBVimIXGIpWTUMiqsi7SPfo8PLL0wEimMrhHpXf/9gBtgzKxmUdmCPOQdvBfaW1HHZvRyBDuK7JMC93jj0BFzpw8ZXF0Pxl5/5P2ntziDxC7cuPOecSy6xcIO3ldOBGsyBtTObkRdt3vafWYmdqNzSOFmhophbmd3f+2CAeCyRHQh8ChLHHpXHZI5RHd8R9xXJnidtHaMzD1XDYS5MsRQH4qqooGmX8KQaCkuROxT4s6Yoch7H/K3DbkDv9w++MOz0ZaaBHWonto1rwaw/2oROhnUCvUM9h9jdq9dr5lH6iSfePGzg80c/J+TPPAei/+Uf1X8jG5xx+VVXXY64pBXkBe5dfeVFBLbFG0+A2qzWNvPHLOqt8dz6U7xCLb/34DtKG3kVg7mt8jJxY+ZmfTNOR9DhisqLi4tYrwgMSnkIiJMMz/A0g28EcMerJHFqsjBTcgkx6tk1KlJB2gFqld0xFIXKo4fjTE4xo9EqJbIc5O4Zmx9e6etHZe8fcONsDcG+5Jt1ZKaBvZc1ccgS2KF0O0h670A3K6aZ263Xj6H4l14iIzzII9nb6NtxzjnnnHnWWRdccPnl/4l+/9zLD+59DOQAFo8NQvkxEAVrBOHd0TRmM5s2olXCm982h7bHDupFeWQcyEEcR+CgcnJudWl2ZtYZi2kJRS3sRna9XhiuIYE47QImdDx4XiBdHAOLBtU9qSO9n2qwHsqDqU1VYcipKOHkqSDmFdYMqwr2b7KiaFGRjS4k5ieGPx52D3X19HT5kd9nfD7HLPyf0Qya+gcfDIq10ilIHVHCeGgXdRt6tWIW8goiquTNWq1hFo/SiKNi4/i4flE7Lr744oONDXLc+pNvXzv7P/C2qTMvO2rcS8gSTduoP/rIot100eGeW0HAAisJ3LW/7MsOYr59R7EjZH0K4p+RU4+w2ddhxuDn7whOY/7KFfYiOzRmM5qmdUZgvHooxOtCFmKnBcJcz4b0pDeLoh6vaWxChv+eoCRyTk6SOWpyV0MLn0uERXT2nMqZYcqT8LCiZyw4/PyTfS8MdXWRlm4l4/T7nE6nD7Y8svzgIGw6HKpGlEpQelb/gkC3qZtmgVQORJjzcGKx0TiuNfKkzj8ReMNzWDSrtXr9ALFB3khTf/76a2+44LR/fZx5mefI3AB1kAb3H3vnD1hwCe9OWMwRbdRIASQBIK3Db9Umx9df3Sy3kEPl2+jY/Riex1gqV4HKrWY9KzyjZ63ynUVzJSR55PMsecItwXJhkzwOr4thU9szKgUjJ1WlXQl0KHWPU/N5tlClTEUUa721Yj4sBsLF+bGJN57vcw/d3IPi7u9bGR7E8RorUNx9/sEHn3u7dmBDt5T+hc2cQM/ni1FRpMKA7kmntbQnXGzUase1WtW0fhsOD/PQfeMQ75BtvHHLdffcc/6/P7+feRn53zy4d+MTwq+zNyHMCeDWrebtTj0nYfnuD9jNW9SjjYyvPby8bM/lQI7ziyTLwhoPLIQN1fCmQosRZjFETwlTXiYkhLxeL01H8DJCo3ePMOjiUd5DNIOu7qEqTsNin65xEuXiJM0wEgaXMF1U3kVxHJdImGR+97ABMSiHb827PBOBvieHep69q7unu2cIexhgx9FZEm43/NqBB8eKSPM29T2EJfQ2dNGGzrIJK9KYF/NmNYdyXzq1cR8+2wj5/su+7uvuuOem/wR0D8eJh/XjgwfuxEBGqrYVBC6iVcFbtH9iwBETBgHiRU7WNHacfIpv+QNCfBtezOoslt4zfvdwgIvKu4v81PteWo/ocRpmDLFikMN5mlR2hvEy3mdwi6FxA4mA0YV4Q+O0sIzinZfVgkyOxNbCsGBlg8uzap4TE1UXlq7fBdC/U650uld8/rnnnnryrpfv6uru6ekZcL/gHvKD+5C/n1zuvoH+gV5PsQ47DtQ7NR3UlSiogzlRemJsLBFIBAPBgGsyAWeIyh9vkA8y2/jucOL+rq5bbviPQE8bkoRsWdw43XbMAfteC3cHekfh9mDWCtw7HWl9XoZ1NvL46Ghsbu5FSHybOK5w2fFDh1XWOyaSNyKGItA3OjXdG9JRwAVYcAxx5ABfwGIVLTzhD5+GIWmfj5tpy4UtYK6n8gWqYuzK1C4lVrmCnM+LFFWV8wWtPhb9rrc2VqxyweD88HN9b5PCPtTT3d3dddezL7gH/KjyXT1duPqH+vr8/gcDnFkHdlvpdk0HdNEq6WjhxtJjwD4WDAYCgcTkpGakvAdE5/cdP/H8c9233dh9ww03nffvP2wH6BwnSQU1bW480Hyn2U9o27omF3mQSb3JnfxyHNRMkWicfTwGDxSW2Nzc3NIc1qdzGMt7BgcGb+31hLkcPLip0NQiHUIKDzFCiIlEIG7keZ6O8FM8zPcI7UWGpwUkAFpAZONmguR3DX0chRaOw8SuqdykxHEyvjSDjcosK7OeBIua7hqLzi94xgITtz7Z96S769nbe3ru6Om6a+hl6L6HRDf5R7/75aGum/vGRDRngF4D9MrPoAP7m4jngsFgAiFzyp712dPfvdk18VL3jd3X3XDTNf8N6B5QL6QSh98dWEjb1NuZ3EZvUW8fgXsAxNGtWz/5kZjDDrLYnltdW50j7Vu/u+vW3gRLSZXFlJDieS9kjNRN3BcIWdAtQZNXvIDAS52s1aFzAf8SDaWLcjgvV1iFVZUcWafm2LypAo8ZrposFaXyeaoKWNFE1MN5HiwW53/g5vp6E6niqDF+DrtKq4ugtINtmtKQtODVgQrquMis44owox1GRplOwQoyMpBhIrTRSGJrM1tZFXfVp30ybd34UqPRxgdiokETLYnxxeiLT7547lD/JH4Cewt0Ct0+7Jlzfuf3515iCEYKudtmcWFhFmyf9dxWKS5Mny4PdH9hcxMdmlTa6AL34dCN6UjY/vJxV65cAc/fEd6BvoPqZgsFGxxY+N3+OyvT/cr8uYnz5289O6Dzex1TYnvf3eyadQj5GPV/+3YAjseY/EjPvjsZsJwJq2VuwJwDb4yrYb1++f3LF2CeYKKWw5kI5hk7nY4ma6KtJTSYN9AYRg3+TQSrEdBRdNViUPQGYnkimaOzFGi40r2r3aZKVDTT+cPjFmYjd52W40gYoOjSKO/U9ZNAV+f0GneS7vXSvZE1YAwjTZ9GZa6yOevzLvjum/f5g5tF4D8z7/XNT076Jn2epc0oxT0j9QZYNKY7Omzczy7Tr2wJWCB6Gjw3Od757klg3n86ND29f/ZAd+oFOn928uBYucdcR4b+D9nplWvzQPGTX7oqZ4LjCOQw54s0JV5G7XMDkC8uY45pLvpIYJEptKrItzpJAAxcUWePAV/RnZOI4bUBOUfBlcZ1OHlscQHfAXgDn8G9O8ifmjzXgpqbA77JFmpqZFBtOpHdWqFbDahc19TpPWfqaWKltzJWVjBIwBIYIR5UikXY+CmgDNipyPtmZmboD77p2VnfdBF09/jDaQKH3h257n3MdKg7pTrierMJom/VTnDY+Belpz0er3f/lflz90zcc2ZAhzp21QiPNEX/5RN3AuYU9VO7hh//Yjgo/svvukQRrz60gTDuQr48Fvb3wfLwI9PULM/tCE0WxTQbcTshJhpJ1NPbDeTkmIZDBc4tusXa0Hp3SAqfUQsXg7KjCvs8Lc5c7aYH5pCtH5d3MR25Wz/e4wdSfcDu1vUahL3rDDiHZUcD1pH4IdcbSCNVcPhRRreEQT76+dJmfnr2jsnJeVj52eJzmwu4mvR6fd4Zn8877ZstFoPI6VeeFojac3rfU3kH5pywRSGnC1Tn2OETD9z/i7KCm2fGR0E/f/4MgU5Il21yVSKp3//y3oOnJg0Wfgz46cKeYADe+5lwdAHxRWCNhaInHUlds6wNyPocUuJwMJjJcNUO2mma1ol1tFyngcZaJ1ePIVPXGnZCk0URj9WYjJwdLTbq4FZlKH0sl0TSDuivOSTAc7CIBb5lIiPnagWWL7BcoRaQWlw9UtW5qhThzIIKpJgtjjEsxhJSBklnU3ElHlc8lcnNO3xe8Ht+EpauAnc3D5Gfgc4DQgT8qeeKft+kfyWA0pv0s4s6lkvz8SLda0888Mv6vXdPwsD5Pn/6PoAOeT8DdViAvlWtVrt1hkDnJeSlN7sHObqgj9V8jPfJ76PvCaK4m50BcTAcCy9g+oW1y1Zm8eEwppem/cGVeHqLRzAv72q7CW07CTBfTiIbB4FXQfNtESW48Tjc86A6nY1D2R2V2TbUfjW5jUgAgUdMl0zYN2xXrfO1Ol9vlsFwFR1Vnh5A5FTNbuSEl7oRVeWGhO8xlp7RCRGy6f20ZYWNeH7Tf9tm8fbbATKVdWRwlSJSt/t83nk85qnge+8oFqc8SO9Wgq/klVI2SyyK+inoW99j1u7kyr2T587Pz0/MU9AnzhDohFQh7/iG6C7Bw4/N+Xg9QPFGYobI6q7CODk7xTyFJ/YQXr6MEjeGFD3+kP/pYAA1jjJleacma+Bxg5q1ZCwJZHPJJNJxdNNRd2uA3LQGDxOXkJG25ZK4zoH18PMN5OkcOqctDLsfc+yeytKaaBWT0Ht8vSXVVIntNrsF9Nb1bgrJ2zCi9ixikUE8209lSXoYCChxZaFyW/FR8NRd03MLm7gRgPHkJJg+f35mZp4avDumiqjeTiOXiwN4QgC8G9ZNaQjMt1YmZ+65B2Df9/krLtPvOiOgE0K4LstA23AlSc4JFXe6V+TqtZPD3b06y1eh55fMhwqRjQ1A7uKdAt7Uw22A5DuLDz8cRkYEZYdYCixf7mhiJ5bUknZSlHMdVNrEZEwTEza0HFVXJOd2jEp7DAovy8jbk2JiO0kzdbRYMVuBu+Fa14TOmmxTb0kFvcnyEdVk1UJLgqk3WY7X+RQqsiof6VlShqTVQMZKo6qSVUoWQ5h0KStEd0qh/Iq/ODt/x+R982MTt1SpROeQtk9PAnaK+/mJmRkfgJ+61z9J79kgkxZA+SxP2N2rV0+u+O+enJgA5hPzAJ1e3HrX2QOdh3SOfnnggatjuMvVqgv4pYcg6X9RHKC7CzOITz1kXV6jG8vQ3fIHPcGVgMC2YN/kJKoxwJIm4A0wGdqOB7zaNiaikg3k6TBvjZfFNn5exdtt0D5HnXsyeR2TFPiNx/Y4XdCrdQ5VGUzLtJCcDfn6IWYiC7tE6vLNUZdXVV3nLF4aEIfP9FRrpGeF/bjRF0bCjrIzSu8Y8WwwOl25z3eHq+jzyNxDUcg8MvYx7DPzeGJRqb93amFhwUMbNuFgAM7+6OoRjedgNzA/Pwb9njMj72PQIcpYpEXj+tWrdcwpcealSxcvAu+xpFPI/164vvD4++9ba7gDHkGKNrc0t+SPX2FUwmJngtxBDU6WbcBuJyDtILpmr9qr4DsmKMSGloTg50StjUoc3oHq5yDscHA0i4PIQ+kf63ICz7aOa60jR3JUadeRpJrE1p0uL7G6JHW7AdJNDSX1ZFHSF0cSGYZ6hhUZGemspQiZUZbZj+/k0XGtVPwVX3Fq/vbbKcZI1ienNiuVBcg8rdS52g/IaUo36fF4lmDrlxZCK6EUYx7pK37fxBh0yHvlrIG+BdAVF3Rq5r6/dq3cukjp/RB2gIPiWGPAl93n6xcuvATE319zN5RNA/FHlkLB1LpAJK7erdtJGTDCkcOjYeIViNJ5V3AZSXoDxZl2LAfwUW4VRVqNSeALrt0dgsZkLKQePyWu7XGq0KxWC1Wuhb1NJl+o1SK7fMGJOKzpkAJpdrtw8JxQwN2gmhmS4QUVUT28b6VH2XRc6AeyJSEeUCqhzeJt924+Chvvve/8zHkw3js7la9sLkHnx9DPnKLu9cx6vbiBPVihTGEo+ed9Y3GnTF8/Y6BvUaZfGYNOeJa9dgCCQ9GxXnoJfZS/zLpLcQD+EKrraxeW0b2kYwtLS3PhIMKp1Byae52OLGoaZTQgpLMxmGKnDKaNFGxNhNojH6MtdFTgnl9NwMHnEvhyk3UIPLapY1rqeq591eHUqjNsHnGH6LAd1/Zq2KMuOd2aznZ5FFX0IWo1vD7kBpzVzQxVaZDWe5LxeQ95eiY9sox+5nOmNGI+Vzz90lLe89zm3bfTktp99+Ex7/XCzecrQXRjALv3dEEFvDO4E2Y90/5QLzMknkkf5fk9eAL0MxXTsVzQ/0JdKm8fXHrocTAc7ZN/y/oyGiprlwH45TVUWlGGmQYp/Ese5GgwTxJfa7F22dZsLdmh7RVafcUWRRsJOaSbdtJFO4ZLEWIv4iUpitTYyUkwH6KQ0EQ5KW7LIjUBsZf3iECaJhLxFspuasR0GN3kWIbDJRthAygOqc1CNW3yHM8xXDPNE4ZEMliEyeynDDzCqVI4G94x5uKVpdLUc3cU76blFZB2BtF98u5ZF/c4CA/cx8sD5GcB+fRkKDDiBtK0G9Hh3k9Bn5k4f9eZAZ2MQT9FXZIODv6O4+MI7r7AqKPMehmHPyyHwyEP1qx/JeoPBAQ6xdDl9uoyumlQ7YYMUifgyqHoYi7hjsNhH0uSklyOtbXGNpQAwMq5HOBOxvAprD1Evo12WyMm4y/ErtVQLeKPTYer1aA9EhydjsRSciLSkJN0leg85iikHqOykaEpOc20nuFVi6ihUYZYQroU2l8vlUL98Ho2lM2HotHnisU3Jm+/2+e73fV0WD4vgI/mlXyFTty4a3rGixePf2WFGZiHBCEdNbhxyjYG/aww/crfoAtbV0pXqMCfHFDMx2Cf4r2Wuby2hvdepGEc0RAU94fC4XhASAukipF0pGl2EsIuy2iaivSZiAFYwEwvADI8Gn2gj4qXBL3GhxT8RAL6L6823N4qPoba47ShLomohHNMvl7l9nggrtJTxViiVyU6HI3PWEJ6Ji8t9iKklya9lE6IpQq9lGBkjJJgpNFy66eM9fg66nPBSkWpTD13d3FpasHrczG/DzI/D6D9C8XNeCWOMQs/piRo4obWO8MMuV0wfQLVdlD9/D2noN9zdkC3AHoKTHe5TkE/KZi0XTpOxxcp3tD5Fy88jC3hlODTswuepXCYYbIMadLObMtu2fDrABryDUsurtoxkD0J+soNvAd8k6syLpLomiYTAF2kRE+gTAOI8S/w267KN2ACY88ncMg/XLpUVVnMTtSRT2AQtsoDer5brUmSLvHqoMpJRBrAbjEjThilDT3Qg52TLNVgjH2hlC6lM720gaRbUUr5fH7dX8k/lw0Wl9BvmUXsBnsR3X0g/eTdHv8cbuDoTiUEkgejgQATSQ+ru8TjA+iAHM+/QD8jRo6CvvUf0C20z7BS4WVq3h5/CUfEAPG5uQW/f8G3sDC9Gc5n0hYp8KiT1XdlWezIti3anSQq67GOKKLkto3+qR0DjxsasrRtlOCo0sttLUGDNypxGoy6uA0zB7pT2sP/YRQWoR4Kca0bIZzZgnVneZNnTSj8HlfXkbRXUZORTBOWvbvB8wW1WtAjaoZRGdIjjEUCJL1vhbN9IVsy0gEjXvLnlTmjFDIUT/5pf9+vePyTC947vI+en5+479yMK/W0XhdeDj0SjgYDDBOPx9FMH7aOiYcyHWti4uyDTk5OIvwFsJyuxeULQHzt9ReAuN/jh68NhaKhuIJ8mCFcq7bXqdU0pOS7id3EQfJgN5dzp6AocIC7TTOx2Gobqo69iSI18gl34J2yPZED4qsYnWlA4hsNXCKkw8Uj3ctddSSU3fTqwDySCEK4U+Ud9H6JA7rX1C6pDSJdh+sSaL2DvjqReoJqSJmBJeiZ7OfCPsS9ZOyvg+f7pZISN3ayRlyp5KOb64pHmSrObhYf9U4W4ePvmzk/Q1F/4TVImpHGcsdmzEMX9Bk4djdlO4OgC2PQsQSgTkFXcaoDXeinPPX++3DxaKAtgOaBuUCcIWvWGlcosF32GHsQynJHO+gkNJqf1xK2vFpOYBpKwwOxXEbWjQfQhvjntIYb6XPI1WRIPUK7BrWnv5oD+YE8HMBqYhu3zbUa3DmhA1ESX3WqqMENqpFhodc1VXWxa3LQ+CZ6+jphe4sSUnOGJ5Yk8CQ9YNJWvL9uGIIQZzAYnZ3uh0t5Jo3Wm6KslNYn84pnvzg5dffkwt3+Be+MFyX1R5GoPbKzYUlORmjSIbktrnrIj0E/74I+4YI+cZZA36Kg569ceQdU57a2WkdHEX3DBZ0m509d/PXtpy5A/TanbgvuMNkIIRt8S6qybFmWO8f1vV35sNbYPdwVj2rIuUS4cUrgWA7o0acMd0aHXJPY1kLLMNr2qqwl6WAUhB7HUCTbMqQf0V0TkwjxdhJKLz7mRLYyPBuBe+erzVGB60UclXG4AG4Ap7DXZE1SqOGOiPBpjFFIhOmtSLwQICRFskI2nBVSWSu9nwpkg6X1eDC/H1BKoXipsp6v5D2VYn6pqCwsLSwVp++4/dFHZ72z2P7ImzjbpEqqVUIXf1gG6DNg+pkG/Z13ADpQH4P+KwV9XGJ//K3DXy9tLD+C/7v1/AVrMWNGBixKJZpd1lpJGdtPwXGsxG4sdggZl3PIwgEiaAz8AGgC/gzfYeHorQDsxRwCeg71G9CaynkMdi8JkUdpRsPtQUdlrzpVNQNBl0xd1x3IumT2UJQxh1WCFlsVyi4RlOT0Zs/JDDIOzxNHUCXDcpiRYA3imf14P9XPCsNwyYga/UBpvR/vx9fz0biyjvnIYmlBQXl2oYhy7KNFYD63vPZr6/jGYVkqlxExWFY9ZMegA/UJrPl/QL/lpv/7+kfe38Eah3VydFT4dc0dilnG60PlgxvljYeWGYHJLlokDS8lRWrlmgxdt227I5bFjoaHLZdzZZtuZQBl0XJZRZUGl9B19M1Qek+iD4NratZF+HxatYGTwyX9FzH6b+RV925pYxD+qtO0IhIHm86byMs4eqoc1+QlntfVApprLGZ3sAhCQCQjZNRUL8yr6YDE0KHYucwoVGICW4FsyqA5eiq7Eg+9UgmWQsH1VF6Jlzb9RU/ev+lfqhSnN6furQSXM2/tffj115/W6/UOntje5oKOGh2Q/jfo95wZ0P9h+jtj0MH0h9BSGefpl949+LRcuLRMIkImMmRrNalbrnW0li0nKGtp9Eb3pI2Lto2+OEI5pByingN6dLodO9BtOgJHqb8tQtppcTZnIy+jZViatcHtwcAjlZO3aSqHtxLXHG6LNGsRNqKrVR0RnON0iVVVlTXRVq1JBXhNdWNUTfciI14YBIxseoSmOhFIRsj2jRQ2NcLJxYWSoBjr8HCGYgSVftRYx5B0fi6fzS8sQOU3Q8pSVAlFmTXp3c/sTz9ta3tfYtVwptUhu0dB9547NwEDNwYd60yBLqWu/JvpkT30UrEuoC53sdM+sB9/e1linCZv4gg/u0y5ndBA7liHFlZlPDU0zOy2hj0NlM5QcBkNNviyHLIzGdlZEhSG9NPJOGxVxjUEH6/iKrCGeRfh5xEHaDxoj+Wd6wFESa+jILdHyLA54MwutjU0HR3RvdnF6AxH96DpJNLL8A4vGEw2Q4hbljFKfQtoM/1sKZtWlHUhX4oH9lGZQ1RX4OGVYMjYLOXnKsoj8egj+SizfOnDD7/69tN2+8Zn4yUfH6l7BFV5QP4v0M9N3HPXWQb9UuEpugA9QN/+8OLbD5vVwnFrr1Ou0T5aBzwHtGVRRHYOeU7Icgy9Uzo4sR0D6hoQpSwW7USCJmcovee2ZUxOUUFPaDkRDh7dV9TaUYOVIQ6AXpPx0oCPx1jFVb1pQsFNIhGM1rd0UzVrBQTzKsTdIb0meJ9WUXjFUBWPkMMHempqYAWQR/6eMoSAUAqMmF46UGKUUiAfT/UrSjScz4ey6+HsXB5lumg4FA0rc/F8tJJ/xLq88eGPNz77CLspb9y48RmeySQF3eOCjvU36OfOIOinTo6Cjj7beD3+aqd9/cuLb2+YNeyJ2NurHSZRPaMVFnd6Hek4auV2O5bcpuhSW5aErq8CR6g2HYnCcHvbRguNzkYlX06I1NOPp5+pqtMzpQB0DBvTketrOS3xEd21fOCYapMH1pKuq0eI7CyPAQqdDAA84cHvk0h3VADNB6Y6iAzp+PNQMtBVLaWz+6PASCgphtBXsOdlv9QH5YMjpbIfzEL081EjlI1iiA7EN/A9mO0vv/XQhz99deOZ9suffp248dVXh4erhwDdoqCf+xfo584a6Ct5F3RBOAW9fBHrEl0f/Ni+/u2r7z7Vqu1WNe0inXBFNQY2rJxDbl5GkNaAqpbAldyQbRRhQVkNqRmtrdnwcLD3uQ54D+8W05J430Y+DunHrlU01eABRBTtZDTbjw63qSf4NLF60N4zeVLnD9FVgWPDODU7MCUU5jiCKakhQd9NN5sOp+tgOhdhUHOHh8sYfcCdKgX6Snw/w1Abl+3PZePRfLAULGWjSiWKiB5VSvFoPB/e2QlHozuICsvWU4/f+PbGV9eff7nxae5r+LlPG40jds/yn4KOJwX93NkD/R13/Q36hx+8+uqrzz777MWL3/x4JwX9EluuH8Nlf0brLBh8E2MHCbyCtMi2tPGkG2Yg3Uk3mqAltIYGWUdyHsM3mqHTDA1pGby5hl4qXiHo1+VVeD4bn8tYsHw0u4N6tGvw6k2O41CJrfOOCq0HvUc8UVGXMatS1YTuWxEuIkgXiEqyGYagAG9RoAWrl+qjGmOESuupUjA/CijrijKnBPHyeSieDyKy45jJaDYfNsJ5eL3s5ccvfvntV1/d+fzz1683PsXCgRX/Ah2PMei3n1HQ3xmDzux9+eGHH37wwZtvvvrqtwD9sw/efatePk7Y2mfjpDxJrZsGgG2RFtcAsAgDbkPycQnIGx30WlxPDtNOS7PjJiuN8w3ouihD/KnSx9zjpdqwcYkDlG1lGh7wpnjQ5XkE8HK1W66zTRTlHG5AyKCpqhLEndXpySMDc6Q2e1D6cK/HYG7CUq19QyA9WHmhh4gOR/9LsG+ElM9Dn0f7isco4dy5fSW8H8+X+lFlJ5rF97iQJuTdS599+9XX13HG4PXt63RttwE6dwo6CH6mQRdc0A+PGPmzb7/88ptvvvnxww9+oKCD6ZeObYw1d8q2fVGzO1TlbZmeCScjObdbjZaodZI2tFvEed6dznYnWU7KcHwJGz/HbFEDs3EtwgGC3dT6JTSqDggVSU2mQxSQewgBErjr0HcNTNerrZppVlXO4ZssITxp8mRxGIGli8DBFYgpsCC3HpGECAbeiY6JdyLQoXfwfF0IrKfTjBJHXh76PIxvCvop0XWUY6fzwZ25ShDWPcUsM5awZm28+i1AfwZHiV6nqLexDsqI6XffDbzp1yno3nNnK2Ubg37lL9A/u/HDDz/89ttvP/30DUC/88ar7751XC/DlIOan4piW0uif+rOr4PQ7kD7toZL5NkN226Lqzk48bYtouaaxFcnhl9FDYae/UuH42xsZFulfwWhHW8gQcdb+HuiiARejMERHshsq1VlIwjm3ZpExyi4uoNiv8PSKO9IkZPUsMr3BDRlgPRIUDMCsUjGEhg9jYb6KNALZ7OBkrG+ngLBUzSMK/mSEi0F48jjoPPxuKHs9MM9axFD1GUw/Y+PAfrzd7bB8/bzLuhVzyxAp7CfO3Og/0ne+X81VYdx/PBjv/djpy+Q2jdbMaMv1CqgKa42arr4cqVxHeHddcsG2zJo4wJtN7kVER6ZgwYhC2J1OusHETbqHB2No7RORrowFfXQFzunOpZlZvV+7h3O1P6B9ey7WEd97f18ns/zPJ/n4qhmVukMgy/BPJQ+l0odly2dkqFHKtxSAntvaS3tsCgFxxkk0i15eM4ASSNowwbdgaIKPm+CnkUs8bRPRwCP7wKdTIQZ6C0WAdTR6YtBcd4mxyS+CYjb9e1yjAAzTDr8RpopNdsmAD4u2ePHIu+32eu1no76JtRcSpsoXVf+Wr1x0F7KaJkTlXbWqx30NTFMvdlrDvNeVjXB8yi86Jx8JUV2Jh6eHTF8gcuKvbrLWlaM4J58g3mwriuZnJqWoa9Y0bmiE0PnJt0e4x2AnjG5BTq3oHdkoKPmkoGenAb11M8/gzpBT3UNV7tF5OFEh5x61Usc58AHESkaOGfOb9gkdooi+OMNqm10hA0ROr4HEC4HbUPL+l50u9LG3EDtVBz8vYW+KwjkEnKXfFSv5wzT09jQ0XfB0UaJVn9FCBnffg/It5X7PbN+pIeQnEMVn5pm2ozzHYMgbj+p8poGC7WVPsZnxjNrcvE44sIwGt6pgq4rdS5nM23SyliVjnU64dpdxfhkVQW8GobZaq+oTk6dH4+2Ajph35KFnp/70CF1gh7bqEqOx+Px06dPg3x8cUUDQRcSQYsjBq+OGijVyvQcfLUFbh2DwDZiJ06nkKluSsJub7dQpIYbNTijEwqJWWqGoitxURJO7NVT15TSB4vCKuruiN8Q6YN+ZiaFw0MTIt0wP/ZsOPYQdLuNqLNgBJC2p79jXnWwqa3HPt92Av3R5sEqRquF00e1pcoMdXtd/Enn26xzwsk73+Y1YVcl4dZMWHVhTfGMzgXiuPE4HOGrhw11JadScYKNB+5Z6LLU8/MJ+n25A/1a5GMU6E4FOymdoMPiZHMEfWosUt3iphKLgNyr3wCZui2cBD+PaMyth1NHZs6NmAwvHDw+BfS0JVvLgS0ieKTj6QgjLsrzdDvF8Hpk5qBoEfu2KQO+CfKYWEfQEtyU6J2kq7Nh/NeJ0RMnaF5EP8pslHbH2WE/wnc6ZFXa0o+jbDbMCp4XbOWowfleO8h4GSzm2iqGLWRwNqmw0sqw2Kt5TScZHV8MwGGXU61xNbsmNGrMq2B11oDKGmDeYM319bV1U8nU+ApSeoZ5qwI9n6SehX5jrkBHQiYD3enMQrdEo0vYxxdI6ZGXJfAEVFq2OXh0AxXTJITliL9pWcev4yQyaGfGy6yltghqcaYJBBjunTiBsYsbnk7Ap0PbkDVl4/TJ6eQUlgHkcebxc4yspNmFeJBh5LQytfLIfkxy6xlEQPcaztaSg4esO6qEUkyTRNMkRgow9YyvHnsvpv7BKrNPW4hxgkyhkzexOmcYa7kprNPB4VvxGft0XocMfJk1oAvwb7CNvre09cO1i+fPj9OaDsso3Q/oD+SvhNbzFeiP5Sh05yXQG6INDeOyLTQ0pHZGukIeNweawIqIzc+RgSsnIt5Gfg7FM5GSqOCPrboE5ZJ8N8liR7tc7wnMqnti9ZqEYVLcyE1H9XOOSQwFhs+n5F37yMg7R47s3390995TZL9l7dRvp4Cf+B9559eer79GWu4gaqvIwgstHaE2DKLpQH6+ym70FZ5EG6yPsft8XrPPVXlyF8s6WZO12Mm6dBNWrOSsy8kWhtVWLxyAtYhBKw2DIzEn620VkUg6dX7JvStKJ+hFD9wD6Pk5DJ2Q023Xa68FZehk7zcsQR8bksSgpV3WMwcdwz8nLEGcUZvkqCaOGhmGCeEN9mvYq3XSLhyT4XotUUTpnRtxfY7VmGHzxBF9DIHctEOcI4kn5zjEdyfWHPl4//69wA3E937w270fXGHd3V/tPUrKxwAzexXOvpTa0GSBgTRSCDurCltbaX1T5WAlg0UAB1zYJmZQFdbxE6zTO2PlUVOZ0fC/UgZ2pmCGhdRZVj3B6sIlWBDs2tL+tlBt7fEUbdmyQm8dlaEvXw4HT5a70GXsb8vQDQ1LFs0o/eVhkUOvM/XLiBInufUS5nc6BKzzfovgkLCHd6OhAs8WStg4qGfCQTPE6KzqKOZ40NiiNfMctUlI0Tl9MmmYQ/DfO3LkyBd793Z3f3CRdV9f32cZ64NlfrH7r+8/PbZ3/xFMOGrSGrHCt5RW0YQEqRpV4AqjuRJTI+0Pms2FlYXmysJKFcObClkNj7w7GiNNqLGxLqtOhzYKbNx0OrXOpAqUaHwlaBGwVQwc2DwWB3SF+WXQ83MXelUG+i4FeqlhRUMD7mQy9LGx6lkqkkwigY7QLCHCg8fkPkc8HJYEGp049ECIem4SH+WD550W/bSlHZF758iaJ+iq+fdv2Lg2PYdqddQxlZxGXJAYxUCTY3u7M7QB+6+//ob9kLG/f8CHv/76i+h/gB/+8MeOfZ/M/Dp/cFDb0VFe3m/EKYtQ7YHhmpq3zOZG83zpQZ+2X8uexDRwttDlhCdnVUjRbHPtQpaG1SCWR5HNqw67ePWES+fShXG8tbHfPjBcF0nL0Fuz1OHefQWAnnHvNyOQw+Kec9C3AboZSn/bGIxdAb0rUl0rYe2WHNT8inhNQm2Mg6Bj/l5p00YpKDpahRjHUU6G+lppz9Wun5rEm/bR1biq0733PrKmd+r8+dTUXDo9NZ124Pod878e+2LPKQU48f7hd9gfl9vvv/8A+EDf99fff7zyyivPPet8u77+ZEtbKWowLR531yyOWtrMMPuDgya7qhQD4E+6UHDzalis5xPPTqifnbkjHHbO3MV6C1Bd5e/CzAlT2GoNlLCNb7WstwuR2oXTV4X+AJQuqz0XofcDumKQehugr92yAnap0mulEAqq8tElEY4ejZH0DYhJMeXMomDwCx78nLqgRUT5klJup6tjryGZP/TIM6Px82kAd6BPYXEuuqln5ssvuvsU4H8D+A4AvnDhT9xxu9wIPul+R96N+Stx1sxU6Cvvd1fbbMbQQDKCE9VtjWZbYxNd94Wp8qF5IgAtTwRUPA6sIH5D37aJQf692Oqi3RqNIjKVBXS+N3xvtQ0MbB0aPrCk9BX/VnquQt91CfSOS6A3EPaL0CNdAgXidHAJ++5JtJYEhU4ugSDdENOvTThi6JebRJQG9aNXgpuknbeBJkK2rrmfZH7/6pHp09+MpQ/MJQE+NeVomjm2p28J+J+KvQK7gMeldobswpkLF/D44/ePPvozDwhw/KiktIKmGdVurR5Ldm2tqUO/R2NjcN6mbalqYnwBsyvAh10unGtCn5TTOfH2Lq96otk1o7Kyat6JH1m9YSRpfYMVP/pDQ12LMnSy/xv0bReVrjLISgf4rNL91ZKIf2X8S/slATfJ4EfohvYptyD5LSi7oa4mCgaL3+I2YEWXKAHXirAdzAH9maej8Z+/o0x+am7qgFD17ZdHu/v6yKf/8QfhvsLycHsl70xe3itn8s5kDfy333njrStvL9LYhg4sdMGqDyerifnWGptRGBlpsav6wdobLtOheq5j72JNj4cLUF5ndcVOSL14oghiD/D4aeBJs9mG/zRUA+jnxrNKX/H/ce/boPQsdMUI+vsNqYXIZgkxOpZ1Wtj1GAQphUSPXjJ4pJjH4eEkxGVBIciJgl6Pchp+F/VBtreOrnmG1nMEcVvGT3+zuHD8dPx4pKuF+faLPd2fycQvgHje1ZDD8JS17dtxP3Nm+3bc77z75oKiJyuGURXaiTaPwwc219XUVGBsRtvkyMGWJpVPZaITLTNOHieRnTM6fpdLZXKxzeiG1VjlgksxnXZivTiq86NxqBZr+jlF6fgrZ6Gv+jf05QT9mpyADqmbAZ2YX6Z0PCB1QH8f7n34ANJw09w09TtLcOcxHHMIBQ2eSRGe3p2w4PMkMjOtDlGusCDvEl072jq6+vWHfgPzNaPjn587n0Yq//DOaqP50Ffk13//418KP3PxzdKXgGROYsfTdsKetTtvufWup0oG0igQ/LzQtbi4+HINqCOgC42MouputvtcAQ2yMTz25GyxV816VTwPjXuRfleTb0ebnMs6+IZ9EANODg5F0oCuKB12OfTlCvR8BXoOnHBRoPdklA6D8i9CJ+oZ6GPVKLNxONkAoYuS3+H3SBLnd0gCgjpDOedAUCdY3EGPm0J6jvJx01z7070bnnlEWdDbx9+Pn4vH02ObqysC4WN7vv8BGl+ivA63vKt6+KwprDPMH4bWMY+0pCsV//zz+PmFhZ9+2kzzcTCjfWSkieaB233IvzMapxV9ceHHWRWOsfHofNVoeJTUm4uthWUBjSrQaF5vtG+tG6qD0s+9TxL/N/RVIH4R+kq83pkTx5oIulmBvi2zphP0tRmlg3qcoO+MbHYLDlB2cFQURcVFDAU9QU8CNVaPaAF6gxgLibMCmh+n0d/eDuZcJ6DfT9BXb9gYRXYPq0RXbUWjlf30k30K8Lx1ZGB+Kf5/WYY47gr1O0H8YXpzw9133VNc4ibqv/zyzXenU9U1dVifbZMb5jHvsarQbGYm+DD26xM6Xp4HWcSz1gBGjmnCbHOZ12p1BQbNzElfi31gdrh6IXXuXAPRJqOXyRbk3gH9EqWvxJp+Q85AV5S+TVH6VaEfHzvQJSU5SHgaPTOohAsxTzDRE9JLMcukEIs5Epww6U4EgzHRgNY5cZqLptN6hHEUuj/0xIZ2/Tj+R+mu6opGXbP1ox1/AmaGKTAr2JdhC3727NkdOz7ad0i2ffvwG/9c4k5rOcG+Htivvx5DQTATquiFEn+SqH/+889zaYxGslXYQhtGjB2lRrh4s1bFM+xMMat2hgsmXNZwgTWsZtFAVcTzrDoc4E0BMzrubHU/DsC9Xwod9yXoGctAz78hN9y78yJ0MP8v6KmxnbXVbuqgQHlb8osehPBuD51bxagZN4L6csnix89ECWlZvTQ9NZd0pNsB/R3s0V9f06sfb4impOraugdVZa+eJZWvwz1vXV7mHfE/e3bXR598f2zvnqO7T8nWvWfPV8e+/2QfviKZQI78+50gTtQx8+nughdKSirSp09/Hv95bDE1jGDO1iaMbPi6o6NUax5kCn1mjRPH0lnIGplXBHABqrJNqMtcOl1ZCa/zNZqfxDCTdwe2jpF7p78wJaXI/gv69pxQOqCbK7PuHdA7FOhkWaVHuiSRg9SxSY9xyLjOxkKhkfIYXLxBRHcFlxAMCU/MYaFy2xxOiSykk51bekeQcn999agekUEann1roUn93E3rwJjkTSIH+QzxHYc+PbZfLrCBNx4Kdzz2fEXgift2sutB/TZAvwV29z0vlD1YN3YeHT5dNUMHqhHLtbWMkH+3lfpKB1FiDyNCR01NjTzshIbn1V6r01XMNwd4r44GSvoGfTgEPzu8czGVgd4Ay0JftkRdCeQIeq4oPQPd+V/Qx6H0w7VuD8oqHEI3muktif7yUJsgYSYBhvYKfujdgrAOSz6V2bEbT4sbW7dsHF39zBOrRzc2jE+JJPMS0+OPr1q1jICDdWYxx+PsR4e+/2r3qY9/++2Dy+1UH7H/6tiniAIUHw/PDvC44+D47UWPPlmyvnZ4eLh2PXZwKL202TZsGG1r6yg141B1YSHNm9HpNL8WFHsLws1FE0XNOOyiaYaT571PMcx6pspWtf7dgbHFJaUrzBtk6AUEPT8LHYt7jqzpwKxA33ZVpTcQ9HEo/eVqoygZAFx0w4dLcPBBwYOTTn6OvgacG2ee9EjMcuicnE6mFxfTna0Y6r9hzZrR3ug4reZbS0rUjy9bRtDzFd55y/GKhXzfp3u7FYlfRrwPRRj5Fdwh+H2vyMs63Dugy+BvRAyvwSX3aP7ZC0W++lpAf3pkpL7NVrpey9gLWRVidZRXnSoUW6waFkPGiq06PhBAZoYJMKinv9DUUjUM9x4/d25cgQ67OvTly9flSiCXhQ7LQNcT9ExKLgN9rOtAKCFKQWzHHQnJEER1BeG7e9Q/6gmNeEIGLmac5GJyFBcVUwsLi6nW1qgBvYa4pOJcBMwfLMHUVQxYJ49JUpe9+3PPP3f20Jf7d5+6UuNZ8op1dyObc2gHNuygroidyN+AWe6PFhUU34FZ80XWoVqbbWRkQw+OvjSut2NeZFjnYq3IwkDviN5cd03MFLvKeDaAL0IlP2HG2ee68oHh0BgCuSx0Wtd7l6DDstBzTenNV4GeVTrce0ULlC76/aKE2UI44yRg3rPgxmuVUC65cT17UYTmxaTBkVpcWFwcb90ynk62t0e36KWhl19aX/L8o6swfx1GeyB6pbV9x6FjStz2X8SVW8Y+A/Y/Se0y8Yevf/hhrO2I4u+59W6M9sVw1zeqjB24qOo82uRKC1mtyevzFjt5HYqs6H/FJbfRH+fFHGgqqGPvhnr6W42+qroKZOQIegMKDktKb5ehUyRHT+uW3PuNObamK8zxsWP2Sug7I9XDxqC/hRNDbrAVpFnJ0xMr5zzuYFXQExIEEV8G1NMtaIhJT3344WI6umJFfEza1NCZimzGyBo1RL5qlYycoMPDL1sGlR8j4r/9F+0sbiJON2D/HdQBW1E6iV4Z5El2911l2npcSzdhKzWXFhZ6GVzzwwepO8NFXtMEy6DKdlLthPTVYV2AUYV9ZvvW+orh2YGXx06fPj++VFekl2mjwBSQW4KB+kpApz93Xo5AJ6X3VxVD6TAFejADnZ4APU5rerXbj7G8YtDN4XqIIfcsxsdJHou/x+MJcTjmJjqQcKeDquLU3E9jhxdTyN+mFvQN0WSk+s0XSzQPLANu+HVse+h1OW3KD31x9KoiJ9b0dBlxIIehqH4GCr+q3fLY7Xdog8FQeaUG7TMqr7YFoyV9NJgAA+C9AZ5RYVFv5jUB/IIVGzgXRoqaq2qHhocjBH2pgyDacAn0dYC+XIG+LoegO7PQnbhnocOWoHdFhtyI0B1ItApBCBvPs+V+JOkET7kUmuVCk26DG+MntjjmksjZ/nQ4jrTr4lRUPxWpWY/LuzxAilkJqdB6vmwdDCo/+vEpGfqpf8tbwU2vVxJH+wyYbyfo11133W0yanpW3tx2C66Bi7MvbZUmFYPGqflS44jdZ9Lp2MBEEaNWhV1lM0VhDA6F1AMs4rk3fFptU51QO3wA0ONy0pmYZ6GTb1oFyzHo2xToj2eUfil0PDLQ02ORmq22kMfIiUa/2+gWjCixBsurxA4/Bk21CW0hwUO7eC7aicJX14c/HT5+PB4/Ppeak+rWP6gBc8plUvJ6ncL9prOfIHzb3U3Q+/5jBc+qvBu8FejEnHLvRJ2wX671x+67+XaV3VxpKrYyKtWJwoMj/eiUQuTeHMbQmeIiL9ojCzBwxIoFPhAwB7CqVw0N1dR0yUqHjeN2qdJX5TB0bUbpTtz/pfQGRelojAwJsx7Oj3lxDglTeGKg7YYnTbT0+GctHlEQODq6vCWKdqidhw9/OLaQjqeOTw8T8zvuyCdbiewGGa3mz326+yh8O0xmLZss7iuWcdwuIkdh7gKt6DB6uu46esLtIvM7b8O815udXmzNNUzlgwc7Do4cxNAhp5otw8lk3hVWl6ET1stb0VqD422M115v32ocmh1eJKXDvaPbPxoF9OhF6Mvxx10G6M8S9OW5CH2bDL0nu6Y3ZJSOQM4Gfc9K6KBAKR1zeQVPwoiovSUoSEGkZIMx/3Q6vWnLitTxxZ2Rne9t3pxKjaUiNHXw0VUy6xvzFYN7v+nsp+hxJ5Gf6us7JXv0K4ADeYZ6dwa5whwLuoIdsJUXmPIFgIPH/Zb7btexOk1xgDH1lx5EJF+pwrl0VM8DCNnRR2NV4y2LDrlASYlvvbax3zhQszkSl9d0MFeoK9CVLdsqUJehL88l6JVZpeMO6Jev6XFArykv7SlHH6JD8GNg4ywm0AB4yB80+kMI6MUWf0yaE9u3RI8vLNIIi5cPz+08frgGIdwdK29ctwQcWodebtrx/dHdu/8h72yDmsyuOD50ph/7sZ92A7IBS0MkmFhKTYxCkmeahrZgJE0gw4R0QttAkrKEAJsIkoawiCgqLwMMAsuGqmA71c6sCGJnQLAj6uwoqLgFtIx2sR21nUJfbKf/+9w8eQgv3X5Oz/NiQEdn/PE/99xzzz0XOVYKG2/6bEF+Bjcvc+LaUUQBe4do+yCFHWUH33m3PT4lM8lrVWNCZmQkPeefSXVIww6VyjzY0pZhl6ObIGrllHalR91lPV2XH/TnhkINw6zSIfQwdQ46lL6Pg45hKYagV3LQYdsp/eX154jetfVPtH13arG8hqsX87SeO/q2vvE+Er+T7zUi9wroTzuudHd0NHTPDS/PFp5FngyTWxjBjjegJyfemF+8zTKnthL5hX46Q54zbDYGdxg5W2ZDkBPH3k6YU+QcdfrhHSgfWtek2q3oWhw05PScv2A06LxDMvkTXWWXdwirrNi4jrOcsIvZ7jEH6wb0tnxnKPSIuverPPQiFjqokzE9BqEbo9y7MdAXrXRAh8dGhYKpvvZEn7+q3nQCaRm0/MZRqPp6HL1Alt3q+6ZHnj6+/NPLww2/7G5oKJt4NPu6oEZRnfENljk2heHXOEzXkl2dS7cXF8+AOSfyFfaCRdEGbzy4eddOYzhwpcYrHLhZYz0+nHwmqMvldrHhJgppDBIdSqTkXrQaIm6+Uq1Ul+oMdnSdyQierkHfqv6C4rDSWebT2MdHoAcIdGAnFoPQVYAeFnoUdJKW5KAXoP8LTrAnZZC+PlNVLdp++7CnqM2GrSAom+nrmx1+ivzG5ZGOjo6yhtnHs8tlZ/OVGUK0bYHhVBwCfdeR3WA+yUIHbP6m6MGcu2DgPQrkPHNARy4uQjx+M3NApxYP6nWlaFIuuXn+2cnsbLUdvJU6Jc5uwiYnKxZYyd2lsyquoXbGcTFUMMJBvw7o09MxDv2rYehiKJ1KfVulY8HFhPPLEbDXIymDiXoffDpc+rgJh3KNNY7X99UPP33+z1/8qJlAbxiZGJ4I4ez8jK8T5gksdFbwu11r85OLVOhnCGVKGl+CMpU5xR2W+ShBzs7UqM7TeI2z1EUEuEAA3nhYE+FbWGzP3HPNmy52NJ+/6cN6LukpVue9hio5u70OSy6eOgz0Q7psDOqM2zYYauWgT1+/On01Ah3Ew9SFgH4kOeagE+Il0UrHQ5X+krp3J5Re5fNXBU5gq7i/8YTJV+VHaxit7yf62sY7rU+RwP7a5UdE6feG50Zw7HI6SzohgVDfm0CYJ66tTt6eXCRkAZtiB3B8DPOOcu+juLjZOWXOQ4esI8wpcMoc0DHoixJS91n3ifXN53t8qmyl3FOao65EwXulDB5eBpkru9SHrdLsYHZF0GLLL259eZ1Avz59HdRZ0xPo1DCmU+hYJ2qPhWpYHnoJrjD070cpnUJv0DL33VqkXcewinoH56SZMKgjqkNurrEWjQVbofSXf//Fj2bLOhomHt+bLQZzIYucpU51vm9t9QGcO2XLIY5CDtrsRYHDFtjaeN6304WWgyx03JQ6XuwnfBSRAE9A0jTe0qSq5vN9JpVCaZB5h9BiRmhVeioPI/de19XVhUIa1MpWmCqKnaFXI29YpZMeDHMUekG9Rbgv5qFz1AH9zmalP+0eOZrrrg30nNBqMZLX+rC2hiPynI1VmMX5bvru1L9qbb3y+ct//uLyrYbW168nJooQw6XvAW9qaWnowrZnt2tochI652yFvnDzwNkXCxyvBVxg/i8wp1UzlHl8FHT2I/cJqmejeAHm656S2uZjVTbV6WwZZufqIdmQvRQvbGVFN/hrcoztnmDQ4vbbiguGidKv/miOGKhfnx4n0PcnU+Ohx4x7Px5WOgzYeegwCv0NoIeKc1VtNl8jdqzhMB1ysLVe60foDrljwv5haKR1ePjFyxcvLz/OXZ57OteqyMMpdxHi8Mtkvpbowbbk0VGCl+cebZA4NI43QQ7PHtF5HPHtlDoM1Lcz6uLBHXM3kSbT+n7zmENbIZUoZZWVpej2Lvd41UjS2KUSnbw0W+LJPm1RMDVBJxu9//1Hl+fmXlLuYeiJ0dCTYwb6cQ76ZqVT46AXMW1tCOLq7/SQtZa+HnQGbqvV9jTe1NaOn6i/U9BNoL95c/XD4ennGNDzDgu/sSuFZY6lT6h01649iR/PU+ijOxLHbwE3JY5rYeHfq1NvidBJUSSM6pxC57nzWqfQWbmLNAn7fjfWI3X6FWoZjnzGYQ9dlV40nUHxs/0aFthLPWbzABpS1dhsBSMU+j1iLHUWenIMQz8u7Q3KW0qIEehGQO+Jgo5NJCNH81WmRtRO+H0n9Jihm3xatPbDwdmN+FYtvHv38BVAf361avrW8uNCxWHh16FwztrjE4hz/y3LHMhHtyM+CuDEIl+OEuYPSe0sCt/DYRyYt8O3c4yjfDv5knsIdZGm5JlTEcpVqHHUng6Fz+ohLK0StXu61KXQutxzrquOYfy5Nd0E+tWrc4Q4hV7k3jimiyn05NiBbiTQvRA6D/07m6AjDRs0OWtNqCfBMN7nqDI1+u472qr0fVotdjW+KgPzK2/+/Oenc7fmnt8ryMeAvjcCnWg0YRcG9CUWOmwjag44fa+sf3ODra8szHTS+ngCHS6eJmZ4hfMW+Zr+QriLMuuYmpGibLVars64Zldjf7Lcji6hXszTZWrsVM9WdJ3O1uMci9Y3BPrlexOs1jnoyWHjoe+OGehblW7YBH24eyQXTddxok1Pm+1+G04tQ/ZVr72vuqCvH9ffqXpV0N3NQn9+7/LjW7P5eWCOShZe6fDyuz+eX3qwMMky5y8YETglDuBbbWVpCtAJdTh3GIQOi1J6FHX+C3h4l6U4VJQtg3+Xl6NN5DXDb7Gd0YNSaLT8lmLrKpqDM7agrz9ElX5veWJ5AnYvGnoODz0udqFvo/SabKPNTc5WCJhwjA7j0OO4NL0Jndh9H9b6Qq2h7ksE+ovr92YncvMOA3paWph6PHlSdrlm5h8AejR1sIZRjX9zJ1s/c/ct3ewA106g89ijBb/hK5q6SUm1WF4VKJRZMqU8w1sp1VXKdTKZXefFOQ9dSMOfRh2FVcUU5xe8fPk5C335FqgTy3UbOeiJyTEIXbcBesm2Y/owoneTCbWjvlptmy3Qi+MPGZO2F3EcyiP7fDcRxl365ZU///nP/7w+PFeVLRfuTQV0nDEf8e8J792YD0Pn7Qz3oiLf2Q6sAzuQwzbE7lGYOc/OUydK10jMr3yK7Kws5GS9MqvZbEdyju3zj7M86rDpJdtiVAz4QsP3oPTrVydugTrLvIeHnoiLQE9OTIwV6BB3ySal9/5kM/QrraGjftOAyVZvw2lo9T631jZgszlxVF79ibbzvvrWke4OFvp17GwpPizcm5JJVK6Jp0b4H3k4D/cO6hz2Mzx7DvmOUkf7kvWlziY4eHj4NEg9yr2/s5OBepLRzSjUhzPUWXLx756ZrQYdDnlAxRx6B5aqUSXXZWakDFNUdY9V+j/RBmkZDwcdGscN2hz0I7ECvYSHTifqtX1blT5SbNE7TTdx8qKp9ompt5a5D1+PmXvVuPvnWt/ISMenVOnDcwWK9K8DchpXvSbCG+79yNTdpaUHoL4wubAwutG+CPkB9oV7vikuPp5IHbPwnaboAkqbvfGINLI6RqGQy/eLs3Ke/dwKhcs9cO3WLvtvsW0ZTYLN1iC6ipExHdmZW49v4SbWkzsA6CzxmIP+5a+CNA8dRqF/Z4vSiyuMplpHQGvDMZh6JqBV6XuZJ3psbnH//PfavtZPO3756M2Ll633XtUcTqfjODWqdEzZ3rtxl4UO5rDRCPgVAvULsOOC3L955m0cZn9k/XRTMMcZ9ykyeUc2ttRcYTmc8Y39yTmfnZdKpUrM0NVqjOk69W+VWF3tMuJUiLyC5W2gJwE4jeM46ImxA50b010sdB2gG76/AfrwmxfDZMrGOBHB3dTa7pvatMwzRvsES9HaPpX22/f9/UcbOi4B+j8LxvvzMjCcU9K8paUk7DpyYxWj+hKIT07y1HnmX8gdPn4qno3h+ZQrNQ51BD59MAxoMsVWi9UgT98vPo4qGjkSc15k3a+RkZ0c9+CxWizZzv6Rey9fADq6X80+ftz3k8c8dAp+X8xBp0qnzEGdg87u5KPQr3SHjipUKhs2fgUcWkTtNhxi7uiVOLVOR9X5ZwbF0Y5Ll15/vpw721eRkZ7C1yVzH9iZuguxHPXwYA7o5FkhQP836MTWZ8gGxki4til63wwdWTuBJtPOWHUZwm+ImfM3UQOLZu/pLV6hVe69lm4/nO21m+sqLNVFyxT6LGvvzz7GmB6GznLfd83FQm+KNegU+Q5KHzxqxoFYUnKuNfbxu/VQecDtZNpUgcYL543VZz/tvoTGNPnjTHV6ekqaiBhJn/H007DU1kTGdc7Hj06C+fp2fLeFDjt06tChQw8T8Hdtl3zlDT8T/AeRJgtH9AnR2vevF55U6uR2NID2IoaTeWUtXrJRXYp+4XoSyL0B9DDz99/noYM1ovcYhD4A6K4SahHoAB5RehmmbIzb19amrXfWNra5TW0m7U10bNSr/I3N5+uyPzh6qfvecHGopyIdaZk0KnFa2MRBx4rbe00I4Ql2OqovLK5vZXxgR50fOgDop07NpLXjr6aj+RdBx8KLSJNaakYFjzjnswttRrVMl6G241APVMqRU12sqKdQ4ijf0PIbQL/++MPZ2Q9na2tn3+/xs9BZ/w5jobtcsQRdwkKn1InS3zeEO0ZSpb94MYwpm1KK85OkjErvU9UGAm6HifGh8brD33jz/P3svA86hpdbFRP1kvTMvSkUczR0eGUEc66p1SVY2MWvb6W7kfk6fUCcNRBHi4NT61NwHjSQ26J0SpqHfhADv0ijtsoB/SRaEFWqsX3RnpWFlmKkaE6p1skkdkudKq9o+Trr3j/EyWQfErsTgZ4Yq9B7WeiUuk5Vvw30wfyg6femQK+t16l1B9x9JpO/zdQ7ng/oYxcunP7gg8JHs8VF0z52RIfBvbMlqmH8NDGHPsqUOh3Yz+wwO1snu9H5HB2Ffgj2re9+91uH1tc7kXx/Zyf3zk/d6ZiOubqwLgvQ2y78gDGWqOUyL+I30obESzpD29UeedBpCi2//PyfROlgPlL//wE9rHRXGHot3HsU9O7uUL4Uxyc8Y2w+nxtZGSB3u/1aP3p46cfGLzjz8349W6aYnXCkQuciQAFzaqBPdU6DuV2uh6vzVOqfbDs/Z4nDyGt1dQUzNdxgDuTfAvQvfevU+kpT/KaM3LtbobO/C6nHixDKecXCkmcXLgQqdWj7TsSuQwtROza1WVEKbbSoavoJ9JdXZ0dgOECdha7bAJ0EcomQRUxBP0nHdA56VCDXDehloXyzxNQbCDAmE+NgAuRETBLO1eQ6sMthbFyRV9h3tHg6pEjPBGTRQQKd5ku5iO4gm6JB+fsaqJOBfRQK3ibfCuSEN7uUjlXVpQPrIB5hDqnDwT9Ii98EPYo6Dx2LsIJ4TWq5R5z0hx+M9QSkMolM3eLJyvDK1XZsbFN3Ce0Gi5WBewf0e1efngidODFyAgboKiEJ4RJjF7qZQHfRnJyxHoEcXzkzh/KnbiRnVHVOv4kZt6Eq1tRWj9pnf+2T4tzCXF9P68TY4Af9rz4YmdArU1NELBBRVA6FOnmIHYVyR9amWOggvNW5rwA5B32VbTy2Sn07kIepf+lLZFgXxB98R0Bp72iAjj8kQChnlYl7jl2wmSVSiUSeRRoOddlbyOwNHaKzzfK6YD0CuRdvrj8drqoKnagCeg46sFPoibEMvaQEY3oU9G5AL+vPz1ZJsNvb53f0OpCLNQWcmLDXoLWP707RyPT42Vf9ZydGzOLUTMicYKbUKXLcB7loDtQ7p+ZXl85sETluWjmxgTmoj/IyJ8hZ+2RXPPKtCNM4me8MXfQO8e8ex9jYmOqkBOXQcm9LSxdmbuXX5GqUwkuDQ2ajMBdKf4EKoRDqfYnaQ2HoybEM/SM+kAP02mjoz59fKgvVSK02p4HRuvU4QwUl0Cq/3uREy22Hrza3bGKs7NXZ/rkyS3qqJj4MPWqnGR/CQ+vJazPzEPr61vEcxDmb72xvYltF3ggLfQPz9fUb7SKg5qHvYPDuGF40GvGQtrm5x8BIJVK1Ml3WohN6vepyWY6SNCWxeBimP6z0Kmqhqj5O6ckR6OUxBN1Flb4j9HvDBHp/jdnqDtx3m3AUnl+PA+xqtc4njmJHhcNnK86dnQ4NVr+6k6vLBHRSlQj/zu8qhNRpCA/mtECy8+7odkFcmDmWYDCSn7lBmKfFxS2ewuwcwDnov4HSF0jMAKlz4fu2Bv+PcjkCXWOtHWuukjASiRpKRz8xsrqaZS21o3oGhzBKWOgI3wF9kGIHdCmrdGriocRMV6xB30HpMEB/9OhS2WC20mDBseV6x4BqwI1+Pn6fqdHhcFRUMMHi4ta5wcLq+4MVWZoUEQcdOuONcgd0KnXXDQTlW4XOIl8C8lOI3Q6sTEHnaaK4KTAHdRBnkRNb+eSt6L+k5AT81gdKPbOkvrnHobDi2PSsrBy5B8O5t0XulXt1EmxvGpIail4D+ovrw8DdiKeVg85id3HQYTECPeLeYdspfYJA7xhUWIbcJgfWU/16pgbb2nB8ynjAUWE0MudqasqWB/OO3ld0CQE9LD8RhcF/QWdutFxu992tzDGi06T8KWTeyHVg5S2R+q64A6eIAfopDvonn8zHxyOO+yL3Duh4Y2vbHu14o0phlchk6hzdnyR2JWZu2OqEHhU40gVlsVUs9JfDrY3UeOj8mO5C2NPUFKvQnRHoPyXQUfL4SxLI6eqMz5hevXPA9IRxBrS9vgt6R4WqgqnIr2mdzT0MB1+eqiEZ0oN0fh7GEVY6Hh762sr6TkKfXzkAZX8LD1ldIcsrcZOEOYjDWOKwxcUmEeLEnaELIhvbEPBhgdXkNqoUdRJZ+X7hRz+3GtF0Ro2V9SyPBwc4YdbW//rN6+efvxxuDNtg7xboqS6sQ7piBPrGMR03oGujoT+98isoPT/byjxROfQqJGQYf8Dk8zee11fUqCr6KxTFoUf51b01GftT4gkKCn1DhTK+RaDTegpAPzKDjMv20FdvrB86hbAN2NcPLLQT6nHzQM67dkAnNiNCcM4B3wk6+acJ9JTMj20EujRnPzz1eSO2PmRkoUcJdjPjqAer53Dx6+XPn37+srXAF1Z6bcAtEbK8w7n3xKTYgi7hoBPkFHpPlNIvlXUM1pR6gmaGuW9ytuHk8gFnbb3vgrZGIa0ZLM6uGAlV1/QeTt2LVNy2Fg7jufi9c7PQD5BnfWlp9UZT0zrJsX+XLKitj7a/G4e5/eqGwZwix77X0bSDBOgXMGfdzjtpuzT7hqTGfKdEhpOenp2Xlsqy0KxCVmon2xm7hHWWwdcvnqPLJaDDCHgWOmUeUfpaSUmsjOk8dGI8dH5M7/4loJ9TGszm+3qfPmBiGJvD5/Nrm8cVNfk1odz8mleDhxlruoYmyraULLIfKHQRG8DPrB/ix3RuOeWb66tsrfMoeEPnJJZbIk2+ExKWeJVzzAG9811E719gBwEdLj4+TZNUJ7XkD0jk4iTrZ59JK7HqQjavZsg8Xvu1j6VCx/Pl18NPAV3PQvc11lqo0onx7n0tRpTuou5dHFY6bukW6B0dULrSHrSZgowtwDABG8No9VVjx7TZivz+vprivsLqay2ZGlFUyVp0VQsrOyr1I7cRm3P5GGqnyGuKPcPhxjqoEzu13sluk2j6De/Xw8xxFu/kXWR/NkhbEI2bjyfITH1XaqrV6PDdN4iFkj+hgOZ4jn1/ixdZGruMFErqdPrXr58PP10GdL3eR8C7HWHo5MmBewf046DeFAO7Vr/8FQr9Y3ELlfp20MvQZmCwWmkdMFt8cO2BgYDKbfP7G481jxXnKWp6RnJ/n5d9TZgiEoArj3oDdnYvMUnEs62b30LotPyJWzPFjZn5KmHenobpHAI3SL0TBXGorpsJA6cRHJBT6AtxJHjgoQvwEOOhU+8C6JqE3Zn2k/qeXoNYPHAe0HPsLfYsmR3LbXJM3K2VQf/s6+fdVwh0ajx0ahT68RiFXrIZ+uWJ7rKGhoL+08o6KB1Layatyo2CijasqTaP1edn54WmB19VW6ypaSS04qUehR0PgS5Ig6tNwMQb1CPIqZEMDPasEcxvl9YRui8Q5rjibgN3xBYp89uTt0ffsv8YBx0WBZ3/uQN0DSZcttoLAaXYeOEHF/4K6MIWj7Aly4sx3e71yoymR8+fl115XVak1/tZ6lHQczjox2MHuoS69y1Kx/MjQG/taPj0IpIzEmx2sARgvl4n1tkc+p/9dGwcXdwLJ16FqhldZryABO7s5JiDwYOnxkbvorsgzOOGfYsM47hmoHT2sI4mHOGRhg+4RQ+p0HnkYI7i+dsLN+jsYAfoNJg72M72l9MkJomd4z3oTuA+duyYG1G4q2W/HbizvCVKD9rBKx69ftTa/bqgyA8z+3noyZExPSkGoVPk6q3uHdA/7bgIpQ/VBWxBk9Z532fTO216v/+Hl8ea0R0we3b2Yp5VmSkCdNaXIyOyeWshRU+WVwH9QTR0uoDGlkLdIHO0dgwCuOPb38UjakLAHo18FMxhCzMb9znwwHkDctJrENQzk99LwgKh1KC62XzsGFOSuM/V0pIl9LZ4cNS2UGaVMCNXHpV1zxLoAcJd7zZuDuSSSmILuiECnXwl1dZz0FEiB6U3fAqld+nsEifjdPpVjApr6r2OgP97l5vHqmqUeY8eVVR7MjQiFiwdXvliBrx46AjeRe0Jiyxrnjk1MoyvPIS+2b6PaCBCGguImhbpYA4jwGFh6JjSCxDI7QydjCd/+cc/2EaymveOZFqe+BUG84VjzRcCyKt6xZ4Wb6mwpYQc0pgjrxgZuVLWOluQ6zcH/GZQ/7+CXgLotmjoBQ2Fn17sP2zQBd0BBYMyigB+taBkprb5cvP7GNTh3WWI3QELdFm3SiFHG/sdUE957zenYBQ4Z9/FIhqwf3MJSochPCApfNS93F1Z2SBy2CRrpPJmHn9ke+g0bgRzHM2NjtEY01PeS5U90dcYtOePHRs3lriSk0qSWuzlnpYcNeqArcqK0PBIRxmgB8yBAMYwrLG5pemboFdWxg50Vxh6Irw7vtoOesPFfku2tU7KaHsHmF5GpTXZLH7/ibHmy3OqvLzZUHVWskaEyRE3xkay4lvmcIB+5EskzwrjmEdW0E7dxe/Hi9oFAiTWofR3ofdOuHcuZOeYAzqoz7fvBJ0stRPmOH77b3+h0L+emXO/sUbSBugnKktySgCyXLjfjno56B2HdYXQK7SVhW4JWADeyUM3xCZ0yYCFQodtq/TCi/3Z2ToUUfiljEWFDhR6qcWfWzXXfPlykeLs7GB11h6NgKcL6Lzaw58j0BOOQOeAzhkFTlZTDt2FzDGckyteAOBkkh3/cBHMo5A/ILa0NB+3DXQBB50y/+Mf/9LOQt+bKR4I1ahuHjt2M/AR3PtuF0Z1b7pX7PWWenLkqlCou4FVugVGoEsj0HNiEXqJi4Oudsl4pbPGKb3wolJpdFsseosteNKvcvjMqoC/6kM0UZ3NPjrRX52VCuj8DmLuiYriw/49oQnIyarZKV7juKDz23EiUbsIyEGefURE6wkPOOK3WeKTFDmgNwm2QCcvGk+0E+awfx2MB/WUXanCulc1jWPHflDr/1hWklye2iL0QOji0nSZ16OzhFq7O8pwUI2FNQJ9QMqP6S4CHa3wK2MGOjjzSo+GDqmHlX6uQjlkcZq0AwGn29HL3Fc5/I6q9x+jc25x8URD9f7MFEFkL+kXQodFaPO20qlpjxfEx4maZhYWRxem4OjBXJTSxE7ScPEqZ5kDuiAKOmdsEPcvMGehs95DsyszyXzH8RMidKcEU7Yj5TjhKQtJWG9ppUytCw62tjaUjRQ5tkDn3ftxnFAaM9ChdDKm4+dZtq3SiwC9cPC0XOc02wJGldHsD5hVKosjoJ8umLg8PVI8UVj9jZS07aHjxVsU9FPRyH9zal6TJiAx3EMc+bCysriy8BbVjyIAe7gY5dkpcdgm6HhHoFPfTuwf7Qcx/SPQjT2t0z+4UKVyS0oSXUeOiD1ZXozqOsi9UqjqL2tt6HiEE76MRg46onfOu7s46MdjBbpLZghDh9oJdNMGpVPoDblBpbouKNXqGZvZHbAZ3VKjxaG/eaJ1bnqude4soMdv2jXKsscryljoRzB8A/dG4LhWVjrh2YF4Bsxh6wjZb4gOIouatgsiZ4lvZL46v7oZOozz7wjcOegHWegJqUmSm7PNzW1Sk60Ew/mRr+8TCof2l4rlWeXYu2wZLEAOCko3EgtDT+KjdwodFiPQEyPQE/Gw0E9shl7Y0H+6S2ZxIikTZBgTg6OqjdjKPz5ddGJ6+vHEB4e/noZiY1yboG8tVBShPcFvsDwexRz2pU8m00SwhM4VPuU6+vYdQRoiurt8/EaJE+ird+PIIB4Nnft3NkMXpSRlGm7eah53SGv9rHtPbhHbsb1JXefNcgl1wf6isoYOCt0C6EYW+j7q3mMSeqIBY3o5B71EatJGoncO+sWgQlbJMBYDo7AAt0FlVFU4HHea33d8ODc9mycHdBQhoiItKhuzBTq+labZBei8xDn75K5IQM5bWlgkuOnKyugq/lbEdJ2jUYM5RX73brsAth1zDDT/ikAHc1hCaqZhfGLMZ2jsNRxvaSlPRmLW6xWWy3NarNjZVj3YUNZQNJJbbGQtCjrv3mFvYwo6VbqLh/7TiNILf11YGJTKhywGJ2PDPN3iZIIs9NpjzQVFE9MjeYf3xrN4RAJuSRN3NHRKBZHZroTFTcA/YXPrN0RkQSwuDPz2IrGFOAHmbqKmhQWKnJc5gR7Pk46C/m4UdPb4bQ2gy3vGq/INvc6cyvI1l0uc2pKVPlRu9Zbv91baLYMNBYUFLHQVi51Cj2H3HoYOo9E7hU6Ng850KeUWE2O2WBhLkFFJVcYKhwrF5D92DAN6BqCjBy+Xid26h5hPmqCgYZKviQDtz5BnBXfUt6bhR6IJvIH9Nl1KG30rIFP1XZR5NPKZGcH/CJ0GcqnytnpFtr6NEa+BeWJSoqu8HGpXe7JKk2TZgN7QMJJLiFPokgj0HA76RyR8jyXoQlbp20H/PqA3FJ6rllvNAyqzGcGtQo83oDt8Y8eav++YGMkT7k1DzhSOOMKc2lbm6AKjmd8gcSAHdtjiGiZogL5CaiTIhXt09K1IgNivfWGDzFc55lMCmvQF8S+CLhIR6L25yvw7poDYS6CnirHFbb8d/aH3e1x2c39uWUNBiECn3OskWwO5jz76KEagJ0agU+oyl4SHDmOhH71Y0SX3Ws3O4H3V7xmM7dLTUhWq3qebm5txUF9eOqmOA3RW6SSOosS3hS5KmOIWS/ECctxkAO9ka9TjR0e5VAyEPooAHU4/bmkLctgNQVjjEeg89mjoxL0nZQp7FYfd2oBR3Anoa8lJruQ937DKPeUt+0sI9IKGIkBX6VQwAt0dhp7DQ4fFIHQZUTqgb0zO3KJj+mmdDnWRUpXUaLQxQbwtFSrVT6abkZMbBPQUEf6vgY3Cpgvr29hBYE1xfYmIPCLxz3CFx3QgnlmBxinzydFVfAs/J03bMX/4lp+ab1lW3Qg9hUDPTEIe1hB0WiQf71lbWyvZnZS0r9xevj+nZT/SsRnqi3DvhcS96zilu6WxrPREFjqid1gUdPIQ6MW//nXhOYWyrg5FFDbGHXRW2CqkUvj34qpbaKO6PFidvlejAW8onAZyO0N/hxQvgTFnn3FLposzCAPJoD5KicMWH3SSCUF8WucW5GD+MI7Nte8MPZyRiwN05GFTU/YPFLsr5OqSPR+vrSF8T0ry7vHaZZXlZLt68FxuQWFRyEGhR5TOj+lDMaZ0Hjqe7ZReDKWfkyqlQbORcRvrFGZGlW00VqgcKkfR8PDzCSidQhftQp0chL6T0hG8E+iaVbpYGq59ora4gJw7/oDo7YNJWhkzuXQDyAn1u0uUOJDDKPKHUwDNe/edoTcl7ILSU5P2CgecFUq58Lj4OKS+WywUJ5Yn78fp2hC82n6uEDPTUHGNVCdVwXjoMBZ6DoF+Mnag5xjQEpObkSbKKHRuzsZBz1AaDGYFYzbiBDuzuQtTNlh+TU1hw2woG5tVNWCu8SYTTNjlEq6h2UIdPwtIlKzROdltHjnEvYjA7KDgIJLvM6Tx1OToTJMIwwGiu04g30QczN9S6Nyb/4IdX/7Bufe3f0hCZyJATxUPmOT7hOLj4kpA35NanuVt2dfSIkM2tjxDfi63oaEh5KhBe0EdOk6x0Pk0LFX6yZMxBD0R0JO4ajBAZyLunSr96NHCQvRaw24HY76ny2IMGpVSqUXFQj979tevnHnpqah/xsBp1WnI5mBW6aC+DXNE1gilHxBp0xA9Av32gziRAH+gHfPyG1NTnU1I1gA60rAzQL6F+RTx7pvGdC47hMM3CXSC/cbaNXEaWkwlpQN6MOm9PeLjOZ2da2upe4Qul9denpUlRIGkvfRcbkTpwM5Dh/HQYbEC3ZVDoCcnh5XuikCnSifQL9acy1aWooji9wNm88nPeg3G05YKYgoWen4GlK6J1yS5zZr4rdA3fMJnUtQwFaFNif+JeHSM6mzrCCRNiQlwkzoK0VR4Ys47dmKdNAVLsUd/QjiJ9RYq9c6Pf5+TgHn63qRU+YBZuDtJXJLzUefavtQc+Z+GUAKsVteRmZs9WEiVTqBD6SpAp6tsOZExvRLMPbECnSo9GRatdOLgf0ShQ+j/Ie9cg5rarjhep8/p41u/tRbkBJp4DuQkIWdiTnraHE6oNrElIclFQJqkhbYEsGkAEzCiVkBRrBm8WHDkIaKoUEcRx6IXa1u9auE6DrUXi06pTn20c+ujj2mndqb/fZIAKdjHx6YrIV7wygz88l977bXWXluEe/cExSKtuvDBA3WLqG0KB4N9kY6OjuFnJqPGQkxxeIsBhZf44JGkvsjFjUyrlU4IG5jxXGS//OHBz8jjQvCA4QXuHpHdvMhhsshl273y80ugk/Q/XuahA/tB37TbgLeRRqXgH3p4BSXVbTpy+aBCYdt3b9+q3HZzO2PEYHBxMXTyIUPPnXfvNgK9PgWhJ7t3Weoy9GICvUeLmXstYnlT/r68wyfy3dqupp6wd7CkoyMy0GsyAzruxGKmNrNyVi7GfKnSgQPckWF/O478PfnjPdTPSBHtVyvITh2049DJ64p3kpmDN7HLn8Zqv2zenXyOaroMHd79/iEtrYxDL2IY9pi1ov7tTVkK6k8Piir8TeZGOHez5O9BowigaxMWU3oS9KMpBT3h3jOXhX4X0M95exyOptKm/pYajBvafOKAgENOwXBJcW8kEhmYEnUaJcI3Az8xzFtWgziech5+2YOF5PTBbsCWef88YfgvUH8l79XBkxhWis/sfmeJZ79MnsjazFNfHjoM0I9+6yt5CkBPz1Dw02GKwcVsbf4nuQpF3dDhItsqhbmykZxvWoCujit9wb0Ty0056PNKz3wddARyQd6tbTKZPHmleTuuPlA7rKGgt6B5YjISqZqwSzSgKw3uuUcugwXME9CXRHPgg0ZoUH8Hyv4n+9VPfvXzX727Ak21MnHYyhU//e3bi8K3mMYvX/7p5YMrCfSle7WVsWvZ/pCAfnDfVya8FIGuUrinTbx6WqstrajIysq+MVR7xBZolDieoShWlKEPxJUO6Euidxug5+enHvRMEsgtgT4J6JFgT9TttxZ5ymubinbuPDxUw+mEoLekZPDaXEnxhEtilQBJi3OPCyhDfPzIyqXQE1tqRGoHibD/hBd8YJQgcBPDH799d3cOVnU8c179FLzxmI/Y49BhpBCTsKQYTn5iSY9Bv3yw9db1MGWwWNIVCvWs6D5Q48grqsjNyq6492DdEb6RqeT97e1+s9/jbfbKSq8gUl8eui8/35dq0OPYde6FLVsCujfYIwhdfl+LB5UWTAbFtG9BiAa9zc1zb81V3XHpVErkXBTuFy+6HYbVxLsnlJ6s8wQjtLz+FqhjsPEas1/gIadh3gbfd4nEl6gcyOWXN1fG0wCLoMNiX/r0m3//exx6267fxaBnKFjrJfdWrEtFRbrc7Nwbx6drS9lMg5lthH/XdSGQ8xKlq2FSAnounN/Clu2ILwWVvgR6QukdROkmSbJ6BJOv1LQzb8fs8XHK4Qoi4q269dbc9QK7Xqkk0OdezJhoCznTtloOvpOZJ/QoL+u7ZXHH6qV4JgzI5VaoOPFk5HE7eHn3pxegJ72fCPc4dIL94M67f71rohBmKhSMZ3brtDYkFJWuYhR1x4dqavLZQGPAbGQDDM/3RE56SwYBvQLUlyg9Ad2XgkqHEehbFin9LKC7OoLEvVvrhZb+pnytp7B63dC9OkGCfy/znpq79agvZFTmWCys8PjF02bOsHoeejLyBTaou+RcJrJOJk5ox2wJ8cuL7RXZreGZMJCGza/pnyfQYX852Nb61xe73NlpqLdQVP70Vg/lQOurjWHeO35oXW0+z+AYIw6pM/X1cO8lJX0LSvehtEolmON1AfoH3/e/boug7ybIY9A3L7RLEejYi6MD2iG4mzyiKSqW7qjeefX4A14MBksKwq7uu8+HHQFljhLQH7143C2yFiRgiGMH9KUWEySZP/P2bxdYJ1LrN96J8X6dyKFyPD5PGEPrCyqfh44noCOQI3Zw597fvdgrZCOFwFBc7VYTxzvarVYm+8nxoXXbt5ajKZIxUmZzgNV5MPG0hLh3SVa6OgE9sWUbJ9B9vicHUwJ6pgzds0jp6qXQ4d5FwTfuUfswPLcUB0A2Dw01CVpI3SV6i4fnQmZNjtLACqMvHo95WcNrmyjwhUR6HD2QSK9C2jfwiKsbz+SFPBn5QRhh/iZ8SIzxMtBhBDqh/urPhXdfvmjlsywWQybreNiCSF0fsFZkr7o3dGjv9q21PNO4qdHMVNKVlT1Qujexpi+Cnpmy0G3/Avq1GPQuh2DV1t8oLX9o7/FUV++cHrrnFoPeoAnz/ZtvufiMnM8A+v4XN58WO2jIOJl6MnRCfSVOG6W9Izc43sADthh4Ury+IHFAx3+sIEVcIulEHiCZORwMoMNevWo79eLl4x1MBoFOCdNanmLMUuMmxY21D9Z9Z+vWfoEJGCV/wFgpVQZLSrwlA16TWqeWrSne956ZGYOO6N3/5MmTVIGemYCem7ymy8wBfRjQXT1dlY7K+npe67EDumdndevFoWlIPWiyN3SUTJx0ALqSFUtevLw5amI/Q5gvP4A/Dh2+GRu3FW/HMy+xFzwWnHpigzaPnBhRe6zxObGoLzOJ4POATqjv/vO+X798+VSblY7GDSNvmhYclILHkg6hf2drb2/vYYFSUAxLBYyMuycM956ALqm1y0L3pRB02/LQYQnoHT1R0dpo9bub8j2moKcatn3j8Vp31BUVpYbI1IDDmIYim9v1+OXNpyWcEr2xy0Nf5N9REwP1GO24JXt1mMw74dhj1MEcJkMnck9mLh9uIdBBfffuttbHuOfZTaCnqzjPYZ6jcpkKdS6iuF29vVNT02q2Ud/eGMBZ9dKgd7HS3fPQwTwFoa9aDB1PuPfCdRgeGGd+4dpwGXHvRWqbTtIdszZ1aT2ePPj3nVeHhmoQ1kUbOiLPnnFmlUVp4F2PXt583G2nMQkWu3W5ZpbUAp08OQInH1b89J13Y6jll2XWcTwX7PKrRLvMskNHSAKWMIfhmv1N1b9+/PJxsZiFom+GyrFhO+fgGJva9qfjJ7YC+aFDB4BV3xgINLISoveyOHTdYvdOVDAfvT95siFFoMfdO7sU+jcAHffID5c1dIRdXRJT0VTJWwVRTdrjcJKtZgjBnEnrckU6Bp+FOKPBYOAj3fDvCOWUqJ/Guqdea4QTaXS9PM864dUXmMv6TmL+Jqqti7SdxDwOHSZDd6qLn968+bRMyEAPRZqe27qFd+gxO/Dh2hMHeqcA/dK0Gjd30QqGMjtEuHcZug7QdXHo8cv4FqBvSBWlJ0HHJ8lKB/RBQHdFozpdndRlfVhvzfOQUnpe9c7ZExuHNrhFU6RjYMpFmRUGAxXuBPTzJJQjyXfizf8ldXlE86tF7jxJ48lG+L8iwJfoPCn1jmQgDkEC+opM7SkI/ZSXz0BZQGHkD1RzFJj3bxy6+h2i80uXZtW8rPQACoieYJLSl0LPVBxJsUCuxkPFoUPpOgJ9D5CDOYF+sqHB5YryrNlv7VJrofQ8Dx7oen9wYmhoi1Z0lUSmCjhjhoGmTWWPXtw8f8rFytCX9kD/c3EECXRSVYElZWCSJJ74DxK2I2CXsS/PPDFBjEBfkeEu+DVyRVWiOX0lut557UMBOza+f2jj0Le+9ZWJS5euXb2kZkkvLMrpDrXHuzz03Hmlpyb0mAVk6F/fE2f+Vgy6qUuw1fn82voitbYUnVKgnle9YfbEnqFarckVGS6nKKdGQztOdj6+eXOsmUidnHx4LfSFngqi9t1YuRMGuMvaKzRTIdsjL+nLQ49XeKBrcmlIrnb/08ePzxQLmWRipILL9wkUU/GnoaGLvVMTE1++c+0arhuiFPpMfSXbyJUGTQUli6BrUx56Zu4ipQfMMehku3bhrQtv3drf19AQdXUJ7biC2l9aSmqr8O9aNArnFX5l24mhS9X2cEGvg3WmGwxscPAM1tGqBhZXpy9Af72XB3QZ3opXiaBteduNw4oJnf/zgr5k7EEOoGfbEMbh5kivAO++QsnwtQLLHHkwNHS19ysTE3fuXAP0WRE/tVFvZCt1vnAQa/pgAroW0Gv/j6Bnmt2APnUWyKHzt34Xgy52YUHsslp9vjyTp9RTBOSkVXjn14dODF3sE13PPKzeSRto0+DomZs/PnPOkYCO57+ADumiFV6uw775Khnznw++wgNPfOx+8zMJxPgzaYuezB2ixpF2wpwSix89HTsN745iulNJV5dznO/e0NDXvoMb8W8RnV+7eEDgFDjA6jdzXV3oCEGVDdBhYD6v9MxUhZ7L1JAtW1YMu9kmQwdzAv3WXFWf3e6KdgmV5kqfo8jkNnk8OA0ApWvVmEHSe2LbxYu9roEajg0oLArHyZkzV86faQ7Rypz4tP945gxkljIHcmCXAzo8V/wT9wTyzyTILv7zddDRfo0r+7P5cPfY05Gq4pDRsnJFGk2V57lv/Oj4iauE+R0IHSPwLh7mjQje9XpG5/B7wie93gEvqmxA/v8AHUoH9MSezebeuc7dC+Yxoc8V95nsJrFLYOp1OMPY1GIqBfUiyJx0FlXv3I5bN69NDl8S2UC2wcCVdI9duXLldAdrWbgPNWlJX9YS3N9c8erVYuavMC12NYGazDfx+dJ5sKBOoBsYoeDUzJnObq+gsazcbTGoa6qbbvzpwdVvgXkM+vcvnqgRqMwArNFshdJxxZwM3QrT5snjR1IYeuY/Qy+qcfdeu/AWkP/udy8AXbS7TFEBoa+fHHIQCws91YCuRXECkfzOwq2txZMTl/o4fRZZ1PtGn185MxJx4OZ8udgWI/+fGKjDSDl8xR/IEHBk55OgJvVAJudoFhJ+gA7/rqLEvlPdzd1lJiMK/bsxZKhWW9lYod56/frcLTC/cPb7e/ac2McqVHp9I1dJSVFPbE3XEuTkXFOqQydKL41Bz41B3y704jfzuzu3br2Ye14G6PZolOX8uJ1UzBftLYU7dmJJl6G7izyiyzR8Z3hiysFmZBlo8eT+sfNXTp8kx9vICIjYrU3LMo5Z8tdeY8nb+9dYPHYnAyc1XLAPI8I6g7zeYElLV9BN+ZRNpwX0iblbt24R7/79i1frGEWAzqQ4VuryBb19ZE3Ps7a1FXUhZKmNQ4cR5nHo91MH+qrF0EE9r1bonbhFbG7u+WRznyiIUcnK4DbaqM/XE9xRXriTULdq1aIbx1jtYt9k98ylKKtwKgycp3Pk+fOR2x0srVmd83roy1N9LfGVScv5a6FD5YR5mkrw9DV3DnijlN5icSoVun4tw9jchb13r8/JYRygD82qFbQ+QCI5na7FA/feTA4w1iHhiKGR/drD7rj3y/y/gK4F9OtzxJ4/nxwuOCkKWNQlc6Oki5qCITHci2vZiorQMioRqVt5R9lgc8lUjcOQkUHT2pKq0afPT0cc8XvU5UHAS8Evj3aBadJfLMRwS0pq5CUZulKp1DAi2XWXhSVWA6Fn0/4mikDPfzZ5d47497PXvr9nqJ+hsvQKtNSwgmgKF5QVlA1golidB7ZjRww6LDdFocfcO5CDOYGurhWeTT4n9mhmZrCkRRRMJsHK4CaELvjBAu+hva07ZKlLap0gSLpQQV8nut/tFE2kHiwZGXvxvDnEyu4dUv/36/qC0pNlPZ96W0AcZx5/TXwhwRzQlTAFG/aWPBtw9fAKi2WFJUsxfpRSMLbSfPJjyVLHmn5pA5WbqQo0GtslnQT3XlyAo8rVHkAvxejvw9qH89ATa/r91IG+CtCbEtDln9EN6MMzMzPDo6Onuqu8gB6KCjpzQOeT6pvCfa6tl7ZvgYNHyCPptG5JJ7gGOm+fm9pAIy6y0NGGztGxFzMRTrP6TQI9Qf1fMSc2X3pNuIWEspdtu0rO0CyCDuoahdtU/HywxOuh0i1pKyxU3TijyMhk6jcMT07eRfwO9352z4FSitYb0EGB4N1f6iroKysexDxgWAuu7jkcPuymVsX9ewI6LHWgM00ehTMG3RmHjgG53fv3V1V1Nrt64N6jDoncSSuQArqr7OLUusIdMeg6m1snmvoGbkdOojxNOy0GLnIOW3XSK4cAHtRXv17q2M8tgEtGmZzJ+3fQyRslvqKDuoZyF088b27oUdNplnRM/T7mo1RZet63bnDmEaF+C9AvbnczekW7Qs+wOsHhCxdgfOBw2Y7CfYVbWjesW9ebd1gAdFiKQl/FNB1lM525cbO5a0zlz/qKyzrRNuZ1mYKi2+3WCRzm5/q66rtaggWXTnx9b+GOYJ5MXYdC28m+vnORZ0jQ6DUG2h5pvnLl8fNiJGiwabPgnJPcE4ePOKx/b0mTIJNZL/16IjUL6Dmo1a5WUnzxrbn9LlMppQB0Da0+bGNUTqqudPPgKdzVcpf49z29G1hKr8kwGv2NjVEx39U3vL97uLi4dUPr5sHtW3sBnWcCmXGToe9LFegfmIfuTEA32tzr8jYcPolQyBtxuUQxKroFnU7izJKjsktqsvcVbB8C9S07PQjm1G6dThSxqDdHTk6ZWE2ANnCuc6NjV57OlHB0zqctgC6fcpJzNf819LiMl92nL1gMOqgD+socGrehz53yhiqtNFnRDYr7+Ywi20jVF7YODA7/+tHdOaRnLtVYab3KqdK387ouv6ncNDh5anhy/35cvrh3+2TvVG/1YT6XQM9NSeiZMnTamZmVm5uVC8HbbPk7tkzjSk2Xy2UyiaJWFAGd17H1QpdDQgAf3nJx6MShdTt2IB9LoEsub19V57kOSF2B3yTtiJweuzL2fLCDNawG8xj05YpuoPV66HhdslFb+CwZPfnGJBuHKCKdZr2Tz0+ViGIlY1CudhoMdQ91lCJDz9QXbhkYHARaQn17DZWZnebMZMzkZ3Llh3ddvzs52U2gb97ee+jQ1sKtMnSseMQI9Pr792tSBnrmYugQfKatdEP1bH4wDOSuMF7Vok7QCXyjrgn79MZSX0/Z1LaNQ7PrWgs9QS0CeCkaGaiquh0pmZUQwBtoruH2KKjPdDawBqUSfVOgTYj821Jrsp6X38sv3rYlVnNAR7xIDBcoU66Z56eaXaE6OJ0cvAeY/noF4jiFVFrYCqSDg8PDM5PP8j2KLIszoz3ACpV2X3CHF/Hd3euTw5v37l3XiwaL7a01nBzlADpBP56ZXU+UfjmFoJcuQHeSjbr6QblHqzWZwsEitE24oWcbz+msoSaHTyjt8Q5eHFo79N7WDVsKkI7FAnCuamSk83ZHbS1rVGk0rCz1K09Hb4dAHRUQYAcQQl+2/w760txdEnTglg/DgzcsBy25w89PFbtCUqUCeYIVSkNpv41iFFkqf1Hhlr6+/QOwKu/eDTzlzLAYVMjAhkxBDB+5dg25qOuTu3bt3T774MHVvXvLHbYEdLyO5zIx6ClwrCkB/UgMeq4zy5mJSK5fPdvvkRNusVVbQFskV9nYFS2tbNI1NXirejce37jx6oHtrQXVeZIULbk9fPp057nItMiyTo2BbSg5M3bmytjIOYdBrraRJDy5cPk/y8QD5bJ45y3pr8lxSeTtZeirwXxwcrTYxTkqAwZU1tMNmD/BGansbH19UWFZMazsZEG4eEMhp3canFn6Sp1UL5a3ePdePIsp5hOgvvnAiaETVzdvbeEBnZgTf9gA3Zdi0H1+BHIEeq4M3Xa/6MD0EWsFYFvVgK7WAbqNr7SO292S5K+NNFdd3Lhx7cYTh76zeUc1eiNLbo+OjJy+3dFX42BV6QbEcp2jZ8C9s4OjAZ1s1xfZvyGckHYS4OWzrzHmpJ8mdku3RcH3Tc50RkIOiVz9+ia+4BvnOY7SKzbVBcuK8cA8oXB48wZeogM0Gig4PmTqCbd6D108e5aI/e7w9qtr1x6/2joVFGwx5vgAdCZ1oH/4o4ugZ8rQc7Nstiel/bP1dW06mw7QSSsJ9uO2Cl6w+sRjgs5j76ia3LZx4xtvbPsuovjqsKukc2RmBFqPPLNzCqfSgliuaub0mTOnS0TUWHMWQV+Sj12O9PzeO0nVr+vDgNLj0JUsB+ZV3gbW3I5c3JukFf9PksOBrSRVqa4uKSurKq6qKvG21pTyRooN6GlzvdSFIVkbCi/u2QPqd+7cnewd+uJX1wK6C9Dnqa+6EYd+MHWg19ezWVm5eBC1Q+lHa/LvNR1p26SLQccTt1ox9fgVCX6/9DB4smz/xTcg9Te2ff8r2wurXZG+zue4Wn/k3ECNA5EySqz2ksEzp0dReHEYcpSrc7Cekw63RXd1Je28l62uwP7575PdfOL6CAJ9Jbm4keb2P5rpLjFxTLvTYsEcYAPd5HMYHZyetVW6qwv2//ru3YlHp/bvreUpFtEdqzebha6WnsKCXdu2YcwttD6x6+rar3517aXNU6LZRlbz2O/EdiM711ebWkrf56MzsvDTJaira3c+6Pcf/fMmHS7nI+ZW6yRbha5Sior1vL+lrKxs17ahIWj9jT3f3LXD1XGyc/TpGKE+Vc4rstJl6gNVp8/cjgjZOLmO1ZZcdk7W9H+Zakt26f++miofiYbWcTRuZY5SwVfNzJxqbnBQASfK6Mo0C310nDeyer2es2rd3lPX75DGkL9e/5Y7y+lsVygCTLvUFQ0WtLZeemPbtm8T6l/+1r0vrv/q2gO7ttt1mSSyxUtM6byvNkWU/pEY9LpjceiwLCL1mp2zs/VH2io2xaHrtKDOV/qP1TvGG+s96y5ev3sJ0DcO4Vf1zc0FrpKR049/PHblDKi38FR2hoFl7cG+2wOdEdGsMqRZcgib10NP3pUtPQm15Ivzrp1MnibHGz6FU7NU66Ono1UujsrYrbRgZKlFYXtYxJOFmzNbBVPB9QvfuPDWD35w4fvr6t95+7fvZuqNZs7R1RWuDm/dBugE+8Wrl764Zv1XN+49VGiXCHQ8ZejjDN8kQ0+BS/M/8rFMGGO9QauchDqTBUP43lJe++DJkaNtmza1bVLHrY2yUY3HxCgn6Eze3lPX9uCIyxv4RZ3dVYYRU6fHZOqnm2c9HJOloWk2FOwpGYjYzXpNeo4Fc19BfR76IlsCPfnzfxHtf5pAl5M/uOPPwArhybGx7gKBzViRg8BdY8hm+msgdKNKT1m1IbFs4uyFH4D5Z3fd/8W7b19OCxgDfGOXvadly46r20AdT7TT3Fv/hTVfHdp8ySvq4ion1DeNU7ZjqQL9/YCOgov6IatxEt4MkOPp1vbvuHej/vLRik1tstS1EHuFWueXBDHk91FuwfVs/96rgL5n256z1/d7I51nTj8+D+qjtwdmoxyjp2lQiHa09NixoqY7lVhh45f1LWUOyK+1ZMz/dCV/fP+PnLuSZrtc+x+NYbdG0elYzXFpi4LyTbvMcO5Yuhvtoqt14gLp5P/u3vtP9r17ME3h1DtQQYp6wnnb94D4G7LaTxxf/4X1X7y0a8qlthHoMbHbKsYVOhn6nz+aCtBzST3d/VBPy8hhTlnqtdUP/vTk8tE2XCUcQ6626iSqUtdUz1VyjVRX0DQ50br3EC4pRvAzWBA5N3x67Ob582OjpyPPHor4TWNaLM2JYk8U0DVOZzrW9QSxhdd/21qxvMdP/MMYdHJVNjp2Bhpmno7u9/J0WhoZKm+gqKJpjz2k12dns+1Rh+htvXX2wtmzX9684f6TY39WZGeoqHZH1N4VLN95iTCXqUPo3wP0b10fNLnjwTtZ1le1HaMqxmXon0wV6Db+hpkmuBkZuhPQt2zof/D2Ty8faWurqwB00hHnbpPM7cjQVFqlRrPoah6+/p3te3sx5v/OcN+5cyOjZ87fPP/jKyPnOqbHBYpC0ttiMHJdUYHTqzSBgBI7t6TofV60Sfpd5j6Q5bHPH2IixTWDraU30k2cu4ibRSwr0S6TTmsPDNgbzBytUPBWu70BV8Oe/ezX9haVT9e0NCpoBW1kOcneE+wJ793z7W0gTuzE8TWf+8Ka47tuFQA6hG6MQ/fX89bx2toUgf5xGTpzIwDosuWuQH7GLOQd3nH8Bk6X1bUdBXRQh9ordDxv5iodfgzLllwdwxPXd+36zt69E9d6B06euz1zZgzQz3RGGjpmfQidsHEz0JTDauZUKo0z4NTgru1FmJNtdcw+s4x9enmLvz9WYnyNknZvmOqLIIrri3KaHFRz0zBCjO+vsbvsDr1GoZAkTux5du3iV1qr8x/W4LQGhS5YijIbQ6EeMb8aQofUZdv4xfWf+976B7tuhU1uPr6kZ8G9+46sikHf/bGPvO9/3d7/8VWkR05xrBLhe2acu9NoFtxbdzz4E04VHqk7WgHqslVU2NA4wXOS2ShJ9o7I5Nzv/vYI2DdPTdWgrfDRyNPzYyO3I6FQ12yPg5xotCiVNBPQsyoidRW58gMFdpAFMJkxFmUYvgbD8EFlTtyUCUsjn+HvknDL/yTBHTGcgQ0Pzz1rOPVobCTIK5QWME/LUDDlNQ2izqxH1c/cyLtb+vtbq/NaD9Ro+bwmG6VX6RWZlJlzuYLVG04koCP1sB5x3NrZ68Mu0R1bzuVQZ9WTTRVH+wH9nVSALndRZGYq6n00jTxsLI7LMqKmvm97/wMM8fMfrasD9Th0ia/XNVZSuNVKCoUaOucev/zdX/96d++Wgr5nA94S5OBGOs81hKCf2SDHGyHu1UpapWJZPW1sd2pAHRlZVNYJMsJ5pQwdzOV0GhjHDc5ZpVKlq9KJgfp8/41cXpm3T5P9gMXAl83MzZ3rRBTXLNAGkpSBb6ea+h2CwOSi/qMPSO6iPIH3rDu8wWXnTL46VqXH96cDVJcL89EOJaCD+RfXfG/NVzf23ikm+TgnfhnESPDOVPj7IfS3d3/8/e/7n7cPy9Cz226wBmd27rzUjW71gX3HbxDqbUfUFQmlW3mzrr5SanRIjqiroaPq8e9///uXf3zrreubTeG+gb5zHeciHfaQg3P4HkY5nH5QQuuGDBWt0qgC7RT6p+RjR0C1ENLFdI68uQwbljFv2TB8IQ3YiRHK8QnTiUoLuZBHKL77fK6qY3gGW3RWYaBRWsMxpvx+B2U0MwoafCmO49xkVL0YEkMun5+iaLwVKT3Fi1HTjnV7yG4tLvSvrl+z5osXvzMRNvEI3gE9Rh3Be5uPQH83JaB/5BO5gM7YHjIWZ0zmMGMmpH5/33vvvQ3qR49UxKAjnrNW8O0cL+nQYuRosNs7Rm/+/jeE++/OXuvdYrK3DHSEwJx3OBz9D8leLdsCQweVQUXrceEhq1HG4OGBV9niyGFgDs4ZWQuWEaeeplQuXt9jwwxWE+Y0Gz719PHcqYbOme79QQdtoQ2fWZFuYPz9VlqDYI2mwZai6o71I4McCol2U2E5Kb+oaMRxZskeDO788rf3LEBfs+YL69d+/ct7w6JAoMPkpFVdE9N2jCzpP00N6B/NXZWbyTA3rIbsrHkz5vLu0tp1994B9PojR0E8IXWm3d9Yz3Y5/Og3sdtLxn7/+9/AXr78618vXOotDUWjdrMDynLYax+K0BqOt5E1FizoQLuDpWlNDmGccM+J0I0gV6alqzL0WFpyzbKRxLf8W88AdiUsJyZ2OeBbLXt8A+3wDj9//HymI3Kqu88TouFY8D/T9L7+doNBYzFoKIpFUWXcZ3XwgkOQQmJLucCw5O2gpzmzI2qq3vz9byN2h+Fl41fXfGHNF098505B2G3Dji0BfVX9UV3buJybefW/n4VFJPdR0iaQS/nqaYVzQWWor6oP77v3KyL1I0cqtLijLqZ2ieGtx9BGY23XOSR7w+mngC4bsOOYf00Uvh3elHXYaw67HOhewEL+GQRXSo2mXQIBDZSrifXNwcsnkIM5kGdnG41G4NYRQ8vlKrkFGXrHwqwB9ByyNKwm9ilSnodrF/uGHz191O0NndxfHNThnaVZQdKx9f0VFrgXJS5YpRqbjh21UXD1DjghU7ipi2UUxLvrA5wkdHmqv4wLLOaFvn7N59Ycv3T9brXbzcdjOLwym8Z11rpaeZt+MAXiOGzUZehwgApF1oJBZe7y8sM/g9RBvQ248yrIzVUVbXylgNqblWzZ8Vvs6H6coE70/taFq4frSS0TT3vNVJgnHt0CZZK13UgcPNK9ATNLy6Oi0UM1zxzI4WBk4JI8yU2SgB3gbblGfTbCfxLIgzn0jeX88zClJkvXMoAKS1WEM7UU5Dmg7IwMrPKCr18H90Kkbqz0VZopimcY8mayi6YmP8tmGxTZtIo1BkJd2rzNZz8LpceFjjDuC+tPfOXW/jzBxhCdkw9nBlMxzlv31dbWII77ZCpAf9/HVzFkUdfdQEnUOQ89G51yRWSrTgZ9+eu0AA6p49mmExqtjVyj1NjukODhz42eX6AOuV8Yujd7LBqC2h2h8mns3ECd+GNAgIPnWJo1orAV4gwW8tXFzPVQOSgj/zdvciHfbDRi3xUL5wBd1jmhr8zWFfWgTbvZxXGNjW5K8xl4EYNBYT7WLwfxBkV7vb/dyFIMxfBmM7ahgpjv4/R6XMaIyNKoN0tiXvUlDNchSzo+EMZ9Ad794t2JalHHADocX3ZWhhNL+jEmbwOB/u6KT6bAkk72bHIXGDNupbPl9/WKLPnPXF5dk/+n996RHTygx7ljny5IlVace4B7D0kNDbfHbi6m/vTXW6cfPHgYFRysI9Q3XR9iKQP2ZqsBwaJqD1As6zD19J0MO4AFwFevziGGCA5ahAsB8XBeOC/PG8wjp6Fhkg7A9FjY0+Df5QQ+hA7mGpXRbO9oiHhNHGUMZCgs6I1CYY229vdzNKAzlf5KM88gjNMjSiA+RBCwoLN6+Jy0NAP+tSCakIw7C+iykcTMF77w1aGv3Nksr+hZMMSVQG+r99vU92PV9I+/LxXsw7FFXXGkCadO8RPGDdTdO7fm3/stBjq+6y8CARjIq4t0kkOqFHwYoS2EGqINDclSv/nrKm8k2NI/3iVA6z2zPoEzYKtNpI6FOYB+Fc7eMzCIWTCUwYAyTA6oI/hChzLPCyKcSTCIcZQFxPBnMC9qBXVjZpYqjYRzcAvyugCdK1V6hyPU4HKzBjo9De5cma4xoN95uobD2m70+9VuwWwEc+JCwFwQhLwaNYIKJTICWRl6FiGJp/rStW9847Pbvi1DX4sw7ntE6AUk7x7fohO1647prEVgTuK4//1e2NiinkV6/xSbHvIGOVh1kjc4gW5zb9333s9B/e2fHiXQ49ytOl1jI+IsqdIBPx3pOPd0kdR/f/Npd6TBZNIGm45JIS4Une4XKJUSZS8SzkGdekg9MjA8ur/ZxLEqjUEp52RU2YwNa7kpDObAXRYz/BcG1kmEelYshMf3IZaDwqmGZvH+iUp47+TI3z4NUTvlf5hPszTT5cfMK9FOoMNPGzNJtkkQy3HkRaXJSV+tVDr1Zh5ntLbiVBugg/q333gDYdz31m/80q1TXtGWgO7Eb4KpuEHV7atdR1IzKZB5jy3qmYC+irHdgH/H/gjUAR3wMSW3dGv5PXLJwrtH5qFrcQWtYG6yCpWC1t4V7Wlo6Dh98+ZvXiag//78aHNHAybTuKLj/hDSdg+nBcgLyy3SrBYD6pwU19B8anS0uzgcMhohSrLAZkPo8LZRIAfx4oSVNReUBMNaCXeiZqg0MLxDSJIVYSGgY8/VHtDjbSNncNNR1eObZutog0HyB8NofIuaHEY9mOdixojRhh6BJpKU0SDHtyJDYeYlMVh2beLahbN7vv1tSJ2EcSQx861bBWFdnLmcNshe5ffZ2sqh9GOpkZqJ5eRwrCVrFeVrQvwO5jHosFyd+/CW997DFHZIHUvsvIm4rgtzWaDzho4eXMd35uXvE8wh9bFOSB0982GTrwnpudCGaYECMWylSEitUVFsyNV3ahQZ24hdajfSMAWlx5orSlHcGgDkVQkrLm5uLvCSZR2xHGp1AEorsrOyNQQ63EbArCffFJPjnG/mGBS2Awe0iOQqu1wY5B0JRkWByWZQI3OCuZsvatIBuUYJ02QzjENwhaeuT9whUifM4d3BfOOXJvZ60R2XYA4RMKvGrRVt92HHUsW7y+mZTBxWZaSHjAHM4wb0Rt5WmJB6fV0RPC2sOhwOWyWBR/sBmk66Qh32kx23n76cd++APhJpkCRTMBgOt5SDuj1/tpJDLgRNU8TAmAt594+C+u0Ou4SjsAjpIX9eJ0WjPQUnCfKRkZHu7u6R/cBeJkM3IhYgxvEY156NpRvwVM5Mp1xeQQQH7ZPeqFreoGAadS4v7tvCKHo1GreycuHbM202m9pXR6sMFoIcNzcZkZkRByYmJ25h/sw3YkJfv2b92u9fnyjDvyPMoXG8+Z2q3E03bFacY3uSMhs2udAGB7g71+YYP6JISyc/LIyRX9BLse9P75FJ/McwPLU6Lw8kveFqhNTWrmil3d8gVdqDHSc7mh8vgv4U/j0a1WpdXm+kYCBsRxvaw3GJZdHcgEwaUTs6qc51j54h1EOYZoPrNMhSzwk4NNEM6CB+hlj3CEaCoUvdhFwQR1Gc4Aq2tJTqSFpPFnpWNkEOz/4mvAht8z300zQqau5gsKyZUNcKDGGO1YswP1JJIROXJg8WpAKcmRMLJocncYL1rQuAHku7f3GIrOgoquLH1+tj0DNWHam3tT25jyFDP331sRTx7jjw8CEkYzIxQe9GtiEOncnNxv40kxHyavcdfw83rLzj81TDgkGvtzov7NECelSU/GJ9T7AD1Ede/nHevZ+Hf++IWvPywl5c7NMXDCFTUzrbxCMvg02XzMmAYG4E0E+fa3AgFkNwHQiYOZYLdURKmjtl7MRGqk72BF12edNvqu7DeaR8D4J1wtyAiB+efeXqtOx0fFNacWS21o2dmrnL7ikpw7WpJYBuNpIKGZG521ZXzyINZ1Bi8ddkZ1ISJ4WfVeHyd1C/AP/+xtovrkcT7De/NOl1CcjlZCUKPs6sTeO2iqPHCPQ/H0yNDVusOTKLCIITxusUqKrjh81i8Fb/B3tnF9vUfQVwMWmbNO11j1uM740X79rFTmLLsy1rdpyQNSnEnh1KAiFOB21DAvUM+awX2JZAAXexsmZ1phpDSCBOGCqEaqIr09BAYaOqWIcEog9lkaCo2mDsQ6r6st+51x5d131Iews9mCRjgcb++Zz/+f6vstT6fK37Nv7ond9xrdK5TT8Q6AkEb64zkg3lx0Lbs0P5/OJiMd1+6/0SdTy5s1Pt8UFOAr6VxS+FCElZR82Rm2NYaGe9yVQv4ZtjIF2cPnmqfWIgOsBt1m6XN5lJDhDkRUJD8XQ7Gg+3xYkQRZJoNDIx2jM1MzMzXhgLoedVTrqbjbOc4gpJGFVbs+vtFxVOfEe1n2vDJkeRllSYtI70c9eIoveRfK038VedJrPTTog/MFPomZq/fuNdNhR89eAGvLgtjXPPXusYDOjQhbqEMbW1R0d827pmt37zvfdWjO+u2/cY0Ffb3H0jmu66WIBuNgv0Zlvdruff+Y1clDjyg5Z2JCEyGM8P+MdSY/HtuaGhoeJEMT165y9QF1UX+z6Z1r9LPowWOt1yGLs33Vyudjis9R6ThF0oeyS9eDUd5y0R9BrntTcY9vK9GAbYI/j+ov2DHVML8+xBGeeAr3bDXJos6tHyLz+26iV64VTNt/XmDqw+W6gDnfli2+TkpPj9qaxAB3iNGPcamFc5qzxk/p20wftC+cLkZM/UwpWlt944/fSezU984zNrNzwueRmMO3YOcaHq+O7nnqw5MDuydet7v1gxvrvhv2MFV3uVNZeDihmptSOwt9XamgMN33zlnT8gy2OEzWXsg6lsKpLzD+WzxXQReJOLPXd++xeRBw8e3Dk7Ndqe5tpGlG58esdI2KFTD+y4uQsbL478SyRXcN6ikVA46aaJ0vDS8OaCZN/0b1b4Lfz9LQVGyjH14sq3DPo0D8xfIkUjWr6KPK5mC4y9/XbO60DNPY5cw9bpAm7BZKFQTLFPoZVxLB8u4vBqjxwuuHFWKe0r0WiqIDcJnkTV5VDfsIWs+/GD65d6/YEAeq5DhzmavvuyrWb7SJdY9y+tHEXX7Xstp7pPGenSeLrEa2XoXm9gzXf3/f73v4f7EVH1EvV0Oj+UKhbzE8VUfmQR7KeunrzPHMFvRd6/c3uqpzA9IzJdyMeZk4jWUOSKDjIgF9BEV//8kiTj8ehIhYtP5lCx0QjgvcmkS77iERwe4xwvwHsSzW1JxQMqWTxI6zvdTai7KeZ7cvnt56O8UVw4Br6BiH8wX0CK+cUUknuyKdfdPTwcrFetVH4qqO2bM2pSCfjHOEMme3qmsO9v/Oy5Rpqknmhcf61tsDXg83rtBnR5GZpn+2w13M2FG7dqJXRKPRTsO75cs9J0uUYzC3WzOK6I1xYMfGvvobl3jr/zzh+2iqaXJZWfyBfz00MT0xMFOdavLp6aPMPrJ4uE2S16/8q9ezOFQnti0B+SlTVujDa/t998e5PPYa2q/0oVAZxY+SqJnOl34As6Z5yqk1Ymib+BP8xtafkW0GFZWI0QCkRhLn+LFgpMvAePnfrA21v9bneub6Svm2R7dzbso5Y/NLGYz+eJGVmkQYzPaW/kdSpMTjbdJR3B0Fg6scjhj32//+610xu2/PDrNLuv21/nh7nLW+7csdlr11xevfPA1o0r5CKPf86/c45LK8W5Lo/JbAG66LmEbUFvIPTN/otzx48ff+fmvhacYhysq+3ti2BPJwrxIiWPfL5YXCxi45Gp67ev377FIrJJLLx/COls+OauHSNd27f3deUj7oGGm8ubfIoLp6viJS7fhKFU27G7UkTjhCaMFoG8V+pinOu6L+e2KdgC3XujaUb/Owp3e+94e5ffHRlb7hoM8Z7S6N4ID3cTWAxFxC+QCymyAWwGJwrEq0xVVWZ7pZaMRnMp4oRFHfqVd6/NoehPHN/8k3UtdYEAaaCSdZeXwPZel23nixs3dr33q5UTpJfz76uEeq2SO1ermi2lZ0wKslZqX3V7v3tiM9RPHMY/Qq7yC/ot8WKqPT/TXixMLGJNry5OX11cnDxz+8wUx6+8O9pY73Lz7eWRXCgQCOKl5bYemY64Qw03326g4grBx0wCsSxisvktglaix4hDF2l74u1Q+mZZA1qvVoarO3ESUgORkeWxLFbA56MtitOCj4FwTox6U5hTPYBrQI3layZOdFNFzGNxBakI5LiACvuOeT9z+/zrjU/88Im1m5+61F+3xhcEupl2DkPTmVZd3XygAUHRV5IbJ/LZz0EZVffNHlBNlDEN28YHqPv8zx96/cTxxs0n5g6RFhWZnBSFL6YL+fZCATWnVppOLy4K9lP333+D3dHIu3du35oaTaQH/QTaepkrlNixq9MdDXxv+eZs2E2Z3Inq6iSNjYH6HllZMIBINI8xN6SEm++T+jsOe23zk2NHbi63DES7jowNxkMBH2GWotkUO+cCrTuoKO+AgQGsvZj2r3xFiixEa04LTlwgmhsS6DwHgrbb5+fw4rY07jmPF0e0RrrXbi5Dbz42q67ua3ixoe9XL6yAeaaPp2JRdY51Jdel2k2rKvRCg12P2Cu9gfih/QdZN8L1J+M9EBc5xe/R4sQ0xKcXiyg6cpXYjY/3//SAaP3Xv77D7HJPD5mxeCTg9ib1gna84bv7pOQa37q81R+NBgFvrXjsK6Wdn3JTPr9FwI8YpPnTsiWAeJULu96740evbMxGHZ27xrIpdmC1wlxVrardrtjcIEfh3W6f/8kmrxR75E4X8rRmq9WsJr3ugdyEDn0R6OPzVy6ufYK25w3PnG/T/xlK97obG7PSSaLMbrPtfvFFoP/4hZWTjSvbd1RdoNuUc60ePVixGNAx+t5g6Pn+x/ecAPqG87JD8pQuJ3n0tE+PTi+i4+h8UVd2Xksy8UBHAH/2zEkWzPkjPsm5ia77W3btiEejENm4vDySJRBXVE/9V/SVE0iJuf6hfFsjn/VuSMmwe6gC+VJbX3lzR2+UoG52LOWnnDYYgpbdiqhUUnTm3miUGyiqJZJzVmDZOdGtnpjLCvNoLiLQJzDvHW3j80ubP/P1rz9x/ODSFdIyWAhJTiEWNWa325pmbau3A/1o184VMJf+Sapul1O9oUuzmk0fgW5xcarv3/d9qG+eO3FlfurUSZFX5XGqp70A7pm8KHy6mB+C+8TE1QtQL2NH20fT+FVEYuwlC7GvanpmAtaa6uucvndvOhXBGLMHipI4fKFuYBfYhq03hp4k76Y0h6tb656/9+a9mRTItZquusF4glpAHdAVoHMsAd2HCxgdIKJkdpKgQM/lVFSh6EkqdUE8/WzEUPT2UaDvn9MLLXPrL9E6AXN50iIqn1if2ucYfnET0I+uWnGKbpzqPN9K35ojNQpWUn/u4tIJdF/rtzDwKPqGE3ML86+++stXfynCNDqLxIpFYmm894kCFh4F4sNDXdfrLz348QNMSYRpkwhVx9PTM0MOhRJoa+Lq1cLCQiERcjsYdpQGSkO7S9QRQ/nx6DXFF2itzo3t+u6h8cF4pwNJ0ijBHUu9Lb3+NQGbAnN+WqNLZiCSLhaK2QGjTYYHaVuz5uI0cUSzuQFiCqAngN7T/3OpouPFnT80KOlXeeYmFeEkYMbhco1tO8SP9q1ERRdVNyNkXme7gG4uMxcvngy8/9D40p4Ncxs41ufPnhXeZ89euHD2wtlXoT7TPjrdXpzOk4SbyBEiA/7sA7LwPEReg/ogrpa00FY/OchS7uJMhL3gHtns+CpR3sK9e2PZgCKNbeWBZVFx/aY+ynIouSLh2aaRXbu6Ov0D3LpUI459UwjmqRZJ2jCyhsPtinkF+cBAhDzedHEi6nAKdDrqKeXXaoy1JaNuejmFuUBvGW3bt74RPd+y9qnzS3W0XKglB05V+UxZZvY9bdv2Y0eRFTHC9kmqbtGfaNORJzW1dKyL8lswmK2hxMLCpYMUIDcfvHbr7t0Lr5WFQ7tncqaIT5dfLBSHikNplH1oKH2rpOsPqfsC1U3Z+GDKqMJEnS+xFmj6/h3cPTkmpmemOyNuhz4KIWtk+GjMNJC5UWzUyEZG+jpDUWmqV4a7PVq9R4n6abko4kSmsjVeoCs2r9cXBflQoiiJQDfMxbgD3WO1a5WM2CjRLBMaOvOEJInbvnviiW/8UIz7+e/5A4w1GtAN826zHbtcazt69BjU/7YC9k98sqrrxtzraGDDqwwY6WlIkPPAARudunF6z57NbOh4986dX7/265LgquHPTacLWPmhxemJRVor5IWdmMKH1yswyN0zbS04W6FquZn+ey0tbcXprAP1U+Jn7tx5Dbl7l/cOwV+uxisKL0uCEEJzfo5YTG7cCOrp+KhLJtD6LNgEVQvni+RbBbo/5JMgzUfvIwsnEqM9MPcrUkl1VqHrfHBaKx1ynodzMBfo+AIw3zvXyMBi45511/bVBfD/BLpM05ksqp0F+OeOenbu3t0N89hKPNENVYe0PaaEdo05qkx63GJAR4NqIonx+bdO75kT6h9yK/kfS5rMpfRnpk5OFmYKM4s4cotFXtOB7BDK3nMH6uW+ivkeqEf8qWJh40a2s96byQcd0I32nL3za4baX+OowM8vpnLdyLCMNXucrLBUneBi7Sii8FAcVipk2zOaZO2V6s4WqQPIzmKpyAUkNogTfI9TnWmPaAA3kq8keM262+6IwnyobNxZKtd/kSI6Q6pPrTtU19rMeS7MERXzbq1V+s6p6oHdx47tPrZzxcXoD1Udrx3vxd15JKTRcKy77jbiFqAHQ/7EzPy109j3PVD/QIppZblza0q0FOueHqO+PoSeIwOR9rsPjC4q0fVb4yi71ELGvteSiA8BySvdMkMLdzEbyIVf/pLlstmIzD7iiZG28aBqdpXieUk0VQpkVld3LpDrJqc7u+ve3oWZQkcLC8pLgsU+RUFupmMwqmDbda+9QiJQyeoG3f9gHue9kRjt6L9Jtwz514vX9pOK45lazTiDjEsKfRc9sDvV1Szi2L37b6tWWjLun9NyhG1KoIu2UZPJYkQvNoGOAx9vmb9xieWgLJQ6DfWHItQnp6cX2znXs3mc4ywzEBGm1OPzf3pQEkowS/cK7XHJxstm6WxcLipnf2f6/m2hfoG1JadoqBxwI1FJ2Xg0O83uahk5CqvB3OkId7vdVNvl6PYPtndMU8jDyFOLoxg3Lm1WqPmQzNXowvgD8yyWpIPZmoFQ3jDtouc0YO770fEteHFr536+1LumFeZmkZKiq17b5e2qum3b7gN/+9sLX1iRXlw5VkfXLV4lPLudOxEMl6aEHV/O3zF+49LBOXT94M8+/O1v/yK/DLlze75nksQcj8W8zD9EskMDQ6BJzN++Qz72/u2FeaL1NEYfS4xw8qY2NWxtGAsNJK7cPnuWJknWCRvMge6zsTFAtVS60G1NMyLtKjNdN1alKVe9r1Ag8d8iZbSJiARfRZgDf3z85BT/DD22A5KvN94rLDewV/KmjZKHyw39A3pLe0c/zJlRPf7yOj39qqDoqtUkUgH1WtvIrE3duW0nzHd+bmWV1z7xVI85tu16UtPMMZ06KkD0y/iJP9EyfuMt8eU2PPc01BEdPY/3b90aH52RdGw6n5Vx5ehASeR09/MwTD76Gcrmx0Z27BjZONZZHQCwO37lyqmrV9NpeuFgrtDV4ibodmlW7h7giAU61HXXjuUx3d2hVEuB0thCTztptXxBUgQTQ3hnacmjn7l+/d69kbDbDXTNKNFbrTGHN+gIBPJZw4OLw1z0/K/YdlohL657tjcU0I07/74TPWf0wsw1EJcpMv5t586df9tpWZnhWlnVpdhmN8Xs6hgXT1tjZsTogVf0saBE2/j5awc3yCLg01AvYUegfobIbfFqPj0wlI+EwwCGIUjLQvnDqygA9QWkXkrvGyYYOOTIE29eX8Q4+JrFBQc6MymkRjR7ZmdtrdmqasaEA+NPTnV3dwTN1kuiZwC8oFdwr1L3a19cpKwnhdJ7Y3RUSEJWF/KxDkI1X8idz/oNLQc5hmLfTxqZYfp64+/Xre+tlgKdVRenKDrlJmXNX7fZrDuR1atjn1upXpwhn5diW5U5ZvftGHFrzpjJMPCyhEafQEn0cK7jwUP96Q9pk/kI99u3Ti7O4MwVs5EsvMP4ajQ2o3IiqhRHPRquuBheh0PvmpPxBXHN3akrC4OhoNwUVquHTQZ0y4GdjByQJwE6wgSL2rQ9hOWQ7qxTr5IdOiMCfOT2/ftLbx4+fHh6kLlJr1P4qQriIvsbDbojA2MsS4G5cZ7D/EeN+r64uXXrWqpbDeay58ZgbrX6LnPAVUK8crVl1cppgf03LZKrKnBfV8VI0XQqWmxV+ViHOjOlA/6W0QXC9Q0bONef/uAj0HncutVz9Wq+KO473Ifc4WiNO8jrDlidN4lWvOmSJ241BJ52bEDxzf665tWVFn1/F0kRcarUyt3bmC6yo7JEaLLbV8lsD3EopynanzoJ87Okgc/QPX/m7IW7d+/evrdjI93WSpS6mtUly40EuTfpjQbc8Ugeh30iLciBrjP/zA/phLz4ODsn6JVR9DUn4vjpO45ctSPnFM2yU79c3LyCvbiyL2eqMFdUxFzEbWscTqCLwKCSbgp0fbB99MYN3cBvePqNj1JHbl2fvDq9OJHbzh37zDDQE1ejEF5rmkAryWMi4mDhiCOkSD2i+GNv7qtuZrOZQBfHEUdaXc3+OuYIwYGZrnDiw233R3TrfvXUyVd/SWRPOhhvHZ0H+a2eOMGenCEYEXaYGWpOnEavczZUzCcWhXfJtnfsZ26NSfSX17FFqtUnK8/QcHlDVnh401trty3XaLEkbYNsuvzcSky6f3zwQU9JxVRf1w6f6ilDt0iGhuMYF77tyhIDIQx6Pv0B1Msiodut66Oj0/l8lqgNXWe7h5uGBqhbS8SdJegVhhh/hkD9W4c3VrcGoS7YLeI7qjuPNdFRubpWjni7GeZjfhw2OdF1434B6mXm96+3+aM4/W6v7ApzOcCtuOnboIgfDbBypMB1YwZ0jn7qqf1SWZNxlmdIxAXcCjV9mKsq0PnCamm+vFt1JmPoecyyIqtr/9o4BWOoK76RLuqfJeZk5nTqkWw60XPjO1AH+lc//O1PHzJHztwaHV3Mj+Sw76EoauZglb5X85IbK0mFUBfeZTE0XkPXoR7AxAt0UXeL0rSJ21zDdK3zX8a7G+7yR4gFSKvozEnioejC/O79+zOJAYdbwVkUu04iBhcx6PNFM95ozUAklZieaSsyOYGAfrSj49DLjTA/DvP+utaol9xrhYmfSgwKU9NaJZ2Cqhp7IWbhl3nF5uI+1iNpxtjFrI4mZtt48hSWedhtiE/2BqTbe64sHdzDfO9Xn/7wA+FdithZOXPrDN0zqfxQnqA4OowTRQckVFnnp5fLYExulLSoIRh6zTjioZ5f3jrYzIIZQ+w25cCLnak6dF06oby27q4wyDmUYS7GvQSdK6HevdJCXG6VGWjytOKuO7xofTSMDxImMdvCLXs9PcViu8goJfRDr7MicMvxuccv9ePDuWWNYIWIYDd7Kizc+qJ4zDGIo+crOkT/SA/NKpOccC9YlN1HnvTYtZiKrbWXqLOyIxRvn7py/uAesH/1p1h4cCOMt/zljw9+febVdGExO8EATI2b2XEYkFA1VXxFpB4BsMdjpMRBDnSDuvjw2Ve2trL1o9KLD48Xb9s99oNeqFdzbbPbd3QkzDb+PJl19FyYS+IW6Gfv3B8fArnT7HRpiiLgpYUiGBgIQz3sp+diYem6TMdM0s2JtMH8+JYtW47vYZoF5l6XnOdl6BUejNrRyzs9XFQmc/qPhHEvGXgJXOgRs206F9Y0XgbDh9dVPQj2VPv89bcOin0X6mXoyB8f/OnMyfQ0HfF0JDJ6Lk0LScbKjTVwAt0jfrxUQkqiJ0ScYuZZE751I9SDQYbDBfqmhu+xgATqa3ytXbNN7ijtD1yrNoW3DnJRdDz4+1NpyeioHlIxNjHxvqAjyXBiMBvyh6jE9G7sv3b+9q0zBPQIyDsorK39zNrNJ2BeitXMZeac6HaPZdvyAdUZW7UqZmGya8V77g8NvBGtxjRf32yz5rHYrUZqTsTtDYci6cT8/DrsOwb+px9+WGaud0e99urJNFm5rhAZGqYMki4lRsztrBDkOnc9bDOVepwJqFWNr2XjmOYINGxaUxNEcNptvrGN3+oQ6vFQ3ci5Jqmz8Z9OdEyxOE6Xs2fJziSowaPfmmZTbZpXoZIWZJSGK6BD4Wqot/T3yxV790XXZS6qbfwQzLesbdyw7pl+3k0wV3XoejJON/CrL/fZ69HzVZKaegQ894fZWPz3ipjJgjM3QmMxvnNZ15Ggj7nSRP+hx09DHV2n+MKcMlVUmCMXTkJ9KJzLDERZFuhF0VWzFaaQ5UEnnOwQM4lYEbS8vAGUkUb39qawAd0r0J9v68h39g727jpSgwUnttNkqnWivW1qAd4LM0W0HJuu527FYbQSlWeiNU3cCByhqu/3c1fupdM/A/rt6zIAOT4+T1dvI83ce/RJRfJ/Eg+C3OQUkVpL7bnZWphDXJiv3OLaJ2VjdV2vVJSakRGHx1WK2xBZyYYPH4d6/zO6quu6LsgN5tjdkz2LizQfZrqUYEYJKsmkRzPL2CHUYWts+TSWe9f/Y3zhpS/LAkjN3d1UExRlJ9ff0L+vwMxiomXvrlbFq2d4sA0OuIsEQgHJ8bqI3xGvV2qnXgfUw6FAKNIZD+X81f3935Ehqzfe+tP924J9fuGG3CuGnj8lfrvXpSJQJ0wzzhqW2b13brWc69L7v2qFza79Lykak8dc6XKEZ/toXaDiStgEeBviDUpTa/vModNf5VQXC/9rOirKzDls2TUwMRbpjiaHfRlH0k4OvypWZWZ3O8uhRKDM7/LHh1/Vs1SSvVXNq5NJoG/sHx9nUqbtHuucZfiQ84DTQEMcqHczmVziQeIzIjRuY8JpjEY5UdyhSMrPddCd8d4d/eufk7vWoP7hHbDfvrKefi8Z2nh93b46cjIuVc/RmxCiSDN1PVvXuZ0wL5VYH5kDvZyiqTAhDD9ImdWhWumWIymulqkbun7oZ1/96nNC/YO7D2AOdaBLaVxud8hH+pI2Gp20IA6y2WmuN4lql6jD+F9FGuI0V5jkq0Bv7Qd6T8/ClVf8ispMO2PGJmZOCexjHuqu8HJpxINWTWK1IFFamNxbKJyjP6cz5e+N9+7dy6WKxBinof7BB3fefXdpHV3cjZth/pNDdcSBvF8Qp5Eoqo9VWe3q9tkDHtWCP4OpexRScf+Sg0fX1VilpnTPHtMc0l9M6AZ5oOsWPsT+5P2XRNOf/plQh3iJOdBPFRe5VSEcTio2Bo9jMV5bjgu0FbAlZf+YlhtvBKgrq8m+SozQPzM1Pn/jTcp9QY2/iuUhF2t2YuItmgpweHtdMSf9N0EUPUgXHdsxQv5cjmHl79W17H/2+7T5SOZQdP2N9996a91BbPvxDXueeubZOonVxLJbnQKd5KuJFRkwP+bxWMw8c1T/c599dA708rFukh3aLHCyOo6ODPMS67vYFaCXqAf8NFUsXDoNdbh/cFeQl5lz1e4iOwuCwWESNI5MMsmCVaceGZWol8HrUqaOsBOwXmteQ1NNwL93Xpg/T/ez7KVisBlvy+M0W4FtRyk5bkgDWIkKMzwUWieHA+y1i2fHUvnE4Le+s/7lDXONx6UK/NxzHOw/u/SUbJDCh3tq3XfqWgM2HEy8OJ25lAYot6hHzx1TPTGYC/RH60Avx20wMqHrMc3WN0L5wfQYui4dc4YEBXtbzwK6jo3Hwl94zdBzyY2emryaTuUGtjuCXttwhgoqYZs46mwHAvtD3B/FX763B3fOxo7I1sGZqevvXqmzyS0MDKLxw3g8ZuJ7zckpzrEuCXaXF9/d4fO58fzcGdYTD8VTKUbae/c9i1o34qc3Ql10/eDp74N8w+YT6Pl+9Jw2DfHhNJhr4r+zYtS+bXa3FBswcXh2j9qBbhh4jnWg8yJg4buYfxCLZ1NKHjziC/j88Y6eBVQd+elPH1woMz8Jc1qfuKlxOBjMuMV/t1Zak06zWbRdD9FKRzuPEuuH0CV+59IV/+DM0tJMSIGMs15XPX4USdTT16xq1M8wOtzNIGU0ggQSMsGmqD8XTxdTiZa6/u88s+EEphzoJeovv7xBmGPbn4J5DU14qLkwF+iEbCauUn/vKMzFwIHc9IVH7EAvyReJ1iugHnM5Alx7Uo+iu4COYFhF4VsHIvEWdB3zzt6R9x+IZS8zZ+AhEh3mFnMGFx0uZksw73IiO8sV1o9adoO3cbwzasj3uIJN33zz8LcGHDYP7pu5ivZGsjgAh7Q1BmyNFZNSLFeiEuEFmmrYQcf2MRajdPT27j18EeQQX2tQF+ii95v3PHfp2t7q1hoFC6EKc5NAr5CMgZntA2q9BT0X5I/ggf4PZ05PSpuw8OGRo7Uekix62dVVgu5jzUeot+3QW6ef/ulv33jw4E+vGcyvoucT9EsFomRih4PhTDAJIf4S3ed6mwLQJXj7Z+4fOecfk1R8V0OA5hoPPwIHi2wNsZs1M6Zdv3GHsgrJwbBSEwgG3GFKK1kSMp0pet96E/ue/cnc5uNr1xKP6yKd+i9z2Tvn+8tPnd8Xbw3I+nj0XH4SPfsKc20bq2U0u5zlFcijlJX5lxyNUWa2xFjH2NWsacb0h8uFwhlZmgB7fTrGl372xvuMJ2Hf8dtRc13PSaDQ1ZCRReteEnNUX7y6vpur5FeFZOcQDD0PWUHxEl+g7nrCDr3WaIawaS6mk2PiwDF6o+EMOlVXUHFgOzJeN8e4NxNocrCTOkcsEU+k2guJ3pb9377YeGKtiEA/DvO5Odx4sfIH6YFkvIqUDnqOZTeE49yq7p59UdVi9vL9YI+gE/fQmVull5kpuGg1I10+hxMXBzcX5hyJhg/f6h/sHb/xIalwKYAwjyjMRc+jiDtKqS0TDGOHXUhSTVohhzvGyYnZFuhcpw9r+cwXfKUL84bkg2ivMcEZLY+ZVbVSJTUaC7pkEiIjOw74d8NoeS5Ha8eYPz9YSCfYH/2db7+++cRaFL2EnbB8TqJz9P3S+SXWHsnGUWGuQ1fZRIP9Ug+8d9RWL+/HCuSxR6fM8sk5GsmSy8JYj521Wl4VLSCgkSwYolP3BdbU9fZMnT1zlq2fU1P3Ty6m0fMBgzmVMQeJFvw5AjciK7I8HldMS1JtFYWCut7eXCHX54G9HM5JNY4oDYPAQFKS81aLedkyIaNJGmkY6mi0R9CCV0PxlBpqWDYTM7LS0iGm/QRHuSFbtgh0Qb4WfX/u0o2FFn+Id6MCdKcBXW+asGoHsO0wrxBheewj0Tfxn0ov0OFhj7HUbaSr1kOGpcKufoQ6t66EqH31XId5D+s8rk/qbehA9wp0NzZ42EEYPUwmJallktz456SgYY2RWDWZJIQjAVrPSy25eV3TJSVfpf8fHCUeHPaYGWuf1LyVKsbCqze+cQUQSh4NNIWky34gn6Lbsa2Q2Pfmxc0nGkXPpZQmojNHNhy8dGN8kL3/BJEK2TwxIGXbrul6bk1W8OQE+grveP5fnDm5a0NVscrW5pGuSo8ms9vi7RreXBChm4YJ0OtT1KtH23veLOoHuowmlRreIaVIZT3jGg5i4itjZiiKcxCDa5URIwG5Xh7C3pB6O10shA5W0q4ZM5E+eySIzpThYCZDXF4z3OTuDpNzHQuluphNbmlr730e5o0iW46j5vqRPjfXuEX0/OC1Z9sYdYzIdTCSbXeWVd1ehZ6/qPI+rBDPDvCPquP+UeoSrqu8Ti845VyXipkqjKx2RPrmeIDd3zG6MMNOIXazHZ7mSEfRXQLd65JdvwKKxBm5U7VSd+jMFjSNfwUnDaMKcUEvFZkycnrvPSTHrFzZmfSYVaeebvVCjLyMi/i/Bn8hFx7I5UNxfz6eKiRYC99/+KJ47TykNQZtZ/Xdic1yssP8Rlu7rB/0eoEudEvQyeIfmD1qIzCt0A3Pp8xLLjzUndh4LHxgpItWGnFvxb2zGxZedneBPdUyM0MTGlHT3h2hKObdBXXBLh3JGVtGTuKMK+nBynMPHkApvJnrnWbDr+PfB7y+G8bQdZNJrHqM/g2PPQZzZhCT3JNJ2I+yRoM4cJEAE1LRlD8/RN61jQrs+ouSW4f2FvQc1jBH4+Vcf33d0iij0jS4i31C0cvQVWaRzx21szBRnhTbCx7hYO3j1PXao9mgXiNOmEBXXYiiwhwhgAslZu6h6oODfPaXoZMf5+FwMHKeDCpAT6KuVi+LBpyxWBWKbvXI5epVNJxjP8zSJW00y5Ib4+T3mpNakqNFvvQKbjZ8knwLu2l5DHf7I/GxzlSq2JLoSLQdPnziBAYd4DpxWOvMpUuGEcWOdnbNoecSdqh2gY6oCHpODS8mT4nejk+ZfzQLL8pttrBku2u2WdXEDtrN5MfEyEOc4T+ot6amD3cMIol9h/1sjsMOcKBTjVdoV0zizpEtDZKdQ9crXVRrncC0aDGPma+4X73exJdmVL8KFTc7M2wSiBnVTzXjUjL0uOK+JYeZmwnnaoazYX8kNRbJhcbyg7rb/nNhjpaLyDHe+M47az/DILJ0TNzoSMBcXwwofZCIwVzRds9uV+vNL/BWkyf5SFZZ/k3gBnUMMB9iqhLtGqG1hK851a26qAgfFBZ5pxpeYcMX8vwrqahQpycZTWfESHMp3UqmjwCO+/hw7GIoHR3GVovVZTFbJe/iwZ8XFtZ6pybLBzIxs4bzFstY8dhFy4cVwnPSe000zXBZW3ZsKJ4fy+YHB6d7ew89e5HJeZg/hP57uZ8D5id+fu1KB/G5qLkizBHJwMonR/fIMTsnTRXEP2X+8XBdr4oC2qw50HV2O0nXHHCs6IuIoTdcsvKtXexr5pFfHiPzBXBeZ5I5cmm+xrGeUfDhUfgMedSMy4MmV7q0GL+gLzovxTjx3qihEqXhsqtSNHeRgiM6D0r5xl1Tkxl2ZyP+bCTfgK6nCy291M5fl8isFJ0/YTAv2fan1u3Hb9fPc7vVEH5eq11++m5se72qF1k4Uj5l/rF1kui5qAM+tWrrGqlxKFbETl8DtJ2I9JMqUG8dO9KbGvSj7N/dShDv0hUdoU7iUjjQsfJJV8bFB1Am0WCrWmmNucyQxrnTsO4xls14wP1jbDzfQ0bAqzmGCdaCeAOSjomysj8UyeKzx9k3D/OO7zy7B9OOz1aiLi4cCRlx4vY88/he1p6EdNNeZg50jItLo2eCGksM5PL0Hs1q6n8L3AwLX6Uq23dUO0SBeaGAbTBH2AqjBNZsXe6lRQ3su3YFiNZksEzWhsj3K8owWXjaojHW8FdwxRXI46S5IE8sLh8Eewz3LplUJTSvxLaT2FEyNLoOB33VgWE+QTwfyadSY9PtbYm2pccplYMYEejC/DifxLTPrTu/nx9HfDjZ+cpZblJ1EfZHxYezS2a5lHB/xJMyn0DdVCpPvOBx2BpGmtwcvB49jVlmTsDDG6LG17DcORiHe3zHckgycjJPINhRdbx4rLo48q6kguai6V4tyWFLjtUeIz+LupvprcLJS+LTJ+vtdoyCIg6cw52hbh6WlQZcyjyUjU+nhoqDiZ7EzOFnKKEZzKEu4Tkixznbcdavv9LLon9su4w/65VyA7nTBXP6ZCwWPUsA81WPePL1kwI3mubEwpvwsdnY2Tcid/Dwvyr+IcZkotMebu780VgiLjK2vEm6lJkzc5qgrnK2a8NJB73ww5zr4pyh7EECeA/6XulxVWoZYGti3vkWq+rlk+RkFPle6nXhKHm4QC4ykIvnU0OFvNzBe2jp4olGmAO97MKdOM51W+Df/PqzS+g56Xa6IAW6rtI6c4xOH8z1fLts/seIfcr8E4ed9NdH+uZkyHTkAC0IZE7LQpiLVGHim1ufXN6agrnf3/tKV6vbawW6qLpG5yoIM+i7lEwyindYEmT8gXSsyxJPKmkWZyVKD5eMV/KuJPMg7qaiVhMczoRR8yZ21shlEqlER3sLhdSDJRcO3jr04zDnEy7cxfVL84nBkPhwOnMjzYphwhvxdb23zYNVER1Hqmh9/TRA/2RdN1Jx9EJoyrFZbrJ1So30Md3zLYmH6C0YqF7eFae6wVzRjl1htwvq6LmGx4eOORRQD2PYlXDYMZxJ8iWJ3ExSnLWMfI3Bt6P5SVz9YRfNzXx7kqvag9GwXObcHUj50ym2jM90cJw/+/icmPbPCG6du5znfG5sPLHnmaUb46Tbjf3/At2qEhRKa5RVtc12bdPqyb2W5FHtjvpfUnP6OgEZ/rJ6bAfeE13HrHNPBvpjSIW0pmvemjW7XqlD1VH2hiM5pgqgLd3G4tLhz2cywcywt5ueyWBQAnDRcml9ypB/qfRq3dj0jGu7IjXUYSVIdQXc4XA4lI10Z0M0u6bz6UKhpSVxaOkZmAvkJ8ppOEG+VphvWFrSUzIl5nZEDzAly+/S+rrWUERYVTZUn+r5f6Jeeo0kRlePze5E1al549YbKyUQuezOY/U2B0aWO3VV93cu9xGwE+PpyDHyLo8+7jTsGsYxo2Ed3LCXgxsboMDbgXfvcNE8Lf/PcJI7r2V2JSdlc4aVUvE8O2HbOxItS89e3KDX1IAOdSNUk2rLWqpqN85faREXjlgNMUuILtDtTpCrx7qaVWw77RLG83k0htD/L+qI6YUqKU+xpFUaSnXqxn4B/djXNO493LTcUF1d5+ci9SN9bp9PQ90pkTl1XbdymvPIYNbJzRKSgZZDnt0DvBvw1zkClGEHViDpFj3nAufAQCiUi4zlhki1p9LFlgKJ12/rQ0podtlzFz1HqKR+f+n8fDu3ev1Dzc0Gc8Si2ftmV3tUCeCMnJP508Laf6ZOeCOvkyTnPGpm9igNCfVCHeiIHrchmocrb2pGjoyFqpkRDzXsWOOQwotH72DWXGCXzAz2na7JaDe5VXx4dwatF6Wn6ULiuW6+BnvYF6ZDJkeSPZ6VSYa09LUTnfev//5cKfFqOHGl8ByZ27Pu/JW2RCIUaPUBHeRAN+vQ6YdUVnf17fTwBxxMnxbQ/87e+b22WUZxHAUVBP+HZu+bupA3JjZZCHlDIFk2lL7qmjXpNG6aaic2M2uXLiSNIeJMEbfKQnTYQdPWmGxLW8e6KKPiQMHRQYZUGbSosDKoF15kXoo3fr/vk3Rebq67Mic/uilsF5+d855znvOc7736OtM2Fm9olxtyy26zzB1vO2lgzoyOKb7ZotjDB+ZyaT9iPGq3JDW59BM1pvE2duoytpgbGfmwMwP28GxfBoxRmQ1LmYAbP/B7WyaTmZz0BmOpwUKp1DeBfnupHKphf/OHL6EJ1+q8tg9ShdfjqtpLV09HRAqnqeJxjtVwNKiU4Cj1C2UP0hIepXaY3yt14R5szkGGJXndjdyoPfzwjMjkqankskia3Rqfe91DS8zlvDZFprfpbzOgS0jghjE5mQkSb9LpY7THSigJQR6Oj6FHd9LmxFQUTtSwXLhA4n3l2nglgtD+Ehsy5xDQAZrIxTkqQ/yFEysrp/Ng7tUbtwqR42OSkUtiyfXx5Y8Ul9yvHxyy8dBhfu/Uu2A7us1mNbY8ajaDc8sY+sVPF85mVP/e2/tDKJX9obExqyShK0fm2CFG6jbUacmgLwjHxlxrBsRRwOEXo6Mq/DymTjoxEBULBHBDLYl2DES7i3Fs/42mT33Ixqtwc7ZlyFyk7ZiJe/ElDsmwC6c3AXbpjTjeVdSb7rHlw8oeubuLttOFPlyH+T1TF1e6++HrSnK5l0rHn+rTbWQuqOPBjv+phV/95GUk0cA+NH0gyLAOb2fNbuNoJY5fMvB0HJvFVPxMplQE9UwwM4mEPalmEPG9qb5YCcsI0y+Hxoo1KsDl95069gb9nLjp5HRvZu20gyevXv3wkD4YxRwO602RwmF+V5/rs+CsqHrYzBwOmQneOFfr1Gr3QV0MOGEeHscvyxlpTxeo65OtsLbHo6yzqD09Y/Hd/hAuI+y/PRF08loSO3M6dMmJ+I5bSQCv9vp8U85CxutTncPBAJM3dNljXqRwhWJxDBcTIf9Vh0ZA/pX1Y5/RzdvQ8SZzpu/Pnf8GWfu+qM5cE8r3Fry6sDbKJIN5NWeQXTL/A+wZ3ljrML/PCI83ppmwjrsawyZQUGc+RxOeDuhmWfKFw0Nx5vB9eLDH/aTuRs3OzhzMGUQ8jzmH1cHeSbu3N5AKDAcyaLV6A6mcdyrAJeIlKrWX4uMliL9FatFKA6pR5wG8hZ23l349Jw7RyfyVfe+wOtcdHdTh6GY+0btdYL48aOCyLB057ZEO8/ujTuT4WEZllm5JaZcL6VsrtgvobNOBO7L4obkPPB7MPXiGpjNOm1ucsQM5xybh7LhkbMeimKlCLEAnz6C9npoKDBemCsOpZChYKg0mIPo2m83XIvsaCO0cfyR0mv4454jMo689N/DNyjp21KAjROR0dKopArhsMcPPteWkUZYR20UK1zlXu2/qjyPCM0riDikKdns1J8kuFunkvUWd2GVZUdX4NKj78WR/VR+o2SUxtutrmiVQj6WCMT8abkGoLxfYgwkW/Jh96+vz9JVSpQkPQntpFk24SvrQ+rETZK4bfVyk7WD+wmsHB94A8ygTCK9dU1VsIGR8R9PYInNqV1uOOcx7TCw78IF1mN8vdZ6v02MwoTza7XKqgzm3hQqXd01EULPLBB8L7/15P6DjvXsu7g1ytT/MhlEqMA9igN2ZxN6QJLy7L1koBAeHUyXPBFAXCvG+8deHEol6GQpg6dONt0f0FSItNwdzjD8yiX8Bfn6VzXY8z8Neu1vBplEhoSnDOKt39PpxiWsm2IcTft6Zmbj/k9bHmcvhJVv6HS6bL7lsx0T8XT9v92vlPUji7TxtTaf1fO7luYTq1i++0GxurgjD/Hop5cfqipinQPIFqD5RZAdlWmEiV6xVaqVaPnrq1ItL3C0grp2Lq8iozpnPPXfw5MrKJucf/X47ynOuFVawIUdIxhrNkNU7rJhxpWrrWO3/fUnxP8/SPMV5eFDFJi6U6gqSeJZuLWNjjt8cZ0c6Z7eHx+Zw6sbabf/0BC83EroJdXQwSGWXCYD2THj9wJ0cL+Q88fGx7FC2nChNlFLlcrGMLtzCh9dOjgwQetsQ2lvJ3MCJ9fWNPJkHvJC9dyCukzYNxZoChTWr4jL3d8utYrOrMwP5nyeonuF6TZlrC1zcQjVsxlzCTpZzW0bwMgzUn5/Z56H5E3OYnoPZ3FTpIfS+cZylpJKFqdjU61OFqSRkmLKz47OJYg7SyJRxzUcrp44tjZzkriDRcUcrDk9zgNdLtTc21+cj+vPcrq+WJXJ8duF53g/muapdwsAtYn3Hzx94RvYRbunRHWcScxWZalJ27aQjbQX3LkAHdeTqdqt37/R+HbonPfRJIeiE7gbIq6oOHSF9sNg34UlPhCb6xuPFZrFZyiJ/S9SRwq2WIwvzK0snR8B8oDUoAzc/12J+7uCLjfUjOnOP3auBOaA7dEcHaBME1gZVyjywRdPVmW9/UOpPdtF3ALbrWaRztsxgrnsP7hG0kQvTocvYIuM9MP08jjvxCr0/sx/Uaaqa0qEXEvDs8VqoNFQqTdTG4eeVbJzdmKLekJn/8a23nh4ZeG8rvB889yue54CPzuvbjQZKNTL3grnqYNouzNRtdhy9ntRQJXbD61lwdGL7gwsC6GdsvO4C6lCxr1pcLrFYhtceQVzHjpvNMnY4q+Gx6dfBHOncOzN7qd3mDOrMKatWr2Xx8K5kIdJSahbLRWr7oVLLNvORhbWNK2AuoCO6H4RduMCzFqZw36w0FpDC9UCb3Q/mLUe30BToSRqWY4oZsxl4uOu9uQ7zbVhQgoSN65mw/tVotinJKlevAzv3e/OIQxc11GUsbVLAGh765F0Oz0F5s/lyChaELi6ZQ3J9dXZ1tVKkSnIti4S9nC+PN2u1yisM7VeuvAUbGQFzYefJnI5+/lpjbT4fTSCFw8pBMm85Oq/P85fVLxSz7LaYgJzlGo5SO8wfnHrXTmB2cVc4Gl5SMudw8diczLegm8S9ZrfWE35/ZggXYIA90hzzEDuYEzqFtxYXz1Qi9dlKEbCz5Uq9sjpbrmQb8z9e+fKtLxHdR0bo6TDsDmI2x8PzF+c3z0YiCX/Pv5krkIzsJnJJqyYxx8OETgZzxp3OvdTtaM71U90STgT5PIMsQxfAweuBwhBTCb21fU7R1J7w7plmNERLx28nqMZJ5oS+ugqhjjMLeIjXI5BOPV0un1ltZo+sn/7xS3i5vnD6PVLXmaP1CkN1vqE/zkOenrCGPpzBoRuOVI27FOg82ZcHJcWC2hBCBXTzzvH5tlG3yGxxce+mUWHBPklfh3+Le61tFUexo8Ya9o/d2J/OQnYpNHtjtsWcKnmAvvjd5YsLzfqZWmS23KxX4Oan1+dvXvkSBuYwkb/Tz3nCdvCH9U2E9mgC9XnYCj/3OdrGWWqHdLj6seJCL0DewQ1Z/+NFkNtt7StPYAzKEHlCwX7c5oLv8xwb2HXmCrdWwNxO5Fvxn4eyISghZmszzXRbxb5O6NDeWrzUOJOtVFYrC4sL9bWNzW915DAwFxH+wnkUbMjgBm5u3DmLbnsakk40BncF8b2l5OiQjv/2uczV1TQ+0DtHLNvo62K15LMyqHOpqNQ7iI1EeMrDx02W7rb6i9Bh9yneHn+i2TyUpjJevtIsF7NC9nb1jBBco5Zm/shCeTF/dnPzLzAndGIn9KdHPruAg1Xu/DzxdmPtSB7MPWQ+avdpNGZxRiTtRoc2mLPK5N2G3vHz7fZ1UY6jLjb2yzY82I9jbW93P9x8CzoCLrMsbo8O+Us3KtE6BPIi+YUbq3Uyp5om1bf0vZNfXV69eARy+kAuoNN0RQGcsrH3PjDw5rGVI/sivChpDYdbjs5eHP8Oo3EUOyY+11xSuxlrAvPOdbXtpf4YqZtkmAUqdujOHV+OYT03bqICOcqnu9ANGhX9ekLp2xVK48G9F28t1uvZOsI7Zfbo65Rc+33z1sYfbTff8vSlE6zauO51pYGzc7q5x2oFcEKnwcORtSO1SGLo1eU2kjnN1GG+7cYVJcRu4uwpNwhLvdWkKpmxYQS4HW58O2BGuKKmal671x9K/NKEsh7s4uLandW6gI5UDvY9V4hf3vyWzAV2vmBLnyGTQ/LOcYnNfD7aAzXWMJiTuqabEbqdow43tFhwkmo07moH965OS2a7jevhUbDDsKmZy8CMkvNALqfaMGPhAG+mVqpD90N8a1wzWQhFZxpn8uDMoH4Lq6MBndQvkTrsd8H8pzZ4yEJdWXr6vQEIdLx3bb2xhqV1id30cojw/tvTjbgkoVSrH9nMo/1bzHd0js8fij2h63rt7KfmvBGCKjavvpzG4na0TdPNoAE53j2eUGXlLCM6g/qtS2RO6PiNzv1PMif0LUNXDrk71D5vbm4uHIrgeW5F3m5tQW/96Q6kilK1GrYpWHbQ3crcOy2Zh2VtNTfUaQrkepxM5z4ym/EvgIUUobfNh0w74N+dDs1evdyifOnOVxcZ3kEd/wb4aP/zpzbvNnnW6lR4XZlfnz8UQaUG5laDAcxbyA2a0XFUs9nnBsOSbxTtdjI3mTptuIdoTOLZkgFzSUGUtanD0GXGXjCj/rDlNzwSH2HWUDoaubXW8myooC8SOo3+vvgnZbrvgv+LzNF9H7nW2Ng8eygCDVYgh5sL5ngboMNtNKhKzxxOUiH5qYjg3mH+cI0n7F2iQsOSOOOkJB3PDSouyaDYDUDis4cJvG1WqycdzS80LlMQ+3u8vr4kgPML0AVzUsc3mTN7H7k5v9FAdR4F9MNkDuqwsAGBHciPqsqB2zEnmPv04C4jrey0Xh+yIZ3bYeH4245+udswqdog26mZbaOOtn8TEIHjG9R70lA3v3MZzAX178hb+PuRv8mc1PkiehZtS+vzm2tYOwLmVmEGaxh/lkE7qhmOolxT9l7P2Ly9GutDMMca2M6NhodsTOf6uT4UG0W7LYoh40Y6h4lJPGENbepgFEadJawnkc6evvUVqMPwTerETuhALQxy3eKRvnRzY/7O2fw++nnv4YD1KDwdbxqYA7ykDcV7bYGAaoef65uFOm24f9g7mxengTAOIx4E/SP8iArFSmuqQUwp2BZB4iGptMSkhFRQQafrIX40ahHE6DUiFAxYI6UebFVKrYigoDdF8STU24pgWTx0FS/ixd+btFXxrhXzdJrtmu16ePadefNOOvMnQDo32Yx3+9ZdtNSEWH6eQqwfh+3QT+IHPJ+zbVlbXqZABzjcIeehdApxal9xDJ13usvMceSqDelSApTIObH++PH1GEVunS8JtI9EfHvgPCq3/xmQzmFgp1k1bhNK7Yg64eSj3fh4K/bXS+R/VU7ksK8W80aDAZw/gHUa2Bswz76S9J+dP3zrLg4bKMlAOZEg6Pchzsl6isvcOiiKUkrctYmc09V5dHn+hwitc9xu2qexlJDE5El8sJUTQ+HHZ87z/MS6VWR3llCEI54ORgOkchPpxNfJkP71XWfRa1BJxsqpU+n4dRCeh/b1+7jE+fOFzNlUcJfc5g003RPdJfOnQBIfpnO0JICYyZ/djVg/Gd8pHs5P45zHY6Kcz5F1507/AbQ/IO1LS5TFu6H0r+T8LvjmvltkcI56uyVNIz2PZxjph/dhiYnzmfS11G5RRGGOpK/7rza9/9usDJJ41Gh2iZS1SylOfVQWkvHjxw/DNpgaz9k5YFkVve72B6OghwejHio0n2A6cE48/uAuv2WagTjHG+it+D3wPiPOHbt1MJPFlvuAJttoRF8dXar9SVYhnVtHF+xUKstLJYHHBfuW+HFJohClFoiD89C6Jdus2xuFwT5AF3/nzkc4nyg/8trrLHYNRyfnQJoN6mEd9nACC5c+OsWVTPrvYH0XnEcp3B8HSTyk74iL+zDiStd4obTnVmILtw/WSRWY+LatXIVi3a83lntLoweAYn2p85WcB9IfvmXvljuOZshyjriCMSGUjicqNFIpmTi/oAqJoxmSHjqPUri/ANI5unSL0+U5rKtipvxISib3HZagG8qhbko1V0Goa44+7C+9wIbcYGk0+hh07WhwPlxkUF6lHC4I9dB6Ak9ynkmqtxZ4wZTyKZHKvOjbo8rr34GsI50T9+1GrPOqmYX1Y+IWkZegPBzNVUR6pVIFCHVZb+hef/DpBVl/sTT6Bt/Eww/a8mIDlVdDtkxVVWfOQ+3SSS556cT5Uqms8pnUxHlUef1b0O00+PjYLkjP81iQv1izFg6mkqIkqWo6F6AiyqsBllyRHbLe+/Rp9OLFi8/f0LfD+N2PHbY8hHNZrlZNM7QOeDwO85QiCJmDN/fUsmU+XUoEzuPo2qMq3N+CLt0200oUqTzqreYlM52+dEgtCBnJnPTrFgV6EOpmpVmRZcNhQ+/Dp0+fX3z+/AXOHz/8wPovO8xB334BP2SZlkXWCYmX4LwkqAvnryjXmkWez4fOo+H874LdvTbjyk3MJ67YlizfrijywsFaMsObahVAenWKDAzZMPRu/w6sB9Ifvta8xWVG4zkC/aIJ6/SGQLuqoiVEcQ/CHLuz2XY6S9JRiIsqMn8ZLE4Toxw+xSOooVRLV/aeTycFqVy9mKuEstHoacqE4etseG/08dPHj48fvtU+LA4ZM+CcMKuADrmqCniT5zKHbl6qWZcsSOdRq9mN6XOkcJHzvwstTkM7rWdV09Jh3a8XWydUIZkwaTDXoXvaQpqGpjkf7g3g/PE7ZHAewlyTL+CEDKbOc6qZU8tpIb1w3ao1m9ULto3uPbV96+aoIjMPYGBfG0MSn1BNGdb9lp72T5RhvWxWZV2XZ0z7d7Le77PFNy5bfMmYpslG1YD1oIe/eLF6sUpNNcvpgr1wopjdjxO0AyCcI8yjpeHmAtRk122E9azVpExNa/lFY3ygkMR+mVVD/oULcI7msIY3dFz3SbeBOMc/XTDo7wHAt3yBvJuqmRGaJxbSWf82kjyaeCvFY9E9r/PDqjW0a0ohc6Up647DGLOx8bIipC9d+iXEZ2gGcxpd/QlzGaNvcXYi/WJVRhIP9RTnl64fUio+/Zmgu+f3cVEKN1egJoud+AQk7bcdo8FYu0IbLxeU8v4Lvyl38I3mtNCta66m4Qus4jS5pYCHdDqY2drB901F9g06b+akDLdxazSpNlcgnYvFdhUKaSwHp8F6t1FvnVCETPkcWf6Z27ehWWMNRtZZGPfgAmEADAF4VbVrl97bZ3w/+JGmdU3gYrEohZszUJPdFhMEMYughXW3jTVlTmQFwTwHpyHhC5+kk2/XZfSVIOkGSSdkvJKz6NuLdqvFgrMm7QK2IdqJZe6gdC62I450DnrZnTsdLC4ytguCfdmHNofEBs8pjLlMmzKxPcE3a8qhG3W55bqM4aSZFTZuiCZS55JVsB6LZzIW+mTc1t7v6Nq4WSvY5zQW2A4PU+capOMQOg+8oxGaX6mdGY+LTtsj6ey2VeI43BcVpe1zSTDFzpF1hlDv9YeOPD6ULaRbfmiWzaKcHoH0GaF2AOdKfdy+6rQ7gXPNFjkuSuHmF0rndsC6HVjv94dM7y5ka4rf1qaw8AmZUBqizfDRDqRrOhavYN2O57nM1exCktu8IUrh5hdMtm7YwYmZtAHrHqwPnda4oihYLM6YxThgwPVC5VPtdHRbvlLzX92u4709SHdvFwvc1li02sBcg3QOsV7InJFd18PSMoOhZowNRZHblyF1ZjmUTrGOBuicgddtOF8YV5zusNfv9VwmpwV07dFqA/MO0rkNSSGr6K7nYaWRwQfPeeWfKdjt0yR9ZhyQdHqEaHjZvV1T2uN6YzjsD3o9j8mKsGPD2hXRpNrcg3SO5l+Uios+mqz39XH7jJJudV02Uz6RTkzUh86vjrv3veEAn33r9Zhew+X5iiiF+xfAFPvGmCDW6i1I78H6h0ZrXDyTbXUDt9SYB/EdLxQ+OXhjvVAZe3p/iZw/7bv1QmHHtqgi84+A6tzarfGCUoH1AWJ9sHynMdbPnNEo1kPRzJtJBx5at1tU/DFzBkuDZwM49+o1IRZbEaXt39k7Y1UngigMF4pK9BmMuCnuGgy7xS6iYCHYO4NpDAjp8wDjwJTbXxhMMY2BkMbdIGEy6U0ZYmE3ZWyyDBZuLj6A56zRd9jNfOTCTf0xO3/OmTPbFOoWe0DJcFZojdadzvYzzt58WvzXrJRG6WfyYsHZ3GbKuS0413ouaJr4RmqjgDiH1vlI6a9gfeucUosRHy4K9I0flI5c45+174go1ORYOzc6/8wprHN/LqpZYJwLKCViog3s0VtTVtmvz5LP97X1Jai2SuX4yZUtOMnsxJRn59djiHBvuz7CNQ0chQgCyuQUreMgU4WtN6EqMF1zVAA4z9H5zCqDk27ofDpMo+e+kdpEoDrXC1JK5Hdt8AYKVx6U2svxBK1D6WV1zGt+7Asp53bpdptausp4CrG927nrnTePW7fv9J5GjEuh6qW+2ZRmknMxPeRagXSXI7paCP5Lr86TjaZYE4hw/p7XxoIt9iAlXE7+WXeqECLbW6VW2q00cLiWfKFNrXzjjBqC8iT0ldfmAnWafvAcbgKf/rNeXReZHO9trlcOlB8P74dcWQfDbWjdKEmDJPETqY0G4lzYD15xmem/1nelLt4LUVRal1pXh0zK/Ee526B0ZyeERqF33nSgTgPv+nlJ+FrDYscZ5ZNVsyFaL3VVjaSwptwBsM71FLfzx4/9OEPTwbNzcLcg4VLV1ne4sSsuFlW13wuSafff+ZrRwE+ktgMchUieEym/mG1t/VTmhZSzb3MiMovK0blZCUbDnn9LakuAOBcnlBA+PT/hYWO3a/6Zi3fuVCvfbcxSMprEvgrXGnCyNQwY5yPtNsju5OwIOu6g/LzOp5ylSTzwjdT2gK9nDhNKuNAGnQPl8cOPn/gPfHM6IzSIQn+dc7uo6zSUkbU9W4ed/Wd5Xuh6xNIg6HV9hGsZ0HbrBS8YEfiEr7fxnzfnZ7se0zQKY38Wrn2A9X6QUCYV7uvg+veuBp0HIVzn7CNcC4HqXC9MGOMTV2f4m3qZu6Wg8GT3Ea6lQLM1TiLKyNSg9ZsdmN9OeZpGV/7tDO3ldicOo5SR73YL0svSme+ERRjb/XbeXuDsXA+sM7E07nQ6KsEgwoWPfGxvNRDnumGYUjIqDvvxyzSIfYRrP1CdGzyKI0rFYkjTKB4M/JnX9gMh/mEcRSmladoP44Gvtl8CUJMdxP0ojcD5a/9T7UKAFvtV/CwO+1eDrq+2Xwx3O93u6/hq4A9MXBL37n/8+OSjPzBxWdx60LnT8bH9wvjDvh3TAAAAIAA6nJv9E1sEepBVYQEAAAAAAAAAAAAAAAAAgLcHhwQAAAAAgv6/doYFAAAAAAAA4BKv/QyUEB6ntwAAAABJRU5ErkJggg=="
+IMG_LEGENDE = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAMAAAD8CC+4AAADAFBMVEUAAAA5NUJDP00qKTUqKDXi2uHX0tysqbckIzB3dIUjHyzp4O8iHiojHi0gHClqaXUqJC9oancdGSf68/n359PJwMaknaJaboX27vHWzdI9PUaXkpvt4NwWEh/e190VEB/q4ebz6/GdnalRUVn48fijoK3DvMU9OkN3dIFkhp/RxcGy3uzN8PlQW2eVtcxyp8GizdsPDBUTDxoZEhoKBxEdFh8nHSUhHSgiGiEXFCArIioWDRUXBiUUBiEcGSUvJi4fBy4lISwwKjUaDR8RBxg5LTQkBDMhExkqJDMRCQ4bBikoGRxTR1A2KTA7MjpDOD9OQkkoBDpJPEMvHyI0Ljw0JCYIBAomGS5ZTVQiFCdiV2A7NEJaUltDL0fy5fxiUlZCNDhAOkZFP0t7bnQ0BUZnXWUuBD8cDyk6BkxbT2UyIzs8KitXRkg8KUFvY2mGeYD27P1qWVpKODghDzLFvMB0aHCLf4ZRP0CRhYxCMDEcDxFRS1lAB1O7uMX78/5JRFFJNEyGdHP6/P6fkph8amkpGTfFwsrAvcljVWt+c3xzYWAxHS+jmqLNwsVfTk1pX3FQOlOcjI+PfHuqoau+trzIxNGzqbDPyM03HEvs4eCvoKJJClz89/Xe0tHEtbW1sb+pmJnVzdJkQHO4sLaVjJfm2tdvaXr5QfuYhYP//P63p6guFkJcQF7z5+hXL3DNytf07vLYysZSC2dcEHL88u6/sK2jka8/IFX7J/v8Vfypa8qYkaZxTX+DNpaWQLJ0LIaLg5ykXrj6aPtNKGJoEX+Ce5P57eT6e/uCX4ykP8LdQvf7rf3Qv7n6jPypkoqMMKn7uf2oK9STTKN7E5jaKvO0Q8+HBby7dNX/yP6xFuDHHueUg6XRh+C0XNDunPbEg9n+1v7pV/ndae3gg++4lOTBjrfJWeHAP+WkfbKOaqX/5P/p6+jjnObv+fn9nP2VNLyVBNfSmcnisNWvlsK5cMG7pJXGkfOfFMKvjtPvse+gdZfKqeTDqM7XnPTyxfLcxenqHkNuAAAAMXRSTlMACxsqQ/7+/l/+dv2q68M722CQ5/1tVYjciZeA4+3T1aWzotjE097WtdK38fq88uLWctIqDwAAwN9JREFUeNrswQENAAAAwiD7pzbHN2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANB3ds2YtW0gDMM6yb44tGBMFNuNhXGcllax4+SH9Ad0yNQt+21GBDyclmrzcQh0DUdwN3MSpFPnajL9I+LG7j3nN9zwid4D3g+/9vO930kIeQ7v//pag8HE9xy26U86cFP3R3fTjuewDJpMLwIPKv14EQ08h2XQHF/1PKCg0WrpQrePf72ML6COzSBeNKEL3TrBTK9ugPodDW6XTTjxHJYJpnoR92BWOVPjjqHDPFyb6UR6eXsD0+++sXsdzl3othmMtV7FMNeio93r8BrmL7LNDOrS+H0E8d+ERne6NKEDbRztBU3q0vgdZJXzb5e6yMOo7zmsgubH0Bcg/d6/000harez2ca/rpvG/NUB+t2fL/RLLkJX323jR3uMN6bKwfO7qXHlCxfCNTnb9M9yqY5VDpxDj1ewxU5yEU7h/SDbzfCsK3G+WcLr70G80IXATArX5OyCzvdYYVFocPcz5gpWvdRCKlZFQ89hEfQux0qKZrP6AexRmz9a4SLnVDEZnnsOi6DZa+jdDTu9gOV3Y/c3RZdySvnuEtbR2o5/KRVjsrtpToHdzwxi1dVYck65iICNnpYzHEussJJF8xvWqxTI2L0pTOaccTfUPcsjXSoDbvSvB1B+9+OVakpOMsKzKjqHdLS247+XVGEsZa6/PVxBkmgQJ7QpyWvoWTWDdLS2MxxTyhSWfFecPFwBGupmYUvJvjSZmwNmldvUbdq9y5VJnctd8Xy/BvTQxSxs5FDvSbalCeNZ5JY2i92dM8Ywzogotus1oPcjg09Ph0OdE7IlqWLfxcwNdVsMo1RRhlWWiYLcrwH5vRM/HX7WNSHPJGGMV2Pnd2t2l4xRZj6kMqE/foSztPXipPpr9J48k5TRjAjX3y3Rn3JGU8o4zUSRfXlcw1naeh+yY+g02SaUMkIq53c7oEmUMpZSyigxoX/++vgWylBHo5PD4U/Y0JSkaUpTyqfufuYfO+fS2kQUxXFTbUatb8Qqivh+LVyquBGF7GpTpEKwhXamdNXS0HDbNJTDEJRzaGAiiXN6SWlyG2KkFMIYmHyFrEK+iOvuvVNXLtsUHGFOcu9knR//e89rzrHY0I1hDxkRpYbuOxNJ+3FYLvXYaKPX2736k5gQoIFE1RsnIjuW0z3ODKJeJ5BNvzaRtOywBG1DT4SG3t4mcoXS0JnqUf79eErpdSLF0hGMOPxz60PStM6G5OY8+dTR0GvbCMpVrkvMIgrVjydIZ/aYhHQAvF+/1mY19JBE6rGTD9u9zu7etqcAwNXLi1y54xH6LSIm6bgNzf7Xr7nZD6YdFuinnju1Xn/HrzQMIlSkAJ2o1Da4Dd2RSACIkiXTz8r8bDJpnQuHJxe7/LzW2e/v+hWXSIH+Kg39RiT1Qe3a7YD5H/ed5HY9NZ60rMfh8ORio0pD3//S7boABoACACEehOMY+o8tdkMyMSEhMsnh7dqH8Slr6n5YoEOg9ELbFwYEMtcLRCT1weM1RGD98QhZVPzS7Pi4aYake2ZolDr7GvqOXzUIDAMAGBxxN5L6gG5cHEkRcyB312lVConxSdOaDgn0JwH0/S/5q91NBYqBlFIURW0DC52RGDwGZJTt7V42MTll2utnT4TBTj7BAHq+2OsKAwiBSO9OO5L6gEJnQgYCQo+dZreUC6BbISm5HEDv98uZfrfZAAIApRRz1EsxmNDvKiICdBvAQLJytbAQQDenwwH91FPc0xFbeXG57TcUqAMDcKpRr9wgrrvnecyEAlH/qPqd7EJCC90KD/RA6avLmX2/CQaAoQCYqBYlaAZpgvVIEZKQElkLvVvOLbzTV7r1KTzQ+/p4/5LJV1uu0siRtIErIqkfvZAuiQOhuy4BgfTbxY+5d+bUurUUFui01++XyoVsds9HIAB1sLGIpH5UO/kMETV1QImIsumXch/fm5Prlr0SDuinn+JWv7+bXprJ5SvDCjwA4xsBAMpI6kfNdw0jAhCjlKhXq7qce6/zcbY9sRES6GcOoM9tFLKLnRYpgxSwUqgURVI/otAfxYkYCRiBXKfq78wmEhr6uj2WDgf0s2fgAPrKcjFTrsQ1cyLFAPpZjwaMHS3HOVL3PAR0gTwU9VazsPD+3dSkZY5NpEPRJRcbPbO5VeqX00uFmWzRabkKFJBSgdxFNBT6KHbq9jACol7sITrOdiczOx7Ea2MTqY0L4YD+vbRXKqXnAqkv9CvVhgIAQoorEDIaO3SUwXEjHCdEwjgBY73bzH9M6sPdsuyJ/PylMByeQ0++lTultQD6l5lMsdcSDVAEht7YdW5dDsUV9F/ZxVsjHngo2FPoSaft97K61pK0bdMaWy2eD0NtVbdFFnq7a+n0xsrSzOJCuVJ1SREQ8KbrOuJ29LbLoSfyjVCcEQUxMrnV4EbXh/uUbZpjqc/J82EYAj5071tpa2t1bTW9Mr88k81stRyljUkBuK6oRnX1Q9rlW3GP2EMiYsJ609/JJZOm7p+wrdTcWuLtlRD8oUOjmzul2traxsqKlnoxV6g2gww8GwYBAonoxbbDTgWNM3sMgJ4nUcpue2Y2MW7pK920U9/nXr0Mg/uuoXcK7bXVuQD6fCqb2WlJAxUBBAtENKPgUBa7NoKByl1ZRyQhKv5uIpkY14V0216fbqTevAxDa2Ts5mZvufdZ3+lzK0tLqcXccrvZaBgKiID1I0rGHsouPvCQERBdSShFz68tziYntNBN21xf+Zx88fZCCDy52M1OJ9/f09A30hvz82OZXKnbPmihoUDrrtOLeiQPNXkCwfP+5F+FU9fltYUPyUnbtLXQ1z+n378OB/R7orObr5V1zLbxY/rT9ExusdcVLisgBQAsonboQzVJecQIhBKkK0VF19FzSdMMYnTLnhYzL968/UdN0LG/oW/t7xd7O+W0hv7103RqIpdvVl2liNkgAnSd61Fe7jd759KbSh2GcVuFWrswptXUS07qNcZLYmKsWhOboo2YTsuEUp0MowNMZlFBEDJcKrFIIPQSKAJTJkMYyoRLKJEACbhx4+awavwCfoTGpXuff7270sROu5A0OTknJzkcfrzv+7zX+cdrqmZIdrzAPCNr2qR1vAfoV8zj8aPy+uba36AbZU/Tj0z/xb0T6PVxMSK022GW3eX3Qj9NJIxRYJ6CbDpJjf/vkfyLW1KQ7mCOlmpD0sjc86YtAeZu6DguFVixWP8K/d6HjJF1Uw/defTP/9LjY0xFHl8Ui0I4nxfZQw5aTmtJsHJMd81kZg6k3Pz/pyn+WXftSXTX+lfTE+TgiDa5OMH+mhvS3YMfrpxYXbEA+p/nE+/cb4RiQo720vyfH99ALL3jG38fOGq382GRZU583s4o10CnDS6e1OFl+f9k/R9OwGLkuU+2mHBETNEm6nHI5nQmEh4wp+Js2bJitVpxl+APFE+0jDkYC+g/9v5UUn+8jFUHX7EbgHtvCyJLMT5XtNaTgRsJW+aMUL994xRTU7fvoeQPLZ5BuUPDoQzb1xWV1OLsyNaulDvNxGKr1jWrFXn67z73uapmzJ4TgT6589AfcUjGWGTwZBw5AnVi6RxFuYKtVnmmD+1eypDlNumW3Q6devDRpaVHb5n7uXcJCg4TUmQYsk9OTwxPQnZYeZxA5xhRZq2WNYvlj2XlB58dqcZBH/z5oXuPlDEAnQx1C/DvRwjqeNH2UKenQcAfNDKZs9IXp7I0f4sU/NT0o4vzc3Pziw/fJv8D5U5UXF+6mpTSldFCOuSi3HDubhg6J0Yk2+rr1jUHoP8W0Hu9nmKcpbdaC09N/+aUnsMEdNJXRKrub7cJdZ7xReHgJYxSIGvr4xdJ1m7Pwsv0w88Auclkmpt/8pFb44CmHlk8gHPH0FFG7+sZZTSph/bscO3ueDye4DhWTq0uQ71bHpv6zbnjMU6DjHHQNU17AmLuN+gYgA7yajEJ/36YF0WeOYmGTlpqg8zAn5Ht5YxUvi0lmqlHluY/npsz633FPLc//+iDt+NtkbLMaQa7a5ByMknRR7UT1OLg3FkwZzlO0Pk3VpetFudvV2cefEHV9UtjoGNU5sUftYuL1p37pn6F3sWIXDpaGwtHR/m2KIocz/uiofRIazT6V3tOB2it347jFFMPLi3uD0wms2K6NCtm89z8M7fDx0+/MAfJjmRNAXhdz43UtCtqd0O3w7mzibhYLm+urKw4LO5fod/7lKrllEvZQOi12oX269Tjg8S9f5+MJluF2NEsinLkxfh8rvpIKWPLqW9Gk7WEQvKTN94egn5b/GzObDLp5svzanVO1809+PhbgH3q0fkMVBzGpMyZvmzWyaS7i3JCwnEkoLPskc6vrK7Bu7t/GaKYfrynoTZ/WTYQ+njczcHB/+JmyIJLB1G8G0B7lZj6IcswoVBoPMqVT8nkFCY7ZVm+4YE5IEcwH4C4oqvV80v1/Lza0xWTaTC/9MgNY5965BlIuAyYmzL6qSJpk5ovavNcRfM4FxdFf6W8vbpscVidqM38EtBbuLRuKPTWeFyu5O4gWyfbGDB0BHWU3GNHAoam8vnDQ47BEA0/VBuk53K1tC5L0uKN5m1Ev+0PzIqum6rnqiQUKrnB+T6xdtNnN40dVwLJB3V2tcmkIKC3gi771eCEG40WVuQEU3h7ZcVicTgJZBJTVUmSMsplyTDol2qtjFfuufuu5qXqgJ4MhvYupEAAzMmL5SHgsfEiyWT+/RSbDw0ld4MT0VdW/tlgDsxNo3O1nGR4PnhUkAb7+z18Cwb7izeJnWRrmT4qsOQXSc9hRMprd0O4U/H4LidSor88dm0vr65YnQ5c/yaGZiKH1hVl0DQO+oRAL5VzcNjouMDSO1hl2+Nb9bQQ/gW6iGpsiEzRyECeOUUhnoi5Ozf0wRIrH8yZzH3z4LyqVQQQPxb9LOsPlPTeaKBD1t2ck0dAR0MVyNFVVZS+PmxNxlEka0jXiHPnENErmm9jZXXV4XB4Xp4mdmY+kAE9pw0iBj236yFAz4F5KZtqgPrUQ99fQfeFdgpaMe3nkLSRN8rwPl9o2MvB1klrPYPOeu1GFllhSEjMEcph0ec9KeLng2EhiVQjIEB/pItjdTQw6afmG5N0j9zBZgjKl3DwCNO53qgWDVGJOM5OgDqw+wU1ub2x8rrF4XB6kKZjp1WG60TAVC+FxwyBPgXooyFhXkplyxBz9/30fRGbyr6oN3pRE6DkBNg5y7AUFY2eqIMGJDwZmDtrSHL5juFdVrQxngRyBddVq/sDJcYzfDgSSUZqSuoI45ziSfC4CC8/mFMOgH3pBmTHg0tAjp+GogB5TlW1YChKkam4OEdxcZbx52rejeVVEtE9zP1Qfc+VUf84g+ccXIoGnZAk0LVGuZzNpmLNZx+6Z/rZ+vedQpKHqQutVDgf9rMiPCdFsb7oXlpVG3LmqtuGdykZXoSHlS8Swa4gbqtSTKSC/kDML3Rzg0GvfBQOFJLBk6BQyA2q5/Dy2qXxefv0UoaUZDJmHVX3nD4kGXrITnEJkqFTjD/hz6rB9zaX14ih00/fD+al7EyJQFeqOmcgdLUGU081Y3fvPj89/Xy9U+ikj1GQ8XaHAuw8LMLFhymK8rlCnYmCsX3od7wAXbpjIHVEyyfnVU3JkRyt14j4KZoVsIFVH/b2TfpgoJQjQiQVEXk+HJPU6qin54iTN/IdwhHdUXAvDjoOwkyShqpadNntdhr52uEhMnRGDLTqO9vLa2tWh2PL7r//oWe/bX6bLcHWJa1aNuocCYnpkwsYerZ5d7bdfv6hl+v1TjEdBPSdk2Et7MdUbH43z7EUR+HPuqOchAOipBzbQBxSjHuCF4nlJl2SgHxgzoZZnqaEGDDL6kit+P0Rfb9nzkbCkWyA950cF2rI3OET+mZYu2HYp3AMlNwCRY6e0yUdk5Dfh+y0nYbFJEiWjmxNGkY3lt943QkZR9Piy6m7d2ezqdLMTENqjZqUUdBfuVyYDMelFKDn27vtl5+u12HpwROfa28nqXYEv5g/3N2NUxw+Zl+IiDmJTFRkyKykJGlLxlCfJrFcwS6YWlVzKT9lp9mjVEqI1NRRtexnKMrOBKT9z8xnESGWDZxEo8excQsOQYHgM6wTM0Uy9H6/8YVihp3rucvJT9GonU5QCOdMnBXjcSHbS++8t7xqdSKk0z4eKXH7biyVnYFGwmVoj0HQHwT0UWvcbX4L6Lu7yCY7hUIyecwztGvPW29By+UP87scVIidoSDvVJPcwBrrL4uYSk41ojJHkJsUWdF7CEUxgtwfwG5tQeqdVxthvFMb7ImCRkImJ8eEWCnC0sxxsqKNRj0tpxuk5CHi5q4OTugZ2SyZcy0i3ENROzFyhuVZlssLat27vQ3pbrU63Hbet5XYBfUmoJ9h+4XzPGAk9Fol1fxutr37pdthC9fryWQ6CCm35z0ZdoV8+3D3UGRFcKejkPC9Fs6hZc5wsL4/o+SU+Uev+/OcfoQgl3Jqr9oaB4KMzS7GsqlIKterDuQjhqbtLCrGlI2mmHB57jNzKRBolgJoGPDJynBUVZVczrS4dO3WDhE3hy4LOqkZWLquqBiKQ/naR8cTu7sigwDJtqWhbwM5ugVld0BP2193u+Pt2WapNCNro4YnYSD0yaRWyUbuAnrC6tjkO6lCMXnM0HaX15vuRVCWO2ShQVCCZ3z4JiQnWq2h/3qD6DSj9a6XOqx8sQfkrd5I6wpff/XVl2KhUkgWdOAsiQysPt9OfPLpl2ERwZOmgll1oGcDgVQ5gq8Dn4a1n6u5XGZu/rqx48E8p2d9CFyTbD7VJW2koSdNwQFRHLe7e4hiXBjKfWfjjddh5miwuWhhdc3q3G3PxlKlhqxWI263gdAR1Lv11N3ZPOd2WJfXY4VCUfDzlN2+7g1VWkdX+p2NiyxHoUQTxdILxBzJ2k7JhTlZu86ZFVj5ooo2oDaZDOsCZf/yKzFVTgUK2mgyTIUp9Kjzhx99+slHHzk/dbL4vd1mDzdMPXMpIjQbMcYVjaYrw+q5SUG55plrbbdjgAfLLGbEPNl8ZpZMk2FyL0oDOoWQHs/HZzl/WC14NzAO+QmoWzbtIv/G2x8CegDuvZGbtMQto9z7vYA+nCx0C83vENMTjrdfWwkWCp2k4GdoRPUN/qIWZuHciXenGIaiQ769yghtNrKMSbQcbJDM017La+oXxy4B8UXHz9tdtL9Qagay2kgdF495aosKix6H49NPP4p/6XHbNvmwSK3jL5VN+6ZGTGiWYiJtY8IFfVDVM0jgFq8PO5K1/gGMANsBp2DeUtWkNxoCcY5B7TWfyHv8glaLfr6xurb2icNqWbfZjmyvvvmhk4OlN8sNrTq2WwyD/tTlwsXCwrjeRMomxp3WV9+w1YtFQOdou21nzxtsISHyiyzI490zZKIiOq5KUHMHM6fQ8BlQX7wW6mQsxkQce7U3rKRPaJfdX+mmAimtOpKSJ5gz5EXKgtTH6fQ4dhPY9HfbXLQo0ltbtD+mD0zlSCRVirE2Gx+ut6ojrSbpyN+uBTuYL5rNMHOFrCYr0hDMQ/aoDzKD1OEwNsGI4ZrGb7+3svo2oFssWzTnX371bavncPZu89uyrE6S66seg24U4FTCwni4MOwiZWvnE861197aFmJJQGcZj33P6/XG1BgM/Qo5yzEwdls0VBvUZDmD6iF6L6g89a6BOpmRgGJvaL2BnhJ8LpcLyDtF4OvJR/DjTJClyZUmB1b8Dz/Jf5PwOEHdtk6HYd22LS4iVdVKDOESTn79JHnRq06GtUZ/7lqEPFroZhTbzTIZfUWXZTIphqI24toJdA6SiI3UW8mNjTeWSUDHj9MWsb31zuuORB7Q0e2aXERXrQlj7r+j3g/oPy0sdLOxWLu967SuvQZTF5JpkUC3rW/vuEhYJ+JdFOMMBV3CuOw+TEo2GmQgGq8MEjdQ/6+RPzOnN7rD0ShX8DNbLrvQraWSXXU0rPsRuFnWvrW5supGp8oz2z9ze2ZN7QTn/ujLLYuDCcNJrWyhEFI1lWKxSiNAe73BYq2HIp3c0Bef/M8bcJiDxLPw+/iGSlA6GWky6YSiUcoWp2iauHeR5f2dXmEHzKHiYOd421z41XfffN0Z/wV6a9LBf8egdUZANy2MO8OFi3qqOTvLeZxvvvrqG/5YICmE4eBtW67Nbd9wmObxHaBYDpVEQt0X8g3VcaNEhmMPIOdkRZ3/T7Ux6Z6a5LKEYiFit339I6opx9KV1mic5O1blF90ruGzQ4kjITYPPjbnPc74F58dtOOc5yO3c91NsX52a33ddpTrmbpHyW6tGPJG+SJyvJ4mQ3ku/cc+HnaO5U5sNjR0CPccCnF7oagP/XMGLRbiIvn0cauCPssy9LqVMN+CdH//nTetHrZ997tvZ2QV92IB3ZjOKtpspoVaEaZerwdmZ/Nxp+XtV1/bjIXDgC7SlG19c8cb1GppHraeZ0GedIpo/Jcu1JpUxsAcoKN5rPyHHh6SHcilsoT+X+f4hN5aZyKNUqCCb0ASkZwROcfrr5NU1xkPlM1z56a2I55oc9/Ofaw387txJ3BbbIxIb66v00dSr1VPFit1fm89xEdQk58gtpv+U0UHOzf18SIPxM80NBRlwBytNZrj3AwdJ43pcHJ4EYVzx/YaiK+ub9mo8AdvvfOmBd79ux++LQ8n9Z2VZQOhw8o7ydbCz7xd3W8a+RVVt3XcNP1Q2227VbfbdtWNqr45rIGA5BFsRxgxzCAw8QST8jFCqxgysyAYBluNQ4Y6Ac+Q8BEQyLAQIMIoaI1k+rJ56EujPFj5B/rSl0ppV31ptS9t1Pb8nFaq+rntVp5Y8dpxNvacufeee+65P44rQxghr0bXVhDrMQmSeyDERJBEaV+8BHUbBsntF6F+l0kQNnc86tbBVaHC4ynf7U8R6/8vjyuBfDA66FdK2XA8zMiNmjRpTbtCOetlROba+vqP11ft0ds/fe/w8PqZ4e1IdPEqU7xT1M69c25XCuxENuwUFQneiVBuf7Ywn3YqgjKphMK0N5TXp49h9ksvYP72f4zz3XQdbmcA39chDPeIDpfw8BGoGyIhwIJ4TEicH1KcDVHO0V6PTF9yLpsi6NJ/OvxJutVK+Iwm+6mB/oXzwLvwFKGuKujUo2s2gE6rYkEEOWaiHE37fbnqtIINpzvbTICHvkQoPKQmfb+ebpDpC8J9d7fz/6nrn/jkN14512xP+vsdJZZAsIbkxkRSR6026coZcRtN7qrpx5s7Z2tnbi70GxJoRiBwT2GCQiAgKM1z7/SlQDS6t3d5dfNqgAs76ESsO+0ogtqoMP54tkyS/Cjdbr4CRvf/4u3v7cLXiNMBYY/C3OTDVCLl4RjC3ME9YreDAaE9Kvi3fEayvmbiKIrmRPGSYdlg347dUX72fq0JRxVGb9RpHTuEAfrLMzVfOB7NKqByge0IWnWrmVcgyYQCwag3zObivrA6lfHMMqT/gEQD1MtZ1PXpID1ogsBDnSOnnkKl+fiJ5zv7/YaabnV6YsK7F74rNXr5cedxusRjWHU1aAfk9tW17Z/dO/fOPU0gREPJeDz9NM/HhlANY8JQPzyj3g5e2dxcXV9Dr0FTtDfZPZznS+NuNevPpcpj/eioNUj3X/02vKAfH3Pk9lvoW5vpOohtf/Tyh1ksMHG4VcjvaCBjuNSp5HM5jEbjqo1do1jKm5CcuJY3AneGQ0UbHI3KDov5ZN/lVC70bLNZTypXX365rcjyg9h2ZNVkcBoFoVQSYe9hvDTGbf7cpJUJBjNMDDc2wBC9O5E6OVGy3hgg1jFPxFxp+nF1+E986utfPkxr3U5rXoCLg/YW321AY2/N8uUEE9iOrq7bbMiPO2dvnbv+I7kY8Ihqs694PUpTVz28WJfEQDAjFWsLCw1pO7K5vr6+5gkytJv2Cp3WJF/q9YRsPJ4tVWbTQ32QPvPq17Hj8XF1OJj1MEwd6f1m/d6ZzhEwz5Y9cLh7oFvvMEjuojKt+Hwuo8WyarNRFOvmEpLLikjfiN45+wDKTL9V8S1bllc3TuvFm0DfuwA9VP5wNOspMJqhqpuWDVt+QSwlQ8w2FJowyJyPVlvFGP+iVQ8yuDyYvaYqcMjqacyI0Lzda55Z+DJscx+Hs7/y5V2t0dTbpVQulwspNVVunBlNCuUE1DfL+ttvo6+NncWhpbXhT35U5HkhI2dQNjU93U9rYihQkbvtkKhUFE37UV0bFgMRRHsEdNTt9oqTznxcGPfGiVzOm5S6Uxx8q59Bjv+YmDexwERM4WQ/Nb0ATQaVz8PBKhNlgmQBVCzInSoh7majhVpdZSEdhcWwExWd2tgmFb3WbR1nzWaTyeY9pTad+GHbs54sJhLdx8eqIj+4sx1dW112OuNSqIQKHuHQt9Fgc35lIUYQBy328LyHB5vDDCl51B00Fu+RIyXxNui/+p2vfgzN9dX6pN1fUPmcO5wKtbtKsb7fl0P49zysmV1/e33zQaN2pp5ZUL2BO1KImR4F7Iw0gLOiVtGa9QzPS2JTRzbVlKIoZzzF2u7its1y2Y42E9wkURl1FFGZV/i4L57Ip486jUb6VQzbP8Ys9dVmP71L7M73YB/Tp608ejUy5mWicL56SFIUq6OKjxB3G+o5+kyac2c45yUrWFzwwQPlbK3RGiUdxhXT6umdOgTQ1eO2HOMThRFJ8EU0PdBiDc4tv1yGDgd5gQuDT/l87olOKHwMZG5nG9mLgf6QS1X39UH9XYL57iJa1M70u7iJ/9vG8Wt1Te0e6QLDYj4uDyoZtTWSPRyixn55ffPttYg0LCpCN5ucXle5ocjzo0Ym+H5NGzS0tgrprS4HvMLsSE4ovUysNT2QPLGitjv00Eaj28t4wm6O703TeanSFqDW0OVKa4TitPtd1KT/eTLQB5fR70F1x8+PlbVqKpVDQY96GdzGIINlFjHf6aZcWz6KeCEhIFqgCoecuAwb27GzsvL+YufxUxdARz9yaqDDO6POP5RF+B6fvgwuJ2NXdXvNYt3acmWFEMnmUc5LQt3vT3TSqJkhRPv2dmSbYcKpXCqcrUybNYhzEGSJJAv3NuxJ/9MA9bymNkatXtLjZr2xRluodEbtBEyFPHV5fX11PSLXMplGTKoWqqX8OKaFPKlORX73p4qqaH04YzVFa/SERPK4lxTb4e6ooCPWA8NhbbfIshaKZYIc5Wb5bksVpIos0vFwqqC3+o1G/T0E+/9E4b472m2+16yn4YrD8QP9o04hFQ97uAgGU1hQvSPC0yXkO8cYoftcZgphblsFcfcEAPmFt1Z3gjDNKFp9epxyGVeQB+hTfDn1T73RA+gxHrzs5YkC1BHq9ouIdUcpWRaTCPWNDdZOU5DmRmkRjB4yDZ5jcDlPLpxyp8at0bw+GGg1gnu9qY9A4v/71vy1mqoeHx3n+fCem9HS1fy8lRbDHMOwyxRlXF+PDZSArNozgljoVZOlngxTdrFS+6kkq/2DmzcPbmKKPmzMx6FyvlxQsp1CXpIET4DLwNBfD7IUZaGZgJei3EK6IxfknpSg93IhtdXS27X0awj2/4GALOySI8PS+B2neqPHLOXiqTDNMtEIWUdmUM/zLzB3WYw2k820amfRoYsOp3Ppwgpp0WVJnbRaJePyism0SnGnNGM7Af318YeEDyWyhZc7qOoSmvUI5i5OpyMfKvMh3htZ21izU4j15KibjAXROZF1DYbjuHA4R4ero9Eca1Hk9V7g9dpNj175L+/hJ07CfD7qVJMcvXctU9fgdOpUw2EvE7m8bl+/vMdlGoqoZVyCEguP4fCYVIRAqKhqPzs7bO4f7B8c/ObmwcH1M1r7uF1KFkr5cjdZgqU3pMRYFH25rrIU8KYZnqMprzpK424rGa97L5vvYlo/aTf/a4fFF77+5eYusTtjkSUNi+jCwXEyngtToECw8ASifFEExSzMjpOIc/MyBc0d/ZoXYyP/JYBuWovefnBWGrZnrZ7fbFpBW0KdYnZHz1b9UMkEgjDFPH2chvVMuH17Y+Oi0WDdcpWSCTHIRDfs9AZN+X3+UqsrMmg8YQvgPcSb5mezvnih09IHjUHjFlj8rYE+GLX+K5UT1RzLFunWJFkO0xZa0gRVH/Wyfo6JmFZMFrvF7lF1WdI8Plkbqq5SoQrMeTjeteLwvev7RwcEdYT6PmyytbQuZQqwe32IR6M0HtQCnFccSLLmBey0m/XwLEsFGxi7qpVCyR/Pldqjlj7R6q8hPf03qYmU8yZ+EZWiDknmcTsb98dpr5f1BgOEwQUDGVEYHYccCHSj2WIywQppZ8Oi23np0tKF1Z2rZ8/KQ607nYUdBvyYBPTT2/5Gz6aMlQwC2JtKdaeTCpp1WGhWL1qtVqdfONGVIhEweISK3x/q1MloHZUef8CA41G0xx8PdafdBlAnL9eIkxcwTkaZ/OgU+LymtfudPO81uunQQJXmSCg+t8djMZjAae10pkk2GWhuAnt+W07Cw5cJCXIDEXz9+nVAjtUGvCP/cf1gIa2384VxuTAuQHJP64OAl4u1ZaXO4wfAwIPlGYuRjjVnqlwp5RNxf6J63Jphr+s8fL0f/ZZ99wNY4fQ0Bo27twbpbutxDwKA382x0aDHA1WGnJxekkbH5S2XD80aZYbkbmE5t0CjWVtasm1s3z77oKg0RqPSlmF5BaCb2FM8+x0/gVZQBIAezmK0MlKHWA+6vRa1LS87rU5awmwQnsMIqBzqos+f7DcwZSWAM+hLaA8GnDTuXO+o324MiGl/QLYg+pi/vPRRHScDTZ10JkmPb4/2Ko1q/ngm5OJeL2V+y2Y2Uey2uqDKxSLlSde1OmTzXjWfDEm7u2qDnEVAwnx/hEYdy4z46DfXD87V8SW9QrlQqHTSC52uEA6HepKkq1Bp7Ebc+iBnsbiV0VzNlwolny8VmrQ6DbX27kcN9k8gtbcQ47uNNFh7vXkyPs9Bt6Rv2He8oCF8QOSxs5YfzbMkzi1mKKx2i8VL00kvMHe+aVrbvn2nKCm15uOxy2xYNoHHWaKn1qWfKJ+1pFq8g0jnwrlqq6Mi1AMYrFtWDE7nllv28kGOi2B0ZbFQfocv1B/EiN4JzHmOgb7EUv54PCVPR93JoIEEXwMhrqdbOADmI9EhhHmvOxuXaRftjrXVUnU2KefcHLV8GezGzm7L/V1ZEwXGU0uThTti5UpK6X5tcP3gEIX86GgfFjr9DJ6GKfDHdf2g1VXHk0kVVj9V67TSecgJvbzQaA4ZTGRx9yMcZXSVu51eFQQgtRVPjUcdJJHF8+AiH6lTezxKN3dR0OqQJgaD2eNZKY5Kkdu7AiMHh04N5ZxPjkeTLBp0IstQNoq1uykq5iGYWw32ndt3zhYlNX00cSO5XyRV7DQbNgL6YkaR4C7zeOkc9pG7FUWCBr9tN61YrZeWWYEPEOcUS+N2WXw+P9/vJgM88cttA3jWyxl97jiKY6fVndQatxDvg/ogrS9MX/viS//ZrPWGWqvpej4FpTesakK+Park/BxnfMu0srLGRjP16TCjZYQirddUKHSSKuQr6bpa/+DmPmFwR3BSTSbSw7tird5rHO0f4ZMk5Jv4Sknu9drqXJ8LiazcliQ53S9uw2SB/o3z+l25ameM5bdkMu5H89apa1rtFgbt/3Eg9JUvH3XSszrmamTNp94lu8iwlfl9bi+7ARdkwMOEQmJh3JqkXA6Xw2zEEhMNJsFxiQTBfMlsj25ffSArKqboKcfyssm0AtDp0zzvH9nqDRlyZgycncvFsxOYjCThTpBo8BcvGZxWroiMxUUirB1F0ef3+by6HgvxQRT7nRjvodHEA7F4royVp/aggThHda8P6h8hxX/q+7jTDb2bjPvw1EwEMLhuKAcO/NZbb7+9vhGNaR+cUTKyJCjWihaTmtCOsK04V/VDkszxNtLbk6788OSKqZPKfEpy/E38yeFCbaiJvNBWe93JuJyYQLCRlYVmLMrZLUY35eF8rtCsUqkUklD54+Veq1nTtHcxg/mPgswHzXq33R0M4Ac+oXDjVBz13GHhsLYWxIhAFEPgkKNeDmFuRkEnw38aLJIvX7pkvbRksKOgo11TobmXHA4U9Is2k9HNniroOKtQ5eUigZmLp/yJWactnXy0ZlsxGDAY8Ape3oMh64ZtzeKz+Fz+8FzPoNKD1gdB8fAUo9jjx4ZO02k3kIOBJPQaPT3d/zaC/d+kGDTnWk1vJ9AXeHvjUnXSqWRzYdrw1mVIrtFosXk4UMSAJsguJRZqa0VRTOsV4mQn0IK+pduTgfTw4f1H9wH6XQzceuNJ5wioA/abB+eQc2Q+JlTUnsIHdCkQkwR9Co3PbUFRD3toV6o7z/eqhXLZ70/l+01s9C2ex3f8b8P8cOEW4psMlUFg6vp0lI/jwsa5m2Whv3rhcQ9mkpXH4zgJc4PRvIyCDlnI7eER55esBlMEcV6UlZr+geJzGC5evIg4N9rpU305FwxXtSSMkFe3oyydi8MxoaNtiwV21tZsSxcMIPHeIgf9O2q32wiX8/kc4XZHjHE8lrRwZD3HAnUXQjWXLXRGkwl00UXgrqF1R7C//slP/EvMz9fU3lyX6T0fXVJL+V6nm8RojTJcfvvtzWuRq7XpQkXOeAMD0ZPMFLsSH2j0VW0EwP8C+WRQKz58ePvh/Reo40qOe5UJajup7oeAHUNajWEykOAYQRfZopxRpwPo8BajjwozXleu181XetjcQ6pJYjhae3/xta+99O9WbVrNk7yOTAZhH+X8uOzP+QG6BW4Y1stzJ/5RsQ3Mt1xbGKaCilKUnXVTTAC9Ggo6ZkbBO8WirDUO227HFgJ9hYBO20430vG6XIWQgKK+E+H8bjctTeEZzwS20betLhtA4a2eDOthYDG2u91GI1K8i+6NigGyNhiNRCPAnLUA9Xg8nOzCOtdAmSaxXmvU9Om/rOwvfRGCTK89z+d8rnCxmFSOO9UUWLvLuvzW+trmjZ/tXm+IcpLnxXYhmayoiVC73640kbgPyfo5yFpjkLmLMAfkT375+9sAH9H+MCn11Pb0pHe/+RvU/bRSV5mgOJQYWeW9iihLej/gJQ2oz8glfH5hVs0/zReyWb8vO8egWFu897VP/ivSjjBPI6PX6z+qvVvbJb5lktr9WE+D8kNzkR0OA94HmUyvlQfkDuPyss1kJ8TdDhXYCdAvWXGoVPABUs6wMdXDLgdp10BYLRb24qlGOnq2xWpWgNF9B1FLUX660lIxprqzvROxrywvLWHk5hVojonaUdYR6y4/UrwyKoY8AfIo4CLUlMR6OJcdt5ptRDlAP7m0zvSV76NO/pOjKs+rmtruFuAi8grwlszmobg/Z3FYDcu2jcjVxYUFTMQ8gic0ngnJeaGsjNKq/iKvH+4vNBSthsQOzB8+evTsj7/+0/Mn5CNsPd19+PseKQHk636Dp+MgLQ/UIK9pjCR5QkpILmpkjEO73ZSR9tC+1Hyez+er5WwOvl89XRsu3vveP0Mdjp6jBRymVmsMBo3aLSwXN6ezAqLcT++ZLQhzFpwIHI4JZAajkusFh7OZKLPNaHfTAR6QGy45zbZI8Cq6NU3tj3iHA9l95W006RbafuGUQf/qYjWRFGIxJgr4EM10W5cFKYaHYM1mW3FaEetcho4C3zVgTpnNRlCUDEHd44lGN9bYDfzM6EbdOZCwZL81wbK7ppJle4CfXth/5RvI8f+IuSpPunkfiGGhhPCTsmDRZivifDUSld87bAgx2RMS+dB8LLQTScx/u/vkIgJMTVFVwXPj7g3A/OjJ89/+4vqvG799dv8+2XQjsJeq1Ur3MYIdb8B+V64VPYLKFDFtDcUkSeoPeA9H0UaLGxPEeL5TqWJPF8wiXumma4p27xuf/MfM/v0vT/X6u4vQoNQGifNa5/G8jChHbjQjtwPzYJBYxEWxO0u6HA4Xye2Ew9lpCxQhwuHevLBMRbaDd6Qi3DKtjMNlNQB0gjnFmpZOF3QwuXEyhyq+vQMA12ifO6y3lYwAXS66YTNdXEJZN3BFOoqwhj+NshgtLmCVnI0TGLpwduyWRKNr9heoh8Op+WGtog4Ri7ACqSBH9dbha+Dxf4f5UFUmej7u8JcLpd5IT3rxzzoNaGDWIgFiRkiGlACjePk8im5K6OoTQsxJqT6jKTUtEL5x48ZdxPn9Z396/icIc+d+8tvnAB2oX7lxI4uF1eoYVP6Q/A0k+d1hLRbTmEooJEO/zRd6rQpx+hrNZhqFPTGDYRZ8Lu7yj7t1fNu3Xv/k35UiQN5s7NZqal2r1RuLGlnCGOf8pFVzOdxshN2IRHCmN8+H8jPIcFuQ2xEbRqIhg7cHvITDvfmmidqIBh/cgVtmMtV8DqsZoBPZ3UjTFy589lSPcgHoTwu5JOR3HIC0gQQO3a2lKVIxeBtrI6umJQMp7KzAAl0ccwjQzT6nz+Eqz3oheMHA5qAx4g230JLKYeAqj7oaGiZZk4c1DQW+ASPV9/+mtONYzPPKUJ53C3FXrgwGN2pncy5Uc4f18np0e/jBNF0uh6ohJiaFMpVJqdzrTGYHR4cHh/tTHZNU5eq1K3eBOVB/9Px3P3/+Q4ixh/Xf//K3T+5eIZ++dgWj/nJ+rM6PXpA+bDAq6jAYY7SHtzOMKBeEPFIL70WsU8Ys7JLdCR6SQiLn8KlpoP7++df/9rv91OuvHI2gM2sD0pssIs4b3VGrQBD3+7dcbiNL2XEuIIZr4IyzeW7L5TIsX143Wyy2VfTnbg8HAgfFfcW+Fg3E7hRxW0b9sMPpeCHAQo1jjUsXv3TqoOfL4VISCZ3Yhy1ut19uqUUBO8rI8KsXDM4ljIDpABtBKlhbtdihYVshNuUmA97LYxyzAUcIuD2UW8vJ3E1s6ZqqKENpiAnJUFXVmn74yhufeulvMK/I83TBD8zF/HxUCMPUYHU4zOa1oHTrcEHCxG+cTHiKAt+WytKsM2khaAFev4In6eGVK1eu3bhxBZg/+8OTnz8/RxT46wuN3z/55bOH+Py1G9eu0TngnszL+Iu4buJ50WW07bwixbBWVs2HQkqzL4HBoHsDfUw9nUOwL4Vyrvik0a4N318E6n/17b3+6tFI1zRCTBvoSRZ/tIgtjFkyFwcHgf3BD3dEJIJIxxBakEe9+NbWloNaXrcBdLvdwlm8zCVC3N9cXrXDlw3Mldqok3RAcz8B3WQDvbdeOGXQQd8r1RJCDjIc4eLoL/xuraPgGOht9GTEMrdkdaJf5zkuyhHYbas2I+o6LFQzHgQPB+OtReBRhaPSanSH6TCd0Bd6iipLSlHKKEpxCF63e/21r8GG+AJzmDXaEwlunGyoPZ+Fsn4PZcBzb/GI6daCGqazFTmUzWYq5Xmp1G51j49OwrUPf4x0Fzuq14DrlSt37/7k2aNfnST3mzevv/Onnzx58qvn9xHrm9eubF67hq/IhjCRGxHUgfsHxYrKBWU1Ribxqugt5/VuzGIBA6W98VT+OJ8fl0NZX3Yyb7exPEz83ATyr722fwi8kbEaJM5rUI0nncfQFnI50HbAy7JYogS38YDCFWZ5n2MLiotlxWZCLaf23JQ3dpLbl5btKPtXH2SkodoZia4tK4AmkNvsRm556Qcrnzlt0LVqqRxPosXcAerwS7gtZrk/zIhw0Wwjki9ccOJyeGMsS0fIbsmqzWQ2g6z4Ym2RIxQeS2UoBPi0wUCBCeZygp6uqJA+iwqgF4oSnL7N6Wuvf+GlT7z0jTdUpdKeBDBgyZba3V4IfwEqkMGyIXcbctIdDiWTpWQ4JM+FfEmdzWZTMj5dqMPgEUAQ4wKgwPbJCcrn3oEWAzXm+g/fw8dPnv38IZ4JYE5+CyPeQ4KKE9oOPwDsaaUieQQEPMNhgTmZywrtugCTqsuF4UG5Oy49LQH1XKU7wWksUGnQpb3+KjqFBrKVRsgp3tUqvS6mQ6Q396PEgbfb7Hb0L1GPNymO9ZLD6TKimBsoOyqHhcXY0Eui/M0LF1cjO8HAgwdYoO7oZZfTYLhwAZiDxVlYy4WlC9/89CmD/g2tSo6DPSnqUUzOcdGW4ALGMPBJks7NQmIdDQf6dZaNYNyJUEcJdzmcnjosyFGyMoqV4VVqZdlsMLshzIbdxQViuUOoF3HJEgG+fgarwsBc7k26KZ8vDEN6t1D2k97cYGHFfiPg8XmljN/lToTFShpe5c7x7PERIJ/WirLIWQiae2vXNhHm958/u484Rz2/SS4yaXnv508ePbr/SyR+IL65eW3PvQeKkfWEBHhfdR1nSTbEGiY3AuREy7I7xvhojzZg4PY1uvB89CaFSimZivur3bk2VN74BpYoF/qoU7KMOgW8h6hT6mQ2S/rJfAUMzkDZUNe4aISIk4GCPkk5XHgQrGbLMp4lswXmqIzrkhNxftFk39gJ8oEHRU1r6ZzDubVMUjtSJsxzlHXpwsVvnuaQ7UQb08aFQsLvIeaIKGIdBRp5L7AARR70LhqBDG8lnZtzOUbbkc1YkDkCuhmTw3CtEWU5vAp8FCzPRJFYN+CHxfSd19NyUZKG+J/gXQa/CcPBuTdk0PYeBlC+HCfOG2Dt8A0azGaP0pchkPKMz53Dhkhi3k4I3c58Csj3j/pyMXPNfRk4biKlbKKc/+z5o/tPnvzu3Anmv4FxBrC/c+/3QP3R8ydA/crm3rXNvc29PTeWnLNlaYQT1ZuHB3WpznC1THC7yFBmOua2uMV0jMHylgtOJ3KsSbKEIB5Pur3KUHvjTBrZRcAjC3YC5qmoPXWOou2K+/x+F75ry0Vy7iPLsCwwl2dP46BwTkLaUc7RD9IWT8ZxiST3i6bVjZ3tO7GioDSm6bBza8u6hIJuQhEAizMYAPrnTvcFOJHFGuM8nnF3kN8GwhsYqNnxPVMZmAhFMYg4jthNF5bevOS0LgeC0N8I6CZcRrMDiUzqB70sKluEbJ+gxTMsIcVbaBiT2n1FEiH7SJlgTEDEC4JAbl67N0n4ILeH0g0l685tOVEEA7U+z1EWVqn5vIFQOasL5fEsPTt6vL9/NFKF4d29vU2giPhd2wB3f/7s0SPk8j+9gwD/DaQ3XPBR/PD5ExLrz57fvbF5hUC+SgKepqEQJ+dTTN1H+yO1IRkVYYOKBIIM4OLs0boIqmLEQ5iq9Hq4D5gEVCYTSAHKA0URYyAlscxQAvxQEDvHSR/R4FDNtwwGG3gMfPVkHzGmdKp+p4OQUQPiAR0szRp5HlEOEoc+FIJ7AM+92l5AnG9Z0ZsSp/uLkr5EOrdvnfarJnzyjXG+UMIYG0XdAwKPrhu0FlEwkvBDI+mfDF8AO+gcCiKLsk1ZbPiGEe1bBndgQBaDIxs7wHzVboaKZzDjqaFYSjyjZiSxKMDPGBMzcFSTI1zV9qQMEpgNTdoqF4b+7HRRRW3Acy63BfseQjYZKujlZJuEOcr5UVeQM+69a3skbq9d2UBq/ykB98mvfvUcrJ2EOX79pa438Af3Hz36w6OHoHObP8a1vr73Qj4Q+oejdGe6MFAHlChtmJZ+VC/GaDZCM7Ui6/VAE/Wlqk/HpXwIg+LepCcP31cCmZjwQMC3n5GLsqxNZlU8EWjUALnVaqZW7eRWwX9VTk5mScLgrC+WGuwwPLstMc75Ysaygji/ejuA56fd0r3OLRAYxDl0GXQ8tNFpXVq+aPr8aR9fjFPeC3jEs0aOIe0mGPuqHSq7mxZHMFKB1JNYB/FYWnrT7OR4FhqmnbKR53TZ7DBbHR5NYWl2x47nHru4+OQS7oidJTWtNijCOpSB8ZKP4Z1QUcCEkj4XMJ+3JYb1A3NfWC7qjNfPuWVFq0xiISkdrh4fdx8jzqedfCYT3jPiF1DfvLJ34+7t58+egMI9+dWzHwJygP1X0Mlk7efI739m7sx+WqmjOO6+7yaaaIxR4/bgA9ROyxAZ6bUppNtk2kIp6BQmjVFqaytdjWBt1VsEru11o/EiKhjEPRF8wEQTo/HB+A/4oA+auMQnEmPi+jlTFNdX8bQs7cXI8J2zf8/5vYqy7z76Mp4d2IceQSLTQY7CW3h9fWVxWcq58UR5arB4dK0I6noovlA0wmEjqEbyGx835hvp6UieTnxxbS07wT3/QhY2cybbrM+08lh2egz+6nDV7cYhD45H6TnrZu4jsnN8PH8Naq9OyQQ9QeZY+sG8p2dgcJxTFxMZ9Hz9o0rVR9nR2QvkgzL/4JFXfQOD/3FtRkCvQyuGl+jWA2BOVCZUA5KyWO5Ylo0zksqNo+s39o7c2N8fSsCdIoYnVieGd3KD+73Fx4ywBxsh2boLvz4AD0yVmq2akO5oAtq/8G2K5Xa9/nyWaKdkrnaKutdLThsjvV009WAwCSO9VWyZq610fX3ljTeZKl5ftZo6qAUfUcE8etetLz+6/SM6/hUf2yRrgvUe8AI66fq7oE4TBs9OAWf8zgeHHrRRDyJGap3lmMsk3U+UA8W55sJaMZuQblviiWYgnAx7MfEQrdpmmnpNp9Mqr5VfAKxUAWecbT6xqvvRcwnghvt99FLYKTEONUKdCGTfaPv9dMwUp/hzwh1ueE9Bsd25o8c5NMWGUOmskX0mq9Vhp8NBECdtdFjRvOhx97rOZo7tPxWmXMrZxvz8vKGpcYrpPKMeEIPqEzOXZVwV0MGzt4cH5sqfMUKekGTrKDXRHLeumnkiEfYQAUZJ6AYGuaLe3r7BqAbw3rUFuo0CeyJL3WtjqxXz+ZM0QTv5oO5z0G9JtRYt8raKmS2T41EwM1eXO+ui5h+xz84LYkpEeUQbit716P0v/Pgl8hXyiWD+Z3kaD/+LeHUEZX9PqnMMrzK3rDxCghhMpjsfrG/C3V2pH403A2VI89mAX48nEzPZdNLrTcLyJqSl+xJjm1K9WF5rHplLHXkB/1ReMBU/gYg3QuTN9XJnR6c8k4ZqpNOrcNsptVB5VeBnOD2acCAnHJLv3NjTS9wuJzokmuXN5ZVKFR1x0kO3S3FMNEq3QQL58wje/2M5/+qiEIfiScUjoRxE91A0KOQofyT+bDaVoQxP80UdFAOPn1ITgXEcWhSnrnCnErv0O/UnCobXQ7aOsg+4uqgPaJpbdWvxBWtCVtY0mxsbrc5q0u8vlWqdLUZ6ff6qlk6VFwsJFH263K4Vs/NpaO1vbH5AprbemV8yUFNl7BEFJ8nisDt2f9794dNPv/8e4F8Tb/5H4RWgz+6KqoP7yx/ufnjXo/cK7GOjytgYwBPR1daXVxZfeeON8lEiVGoIRStMxgCv3sqEue/I1zaWKMOXIsnM5gbRWzNBh6TQLCZUMtRYUOFSSbFdh+T29kAXDeRzW+0Yt73D7XS4HarbORki856MA/lIf89I3yC2/d7URAY9X9+sSLWOAFAgJxDGKvLnE9Bd/203fY+rVmw0cmyJpCJIzi2a7iGWc/tURZuYKaYScCqoyAJlTw+g97vhj3tE0wn3sPBOB8ir1tFwyDNl6zqsL34UkVYswFtZVjLQy25vrG6VItVk2trYKiUrEZ/PGzaLz1pmygjGMlmKOal0Pb31xkcfsB5mpbZUmgbzUVD3haK33n/Hh7/88MMPPyGff7/7y90C+j+o+m3vA3pXPvnx1rsevXWcNtGYLfj2aXYkfbS1vniMGoJOx62VnQ8mU+m8Va9RDK5QD/64BuqlPJa+0yquFZtzCcJuDze2O6m6uaTeHhTTQyGKAEYPwKBewsVTThSmm0brRHG6Q4nQCI6wZ7inb8g1OTV3eC5llVdfWY2NYBXFuKPpAjqY94I5oA/9x0XYrn1H0+dN0whQRZoi56bCFvVqJOuU0wNPknJl7tUxAKDu6MIeSnFbuPm1QdVJMcLJ6G3gCcjl4+ODxPpdA49dcGgujQacvhZPWFZxo9MRJnguV1xJJ6VBFaM0tgh/w9TV8EYZRTc7pdVFKci80pmHVgzkYDXqDRKzH97+DMhtAfvZb5G/gk66Pjv7OAG8wP7qq899+MPhp+6/f/zWO0fHDo2NHfIpfjicnBy78saxxY5VDKWkZmjEzMySXq5Z7UrMW4mVVufnQR2yY6tT5t+zU4l7XXgxrNZwD+Za6E1Rl0e6LPGkuVWn7gpfAutOYCZ9ZzLaCbdjpGeEqLxvcGhq8g7mHrLZzVeKEWI4h/jzvX6qpjkdgO5GQ8jS/3s56V0L0hBd5rBHmbKZEWSag5hmhQ/9ySK9Kd0zKZa7Dw0eIXdzZwJBfm0xU06Fm7Wf/RXKQjHoCUn7RYK8PoGdHrLKDa2pBavYJEMn4vEn4sXNXDISpHpv6DkMSTIY0IMpq1ErGs+n628coyLzRjstzDNllOnFMYg099/x/i+2nn/XBf02Jpn+hPneC2K5u585gq7bqL9K3e4tYL//riFQP3RIuKkxm7g7sz7zROGoEbey5G3xdCaeXmUcKiyDmkubuUY7V8rD5setW83UFA1fRXUOY657HDgtTBz7fEOBsNHeNMGxn7CGPRMovyqcy9CEYwS5sedG10DUw3r/iYlskVUelNudN9Jlwfe5EBVL6uhzdhP2cw7kOJzrirXGUhzuOwMB9NoQYCfvdqukZAYH5MQzcVhzHlS4p7d3hGK8I54IKRro4qEG+N0p2SnuRCesTZK2Edqj66LqGESHlKF1K0PFHepYJJ0qtMpBb9hf9RtSeYuHY4oRCFrZdi34fLpz7I3Xn35zs1GKEXMrQE6uff/Uo3fsoubfff6bop85e/c/Ic43gvr2YTuEf1tQ/2r3ubduvf9WlH10DCLWIVXxT6c3X1lcPTazUCiH7i9kC+FgRmfrbSdnFbQwG3bmV5foRZTYlrlZb9J3CuF8nQ6uxIHr7h2QYjvOL5xMtGqEdWL4ieFwc6qCaAGa5zZNhnJ7lISGw1Wb1vOvpPzk5/zXBO0DeAL5aXc/Wm+DfjbdlgOQ86+Tdd9M/3vpnAamuroueaRkIBHvSou8S4cbyZsSovWM9NNszchPADD3LVaKW95X1eoJZVwwty08AuzkJKqRKmSLmxslX6RCFL/g9QYp4RrJpXrHLCWDwUcmwlmrVnleXzjGIqDlVTMZeSQSqSqY9tG75u6/98gvv3z/+Xff/fSd/fHDLzTQeczuQ81zL2HHrZ/5rhj4V7sm/u3dT56iLCvxnBNlP+Qm70pml49tQog7kg1EDx+Z8JaJyNLpzUDTZGfAI0larxu5pYo3VtukJmMVogPcvsgIoTbpOX8F6FZGtpMWctcwIyqKW8QfgSkXD46AORbO4fL0eSbvTd2bypQfW4+PADnZOQLkouiqW6iw+HOc5AGEcV0uC4yhpbQRxlW5tDlBHb1G11VJymKxOtSThGzrAk80GNSHR6r+zDhlREk+BoacPaDuw4JNlNEDTxd1se9o+40ONyuW2psb82h3LpV7Qg9qgM5YamERl5JMl4O6t2klN/XWsWeXX3+lnA6i5r5DKPrYnZME7du3/fj9D4C+h/kPX88+LSpNf+0vAub0YMnbAB3UwRzUabhi4cdDmnLo9rFDTocCy9x6ZbHz2NGFI8V7PYWEpvvgCxmFVjwbZh6N0gwG3sTA5+t1nLo1KRfhIIZzOCi3uWDDKIFwuUHKTS8ZVXVLRZqx3grLsNyi58PcJFjxqQB/yECzuLiYJGjvB2P0nKKMlNw1hTQA7+4itT+PDttBCKe2NyjPGMkw1TiyDN1uEw+JUHLw+YLZxzKwZCYneXMAMAnnkH4SHgaQXE7KNIPuHidtGXpMhXs13EBULq63j9SeDp1hQpDp1GBeLEGEycSUZFWJsdX5iQn+j/qTbzILlq08Ea+vH3v2zVcaBn2vMfehMUqod3Kg2bt488+BvCtgTmuNHvlf4UZouyDcDg8f3vPqIu+8/f1X0oIPe5mikEyDnCRZgE/72PNrGZqEE7pa3Kznp8PlZiBD4Wk6ku4s4e0IJM1Ou1huxt1cBQ8HagkDSnaCxevhkSoTStxCTlX0Vko7EW+AGhxcOH7Y5ZqM3quzSa5QXOzEfDDBgNzZZ7NfqetoCnQkmyHndJ/NNoIDEVptzfn5XK4UslG/NyT1FzQ2inN2UlCuelNHU8KymBuS2BwskWHHcDyk4A+oxxLPYeOZjcCK6SmVH/LIxUng5xhRc7nGxmY7X/Xp0KPq0/6kj6KMkc7UdciJC8tb6byZX8G2v7H15psbpcojCswpxenx3BW4//Djt/3wJ8w/B/Nv/wb67AP771CS3z783D7qKPv2/fTmvBDegZ0nFeLE+kJnq7OWKHrZyr5YtqzpmNEyc+lgjIkXCBUSy01H2p1asVjwOuR6Mc8u56DbG1aSzYSPVpmbCM/tHOLuVLzuoBGLldwykwroA1w6DKq4jp5v1f10ZxAgtq25SwI+FN8ppp7M+ICMe9fAW4C+ZISig26PMzAF6F0S1KCiOlSilcTRBI1oSea6QRrpC2kJA8ZwwQ5h9AddknRiy+kqHUl44FQQ89ipqIODNtqrH89Xq159PtdJMqvYr+hGKfCESRkstbKaZJP3jNl69tjmK2/W07S3SWed6ih0cSz7Lz+C+T7on//89Syoz3aR5rn/3dOz+6iffvh3zBE8+wt33vro5K1RUsDeXpSdcUmmZZ6vl+PNJBzWbLnIap1UWU8Z0iuvbMw3amae+eNVzoSxAhTO0F4nLUQVjlUio2Dl/II6sQyWWlXpKvrD6eoIQshDSYb+eSiuZzLoeXDYBt2JApAGiHhUuxInjlEJMrl4YIKBz8ybSwYxlqZElfgkVG7xzVKloaAM7vEnMkw4cDtAkhkA9hupzsGOniBVHxqQIH6IWwO6hQP/57kXkyAh/KBzwOGN5xqtTo3IPRA3W2YERXeHA0bJWpXVncnMI4GAl+Mel5/c5DTapSA1m+ohRR2Lzt3RfA01B3NA/3wP81++nr0b1Lto//4Fuy6fuy8B/e7bXhDQ92F/+5PdR++EVEM8R3bpgOqhtZ5fZUVRNtUMewMp3QhS/a8nAmYylqSG08q1c2l0Pd2xmsVUCGoPLWMX5ksNJ1ThEcHpkyK0KnmtZng1dyAp84lCiJGUbjwM3zaRLT+Z9ZPHd/UaYy6gq6T8/bbmE/m4zyNyP0A597oMmh6mYQYjhBAeajhjWADvGsSQUdnwLoA6M/ch3uoTubGHWqNW0FRZqDI6SoDiQLPFFA70RucownOhpLjMfRTr9XTVZ+jU3xmL8DmCjH3lqL8EddN4JJBLsgRm+VnBPC1zHw6f0N/njtx35i9A3hVAB3kwx7p3BQ78noh2/444HxLZ/3Lk5T/q+nuvfvjjh5z1AuqH+u0KohZ8bJWxjDUrkYW1D1/IIIZvJ810JcLcSsPKbZh58rZ2y8oW4iqa2tPnwuPMeYB8hK4JFRkCd7y5BsOMsN09Qkoz0tsDlHPReydCGQuC4LMpn9vupArmUneVzmsQPSdbg/3M1DoO/QAFt26lTA5kCwWDtPwG9bABXW4v/dLgaPvVSKZlZfQkxTk7Ywd0qBU9zqk5lR8ZHfPgrrgYh52fY+M8kuAOOo14xlqtz1d9FVY0lIP00h1QRPVAtigzsCZN63Ddij+7uLm+zJw6mJMYQREPPPbLaz/++P33v4EO5Dbmd7/++t3f3o2B7+Itz648/ft3mHeYki8I6sDdxfy995778JOXH7zz1nFxqISctI6Zq4IrAa2H/RGG5KvBWq4ETxPWY6SGgV/Ks8Vwo201M4ZtnwdUp6NfzFs/bVQmUtFZIRF5g2o4JPNfN4rN9nhg0rCTZ2m+2ClqPiEcdevrLpdgzuyvTyJA/jajihbmTN0DFVAvzDO5a3iBmgZ/KCCsJw3Y0WyNYK5KDc2ql7mFM3OU3rHphLQyoeVgCZS8HnTwIXV3XD5cwBt7XYNYMyqwrQ0py5jx1EJEuOIai7WMQjb3RqeeCccnPGvxOFPHx16pwaLCnTPZFJ2cevyZU3d3d7///Ps/YP4DmAvodwMqKMvn3+RbgZ0v8njgdXnnzCP7qg7oInc9NTp665SHNhG444jLnc5Ci6wsw8K8xJGCxTFPS+klIjmkZnK6NG49L0eWJYJOSbBGevpGemCEO1W3OHINMpxOuT0s6wBHqNIeGpA2FEthn1iwGiurEbdjuNtGs/03xh1+OXE7sTxvoEpJgriDlhMw8LlSMhlUox4ngMte1SiVOR78vvRBMfKpzno5kUnNSYjXbatI/SlsyDadMTwBqPcRyoi2U8ZxDmLcU9DcLUpxeqocUGIwycIoetxqNubhu2fCoWZWf5J5hg82ktPUrYbRgqHJ8YX7jm4L6GDOExHMb7sb0MF8H+u77wbtB/i6B7l89zrfiTwuoP+m6gL7Uy89dec9d06GNKcU125R/dOrHWqttNULuhEaU9VKumElc4xeoOps5t/IJdP56VqbIw8C3IrYL55A7lb7FRW2EJwyUKQgI8OJQMm1c6hIIpDqZFfelMVS/F+4WUSwi04Y7hDnHHIbuLkH4JlwSv7By4nXpTiFj4RWwnYIU4Fk0COCiZcqDfrh9CXj1kIhzkxr1EZ9QAI6xjHj/IDQAjBiQC51d8ltKViZ8Wy9VcxXK2agUNT8FX+VjZCJoFXQGTNIs7Jsoh584tgiS47ycFIw7m6XhxjutaOnArrAjoC7jfltYL4ngAvACJ/l+z9r/dP2m7t7oZwAzsdbTz310lsPjt06HgrKpdyiKOzBXMC+F4reZnguoAarkfCGpI9CiYpZZrthVkrTlY0GFXqth2k0IKflAobQwWQ6WQ/rcG98QC6bP3kbCxUwmlZxJtuIwakS0Hlb4l4UW24UzY7gHBh6VQHz4487eDn+pOsyZomhTsaXBoXRGfcGgZyn+C63yzlAAToYNutFEzbkEGkZeTio94uJNxReuqRkJ/a9i7rDQV2mXa9lMe6BibWQRp8lpktBJJWKlSrpNEnyUc/as4tb6x/lK0KegkA8GB2ffPioKDpPW9kRPv1sg45Df53Hn6SLO0/7C7re1fav35cI/j1QF3nrrbeeQh4cvR/nbd/AUHjiC6162cpYemH8DpbrJCNpK7aU5jfh1yxQjWUD7nSj3aildEe/rehcWJ/b4wY+If3CotC6g+fSLvNABKdhO9/ZzEO3qI44RLqge4YI9Nmx2z8s23RG7TbsVaf9HzAH9dOuM02qsfBhNZcQQSa8ni73jbbQAOJAE5VkOLOZMXSvJGV7fTcqdNqUe4BkjpnsvbK74K7G4zU8eqkajAesgtdZ8SXNZDgVzqSMZCmdNuLBtUTqycWtj44t5SM+4QzCK+QwytdOPfXUbRFBHdh5/HL3bb9jvQ86GCNdzPce/OvTAA/qt1GCF+liDug87rx9nEEdusGgrvrdmaNFnI9lNCeGWK4T8E5bpTzjqBWqh4VSuyaqTgcOr6729yBA7iQPZTnZFFtZCE5s8qNUaVVVVCPetDY+qkGY9VGpB/JuCDcgOoRtl06bkz0btw9hKCbOOOG4/4ccf1ozYUJppjWMqguJQsN5QRnQXF1rzoX4VElpW6UwTRnCN2y540bardTdydKiaLnEcnzhbujnLC32+TSqEWMivsbAVGy6/mYlmQpaKc00zLTptbL6zOLM1jGTP7PNDVY9DIC+9szR7W2eNup7mN8mUO/b9z99D9LA/jpfu4Kq29b/F9urd7Wcp6j6XXeO3U/piXoTjNagoi4Uy2UI2lpzKhSPh81YOjed5owaUstSbqmeK5G2bTDLnAn7bMwdGGrprquQKTVdQc2FIiMJu5y2ZsVzW508U89VieDAHMABXVMlxDciBCzKwMDY2OigR7vqoJO1E044YR/1Akv8BXXXkKLw205QtWD4wSZCiqGSwNcdCsVSW2ZoXEOtxYff2DdC8tYzfi+GbACbL3k8N0iPwvDuRq1dEeteKKi+ir/UeIPFiuFCPAjoZkCvh+ozM1tv1JggAPN+Sdbm5tYePnUbRe8KoCM/gvlfsP6LtiN7qM8ieyb/x+cw74AO3KLq8vXW2++cioaCXdRhaj+Rpb6eKYSOTBrsNU/HGtP5fG0mjYWfz7ftutxSq2ZZcaVfbLvdA5e5ACH79uPKh+HIOFgEyl7NgLlkrTSEPTkC5r1Cc+2CTo+HNYtuuUDsBJC7PfE/JGsnnHAAdp6FvFeez+aAvXpsxmS9WIi+KmZMAfUQiZtsrnZRaXbx6MOxe1kM22ommbKlxC5RfC82nhFsyeUG7WCVT32OMDOibGn1Ryopvayo3lg1n2v707F4QXaomnFvS7cem1lZ7Mikd5WJ7UGVWOjwyaei5b/Jl7sit932+uu3/VEAn+e/CW4fdec22RaX3kXb/gzod91OE9FLviVzGW4tcbQoqOuZuZDsSkvj0ku1TQO6B9+2Gqy1R9Xni5mgT8IUJ+whjdSG5mrE7pz3jvRBlhhgO4teyq22piOYdnJ5e/hcxC62Ms1odJl01G0xoVoAzH9bX3TRFVewdO8/Fjhyyxdec+WlbFGzUb8kxblIOGw6Aw4Z8COG16i9St7mdPe5CF9ZQKTBHTVbmIShqHQL0QEoQnCkKVn1UYfgPYBXA/HGRrsxXaUuY6UcBDKR6XwuUoolCl6yNpYrNnUwXzlGEOentOl2w1CYvPdhwfzozh9hx6EDOlDzsEVe88J+7AP9R9RJ6OVHPnwORbfx/s3C3z9ESkgk5gb0fiZLieTquHUx8KYeN/M5Du9rxITZk6uwmQTQc61G1jIUyk5cPGUZ5ndCyeHuKsAeuitjnsnB8TA1xqWYn7uXf4EINcaNb0POqlOcAdVYIFcV2xMYN5y0p2Lncjj8mVf/96kbMJefffHkZ67eg/3Eiydoc3skeLNp3G6DV4TwODPFCfEDcy61jWTMn2wZwVCUouwQyTnajq5j46PCqhLanzMUT7TZvFv155fMsuYOGz5fpJQPhtVMIpgqmaZeTi7MbG0tzyenffa0jwLHdOqFUwTxP8lrtl3/i/zR3PPKvhP+rO6sJfr6zOfeeus31BFAv/PR228dnwR0p+tGh4vK+Uq21mplWO4ZolCYq8yXInnGVykULaXTG/N5OusMc7dNzdEn9t1FrKOFVRtzApk+chiG9plVLm6KN4/5eF86uIckT0NxyNU8RrAf5VekNif/tX4DyZoo+flXXnPK668v/Me7R/b8+ETtjTfXZ069+mKMvKTrcQlTPG5VegrY+Mk5WmmMaNrkKOpLXDrX4A1FtHpTndRsdy83wy233AhnYpA+nFh3xhLNXGujUapOl3K5TH/IiLgh13idoVDG9ObyGR0++OLK1rFOchqHPuzuB3POyz3lKIq+w+MTwZvPX2w/fttts/uGff8DZPmy9z0i38tbs79H+LOv7e5BDtx8iDx614O3TsH8lEZrL0EZXNgN1peFCzqjxUzGp4k3GWZluMHM12pkbbFcmwDeq8qdjQ1zer0OEhamUak284qiSzif3rRk21KsKvvcKUshNkfGMUikr2IS3JzhwR3jVL1JkrUu5Fc/9OzTy61rD6Lpgqov5bbeXL7v1J0u7Cddl9B1ceQulWYLzs8zIftNRfm5DgllHMKDYqJZDazFg1Hhut9+0yigk8qyaWOQVQbUcpj4ybKO2cei6FTGHwkHNZ+dk4VCqQkjbaSMpveJlZWP3mAFCOPKEBI4nDA6dfShhQWwBvfdT4B8Z/vL7e3333/mZBvaM/n4m/DePvDdV7N33zYrIfzjLxyGJbdn2n+Tl567+a5bWRELV8MhFL7pTq2Gged4Ko3rzsTilYicYEIav5SnsV6BGsu0XzEN6KQm8Hv3qI99vVz3IH+ERKmUhSbgnw76+7uY9wnVWfIdhh9CunNEFJ3qHKRDrxa+6owTj2ffwfU7pz78DYNblQsOJo4/8aw8h5qcfN8zOzvX8RudAOpJPUgEj0D74xlnphSKHDqMBrsGnPi3YaJ4Zt4ya2GNmp3YdBSdPwVGvo8AoF8x4pyg1MhVKbzlTCruEXVhttnv5rIJk3WKcRlrZmZzvVGpkMyAOiExowFn7uzsdEHnWZfvv/jyyAsvvH/fmXuA2l/+Kvv+HcS7+M/OPlu84/DhT95+1bbvL/2GOgTZR0cZyQ6Tt9Hud2uxdKfdXm2zXhC6o2F6kwZr0+pv1mO+abPSbuTTyQiniGyYXjptErBwX2PcwdwFrh6stZFZzXGLsGmKtx1ChRODKAri1riR5cwWxQXjQLYxhcOpc0476aSLr9sRzJc/mp8+52CKsZTirp3Ot9eXZ57f2Xn3ujNOO+2sDCuCx9F09NrlkCZinDxF+mYYLDAnHRHUfd4QAX62qQkFFhuP+ZN+K7A7+HE9IcdyMyKWzpm6n6mpCU7Hdh8KaEYmbKQThqWvbK6srFCOFboZpi80Pj63cyo479igf7K9s7az8+XuV1+9fIQFCe8/fCaa/m+yb93lM4r+4rPZicDLd7z89vZTr+65cxH78+EH2UMa0gCdiEsJeYvtGovFWBvAfHE6GWT2wvv005slfzWXn29j3yOoes0yJGsjPwVyhhmw7DKoyDGaejkb8eEMwBwzjuOHUQbsAE8bLmTwpqKIrR8a07ihTMdl55x11btg/tDrr2ylYwfWUcfAJ4lZP1p+6Jnt7XdfOO/yyxR2A04yycF8KmkGDyUOU5avoO4Cc+5m2SHqDIbcmi9UnFPdHtpudtUddZeng6PJmPDOVWNp9tRpEd2npTjDce7IuBJOQFIK5FKNrZnNY/P5mN8O4jQi97nJ12xPDt5f7oD52tr2l18xgHz4MLu4Tt957V8s+76D73p4MD9z7fAdgTteZqvk7oPvgfpL7z31Bzl8+3jUwE7B2O9H1UtbtTbJuBeOHAXJiBGOxVLWvMFK1KVKS/rq/lob9DWaLkgPmIM+v7EbclzYKnqrstmdjVGwYKXdJBkrKgAdQQuDudAonEOjo7draixdqvbfMnQEyJ85ZXa5xf7rA+y0nfQrdWfa01gdhfG4jIhbjPGtr/wEUntbWqUDYylMV25b6bTFbjIIlGLLUqAqEotCRYqD66iogLjMuGDcMqCiZnTc9xWXuM9EozGuiSb6O7cFd+M78XBvKc5MYnnu2Z9z/sc4Weq7E9TR9YXh2pOM7lQMNrPJSM6BQiiwniyWWi4doNdoYjSLq3JjtPSePtUYoguvNdgQXLtedfRdSuPBS5Er2T+kWhlioiM5Ph7a4g44AxHHuH/nvWyIg7Jgk3nvBp+sNli6XuI3LPyqWHkw/5p1QrPLxT5UHdinjwTSvwEeKWPOfUVwavcUiKPq+5Z3SaqOjpeEZttVuzsaZKsS/D54NBbYzjeAOmvOHV4cj9Oa7BtycsSac8hO1lbg9FR78hZ4FVbMN2aMqEVq6lBgIRr1jauNis3OgCTNVT5+eWaJQisO0apClmKaiTU0NUxtWKyt0aHGk3OVRCrnfsZZP7iR/5IuddARqpeSc/+mw86dXlrZOxZitQAN1BITAsoAWYjZYyX2JBbREBdjDqX9dFJdC9Zf70gJg4Y/EAYs2lDlczv6iY5s/miyEAh4HQp9Z/PpCpwJvRq2hgOtEXbO3LYYGey04/OMSgOKjke/bwXIVxFesPD797/04IHl5fYikItUVvz8txb+SC1vk2LtRX3gzcULyK/W73rsDlAvQ76Lu2Nsi4BeKswZmWi9bQcjtQTwrmjA6o9mdthP90fdjFInk0mOVYRYwX7BfNQuo02Sl5ohECguxeXp9jDhoqdCh9kDc03DpUrBgFCd15q0Qa7AO2IU9EYVFp7J3Fi3UIme3/nZtfdO2nF9/yVdiljOKllm5JJNbEhd2bsQNlRV5YJwY33wm7VgrtFsDZsAnRCF9Exo7fwVIcXCBiEvVcJBabWIfdeUPYZ1704kvfbs5GTKb1GHnG5pLAbDVr0F/lig27nz3tsuuTRDuiaTAKYQHj1eUQHYCHZ9SXK2rw88+OCBfbNjxTFQLwG/UvG3qAvk5GuXj085gBy8S/d9VzVdRTf9t6o+en6uOe6G5m/QE00o1s78bTtuuXR8MOFwBqLsvenG7lqjUa95MN0Jg4ZFBYmRPHM3OhI1MNcJ112xOFNB/rXNSLlaIC9FcKi5sEkRT3ZI6rHKNn5U8IOBgP7kmlzlytJ9FXfeenW/E8y9/ymNgmT9WA5f88re9kuIpfZWFuP6k2qD8Voo0fguyorAbnRYarH3fLIqgBetRthAUKeYhW0YDNNmK1n4KmPMk6CTYfcTu2Mt3SYdx0Do0WmT02b1uDmfPXLvzM7rkoMlj26hX+EbXrhTtHxpfmV+nkgHNd/z0oMvPbI8hhTLsiCBPBb8T+b9PCz/7Wcced6mfodDU3GukhRn65vQ9XXEuXaNFtumRNUtirLlNIVJhZ2Afksy2gfDwxvNyEitjVYT9j2aSg8mmXxgdD3tt+vEp1dj2YjRgkEFQ0eUBruVtWHwJbgU1IPflhwDLiV4KBf0UvWyijblatTFintXlyrmrrvnkjQ7dhUvkft/KgcfRz2a7JQJv01zgvpC0FWjj+d4cKF7s64e7pr5pLiLpqsIGeoa6HCILHV6eLCNFs4+rilNQ/iGPf0DfXnOSGHpp2pzmPVW1/yNHEk6YTFbAjBFLTupy9xCEUu4BjxaMarudwrkKysr3IL5D3seev6hhx6ZFdBR9mUw5wb4lYv+DPuRhHGcmz8/5Zji+p3sq28SXS8Z9/tBfRQD394B1Y+ekWmLvtHq6kx/yx7hgrePs8+dVltf/w0XJJxRCG3ZdDIfzUChQtNZbEpXHSHjtuRSwoYCcyAGch51MgEq12aThczM6w7QXSWrFXa8UmcxxgO6xlCxcuW++you/OzanZ0MbRlN/zEXVjPw0vWVjTs33Hjl3NJKZbEvFzJUh+JQe8S8K3ril5MMoRDBnR7Qyx1UQR2LXlur06EENRzdhwk4SRePh/HoWWhSk9mUYgyYFZfjgghnId/WmxhyeFLu7p0UZjhVwSZOD9DZ31JxPZAL4HtXllbB/JHnn3/yyUf2gXi7BjuXiMR0e6//ed2Tywu4A/umiTEU/LfimWIhxcpo/Zquo+Q4dV5G23tahmE9wPiuOUnPwoLnniOAj6opis6Re/ui7skLgi7INFZ6bUlJ1SMj+ZGswngTig7/3WU4mV3J/J8rWp+dC167zDQ7hWlLlYMCvEAupGfa7xxwOLywd2WFRG3TXc8U+C2zSOfo4/7zlvpBhx4rXDjZ7J2dPvLCiaWB8YXWMON7objBQn8d0gFLhHQnKzFprvP58OCCu9AoJD83GJh14H1DTia2YnEIlHms+2Qk6TC640ZKMqhGo+KMzMGd6XNdccXMYp4lgmZpO5saQnWxlcvBGj2fX1kB8v0/vPT8l18++dDrd4y1BwF9XYqAv7BQrKz4FXK0XN4MyB5obl7km/Yuy5Lghd2oen3T/cu7SN1KqHMvtMW1xgst7kaTe5ClkTt2pO0Jh+q8cdJPp8yUUC1OuzOSyaczSU4d3FHIR7xGM4xP2uG0VHlYmV3kgwM4QiuGsjo9KZZveaLUb8xMv6Ap2PuYi2M8KnmSqcds+uw6qFQsqVG2WY7ZABy5g444ViibNpJOf+uVR06zimdhgRC+pjrmqsYvEa7LlAdaHFP4NEC7puyIuLpqaNFSlPOF9KFhTzeTUkNewjie6z6Xvm7YQVfFc2lvX4qFH2pieufMokRxZoJfg4+iew6HDtqgLpjvef2h57988sknxbq3r2NeLH1xoe+rhwE1iIuWY9qn13AuvXCf7zlf1ZaEr2qgb79/FrDlkpeehfNH4+yqdyoGiqYcZfItW4by0UDQ7e5PXzDA6Lk7aLFQf09mid+TnfZu7LuTVhsTQGbIMhoDjt4iVk4Ql9qlkRqlyea0QpvjTyn36THubGlgrqG4FzW/7/obP/tsZ8Zmo/Qhk4sbgi91yHFHa3tfjXTD1EvvunBivnt8YawYjzG8UEvVsVogNxKoWuJw5uQTgTlQi3HTcnP+SjUeHuA5ZbY/kZ7EuiczBcXY7zLUBV06k8fktXaHA2rCMnHF3Iy0pYbM6EIDmIemr8eyA/pqGfMvn/wS1PcsLwvov1X1MujATtouX3Jd396VA+cS4mui8iWo37ervn5zUxO6jo6vyWhlc0uLS6UwV6032zOD+UUYMml/Ksp62qg/ojaaUy6FBnLEW7Lv6ZHCiFaUQ4sReuta9kauopd0hg6TDuNOCc4ky9JhVpg1lmesutoX3ruEmk/jzK8s2HH0ih6zf/R/7tDLqB9D+C0VN2JXf3Zu09x8f2VlcSw3jG/3NQgRis+mgyNIm9RiRPTVa5ouVHdBXt4Q0g57UoA+aMvg0jNW9zy92VbF5rCerrMFW2ErDHOY0uIIRXcbKTq8wVCoeKdgLpeA/t5DX3754osvPvnQN7NlTedeV/eyYOMvOvJIYD/7orEWdg9g1RFAX4e8RUAnkpsF9PoS6k27yOB2ibq3TzXHSNucrFAyD7FG9hkqNClr0BMN+NkECNEn7LGxmqLgLxC/RwnlCvm0BWqYtiAOxE+X6iOQ62skXBMSFRQjt1unO92MnxNLQGG5tjo2trCCLF1/3T039bsgz1DWAPWjNwxH7vBjarVOmqDuNaUu3DTdP07YlGO5XE01nBgGlrDxZvHNqlsDvQZZg12KlCWlN3LE1kBfekjYJxG7Ep6oafCN6S1hFaMZcbgTloErpmeu5gwNsZFCgPWFLrpPs+vycmD/60+COUIcR+xeBp0LKX8r2/mFeSrym8a7ptjwzwXwZYlzt5RUnWdhP5jXY+DrH1teU/XRXaOrbed3MZAiO1Qa7ZnMLTM7oEVFw67opN2mpkw2R0DPWjV4ciODkxmnfUehkPfbAFQmHqTNhm2v0kumJubaBOKKVTVBJuGPiW5JTk1VtcPtC2A+v3T9YddeewP7n6XTLh3Fug0w6PBrti5FRFmLIfsPrf2bbhQTvxCO+2I+MnM530MbFSA2ZQuNGIVyNFclYAvsmnOHC9Hdn05yXMdktFVnTU1UN4TaDe6pYl9kMuNxhH0V0zOLtw0SL4ntIBb2VV6O0xM937t6YM97QK7Jq+88ONu+LhrcBHXBMS6k7Np/6kLLp9YB5wdEvrm1n+RltaUeEc9+x/L2konvIXurbB72ycrDBqyXMzu5SAc1ZWqNWwKRQoJjfdQAJFBWkdtvIZKz2oP5AkmbrvE0PqUIkGP8qtlrogduGU1UXaR02HuEdky1zpDLtRPAzU/M3Xjt4zNBk0DOr5bLctQGCOJ+DeaOBnVjjQb7kN3ouuCwOVH2cJjdXKEGcV2i0qBOncUXMxmMVRqBSj4/kJeELD0W6O4uRG2ZyWRWVRhzaB7tyBmGz58KJjsznj5fsWLu3uPznV7baQQ5MuwxfBhBHHqOHNivYf69BvrrePTfoy6vZV0PAvtCsasFNUcE3D8JoIsU921tqtf8+nZBXRSdr117u7rk4JoGGVJTosl7n8uPJFysCrbC/g8yqh4wXqz04dRZb5bMKIHUSCFLx3ztU2LDMXKn6bdBGIcFZXfCjoUoLf8dvdFRqsjFOTN7BWd++7XXjfh1mp9XFKFNHbshBh3W5GBBHZEHUivDOSY2TXTj2BfiMeHAi1aDL0K3yeSIYaoMek3XNXde1vVYrLWb3bp2qcwYTY6BIqC318ZzLZ5MZ8bRali5/jKYcZ3UX7Ee7L6ILVVIAIey713Z/8NDXwJ5WdMfLoMe5uatpG9oOT+OFbmKY109o5uvGkXRwZeL+/eYx0o2/+t6QBcDv3n77LLm0wX4q1ZRdZ+vo1lhY05ncuReAvSgu+iiAptlSs0d0DlN3ZNpzr3IsMjQNZ4nabOVQacYC2GQGI5AVAqx8ODMhHgoeg0ZLOvEwrn2Is2C+QuI324aiLJpSMQojQplYwTuv63Maahr1Alagvxvhq84bAILL0e1yWiboYw640yN5rphqwJwEtCJay8b+JpYrK87nxZCaTZtVsP9laG2hrEa35icrxLtq4tNXHbZ4nOD5GtS5WEyJHcneIue79VqMiXM3/z0xU9eWtY0fP1FBMRLrh3IR3vkC1MNwF1loLnd3Lxqlyqgr+4G9dK1fXnfrqYS5puLua54SECnxUqi8cyOEcjQ7EH1Z5NqFMqc8WLLpZSRO/OZyYxV6U5z1P466IgohYTiFGT4u9pZLadrk5s+3/BYrh3TPj8/DeQXeLSRGgTzTnt6owTuv0vcBHX6qVx6Lp0SvOKw+fHW8Bio18poW8mJn65xAy1qHQ98LbuTyqDz6+AsG0ozkSE/y6MiNjZAjxeba9obOtpb2L8eHa9ZqLis96Y0s2vs3IRXGGr5iSIcqHMd+Oih5wXwN99669NPX/0Al/5buNHzMHc5qGsZHd3cM1oP5gL7/ZzaA+7rIsCHuLWwfnZ1c1M9V/12LDzN1iai+KaeXR33bWPzlO/ibduYxc4k7xWn7uCE6ahKYY5lwSwQui0TSdpHsklP1NTHCt3BISI5pJFOm4gisFvicYnsIERLx4md/ix4z421zy/NT/Tec/Wlk6U5jkZ50VGZ3wCVuL+oxx5NwV2huSYETgRqcrD3ivGFXHscrWzwlVCvITWRwpOZI8lx9Nj4Euyg7nN5xoWEEPUks1FrIOXOTVfXsBF+qp1qiCfQsHT9hTPPZKDA6gV0X8fC5ej4XrkOYNvB/FMwB/VPXn+YhO03EhYzX3bsu0dHt/bI3UNoDvq7rpKAbk2iZdy5o6LqWqrOF5pe3ySoN4mu9+QqR0O+Lk6gsumGOiefuxenTtbmirIMXFUdLqNx4AY/h7EWklGmmFpThUJ2DXQZcgdyqpT0j9AACeoNJ50si4RC8Vgul6tcmp/uvframay0jvm7VaLm4tGPPm7DBO6/Q70WEYarXkRsvM09cOXcwkJwOCd7xSjhiBPXn3462SpiiMco3qx7+6qQK9DfVxj0RrMRzxDbVc2hy5lrHEbVu1xq2BKvuOzKmUs7rTrakobmho6pO1fBmy/0fE9Zz19565VXnvrgkeUy2rl1yNdgP3/bZmQrqt6DbN4sSn9VS8v9a6h3RbvklRfN25OqI1tLjn37geXtEsDzb1fZU9DVwPy9jkLSyOKOfKIPAo1VdF0N6C1ujtOapNQQ8TtUS6DAYQh2cyk1hV0Hq5ITkQN18ls4iUyt5uRqGAh0HVgenZjmiPSb7rmyzy8r3qWBS28OMRpO2JCYw6M5ymJAQLZk4W06JhHUCzbNaadsx2SxoGg7TQbRay1nDQ0btBRGpJop7YFUwWqTDQ8KC4p0+ukJClMx33Ac/nNDa8UlvYvpTpN04UXRV78GcEF99aM9oudvvQXigvmHYt3Df9L03WNjU81oOCJ48yXf+C6w/ypdrpYud5dgLqXYA03ouabqGPgzQR3YAb3rvraWrotRdZ3Nli1cxw65BBsKoLBa6RDojBNzGdsg8XvCrxLZjbCCy26G80v+ovlzo5t9JGTmXCfzwKPl8VwcZnff/PwFnMC7mPArUqQBdRRHEDcaN6ael9hTtYYSm11QB5whmA4218CNl7EUWk5nEtwNgrFGJcGd0V4NNYC36DqbJFLjxHHOpJwpHgySwyaOjG2pHh6VQ8ByvkrGWhYzfkWsHYPJ7URxlYL66g+vk6yh5gL6zTe//8Hby4Cc+xVy/KTI2O4ONHzrZgS0ubU3pW8dBHSi4KLoaze4E7/vqm8CdRw7Bv7Mq/bfcSagc1XmOtiYJ2s7se+Lz6RTiZTSCoExyqkPimdTQk6bjHSO+JMOq6mf8kwZdMm4LSFfjVg6FF/MnKGB/IQzHFiPOTDRe9M99xYoMqPhW5h7ECcpUnv0xinK/IWuN2io60ti0yHs0LKMX9g7wNZ/H+fqgjoQi6pzC+onGSBHVqHvnGfTN56K2P0yCsmKf1TCcePcli0dODuu+ETvJTPPdXYat+hrm1H0c5fW/Pme51H0EuZP3fz+E88+MtueC4fLqAeBn2IHrLeutlPAF9T/JFvx8h3a8W3AXRZ3ixbe7ZtFx7ei5uLWtzfdv/8qieF7rhq9r7mr2WJEhtgGfN1IIZFyhVUObYDoqr/iEjfTtNF0NB/FqZs41puDoAEd0RtCtVXaB9eMfY1EpMMORzjA0ueJxauv3ilLwTmX6bQtbVtqSkU7Rvw3rp6Xdb2s7HoRwdwsXDZTeLp3otUBaVK2RxpOPUnbnKrRBYUjapDVgvRPxum2+K1JflHBsJt/75y4K1DVBgvOHW4IV/T20l90KqdtubjZ5ytevlcTwfx5MBfIH7hZMH96Hwl5ybrv3h0GcYGfmH0zpn3rGuRi3vmhbQ11dL4L2EU0G6/dyO79wC2hHKCD+vZZNkQL7KNjxHIKREbzkD17y/Fi3z3uoFP03KluSvi9FKTT2UJy0KNaCmg64TtRiwwh85kREMejEfmG6hwBByfE9u1cvP3G/owNyFF0DMIWuGXEvSbM2sbGvBzDr8MuqDeSa8p+EE/3hVckWD5WK0OOGuY88Ujpsac8RyW9O5HO2qlweHytYTFs/tQlc1u2cZ6JO1hbWXHJzE3MDpll+Wuz7/KlShBf1TD/cg10MP/i6c8J3dcjdu0iTWs75ZQS1qBetu9A3dbWBt68E9RPGRWg11DnnRbLQZUD8K2CuvRezjyw//4zr5Lq3H0drF1ohi0wlEwfz1GfiYgpBfldderGr1T9dkZdkpEI6wk8lgiF2Gyjea3PgJQ3FTCD7rM6HI7gePcVt189Q/SGMN3IBh1+YfJQ0L001B67YZos/5CvG8qyru3y5PIpTK3Tvf2BuDbdpm0WEl3HufOCVIV8oukZrycJ+UgUfZviTw5sCgG6iktfuv7KZ57p9CvUppo7uiqvrxQ1P/DD63Am1jB/6v1Hn336hf27QVsMPGiLno8Vp7a29WwF79/b9D/IKZiBDtBek2gJ/X37toN6SQR0UH/srLNg0+xe2cZSQd82vW2wMHNTvsAkfdjDcm+rfa4/CktZsVkL2Xxn1uPMjKTzSTS9rOJygz6mnVEttZXjVsfnrr7x0qQiuoE90Jb4S/ajgDjDDsccvtExpzZ3+LEym1jWdaRKnlu4fsIZYUfwfMDtAvL1/LyMOYOroThpeqfiSap1xVaTzdisdGZSvf3muphbHY4vXdR703Nev1BgGzpiP2uQ02R5+cvvvy9h/koJ8zeWBfTZkoVHirt7etrAG8eNeQd7Eew6MKPqGtzcqPopWzXY13DnG2/Pn/r6TAEdA49sP7PprHMe2XPHNcC+a3Wqo6FhdNs2W2fhueNvwb5b1bTfmok6LwmoQlq3+wuDO/xJj9N7aUFyNkEbEXemaTmUfbfDoSa6L7m6N1HaMEQ/XTZ7oyHgjigmMe0brQ731wSqo46uFQMvoi0x5ohIMfPErjAGHBdcEHBRowN4wV2MfCmogQUz3lfws0XdYyl6dEOmi22Dg8nuK7YQHoV97RUX9l6d7/SbCRCauyqgYIqev/fg869Jhr6u50+/8BWjCqwFQ8eBHlXvEEzXwjes+poAOMYdxE85pYw6sGPlO8B6DXOR/XcQxYE5bRdC+DPPPOeaR/Y8rE2vfz3aMdo8us1oL+SPvy2dSHhI1TtVa+TeqOqEs6p4J+muZmm0PVcoREjUMWzISeUAjk3eqiOZvmUGnqcds46aV9VUnSbpayl8U8gNTjhmw5v2X5X9mFL/RUO+XGDn6eVZltDOgg8bz8lfKM8zlcydLxQU0P2MexMS2RSLgK5GphVFjYZrK8+9cPGmbKedclxDx8LXe/cJ5nsefP7L70vGnSDu0We/APR9KDqg7w7ntCwNYMH8lHWo196g1UibQF5GXV7lPc6jJJK0dZ0/u3/79npNthLAN20/66xrXtrz0sOsqti3op3WqLcn84uLhXx3UGnlHJ/OFNVXlhNcbCJVL7AMy+3dUUgX7LqSppOsMoGO+Dh4beC2nTsCUEKGGMWUNE06j7ICmAdbQ/3YDR7B/UHZjzu2NKEM6JgyWRMm7CiRkounWX5BWFFIurX9oNwGX6g1kW71WyJg7lZsnNNpi0Zl54gpag03LJ174U0z1GCNOkPD+T/uO4B89IiG+Zu/xfzzz2fbUXXti1rMKW0g+Yckrb4MfxnvU7nXhR9PPWXr5rJv10rw9399PzQKlL1cljvzrHOuefC9PQ89/PAdX4+BeTNeaOSG428pJPpM8WFv1J9PZrNRu9dkIlVPJzsn3d58IZK3M6etYa6XRcksYmkdmLs0YGuUOBf6BJ4coRLDtBtGQEy71/p/8Oa/U/ZDjxJihei5XAYsfEmgRSHmRpjerfPjKkVlYnkxedRbiuPpiJ8gzpliUIKpIbva6eSkdaPKZtmJ63uP/3bwYtiBDR1MpCI/PPLwyy9qDh3QwfwJwfzdR2anyqiPtZyyuedUScvkXhdq7vjn34D+W5GftyIY+XWvvm8fUJdAl6rc9rOuOefuB79758kHH77jx1E5JMhuL+x4/IbCjnFXKOzs9Oaj2UzG5m3tNjKmk/YnVT+nnlCd0SxaeU9RZGBnQrU12mQwHRG8cXT8Ialajc7AAheht/8vvPnvw/gjjjpWMYnjBnmJTjTIEV7MoK5tQHWM9znqeCgozNZ2+IrjkYApGgj4U04ldePtzqFIxhZ1x2yqGspVXLR4/Ahb47ZdfHH7x5ya+shHrz+MnoO5Bvr7jz7x7BdfvPv2u8ui6Vxju3u2jp566hrU63kamMtXz+9BL78VC89/4GXzaAly7vu/Jj9H1cugn3POOXdfc/dDH77zzvMP7zmwuRnQ/ZMjjy9Kpm4IMnrT71VF02/8zGPrzBC+q515QPfKwlDEbKpzdHe3+hsRM7dOwxzEwVwvYlK0VR7HHrWhCBP/UtiUcfiJzKaKjWeD2GmlYJ0nWxPt8+p4NfvCCznYk2i6r2887WHFM3s0OblrYsBpo8jB+Si/sHeuQVGeVwDuzRjTmmkznbaTmTQ/2k7bH/0hy34su8rqXlxwL6wsKyyQLrDgDYQB5W6KFNOKEBS0GqFaoya1amwqbW1SkRJtotKIgRhsh0siFW3L2Mah0yZt0j7n+75dIbX36bSanmUBFU3g2XPe856ryemxbfnGzu98tKycrZ7Nq//IqtzeoaHBQWy7zvwczIE+Pvz6PvHdea6BsTjsuq/+lxKDPsO+c8wDfaEc8KtJuqpX9mun0HSSqyLLMe6dx451dZ0dnxjp737r1NpHmpVgefue5xtKIjmGnNSgq6ImjZ2Bwe3bM91FNYwaSyvazJ0tSJqNEjgb4TefYZmabePJcI6YLhgw/IhaLOn97D230Wn+jqP9/s8aE3BcpHNRhY5ILaikl+JVS89H8eFy8hOAHmliH74/TBCLPBR9qkzzoFOZefhZyT9+eOcTT9Dxbcpo3nRN7mrj72SOvHB5cmDfPhR901Yt4AZ26EYV/a9Bh7qm7dPNPG79IzAX7Pt+sVSoq4LzDvHTpwcHR8bHe7unrh0+3Nzsrmk///z5kkiWweMPBMrKWeTiDChUiVILW5TGSDk6HoJiv2nLtvANS60zj3jRb6CLSGKFN4y/iQbFD99/W6q5Lij7XCr3IW4HOmIxCHnONml0oGJEm5Yr3zvQic3kBpiiHQ6YGUOH90qfg9MnEygXcUt/ilw6m/aar4ieDw9qdzXtQH9GZ355dN8+7mlbH4k5b4v/MtSu2vfp0P/iYBdnDgH78Q0YeK7qywsKlvPEiYO5IH9lcHBidKh34I19i1kSFdh48PnvlUQKTamZSm05c6ndXprSXLmBgNzZiqoOUhtp0VKrKTwlOiNXNzW3CHWDiEVMu5fBI4Hgp25TNX/ve9/33vdqyv4pW0qCmWNbRHPi5S2eByL3GAffvuRb0isj4VzmbNaQabMq0tZZ3VKheCkTrs+e/dV1z/+WFJvSvOH1M71D4xJ7Ra5qzEXRX3jhhcvjYz1oOhlvuaJxq14icfO1i9fyxokM72ky3Xufqer8cgXExdYvPIyub7i2D9orV67kOIf5IMhfeeXXr/SPQ31q8nhzyOtqPbj7iUhDhIneStAZLGs7lBs2sfs74G6oSUsrKj9P8N2g5ZgkoxovwIEtWh6PHqjCYY6LF6BQ8lO3mdMes+t3f/zj999z9wfe917c+M9mpZNqUIeP2KO17jwFvFYT6ZBQLKvFqyPhmmBxaxHQvWZWGq/LSa2gR9nry141+2uP7qLLQQmtvtE7MDTe3X3y7Ahy8eLFqxM4cSIo+vjAvhOPqZZ8Pk+BPF3DEdHxd0KHskhM4aed89zeyMMcP3Gts5OjXA5z9HyQxqmLF8+e7Yf6cO/om0vR9Krz3/suK0DLm3O8dBkeSmU2Tq0bTXdvrElLLaohH1OkXtn0ICwP9ZoqpQQqcPU4p4VR8WamPXjfB97/vve//wMMFrqt4L/vcw/P+saP5vx4zhfuv+e+By3zsnN89Kyi7fKmqToSrXh3OORHQZKtsqKMaSatRYUuq88YMtvWOZu8/DCc+clPzv7azieIyzc/cuZC78j4QO/w5IULly5dmBweHh9/ERkdffHF8fGxM/uoctHjbjHo0zV8qYYe/Qd6jDSif5hu7HXsC0/tmxoaG35reGxopPfkyZPPvnXp1Vf5bw/3noT61AUMfDB4/vx3GzdGipv9PlNtoK3QH/S5a4Nu7H5NbnFQgx6visqcJ4Jl58yzKJQ/cnNVzIyW8/sJ3D34ofvu/9xnPvOZT37i0x97z+0j77vfU7hz1jd+PGfOk6vqkuQ7pbncyD5pJC5J61IGvZpfjEdi0MMCPVjmVnzbqAo/4FeQXKD/6Btf3f2TqppQxuq3e6eGB8Yu/VIXfvqX+kYnh+HROzDQeeqRd4LWPq6NMl+79C/Me0xm0HfEoC9evv5Yl3hvPf2cK6NE91/9JQL4oYGx0aGx11eybntj266OSKQswAoblxKOOAPsee+ocbuB7ge65r3rotWBqu3aUtBuoYlB9vWZfHV5RgpLVuRv+fEPW7bd9aWnt33q7vfcPkL/clVNxaO/mj2H7uAtq7ITSacZc7LMcnwtYiQymg5uqOuqznMeZ3op0ItaywJl7qBvXanidUmHO1Nx89V43G/L16xZe+YPU+MDU6/+Uvu5v33j9SmBPXBSZGCg4PhjBVHoUdqQlsfNj4TSERy5WyHXUOuf2ZElS5YSb9csO+Ax7idHht+CPNBfHe0evj41eWK5y112/ic/YW1LINXpY0m21+zyB4p349A1UAv/DujzNGF5ESO4iMa4mPzLSrP6unSZP7Vok3Qnt3zl65TQ+P+H62Vu2fzw4Zry3Iqdd8lsii2bVuUnSBVgamEex5d0a2LXtJZ8aVZ2OECPpgv0mpqqwkCZK5Db9pS32UzjrtmjeLKzZz+8//nzNc2rD799bbR36tKrb7/9+pWpa+BGosz7BwbwtQoIns302SAfs+xR5Lr3vuDW0GPUxZdbXHC8YL34cDr500hPd/fAwNDYaN9Q92jf1JUCVL2jY1dDQymLn31swVUsFV7X9/aw672hiKGC5Sp07UzX4xT6NU0BOY0MVk9WXZKUQudtEeSzZ//q6e1l5UX/a80N/0DXursmN7Xl6W+3/PjJJyW/nZ6IWhtTc2zqpuAk/aLGcwb03Bryk60M1at4Yr+SZvbm5dQneGx1sx/e/kRD0ZrDJ97uGx7qGxb1Pqlrd78GvV+gF3QWdK5cjgBXRNfvGaLCX/g3occ+lbg9io7rrgngNfKIyn7k5Mm+vuFTi5sDB9ueb28opRnL6FesfhIGJbsaXLXujQK96vw7ofOiN8wzgtvkZaqcJ9PqiHck2upkNA7I7/ryruqaYNF/f8zIv6Dr6typ/b/6WotoO5VqeQlSA2vLyeds50iL5tM16MuA3lTB+huPxxt2sRp/766KQGFJWnaST/y4hx//zubmw49duzY8PtSNCHCGD/xaVfF+TdG7u6FzfCXX6cOEzqZxnkFePtNUHbi3gD5DzTnRYV6wfrm8RwCvq7yG/hjgh0d7F4dqNx7cdb6hPdPkT2tuyqIaMvfxQ6yJ1aC3toU36+adoIyaTkcM6nRFqyfTSSsAjapb5jw5h8P84Q9+6+mOVtlKdnsZ9yh1Ykt0au//1U7BXlgo6m7nmmrMz/HBPJqBAXq8QE+2URZZRcLFWQb0QHjHU5lKmo9q2HSa2B7e+ZNW18LHfnHtWRz3IfS7f6BfsEMb+XU/rwOgd2KKV0IHXY9B10z6tIfINOjvONmnBeMlwkNfOtVRx5cWSI+LoNewqwF44CM92PrlS5Sq8z9hgGSh4mNOHOWR5r2HyqhdD3DKpwXK2so2BzTofLc682QKm71+ta/J4sxehY7/+MDs2Q//6unnDxXL3qf/5QLYv0X9XrMMwgzk7P/VXbMZMrcF6vV5yXEc70n5fMKxrgqKLrO/VejFwbSKYGaQYSY1kT2zvBZTRkJ99qIfPryOvKpryeJTv+h9dqB3bHgI0hp1tB3ooufI+vXHH0PbhY6Knec0iQFHFv41TY/d1yTFiucO85UFK/V/SLhrwksL8LyH/un1Sxe4gnv3fqfhYIXV6mluNpsCFY9udKbUugObWQTtBnpZDLoWpYC6rNlUZFBBdmZORVMp/Wvf+MoHv/z091oDbpTltkqlz2hbv9dskh5WJXPHXbO+oft09fVMIRK3zpZfn84eF1XZwc6G2YqSMkblbw56zDRGWVMj69pc9MDW2fDj1u36bY2FnNlxqPf2EoYV7EAnTAJ2uPcLdDG9IILR4eWaut9SdOjRuPstFB0BOj0OYjnEvCPCXJUoflLruHidp1Yunj/f5Tp48KPt7aVrMjbYTG53+IlILut0ySAEPamuje1lZSaL7CkCuppbSbLR/MEKG+Zr5dFSOaeyurFlz6O7vr6ro5jB0DJZ5jaNxGrDCsgjyDCa4rbdO2cf+DHTBbm559PXlhgPeGlfSSQDY+CJphdWlLW6yzcXkXCxUmeR1vS4lUqZOtuW2V/53vN73Ra7Y+HCw2d6nwX7s0PjQ70qc6GOpgv1HnSPNyiJRv4N6oJ9miPHR4QPvE0L02HcH4M5/6BAB7P6TjMVutLD/OhxamUdKRzq39nbXpkTylewUrvaKYozEGIrE+gNlM64uI6pZf50NWXnpRvjhbgtv475CNKl2rJ99/NM7i9XkZvM//sFsH+TOs0uRso8U5hPsfPbGHl8efS9Po/mNhReGpTT0xMoIViWlGzOioQ3B8oZnU42lcXRTn/bfvolcpLnfONr33v+fNBiJ+u5eOW1XlVGhsaHRwjGCnZ0vV+HvrKzU6W+UqPOU5OZnp0OHbr6U/88+hlC9H1xwXTocI4iF+ji1QvzgsXyaklxtZ7fs2dvaaEl3epyH/qJHOh45r6wMzPXLdAtqutOttFKV7tMCDbYGHidtWXOnANEYrbf9fR3Hy3NldPQZIL57Rl9n0bdIB1faqNLycMf/MoPD8yZg5kvpH9ZbV+Ok2gcE4MTGX2fEykm/8ygFo/Bx+poxZn1uN9lykqe/bW7dn/3oMviEBYLj1/7xbO9PJ4dGRsfHzl5cSRm4AU6eTBV12/KX0KfHpGDMI+bEg3ZiB+3/LjqtoFW//t80P0Cnislt77vMcL8/CWHK7fje9/ZW11hMmcbcndtLndbWLFpYsNmptN9sGFz2KKf5jiyMsrdR1dLTlZhpLT6wLbtjz/9rV37w1acfVcK81uUe2+z+/kt7utSNcObVP4peZFtX9m5vaU6UkiDoieP1jZ1lIGEooBe11TcEGTQuyvT4PMxMbs5LdK2TMms//bs6urG3dWmeMeKBY75eHPXQC7cR4aGxyf0cz0GXae+ciZ17RKnf9ChC+AZWs5vwVqvpsC4c1rchM5TU3H1w3JR9H1Hl3Oe838Vb/c1HvrJru90lCoJNlNbaVVRrcub6jSw1SbT6j6/cXOxVvYeL1VDxBg9+G4RnLcd29fNmjVrZ1sOLqsUPmMWjdbbLSZzS11PTpTifUkmGXiRu51Z1Tse3bmug1lE9LfB3WbF3VvGGKrU0nCEjFWr22Mwp9ry7BanP1K7zJi8qs5GvGPXdrvDkbhgyYLFx/f9HuoiJNoug53hcWLgNeiark/X9qgzLxKjTnQmClunLBL7lHTcY8eFuAqdG5vITObHBk5h2xfYHVigbJmB9ERjlnXevHylkQ6XWmdqqtni8aVlmoN7N28sT1FTyYZFtlQf5e6FTZUH9rNyadejO9rCQRcF0NKfKpJ0BzAXXX8wSRpZNV13uSj4RVzm1Exe69WsN6vLS1ekgM6WYK0u2ywZF6dfMbFw0Wtv9npYUxUy1tdbldTIrB12ScktmL/w1KmxXg26iv2yiv2kDl0/1oX6Law8zGPQddozRf8NPPfH1FeQiAYd4og0OKnMO2G+cCGpGccKx6LZ21oefbSthDlRSU5rIYW8NFynKsYca6rHXQ70GowZ2K11FaUHtu2QsZqlJR6fNajwAxGRAe8yoWHRbdDE9A/qOt9MojFRqoFqLbUpvNOelPcb4xbhwtLGnBzPiNkDZeFyd24xC4yNtAKmmVzEspUUZhLlp1JSUvp4owPonOtLj576Ocg17sjExNl+FXonlIT6euEdhT6T+0zq0zsdYqLla8SJ01X9uEDnGhiricW0HxvoLFjMYe6w2x1J39hWvX1/daHXQvzc7GcGfoo3x28zWLLYz+Nu3ctrWTTdaMvzJcRBl5JQrLl4OvT5IbWyi0udrpd8u5/n06fHal0Pas0737X2jGXV41NSCFswLri0oqosUFTsd3lMSl2+32nxKbk+6zIMX34e+4Wb7mqK46LjWLBw+dGjw8/OwD5yEv+dWgdERaXruQY/Rj1m6DXmPBC9gzGGG0GdteoohNfR8ZW8VkCuC3/UeewXRPkX4vKh6QnbWpq2d1DiaklxMA3XZ2bCuz8zzchKJjPQNx7cvDnAd6gd6uTRjQRnLHKEY/1QBMSASCoq+U6w7bEoDdT1QujoiFD1nU4dISRnMkUiuZtdVZl+t9+qZOdkpxqbnYox34DPm5SfrzQ7S2dlOeLQdccSFqyMDQF8aDr2HqCrql6AQZ52rk8z9NzhblKfjllFH/sM4x6LtAt0/paem0e4DnYe7V2/fimWQhLv9m3bIju+V12Wy4TAxJDdxNIZlzcrU2HFnF/x+NztB5lEEZsjJ1s4Eb3pA9Q6cJk4Yb73di6IvAV1SqEFe6IIxAV2jDjMgW40lTQxvIHu3qChwqx4PPWsdOJHJ+FaR0KePxjIrZy1yqEe6+j6+jGw39R23np7ujrhLqRU/Ai4dVEZauA1Ax8lPFOW8JDM7OECLbvGE9G/XGty4arW09sJ8yUL6KBZYG/a1tSxo1q266Q4QsaQyUpIzh92sng002n1WAPnGza31kpLkxqRS9RC7/KTENp4M2r1s6z6mHt71rr/9aqKex9IoCg2JjEV54MOnXlkOaW57e5g2G91UnFhzcp3UmDABd6QwrK+JA/beZ2N366zi6o7WLrQOTw0FMPODY63AbAjUsDI+yiyKG2wa9CjDrxOcgZ1Ha18lf6CwTzEtJy/V7C8c6B3/cqlC5eg5lzy675aSgt2Wa4J5nF2u8HqMqPorBxqM5WYvf5A0SHa02tTYolVzcpp43Fp7hT+MhxYMf+vzx74V1pZH0hQq6XUu4l2qAPcEut2YlyiMbWpOBJkoi5l7y2Zxuwt2c1KalKSmQHS/JBSGKSv5P3wrmaycnau60J9bOpZuEehqyVs/adJfKrJT6G+fiZ3HX40tKYjRvg4XdRwq0pd+2oduhZzF+YCHcPOkV43C3e8usTnwjFxGPHRqN1WMrNyXR2ZtYVcyZWqQ2UNNQJdgu96Lh3dFnNOPQnv1QGrpts43P53pgti4zXoKnO1Bl6HjiQbvZHNm/3uqsxcl9e8I92Qn0lnf3KSiS+XYdmu4jRnKPtHDxsdOETzlxw+1dk5NjYWpR6FDvYeMt0CXT2PY9hn3t+AjtwCOmSjzHW/D5Ev0Jmv7Owd4HKwdAG9MI6Qo25Wy4Ft1VmpvDAdRJjmsZGHYdAVae62SrPidxOELesoawhi3lXo8k3bMeYAh7jwBr7at3ynuO3vpP5hoFsT1DHn9K2L6P6cA5nHoa5URFrD7jSa+q1eY4ttHsmK5uREhWi1A+opLr/HlvHQtgN8LX9l8fKjnevH3hrDxuuqPkIsnjTrWYJzp+EuFl6VmdRjx/pM1tHPNNg8dVkqbxwEsbvaWC+vpAL8wBWY9/oPNlbuqMxyOhBZsJhi4YpuzgoH/OsCtZR6+VPd7W0Ml0oR6Ci62rINcxqREflEDLvX9uH77qjjfMaMCoKurPznRS5LfFRJAL1WNBWPqSvcWF7pyi1OIzjjs5UazX6vMT3RyL1G3D6aPPPrkzPq7joQh1qReymA+tBolLqEZdX8OqJG4k+Dfb0mMRPPW+xc10nPrI/WSyVuxnJAzTtNpKtpcqBzPYc8XhzMse2VLaVZPoudq2Q89REpUDT6s1yBDorevblejzNwvn3jZhdVrgIdf132QJM7lV2L0rgmn9huu6bkf3JGBSO7FcVGfxrfs4mVg0aZgalNhyVg4akorgwGMouDLqXOZtsSl++zm0OKHfOOjjBoKyk7Z7Ut62uNdguaRZ3qvlNCXaBPQR3ouoBduAt2EZ26zl6Y69ChHsvB8J7fQ5dJkVNgGQ3jyEe9mlZCr8MDx9YXHCcqs8K+wL71gwcqG6uzrBYZM4GiI0b2amaaTE1ZLpZHBmuKi4K/Zd+qeqRL36ZYdq+06nmdZuFNV4ct+45V85smnvk6NsUEel7iLC6lg8mkNjKTa7OkNoUbajjUvS6DL9NmyyM7nZGME0e+XcRBxxsWftXXWlKgPn/+YwX7OjunRofHhDsyRO4FeUmoS2D27EAPR7vGfTp0ZFqWVPsUsPymfFVnz7H1N2tl+OSwQGd24NL1x6YGOrm2L50Pc4d91S+rSxurS7K5XUTn99uTYG02ZVabMdtpQel0AHquDp1wjKzJtpq9NON6vU4R69wP3blqHlP2BxNYWeG0+lIR0uryusfDk84XSp6bCsuK3bnhGsVisGWm1yvmbLtNXfyhQedOtGZrc/PWr3zfHm+n+7zglFDvU/059bYehY6Ile+bHEDb32nmo9B17DpaLQJHeHV4gPCOatqjf6Ie55K/G5gSs1HAsAP0/MgXD5S2VJak2VNU6KpTClWn1+KrZuQMs7G8VVXu1oOb2wMG9Y+pIVpk9hKy8XtILfADcGLtbp+pMv/Wyf6huVRIcKslIoUH6+Sbz2YifEJiPGNfKyr8G91F9DG6OO7qvf5mX8ienOiIE/dd8/hCazY0r97wtRa7nXAsS3AJuE9dGNOu7ATmriJqNY0M++8f77sw2as7dTPO9ljaTQy87qxLSOd0L38DRdf+XN4QoGMD5PXAH/FPLF04n4j7qlmVpdXVDNNwcFlD9Fp2JdXkjASCbrM5UBxks3I7PRAuizoU1Gi2+bBtVqMhlmy+w+Ixf3MOUYJBFi6r97UUcdLUqcC47wZPU1plwN1axcRFerVTrT5nOlccY1xMoL51Q3OzZ/sOMi/kvFce7RYLr1EfEuga9qsvXZUNPn19fdfHzw6e1q9w+h0uFqFBKH7UfDeu9j0jzK25wD8oXxAV/pAjABeua2DyKK+d4+LFhRyrPnigtLGywmOyRI07AkunxRShmpXqxmBmTWuN+zxHuktybLrESTlsdMLMg3e6ZZ8elX1QbuqxwIwKX2bwUA4ZKW7PddHP5kKg7ktJtzFiyxFviEG3q9S3btse4lRfXHCqp/vY+mHO9SGEfNtVeejy0snRvr7R6zOxRwtrgB6thwE5TAcvv0jja99Y13TmfILaw/zYsYHRLuouYb44tMC+5YPVTU2VkSx9Iz5unO6nKd5C9BzkgVwWswXkSA8CXZ0spTXj2wnBEpAjRPPA/+Dc/v+Q0LM+NzEBijHoPFX7iC9fGC4pc9VQWOCuiJhrGcNkzg7ZZYqDiMEu6RaN+kNQJ022GL+rp6tnVKM+MTFxDlGpnwP62Yui6nS1Xtaw6458TNd5AFSitqdPXn6NvzTxQl+PZOOBjRCARdbzmoB57ySxvs5Tx+mEtodgHmlrjPjZvRWlKYoOdEuYblVXsD0crGKlunsje5WZ8ate2fQYLK/3RD0FcSclWP6Odf/CXFqaJBB/E7yG3WyI8xRmlhJ+Lwq4i596qsllSDUryXa7Eer6yC1HPOfphq2rob5/vmRHjh/t6TnW3af58EDX5eq5lzHzZ8f7rl+/rk4suDh4Gu46dUTFqlZDgPysIP/pT69evTwkJ7ru4avvub51Ygd6R3tU5lzzVoQis0qbGtsqPIoFnDFFl/8/lz/orQ0e/O53S9zF7qpy6uMaylwpUehxiMo7SRuF/cC9t+EIqX/FtH/hydXYNpqVBfvNUWMCnV0+6VlpbUWB4ioKQ9Oqd7cFFO6zIaOm6gZJTYgPvyC0Yeua5q2NfyQ3unh5Zw8X8u4+8eGHLk+8di4q2ul+XTT9hedeeO655wS7KDvgEamP13RYkDPT4qc//elLL42j6OunMZcvwBAI82NcA04tXbwiBPPqSGN1hcelM48KZWFe5uQU735qT5k7UOxuDRSxirUGRUd06Dp1LivUfjmS5n7ojvfe3/v+j3/+ybzs7EUrwK5uD09Q72Mx6AYlx9MUZhuOK1BLSKupsVQxZ5gN8Ub1i4xAT1RjsBlrPN7mDU/+cQPUCzpPQ71n+MJbw8OXL19+7bXXzmnk0XVUt080HeYiWHmwx8I1GPJjp/svTlx9CeC/+elvfvPS1ZGuWFmlnlDn6/nHh7sg39VTsHztitUtj5aWNpYWPqSkRP12gLORiNIgJ+ul2/dEqmTee3mgKrAZ6+7SrbtO3WBM1E4zlf2K5M/e1lOF/gHL/pHPzNmyitoomh2grvtwqq3T5rHg3fjDmdWBYHGwqBZfiOHpBxhEkpTgwIXDjUdkBzMmPtS8ak3zmiM3TixcSG79dDdJljGhPg50RIcO9osvoukC/ZlnnnntGVF3rnDRcSJdg2dfO3dViIsA/fJgp5Z7xwio0DHsXZiRKf5O1+mjKwsWP/LQXfsjbW2RTK99mWNZipDUe3Q4q61Gl7ux1e1maLubb6EmwKK+qmWaGyec9Y01Qlz9NCEZyf7s3Xdefm068+ofMZyink0YCaAWVZef2c150KRevVn+tnJOwwBl4F4z4dqKkBLiC1ToSUBnvqQDCdk3PbT6oSN/PMFAoZVHe/Dhe8YujQ6PQ/0mdmZDX70MdI35N3lC/qpg15BPvIZdh7gmr6DpXZ1ypdOIS7AGP7FrAObY9p4egrPND83a0dRYXZrTbHfExwEyVgvCJVQh3lbqZLwvPT1FVQEeBzc2uEXPo4qO8G2q3zGFAsnpsg28vu6z99+5J/tHPvnthykEnbOJAljZ4YNAHokqi8z6N+aEK0oIWjMy3S2zo63OLLs9IxGTrq6YZxc7ei6/sIdWbVi94cgfz6jHOtS7uqA+OoP6yzyuvhCDrskzr6HtOHX9E6qW67xfEbk8eEyDzlPvRz82MDDa29UFc077xYtXfXE7NbylmU47aTV9AZM2Jk1irIop7K1lOUOAYZEMynI3NLSXpVh04og4+XS5aCqezk6b9Lz8+rqsTU/ef8fq+vu/0PL4rK9sR09Y35SfLcP+k/QVjLypvepATy3JPJhLNMtLzM7EkgOr4reHHEnC2ZCkyGRpqCOJjtCmDaLrZxgcABKonx671DeTuqj6a2LdNeQ/EAH7cxP9gxPPQVxnDnKRly524bsjugunQn+2bwg9P80/v35p84antpe27Y2EvctgrrLE/gBdHfvKGh+/1yW9SVip4pqiouDehvPltTJFLAqd6cgIvfjZ9XnCOycrUr1/510tX7hjoRN4zyts3DlrXUt1JT0udXh06arCa8dcPELtkBLObMeVKw+6mSJqtDis2SFb3KI41cBLSs6cbAe6ZDLtGZu2smblD2eYBQRznPjTr0MdvZ6u6lfPqSe6RlyjLqPnnjsHcQ14TK6qio5ozBEUvW/sGMy7Yb58dfPObdVthyr9gRS7Cl0oGgU61W9GNN1rxrLLWy0R2CJ36/mGBrcKXb/TJdICgIbn5efX59cVlkQObH/8V08cavLf0cHY99/zYas3s5penq+0VD+5Jas+rz6bjjY2f6DvAp25JCZ/ONwe4EBkNmzLDo/Fwh7aRfYkge4gZaGEkkMOfDkqoR0r1h458hgWnjmeGPhBidJMXuKKBnW4x6i/JtBjzHVtf/lnf8H8d5zosWu8btx7hseOEp8dPHm6c+Wa5nV7qve2RDzNrhSHQBfTlBTSoLOvhEw5vANl6w5V1tYwK9Td3t7QSrmkmHc9dKOwiEz0m4VcLetocdnZWFaeeycWSr2jLnau2eZMLeE1/vi6AyU5+aSbZHF8gsRfuI2xipP9Re1VhDZ8tMHktDTWplhNtoxQIgadIjTFzK4mUTMHYp//yJEj6PqVE8tXdqHrGvUL169DOUYd7M/N1HTk5W++HGM+U9GFulYJi4cP82HO88Huk8R6H1uzc1ZpR2OTR3FYHFAkhbKMqifFKM6ZVLCbrXRlOzsaw7m17vKaKrek0qO1z9RPYPgDXhaIhiuqD+2c9fRTj7cU0sNhm/uhO7JQ6p3KrshLnghrIcfZoySkSTT6zGaTHI24OXFJnjDjOqq8XiWF0ehNexWL3ZhsF2efELwpI4MTkas62KWLdcWqI2xCv3IKA989iIXv6p68dAnqYIf6NzXszwD9naousRhhPo36xGkduiog7+wZGz59rKubmRfYgIce393U0VGxIUMz7Qi95ibrIpOBxmNJHHgVKroOlaW5li1juH/AxSW9jEz6Mh4WI6sqcv3hkkjHnt1PPbW7o9KTS0UBNuxdkVqVJJtN21ZhoqTAlxU5sG3/jgNNmfV4dqg79VO+cHF7lTPV7aTnR3GWVFrsJrs9T4J4jnmm5gybzZch93a7Sn3t1k3s3LhxdCXUESKyb7x66Q1MPNBx3TRdh/mtoM9U9Zd+rUOPzg+TmExP12lh3tO1/tTbf6rs6GjaEOJoEeiSImLxZoISJ6uimQHoxL472zK9cmWrChKf2dvQXqSHb4zUxYZLOx7dvXt7S1NmLoUjVA5RSPCuSa2qm304yBEyLEZ1n4EtP4eliUwmIU6VpGQWb44EwjS24xDXeksiDoM9eUt6UlK8gxM+2UpJjShbnDYk5JGHtjy04cSNfexb0Kj3XoA67hykwa5C1+5rM6C/HKV+80TXgrQCXJAzInJ4FOYgP9nd1Xni7T++ubej4gh6zkVC2xZrtgLOiDNCTUxqBW347kiaUksArjWYG3SFceNqBXqcKd1TWBGJlGQyx1zdv8UplWC2JSffrpNl/qVg7H1Q54EHR0l0oomfmy6qh2tMC1dV52Y6XVZLChXFSpPPEJedXCeu3DKD3arY2NvnEFG7DVii9+TWIyfeOFFweoCzl4LIqUtR6lEL/81bQp9JHUWXPByiM2dYWDcTIul/7+86dubtG1fe/P6bm1bgSXCyqCE4k08BuhpuMeSVULTr9njcte4UVwBFd9fubW8vTlEz6aLt6mB/bqFx4sIn0KAN8zvdg/tLEw9zoIM4blqfC0J0UsnxVxSm+RWvSe6+JNmN9uSM9Dx8OXpdQ0C35SfHYWPpL1lBa9HahzYdP7XvDwOd3WrZ+yDUf/mqauE1E4+oqj6d+TMvMzVcpf673/zud6/wIFCnlcvzVJmPX+9mkwAFGRj3N9/+097GQ2+uemT+gnit3JnXX56UtBokj75MabKarAYXoRkXOTWGWVfVtmLdicaBG8GRSwE7kVq1BBgB+51Z6v43vXhe6aLrlBOgNECPrp0l+2ZIy8mszA27DDkWqBsZ6BCfnGHPC1FxYpErnDU1Wwy8fQGywrFgxSNbTxw/dWKyt2sAtTx7dnBwGAt/QaUObFVmarr8+mXBLtThjrykhengrg2B7Rm6fnKw/yLCip43X73xZmNH9arV0rHIkY4w29rn5WVplFyLwvhmhZRqmkvE2cqZ7trb0NCKakNcG/etRaAkrboISU5+1xznMw92IvDJRCv01IvYdrAzcyrBaM7yREpS/YwAt3D9dRnzLM2hZHudIy6e1m674vRl5+XF0dwEdEG/VqW+b3Kqp3eC9tWL/bjwr2phmmeQKPQYdVXzJVoHdRGoo+iDUBfs2rqO3tGTg2cnJi5enOjumYL5m3sqVzXTpirM42FuMXusUslroejRYksz4LxTPOGGOW0tgfJAecfG9gDINYkW0YEcRScU+S4z7dPubslgR6LUEXXtQVLiIl9OZrW7xOXKpGvfaDf64m0ZGaHkPPlpyw5Gob6akBzMeZBVP7z1zIYj+4aHu0deHJ4cmyJeLuc6Nzeo69iRKHKYiwl4GdGoSyadDR0qd5Dz8eKLI90j4wy5uNjdPQbzK1fePNKMnvOfg7mdSHuOE+tuUPswDB4u4aagG+R8dJa5icadb29vdXFfQ6bVSgn0BNmg+u64qd1a2VVnLtrkomk6qp6caMvxR8JVuYo1L8VidJjMdicL0OTaJobVqNh8JKcyxJXjKcs31q7eeubU0ROToyen+i5c6Bs/2TvJKPi+aE41Bj7KnA0gEqTTTLyAPwdzTYR5/8T1yyepkhy9PDIwMHkJ5nva2bm/ACFEZGceliXL5/Qp9FbKJp5Uq4teJTSdE93gKnG6W6VXtSEoqZYYc71sRhT93XNTu6Wyq/6cauE1P077CSXHJdkKww3BcK0hU7E4jBaF9cWs0A7ls/JEWgbM1E3n12PeOdllVpB4c1vPHD3V8xaTwdWVDwNQx8Lr9RM3mct7kLP15YVnhDrYVe7ndB8e6ICfuD7RP3L90qXRobMDr8P8j3tKYT5frDvCuWJJzQyQ+DUJ8xRz2jITDS1MOqzl4SxJoTZu83ma0nHjYjJPJw7zuffeyQn0f6RG8t65yUlyiRFd1/ViGb80e4obisMBl+JnBI89FErPCCVk2JNtOFBi4L3Z+fmePGrfgY6AY+0jx8/sO9Uz+cbUVN8lcPX2vgF18eai2q5rug79uqh6jPo53HdVXhnsR89fuKwyv/DWCK+dG9duXKk8sjrEeBqgx/GwG5qznLlOxWxR96t5ZFoazQ1KCpd0U1ZNoKiotoOJ/9LXolv3m2pu+/CH3hV1cX8Tu2xqnJusK7tohBzrTCFzbmxtL29VFL/VQhg2lN1sZ8WlPZu8KtTtVmLYaXU2RxS6WPjDUD+67/ULU1OTKHsf8IU6212gjkBdF1XRMf0qdcHOZjd4/1TD3v+7iRcv958dhfk4rxxh/vqZDazdR8R3p58phVW6NCR5FVbMpaRYnSkEWQMBpzslmFLrLXSVBwKthzZS7S4hWB06xDnJ53743vs/8G5HLsJCp7vvB/zcBx6Qljb1ZmtLMiqby1qLS9z0uRjw2I15zfZQBtwZHp4iiuX1+fypdTZ7TNOXsFHz1JkTR4+OXZjqnXzjAsSGJtn7cQEnXsOuQlcVnfVOL4oNeCZK/dxLv+Nc16lffnGi/9fjfVRVy1Fx48rrr58R287gUPlviVdhrEh1egMYdxmSZMG4o+juQG5tbSBFycmtZWf+noNlAZW5KtzUkh4A+H33/J/4dPDv/8AH7r77nnvuue++D9374AN59fmexvLyqtZclzE73WF0hHy2kCMD6smL4uY56Crg2paWVu9R4KBTB/vS4ydO7Dv6i8mp7qnJ0dGRsyOT3NeFuoY9quoC/fqlN1B1OdYx8efO/e4lbLyK/ezlF672X7z8wmVW7V1549KVKzeunNj6yMLYWHg0XdnkyfXKthHhaXBaLdRNmN1eZy0f/WEqpdzle9rDNbXEY+Y98MCD937ovvvuueduFm/9H/gt0Kvyvvfd/dn8Ok9luLymmJCm2ZRvptLdlm23Az2UaKOGRvrgFKfTn5qfZWNkIygYJLkE6swk+cW+oyeGJ7sHhocunz05MtbH1S1a+q5TR9PZxivHPdC13/mZrOOGOv1vL46fhTlXtf4BjvMrN268uW/DkrUL1i7RX1z8v0TSmnO9zS76ssi6OFNTDIqLhelE26nqq2ClGE1NbRvLwk625z6owua7+j/vP7N3djFtlWEcN35F40eMlyaLF154bcs5bU+ltX3PsWXtOa2lrLx0taUEGwoHLBOxYKAqJJOjrE5jiCbGoDGbaI0aYzTUBsEIkrmKIXDRAYMwlTQaDImpZuj/PUW99GtqFJ6MmS0Cxh/P8z7fz2/IlbfFG7FzKCDJLk/AKvBeYiW0mVKqUS5EnSwbxqjjjBMajpKEldsI03TIsYnpryanJ1fLhTymXb45e+7c/PLWcrFS7YP+BTpG1mABqqrOBMh1j+6zC1+fqTKf+zy/UtSZT6rYOgEfrpr8q7W6evySJPEaXh2kZex+/JfwrnpPQ4wdV+1iY+do4+14JDUSw+jt/plb+svQb2/0dvkVe7TO9dBjsOQytm/SSJAQTaOUCwtIe7N3HXFbc9zfFiLADh57D/vY9GyV+ucXzs2hXPI+dL1KHf66nonXFZ25elD1apPsJ2DO0rKL6Jz94Owi+3H5fKY0v7357fb34+8O67slRZblT9QSVzQVk2RBoFbWOYG0DHb5c4jWullupjWKzOzj9WlP/aneoQ6hznj9AfTfKdfEB1tbFV+r7FJ6nukyu4QAb6wL+WDckZbjTM3IfFohoN6MwO14CBa3VvzlXd+jXpr5fHHu7OcfnFtCSnYNCZt5BhnpWAYds6nVIL7aDf8Jju7Dm1tcnz8z9w2Yf3F2ZmZnZWezsvn95Bj0HNBB/U72TUhrp6Rpkp0Xj7CCqp87AuOOeM0Xq0e7zJDskgKvD+F0zUhqqKPdbLj1yssO5Hc97bcM9j8YlwJdWBsciz7Z6jILfg5RWhJ+nJNyRFFYkRLUOWc4DjlOma7rK9p16hNjuhNfKuQ/OIvk2rlVnToElM9Dr3Xoy79UZJCRBXNUYDG8uDH3HZgvgvlScXN7d1PXc0DfuwJBCDnaGdAk5NytCNzusEpsh6mZ11xKACOXDS3dktz+5oNDDeiLPJnqTdvrDv3nzmz9O4Kjnf1NR52S8pBiVoRY05ONLqiPy0qCTo4IQQ7PO0fAHEKdzfGIN6PrOpjoBh5DpRNjzIlfWn17BmVWUF9H0W0LB/xA/ePz7+nQ8RdQdUBngno7oK+fKVb1fI7p+fw2Y/7anp7rB18IJNIT0xRJEox1MDZHZHMddvLXyZ4GbwOKLUOj6XrPC6eg4n2e1COjHe3CAfTfDf16p8OG1EegBV6RpLSCulmOcSJvB/WgnXBUAfM7WDKMD4bjmWzmOBWr0GsZdXhzE5OzubeW3seE28zM2W8W1zcY5DVGff28Dp3dS/0VOow+Y74xN4e5NlZiLRURqoG5qt8CYNghMCe0RZKYnvOI0K13IFA3C8IdvKuhA8zro6l2Vz2Yj6T76k+Ojnak683crfusZP5XNsRzJuyfktGBhPuE6Z4HoOs+Cb2HQSclioD4zSmIuhgd0PWMN9tGdFXXuR9Dcm5sYnx2vHDxfVYlfZt5Zow6dBseuw4dLv3A1tr8XtLmE9RZ178ubix+tsicP7TGVeC2w7bDhcNOcCBnio48gdYVi0lByUmsiCCwGAnFIB6+u+BnB7TTGE/1vHByiKH/FEczsSzJcuuB9/4HLrodspnMTlzpQp97zN/6gM/M+WRiFB1OjtqxLbvnhP7/Hd2xQrA5m+33Zhn1qoVnTvZdE2Pjs7ncxVV2JBEeHTZMVPRLyMWVdWA+w6AP4A8seP/4/Pn3zuvMFzHZjJ6pfLm4+e3u9vfZJIKBXw98EKp1ISkjOe1Q+SOsW+9B2WXmEJcrAo4stT+FmO2dUylsHHGdTGEpmpFabt2n9dM/vUnWInBOxY8D6vWMesBojsmg7bAzI68cHUSJzQDmoujGOFgW3HVVR1ilN0smYOHHJyenV0t5TKe8/fniBd3Cg/r8x+dZ4n1t4LQOHbL+HpjPL2+cW/yCuXBvFcrQc8Rqrw1X7wAAOns1CEk+5JOlgNNtgolByp2XvC9jlEnzykZznyd9KlrX99ypkWi7pw8+XIPHTLn91g711xfO3WpwmAWcbpFdTNef9NfxPsHI18Gg82K/4nAqbLiNbaUIheNZSBvIMOoQBop5c7nJ6Z2LeTS9MV2/sFEB9a3lrz9e/xU67PuZ9fPQczBnz/lZjCVXypsVZttVMIdxZ0m4wwnEB5mHYnIgZneGgJw18AixgK8V+38FzJ/Xd58cxbH8p0ZS6b6+R0Z6PbzAHdrHNfM/beIPGUymoNPfKWPQxdf5QKORD9jrcM/ISluDlIPjjiedNS4RLZzJgPorVeS6arLojVEfL6xeXGBNb4x6VdeLZzY2zhQB/fQWoKOsvv4hs+0XIEzP8wC+y2K1CSyOBXR8QaR4RUqzj/skSZGdJp15nVGWfX5eQr+uGaY9/Ui0r+/kc9Eojup2tSq84MYSoYMQ/U8d/HHY7IKvCekvXyD6jN/o8ilYDUxrwjjUK7iRjQd2Rj2kZrKQEyE9mAZwCH7Duz4+Of5+aQqrJKrvepGp+vzGxkpx6zQ0nZVdv15fh99e0pnn3wLz7c1l5rdrYA7oh/UvSYm1tSemoLQm8zUiBlaPIJzwSi7BiKDSiI7nR3pdrqeeGx1lzKMS5zYduHB/umHWCOpSoFVgJbWml5qsnM9uthrcHHHEHXDlMdNmtKIZmTgRtmUj2RPDVISyV1U9kQD13PhkYaq089bzuq5vgPrA1vLKHvQtQJ9HG9xKceXCOsLzwluYaNje3GXMsU6IIYfU4jUnnp5GXxp6rlA2ZCFaqb3RjxkdTlbQttkQHer1eJ56NTXa7vI82CrzvOXAhfvTAnfOgVYTpVXgZJ/P+2yrkfNJglVEvwUJQtmdOFlqvIPVt5ORDLhHTqgEyHVVZ048LqvlJicnF1ZWsTBGp17e3RpYq5TLgP7o6a0KUrOljZXlFdYAeQ7Ti1/tbm6D+WxWg5rvheeUUKK1+Ltj7bIsCYStPiFc5KiEKosWRga+ztPYglUpLz41EsUahQejMobyTPtoKeAllytwDsLNBRWvnYeF9z/dw5ZIWji2ho2QZop6K6ytAdRJMhLJRJClySSYiuvQEwjZJ9AYPZ7PX1zNvQ3qcxul7bWBgeWVcmXt9OnTa7vYLFgqM3sP5phc+r6yuf3tty/Ovkax/LWKHEJFtSXQnW7olmUnQrUaGyFxr6ZRXrOLlBA+0NPuakd8Dr/dcxLMeaPxwG3/a+7crRY3PPVGXpCxQ/exh6zGsAkbPCglFhJSBBoWgBzYaTKiZiBtbbqaQ2DnE4fvYtQLU3kk4mfgw8+VLv4AA18sV+5lb/puZX67vFYsb5xhzKeh52D+3GyE3qWb9QTz3OG3v9YTS0MaJLsIoUd4b4anIYlHZphwZv/jaVf3m7jNg/zM440Ndv6OA7f9r1N32BzO8FGUqf2+wMvPuYxOh+UOo4i5ICyTDQtOO55YzLMaghGm7JHscebOwY/7ORE//W5uGkeYLy5gjKEwtXGRJWl+/PE6eO/37u5WtteWy1hYsoiFNV/ufsn0vCdyNz4NXwAfLDp3tUTTsTTOwyk82zdOMOQg68UfSIjKXtxCTr05NNSBxaAnvYJiMxy6fj+3ul4qd85kcbiVoyzbGQg89KyZC+IINxrgsazHaEUDvJMeOQJdtzgjzYx79oR2mDJe2MOPDzTOTedyC6sLpSlQnzm3UWLU37h3YOD01u6P326tlbGl5gIWl2zufs9SMj0q3cvI4PMTFFm4jnRAwo52xYhkP7KAil/j7TwhVmsoJAhHuwTXKPS8o97T/qDX5xAPXLhLRN1tMDqD/mZiD/iVzqclVFQ5/foL4TjMuDsFO0756JFbhEmm7bUEZQfT8KaDHd71d6enC0tTU0tnMb0ydbFcWR54/WokZ+6/6set3V1Y9538TL7COia2qyUW3W9HfkcktK0z1i2nJdkno6hmxV9kJC1ECTFaQ0lNkHqimmfkqeho2lU/muoVeJvtgPkly8maYMnDXo458c2PKVYajxtsyMeZ4DQ5BVPIiRFWRh1OPKOuvqLq1TZwZzm1u999d/z53OpSfvXcDCx8aaWyNvD6AKhft7W1Wymv7OQLC8uM+eYswnPw3jPttSTTklVjsiJLihGRIScaQnGBZ9+Iyv6gJgUewnrD554b7cC1e9RZPJz1IPN6yahfcf0NaBoPx4/aWcTe+AyGC0yDxGAieM45jrqDpjCyZAaiO/FqBgrf1nYXqIEb1BYyNp3DIebV/M7SzFugXqyg3PLoo/cP3PsjQvWdwh5zPSUDs179VMRqx4+rqqpJsiKROkIwlh7EdxVDnKJmM9TOe1vk+oYXXxzFyur2EX+9y2zeP1ud/wHBEgODhTQH2cMuK96XmnDaadCJpAzPEUI55Gn6HSIT4g5HkpmIqmaOq8dwnFOfRILevgvquaXSwg50feaDUhHh+un7BwZ+XC6XmJ4XwXxzc3ZcOwzojDi0HMH5axFVViVNDYkAjhihPyxa3EFVMWskqboaeyRP7NVHRnuxUagzwOPsEHfgtl9aJ/4mm+hotvcHecEu+R7roiIZDEO1KSE1IebTxd0WcGHUm8NqUlUjx7N4lI+BOB7nuw5D19/N7awuLE1h3cDCahGlVdRWq8yn5svbUHPoebWUqo8vUe1ERoaaa8EwZWM0RHSfcNcQtw1/okQN8U2NHlfvqyMdYJ5uigmY0Dl0/cEkwyUVdqLXYEGfzKAZ5Rdf18vUIAYHBWIJhyNUwKkEdzhoq2G6nmDUdewZpFjuQuQGOaZb+NzOEqgjTTO1WgH1td1yaSpfWJovboL5bObuu2ETEnjQE4cJjTDTnkxqqttWPeQc76cGmw17KuHHJXGmJeaqT72a6gikPQ2tKPc7bIf25cD53ypsrhnbFvGw87wTVbeX7KQGig8X3kApB7fO1hx3V5fGhjPJpDqchFc3BjXXZe9dh65PgfrzMx+slneRjt1ZKBRW5ytV5vfpqVfMTFCRatmMqqlJLam6q0usEicyhBCLaAJzTaP+Ts3j6Xkq1dENvz0q8ZhF/R/f0/sXBe6czeIMK34z7/RLjc+GRavjaNAmgpHJgoNOtvBgHNRrLDUUBj4C7sORCHpZYbPBHl0VoF6YYte8sMV7YalULjHm5WLxy+3NL2cz94A53n/8IqFMJqlCgskw+ukxmJwIXqvSWkIN+C7JMNGORmVP+yOnRnp7G+q7W2XOYXEcuHB/j1x+8yGbDY0yXoFzB3z+p5tqakg8GCKEUuJg2LGowALshloSTg4nIRNjYxPHgPxOoEfNjVHfWS2Vlgqgjixdnt2DKO+A+WQG11TZzwYllKrZpIqfGaj5MJtdq8Hi4Y9CbKcRJTbi1hCuYU9oBwaXOqR6Tyzl4znbQeb1bxOWibehjt5vN/FepfmJBykRB8OUGqiIJB3WzDmc8OkZdREGHtCHh8cmxoZ1s32MDbrlcrnCTmmjtFp4+O08ji/nixUwh98+BuR67pUe1iL4TGbbI2ooUXMnvITgR4NiAvsu3MQQcmia1hjweJrAvLcdI8mNigDm+2cd3D8vcOfYanxnk8NuxP3ClqeNcOf6LYQQt5vgNYehD/eLutSGwHxiAtjHxgAcPnn1Xc9NTpXL2zsFrIN8ewHMN5ltZ9d4IPj3tGSEIdeS+L06BU2aHmchGw258Y8QpXInTj0PnUqNBDz19VGvhOLvQRbu7xS4czfaLNhE1qTwZl+zr/GJILE5Bxl1Zxgul6GGupNtqlhTpQ7s4A4Z1kNvoIeuo+hWAnZ0THxZRO4VwdpsZhi98gz68PCwOgwboUtN4s6aWqI+HieIBUPUTWsSYO7v0VyxoVMjKYymxjoDPs50UDz/2+UKPOymoDvezBuVgN37RDO0O67PNYWCIY5YaJyG+201zJ+7c5jxvgcf+JXQ6+vHJnLTk+Nfbpcrldx2sVxlnr37GIw7lB3QIckk4z5ceydbKH+ijaDjNpgMuRGqJ0M006r1xU6eSqXacWwvGkAjrOXgOf+JvbNZdRqI4vjaheALiM9g7YfV5mp7oh37oaIjJ3PHUhORwbFRJFDFLqrogBLxc+NSRES0a13oQhDhPoLgwpXg2gcQ/5N6/XgA73WRfyekmWb365mcc2bm5J8L7twOzLq19aC+q5N04turYXMlZvLRtBFacpXJzDSufLFgmDqwuyzL2JgelD168n7tydfPmHX5jgmWbxjb04OFi3/QLWUL7KaYkJ89y4mIZY1NSMbmiN77/cn95+PJiRP9iV8kUy9duA0RXtrZbHTaetamPVrIy1MKmxo5OfKcW4kOQ6rK2bLeWOAKAbo/ivANGdm1J1gt8bFgjt3nzvtw2fK2gjk7Jqgq72qcDKQ8+jSvj1br/YuPH0zu4E2qF48N97VXtpYu3Mao2AohhJyJSi3WndXbtbCRtJtSKl80gFhRs0rzeQG9mi2ROyAvlGWvF4u1tS/fUG4AzG+Cea/oRnMQO8EBon2i5CZRGBKzQ4dCskadjIbdC49vjMddH6ntq7dLF24DhQmYZkN24jmc96Od+CnKy8HCV2LNrZAMC6ZKoOaq6qtBmSV2HJCnmz0CdTzMvZ0vihWQvnP9zwHCYE5E86QgbtngQt/LVX7maL87PX3eu+3nzgwxtm8vMzIbKUTsKNAlRdKuqCQ5/BT023MRGnlVsiJSVgrE6hwsd7Iuif+mjkqya0WViYVDmFb0LYX7TGB84jWeMSnmDpCrmpynSh07M7xy6vGDi37f0qXxgWF9d/k432D52I3aUicCxj7QH86GFYqlMWRH2htnQM4al2YY7yHjXEG8+GD25eXoydcvX14tXvoL378u08LdFOqzrJTqMIekhB4c3rN7dzTudicvbvj1j93Vwb59e2o7ysf5hsun4hssE0nUiOMPT6lKdpmTtVpLK7jFbJwNCrXML1PvFeRHb798WtgeXPp16K5ADqc9ZC0I0EVFsRzp5LBC1fnoyJX+tel4fKm/d4gkAf4FZXS+GcIQz4220DGRiOX8Ddx2RsVRUG8qZpumOk2dsa71N/aeA+eeG63ddNn+wI/uP/t7xkM3QSpICGEFa20tC9XdfWgYDQ+dml6bTCb97oFBBwsjt5frojZHGOK3rzCniSWlE7lliwxJyBpRU4E6GuTQnAFzNHjpP229h5PNegBucKDLT6T3PHJnrUBjL2WUYkXdfHBkb35+Gg2iA/3jx47t43aZbN9EIT3XZBY6UQHPdfzuGabaYklhpUnEhgy1DMTWAXmBfemow2M3P7XfqzBy/G7cvZFTNSJDpLxYVWk4GOztRpfPDMZYBpcfzXPBlTJS20xha6tQLMRVgwRNHD970wkrnZiBnULFoBe0lDEBO8a3pTzp5QH0+PTAPDPoDmya+hL+UFBwZw7DPEVsnt+6FUXRAaUORHneXikjtU0WhvitilnElkgmMnmYVKq1IwK23gyryqZYEm3vpc55/x22vI69Z7KeP0EZOvwPLrUsRnGSjmItOzBxopDyaHG8O5qeGQ+iXKmrA9g5hvaS+SYLufht3BAikarCWsZPb9Wx7yVZ2VlpJIlf5eaEAXPLmTG8tPeeVwHcXwQGzTCQs1QM5dbq+VyHVOVRlHb74+vR6uKqovxebJVSpQf3P8hvgWk0hJ4Z1dRS37wuFTXnotIIycGaAxVQYEJmIYw38hZQewH5T6E7TZUhCmtUqykiqjHXamF+L8I06uUL0SrycTQapDlzmZD5T+Q3Q3CDhWasq4l1PF2tqWocV0gFRhkw9+TZolkTFNj/gG4wvItUhUrP4nX3zQpWhHj8FMz8/sXxYDLs168O0MulB/eDvfNZcSIIwjh424PP4DuIrohpwXy9pMW/rI2f5TCExEOR0lZ0UcQcMh4GVgd08CH25NmLFy/7XlbHl8hifjPQyflHT1fXTFftDt74yaWnJuE2c1muzrN/Jd8w1KAcRLDzFVURJ32veqKu+9+zXZ3AYlvbOHr+8Hp1TgogZRxmw4/P8/n82Et6P34kcuPO/ovXXaJ26KbQGoXWJfn8++14O5tWotgvQxWpk6BUx6XrxKk/rdeALZEt/+mPGI7H4d6zj/NXb78Nn+4ePT46TLy8P4O8W9T2rUy0YhqY8/Lsd0ZcLAGJis1G6Ca3JeaUGvTfORb1+8QYXXeMqIu5FZCHMV4/Go8Phy9fX72qeVdp26ncuPG/dlLbZbzMJEkzo1u3vPmzAtLqJhJEuBohYWLfrWbXqZMTt+/OPeHOCSLSWiCMbRkDGb19gEdwT148e/Xu1csZpLOB/J87qe0w9QwMT6wvvKaWm+bsDB7FM0IgqTVoWJ93qgHqcNuat6f6CC7ON0Aquc3E3dnw8Hh22H15/OyZp9pvDa0J0/6V2q7i8VxPWmMaJDf5+4EfakxFFIJkZmVcuXNVBJ2wTvUThlD/i+RlLqW0BTEOD9oHPs1fH8+Pj2a3Zg9z3ajtI7jdxSd7ovZN1omm3K7+LADJlIAopJkECqICWp/x2+muKoCAUsogETJ05d5s/vH+z2ft4ez60XSaxFvb74+j7jK+ZU9Uy30ItOXm7LsCaUk4AgkMKq7WXfdV+GR712yMULykDKR0cq98eDGOXUscDtPpbXI/zXedS3Xz1vdWAE1Nuz5fI6JkgQ9RFGg2RAgAlRo0MCVAEB1g6AaR+ZufXkF+4NOpWZJ0eZ9qvwDUeM61LwhhLt3pwSJEWSQ47lWW6zUUoUqv27bT9e9VRMQtgGUg2jfPu3EsAhQz4r9teX3RqMl4CkuvQVLTLA4OFNHcow83Gk6T1JkuNXIHc2pW6tJFBhOR528et+NoiCyWyMv71fyisN289Uw9Q6BZ2RwsNUqX3G1sMgG4dRWtsTvFAchhINsPp91yWYYYSzYT2afaLxK+srOu7K5drJTx9ExCSJnxahSglhOBqqIifsvgiLw/a0vXZFxjYzTZ52MuGPUUjJC9aVTN1q4PNgEiGajNIGJVLootjKAMgvHDz1pe1qIkM5JX9jVkLhxekKqf9L1r96yrufZT166kwq2ril8BjkAGv8b3q7Yb2xQ19Wb7F+d/2Tlj3TZiIIjGSgrBsCwhP5AfsapzcUgtYEAYLJJmoQFYsUxhNgNc4EL5Clf6yCzP/gnd7auuX8zukpybG6VPdjM5HhwjlpLfT26UHWF9ovdFbuj0BW5ol5ZbK3g2igJwiGl+o7jYE1Qrq29sZOHlPHjz/rBEW/rwvAIe7n3NLRcOTyApWEzzG2YWO1hJv2pPZPnl3vgjKD+sHeeaAwPeJq95IZ6TSOHJZb7/EtwuLnbMPd5c2yLz9Dr0Hj44HhdHJFwvrb3k8XgUKSmW9tunix0GqZrbnMnyZ/IfWkHrodFvSPnvNec2+jn+NLICiiu4JeD/vMnmsnfXBFmm38nME6QKUpou2eFwJAVTeCWWwt237zsDxL7B9bK/npOBflBr7//6Bje68hPnzh4PaovBxW7VqgQzjKWUczsmcPKStxf2pxYyweLdfFF036RB6KlREHsePPLklzGFySMhSSRFZ18cm+2PCkjqW3xh8zx45kz0pe40JuMuzmkLZO9irxV9sBvpjT2TGAaeCIyHsEosk7v7xzpX3X2wZMnFVQ+y1zzeUJdLFzvss+wueRPHWeb7kPly2WwPJqHW/mNThfxbDOPj0vEze5WoOufLCIhpvgI8xEA/1QtPoSpkvgrcN1kqRYkMf/Nq+Opi9xB47iJKZEVstg87lccwwa2Lzf1DXLSvjrtNlDwIgiAIgiAIgiAIgiAIgv/swYEAAAAAAJD/ayOoqqqqqqqqqqqqqqqqqqqwBwcCAAAAAED+r42gqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqq0B4cEAAAAAIL+v3aFDQAAAAAAAGAT5HoQiF5DI5cAAAAASUVORK5CYII="
+IMG_MAITRE = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAfQAAAH0CAMAAAD8CC+4AAADAFBMVEUAAAAUO0zu+PQfTVwgR1dCP0LU8PXm7O8gSFjC8vU0s75GwcpUztckiZl95eclP05Nr7wxc4Pd2dOg5eSw0Nknc5RTkqAlN0Rfu8d0ztGF4PmCzuQyYXJkv+RGrbo5RlE4VGJOwcteyNQqk6IVJDG03Oejv80UJzYZboMyo7MKHzGE4/FtfooXN0jr8vh6k6NdcoNB4+bZ0te97fWpsbgECSACBRgOECMZHzMDESYIEBoQFCsR7v0J6f0PHi8YGygEGS4jJjdz/P1q/f4g7/rq/v79/v0YLDjz/v4HGyUsMECN/P0YMEgjLz0PKDyF/f6m/f59+/wV4vgtOUo2QE0G4f4GHjhg+/2V/v4ES9JHT1xq8/gEVt0GJzLi//4GBw87RlYE2f4jJClRWGWd/v4JPks1OUF68/QHpP2w/f4dT2EWQlP6+/Xa/v4iOkVT9voIND0V9/wLxvzQ/v4Fz/1FSE9BWWcYFxoFZeSL8/MJrf0GMEoECjMw7vIEJkJ3e4FbYW0mQFi6/f01UF4n5PpscnsGRWFE3uVea3oFR8QJT1cwLzFNYnEGWtIvVmsFD0gMuvvF/f5E6/A3ZXNma24gYGsf1Pop4+id8fYHlf0s+P1UU1VV6+0GWWgHNFmv8vUKZXQMdIGIjZSBhIw70dcop7BjeIcJT3VC+fth2+IRgY5p6u1ygY3i9PoqTVId0+IIhPkHc+8PnK8mbHlOdoRgYF/S4Ocil6Ujwc4arO4Ki5xCZ4BflKIEOrEIdtcXrsGmsLyVmJhScnMXodiIlaE3doTm6N11i5klwPeXnqcKb5UQhuO2uru8xMo/lJ6mvsukqKtjhpgKX4VB5/294O8SvOMFFV7H1NsIOXKQtsPz8+UGLJhOg5cOjsjL0ckPmeoNWawKaMGHo7YOfbF4lak70vVLoqwKSZJ7o548ho6UkIiUrbBfiISXyNU2s+W0sql4trtmqKiHgX3Kwbt4lpAGHX9i3Pg8lOV5cG5rn7yooZste9VKuvmr0+uCsdVEh7qEk2JPAAAANXRSTlMACf4WJf7+/Tn+/v7+/vxQ/mr+/v7+Qm39/Pz+k/1osteUv5m7i2OKxMrdw5LexsLLzru9r7MN6CUAATlnSURBVHja7JxNi9pQFIaNkdpCaSkDgW4EBQulZSDt1m5iEgIuHLsxIGQliJAgISsXd5NN1mbjEALddDGD+G/6g/reG1PtF6hk0d6cZ+ZmhmGGWTy+13OONzYIgiAIgiAIgiD+cRSlQdSMVr/fahC1otV78aSvNogaoXST3bP2e9rh64Smb5ONdUsbfI1Qe9vtKnaafYp6fdC2gzCN93ZbaxA1QdUHYZguLaf5gaJeFzrbsJBOUa8Nqh6CJPYc276lqNcCpbMdiKRz6e03DaIGaHrIpTMuHVGnCU0NULos5GwL6dS21QFNN0+l+7dUy0kP5jKDwUG6zaG2TX5Eu3aUDppUy0lOC3OZgmRp2cChWk52lG4ZdPTpVuHc9ynqUqPB+THpju04Nrh92iCkRS2CPjiV7vu2TccpJKZzdG4W0m2OTyN4eVH1z8L54Cjd585t/wNFXVJQxX06JB0I6XBerDfUrMuJpiPkpXOzkO7boOn7VMvJCYJeGC+le6V0GsFLi5aYwvngD9J9u62RdfkQRydK5aV02C6ho7ES0mGfwp+Sfhf8JL3ZbxCSoelhSSldJB2rgM7LSQdmcYOyRcellO4fk+40qVmXjI6o3Avdpjk4Jt3m0GusMqLq5i/Sw6J6t50T6VTLyYTSZRBdMDgkHdJFr3YCbfAygVkcNw1wVOpU+qlzTOJpg5cHnIuD5VDApYtNPv0t6U3HoUM0sqB0tqbIOBCXP27vDtjTNFYWylmcMI+k89Cb7FDI/QDKLcuiZl0OfpyLMwGsQ/lfpHvefk+1nBSIuxuyQ6/GrYvvtskysH6S7nnBk71FtZwMqD2WFUGH62Lhwlh+F1mOfcQJgiAKvD016/8/Sic1syzMsqzY1rNCevYwu38WOCfWrSCKouCJtada7r9H0xkUZ9kDltANuPOpsb55Fhyz7kA68BD1a2s5erBUTKv/9MoqLs0YewDCOgdFHFtNh4axXsee4/i+jU/H8iJO4AX7j+pV/+lpnw7aVYravbkugJ2EK19NV6vSOoBzg7O433iHrFteEEA5x3vy5hrnL999o3KgUp6+Xm+uObvY0lOWTofDIawL7Vw5w94uWKzvY+zwDg/6Pojw8QTqveCa//S0d+O1XzaI6nj1fLcMrqiwuilSbkwmEwPeuXYG5djbxY+MyWJxH0ewLqRzYB1xv6KWU7u7eE83xVVKJ8ndoH3xc6am59PhZDwajcfQXlh/4MrBGAvW118ijw9gIb0EIxrtYufJ48aiE1eV0mXpLPJutUtVzLhydz53xyLr01WaI/hjgIsQv775gid270R54F3crCudJJlEjk/SK0TRGctjr3nhi2Cdx8l4fgcgXSQdzg08CPABXNcVV+zwmzhexptNxIcz1p5/9pWLnOvbxEXXT29QViGtr5mZuoHVvsiF+s4YwTlyPhpPZqs0TZJ8OJoL3Ll7B/B1fr9c3rx+sVjjd2E+KuZybe2ytxdm+RLS2zS4r44OC0P2InIuuhFF6S7GIuKzWZ4nSZqmq5VxSD7nrmC5/LKcL3YJeNztFu78Tpj/qF403GeL2HJ8GtxXSJdlIdvFlu3fvrnABa/Ucs6qYDqbjIToo3NIx3InM773p2mePz7uFmt4f6adXzmwMNuONuj8fBrhVobayyA9H/Hjq+eX8N18B2ZgCKZYxgTST60X18P2Dx5WnDzHX67P9afwg7YZ3919etfRCmnpLMtYuosszMjPLeGVHhpxAwvgC8auomb/kfC5MC+u6/V4bMA6wLgWi5vvKeffRWGy3Qa7O90bVSGdNIN0VqTp3BJeeTszxhM4L0G7jr585JbWYdt152JzX+DxAOll2Ln25O150lvi1frtInIcukvmO3vnFtpIGYZhx8TaaIzWlfEcSUoXtbqo9VglZRNrbMcyGVvo0MFS7OAQ2DZCsTIXxTUqLbI3icqGGoi4bmlI9cJVEfVCZbUIHtm9EcQLUVmVBU8seuf7/n+mWu2ko3izxq+ph2zT7uaZ9zv/s/9ySKeVtbnBPaDeE4x6t4VaXKPpMPFvxzEcjZzzf0jnbA1PG3raoy65L3YHY46AfhtCjz2J1Zv/z0v8m1X6srBVpHJ4X4Om8J0x0ZexNc8MB26e0DeZrRl4FlrPeO6dVq6rAVexlu+m0PMS+p7/bz+5lSlqz86w8vfyOA96lSeRENaDJXOhhABsN9swJuASui5cepN8Df+lW0jxHEh9XEIvF0RIDwVK4p7jZu1y2fG2cP5m+0jp3NkOd7YK9+6I9BFacFMXl6WJVI4WrHCLO7pr2oRuw3Qyl1K3Cd0jb6JXZ1lI+HSD0CX18mJcCfITkGEC+v6qOTf4T87Dhbr6IkfbYAofTsaKMx09ncrfzONo++tFSJ0fu9RAORbzNhhzdFNPb0Dn/28UbBqgwyxAz0joRwqL5WvDAbsy3L5CikkXROOgLbjME5FIMdIG0ENJtzKHicbOUPDO2ury7QL6wmKO4++gtZHSDactoFdsRu6mGYI6TBbprpPGJCZj8VcsUD9ypHDkq8VEoItqmVv0gJ4uUeiCe/D2jNLVW4zM1GptkPArCdeNTA4OdvSpStCQzuRdLDcuumL6vSfgnd/UXt2QUve8O81xzT9A1zzoloWyntQB/ci1ahCftcCb2MDK2gyAyy3L65TAMq9UanOlSq0NSnul27R3YP9wsGPXznDA7odkjke5XkTRJm78FiSFVxKGIajbyOI2oFsbCbwUuoSeIXQ9XS0A+ZGvEkqQ2xxw05JCt/IU+p7gmRyjeW+lksuXipW+NoB+SpfrVmoU7ORMXzwUaIECjl1yh3+fvENC3xNk4qY2KHWbzt2DnmFrzpRJHEM9mAM6qI+Lnp1VFdDVIMUa9qkF9LJREjeTDp7JhdSEa9uY9RQrbl8bZO+nqDHbjRWxcQDqkURYCdiaWZDQ6UgF81Pv3LV9BhRKejsUjgDOT1CXpRy5izqOnXkYtd4cwSaVAGsTGLPcLiJ6wZ67EyahB1mkCMV7NZOD3LytuW0xo+mMmaa7ozSIvTREdoh9+5DOzjtTOfbfuckoFIU56/bU4zFNq+QodA86Jy+Oa8MqjOjU+e/QLTr4RvRaNcARCkx7KXX8ntJ5uV25R0Df1r8raiKGgGPma8Wi5rhtsW3TeSH+wLHKzPMQB7jv6lG3Pa2wvMrzCQuwsuXkZdJ0Kqhvr/Vw0jUB13UMKXKJmFKnsQOLJ4BbULfGQd1ouBcnQgF0vgzfDuT7CxmjgmkLcAe6SRVlbqOcEErPOY7bFo3bUNK04eBr2DjnIQOIfWdom5COkg0mFlkLDTcvMngI/dTt56xKt+vuyOdcV07aaMzZ2JajmQaZS6mTesbS8f2L8UA6F669PI79K5GjgHcA/66ouAxN5HAM6bgYnYvaArqSgMw0N1YSeTiwT+7qCbU8ogLmvIHEQnkVYKoNxxbCYhd+W60rXRce+ux4EW7ckMwleItNGzCn0CVzUqfQG9HvXzqvR9m2EUfi4L6a0ZEfVEjdY46iraXMTTBvZhSaA+jxU9rAlARyKzr4yVP3wICuZc0eSgro9O4FadWGjf1V+HeGh9NbC0W56vEnai8V8xVKPbNhVppJvcjiWK2ROD/RoKlf8NQHe7fp96nMMm5nGkfmKLywcVWbEdRb/52OlLm42mTxYDpW2ultg94MrFtAd2MRtC5JnZr1d/Hha1eRxZE5dC6HYFW6+MlBnj6bKfWpLWP65fe/cPz4G6Wi6wqpe+AJXaR3YA3mNDLXo/Wnjj378VsQa6v4hH27Bdj+ckY3WXdhl7YWmUPIgaGDoLaK5gzm9O107hYuv952qNhQqDsQGTN4kfPeeTqxP9/hl8/Fq4CO3L0sB58yh1907GKttqNC61Faefd7svv2HT12vFRD4+0P1NGXM02ZunvQuUHnRD/87O2JU19uudUarzfPy2Cp3syBeKmEf2B7XjL3rdRVTv0qNh85ruCaDvLHtoEe4+IxpJ5jRtZU++SMj9gThVU4U55FQgENr8qcjhpDONQcxsRWM9Dw1amx0X3HZtYjJXbeiL1phM7inYm7xzztRM85dGxq7dkD77W6kuIOoIneruaCOaFHikUIfm5SQMctqrZ27ZotXXvFZjPONiwLbqZNoKtJu0LoegzikO4dRe7gZKQnvFWVDtYgPm6kqziAyvuHMKdbRZklK++Luv35KJfck5oYenvto6NflliSS617/l3T5XhtXBqEXo8+88bsgVTqg+lWUb2rAXD06nnTrRF6DUEdKF2cmphB1LlzV9jPtdMInc041+Hllm6L3gxrZ1Gnaq7rlsTwhLEQWdmWYldjVdDl3pORWURsB3UeMC/AKRMhoHe1uLyuTmWH9qWWVl4571ip4sqaXBqXKZxmL06KvWBY9Q/fmJ+YSmUnnkVUb3WYUkRykK5Q6XnonptYutNwDDNfmvxrpa7Eky5o02wT0OncDUv87DaBzkKdqyygjkEFTTp5YI/0qMqfW2rgbTouXmEUFsD8UQmdzA2otpHs9P9Bl9wzOjC0NDX03drzx84rEbpM1fHaDejM2yF2Phm98J0vp97rz86mnn3yXH+ph69oGHZOQrdFK1WXW7cN7E5bDS0f2fmXRbprdTZjCN00mcflcxQ6zGkT6EoCCLnDhMkLmxpyKImSHewxg9mMPY6v0+Snni6DOk1CF7l3ozvkL/QrsxMDNw+tjYx9tz7zZY3vsyVq8k3QZUwH80b0nV9n15YmZldGht88cF3IP2jULRCE5WyYKbMFy8CsBks32JmPbYYeEjKH0PECmbzz4VjCy8TaojdDkIRu0mI19lQ9Y92NGYwa+qNf1DRZ4WlwodX9dO+8NxTvKqADerV+tr/QL0vN9u+9eWhkqf9nOPjv8ybg/BU6DVpPW2de8M7K/Hoqe3j6kdTexz5X/f37mfTvMOZzXKsWbiddLa/CcHiqvkm9agLR3DtM0wzqnOhmJPT2KNMZpylct0Ktl+SqI3nTJicn52oSuxdAdX4tXsDEaxFpHJVO6AagWyeS/tPo868cGum/aXq0f+Kx1JtLHV/syLl0w5uhS6EX0IuL1g+9cdfK0mxqaWw+m33vIUjd17/XdUodepWenW5Hz4D5gsBuxTfJXGbsm0/QmY6Y5/7XKjbVv6Ou9hI6mJM8inUYaOO0aMcMbK6Y642rG9AP1oHbJHI8qoBO6gsZA6anT5zoUnzRXJYa3j1y0+jYUGopO/HR+tz3eduRWt+A7jEvZCD0rz97aX4lNb120/T0/D0TP/6k+vv3qAOpe+vT/I64AiF0aeO/X4gKZA5/zmrFK/PkZp6OLG4b6CHlpIv2uDOQ785rKEmOtszl2Foj8Ah7HOxy0G1elPQmrqHu16I6vbuuu64+zpoNtpoW0DMn/NM45fypm4dvHBu+cWotlVobOLx+3lE4+JicsNAdS+iCegHO/YxLD32ZXZofG5oY2730yD0D3751na8T6byioRO6t1XJ6iJTaDIvRDfWbsLdSXZd8eGaMjWRp2ryFWcDuuLXvevrO+nCfSgZy0d8BilKUid0jVKv5COlCK1YI29Uu6bLPKc3Efbe4IN1E08auEC09MJ+QX0VymIed8I/jeu8Zmhs9+hNYzePjoxmp6ZTH6x0HIeDd9JeybYJeqZ+5jefPDy9lB09PDIyNr8+O3Daj+de5fuH666nN6CTOYUujsDh8dwVYa8dmIyZELYc7cCE0ske0BnR/Ss2JdxTi3ScdNCVhOOW0FtVtl5dE9c9PtwcGqnEXcsLkVc4+UaBls/HeuVrla6zDjr074zr+jhSOVjB0HS41cVLO/1d8AtDw/3DuwceuyF7eDb12Agd/A95hHVRpcGdA/pGXyZjHbzg0OtT62OpoSd3T63Dx9878O2P/jeZOjvakEGd7l0I3RLA0TZ81XM+4fiFrikKc8+3E7mpI/HL2R70Ro/PAl2tWDp68kHvRsE6x3bLVtDTWhN6JWe6qNyY2NZqeBc1sdfk8M0C9aasDp4hqJs8k7YoqBd05mSFaiLki+Waodn+W28dS906NjIymho43P/dChx80ZXyBnUqXcick5YzzvzmpfnpqeH1vf0DB6amsgceePChp3+6PuSfypmEzoQMpmtp6JzfqfBcUt1Y37CbGfvGcUl5JtrC7MFJN6FvBbYzEWPT5+jJl9h31TW3NHPn6VtNTeMNVN2kCLi48rmxCm0Xa7YLGcBvu5rIc5vRofPyF1+1dH61bmgWoS8I6JnyiS7/vkw2lb159/ANqVumb+3fO9E/ujT60crcp3TwYn5ugRShy4Fq9IwLnto3engUzbj79o5k5yfGHhq57/1f3j3bd5ATxcinCJSAbji6xojOqyfqMQ8lNILO5YVJ7BK5Nd7QbENCLwD6Fg1b18WabO0kXJPtimox9l4mtzjWEK8DoM7cPZ9rHiHXqAnToG4Yr61GvX5BUvXC+ovPWdQ6oBvl/QI6SqXCon+9dv5v3J37T1tlGMftYFJbCgUtK8i8bOqYbt6hp632cFpNPS2HrmsF0qZaKXAC05bEDNKQSR0bbRxZMmCWDJjbbIGusCUwaYMmoGGSLQ50mKBm2Q9TiQwn6syixNvznIIUGH8AvgKJWiDwOd/n/rw8oKIZxqGQm+00QZnMWuIU3Ts6+8bP+1NY+MVzStcvmHdI1yLJJz6s8ZkIj52kTtGmLpqe8pCX2m+ukbahjsMllUvQjdD0xY6NEKzToi0QYjUipnIO/8JNKMDaypYZuAfOtbo2wwOZs4ayI2++17YOx2T5UoM+Zf+LkIz1rfLsGU+h0jnoZcgZSbNuUD02zCf9Z/F4O8QInTup24MB0DpG8ODVMU2HxwSEvmavJfFJmlERPlWXWetkTErC1EWoeomJpjvvQalb1fHQwSUnC6cPtzgvWEwmh8Oj8HVpmdnRqYq987+uLfWtIQOoGKHj7qMVdx+BufS/DbiE7VG1ATIEdyzXxHfjYjHIxZZw0OE8lrFq6wUNH1j3trZ1WKDli1l9SgokZC/hPFTiitaZgUtg2sowEuIOzKG6WW/Af8C/+104u/1+19B/vxFeaiQoDKNPZ7EWi4NpIJrJzfw1re9ORqGzm2ntbJdTa7YQOq1d1dRkHul65WuInFHr1kXoOEUjlu5p6fI5aJXdpLMwDvMno4x26gJ96vfP1krbeKlCYxkH3aoGoYdd+IWSgfnSUxHF28sM6K1YdFrIXL04i8e5ltVpOs7JsvByMCLQs1uHO26J4pDREAIDD8PKOPzIW5azGbkMBsM4lqMO0Q0LtRfvu+8eOLAbz4EDzaeX7BsvWxQRhjHah9VSP0KHCuyt7Ylrp2sminbY5DR9bdBCEGZC6WPoXgvU4O+6AaDCsZW2hX0mg1B8tOWaymm2OCjCru2tqJ910qqmwYO1n7emP7tWHr39FoRyMfNuUIfBXtxKlm5NiF9iDsD/cZdgPQGzTTTuiymi1VjiXoDOW+7NrVYMabiRSff6i+Pgt+JVG8PhylewjwID7ij2+Mu+sCYH0A0x6JA3s8Dz+wPvIvOXAXpPNAL2LZ56kMUKh0ED0DVGdXHHmtU43g6tWaH1aG3lVTbbxJSDqSC1hIWhT5Gner+88V4bC2YC8ywI6dC4W0XTVV01viaa9uhM5hr7JyNnbC3VtpGpCt2pubXSNqwPo9TBaoDQwXBYk8XLRvgzAlE14jbAB64so1+CrrHCw768sYoyfyxs5dxO2/798GlZ6xA6b2tAA0tCsFH+Itct74sfXH0QVAsHlY7MsfkFHCYneyYXlP78gclhcbxTS0DqRuy8GGF5XAOh0/eb+WsWYBVm2tRkK59JOWqzjSQ5CJ1dZdGRFRcUI6NvfA0qQtNiAOicRw+KB1q6VB6L7qBWYaIaambPVM+kzNga7hxhHPPpazXW+Sj1XZUpRis82vDACqVQTloOXYNTAKBxd2xL3gA/4mJLTw9mJh46yjzcAU8EGKA2iBAhjXls/QXvMP8YKDZYmztiy8UbOBufsJSzQX8Zyi24VoTQ4bBq11n/5CRKHc5zByb7pVxku8zCG3EtTeP1Qow0+f3WhDWFbqJVXbbqToFV30nTs30endOp1TlIn5mZmPqSq8tZ1QCdq9KEROLy72o8RK7Z4jQdZGLMA8KjttHBT7T1c+mpa4ZyRm7+xWBA5j9JV9QMEoVR1+JdN7FCHHYF45w6RhTWR5YuGoXyDj6DXBQHTQL3uryhIi3ggqirOQXuEcADrbQ+qCYv5mwA3Q3VC/cidPg4efas/8AxlDpwPzY5lJmxYrBVNCRgyyCv6+iAePn7P9PW0uADSrvM56wuDwYCVk7rL3lIk1PFUOSodqz3zRttZWBfWPDp3C85Ih2o8lH1OsJkcmLrvdomCgX8gWlbwdSguWJuzbQtVRxG36tnDcDc+9MynaNyBVGvAcN2kDp2YJeg4zGWQEN2CXrilqc6mpsBOng5feWRSrAD63PHjS9sRugQy70CB+QO6dvipmlGsgGtHmy6YHgTo66Z3L377G607vjh2PdDKYkrvmCOSCTQY2crjNC389cIJnYU2nPNvsK602f3+aNG91HaOfqSQ+s0UXZqb69p6rc3bmAEz3LRu9oonJ4uP2f2UHST2WRi7KDz8bAwus8vHCgyD1441J6+1gwNPyeE0N0lwDwkWFUy4G0PRAE6MgfkyHwBOoed1RtR6eGMheUJrwt1DlkfJANo3dXqrHUYvKN9azZqepo7DJU4Ogg9tDdewc21hZzNiKE4WvdF827V7NuN5wWg7j9woOdsZFXXMXVANCTU79LrAfqtP7eupcAHCp3KXlVdY9QPt9REwykDNnv9ixabHaiTreZPJr4+cqPSbbSCWYbIOySSVhU06QC6xe5knLNnbDMhb0ANl8km1+UfHNwLUl8jbUvIkbah0iEVTxZu4d8mphk2AnTUeYz5otIRu1pvAOjWrAzOtGeyRqzfG7nXsLv2l61b6Bi+a2AzQQ89FTecu2H1Byw8L9aDU+O41K4Focfu8USNo8yPHTtwYN/ksGBV15G3aeB0RAjBAGjr1p9rCD3xCZtT1XTGVhfEm2rAZqrbWuQVvYMNKrvdTim6VD989xe4dbw5Dt7CkcyBPeca7CRdb9JatBOgc2NHAOry1uaAuJr+fKSiPf3m7dM2XnYkC4qIQDW0efNtHD9AZ2OtNUTuXoCOFWCEjnbGauWMWZoAFwHwrcSAaX8ZTN2p2fUYvOOj7tUAdDWOjWBNnXVDIP8KBnMI3YpZzC73QpKOVs/l3737tZfBwh+D7YbJ5v7kh1cD3SYRRULQnQbo2xPWaKP7bFqmq7o6EoDFiB4v2BpjVovW0dsHMbzHTFiaCibGwK2DicGJCvH4lXKov9q1ZjtDMSM11QN6a0DjBrFZvaHxatugZ+P8zXT+7YMWyWbojOvZsHBzGu92Mc1wuGRJ50aEbl2ErlED9Nh6Cy8HoHNjIlibh+YherB1u+50nxdIujDExRKGGmoOb8KUcyKHBqHjpBh2oxehHwDmL7/GUd/X4+3fDEHOauoXI0GMBvSbs9cQ+rOMjR7R2k4HenBFQlO8z+/V3yhgnBcGPRTlsTNdhTX3XDsyPi0IRvoFAsnfe5xdZrvTbiYo6kKX7Z3MjoDXuuvIm/sNHcnhgeqmQar95hqxXGKOWA/RgUF4L8ect6o8P5ys18fidpS5cRG6ZhG6mqvNJIqiYWRuWPD7amMJer11mbFh+QJDkzLIQKDYitCh0nTkHj6Pq85YDTA/UWJY2hnXNENRBg5aeP8xl7d/9aMOn8l/6GJECNSzxGtkUjtGGLrJV/1OqHkf/rkWNdTvAuH9H+USlkufUTKzmXB+x4xd+/JGo+TixYuiE39/WGD3UAxt16qo933yPQPBYb+X3f9G3xv6jkAg1Fk9cfDQ7zc/TbvtoEO2KAtKcqHN2Qlgu1JXuv6ErVEhMl8OnbvcBpM2dOpcmp46FIV/iXn0GHQWxr3163R4jg/QO9hdEMfF2irGMMu2/ZUWB11v/A96sbr53d0vvwb/IPYeV3RVHMfLuC+Vz9+2U3I6uUSflcO/vXV/fBQ6ZAXlJ709x/zNLk0xsG8OZtYVUrrWUrNJBoa8y+4EAz/Q2H358uU/Pnqb8YHNr9EyDGGaMNneEUT9LmPbm3e+6e5o9gdChy1TtYdu3qYYy8vgJ6bmSHeVhYRYDealXUpa/iKsvgsMZW0li7Yd3heUHoOOTv1BHoQGQ9FwjLkewwx4Cay8GdzrFHriU5CT6IH5gtQ1Hc3eW1koC6zOQPi+OLwUU7oXoCNzoO7vKR6OrLzgiX9/zT1PPPTQzp3jp1NKpNl8Pj/hdmPPE065tqHqcv++Yy5oXeLtjx2Rzrq3KR1J6iiC6CLIUZVl9p6/yhu7q6puIHMPZVc6TEo545soeGvaFS02hEpgZUkN0JOvaK8eOvTB0/zVsy1PP72Jz9/eliLeksrj8dM+/3xwZUsuTdBvXICOTBegA+/F8ow1i4PeH2Ux0IMgJ+b24YGAwtWW9Ri8Y/hu7YBRAzyV2CkvdiF0lChChwiZi+Ni0IsB+u4Y9OcBuqu4f/q+FcLZoVKYZifeLnr0Acl41vi2bdlP7FhNnXe/dlZLF33Y3T/sLy7u2eefLLaGTtRVFdgpGSnz+QjCXlrhKR3rffGLt/bsuXbYqfOZdFSFzJSXl6tivrv2dmOyy6vpAGdc4g00C0XnGw4dan06dZW/3vHE4IbPUxPTMsXbN4Hks2c9TP03KwZt+IJ+K7p0wxJ09dJatBGhw8+YkIPQY9P9bs7dYT+mpO3B9Qo93AEjIDADwkldg2un39+SpMWWACE1KVuCDtS9wHz3gtKLrUN/ZKxMv2ltLjH25VjhQ9nZ23N27vwo8+cdiauz9J1vT2iVBZLLw1G/v2cfjlskN1ZVFegAugkqdVQvVVsPYd2FPlNh1xcqwkPaLToP6TErCaWSuXZujyQUiBZrwtbkaLNV9M7hikO/Xt20ivnWD2cvJSXtSEhITePzNz30wG8NNA1eYPkLEwX9IW5c5r+DHZeFE2ZLEDqGg5zS4YC+jVZuy4qFKHedXlABY3LhMhxsvusIJ3UOulWSzUPoIStAZ+Nv/0GlI3Z431d86+IfK1rwT2jlo71yhe/LsUe3bbt/Z2HLz5mZP2cnrG62NDSMEEXHJae90WEorLn0mSc6z+UzjFKmpOBdt7e1lGyFTdbBEQIGJh0WSkvIZEoZQb6qkCmZkZZyUagZYpFoAIYlZ5pUEMbdn7Dye2S3fDE7MpUUs/qpD33yW4W268VD7Z8+m7i8JjccwEvLYkLHTH1J6AC2hA0j9FSAbkS3j9BZhM5didOWdsf6PGkhFoR+5C7gXolSj0HP4SckJqSF1IbKXTHo8AGV3ozMkTpCD1zckrA8/W6SFzT1zaoUZ+754dGHHi0q/0gcCmX+nLYSCG+bljFfYooaJZGA3z/ssrLT1R8W5hPAm1AyZoqS6QiZw35m1D6qsxCMj3Z45Iwd/nMFqSBlueapt8uF0NGBBXiNYPocU/r73MZNq5hXtVy7Ntv76ac7ePgNHb1OZ9eLG1pr51ZIfatAUIbQOeZc8T0OuhGgQ4KSuEU8DErHV5SUGTnmOGlZ8hf/jvV5+E+xeDfHEYReWQb3qcO1fFbJ5ez7tqTlJBv1+yvdC9CR+SJ0VHpP8U+SJ3jL62y0nFL6+iZU8jNTl3yFhS3SzeFwZuaWVZnbJgVB6i4UFFWJgsXFXqFQUtXyNq3MlcHeipKw0K066n2K7lU1mRiLTOk7ozXZTT6dxUeYN9aS8Gg4JqpOJAf7ofkhlLZoD13/tbZ928pKXMvhL679+NHPs4NTiTDT9kAXU9D70ob0+dr29OVpW5ogWLILWONB6nFKx5FYIwsReoZUyCkd67UodE1sjL5tnabpaN9T9Pj37WB5BWI5vbq4h4M+sP1Wzkmh0X1kf9w9MFa1izPvzwNzgB6R3Lf8F91EkyaCOrhhSkufmZi6VnVeHBIa2czMJ/grla6S0bR2zFTUKAp2aASd5VUtcrlKCS5dCaGcQlaho2na7KEtMkqp80FtVpZXIVOYZQpClicD6l0Tx7+6fDHaHBUPOEt//b229rPl3yJh07mqK7+Mj4szf5xI2sHjPwlzeF1J38xdv7qxdC4dtB/fcu9nl3w6YLVq/puiYN0wwAO1mYztguGoWo/HAOlabHrPmLVO63GxkVCYFMYRbozlyowaDN9F3ZclosuXg6y7EqRuiJWjOeh+zNPhYJoe2Z6xLDwbo/McjIKi3n9pSpWnHf16z4A4aAyG3ZmZOxJXQIelRUZB+AqK3jkpYMfrqhvkclqF8qdIT4XZDLMUNCVzkDqLBTQPc5MOE6lTlJIEJcuVUZRSNfbd8bru/qBw5gz9fjtZWtoKAVv8cFxO1fmfx0+6UwZaWqaeTX2yt0HrS3p9/tffb15HqfPjf3xczuFqbTHoCz8sZ8JZ2FsNPcINh6DS3QhdzZ0Y8/UZuy+EuYJkdRmaeAjgWavLi9C7v/qqsfN0IIzZXEzr3BXMGoAOxF9+HkalvKInEpd5UZOCOiWTyQjKM3hJladq2CMRCQQnhGK9OzMeCZbstLky2HJQ1hzOb+w8f7S8Kj9XRSgJinQQwFXJVFCevWaSaG2/lHTpIKWlZRaLbC/ZaqEcJiI3V0nIVV98V/dWp/R8gdnDkGS7pfTC1dT4hmrnuHQ8ZXpm/CjsO0546mHw4vVvrs9f/+B6envpdZB6vKULCrHfsqh0iGVj0HHmm2WtKGde6kD/T0ZuA9/IXbkBDcTHHlyfhZmlKaeIILmkciFXR+iR7q+OH6/rPBH0AvX3KnFpYYH6PrDv3NsxV+DisnmztAfyZAftuQcBG7FxaoqR5Z8bOBm5HIlEginuG/DSOKGb4NnIzSVy5fkN+XU2W1WhXM4oFYyOUpCEmepF8DIZWUvWkxunktopu91kgiydMIPhV8p0tEJL0729tvLDTIVFpQLb8DFZATOxS8wHpCkpopMzA0evnD9Xw/hI7cGk+fm539uvfpw+V3ro5lX+MuhBfZx9Ny400zWYorHhMLh0/IrfRg1lIHUjyz0ZWVlbMtY3cxzez4kIoUV8113vlRmLJ7+/FezuPv5WXfk7Q1GvtQyieqSu5qBP+nc/D2LnirCS+NIM/0lCwYyqlFOXzBRR6uibIuRFjSdEwohoWnwyE6jzlozvTiVlz5Pl5ikZubKmML/wbblcKcullAqFjFSASzd79lL2CrL0QgVdWnF10K4iID/3KKEsp9srU9CqPLD09OyYky51EFCPt1iY+tqN6Q8nLD7D58WZ0qMz450z54+2tDR8Qqtav/lsfr79g0+vll649EHtB+nxFRp+MGiIg764Gc26S2B6MBRrpmPKZsAFfJbFWC5r833rNYSLP/zsiDDk3n8E+Gomv3cFu786XFBUV35iOOo14jgYF8LHnDoMRKJ1d7mCkoz4URh73qu9DbS84Ms+H0WSvr4pSl5+QvLPPyLRCaloPAW0vsj8fgosOTAG/0zIcu1aBjjbZSR4dNJCkT6KMMsoxq4oPeUrLKBpS9KgnXRYCEJldhCkA5I2SiF7tbTUNuEjWykVzch0FoVnL/jqR3gxN3M+M3O883xV1XTn0Zmqhi+02k82zM3Pbfz1m6taeu/Vz0oPzcV79cRg0LqrbdGjGxegq1kw5aFbLPes8raIhwLc4gdaePe929PWsTdfZuJzgslsJXh1g8vvEnQ3XmkqLCwvPxmNdhjA2ceW+dDZ+f0IHbJ0VyQnIV7oylf3jilsR48f//KVXoIkmvoGmfzD0DL55x+p5IREKs3kPGnGI5seomQqnSyXUBC5eTKlUkGTr+ZRhAzifgtpJkk7QelgdYkm3z9VaDs/UJ0P1CtKGbM9T3fQRLa2UxX1FsWrCqawYMwhY5xOxrL3gqf0oKL048czuB9kRiqdfqf8yvmjjX80Hj38hdP2SdL1ubn26998duZKudIz+HvpxvjmTAJEcgvQ9eDS8dGOXWbGhkNszHHznhkfSsYbkt1Qx8mSbk38fzDnTLxIkFwGYyYwHSturDo3VpNftKdxCKjvAguAI+CxQixAfx5LM81DcQtLPBA6ecGZX3VSfLLzr1cmwOrWJ2H5ZUDSLZFIRRKxSJq5KeEO3iPPPAB1tzx4UyicKlkeoaRphQJcfB4adjykQknCM6B4/6DNdkIYEtUV+l6c0lEqcAGMMs9CggcgSPgEVS5Ydqdd66PNpKPW0Vq78erjGTxe6nlp5nj5lb+rjg5UzVypOucEf/7x3M0P5l//YWBcPFNEfX51Y+18emq8Uw/g34WLQefsGXcrLdxDFV4cqgP3B9BxoiRr8/9F5otNqRzYS4KOYTgkbmz80DdWYys83h0ZjmKdts0dy2Q0zX6M3XdPFgdOp8Wlaz45rJfJbeNDUVew8esXZymCau27RBTtGZD8I+kWiU+fFoszsxMSn55QFahkEMgReVqbXCuXOwmgTurMQF+HKRvlI00mC1Fbf6qw+vSw32WVlBf5NlzdCw6dOOggK0pfrdDJ0DUo5QotWa9QXOpyQrXeMksf+mDD46mJ2eJ7RdOQEAx0DsycP3wu31a/YT59/oPrr/8wA4O3wsP5FenXUepxN+ZgTQ7/9COXkXHLsjAaZdB4w4+l/mcHh0JluNIa+keS+n9iziVvpwWwjhYOb0boXaNNhXWN3f3RqBrdehgHC1wIHeM4lyYgyYhzDk6FataZ3wiY9rkEnR/1jUAQ70iaoor21A3MjA9IRNMnpeM/Z2/7ssamlavAhDMKc77NVlBkO6Oygb6JPAthYewWsxl0D0G8pUtbLhKcPdujCZ+uszVtmKLMFRSoXNdaAembxUFAeK8t7TUpFDWDJsLRSjKth/Z+nPT4psd2/cvdlcc2dd/xFXChuQiQjgR2dvd92n5+nt7zg22eH7YZ81NAjrxYz/NDtVtjCdkWyhbb9RxHthUJYg80J5C75KgjkYuRSIE0CQsKOShVBsrQRFlGIJRwiAFbu31+DkfZ/cf+oPxCQ4gDlHze9/58P7/8+WS0K1k0XzQy7da6Klfev3Wl5+4rt0eyI/v3R/LL2btrZeJ90Gcft2cGMUtEOAfmS4QRooiHO93zYNOPqHaRHeAQ5ee+vv4ZwxyUz/zX+/6WvWlnIXpk3S0dl70E9cHOpp0/znTmNgP07cjkyIhtc9YXV3xwukaHWzTldUc6wX/al13//tnjlJLzrJzhVVXlZRXz87WF9XNz89eqzjHF+mKVQolcjdeE7PMjFrfXqEN7jmGANnljzWb0ZVCQNb/7zh/f2r+rpqTPrQm8MePx8JIB2260wiPxNitNa8WFbrfDort6VYuOvDTFxmQXVhZ0J5Mj0XUjA+85up32oDax8tb1mz3XX7k6knV4PzShW1/UsRdQtq3F3OVxUN/zMrmoe8nSid4CLgtrrdn5mUdfAhLFnW3bWvvOVFz6sM5Y/oPa1IF7Fa+DzFpUUWEPDQ0BdX15BZK5yI7X9pL14V3QA3wAekkf6M2PDD1YSk1qNXVH9oMviQF5Vv37b0ySrsnKGaE46CgrTjpgfF32aHdIQ1EYpyFCm5T6stqi1jq3M2RkBLPBTKkFE2fmBYNCbR62RHMjb745+FZnJNJU0+y0tPxoTCZJnMlGtfACp+RYg1bXseBOFkZ1oZnbQirMSQlR1rPyjQ5ndXd1ddQeNBqDFu3YK+NXrtxd+8rx+b795KqRw02tSdqzMiXeHIUZPwrqeUugk9YM2WpG3Y4k7kuP4z7GbNk5fader7vxjQ/rjOU/XYz38g27u7a2oqys3B1qGeq4BA9f23YUYR3L2DtBoVwK6sjjSnLxXXtk6Ba6o0Njb4adw55w9WZzxfQbp1laTCw7TanjRsBebreo3O5ptRI1twl7KkaT0RltRrLUZXHEtXIU39hkQ3CntVpGuOS2tzUd++Vvj/yxZnNN5Ghkwm5veSMRk7HWFq2L522C6JF0Q0PRiZysrKhu6LTgR0QYZ0tlYyvfENJut0ZvNOo1LkZaeevu3Z61r4wN5UYQd2rQYq4ptCjvw9QvPI7qn2nOgWwwWFAZ0PHTji15rTvzH4+ECbvui6+/XlF7Y+FjH7KezPLPf3T5fwlIqzYe2DvrLsNxVrvdsPWTwy3ustePZR3dueO113bsJGJuqNTRmtncipD+yND1Ct2MxVIPAYpfEPWm/Ueb6qtbTvIiHTstKXm9KugKubwuoy6uV6spCqWaVuUqdtj7CO1uy4i72hsymHgDb2UNlABXP2239+Ucfbvzl29j62hb09EjORNu99iPEjHWbDILlBgTWYOusts+l92+vQkvXb2qC9hE2u/xSReWjRviVd5KbWVcS+uUqZt376697k9Hj2BhHjlqzfZ9rSOMDKZ+d+2ax+2ZfMRrqAVnaJE7YfGw88IPwovi/4toXSwOfe2/hvTnlj9Vj8War3znK/+5kwSqe+HLe7v1+qDeeWPA4k4PDd2+vFBWhmSuCZTjl/NKttdsR1AneVw2QvojQ9eoAy0WewRK79BoI6BHciqcGiurBN9FrQ4V63SVWpXJqI3rDFqVQg2mhCpY7s4Fk3nfpi0HJtz9QkiurkR/xmbWanVDjoq+nCODg52dP8FVyK+1Zh89cifX7T4NqCi5ycbZfLxVXdkdxTY8NmByct2hyZAU9nhO+MRYz+iycNriMmkhcgGhCxF+XCYyjrkmXBz28t6fbd2OaayFnYKpYynm0cwlC5kcQEffFWoD2GaoaS8EY+yDGW7+XLKqYCH9tdX/JRVe8+mvfO5p6tatKsLM7Dv/8V50LO8UHtrtpYL6MufADYsTtr5w+ZKx7MzgkRrs7EHSYQl05HHNaM08lBExqtRjLbpaXO+AiA4dTnjS/GQ5+uWlNqWC41QWLwQEzCZVpUXDuHQ6IKeyFtvrmsBqrNmELfAJt9el1YIxY2BpncEbsvf9cfDY4Nu//Mn3Oksw6d+TczQLe0/CzMqwjaeQs4Uxfut3vphVgwXZ9qasqPvkcV5MSPyUQRSnRnsDIQ2maoaTWh3tk6S746KuOmffL3aVYGe5vQQr6i1iz+hdMTX6+cdBfQ/Z0iQNGXLFMzrurV9EZfYBzAsL57tnOtLpTy3/Tyaz6jPfirTveKq0h1a8BGv96fPf+RxmBf/+wcjf+MJZq9GlL6u4cSnj4RdODusPnsoabN/62ss7SdH2i/2d+zdv7nsU0td8DWWXtiDkzsKlDoB9/68PH26qqzKalXQspqAFq4rRakNxm9cbVDE6hU5rwqBMa7TPIcTiXqetO3OyHXqnS0cqNSTx8Wp3feTo24O//9VPvvd9XJYJIdo9OdlFB6qN1t7egC1sZkVWaQ1VtB25s2nHDpRWQL1s0iPGSn2NjBW9+pUNJ09erjxuHbbROgx6uXE/a8+NdB7eHqkpiUQ2F97zX7l5/rovdgLrEY9kTiGOh0wOGz7gTZTcaZ1fv/xJzCe6e8ekdPqT/85iwLBf86Vv7cNW4I+fqvXl5z5TswfXGuze/cK/NXc8GFn1h3b3Wqlgud0xcM4ND7+wcPKq4+Bc1mDJDtKN3QXWcee+TSW5qx4R3iATYKC1F521Tfsyd+wifPbVFps4mpZ8SkzMDHFMSSxWyquxelUoz1Quk0ll6WrPKPq1bqrJ6nNoqt3pSsmDIZu3312bc7Tzl796+5e4z3HXlt0/eOOnu18GzWOdszjU25sSOVAtOG1/svmPTSXb9mAsUpOda/c2sLErMVuLQMdk5y9IOtK/k2NoRxPCHX6dzNq3//A+PGM1re9fun/z/BWfhA7NmkeVehOW2EnNlrcHC3R3Wicexy68+pnCormFmauudDq9/t99b2HkuLDq8K5NOw48XdSKVUU7d7yMa9F/sGTuz/3LByO7dcPeH8xQeqfd7rixCNSJhz+XtH98kAzXD7RjC6AToN959G1Zo2VUatakUw1Ea8kOKrHzSL29GIRllkWPXFDIUbJTOgXYMAb0yr2Yh2sZk7s2m8jwI2Ac7au3azTwBhS2WNLd7oqsfYOduAUGCcKukj2vYYMawiiv/nT3NWexqbfXYwvzVqXcuRETwAghNG1tzclPWi5qWZbmArfDtO/KyoAICXlaRxkAOjgXiXHW3VbTeRhrrk1577XcBOYxXyMrXsHc5aHKFJrqmKbkHYC+ZOvGuer1H5gJfqOocHG+oMDrDjlDq/815DDyGkB+uAaYP2ULEFCR2Zn3MtlCJ9fmfu4T/ww7uhDoQELffZyg7nDMDrj1oYWhocuT3bU5zXc2oEXTvm3T/s6abTlffO7hpMUiV8pZxqXSVNXWDcK3I4Fvjhab1KWAQUGa5CY51WHVkefCpLdYLMTOGW1VtD67HVzbksHB+qiOhls3qA2My2uJNkdg6L/OPD2gTJLr3SCMAgHqve87iIc3Qa1CSakchQT1XZu27mzFTisRsUg0BvxmrZmOYQTvGRsODwvmACvHZCc2dVOXbP7FLzaXNG3deKnn/uhNMRYOyzCNXf/wUUdP7gD0R/KggboBmH9q1eNa7Rs3Che7z82EkvPJ5KdW/0u//ukaJDLIZsie61NHi14DQYa8115dhsuKCOzfQQ33T/t+W9rz8q799EeVWn1VMhntnka1tbAwdPvqPORk7iCDh0Tzvs6SrVkgSS89JQLph6kZMhR3dFUciwCq7LoyPaeg4V3hr+VqnrJSSq2k1emL9VUWt8XEq5UqvSNan9++ZVv2sbZai4XVqQwUttVCaMTVvNUJvAkdnnAT2/fs/tGyHwDy3bsPFFaUm2dmJBEterkmWdjWFNmFDnlRMq01oIDXVbI9nstptxajHjEW4D09Ii+pQdYQZReEsheb9te05hV1pO6PXkmJEk83xmInHtbqazI9uQPQQN2xYeO9kdAXlj8q1RbvFd3ovn1hKJ1c7Jpzrv7n+7Y/8y1yKVlGWhrrbk+fCs2KlzZty4PUCNRliJjU7te+Az2OJ0nMc62tOXvWFTz/vIlxVXeNVPRPG13pofDQ5XPzOadyNkCAIW/bLogE9q15aOggM7G8krFotSpNsLq2LVJT0wbnjrGZrpRVGuDlaSVQBsk1Oo/6f9Y+pFXIwZkpd9rrs9rbj9VHyzUUCBgMw5i9Fntfzf63iQg/VB8yRLXWVqjNv7r3EDzvlp35QL33QkpU8pxCM190rCayeVNh1Gv1iZTKFDewQoc7OeJ29fY2+HylpaW+UtaMeR7rS4xrHccikfYbC55b52/KxHBpCkcZWPYgR1+VtfFlyGgdwr8u795s1dfWP4zUH1u8sXhjaGHtfW26qyt3ogtPwz9c4/atTPYK0Ek8B4PuqWNRLf/0ph3bWnEvOsRlyK0cu/e+9qQix4rP5u/sa23PLyp49bTBGOyfn3UuoY64vjiR19eaRxTztjWVbHhx1YO+TEhFKyk5J0dhrJerg1X2+py5aLlRjVF5qQLdNwVlRV1uoKwWd31Wfm2tPe0OgSGnkmNwa6+by62rtWjwSKCrqhVCxfa2kshg5y7kXMAb67RbsXDaSjZwWtubdu1D+Wx3m2cupFglp1TSA6A24AbOkFkUS1l/gvXZKu11zTl1dmvvTMDnP5FiaQQYhVKBQi7uxph2PiS7fv6uTOIlmy9c6pFiF66vflCpF/74x+sgPrZxT+FsNarxJb+9/pOLN27c6PavvSAzp+3Ruvr85PoPYgqabAQyiQR0+CVsviHH+MRTN5D5KLoZJTl5yOYQI2E+h9bl4cn84D8iN7u1OTe3cF3BT2fMjHNgYMBRNR0E6t6hy4sDhc3ZRbD1rXd2bkAet9SXYUBiVcsFCmxWrUGtMjrstdHyYoNCoabBWMa8XEUpzRTt0lvqm5tw7U60264NaVVytVxlLCuLRu1uVPkcgzzOpDWW1eU0DR7tfCtSQzbia0q2oAuO9gti/+ZI5+DRpqbmfLtFGF97N4apOq0bye/LtS9Y2VJPgyRKnkTaWZddEwHq3t7eMJ8I2DyNAjg3Sriaq66y2Yl0z61bd2MSx5lR9/lZiUuNfvXBxnLWjpfJxc6tRXNJp/7LX1i1YtX6L3xy4TK+AUMLo7d6ZEPJrvr6vr78D9Ke8dsicO1LZ1dGrGTzU0iLXv4SOsw1aCD8DAru69YdOnRoT9FHn5TQzY5ktdVPzL0w+cbKgNbx/r33Hc5ptLi8oaGBxdmNRfn50HDZsOHjS62Z5d9kUHrzcpXOValSMxTPIJ1za4wCODEsbIxTc0Ae+Bhcltpm1Mlb90xEHWmtF7aOibhGj26NWi1H90yLbrzFXdfXNzh4DHrS5BIGfDWR4kbHpDUHWyVNR9rAsayt8OrE+6N3JVT1Ck0XZElsPh/NJrRsR9pV3daKZY2a7Fq3YaY34aPJUappeB3RPO5iYjcBn4hebof+ZJiVPGJCvLkSDj4zOt2JcfmenKL5ZJVFX6b/2te+Zq+6fPky0pnLyy6khKEh+/zEsebIznWrPmgjWdtJ5xYFDR5SEOjaNz+NN7ghf4epQ+IFNSm5aRg8qDz4ow8k7+0lIEHUts0dOnf8Ryttxv5ri+877JeClmDIOTS9GN14oGjuwN6XN+Yv5XGrQwyvkmPzSBU0GXQMQwlAPagXSBanRI6NNSW5IKDPlrZU9DVFtm9FdJmz93t1LisLsgyhUMjloDyjiBNMFndXYduxU6fOnDkK6spmaJLtABDkbC2JvLXrrSO1dbmn6l90hFiMw/08DcqVpjse94ky8lTFXe7oSCu0/Q7vr0GPzjpzWmYICGGJ/D3g1PnQeb0yeiuFvn2l1z37wrCBa7BJmLt8e/Xy51Bz9YEylZeTN5+sttvLcOz26su3cXpuj46mBO9QtwMZSFPNVrC+P9C/zMIG/4PddvAmYeg7n7bcfWmMtnXH1rdw5wLODgL6y3lPRPUVkEo7VlHx4tzi3tu9K3u9loGNGzc67BeDxSazIb1wzjH78rWBda9hl3kpi2PAVfaqNK6QVZXu1zAsa0CWZg3DuYMORYG6zmGCoqCtbnd9UyQCy23duWfOXuXVCRTSagXsnfgDsOK0Fn1510RW35kzGOC/9dYuxHNMOJe097Fjt/mPb/3x1BlIFMwV1rmNrHhrbQ+HxpzKYqbRcOehNql1O+pzSkpqIFOwvSar1hIYvSlr5BobPY02M2pHX2ztrdHrqRhLDVXbJ9YNFLRICR/2oVMr13792yueW5WbvSMvP68rmnQ4o1GHw2EfurwAzFNXRkeHvKFpjJ+iuYP7Nu95PFok5X3TJsKUXDoAfdPTea/T8k9j7fLOHRIqt5EaBQPTolVPdu0ix17/3ZmJxd0FiZXLer3OxQNFG5POS3qtSW20L1xLJt97b3rdxk+tWv7R5cs/5tXx2D9TaSxxfZXbnXQpWS1hvCE7R4tcQRgRLJjOILJCGDKyq2bbyy+TXc9ZzZBWh0cBqCvkajXSOJ5iiov7N0BjJvf1iiNvHe38BYmRMPTMzQwQp93V+cvOYy8erGhrbe6b69eWSiuBOofCoLSUjXk8INJoy5LZJSA9RfahRxJpc9InVt7l0XvHDEaSaJ/P13P+bizGcaEq+9yeHxctTrKxKbHHJ2vAFYPfXQHl9+zCoqQDmDtqJ7oc6duTCx23OxL+0fN+KT1dNWJ3R+uP7tv0hIWsyopg1wmaXBkhGnL/c/vTKTGG69aQY8KEiHITuW32EBR4npAjiRx5/XcVEyMDu2fCK1fOBB0b1+VtHKmaxj5CsVG/cHbaefGFS/eq1n/s21/9xjTiOSuoGX13edlIYV+d3YXsDc5cIVfBvwNwYsdK1OlU+QSc+zYszUFpLK9LrzoJS6fkLGydo3gecb+DKZ49sKFvZ/OZU+/+EWLy30enA5a+dB8iLg3AHc3ZZ06d6ruTVbjhns534gRIUzJk8Z4pW1hqZEvNLc5oVgmcQjuGfLua8qslz12ZL+aLoXCjYyIt+sS7MZazBsvche3Z+Xnz0wtI5WwCK7swev7WmhVfasNlzYDc7hiZS0ZHLl9duN3Q6PePLmsQQrenq6vcFnt90672NU/04TDxyawv78iADn3Jp/TWvhUvbdlaAqozrIfICr326t6NYMA8kZAewXbL3L3Z985d9ff+6KxzZN2BjRuTVS0qeXGLxdj9wqITal9VX/vmTMGloApJmlWt1UyXlyVBO6izqFkJvVf4fDn6MtAM4njJChdvDdY3NeFeNUwzcnLmo3qtDo4AWZ5CQJsms3luGtaXT/ws/9ipwSPHfvn9nwB11EBblu7X2FSzf//+7ZsiR04Nvnssu2jRrfKfiBmsrCjyrE/G0SK6QOrJS1hah3p9O4J6pLUw5L8bu+kBbjEZ/HhKojlYPeFzlE+0ZmcV5hXNT7KlDUo/zd+9dev6x1Z9cWN+V9QRtUfnF5PJ6svn4Nv94fDosikhdPWqt7rb7Sagf2vVE98qJJxLoBNRki0A/an07sR/79zWvhXKppBvJWSw3XvzIKT4hKn3vX7w4MS9kcWCjtMdvT+YtN87ANSrvZUaVRzsqep119JDzz/f4rk6M23RsXSMZ1yW9+32otZN7XUWjVLJoxtCRuYopWlGhwUlOTLoYMUxrJM31WxuapqIOgn3WUFhxwUvYs+FolDA8cN6+0T+qVN3/nikE3Xv/k6M2ErIHXlbwdXZv2/T1k273n33r6eO5d8zaoA5KnMdy/sAPCtwHHr83OR0NKeppmTbLlw4kV9t88Tg0qdiqUQ4MZZKoE0U85HHUG/vwxAB0nJF3bdTPYLVqpOunxj/5MeKctF/tNu7Bm5c9DoGrt7uuH27w9/7g3HBNlbgCl0esmRAf+KWitV9TZsI6A+0B0Gq3Pm0ypGsydvZTvbWyC46lnFf25tXuOZJPZLc3x2smFicv9c9WVnQ0vvGRcfGA3lAvT9k1L+nD1qiBWfj3rM/OH77uEsHQxd5g86SrG+DDFN2VKMhlHSa5hR4TzrkpUpEbaR1P3cA9aOQkmpqA32NQUcchi5HVKbwVWqgj2fkorPszN+OHEH0/j76mt+DLOW+ErBYdkXIhQE7frapaXDw1Kn8uXKmA8OSVEwSICPLe0SrFevsiO3S5Hx90z5cxbQrUlhlC/h8/jE0bXBo+B5RFFhRasTfV452wQ7889d1T3KipGxASrB2aORGXW3SaY+CNX22N33x3OWFjo4O/8wPjlvNw72h9GVvdcbSv/VEJ+tjzURMGH49c4jq1FNYpD8qxbdA+P4Q0iNcmIFd5C05T96ysgagl1dfcyS7Z895eyuff3U6mZe3IW9D0u7Vxi/aHe50wdlLzoJXsWKmhGs101ba4p7PqqnJaXOrKBqPAawP0FMUCnCOpw0GlVzJaECIqzm8b7A5agfvnQR6udpKya1qDm+Yr+MYLgbL6/sGO8l4Dah/vxOog30LCmvNJmwaYBY+eOxvfyvXdzRwrMhJoFDSNqnBDENHwghsPZPJ5si+/ZGavKQ34fOJPIfPNcDkPaIv5YmJVy6cSHBKTVluDlKFvBvVaSnWmEBvLjZ1eyAajQLykeru3pUXtJcu3V7w+/29y8Zt6cmCoemCdPoyQK/L/syTsrNZu0CqIzXGQ0myp9S7Z0QIADpJi1H+AvUtW1qhsfbEzKXiYFn3+12ORcf0WEdv/OwLIxMbWnfmjVg0cebSdJXTkp48ey1UMMkoJayWChRDn7RE2/rAZbBo1QpRkolTVjRAFSYKZszqtDqFGn5c40QCHyGYqxVqss+MNSak7WpeiV+TdB+B4aK+rK0GzvwwDnRIf4IkHjQcEBOQzIGV2XQsG5ifHGa5MMejEyvxCOoSxdsqOSVs2mc+V9fXtK9mz0g84WM5wer3TIkNKc+4P5bokWLjt65f6OHlxe55cnFN4cRC/HTYL4oezGEn0WO1Jwnmzy97JWxyoyezcHvmjRlb6NwL4BNUVU8T0Gu/9GQcbDu6GVfaZJRUgTnOhqexSH+oN4KkA7ZObhvO3I3Tmv8krXe142DZ7LpZx+KAd9hKnQwVnHUUFuVttGsoU1w7Wd2NOebFswVeLwPolAE4cxOv0ttrm+fcRgpSAwGaESatMHSYL4pxFZlpI53XFNtr+/Jry8r1SgRzXk06tHKTnFGiupNTJLQr1fpLzrK+kl37MZ/FIYEdWfsu9GggDoCLn47m5JeVdwBzlP8cb6M9vNLDIaDzvEfwAHVlfGCiL2tPlzex5GtYsSfmY1HHy0RRtmz8/q0TMhujK3a3ZeVkd0XjWgldOVks4GEbhrq7sNZcPfT8smX3+ZB74fbC7bPnhlqGTr66UJ2ump4OVSGmdz1R5qCf00Suf8E5cCCjLfs0SwniDtLW9vYlhXP0t2s23clGe+0JmTe7Pbo4MJJ876IZHRSh5fikvXDjvAbSrLzgmkx3u1zOc5MdmIXyCrVQKqCLKo8jIEYtjJIFN5nTFPOnBRAiGTmKNQpENVLEyeXlxfZkWRkMnVVwChZQC4gAlEHOkgwAYxE1SFSXnAeB+lEMpzNnP9h2uBAb/7Mlm2sG72w8WNYxjJogwKJgE3gpACfPSZRfaeYQuPFkdVdDhyAdEH2+hKfR7xEBdqohEYuVxm5NnR4XU7dSZp2q3J47UZvs1nl8rAwaNmyDFDvtTXbNOxZGz58fl4S4xXX19mS3Ma0/96r3dnp6oN9ePYTmDMYNT3j3I63A/NEtrVhZf1oj+hLqX2oiBRRaXpBHxJ0k7+Kf80RUn6+zFxWNOM6dO6el4II7TsLsLSqOp+QGY/pcutsY1E+6eAaAWZVWQ6VKxVsNFreumGJjYsJH/byYss1U6rRk9QiGDMgphHUMY4pR6atApDGgH8+pzRRWVeWwdiVcPCp2BYPJy6Xgwbk7g4N/7IR/h7x45y8379jx8Xzcktp09M6GivL4cZZltQKUKfjjtOeE0MgLM1wgzAaUXAB6NLoWu1sbQN4uwQXQsdR4T4OMvtnjS9263ntcp+au370bo1Tls3anJeD3pBqksN8vGnrEKbNjJNm99vz56zGDQYhrb992W0Le4rjX6l1YrHZ2L7jt9uRnnvSHbc3tyNwzgAPyjS99+ulWIwHX4zNfyjoKshGmBZhZ5+SueTIAvFQ40TXRVT177lwlbYM5xqeNRhVnUhg49NfTF7XYGw9podOK9Buro5CAEhQsSIgGpTLWk9IZqw+WF3t7T9KMgUHcJqMXFUCHp6cQwwEuPkGbYPBylpCh1cTGS/E5DNnVav7iQdj6kXfefBs3BP3y7c7Bt0o+nv961p0jR7I/XlHWP6ZkJX9my7VUYhHUOSyns1haFwWJwlyllE2wDaJPOhHzSbZUT4wVeQ/SuJv3b41etlyyG1NTqYREMRqXWZKR5A5fCpp0g1nqAC1sBpjLJJuBF0wGQTcUNBZrVIbbZy/P2rvT1QNJVLZP5O5tzaRYA+gZxD/xIVhffg6Mj+ajkZrtmGBuap2Df3/C1IsK8+dGBroLpuMqKzjqmjiwgsAbo5WbBeiAukJ6E8PYKIzKKcYgZ0yqgEQqNJaXbus0jvyPQ8fC+/xxCAbQJEGD+5dTGReO2I1CDfx2GkMQDr8D1Tp5cpQUQMeBjJz+4sGyuTu/f+fN37759u/f/u2b77ybhUZc1plTwDx+Uini6RrWUWGeYxUIJkjb8bNShD9CFkHTpTK/zxdLeGQpyA/KMDG3wccnbo6uvGqZB79eO9YQliSVl/VJSO8lfAHq+JjHT5tD6ZnR0Ssxv2iuNCiRNTBaq1dfzFiff/Vyt92Z7rYfwvfoCe/elo0ICcQB+Sc+NFokGXvPqcEu6p18+Pcna/X8womRe90X3+vQucCl0KiUPCG7hbScyazSWScFsFoNnBrG3mISOlQd8kraw7ImVgondO7cwV0bzhws856d1CJcU5xKTswcB6jCqlnCUpVoq5Ln5RTCAynYABx5jSTxFHWxqiIfqP/+N79/hwD/+3f+9udTZ17c+PrB+DCLCEzTPK1s9HjGWMHfiJm5ctjG+hs5zgbqHKryWCyWisU8sZSsQUoIfskn9pwYXXncPbClPbveYppJ+bmAtvHE1FTqbo9M9IXZBO074SlNjZ8/fx9eQfQgUyAPahyzZDAxn7/ttbvTVSOzAyuepBjVH8OAGpB/5dMfXf70G/mTxN1mrBtsy37xHxbtPzZXON/VtVjdUqwy2kcKr4VIm1yJ6svKyQUskB+3ygUrbTapbTqkcQza77o0bVNz0gyri/Z1Ymus3u52zkyiTidDdTWrxFHQaiWtsPKkM4PUmocqJPDHrIUgrSSeQI7DUfqLwYP5TUdPnfr9m78C/f2dd949807Wx8+UVV3U6jh48jCRHVOyNqXNj5KtkTeDDoEdWB4hRoKtI2HnOZ2YadaxPHtXdn3tyjH37J7WpqYsu9E/lUrRPAQr/f4TN8cbGhI2jGFkJ3wnzo/e7PEgGgB1tI1NrvTA4ny0XH922uVKh9LugZeeNHR495IdsPKnPJL/W4p+zrb2vid9F5Y05+btyWuL713E+nFz7oa9Qwi3ClplpngO1qnWXjWZIdxriqsqDVoDmq4qndaCnmujX+duO7If+2ytubV29/EZnheAsZxUaYTQAFs3oN9O2SgBKrAc+I08Mjmk7Qo4eBqoE1v/uf7SwYPNkb/+4Q9vvvX24NFTfwLsHz9zsOoSTdkQQpAmAE/OJqFSF31cwoNGTYANB1ipMVzKijTtNyfCDeGEzJ8KgyghXR/9wWVL14HmLDR3cssNa/2SgdIJqORKRUgM+wN3p26KYMKv7ZElhA6P5AHvssVlnC/K78uuK9YvXIyHgqFqJ3iw/3AVWc62O1/5METyf2PtX2otBH/kyX/TyEjUmTwHtaFi9FSOFR26qFErDGqTmjdRBkUHw1RqTRxFCSpB0A6brJVk75BipBmXphbaRJs31+zCTNsevPS8meWBpyDnADINUgWxZjXDqZAMqDkzSnXkhxxeZGhUcTB24E9pgvcOljX/9fd/erNz8Fe/evMPf75z73dBfQfLUgFeDacAU/eIZpsYDksBv4zlG7BLgSGuT0nqNhqPksBKKM5lMsmHi5yWLet2T+RltW9t39eUVWsMrJWFbY0NYU/KQ2vRn42JnlRKNnpflgqDQgXBIkEQXFU38nKORJpyy8unnf39wX53NQSH/wH0j7/06VUfTsiXkrpVUH76h522kWQyuXhocaC4vC47sq+t6LVrWtBg8MYbvJzNQJFNRKvWFTJo5QYDsh5DyFUpNYzBuR/dH8EFSzU1Ndld5cGWN/yoy5CgU3DtyNcohYkzqBlVsarYa0TqTgFuhHQUWzoado6MHqk8U1z1/sGDL/7+T3948+1fvfXXdz7+N2A+xisFCQ4hAIVBUWlmA6wYi/nQYudjMbrDKhz3+P185WmbOSEJbEyi4dzRJPac/uHKyv65rKz2LT/egaXnZrd2/IRkYz0pm3/M5vcnfDwLvwHoe1I+j43HxqVhSFedl5eNNdfIsTLnxQEnRuz2qtX/eGfEhyd5+5/PisX5ka6BgWvdmrK2yL7OSHbugbM2qIBZDWatKU55zQJocZSJMUG012T06vQao5Yx97osbeAU4f6qPJDaWvMPlgcrh5UoyngWGTo8Q6b7qnYZi4PTQWMQq21I4/Aii1fkFOo3BcFcrmJ+HrzYX/a7U39684+/+u27p373u4OhDuCB6h7XO3CcByuMSsmDpQcfortUKo6F42OMIcCyEk81CmJAQmOmwWNDRJ+CWk13sg0XsEBLY+v2SFa9RVqbsqGBi/4w55ElbD0NZlsKGXxKSpgFsySYbNrLh/bgwpBfdB5tLis/N1tV7SwLfeqf2OwfXiP/Dx36uflo17UXBsqwfLDrcKSmte3sWdIyM6isjNXsijNxpiVkjBtbQnovU2kZilNx19RtnaM5sn3TDrIbBL5TW4WT4ZC7EVUg9GQR11GzIZvXGO9VB7uDmlAlo+KRgkk0pi+YuC1Ff5LmU5TxXH/56++88+a7775+0KFviVMUFtg5KoB+Pgv3LiIP5PwpqTHmkaTjCZpp8eoqj9s4stPKe1gw3lHL06Vi6c0LBkt+dtM+Inf6s837Illd2sBMLMH5zWNSSuJ9iOvw7ilZQkIKZ5MCHqu1paCo+ei+zs5dkeaKsupLIFC4Q9985sz6X501A5gwDNxwlJVnQYkA0qF5I3qVWqsyqExyE8UEi08yXqyxo8MW0lLYSzWrvK4Z0TKSTTRVwSvA6jnE6IJk7EZmaAAbh0PPTQHqZP+9/oqD/UFVsNIgN5DUniXBHSmagoGlKwC9ijKe7C87884f/vInEs5tlAq7rlRAyROxOZHzeMxw0aBFcJxPNh4Wx2y64RBT2REIIHfzmcdkfk+YE1DB+cTxMc3rWZ1v7fwZ1lJr9h0+2upkTidSrCEgQ7YnDEsy0D5ooZJvCKBgk0lI4yzRuiNHUdTURJpqi51xCFtY4s+UjNg/WfjDdHTFp+wjXXOLZeUV2WTPpCaSvaiRyxmDl8cCUWWx0QjWq8lUfMkaMpqwfGjmcbX5FG3pwlcjnLfvLIlk179epmd0mKhDwJdXq8neIp4Pjb5s9h70psqqpvUqdGoFSiAFF0W2YExQqKA4WDsZ0Ogu9Zf/7k+/+10wOGzmTFoVL7cKapsZrXKpkefNNn5KkiVSojjTwJrHr7pMky1EJtYvIL1jxYTQYGgUUMD5pJmqsmNHm7bl7dmyGaOcmux+xn89JkqiiGYtHwg3BqYS46LVYDOn/FJAJmHQa6k9MlizdcfOTTl1By+lLRad9rOrHpZqT9vS0v8D89WPBDTXJ4tGuq45Dla0bic3njb1DagQbVVkMY2pNFVWmkInjUaTXuW16i9pzGrqOENTJiMWwSP7d23eunNTDShzehWj0pExKofpTMZ+1Vhnmn+xcC53Yt5R5WXkpCOL7B6HVZCKLePc1cTJQ4voZLy4HKoYF80cnL/cpubNakFN+nksDqZ7Pg/IMKKZ8haYhod13oKTIZMWbkNIxQAoqRBFgO5LTFqigxDu3lmzCzvUzRPpm6N3e6Yap8LhE8jvBdEfkyQbVOoEtHREhBoQq+sGB7dv2fvaltYXy9zpBa/lyw/SOGgffvfZExpa9d1e7PQ92PSZ6+pyVCTr28nuxqZI87xCJVcJDI/mKyzUpG3RaC5qQnoNo3KpvKZ4XGGFlHd59FjT4cO4XL+kuTZqNKL/SrrueI9EjVcoMFjprp7Lz90wV3evKmSUE7A5UCgFzFpJVIewN9o5nDLTkGdUHXGGMR0XyCyOg7sgtYMaOSHRkfM0KD2iIIjo/grDLXA+JrrlqsHVYRNtMbYhfMKT4CgfMEeuN9Vhqc1BxYbVyqNZI0Pjt8CeO9HTkwh7psYCAFvqQT/meNjPhkGUJItYmjpUIFv2HtoCuUpHv9tieVSvrfrKyq8+a45++VdfON770Yfz4omRieTcRF37phJg2AQVKDho2HmLqoU5aUUYD1FQ7QoBb1WcMWl1lI2Tq6oqKo417cciWmt9BaaoaoZkcGQyg0k7pbQC1OKLI3P5eYUvjnQbVUqOLJXTpE0LBVCM2DlEEI4k8IQUb2LkHfHKq3jKeDmp9ZS8oAZGCOYKTFkSHCfotFq5KcxYK1usujjFtJzGtISfagQLVkqFUwFJRqgVPs8MpvSt26CAN9g8MXTh/hUsKYuenhQWXDxmfzjh6ZEazQbBbCv1sGH4LLkCEgZN2yE3lNOFpQdvGob+cD657kffftYc/Krv9A6dw2LOAz3U2a65jRvrcnFzT812VN1Iw1WUWRWMWysNZsaAKYy+Uu8yUZXySrlJq7aRPK04WFXRdhT0lawKpx4VOCTdtUolYOdMJJVDkqYpn4VG68Scs1yjJhRKnUEwKM0o2HDk4MbiPZwDRbJ4G8UMHzdQ5NMcD2lRg1kOCSobFQZtmkWGCKVIq1xuraRDla64VQeV6A6/lGJ9qZ4eEW0XmU/00QgAvsbjZRXNNTWDg80jl+9fvwI2NCnOU6I/FbOJyP7DUpzWdWg7bJJBx8LSVURIpWlzeyvKD4fdZfnmQ5xXza376bJnzNSXf/X5SXf3uYem/tWukZGy+cKKuZ3tNRBlctO03EqZdHoVRs4aRTAorzQFQ8UquF28mTjORPNWlUrff7B+EBegVkAYUkVlZOOIzDdsHZNPmozNy0e6uiYGnBqNHGFcEBiGUSJQw3cDVnypQYlcjoKHx/yNobBqbEaOZ7IprbzapkYux5LcL8AF2CleLVjVBHVUa16Gpm3wG2wiISZi/h5PQOIaYp5MVBdPV5bXZzc15XaNX1l70yemwoEwb46xNKK4FLb5DR1uFW1y8UKjdsiKZEFlyYoc7tyHSyG7+p1G45fXP/fQ0PPzfvDKt5+tqL6q4NUFS2gWUf1BAz5q79p4oLA2fydAz3FDLkKtCVZ6Qy0ulwYbX06N0RR0efkWK2U1M4QKwWnRXdVXR+ub+w469UZwoYiUPxJyeG41abYvlerl0yPuKiMWV692YNOF0VkFjs04dUUm/uMjMn3h8TF+vzoz4AOhCi1cNHfIipyNhe2zpTEOn8ezwdpc2kkrQ9YsPEjKwXwF1Kxo1WrDYNTA1sXUaWSYzX0jMzex7yqThc0NnvBxRPRUoMEWsLlO2pMOldWLMZ2WSXCSUmFpjhwmPduu+f5+vf6zDw199UvNeT/94SvPlKk/99W9PzVb7Ml7qx/euuGsnZub2DMXzUdXFZYup5h4MfbIK0NxVddccsRZPA1/Dtet5ii1WWGDazRYVRqiMVFbDsw1OjnAg+IPwRxIUmqWhiAJgsBAtQZOXBV3WSxurQ7GqxBYjhLgwjmBk6vJQBaeX4GvphVkGGtTBihrgLOZrGFbJTtsUzfaJF9K5IehJciW6ioNaoF8KZuADUvSVCLWEGN0Fp2OlSS0aXy++x3u2vn50zdvpXx+v0ci4UEkG082m8daGYriX+nWtMTxCEg8i7zf0lazK5JVW9dV3a0vhqE/0uNpbt39w1eeqai+4it7eyULdj+/uvzBzLhqPjc3P3/DHBaGWnN12FkQiq2ueFyr19hzsvtqoxaN1pyp4eCkzaBOCWoDPLrGWBUt1utVWGIGcqQ6Z1DpkTCNuhkVmsKoYq5CQ1DB6E4WdFsKWihOQMYOE5aDe8PDZTDQdS9VGkoBo1JgeUFpoyoNBqvaykpE7p2nEAQMpZiYpGmaIdpzYV1GKN4HhNlYDJ30sMe1cOiaO2yWSml8Ojbjcg/1XrmFSTvHB2y2YX8AVFmZ32bmbSH7RDZSNk3IhJuhxB6JwyAAa+7Zr8+OOJwWp+uRoa/Iz27Ohp7D6LNk6msO7b4ggvWZfCh6u/pGYS0U8+c2TNRm75xXYWpitQa9RquqW1PXBAWp+qgKc1HexiMzh7Wi+DIptQYtpdI4gyGVXEHsGiF9OBhvYTLUVzDucGDxDNltoXXMZEGBJdjSCG/N409AfMCyEwX3LtAo2fxm1Hg0hSQOfoJwa1DLCzSP/pkEaUleVNLuhfmk2yCgrreRwl2aGvOcAGeGTGJ0rhvrkm41HiKWPA9+/5XRK7diMeTrSjJhoUWJsCI9AZquhg78pvYJS9wcQMXuCchoWmXPaT1Tpa92ekOu0BceQrw6K/tY1qEfvHL+u8+OqT/30qHd4yyEYR2z6x9KQXbNzdfV1k7ktbVt6ELQ5CAFF4TqalCV2/SLXzTnzRPXDUAYcCTVmLRzNK8QdCqOhVQU3C2oTIjVXEvQ2GFDDsioKL4UsJKGG5JzGKgOZOq0yjBGIUAISM4VZgzYeZBpeBRyyg6bQmESOFptBe5WMx+mwmwj57dx4eMCe9zMm3ULXfM30h4lg2fEgzlLQNYgjvt6TstOL+thXdEb1W6zB/QqMOdoce2tK9fBlgiwyPRA5IvJsOCWEj0+pdwykR2Bmk3UEgiMeTwYytLw7xN1qDj1WrdlaGj1433FJoD+0x+9cmv1R56VswKqJGM6lxNawNBFXPLvE/NRd9ReN1E0Me9U0cjAMVHDrMWCJdTDvxhsdajQM0XhZGCsaJZxCMmsWUFrGfCZyA5xqaKUQqqFsYrKmmmqqzK7xTQcAD4Aj0ZHq5DJ6TjUbuRhMMlZpHGkTa80wzozgjUGCBYEyGYrVCJpAbkauHEUK5ZSZHvq9sL8grtUsOG5o8VSG88CXtpP+xCwsTOdXjA1sglPwMeWUr67V+6jYjd7bI1iytNDlh8apFTKI2NxG0XW9p/9uLDOGIB8QodBstGoK5Nls11lRqQF2m+ueiTYAEufWPfqj15Z++wI/X8UoA+zaQdM/VMP8/cRu8Uezc2d2LhxJKiiKcEMyENWqBB04S7ko31uTFNMpL+qI0AJaiETcHlGyftKSQAHugCbocgmgwEFmEJHaKzKzCsUvgBRXqvQMjB8FkwKjOJIS07Ah5kEwGwy0ZCbREoH1qwZY138CvMWQorK2G8prU0uLKRpVoXfD9kgPCcejmwlx1ChQ0Lc4hVYeHdepsArqR7SsfFYkdpjtTGFPVYpBZqFKCostVmbXv5xdr1OgEKNrtJspRQKjb5q1jFi10P+9LPLH4KOq3gB+u5lr6z96jMzc1uz88e7x6hQlbPMXvXwvpovI62byM3ZUzj/PqpqptgKofagN67S2EE+aqq3MAqWU9nUZsGKyKoG6Ga5gN6bohQdUHhVBQWtVw4g0oj4FKG4w8Z5LDzhTWAJuIji4MrpzBixEUQphYE2caVqBZIqpYAcjec4KyuYeSWUgM2shMW1RoEdlgSbDf5fFOEnaBEjMkocMwuJBraxB3y5C56wLMXBKZAdNx86sXi6YOWgT3ngvhMxchvATUzcyWElGkzObTv25NfpGYEVtAaRQ4nIaELVyZFuJxjf6z9wpUdfG0C/cP7WMwX63qtUGqA/4oks/6zjxsRcTmtu1N5fLNdpkcV5Q5UhjUoXrW0l8vomWpJj8GWV2xQo1rG4Aj9NE64znK+CI4MWxgBFL2Up4cTgKChJQdaKIT1lVqPpqiBfDKNX46vxSewvE9k5DhUYGnIGBRI8UvSpMz0eJYdXRPz5paA6SyBCYlk5ANqU6EH7Flm9mQtggN7DByQxYWsISKcD47apwBh8eAoBRaRBeTYHGsQTiRQasT00L4RtKU+pj7dZJgr3FE4k3bqOyrgr7DFX4q/Wai3O2SqHV/vlVR8gPbfVTVx7YWrtswQ6pF8nDUuWvv5hUJ8daSvKH3Hby/qrVEw6VDzd7fXiUibtuZFo84QbZGRJrQbEyN0NCptaCCiwymqWWCtjQoSmlECKomFprBUfkGYsIJc4BZjl5LmA+hzMisNgHOGY9GBQnQsc/IIBsZxS2kh/xsSiG47MDlUdWA68hxbMtI3DpgNvhooZNIzComGY5xPgvYhiQEx4fAGeixlowoWNYRhnlsGT+wWsNzXiLyFVnU80S9J1z3CY7gkIJ8RSj8o+39dW6wzRNrM1wIfNJq1GCy1DS1mxN2hCevMY9Lra+aJ1jbeuPzugr4JIX4EJ5KBye9XDMmXV10YmJqJl9hFI3IPhVNUdxKzTqHedTM+OVNRqaMRnOaitHjMHvVc1GZ5a5YSbCNZjKYe5WcbwYZ+wYTRiyfgMoZzk7oqltotCSR4DrpR8GV5lKVLmIZ7jEcj030jFxrOkIEOjLAYUJVpi8WD48IESdT5SOkkpJlil35cwgzxBn7DRjQ1SgwfmbmOxzgTwfT6iAB5gZQFzYziM12QBcKMxq5viYjbk6nAY9qL52UsmzFysrJnTer3pdEhrKS4GScS8/nGT+pNtdfaRxcm7t+5/2O70+A+gZ287cDZEQHdWIXt5QKWYHbGXV+TP5b74Ylf/PXiB6fjFULzYqHFM91tUOsRcjyFz4zkgNiDHBoggoKN2gwsGnHhjYbgwahMPh82h8MZBrv3gAPzMAQgUhwmZIFhxzOZAIJAIY8+ssbGxoeHEibGxsakxnBOZ09DYiB/hRAD9NI9MiuFwmeSNxG+SzAkCjQ58YyDBj5ltZgnjUxCswjxRRmmk8ZJnCiM4LqVMQdkADxJPC9OLaVQRhI9ldXnT9u7qqhZnUFWs0UM78jHoI0l38sZVXMf97GTvy7/UuuVQdRVu1OpGu/lhJ7YarKmJ/Lr8/Lm5kYrq/monmlSh4mrntD5uRP+UaBAoBVpAMaeG95QTNjOsViglubTCgFQuI0nBgjptsppxbDYbEMU7csj7SmDrB4gfOA0E1n84Jwj4V04snbHMYzA1dXwc5zTOhQsX1p6+cHr89Dg+iz8hEbbZzGYPL3koW4BP4IJGj9LvsYFmJfnRfZWw0IQnBqRKtOjIIM5lsXZYvVqDlzFYtC63w9mP/TUXhBHxjXgM+nyXxXn78s37dz/kdTou8wFB6kF2mp23btbpKK8asDxKX1Z/GVV67kTR/HyF3T7rcOLF6u4qSIJf817CvjrNwjozBsIhqJswMcc2Aq0upXXIus3gInUMA55h6P2EA2ZBIpQXWDo8/hMHn8E7HHbpgEzHQ1wEDwgMnth7AxBeghgYX5jp7R19cFaSM/ronB8dXTua+a935bKVy3BWzpw+PtYAtxDzswlk736xZ8w3LrPNsH4+LJh7fA0S5nCe3tstV4eG0uk4IHfptC69MaRPB0M6HeLc40vfp7st7gX/lSufXPH42/d0aoj9l+ztOwVvfPfBpsPq+cIDN/R65zmH5jFt4LPRibbC/Hm729GFnZeR2WR18t777033u4pNKnDaeEw9FV6T3IpiizHwKKUqOwjQx4G0HzkRT1BW0wRm0oqDQy9V4AdJ5OU4ysdHTdDG4Tji501w9A9QJ7BnLB8mPkXOdYL9LVg3zHstgXrl+fOvvIIfmfNDvL2yLPPRsh/+8Id4v+yH0LzGTyvHpxoaezwy0B8DEg9PIEqo2WSZqt8UT3uHOiZvL+D2BujSG3FcwZAJ34dHZ/2Xq1qMzJD/yt0H3n3FRz/39ZXf/hBa/Zq81yaXnf8cVjVIAJ8oXCwvvodVdO+j/GX97HzhHKy8a762q+vG/I3F985dqg5inkKZwXJVmTFA1+Eb1b1w6erkZMHYcEdlZUCQeIMB4BEY1aTqerjAiDdyyC8fQ64mh1UT0B9jDsgfhIJKxPaOB5jfv39/6joOAf3WLWCOk4H9/LJHiJMfeLcMP+Onh+9+RHSv8X4Z0B8dnzrREBDJ/U62VMoGp0LTcYOO1rouD8WvdsTRcIduhkvLGAzIbR4rqH7ZEteyPTfvLhn6ijUvretddv7K+o986M6qoh8XXBh9ZRlmCAjgybkbxf2HnJq4af3jSHZvpOxg7chI3fz8xOKhc9NOPUygOAjCIpbU097ui+cmC84WQI9pCFmvOY6wjcApSaCl47BKIjcDXIEwGY7jpwzaS2+PD2DPIE4BcgNvWsLca4sHKoH5kqUTzB+AjgPQgfpDyDNWfj5j5A9wXrZk8vhw6b/HBx/D8mH7P+odn2oM29CaNWtdw9BFwzqeS7tw8WQ6NB23IEvF/8njgg3fnU9pjBSX8H9yVYZB+qW8dS8se2X0wxjfV7x04IWG3rUrR7+74rnn1pclRxzvdVu8WvoLj71af3lFV92LXRP3ig4tVutxe423JVRV1p/sGii6tm7dOsC9MJRIgGvmT4R7Uin8kCGnlgB6xtgBOVBdMm78twT20nsVeU1NDvXgEMwfGbo3/nfqrv2nzTIKq8gAp8CAyXDqvKAoOi9RoC1JLzOKlLaDtGGkpINQKaEoNjGtISht1xQb2jSZLQlJRbZWmW6MHyygERILggQDrJglBIL8MCfZZDg2FgNLtvic9+sF1D8AD+3Xr7Oo6/Oe877nnOec47IAdQ53Av4PCCHPUI+Bvkig7xQCnrtyN4CZw5sz+XgLrScB+vMzOG6gzbWm3wqbrtEo+m0Y24k3vEI+1n5cPfJyTWKh1OuFcYfa57RU9SwvLm4c+h9m3O59uitl9Ynp6Z+wOSVkyyqbPO62evRzfDRewHpYH+w8NXug8eCNjiY3nFi3x+NZX+/J7OnKzEEPfPTHvjV684+bNzHr0OsdhFAeI1EKkbBCJugxUI79xPEH7DvVPSrcfSkT7p9EDnl1nDghiJsbscIGNzdv0krAKqANPonDH0DHlB4SVfrYBU+YezxxA+CTZlavmWy2fqSVmwxoXN407PGMNaOCOn+bw/b64fzDTxzOzc0jm5id01CWubr87uL1Q7vaZb834T9r5/d19azlZb8+ujH0enJavqLNUFmpQcozXrp8f25nx6mV1JwVfVMTZnFevXpjrSezvKsnM3Nt7cKFUDh8e3QUGkiYA3WGOQc7Z+F5IgYjAR3Z1qOCd1Gk2SmuWMgpOz1h50vAvcC0CAm9B/igZAgFeGVH/8IaQQ0TQewCgaOOBaFL9A1iIdwOT29k/LQYU3daATsMQHRBEOxJM6Ert66NeTydTQaNoQ3++TDWgIKfm7yNM+p35uc+kZedBpTT0lPfOXiLQP9Pl/3eXXOif/i1155N+A/7nlPek51w/8uB0eUX03IV6LMixld7Ba5KbC/ruLqSs9LdwZporvc09mQ2ovcgQL84PzM9ff367dsM9AjqpOyIdhtxmANcoijckJgy8xi6InZbTEJveBB2KwTeMPHMxsPI03lO7XK5HL2O3r7evkn8kNj7+mD34egjdKpTSRCdAfOVMWewBKKLgDiRTiOWwOhtWgCRTZ9dCHpI5Oan5elV2qU8BHs9oa6xyWzNJdsmtqRlzQw6cw8dyk67H3XKqUdTPb3hjcUMlnj9Z0Hrs6/tlj5Tj2ee+OClZ5IT/hWSeYe6qSS/+Ip/Ki27RCGuhF0dy8qNgQ5PDiMu0FGx+/RKZsoHKXswze9kSkrK0ND8/MwGUA9jl4WyB27eNMMb1xpVQJtibfQohvrGhNPpiAhJoSG8qJsmkSoBNaEtp4McF5tDRIcTW+zFhtSuCYuAdnug7x8fnwqFQtMhhGjmZyDw5mF+Rm9jIXoHfYnUITayBpxkA/64vpGx+O4ip+R0IflpeSYMVSfUUaGtr0clk1gmcym3een7Lt53O7Eu91B2Ms4+Bxpagv3+0ZmkaVj3f/byeea1npRn79kdsu8gJre8t+eZf7bLeDT1kZfvpX79r7wC0MUoRMIIzdVtvkry+tZEOyB/MBUJdwx1o+kvx/fs2TM0v5yxscFgD4f9dnzBOKwzu01ON0NUzp5MorDHt20wqhGVxRMPCPPfo3f4QwhbOLhQK3HO38MTwocU8iPHAgTw2Y6P/wZFcdXw8QKjo7THb0C531qEHmdshG//sQm6DIc/U/+bpPzR/X9xefr6asTAQ7rBjRPzNc212dtAz3wbTNrcvOwEUvSWFcOY37+aMolP7KgEfPwF9NA/eWe3aHryU1UnU46/ef4lzF7c+eepW/dTE5VDr2TnCcVisEivvde3DfSEkc6O7rN7qyuOlp84fh66geFex/EvGhrKWEbkMxywgNJEbXfpS4dvDatLMdBapVRKOzqBCxw5wVfOXeLC3TNAGa5YB7jQPXBlk15YboaCdrhj2VZcgXURfYZWGfqRRfZ2AV3ZCwOXrHvioPfmaHh6OYnhu5ixcf2PTV9iBPxEKP4yHICM5enQKqfqUPSO7k5MdjCIxc04vMdBf/Pd6778vLR7YfpSUzuaxvpujdx5Im3HiLYnX2gp7zpxsueF3UKNT3i+ofHiHoywfC+FaXs8Y8i1gU4D6LnwVfHIOq/N3wb6YcxKrH6j+gjGKr/35ltsuNfbb55PGpoZtRt1lB2vtZgD4xRt9dsdajRhkwiLBDtBreGenN6yRwFdmbJS9Iawpb4ERH+m3LkKlQ9CKqAoRphXokSKFc67SK7mIZeirNVheoeEjH+tHFkxFQ997GqkamTzVHARwXh2gp0HjlRMBNjeccLzednmzg53i8vQfWDP9N7nDfjHb0EAOil6B0mToVKYtq0paM7xdzEgJD87ASSy1BUNZtCOjNx9InnbVv5kalkVw7xr18xmQ3fQ8p5MTDMEYHvisxcBevre55Np1uArh/LFpSZN6dieedU20O8//NDX1ccwCxegs5GdUPKZqd5aiUhutAemZuaxt6M9mxYVKESBowcTss4QXIBp5ByH94xiQe/IgwfkOLbjhgcVhlC/CsIfvSiRXC1AZk6qLiiUWpRFBUI1suxSubagsNaOSghHUY3EIbUUgTanLRJZpDWqgLZGpDWDBSeq80vwQbXEJ0pUgx0lkiAvtF39sbffhPnH2T7j+s1BDnqnSu1iBzmYNfxAYOO37+k5H7z57sZmYt799+elp3ZqTGPXllaWYg0qEvY9mYo2/13UU72ra/dUs+/b+05jJnh9FJeIW/l7k9EFL/25BMSYHn1CLNagbdeFPRf6Y6DDJ02vRleCN44cbSk/8cGe80OrfbYSYbN2MjR//vybgN8OZlPUFyvC1ysCNuAuEoNRVBQREZDEG+aB022BiEAvwC3eosEQQY3ELFDHKw8kedzwkKGXoz+4Eh2JUL3Er1Uh6ov2JaBKq8GTccgl0H+HCLwdO7WXKvLixS4RmANaNKoIqYvs2jqzxG4pRCYPLNpELw3bjp3qSMMBPu3sGcvXb/p0yONjF2/S6wn0iDTBZYuDfuL4W+g6lpudduhAjqHeNLY08dj+J7gBXwmPP4UpWDR9pOdkY1fZwd1i3an2uKH8ndQeWGhoK3Df8xp65SQ8/vxDv5x94EvMiL//0cP8Us+Covb8ntX+3IT4nn+ORs0dwyiOnp6FMWtpietKVsqe4+8NhSZdShFHbWUlR0WgQklr0LlTh55fRIyigx216AYvAgWKeABg4EuAU761QALdZoVKUhEsOwwFLiDToHwNnwfrTl6sVhcX11rwq6paJV/ikgvBrbXwCmvNQN2OBpWFSqnEUlRrKawLoIfJqE6k9YoEWrMOUXUVGgx6UYjqF+iK7IkCY40ZDJpBL5rLfGhHKwPKvjOhbd+MVL3ZJ4W54SswTLojhnpc1bNzyj94863bm4lw1nNuaBB/Dqann5l96tF9+55+8tVzDUfLqLU2DnFdFdVP7RbrTsG3r6vKM4E6LDyOYzRaOeX1fU8/duDsLz9/8+Vzyckvmviakcua1eNZVwxxl23fgxgyiGb7Dak5SwaxbTILE9hT1iYHmsWlQgxBBOKqQkexEt0E1YU68Jh4haoiPOp4gBB5VhrvIcIN1gSCc6zdEBdqxxXrgarS8SICu5qqnsChRoM5VLGivonP0yr5SuCqhs8utTsKVZPoAlRrUUodyOYplRaH0q5Wjct1Fp7F/KHF8iH1kZNOaUVqnzZchKYkIn+NMYSmImEf6M5es9OCnjIhn3M00WkfdCLVBv4zWDVs04c7p7XD41RjNKSmLY57nEORfaAKR7nbm5t1msMHZzVud3Al/fTZigfOfrv3ryNsogc2dDLuVdW7aqjHvr1ljeWppOsUdKZQFAapL6wcwADUU/tnn3/0FfT+XJjsH5q8dqUeoEfPf5+Qon/y4EpnZaV7DRP3L831o7ucTWaVK/GjrlXZC7QF0tpCFQodUNsEmhtPpCN9loIVLaISVOAMEw6tFhHMhbgXIa1GIVoa6CGQg0ZHpGdwqPFhkbJApeRBw5U8KbZytaOoWCtFSZNSCdakQGsXqOTUb8aCVqMWu98osSNB6rSbi7yjRpF2SldkDvnQMgwTPvxmgSXRkmgWGaeMkrBqNKAWzQ/W+L0fThtrQoPeKYFuWhdCazFnooBxd/H/WKvtNdnESLG1RmDXx8Iz2empKxff2ti86RTqD16t1+/feujUmb0/fPPFuQqoOISNEzt5oupo9SP77tk9kozze2NVC6Yqv0nnMXgwONRhWlP6Q93t7WcmlpbcYs3CtWtZpbZJA+xa9Jc++fhTdBTrAB3+8sWTC556jczlsFnFCkWtsrfPMamUo7CJp+b1Sgu0KqGKRwx1RyGmHhsBPyoUwJ8ipQfGtJMj1woVx6UYt1SQLAH0YMahQlgF4w47XiDXyrFv16q0oFNbankqLQqTpWpdoVcnsdQVgbRsAeMN3PU69BKTonbVLND6UaeYaLaj77i5RoJuUdNq6ahFpzX7p3WCQLjGOyPRmWu880ZfQDcY9ummMKnNa/SH6+p8orAvMOg0esH4KeXTj9xmsikY7My+xytWV76evfb2xuCmka9fQQ33/jNnutEy76tjb1RAy7veof288cTJRgzk2zUOW8S+lze+U5XacuI4cQqIWQBtP/5eT/r+U+2ff97eaa1UTA4s3BKYehV57Bcgaajmf/Ch9rbW1q2eni19vWfAOoxgrfXy5d4QmlLAAPOmJLw+Hs9SLHJIBHaewILOETpEY4jRDhYrVJooVIWELoCmB8wAj+FdLGXFx1BqpRKQFynRu6AWthzpeDUUWqp0aFGsilp0i5qOYzqVX23GArAjj+cN+AYBrz3RiY7tCPuGjTWJfmeNeRStwex16EMU8In8Ux/ap0WWsA4WwD9VZ5wSeKcxS73OOK3zgTRZZ/ej3yR+2e/06qYcShVy6qXYsZQuG4LR4nq47PrD2WiteC+B/vyDs/1DG5ubPmErxSfb20+d/e5TGMFjx2gKI0CnyYblVQ3Vu2yY9r69VZjMVdaSmXIcBznIffchzPLBifIDwVNn2uvbWts0pmtZYwLUpeZReCktLRlO6YNn21vbPl+6s35Vj074bvT+nLswN+CudIEtyuszuVCI4qqVaguUfUSMFTmKJNpCAKgD4gWoYiYrL5GgpwxN2yUrL2I9xNhBvgB5diFK4XAH9jNOADAHtPfjRkAfkhQLROyVnK466vpWV6dD5SHbkpG+RRYXZzafZRA157QKpkYTA9eR9TF7w+jfP4WNPNEe0AVGdWY0GfP7vKhV8wd80wGRedQ4PZo4OGgPmAM+bAdGi0pbq+qda3aV8IUCPvoaysRiQ4fHbc1NS3uRwhrJz6U/ZAhtbPoG5ZUYfNG5/+fv9wLzj7+CZ1NNo9locGAjTd6s3j0OWzQ+09hVVdWSeZJiqXi8dxLj0MsqGh4KBoNINbQZDGMXTAKXqSQPEeZDuYfS7k3zdLaCKrk20t7Zru+sv7qVMjKsb7O6L/d6miYdl2VqvkM5DndK2ltskdbWwrhL5YipGAt10HQy6rDsxYCSVwBhExkj3h1rQUCoo5swuXFQfBSuIfAurVXVakmzGWvSYYcwxpTZjLQ6UEJKx4gmjyA/IJEHQSWTCP2EUMUCLiaF2hONRmzqYaNx1BlYTvSP1vhDRWgWjWPeKGZ81IEmd9tnzhDZl9FuBlZ+xrvsg73XwU9vtvVPmmyySgSjm/vr+RrPcLMwN+9QCES45NyVCY35+ia6Bmv0QRBKMA7sU9J0oI4B/whdldOoOwSxHttdGXY6v2NIE02a6SEBBSI1NfXcuc+qv9zf7da79UgsNl9QCRw2Xl5y2hP5jtzke5MPN7W16bfa69vbtyYm1g8GW1vdS3N3hges1oUBcXOladKB0Jilr0irKlCh4FRdaK+FrsslWjjaOKoTuBwdjkugAlqWXZEixKbkaHBInEwiaxJG3uTCBaRNIEOQpKHzSfihx9sRthMLB9KD3UZvwH7DfFDKtoSmpkCrwroAuZkKG4wCCUpgqATCGwhJ7GGj2Q5bEHZOB4yJ8NvC5il7HciSMAzXcQ4sUY65FAYbeJ8KHOZk/TKMkG0WCvPzD194OCEtdyKoGbw96LS7+geWZq+eOvvJsfe5H6COznmpXY3vNGDo2W5y2CLu11Hs6pCqlq4ujFBvaWnADL1z56r3PtTdpO/XW8EhmFQKXEpe/qFX8p9AzBHMSFlra7C+Y+LuxEQnJlJOYIr6lrXSZr3UKzP19romFTKlxFKgptCZXWS08xCZrYNFF0CIAiUniiMEvZWV1OhzW/pFKOTybZAd9Am8F9Gvss8RHR6/5nRKdSQqldFI3LlBi5cjUU0xkuwM+HLEjb2PybvckkgaWgYTFivAqPsQZwuVzqsN6bThwhAvIA37kADGQS5xyOccFBjrfF7ttB298S4Pu+sxMN6KBLPMpuGrEAxGOqI5C2kJt0foG/U5e8cGri1d7Tj97Tk2frGCTVtlM6qxoWP8VcNuOrtz9QzVGMkGgVPJjYqsOMLki++DTYYmW7/VqnHJCx0lPKGjOT+f+SvZh5taQX1fuRocudvZ3r7UPtE64B6+c3lAdsk0jEE8sr5mByqVef4iibIIFacoWNEZtWA/j0MCfUR9jmbWWTIlTqDgaFIcEVKpYkRIMui9fX2TSJgimL9Kyj89ExWAG4KEISh7IFo18MTO7sTDSf0CQalhdBrsBgGshunl+SSsg6TzjAodCpvtWimo8CilMPsEfqph3MS/wBsOTGkDOqdcVdI3ToP35+oNhiaTrBTzwcUSCZaguKC0fyqfr3GJEv/w6a5BPJ3dZ3+gnRywRwHHCb6qAlv6X7slwxbf1M+xgeRsrBQuZRUA/Q3IJ9/+AtMOyiMIj0KBC7rmAOYc6zMPsx1yrnbfOBjs7Axu3Z1YW5q7PCcb/shtUsjmLskuyfi9YpNM0WwyOfrGVy8gq01cc1AOUQFRShpPHd5ZrpXS5fKYsu+UEnaVkzDTzwwELQSiyXmp3AVJEVCg2SLgyM+Q+6JkmCREU1nOLzw6SvYd/QBZ10iRDhD7p6bnfyL4aR/IWA6PBuyDRlChcZDzDk7V4YhnH+/rNTXDh3BdGev3eDA4v9+gwBx/hIQJ9VJBr0ssMKHYNdGCMX2m+o7T32MSH5QczxY6xLGhTfDRj1Q/tbu2dGbfqwh0zAAm2MtaADphfuwzbOqGARt2WZmCX6gt5bukxWiwE61XxmzpnAPdE1dXtrbaR9oHltoGZHMDc5WYUWettKK5yNzCwsWUPZD5rNW+XpeqWV4nqkOm1chIzMizqlARQcpOUhCRIk74RVFWhZBDn7FhGe09ovtEgo5WOEG44pYYD5qhn7R4H/CPM145MiRxI/xmAOysoxS6OQDlz6CVskj4L0+bfYloT6NG5B6hPvTSQZdRm8Yw4LnSr9cj3aIpkQq57YdfWjqJxpg652aiGZgbFjr2f//dEQAOwfR0YA794SaeVe+mcBwn9+9tgarDmUT+pAo7+9EI6Md+ONvdfgdtAVVyRUGNmi/sBSjRAE2epmkkp7u7YwXTa9ovukc6l/Rrw8PuVrdneOTS2p2LF8Gj6blzaWTJY22SyWxYA5N9ZjOUiEhTxJIT4QHAmcRYkTHhIOdEQgJdB+o7MLczzAE6Q50jQjPMo/R3YBnjxS7GGDFvUTCCPZNIv71GqYhaCdv94emZjAzUxmRkTAe82jr0Fbc5HC6byWUyoeFV09jcAP4uCjproD+OWCjm8+UmvlyHJOytK2iNlNW0/5vfK1i3a2BOAbmyI+9/egwjds/twtGbcNoAOkbbffZ+NU0Dpj2dgf7At+3tPcNKLPkSNHoRAPqCwmjSJTnXc6O+Y/bA1tWrwaX24ARG+ugnlu4ezGxEOKJnbR3fkF7vGV66fOnSwsLq+KTD5PKBGmlkRGhnBPXiKOpxuMnsx0XIizGnttc6MMseL3HhuO9xzAny5XjVAyEfK3eJM95xsIMDkITneWzuU34L1T0aofs4CM6EcEToM8mF6GptNc3Z5jw2g8EwMGzzaMRkfYrFQlkz6BxKWanK6TPfuma4lRTS//zr74C4gXSdjkcVwPzT94/A+X1h11l3LulSfuQzzrWkg0gF29aP7f32zJmDl5vVyIojM1Yg5wORaEFbQp6+o3NlC50EZ5fuBke6J7YOllfhPJh64MDs7OzI+tranSzwYscDAMcOYURoQp2mqAB0KgyOgw7Ud0ic9R491ZGeq4yRmqZ/gH6bJFbjwsG+kYFHvNiFJMZ9j9p7oM7o7iSgvhPfPeS3JyLYI1dZ7GDaTY1PmqwKGCosX71HrzE0aRQoziXchQplSYGQrygxSgf9twwdWW9NuX/+9a+KspYGYE4Ws+Kz95GVAuhlLbvNYSN5/EEYoyPVcC4Z6kcbGgB6dfUbX3z5S/vBteYSNfEVJKVicSEc67xoa4L6ka3Z7iAmcZ4KpueUM7xXVtIPHOwiX3/t0pUrXF0pKLEcKZaB7ourOo9Aj8P+b6r7jkoHJceDZaKF7Khb9qNyNarrkCjscSO/GIedJLbLA/iYwO7TIiDG+5TdWIJBnmqTo3fyMhw2hQzbFhHfDVaaElophJHnKdEAgY/2JEbzeL3hRta742d++/EYmokzjw16Xv0Zi9JUl1XtQutOSfWKqrKjpNsQoM4pevWxT775uXv9TpMViSZJAXkp/IJSQTTbkOZZp3KHU8GVLpxSU/euzM6uZ/ZALmZlXQit4lgFPmycBw3QGeqk6ECdO6lvZ8J+FHmlPTPipIvxQ3/8ER9SjMg3vYojIhSyi5Az/nKnDsLVOqCy5mYAtQ5hqniJFTRCogY+jnO8zinOe2efSZoP3xrrR2mL1TTc2zvX60Zva4O+3toP0DUKcYkQsQa1Df66Vaoet5UG19fu6zvz23c4FZGUsdPb+xSNpR3zkd3msHFcr3PkXB6hfRyDNwhzusfx/XT3Vo/ebZWAt4DvWMEX1JQKI6qe5u6cWDndvXLwnZacL9FDMgesoJSUkx/smQcjdhmE2Osx9nscdh/ECHokRM78sUoACTBJcP1vIYgrSdra2lo5idy1kSgqNRrGy2fVD3QVRAQtZktAl9ep1PDSb41OhWbmM4YQq4mUNcWsPR4k7JVD/T4c8kNXJq8NYDA8iltsbtcAhragJlOGIifS8xIedhuHSciv5VkcpfUr62tJjjO/fYHsGgDH4433OTn2RnXDO7twS2e9QMsqjjbQ6e0IVugRMu5M7X/4+dTKiWG9FSPoVQJepZW+0FKoOue0BYPdD6VWPZJ+GoiD+vfBe8chlLChinAiQhPsEOAOlb+JozuKEAA209EoyuJK4FffpHfj0Lc0MjKyFZF1kgXI2hpd7y6sr28xGRlZin8QL3EZiQs+MhH0uBFD/hxLo7JSHBMN5iwafV50kLu+DD+NwR6FO4o5nuS8rV6ZG4BJ76w3aNCHg3ovyGS1JUJgjiFUOiMW76RDo5RrZaXBA+uZQ6Zffv0Edh2ow1XDVolgLD2qj77zzK5z2LiJa6nkp8GkIxBXgQfCxez4/v2pqydG2t0ydF4RCq1KvgDK9EQ2t1DyO4I5Dee+Pf1tTmbjB8jUIB0PeQuySAJiOfQdyN+GW4QAHE8YVVyorMzqGZgbuXwJkBKo65e2LhNSAxPENoY01aOhdKuhjeFViQt7jUgbE3rdKa2fIxXcfuZMZzA4sR+wswVx9+7dg3dJ2HIZ9uibZBqhgKPGlOKvBU9tJoO0n6tpjQo0nYE+MRHsDHbqgXurdXjABeskp8qq5tI+o1GldY33atBXp2M2/UbmvPWXH/8CdQLeGtxzoI0pN8dIjRp26wj1hH3PnztKYFMElqk6A/2L70/vL7/7udsqL8GoPasQmq5p7oV9Z3zY2dRzX57+9sGWEx9EEOfUhcki6XoYTrBTBC+Mg5ohDaAXLl3awvcPPbTKWmGdCVD+DkHADhJ7G7stiMqOP+Fvk/gbTq+xKxtQgdgEcqN7GCGFG1EjcmNkCW53mxj/MQrRGb2ociEqbEQWOdAxhw72jBZiU6vG4JnrU4koVFSiMGR5sU+pXZM2haI1mH7gRlao6ec/q8tYGBsqQ5gDcMi553ft4NW/qTv3oKjqKI4nmcszMSARcmrK0pxe0wTswy5LadfFhcjdtmYdhNyAkNhQYh1FHsvymmQYF0lJFBASIlErEOIxiU8eqSjiKI1YqWlh4KPGSQ3re353HyxZ018l372wu7hstJ97zu+cc3+/85vw4GOugM2oU/AO7w7o11u29Jb45dYb9bwBY7CcqHeY4N9Zt4ISt5aWLzehu+BisnAcgpek8ucvewi3lKJ93ljQcOwYXC58ZaEx1e5q7aABjtELdFSAo0b/yPFV9jumKMtTqUXCA9DFX4/TICkpPSk1Jnfzh0IV4ez5umpddBgCAWoqV/rbnkO0ws0CHYNERQVNj6CFmkk44evCOD4kXBkZ432odJdah7X4Rk3uT75Xr3qfz+3++DW6dgGfScwXMRuq3frYXTmg243d7TpqC6DOLP4N6D2E734l9T8ZjXp9WBAH5pF8Dz97MoM+y7Nl94a0opcizIsZcibkO0cz0EU/ENIYTYWG1laD0RgO0quJKxEW0AlgrLZL4EcRHUvW/huO0B1l/RfrSx1+bj8J8AOJIEs2EK5EiI4IPR8XBmTUujAEFZo9Ry+Re4d3ZzPeYzBLKgEXXQqisWZWrAyP6Xe6tkurM3FKY+rmC75HrnoX1LTkIT2nuJ3cOjMgd9cnp9yFKfqYTXVda/HHQszUF7286cvuzb4lR3zWGZWqMAUnj1RE7u3hgqcK0Fu+TJub9slLb2MtmxNNsAPw/ZmxwfQx0xKF0HDNapJcYqHhSNFRVoO33Y/ia3+NAy0SwnXHQWDsr0O251FMDmcRZH0F/lIMQFoDJgKIaUWUglebChDGYTIkMUeQQdR59AwVh4QnfXB13pniUq1eLk8t24J6VFu/sabp+gKUZKjC8QalboT8sbt/t134+K1fbnoJZURhbEem3r35iN/0+lYLdEVkpHeHAp1RGfS8DXM3bvwElp6YmJw4qWe/TiX0FggcAyzQCtz6ibNn7GU2imPl+CN7DPcP0owR/Zr13ewa7SispwD7Qy1/E04sGV2uD+NZBKOEWyfaJCKv53kEc8qkD35e/Mq14thQ7ChX5oGeS1fbyi66xq2MWADm5CoZ8il3P3KLj9/95XWiHkfW/l5eS80WP7/600uNKo6jsGidi0kRxKA7exZtBPM3Xisp7xv61cArJDK7QY+1bUczt+CWrxZ42qLvO6kMNxILzf9OZbllpBi78AvC9yQIWUAkZDkTGHnHtXRM8ASEPkASaIsJFMjPlECemoT3iUnCOybpdyhDAD3mQOL8XzJKQyQaTdkR9ws/XWk9ddHt1TcjVsa9BuILXnP3fHLK+NlG/d4ps7ZiD2S4J8rbrrtuzvX1O+JTaFRh7EMQNNSn5wCdyrC1RazK6H6hPkEDF84s3BEtbhbeHEcfpd2RCqRHozxVM1q9NWNUUVMhqLeit7dii0UVjtrMVLN5tHJJ5KCZ2EkQGSmAt83Js9g9cz74ZncE9ALkHUq9PikJyPGl1Jv0YrExKWap93ynPdfuE6/W5F6Yhk4cZad6a19DwkaXW+JqPR+7y8fysZr4kEfTF9hOHmHoy9fdu3Prp90WoDfA0M1XwhXBQledbSgzXnfdUkZpj3VW452FxYcoZ7DBlngTbcZa4EvqtqmlpaXbehurT6EWD7taPrWoewsJr9gi3HDQF9SLr1EnBPCDPywXJzAZfQBt7MqoOw71URZZfyxH10D0IIEIuqxAGRPTtnj+L4NVoatX53r61re1ltV0+7365kpU47a5e84aZ8iZtU+e1bT140WvIXP/oSlm6RF/QFdKjGcjI/vNDQoJC+QmzNr2XpHbFqRgkn+KqJmdrxaHo8eckuI6ELcBt7A+Z1VTU9M53Cz3HucEsj5086GvsfrU8eZB9OlwFJ4z/HASNvjgDvDwNUnoZCyHF4IcfL0DcfadM+KqOrDzJhV2eDUlxazrm3fw2iGdeHWMp2d9W9mpGg+/BW8iRa8dl8hJzg95bHV1RyT/g1tMzGbfP2oSwuUNZxVJLuU7IoOCJ7PFzNfdWnLTV1s9+Oi7KIe7AAlQa1anG5XpGouNWyzchq/bp9uiXkE1FrEBWxAN7mMUIyjXLnLu+DX7SLCFbhZV1Fcwfbh5M0JyIR5XyhExyqzWHWQlzZDjGP1EgVo7r+ex9kKqrg5PX9q/+N3By5UhmhjfCwfqAf0Cqq9x29yaZo2P8O1OmkjY865fn16fFPOTb41SLD9/XrHD3J/EBc6ePIFqM67duRq5bU7jnSycefZAtIDCmA/y4WwkVyrBPaGMfTGMY4NvuQYRHpyCZIwCbEUce25Gj8dKjoNF7pZwP9ISIwIx9EECKi3IuUlGpeCm2OzM4BCsmVgjpZHcUVEWu8cmAvnVO7hotJNfUmdKL2twcfrl2s1QTcy0IwdyT53qdY97Nc7NY9bkcYucXTCf9elWVzfPCx+k5/rWKzl5f4dib3JDjCRg9tSJEzCHoqJMs1rCDOFOwMViFtlhN1UJx1nCPIEGMnfrnWO6BtB0x7Jw3NlkS99R4aN7KRY1s3bB9iqdQy4GsRIcyZ5AUlbPJBRnIV6O6hrLMaTBaHKQUYnZssXYWMimsb4e/Q3y9epoLFvPrFamJ/Q4Hdw1qJOkXvnpw7JTFz38Xq1tmvXQ+AnZ/6ZY89CHFT4eF3xy0w+cxhx/7wbFMW+s41PPnjF15gxleqoGn6mdsmNGxkXjXhaAndi4cJmM2sBE4SlVV5gNkx3CuOXI/OHyWQ6cCy3F8v8PcRQK+pAJNXqrEhLwIqWqFLOe+0koorIGJx1QXR3m5+TTJNliTLssRV9S9CaF1OpYNV3Bx8yNJWE85jwG06QdTqZArzE0SVEHWXsRx3YdxfyLwRVSwW/ZSFtdPZwAjF2NRTRrpFi5pUlvmHTwt2uZmsirMPQaH39fj1kP3c0l13+piVMfWYpJ7QfK0o8pJUkj66RnO5RyNVpHzpbBcWokQYx21KiU1xrFy7Qs/zEYkO/ImJ1jSDQKV8TLIIy+Fb2fHjlw7OqVaf7+27Zti4vzg1Yy4YG/v//06b6+np5/QD6QMNCfwnGqjOua3zgyUl5CS3LoCr6ZlJycKAhrs2yiS734wqPt27c7iR5oRB8kmirffrRLmCEfipkCAfSHU4/alKO0POLyCjwNYg6MQaddnSzgqXNSbCnOJ+zpXoedZXu++a20OFzTtrSs5o8/6j94eur4DOD+Gsc/jFbvrano9hvet0Ny3iTX82SucgzQWGyGThP0AaGpiM3U2Uo0cTWHz5HDvHCNkcNzynZNptReCtUHoN27v/xy5w95tb5tJZ5NLV980TJG57rPdUPfWXVx9Peys/OdJo14ug5D+/btG9i3e/du3LsKcnNzc3evtYkWaG3D9/v9p11pdzqJdnfJiwXNm4dLg6KqkExtAJFFE7Io7SGaZLOHWOMcoNM2CicDSK+JFUtpTM+oxPpGeJLYIIVey8vz0WSoOFTTmrq0rRUlnBnjNoK71/lB54mQpX/ohMkzHzGmtiqNkqQePrBDoefY8MhR83NOTLuVRQVgwz0rcAyN2FAtrC6UPHxHgURsDBdqsfJ1handA/tIzc0nTuxcv3BhdtqmlQeyVuYdTyNlZ2evJ+3ceaLzRHNzM1747bdfk76iG+nr77+6deu7sv7tokk95X7DJ5rXNjd3dtLb0RcOps6dJ3Yybdi582MSHuKB66cfGH6cdHXa/SvvLyGVoz+EGQt1sZBVC7BS4izVYWrVN6JreIbl9dhfBgtnqU0SFCLGaVCMyws392A2iA479/JoD33o5ppitSYhoa0wAcnc7JlTJzI5O0+e/OB48vRT+rydMCv8mRdeeGoq6DvT8J2QYFIq+EsKhYHnKICWg7rSIEEnCNBmH4yt/BoaGiDDRkl4Ena2QI4ZoxIJq2gXNqT3MuDNa9eeWL6cMf/EPb7N6+287LmkOXPmLGR6//3la9euWvXOO4z5Z9Dn0NefAz1OgO9rbixefDJ/e7/ZfxhvNUrLBb2//n28OZQtvC89nDs3+4fd3bnnG/quuH+MreNIeZA7Gh/Oq4zN0AqjEqjnPPANrqteW4EARKcFdep1hRkXdGQG8/wh0StOmPiXkYOWg1HBnGLw8pJM7eqE1h16PZpvmHY8PePh557t8Z7U6OR05m5bvfZPmvhCf357I7pRoEdY+3MzZs+eLY9EuMsrIqulISox+AE6urlFY7YkkNMG5lYhXFOrwPySijE3yMQmfWAgC7sLGHNGiaC//xagfFJUG9/fHw/oy+Yum7NsDunFF19/6y0r9Xc++uijz6wCeDC/dbEtOdHlQOGNvvPm6cM4e9bSzSIQh9566/XXX5wzWi/OeXHh+oHu3KH+G1nux9MWpuFcINeStmFTbQSoa0GdlV8R8lexKZQ3kRnIOjJpNa0MnTJoeA/KORrGa0VoN3j0JqjvWkLbPZUCukG+IylUV1ecuXdH4el+rPHAwIEZmM+NJ0u/Z8rQWR7/E4cbEfs0nsQKNp4anivlnEEaKyY7h6ErosPAnHbUklmZM6+vRsyu6lHhsbjdIA/Tgj5LpbQN6TWwcgYGB2Oe9t7HcVleV+MXbQCEZSQLdRv0jwj6aIF5g0uy2X/6uZobLmddQN1u52TpduijqC+kd83uHOitKfdqy4rDpUH4AIs2FG2LMM/L0FbRVs1RZOrSyoM0afYyVteKu6qws5BYRtkhFW662qPDMkWYPQfqlcWlS2gzv8H7dAVGE/pEVmKvl7ZpCCzNmEWE+TfXZo6r8f3ex7yOSQKDFNqcS4fR33c/p+CNJiMut/CBahq04dt5LS8u0AWBeTBGOoacJNOpA2Wq9ugAWPd+rYTXqSz5seEYMV+1llm64IPXZxfl1U6bFn86a1ERoDPiyxhzQMeZQczHQv/8q+98+hKT/YeHfz/Xe7vvUtb04bH+/U6Wnv3iwhcXnjjX+1NW+RWvt2vTFs5l0Ok/OjctLy4reTGoR7O4DXyjKp1oMcyhJYHBYT1d4jDqahoVSp3Ggi95q/kMEbCjqWwVOtDB6+OSenXDz7/ur9Lt2HvFKyLL7HLyJM6ag5fHW5t/50f910ngqqX8jr2XDntf4pQmIyYLKGWyUOAERKWJ5/J1ONGpKxQkXJwSB8D2JXowx6s6quVoDRQUQAW5QNOx1FMDZOf2sXf9+uNvuMZ5ekZciHiVoMPDA48V+vs26KOIf/b5rVsXRxKT/YabEbyd673R12+e/nvzX0zd0dCJOWx9/Qk4h6xyr37zyrzsbCt0cvN529DQOEdXFc2CEupceUhEk2QPhURJtYfbw1CLCcGiWlCXhh1u1PF1WAUn2iNQl0bdl6Ouq/v112qD8fRQSXx5X0/X5Qcw1eqXXeOtLjdhiq9/ggZ1LwWvV2d29eznVHoU5DgO0JF6yVVqjs/XcYGIcGEettkQsgLk5qp2E55zHR2cSheK1qCgzux8AOP5Kjt0BOnHF7nWNnks8C15c1uRwIBht0EXqFt4M3196+LtxOSS4eHObxG2k633xw8P423t1N+3QMf7LLP7d5xK6/d1V4wA+pBLfG0eQcfBlLahKC7ePK9KVwkHRQFIkDQUxgxjP7MmKEh38rBKpUN5J5RSdYW6Z9Jevk4E6l208jkF7WVzUnLqft67I/30UHm815Xq4pvI+cB8vBk6OXjf20o2iYBTo5dTTz7Hc3wkJxErKEOPNvJ8dYFEGoiOnEJ/ZlRfsAapAHYO5pSr7d8frjSo6F8xTBrIzh2Qg/n6DW+4uXtu2YIiTETccSHMJujg4widYH/O7PwrgbnbcHMz/rW5+bvuoZGhCITwy0dZuqN3J/Bzs4k7QUdT3r4RLzL1uWTsNup527ISt1dlVmlZK2JE6ymNbIXzA6FBUm3jSbRLQlVvTQrqs1KeUd8+/xUROiBk/Ba7IioT267vjYn80L/c60pDUsrNy1hMdbn4vnG4G+PEx26c1lCbJ3h0targEuask8QSGDoW9PH5JokCnZ8AnBwiG7fF+YYAxlxCzDm5QQUnT+V2Q0d62blvV9mZE/QTO4sWbXVHmc23ZFrWyuPMuwvMydTt0K2uHcfXt767kZxcPn24eRVE1Lt9Rkb8/YY7KR+gANFhSMcB5DZj7xzork82Y82VtzmitoigZ29Is6BPK9oWv3h+Tn6lmlVjifpBEa1xbYyVBmeeFGWilhubklOMaI7j2yft5epEyGmx+eO1XSuka3aV7kqJTLpR4t+2NFJ7bRDrKNGCZvwZOjn4WYVKtoWSjEMjhpw6mZjDuj1OEYB9umDnBi6QQ5tlGgMleI2EU0kMBcTcgPyM7+rgOEN0oIxcu9TUll5m8+1QZ2cn8+7vfbz1Qm9Nb9MCX/Obx7OFQI5RvzN0+Pbv/zAnx2MQx/lDB8o3F33Kh0qmk+ULumPGxk6AhScGuk8z6F5eWX55aYw20AvRHDy8efH2jPwqlBdkNFhJtRjWaZVLbFRwTmNjjjqlGH0JQ2MxrqMDej6fQeubjw4OZpSuCMZ6+zAY+u3TCZHR2CPk2s3B0jUp49DQUYZ7WiMXs97MCgWWAVWKxeHhcnRX4gz6ML5Op0AnZrUYVOHBxbJAUK8zSSSmnmgwF5+tlmDIZ5fGZAGm86ll58CcZPfuy9f/8EaTG1003xLnmxWx6DhBh7HbUjZH6IT91vcXR8zx04c7CTi+3lnLqJuHyPZt782gW+I4a+oPIY5D4JdoLo8HdZh6HkJHaKM1nkvbFIfWiRmZoE7OSUZufT4FbKIUaVCmSIT9mIt1maXB2LeZRzQH6rQkBlUaUEeDmzD5sSvrIhWhWDqJ3Uu0vOqRu6k75D/t2jTReTLk7Iz668TJM2jNSQgnQTc3SSSydnUwzYSVg7mer87nsFdutExoHsGJA5DJFxRIJMYegwzM26s5VYFORj4/KCD6rJX5chxMncvXA/vxjz2OgPnmCne38viXjqexNH3smP6tDTpVZYZg58yXW/z72m+bB3pP9w2V++KnVuiQo6UT/WUY0s/VDCW6lEegbadL1sratI2Yx2vnvnFDEaiLcjIrQxCGssxN1+hEM/lFaukKUEfHwV3a+4pjKYZfcnhSdRiiuVe+uYxoLiVWqw7XHCuUK2KxYBZLqNVKYyErwk8g4cOceO/davaTXxBarh199tnnHnnkaSo6U+EN05xww0pgWjys4AwqLrpaGyARR3MU8uAQw6lz+jqYeEG/CUuZte0FCn2+ljHHz44x5vZAy2bo11su9GLiQW6Fq5tX1oL30jYuIzHoo1M2O3Mf/2RKy1eBuQX6O/DwA0jcyNY7R+fpozK2udYhfV93b19ieXlJREm8lzn+/iJb9L7QUqXJi4tn0Vy0MPMjCI2BYeroVZAjlaacFB3Wle5C+8FitAaXKvZvv6TXnRS9+wrz8ClqXmlQqvRqlV6l1xuhMuXMqVOeeuqFF154/vnnn3nmLt14dYLzTHW+KnPPLw9Q2Co605VRrMZOZxS3UXuwcPLtsPN8Fa+t4xVB6PsZxioZshDK4YzV4RLN+bNKRPb5PXqs3MWG2RTSiztaU2sGHNJzIXQH8yYPj9xTgL65pfZK1tvk36HRKZvDkP7VHzUjiVnXwXaVg8jWb7v0m0G9WSjDUvi+kEFfBuIsXWPeHXEcokBYOkzdKzkiL41sneEm/Cxf3/R28vyuzMpSBKfC3nBH0Z4Qn8ee4OCww6IHdhVnoA9pMfpMh/E52xtTYg/NB3XYOvoSBYeoClpb19UfOHKjrRCbER/r9560eDvW737zzZnLgw/ffc7e+cEJ906dIZMXnDUGSpfEFu/5BV2WTu6pS4miad+acCNUqAxHRW5vGK8Gc1mIThwgo6gdLfYDsLSrAxdVzveAuSTfWxlekI+daWlk5M43pNbsO0EsRjEHGILe+0cv5r4B+qe1F7IiXqP4fQ6jDkO3Qf8MNyBH4A7mZj8au+HVR0NfhXR9xGUI1PGPzNDt0O22Phfevfd0YnI5do4j6IlZmwAdzB2op22KSJzXrqvUUnwaiNGL68LWyzi60K/8sOhMSnFOaUbKmjUo34hz5hF1J6KegYJsFBJ8TesVf3/PetY9tTw5cd48kYhWax88WMoKshP+10vtGGZIGLqFQWdm++NTZ2CDU03rkEmC1BwXj0v3nGk8VEWXU9gVNQ2AowhbwHOh+bxCKkarT4pxQzj0B0G71GqjRH6+Xwzm1d5hfEE+VWwkgXJNR3X6qQG6JmJx7LYUfeeG61t7fYh5We7mLbVH4uMXvMegzxkDHbJU3G8nm0vA1QH5OzTsN+/rrhlxGaHSnODd7e7druz1A+dqbi92AXQK5fomJa/clJa90ZqrC5lbGmpzEcnzj2qr1KxXrQzTBPaz/Zbnt2OyzUmnM6XUljCjGJXIkOAcUaMu9hAC/MuDGbvQfVQqN50faktA9+Sk014uWO9z5tLgIBXnvhlcAej3Oj8hBPQT7Lrnv9OEJ57BKANhxHnqqalTZ84OaTzMKwIDwpOODRnlCnTQDcbqTV1lV44OjbPgvZk0fzJ37mFNn1cc39gIw1rnFLeurs+259nt2bM927NnSgJbLjr8QUyikoxpGJoRDVNMZGMJOqsJl0gUtENRXLFeEoWqATYVFG/lVi4qBQULaJW7OC/UKoJW0X3P+0uAzLXb/pj2JAFqLVo+OZf3nPOeE4OqqsYtj8C+HCGtwgplPl2rUPXkTZPWtGGzisjdoBZrHCben0tPHkEerhYFNQ9txoSd1op6B3e/fIF1uWJU9vhr25fOX7EG0CE89NET21+9zBO380E6qI/F/vt2hPAXmpuHAykhy3IzvtCZpqddBPRdRkD3UDemHNwM6h4VB3WQpzQNzuthdXqrjM0nRilJUudHBt6vUZKUi2KpGfOji7FlW4ZeGm1Bgd58NWAWYvi7D3INGMiDspRKqUg4gnk7ZQPFxXeBfDnqdRlJ3/nyl75WVv79L37hS1/+yld+9O1v//y7TJ7jar7Pf7v53L1Ly/0w4ps2qZU0VMSYSurF6CKMWn2iJ1kkRs6dbbGzuax62nQK4IjkOVxb0tSoI0KUNqEMzJXTZDpOiHp5j0UkZbZ9Wt5NhdjmwHU2Bv3EkdXrKmspVIeMCeEI+uDE3S8DOQSqPm7813FoG4FOLn0UOp5nh/oeJho9B7OxwPEgaR/qmwLqFM15jmygDk8+KoDefeZwViKgE3ZkyBONUHUGe1Qohs+ZsdQIv26Vwz3hid0wZQXhy/1APTbJCqeHrV22bEM2wh2MNm4p0NsAfXkjqGfnamQyDFlUxxy5ffukReNvxZgLysHf8E9Kkvzwm0Et3A+/8ROsm96Vgr4uwUIc+C49T+hfDQoq9i92lZUEoGKOm4eCBpNFUI/1BSq0Om5KlooweF1Ig520drs5NFgkpu5UEyqslhq1OFjpkMGZozkGx/RQJWdqw1ntfFsy2fabSqHepoM7R+NjVPLJtevGQc1BGgzZA1/xmt776oUpFwj6+wT96ODElKUzNv/KW1n1LbKBObIqiSPMx2D3pR64fZQ6oI86dQhz6Vg5snTuUoY9sDksZf9mX+gsTZOzOXpXWLjLbpWBOSQUJ1A/P6q6lUlCrNB1UNc7/c0yaLpS11KizQ5AuhbjVe5iAikaMTWc5fbtWybObEdmDksoP76bi/1PwalBgddjbk2m0e8YySMQBNDIo3vPM7xD5bTMnISA02yvamimlrEWnDqrQkRiuoESpTbRWQvlVE6owwYFMEcPRbJFzGlrTGJEMIjgcDqXCZXkz5O7LKJploZkmIK8Bk6mt2kQHMAuitVtq9e9c3EbLDU9QYKUHF9vY6H7xHx4dF4Qvg/uW7p0Duz7L3zK6UzRiXnHiUA6rNXyBzVf4vhE1B+1PoVb3/4aoBP1yMhnoeffQWqGZC5CuaXNRuMqUKdQzufk9uaanLissAC9FRaeksihkEYYeEybdEmSQB26Dk1HVhYO32ZraVBmB/jBr5djkBJmKOlMS9ra8lRipQajZzFmB+H+IsykU7dlTS48TwuIscyshBqyIPd+9DydOiqnw6CetIhKp5ZbbYHGgqrY4gB0kgtBXSoSyjnUVSBEXS3i4NDVOjFncWqQh7PJgBzqr1ROEzk4RVfmNKll+AjpOc5qWhvCetJzobxtGfQczL3UtyFkp7iamPcO4hrLTqbodNvlzOC+7YjkCDqevpqOE3r3lMCFKVMp1QotZ08v9RH5a3tn60NBcyLS8LVe6L8cQ526ZvKDAH374l2eU5sgLGvC/s2bYeLJm6e9iT+Z1/U16aBekgvq1EpDyTlhI8aqICOLjKuTqBdjL0SxXU7hnKPkJpcdEA7q0HWaJR5z4oMtClzgUlswcrrYgNJrhtnA1QTuOrlsMtbxTQ4qq/sYu17J7v/kOZ/jvjx1exvbgxoSwqWmbrnTHFAc62+mOwlCQAsWcZRkwO1MDRYZR4B5sk4szqyRC1FpxIB+3NiHmoumqUnPp4kym89LX8f5HLbdbpZQTkckkrclrz7avw3tMZG/i4R6MwWP/PXvYNl7m6JfO7qHFH01ngR9T++4r6fMh1MHJJ/GGYI+1DGFDmuPS0dpP8ucqPc9aW5OnPq4tvZP6JAj6L8co+m13VM2JRpT5m4nA0uvlGbsK1n66sF0wk76zqB7zusTEsNK9FaHejqbVgtPdy4sHD4Y1GPL/fwmFdudyNMYJAh9uBrBTaU9AKe6c6BebBaiyQjILVsyLVoQD1kkQdynXDI55faSk83Dt293WR/cuHeV5N6N51xvx1TQqcM9KBQGU0u3aVNhRdmkXFwBCIkAdPwaUk4w6iqViFNyEVgjrC6UKh1uObIVNv00muknQqTOqaXJDamiKDCPYjkZTm/X8noO247G1/6i3/06kqhvA/htaWn0NcL26MFD+WeO7nlrHXgz6Dt3H9s7cel8OHWm6r+MHGvezz66MJyY+Orjfh/oPh6dddL9fqgjf+pwcxZ0nQyKbyCHags7pS8lHU9hW94Djcbhh8NZc+fsyFmzJoeZeR76H6DrO2bz1OXT+ARUqAzRnB+kWCJh1LNdsUjK4gcmRM2tTFmBSuvyq0i658pQiUASNtWkigDxpBADdgYYTPG7Jh/e1BbU1ePwNz+gcaaQG8+/IvPFb08dzhOFUPN+xPQIvT6zrEwugZZGQNcxHAgiipBidJZIOp2G2seI82qUQnGoXh8qDsURHbOvp4lVugadVGoBc6nUEYRNbHY9ZWZfnxZlatu09kw/KBN0UnHGG6XMHGh5Ny4ujh/ch41AXuhvHUp/by7aZ2Bif0XQI8m6/wVI/9p+dij/iZExL332sOaj6n8d6usbHhZkTQX1kTObt1pLLr2NoC/dTtBTArEmdLjv8v2+17YvHiRlp3YtsvP4BMmh1BwsvFtIhVZAnyYrYwe3AH1srCvcb1J2ttNcbLbJZXCQN5GRrQgIx6/evZuthc7gsEr7CGlxTHF2MTaJywsnH4nvaauyY8En5owPXB+4Xn73BdyKwFq1O22WCLQChlADszwzs6rOsCg4OCIGg26Dg9HJDqctRkA/HWWUVLE4zy6TwbZrsURdiMo58vA6lQqNj9LU5i7EcJktmCNqxxpMGuepUrRtgZ5vg3EHdV5+EQm/mdP0m14g737nWG/04NML+eDN2/fj6UcXL5294+1fESQyDQT9z6i24LD2ZGHi9sdom+aduQ91H+b4vaDeTBHfxUiquIwyZ7X0/Ga4dNqRhid64gqGL6/f+Kijr29o/pzBdGg7H8gRdNJ1ot5iZtQptYhNceeg6hgdq0/KcPqFlxRja5sTLXJymRjUG7iKEqJuterNEiEqFBFqA40Df/CAQecKjyT3lNXgDWMofpBdUYF1ANYXUm7HTeSf5pmwHJPvgpBlVlTVyEKCxTHQdSi7kNMo+aE+EUqdWOhwKLFDS2sT49fEYiXG4HLJyV2opToENVHSUK5MKdYy2z4N9w8Z82NMvfkoOu0X9BNNa4oe7M4/c+UiArn+/sHBo/mMOnPqe/etWor0+xoy8GQc/viXWkCFnnfQAX2wlNH2IT7WttMDgl6qKcPNxqXj9yJ+ZH8yNJeYs8T7lkQjHdgY86yCAkHf5QV/Hxo6e7ajo39OdDpv4NN4TWfdkmibK9G57SxLw/t1v3CoekBuLKj7lWRjpLXrQTZa3+VcXUG9yVESFj6rGncgzEqh0mBtmbX8HCajEnR/fy7B1FNWZZZkmPEWyL5FzL/2Qpjj4IZtyT/GWg2qLEzHNpLMLkfINCAHc45TWjSiiNCQiGliTh3BOezKEOh5Ht7CUqUI5FWp4uQgiwgxXA9K7MogixJ6LqFYVypStJ3YeaYfURtpOa9ukDffburvvkDIm3prr+BmE6hfaOUvnaPQNm780rnzEL/jPyCHAEWnWspQx9MsI+uU+VQ9B3P2aj/dNyVQkDh3fBFzKYSbBWhpdEo/aWTQU3YhOWIMbz5x+fKp9Rv/BhMydKW7/ze/yclBThbgAZ1Rh4XPWliitTtk/HEd5/UWP9ZWkQsL74fqC3ACPII1mawOmY4KQXjA8gBsBtAo5dnOuurls6pvsGOc2Z+TZpbV6SRmPep0xRUVFY6fvrgbb9iq97Vv/pj1sfP7BevU1CZDBVRTXircEr5WCk3Y1WOTYa+VWQ9HJcbQBlxxkaosDcjDpYI5OmMb3Eq1wxE6DQ8c7qDnF/rhVtGXyJizxqSmpsoz3SAO5P1Xuvv6zpw5NNh7/AJz61j/s288ndR/MwK9thb10/ahzikCY8qr/ZW1f342cseLFx45M/DtZ/ueNguytu/v9UBn4RlBP4NaOqVmYN/h0Auan14mOXVq/VmE+xcrD1WuWJHmKa8z6NQ3Nz8rrEVrdQink4C6hi19CifqOK9Xg3rug9xcCfJtyptGUG+h0YmubJt/bK7d9eElnO1vkH03yzlVTY8JM4khWD32rZ++2PFDwI57ajpdanKhGpvuMvWUVYGo8zJVMUoOA7Wh50I7MQ/WOyIQ6EtxrANsk64hk5h3qaTT1EE1nNJhFbLkK/T8yOoLe7dtQyAFk866Ekne6e6urEUET+nQvr4+3N+/sG9w7xkYeBJUV4+i5hLdBHsc6YEOFcQB3Rg4FYpOmj7Km4c+xryPCKrufU8FgsRXvdB57Gnk0gNZiW1uyq6sxIWCnvtMQP1UZ3vttm3gXllUBE0HdyAf8eth9To7UUfkIxIG6wOovL48gNd1UH9gdhWTrkvEN41BpooSP/zbchRfMrJd5fUI/KqZpsuFyT0WKEsEp/vWT3/6lS99Bq6vQ91/zPGSp6cYLUJpyqvAvFsOTf5KDrbdJpegYwj+HAc5hHViEafKbLBIp2USc5G6oUYst9mJeSicQduRJbv3boNDpdCNt+wg/c47MOtNTVT2uADire+/j0lM4wb7jxN1zOu8MH7fqpTF85rwrvBAB/NHfSiLsMD9GW/uY93Zw4v9dN9DgSBrQu82fCN2+oa9SYN1P4FT+lKK24n5QyL+vod6R+eV0l6qBxRdvMgHcyPUZ4O6BvEpDZ1CYjrYJoCqYwdAriTWGbAcFt6Fomo2dj8ZdFUL6wsrBAV+KL8U58rN2c7Gq6B+iaCrTXnnsdomOfmbX/vyZ6aH5vPfx8mMU6XWpMKioyGOc6PhGciVSjAXOxxC7DzW24Qi+HqxyUT+XBdkQX+koEshnWYKqhGqNXak6SiDJ247CeZF1LfwK6+k4Ye5LQ3Ie4H8DI/8/TdAPX9cdP+Z/NZ1O5esyx/30teXzo1bAejMpSOQ6380ZXhhFs/8WfE5r/noeieoZ6UM7k0bucBILh13HhN3kTtHzbPgCWMOIezg3tl5BVZoW1FkWlFR5Jsjyo57brDw9XQqYfd3METSBl33g9DJLaAa1BGgm80ZOJ4pqwQNhRUtfqDeiEOaGZOlJ5Gu41+jmTho+DyYf/mzdHf9a7A8aouWE5Mo5W4Hx5mUQg2d2SIcVpaH04txMEdD7DTMg1FYgiy8bY+Skm3XaFw47YmQwFV0ndy5e2+Oh3kk9Z9FFrEf5JtptZWEPL91J4gzWb3zwsRXx51pZXOmDu2/hi200U0MOml67RA64oh55b/NuPsgH0sd4Th649H5WJQWmfZmZBqMDexLR/4woC/dlYW7hQufXAZyr/DY168/3Q7s2yLfLLo4ih0xPFl4tcOGsIeoTw/RgjokAB001lnVyMhiaa+5OBcXnjRVC8nCU1/dObNBZnY56yYhYR9gx3ZIZWZbs6Dhp1/7DHVFf/E7ukwNAeZCI7D9rCaPQ/ymxJhMjpgrgyXQc6ixkiYNqKclK1KDMqXTLM0Nap65XFOHhlGaH6Xoebg6f28OTCqggziQQ9LwRdrFym5y5tByxvz11/HauS7/lcFxZyhJk398/8te6EWMeX/3k0Tjq+TPS0d5P8ucqPt4dURznaz4np6zDe86xAhQdHLp2AxOMVyicZQ5/iYMOwvkO8m5pyHsAHYWz3mzNAVlakfm6+xKB6oT2oDwMKIOXbeG+5Gum83olkSSS1xVQNQDsOGg0V8uM2OecPVy/M5sGUK4zIGGkrCSn3xmqH/xaw6m5EplMCJ3fU1mBIcdpvDn2DKXZ47F/mq7LkI5HXUzoVohVqhq2lBS6xnuUktFlgaHUI7a87Rgurqc3PbB6j17c6BcdERGeg3E8Tlt20Veyb3EGXR6rsXIjkFYeGj6mZeuTUiZS9B5RX/89GmiEaXSUeS+rCE+wftY6mdBXZC1anwvdB0pIdiY7r4PjGECMA80CjzM32ACNzNi5WHmT7fX1uKvD+sEv0CNPG8yC9+i1WcKMUwYhaaQYPk5NL6BpSs2tnhSQLU924oDuzWD1gXkCVoqUusLwpGIzwX1bFfj1Usw8U6ZmjY41mPX588+I9S/8A23Dn5ciUUnyMk43Dqx0iTDHmoMwy2sMcXGBhscHBJznDoUu6+RbcsLUohUDc3nFRgtEoQ19nZrLOm5FLW2d1cfoJ/Wm5HU7EZaDh3niV8g4iSMOAmPfWf+0ejXzmCKzIV9469lLT24YoT5FDQ8EPMR/R5Rcv7zJ/h0vtMGft2YtWoQkWMOhluUwrq3hRU0ZwVm8TGcF7mX+ij39eD+Fzq7Ifin8v4v38SoDKTvbDoHqEOCJRERdcAaDnU2ZPhPCijJphWd2U49sIdoBcaKwuslYX6zSrLlMkOxq5yiuVn1WPePS0JXqzHo4TOx4eGLP6rREXEheXChw6kj/mCOZKIJvQDYOWznRGoEdNNp8rE6ytKgEqnamvPQJpnXolNiCBctxX49Spo6vGXd8SLKYEPJETLDk0PJEbux4I258lHiXuxvrM7fF/faBUDv3v9ySkrcijUMev/QheZExvz3Y89pvrifRQ4Bcnp29uFYPiG9tzfNA705zCgIbE4UPLwM5D7M6SMTUGfYO0//flsaC0Yi//CHX/7qzR2zUV/Xqm1CvssfawLKgBzc6zL8/a/6tRQXW3OzDU57SFKIXFdidBdeFyA5F2CVSWJtTlBHaFcvF3Lq7Mar1cuXfxaof/FHTjBXgrk6AsyrNPgHCtyF4piEmkKxTGK2cnSVCV1RQpVInZqKsxr0vMYE5kE6pczuEgaLKIZLvf2PJQdyKAACc/zEvEre3UGefAxxH+yk6+MGx6EEc2b/y7uy5uwg6LW9Q9ShPpX35x4d/2TxZc6e0PUOOu6NpzNgbfuVjhMLwwSBaEkm285bmzd8ZVTdEdRtPF26jdQd2PHuXZM+OxHUaQANDRhEP7ywLIxRb8zIMJeg+lKMJVTmpIxYZLh0AsEtUKdmSmtsrMzmrKvndR1tSFZQ9/sMUP/ij6o0QC6XyZWI4/Kq1Bwnp7XkYi7CdD0VzA1uTmiCw0f+nYtKlqYGVYgUQbDtoigw59RWZ2yICOykybc/2HAgJ4eCHwrf4MmLKq9cYcSZYfdB/gz1oxgW1r/v61mLD25O29b7uH/KbSOmCAH5KO9nwIO29+ErUHWi/hTJPOh6Wm8pneLC/AA9bJiY+xD/BCu/Ht49DRJZhGbqtKbZieEBOrkG3aDQdlDnGog60uv+GcUBfiVogcy2uxrNkpBYDro+YLqJWA/JORmou+uu0lKYeoMEoz1A/dILp/7Fn9RphDLCjDYQzl0D5kgXyqHmMYXXCzmlhBqeYdp1nBS30xWoseSJpPDnqVJpZrOWk9mdsUnTaaizIujk6uM5kcSckLPYbTRc96q5FJCfEURzL4H6mXeYU09PK+p/7cITY+D2/sftfLKVHr7EP92ley60n3oaaJy7v7eXoOcPhxUIBGEFT3nmr49Qf/0TsIM7pWzYCfKXv97W+2piQYlOp6DSC40iieDIwqMz+py/wVrtVwKnTjtF9YZFIcLMEuP1woYwytM7sSJQ76o7h6/9WjRCuXbgJk/9RSZovgTm0HJotmaEOSeEJSLmFk4pM1jFISalmHJwIhUuPbTVoBNO4MDIyLwSi1hor1KiGhsK6G0ndx7PoasKhPxXQO6r5Az5Jwj8+pnBwe4LxwffTcl6dUdvL5gjKTNYCc6M96fF7Xzk7uvSPdjPdjxNTAT12srTHfmB4QEYn9MFf+7D3NfA4+mr7p3tvYgFqfFn76tZic1qjTwYyg7soF4P5thaA11HHp5VX+z+rtxFqLrpmo15qQ1UkptVLpPIta6qelr91yKXcKAOvX+h1L8M5nIhqBt0ESFcTQ2cOQYco5dCHFN4pzAG+m/FrgbYdg6ZuBiVhTFPbc5Lxci8EotSaKtSBlO/nFDUc2fn0SboOXS8KY0RH0W+lmf+KdSxDAPUzwxO2ZW4a3z64BRE3pMH+0t54KV44vEpqu6D/W+jj7MI4alXvrKz711jWEFYwZNNfI6AHs8gZy+flA2od3Qwdf/dn4r2HkxJbBOqZeyaLkE3IAvDojlDrD0g/CqiOSqiFiOGF+uaBamFUG9sba3LkMDCV7EYvkwiVqYSdej6914MdVxe+7lTzlaSy9HLLna6YdmVoC4URnCWm4UxJk5sVytxgItQh3I6aXxCfFsPzmWCGotJbClxiMFcHRzMSu49w+sO9SLNHekJ10GcIYfwyKOiPpH4NLxWtx4d3H98/DVcUNy/f8pDXGWhO+jAPKrln6LpvsJrOp6YYdDxBDm91x5h7hw6/Aue9HnzQt6Pz4In7vgwxsx3MO+Ovp/BLKNbLqeSG0rRaAo2BxB0xGsGA24ts64Ke6M1A+PnxOpmgUWLtjrE7XUSmVzPqPvhRlyo0sJb+OoXQh33z3/uxskMtl2tQ+rY4Wb+XI2gDduY2sDcJHRoOFOIGOMB5REiVfySri6pSFdSlqmMsBRUCcXaOh30XISmifPN615uGsm78XbdeyyHokfh8cYnIsdxD8EcqO/dt/9aYuLUKQ8FibuIOblz33aJTyfvi5y9QB3tdU878oPCwXyTj23Hp0+SEXW/DGFWHrH8tt7XUgrsMrmQzQiHeZPYQB3hGuZNZmRTVwUGVdAi2QzE8JklAkvhTT/y642476t1l1+ljY51QjFZ+PpqVGJeAHV0UJRZ5dhhbsCC6ukRi/RuJfXKyOUiLibhSJtJDO13OCKQlMNoIeE0pSlh2UddMVJtSYNDh6xdi1qordMipIGag/myPelrQPziFW+8jlM56mje4zCgfxJyPCGovuTvix4X93Ki4PzJAlRTqcXdm4tjzP8XZSfcPHeMK0Ej7ZMpUwrCCxpG9ZzkPyLnU3Wes/vps7VNTYNfTwy3C+UovlAQj92bMOvLqebmNBiyA0A91x9RvNMuQwKnRmAsZNRpRJVQqSfql+gdEMxpb0HXQf27z7v6gtU8P7Mh05ohl2lMmHqod6rR8mxCAp4Txx+5syTGJBfnQaVFEWijCJaZxKZNXV0JERYw15uwXxdL+dx6GlIRDD1vWHdhsKkI1dMrVzqBHLk3aohh7hzGfcSjMyV7VtHx5A9uL+2PPpDV0IUrN7fpAiqT9pFPDDF91f57evyeXvyXf8XTF3o7HiQYKTr0cDjMePKD8PDhE55jYxR9/HRl90In6hBe27vR4PWqgHSdBumBOprGrp4rzi4JB/WMDHRBX0U/vMGekaTRCyXiKgHpumcwmUxuA3WABnVc+OWp+z1n6jiet+hlco7LUGqUsEYVbp3SpAZzlTQm/shHYE7Do+DisSHcJFZiQVNhVxcXoS246baoldOD7XI0QLvZQJrgvAbFzqeV0HHy5cyZM+gMO1YpAPsnRe8injr7GgPfL7z26rtBdbhfJxie+hrkcf+oMPSVeJS2t9ObwPNs95Gz9GDMz0LAHPLoyXBDuKDFL8CW7MH8bPz2iYd2Ek+vBaSj+7WpUxMLHHJhKIZCA7pp4MNyQ6yL7qQ5DXJQRzRXjpwsTuToNwP1zFRQh5TJhWqbtRygEc2BukfXlz/PRDxCuJ+g+IfsukmG7scIME+FOzdpuBhVzJIPPsLeMU7pzjSplGIN/r1SmpCQev06F6IPaHDbdKaIYIcDBkCqc1Aka2uJj8rn9+6cOdMHGVm+Ao3HrVQ8/0U8y89HBX4fsjP/wsNNqQUBGMeOoV+v+sggL48HH+NJr2el3/vFEJ704OXp04KSDzFBxCaXazSKEUlWJEPwCc8xshMPBbt3w4Dz79zWVlCH4P/t6cOHJQU2tAUvgoFXOhsbG8s5w9VZl2b5lcOvBwRcLc61FqNVSqMBdbfAmKerAnWUXxA76e1om6M7z0hwp94iv37peVL/wtd+gtOljLJw2Ck7XeyogZ6bUAhSxUTEn7yzLAG4a/QcVyjlxBz0XJGwqaeLEzlKnOj11IlDNGWYNISznMOCYYEFm9auu3D8kI8cxbR2WpHEBBuyPJI/Ing3sOfOUVm3Mz//g011AS2TCDrJ7akQfPh0ec1XnuDpI8OCAAqWG+to+0NVlZPWP0DyvOImwSf2wFf49z09WLmLJxOsjsB3aWgYvg0ZHg7CuFw9LntgOKqrsby8sdEaqy+hlCxFc5Mu3cMIyeLYWL1DKZGY3ALBkdSBADq6IQsr11g/BPVZpOtRllvl96qh9z97TtPhwdxd5m+Q461vUAtFIRK7G+680KQB85jCWx9tSIhXFPbgFA6yMQpVcowpZktPl0nkCKtDFTFXFiwvyxTDFIQIxVW6qKCa1a1T+gdpNfyKFW9D8AlLefGBZGa0V+LoNVZ5GSLv0gb+/dC6JdNdElAgwBDlXUzQ3JSyFJ+3/4vM5Ye1b3917K/Nxa/4SiATQUEAKVg4Lf4dlTBevP+Ep68sZB+YsOUQYfi80EjrwgNK6oWheFjLy8vrPm6s04nLCgrCA/zuZvjfra7+EHPHyp0GjU0ji+BAPU87QKMnibpB6wJ1YIe1V+myP/6Q6frzuc72xe/n1ftnZMghBjTCcG63GktUibkqJv7kRxuWLFud2rVJoeGwJb0QA2FNqvjzwyapuK7MhSYRa26GRssVcnD6YpGiLFWVfGJKdzc64PiR+jm/ysnJSVuzhu9/YcMHii5CKknI7TPpgCPwCHwACVP+nYo31ibvZJu7nhHfdXwke6a8fOD4gbHL+i74Sl9+H74tOnUUunN+JTQUzkPWC52gsn/0gvYRI5NE7AlJQW8d3lK0GWLqk7JzZeXCUFGovbz8Bml6o4ErDDRSX1R2Ru6H1ZfuPcClRaXBZtbIhFxms8BtHsBkMlZxUevtjLof3jVina2cLPylnz2HC21gPtBilsk1SpNch/QSZ7dq1IpkU7KGw5bgO3e2bnhryaauTUsSYjhTpiIVbwRTwqbhI6kYAqq1Wu3Wu8W5sogYHOIpOYtuZ8Xra1u7+2vTmkAavCPRAjtG8D74U9G2oj8CPC+edQ14eeQKSSUeT58+3IkYamf3UP+/Su8zkj44I3r8wdkrmkZ/iXptxkolCSv5tL7/emg90CJaQHE1ENLslV3Nk/ER3mTy8GSPjH41YTJtkpkwYT8v6ek79r/22tM8hwZztoSOuvIbN8o/Lm/UirlbQSW0FMA/9kHupKv3HvhjWIVdacigamVFieAW1dcxfLJFrdTo7Y2TyMKfw5lIWVH+IVF/DnOnvvB9Z70ZR3OFUqkWod35lltnQuCu03GqmGV37mAx4e4pD7fQ9rJChUmhSIWiF8b3LFNIQR0tr9Y6a7G/BG02Jhh4DstZulSvr80/U1mb9vbb6IP7A7sT7p0cQxJJH+jSA7ugTvIXJqW+cvFif/8F5HM6uq+g+RmD5iDeyRVeifQsa4D0Ds6bmR49ZzOsCn8tctuoYEhd7V/4B99H3XEfw56CCmaFFwgCRz3FKo/gC69gyUfchDh6xh2EN9qxY/PmzbjmlgPBm7rp7abHQ486TsiEuNpmqwJz0nSbWNHTIjg36dIN/4ykpMYHYG6v0ukMZVUGDnGSYUAQ+O7hO7sWzgJ1BFFaK4wBWXglJi9WDDwX6tizVoe6kEypSFZqEI5weXYdB63VpSpUCZs++gibCfccPfreuye3LItfhkXhKpUCq2jj8VklxFILtdbpbHxQrJEgG4/3jSIKV5hr1kbtzO8u7S0qWgPq6HMHcgg+sy+9+DFRBPInyCh46mX3fAb0M61979/vGML4sZHpNB75HcmvvfJLcN+2Y95vAH0N6vb03VEHwx/g+0dA+D/k9+s7przxenJLQTj6pXYtnj9/tkdWzcH+YBIsvZ4RTQ+vUEzyNnwUJNI7h+jNpm2VlY+wMUgoAvO6ckD/uLwsW6hwCMI+vArmsUkZD1Bi9U+SaO1KHWcYyKzRZ1fcDLyz58C+V3YZEc2VIXJGTb2afHwjGhg0xQP3LkH+3zH8lxrqzbJYJYCpQ0ODubxbhUoEcVqTIiphK5i/tfv4sXcOHb32wcmtG+K3xC/DDmEYejAHfRUmQeoy8+oa0QgoQe1drSDqUal5UWtB/UpvU86xNdB2YB5lzoCzDwTFlzp/BZX/orT28ZnWjvuXAb2z9C9sGJUvc0DnsQMvaTug742bxyZXMHMSSd/dw9yX+p/bOx/14eSd2RIetpA0nUGfM2+E+MyZM6Mp4MRnFnyugAB5Gn8liwwLdXg21Va2D4F5a5QQ9/GrypmiN9o5LjmoAHr+MdQ81pprePBhrrVOp64yuLSFWu1AxfVdXz+wb++4ca9MNiL5XyWU8TE84kpkZ+WG4nKqvlT/nyfPfLnMTen2zGQV6oMaewWS6+pCDcdJEw7fee/w7j3HX0pPP7bv6HvXPgB1GPlNeClipEAepUD4Ikq2VNx02nP9UYhT4ZyriIGuZ65+443WM7i/0pRGd0SIO/XPeHkz8r7UgcMjgE5fl/b39YE5ZKjySi0hJ3X3Qv/TKPVIvBh0mPe4OTz0SP6be7D7QoeiY9IkTEjr+5sawhYaUzCJAtRB3MucoBNvEGcnDiIO5KTiv4CQjrPOzvbHZzs7OlrfEAULHR7m5TaxKjWo5Nyk6rsZi5IMThzSMUUQ+S63IVt3y2Iur7g5+dpRrCTfMR4zMbEUKqxMw0hPorLrVS0i6Qf3qv2qf/7/jeBxXOs5r5YbbJmi0Ol6t95gUqNGzKEzastH/9i9+8C+l7DdP/3YoX37rv1jC21CJF1PwNTAKMyLVNDUb4Uls8xlL8aAxAiOqKNTTnFiddQbO1GEvFK7oomwk3dnRpGIM+aj2CFgwrCOysX+/L6++6dOAfqjx51jzTsPnrfuGGwA6FB0QN88wwudvjF+dYQ5o+6r6I+QXEFnXGsbDl2BRN0DPS6OUQd3ZtNJ2LHTMw48krXtM+QXa3tr0SLd0Yq1B0pruct5A1KnjlKcEBScu1RdnLQoNtdpyC3PlVTZdW6zwWBXmyoGBoImHx13LD1u9txV418aNyFrYfisEp1Crta76qlH1s8q1398taTe+Y3/dzr2i998mAfqWqW6qkqLJJxGoxYKuZgtJ997a8+Bo+PnLcboxh3H3jn68sR/YPflMuyhBXVOBWWPEgtlKKkpMh31uKFrYNQVoC4i6iiOdnQ8ulJJ2C8WAToP3ncMM+NOYMZihzG/2IsTHKtrnLrc8fhsO6g/49XpvwP3X+JFsnkmoMO8e6jzzPFk1ElGNP1s51AnpVGJeoMxjHR9O1SdaXocY85jh6aTrq94m80TpGAByKlx/0+EvPTsxo1g/npoSKzdeZeQl9dphQpLC2z7JCxtStK7/B9YDdlai1apx8CR7IFbA7eaJ/9j37HN0fOzjClxe18a9/UsHBXr1UKZ2jbAMjN+ZXUtV+tdz2GC6Jd/0JWnoXJqw02dRiNHiSVUqtp059qeAwcOjcdSC2Pi4hmb975z/ACoLwP2LRug7DExoC6m0VNArHeXlWdjVJ6YUVepcONl09o33r/f19F5+iy1muC8TtRJS2DoSYDey91LnYSHfrH3Cmw7MQf0y0Olp//yaYEctB1PL/RR3wFh1H2Yw3F0dg713ce3Xn/58vvr2sLCMPAdbh3EmcyIm0HcmUNfwYdvvI3i7+DhzMm0/HQn5hdAzyMWSazQcoizTocUbkn4uXuTcpMwJNplfvAgV27rOp+s1VjLMzju5q3JxHxH9OIsHPqzJryEe1uJYQWNLpsMum6luN0vrKSlzP3N/39SDmX0b3U5UEM1FXb1pKo1ak6lNMW/e23PnuOHxs+Zm4XUU9biGel79x3f88oHWGyLXM0yhHIJERFiDgPHxJgzodFWNdZ5qZtAXQr1j2LUO7AisZTHvoa4Q0b3rfEfGXVQGZGLtZU88wXrQZ3se61v/A7lHYUOvICeNgLdh7oPdAhZ945HQ5fvn1qwYD2UvXXZMIYLQddZJOcN3EmYngM5Y84PQcHNmEggR29ue2fnxkePnva9HozNTNjlcJf0XKdSJLeAOZb2IV53GZxk/ELUeQo1DsHu1AYwRwiXPmNu4kJcjViYNfulfUe/Hnizyum2yeHXb1ytRmAZ1OB+DnrOqP+0K9WE1tZNoG5CNi4hfsmG3UcPHUqfsxjMw4l63I69+w7seeUfoL5swxKICc2RdF1dLkR3lE7rulmVnZuhRE6O/DputyUnS+HXQX0jFmP+uenttEhQfxviNfNAzr/GWnjGvP/x/Q6+Iw1g1sO+w0lgyqAv81Hooz6doP/BR9MhvppO0Ice3UdpdAH5jtb3TwiIOgw8kPPUSaDmDHlODozTyA4nIC/algbk6IgG89Y3cMZ1VLlukHUv1ymI+b1zlz5OSkoylxtc1lhDXZXFkao26dCOcv1W0OQDCOFmzMePFBngMOPSCS+9tP+jniqXy64TZmTjuL7Q2Hw77/kwpxrbT9sQsCOB2lWjM8XH0wrrt/YcKzo2Y3EK/oZ+4UZcLwL1owcYdYRzGxJQd0NbmBRuXYL5oLpMB6I5XNyRRCiS4xUKIbI08ViL/f7ljvUbV65EfxGwY6gQYfdEdR7mEAJEaPj5kbW1YH6KKtZQRqA5df/x0BWPqv+LdWdkiTAPfbwH+i//RdN9Irnfn+1AcqZvPYRR33kS1LNI1T3hu5c5IWeJBq/k5IA4Dmpk2VeCeX4UJvHYnU4Xc+j2UEVyUPjVe3RWiwXzu8UZNr3FkpoaocmsST1Ctv0wYjiy7TSBbnkYfqZx+1+5VuN03bXL5dkfTqr2Mw4/OfK8mLMm2DKlEAvfj3TVJBN1RfyG3YeKitLnzU0xUiramDJ/xo69h46+fO3wYdL1LUsSYOJpDjSUHfVUsSYzr6EqWyuPTZJA1zkO4b0FDh8mvmP9yo3gTtibcka1naj/YdSvI4VGZOguy+M+MOf1HMLsuyc/40GOB0H3EOdVncz73ugZXvPupe4byTHocOn377N3FIRRD4SugzoL5WaAOkEHclzTYMjRz4tPOWuKcnC1uv1KJwIVVOWfbopCXkNb5XTBuJdXuYVRipawq/cmgXmIuTzjwY0kuVuN24AW90ChKf76rTay7XsPzoU/94OEhyXOnR33ykcnq27cfeCvrEA5HV0DD0986zlOkkO7e5kc+RZFTVtNanJ8fLIift2Bd4pydszD3xIhJobqzZ/3m2OHcF7fevitDRtwWE8A9wgwF8vk2NeBFT15ZQM2LdJPUqpIUzCXqYhC+0Ff5/qVv13wW17b1wD7GoL+Nlw7hGH3btEFHmx3AHMYdy9zsKH4HfZ9FDpeY106+D4DHci90H11HXEcHdjwfT1vqb7WnT2Chcas7YvJrTPkvJqzS6rMnZNhRx1hxYpeaDm2djPmJ+DPpyudLieMu9OZJ1YpGsKuXq0G80UZ5RnWj5OsWnFmjwV5ykKuou3IR7v+QXpOP02GnH6gE8ZfO3kdziHXUHGz5RL2gPec+NZznSQH6l0qon6+7XyyqRCZ9mXIxRXlrJhNoVxYmDErZf68Fcf2HSDqhxHFb10SD2VHNBeKpBJtYNLqHWVuvdZfEiEm6gpQP0FNMmThV0LZN54+W9rL3GTkmyRriDgvaRCAolWrvYM881NEZQEP/fLj0ite6CS+mk7MPw26r30nl44gkUFn0oemnoeJoD55FfQ8bh6Zdhax411J5ggPGPb0zStm9tYiGYP/4vTZR2D+BtoB5Yw5Avc8TqFoCK8n5jisOTOK62INdrsGtUeL3aYOslwfSLm279jeg4thN4k59Hzp9jn7J340MADmJsvNErRjB1XpNd9/vldYQb1HJUYA2tNQgxXQ8cvW5e85BOq/mb000QjsTNd37AP197b+4623KJhLAHURJg+hIRC7mcR6i/2cy6Y1yEJAfSclaZK3MOow16dXblywYCWwN614Oy2HnXc97pL8OpghiYZyXA6WO/R1AjnBZljwOnV/6HG3D3Qw/0+aDurPJuVoePjpDordCfqIqrdihiwFc4AO5tByMB/jzBGKbP7NvMH+s52d+O0bT//t9NDTE6pQCfTc6SqHbXe5xApFGZhf+phqLC5zsTMkVo/dFoVolqmyWVIHBnbdQR4O/hy+kpDjT1u8av9LTNFzNVuuNwvCwlqqtP7ffN6dkdiWjUywUJXc1VZlgq6vy999ANQ3z5yPydRhsPCwgPN2jDu0571ruw8jRbMMrj+eGXhMDg3FcGSxTeducOox/1SkWk3Uo4g6NbYiTcOob6RTOw6/mxHRjcH+B5ZQgZmHnnf0PeL9OQkz7/C7nXDqtf8WOuCOBnK+0H2ZQ0at++Ux0DtOUQ/fk6yF8LGUgiXkFL+RquMF5Ok7Zs6Iftx+eiPOeAjh/gbb/oEiNHiRzAXorrv4IIxSlRVcvVf9sX8sNm5aNeWxmiqUHdXasluoq1VcvzUZ+fb0OBbDFbAf5dLFqw6+dA2K7tSbtjwMEmD2YJXe/wWsdQF1p1CpAPWymuR4qDoS7+8UFW2eMZv367QDYd7effuI+rsI4UGd3Drz60ohZmKLbdoaUEfflXQtxfBRRD2KGluh6xv/vpGZ+L/Cxs/8TRMiOq86jQxrfbN3sLtjwSkIQ+5x6viFvseVvvbdk3jn2SJY/7fQRzOxYwK59s6hjvcvr+ehe7D3XQZ1dEfMXRWNN+SaNPp70ekc9KHkK5Cp6S0Fc7z9oOdopwVzSciiWCtw3wVzu0yl6gpruVr9IWz7IqdN0hgbq7FZHHYOdQxLxcD1CjAflz6P13OU9nBYgJ6/cu2j69fBfNPDYWIOPX8xEyNxSTkUjj21q+08oL+1+wKoHyt6myx8GEVzgUsXxx0bd3TPxH+8u3UDsjSATlE8BoNz2LaJyf8OrbvBjQqDEJMK0O8IC79pU5QIB/bWvlMbV25cv/63K//+t/ba3pkzfrMZ+y35sU0MO9Pz6O6+R+s9th0CNDz0y0OPUVT/l3ILg+6r6Qc/TdNh3AH9bOeIdd+4YOP6jQQdlTJQT8RUmrgdm6HmJCAO2bwjet6cGb2VlafBHL8VzEnPU0NCkoLdUHPy5w65Anp+DsxJz50PJE6txKrFQU1dVWPRxFTcJD1/h8Xt8Odk2/HuimPMBwYc0PPhLL/lk8pzDS9Cz3nqbiFRb2u4Fb9h61u7ma7nIFm8KxFJJIrm5u7f+w5R3/ouBfFb4dkBHR0zYiV2smEWeKq7jOpKklCVIj4ZCdmoE6lSNDbDwvc9goFcAOpn2xHHz5wxEzqVRtD5FzF/2gHmDIhX1XnPjkNbdymgj2BnAqS+ms6gj6nmsKyPr30v7Tw9xGJ3L3X2/Yn6uttGTKrYAeS8QMs375g5e/6M8f2EHMQZc3TTntdNx/hu2HbrDURxVqSibxbUT6puzABzqz3WmStDJ7zbHGFzaNxV7opbkyfgsLaf5eEKAB3+fH7cfrLt1wfcYH47y3ip+sPcjBfFnKjbhSqkloj61q3AvocObumMOsWccEYH048dJ+qHSdc3sBg+RkrRnBgzBFWZqTUNLrN/RiyoJ8cjIbv2RHIUDDx0va/z0QJQ/+1KUC8F9nlM3dlqTfhODIOu7Hg04s7H+HR2aKtsH9V0H+Y+mj6ahiV5VtPJunfCum/8LYNOT7x4Xd95OzERm3tYfQDQ0zZHz5k7d15vf/vZs2AOA0TMKyufnteGQNxVLlJ0p1XIgXlLPWw79jBarRmu4iSzzI7M6k2TOEJZMXBr14Q97+wdPx/nc3RLhpPmLAbzibDtAwOFYB4o8Lv0ce5z9+e+MXyeMioqYZOHOoqrx4n6DFCHX19IJ7fo9HGg/t7Wd6HpKLQinJNi6H+oUCmeNh0W3lLTYM81xMaG4thGfn31B6ulIi91/JCh63//21+BfXDGnHlwofz6uzVNK/qh5xCeN0/b43vh1PuvjEAfU0z/VOjE3Le6StYdB7ZTGwGd9JyA04unvqwtMXHxQWbf1+CvM2Px4lW433r27N9XjjBvZ8wXga4Tmn4XO/dkygieuX/SoiRXdqwzOzY226yNjVWabQ73zYojgXdeRsJ9FTKbBYjhyKEjETd+Itn2AUthFzGv/jj3xS5cRjTnUKkSVJa2hi3xBN0Tzc2cM5eF8ND12TNQcts98T0c16Ho1EOFGxEqWsfGtvnkWfIasmHhQyQcTvs7o6J2nl9Nfn1tayuor99Iuv53XCwrpYhu3rxoNlo9rWnF444hMPZRc2+8deo+ii7PaPonQ4fB94XuUfW/lJ5mxRam3/wfwr5g0Ryw3w40bt+fTq48bj6GzQ8S8tPILI0wRwyXOR16TslX612nFWM60O5cX199zh+FNXt2hssem+sKoUO6XsOZi10Dk78O5uNX0WBxUnRKvq7aP/7aK1D065aEmtsCY8ClF86cURfHqDDd92bqBkB/C9U20vWZcyiaCzMmpsydfTD9EBVaDyOGJ1VPiI9hIbxKjPH/YqnDUlWWbQZ1oWL1zvjVa6OWfbA2SgTsm1pbH21kuu5R9ou9g3NmzwH2dDDvHurE+wE/YC8NBp3HzoounqV6Xuj/jaZDvMwhdGCjYst63qN7LTwEHwh7PhZGrNqfjqIIJv8DeXs7LDtFcHSgWHn2bD/0PBh7Ca1VVpj2u2iDEorhz88Rc/hzfWy5PtYgMZhxZdHgxpoef3fzZBx7967CHFLs2+Rt+yrY9omMeeGt2xgiSsxf/ArOL/7cxiE3Z2noSo0n6rDwTNdXLUUsAuq75s6OJurX3tu6bN26DXDt8Qm0fxN1VXTNg74jtarMbvaPRZKGZO3aEyeipLjMCup9QysXAC2wM+ql/b3RsxfP3rFjxiCYb6R07QIfYdQpRQ777lm15dMhNxb6jH/V9F/65t4BndJxLHb/7YiqAzeDTm0woJ6VNXfV4qXQ8sdMzcGcIV9PzIcmnrfEwrY7oOY4rLnKtWIp2fYAxtxeDNueIa9yGKwSSYTGVsHZrwdN3rMPgXsKuukFYbhaYUxZHEfnc8Y8/lZbs99yJHQ+A8xRfSELr8B0uB7U08bE8LPRUEGpuUBQ33voAGVk+V6aBHTNxYhiiDpN/JfmZdaAukESSt8mQbE66siJKBGwr81v7XsEstB13sT/vhQNCXHzZ8+LrhzqPP33v+Pt8Cx0fPQm5bzW/Vn7TtCfDeQgxBwvivw9BzZ4mBHoUGNAh/DUL+RPTczCAiUgL2VaPpb5o4kfZAoxBtJGzF1gbpaI8wpaWgKuYrVeSHFxUp09QyuXmO0hynNVNpNp4PpkFFPH7Z0HxxhmpCDO688piLOYbrUFFSyv/oww/9znEc3FK9Yq8m53UZJ9q1fXo+NQc8NfHdPT5yNLc/zl9z46DOhIzuEqBBdD0+Ch66EYNmbJyytzaA2SEDGXgIuJCuj6Wvj7tatbQZ1iYeJO2Nux+fpi04xo3G9o/9vfV4I5uPtQZ9C99t3L3DeQe1bTfZIzDDprr/szS8fx0CH0aQQ5yv5XKjEa+houR0LLgRzMkYTj/fnfWU7GIly0KCnbZbVaXRC5ELtV60uqGw2Y747mf2durNmgcZg1tmy52GR2X8f5HI0ys2EgybgDfMr2uP0TeebmwvNtzQXY8fIZYc5Gz9QoIFgWeYKnTlka5CPRSEPRHKKR+XPS9x19ec8rKLRS19yyQvRPRXC0zkuK/S3i1DzLzTytf2wwqCtUZOGPrGXR3An49UegTnDJs2M6zF+g7U21mDOxEtCZ+IZzfPzeD/vuE8iNgf4LH033depjobfzjVK/HXXpoA5ZwDMvpfGzr9BNeBh2ZtlJvHr+8LwueBGdz4EcDycKSzUF9QElLpzPJeX+GcjDSbQ2icYQqwlx1F2/dTPwlT37jh2cnQLrSMjhz7dPoLMaAvdbhTjjBBrDJxVnZHzzM7NH/Us/qVED1onbQaB+eDdRP3QMc69ZRnbWQiSvFs/bj6aKA69sPbz1rX+Sd/ZRTe91HC87SAp47Kqnaw+n/uiczunUqX+QMWoPFs2tbffmFtlsurYL5paDNMZFim2NyYKx470DtJQrgkxBmCkTBRbgAIGLolzkKAUigoaBXajbvZVZvT/f3wYsrVudOqn9pCd7OvXy/Xn+fj5lRpM/C58I3ReJls74iDwB34xLEyNGDK+Uw/grA60ow4twuRVaf0AkmWNnNn7v/vITJ8qb9/40DJ1JMOrj6jO95Ut9+mOi963huffItwidc+ltE6wys/BfANqRj2JzdPOHe7fi5Tsnc67hTsxJ5xzzJGsVgBN1vZ7f07D8ctOviilXy8i4qhcaror1tuKzVaWa+ozpmSPPoyZzMpf8OcXt1NFZFc/pfNbvmLrS1LAMg9LFn3hCdL6odVPg4VovqFcAO7ROVRrclV6GYcIfIl8/1l5ztO75isYKaq8b0/0mLUpzCPx5AtzMDnh7ZgzZMeLtemyhwvBs/qAnP02EtH3dInVg56jvLjjxk+Hm8dOc1pfA5v6GpD4B+15OzN8VOhXkHg+dWfcwdEAF9Qh2mukaxhLa4aGh3ghzgs4aAafbUIcLWuioWpi5s6pYKK1vuH4ltgrM9ReKizv02Tg6qCk2VBWLdU7LNOVqLedrt/wQs+0NVHxFDAfmiOFQiDP7wRw1mV+B+ROjc07rbmbhH973UjR3tAJaB/WTW47sQuZG+SajXplAWjfio8ocOXZQF4kSRdqAZeq2IVsNvw7qeOGcP2VCB0aU/9q6G78DdUIZpj6+d//un5woaN7bT9Dxs0TpkXYba7owpeOLhk6Il0Jfwjx6XqqZWXf6ryVnvogc38skdIyzl2cuMqcGC1UIXwbzPwRdQuRq9WBO1KtwzMSH/HzZVTAXXiiOuVCcIS4Va9R91XxZtjVjdu399Udr4qh/vqmhARV3NhwF5syf+/09V5YT85gnSudsWvKzOqLeeo3TOmfhC9FzQ0UWjn35D18CdVj4gXkj2i+YkaX+uhTvV4k6rjepfJapKQssfBJPggFZaDxoTMNSwfzX/nLjFw/aSOthx94/zgx8b/OPTz/OrdOHpI3id2L+rkoH9Og6bGTscpwNSqE6RNRLlmD/JkFvLueETg4dnXNO6BTEkT+fciJXk/b0WPEBO0JUX+rlJuRqwu366mKMRwkxKqaxqXkaNW4zvXV//frKlpVk2xGz0+MV+PPc+HAM5/APwrZvunghBjp/Qi55LNG6A9DNAaLuKeOoH3u1cGOkDo8qDavIgjpJvcjPyvBaEX4JBKBu9zlGbmsomlMAuhInZoOv5dP6uBt/iVj4SDjHDPxQ897TEQMfDZ0KstRUH2Yu/THQo5Uebd4X4vf9Y6wyQwlCuOES/mBv2trGd29eEHoJpiU45Ij6TvfDtjuLt5POwZt0rktKdDVcb7p5GQPu4io9mOuzrSqZi2dzGaoUktmZkVVHwZzNvTZgyxg9mcsNx+31DnsQzEnnT5ht57T+gc86lMAO6h6jh2m97syxwsNfhdHC/xq6hfHC1niMw3ffa7xnRAQP6DRVgaKcyIzhYJFjtnW6x2DIxoyJGepX5puC+bRA6PvHF6kTdkYdUh8mqYP6o9hZtvynzs7yqCz90eIMddke03E5RQYCLv1P1Er/RuQ/n7QO4jS1yQn9exA6l54Tb862lzDmPmLu5OL26ipVUrKr4UpT06WzOZiT0R/qK9b3yQBcWG8zKKTmt95aA+bnT+ayKYRYOEMK4sLMfX7/4P3lqWD+JOqcs/B2QM8KXLvvMXo56u2vUmGaWfiGPUfg1+NqWuoGkLiR2qnnhsxNqsQwDdLyRIsvNOLTHMIqZCWoa+Vp9lYEc8lpeZ5RUKeUaMGxjw9D6uN7fxqhHh3Ak+6oqU7Qo2szj4f+iE/HD7l0PILlrDvHnH0MOjz6tyB0GHfGPAydOsHE3KVAk8UAf+4k7BniZDfC9qaruLUI5gaEcdUamU2sU+mkghDepY6sh8635qKSxRw69Vi2rAr7c4d9cGRFw5PLnLTOqKePXkM054WFr0C+XvgqhkCO7CHLtQuPu3eg+4LEDf11KshmMeio3YM60nX/YOh2yKbRSZOZW8/PD9BbZqTrjaT1MHR8gN5cfiKTpH76Ualzww40Cd37WKXj+8dK/x6DPo5W+oLQF7Ez6z6+/3t4yTB0p5OCOM6y/4LZdsxMTNUroHNZFyH/DR4mCJItTU2Xl12wws3bimP6qNyuw6Y4sTNbN6OzTI+swf9L8OfIzylZWwbmVG/nYjiHb2TFNtTbn1jmRH0KR3PzTKPXHno9XiwiobE5aH0jLDyZLWidqNehSGNEqzWdddclyNsQxUuSYeYdPa2gbstISoKFB3Z5jwnMk9Ne+xvqkNp+SL1zqdSjlY74naB/7R+Z90WfHt1cJerI0h9wY7DfDAdyYeSAjic4u2Hcy4eGx/sjzFmyxtl2GXQu66qygrnVqklJdF9vuLqp7/f67fwYdQxmJwxXZUkSsasaQZzUMj195F7LysMsP9+1HAY+9ZWdW8D87jTl59D5tWXUY3lymRP1HmjdZBpdAQsPrYM6K9K8sIW0jnx9Beu54ZlbGWJ4FsKbzBKtFEmaSE7ldk9wdNBiM+CaPKaKtPjNKdJ6mui1dX+5cWOROqVM5UMnysfh1fERFvxahM7F752Uqb8r9MVEHcTxw32UpSNhK/lm2I4QdRBnQu8noe/mhB6x7fiYbf+DT40ei6KrHsa9+vdW3Ca0XG/qiL0E5jk4nH0pA95LqupxOxVCFGFxEfvI3bqVh3e8SF2K5ST2bfDnSNbIn9uJecPPf/7mE6zzMHU5Pmh9kXr7AWh9C0rKmO3ELO9Xtp5H92V1WRHNw3s9iOWU2mQpCCvh10Xe4GjAYsM4fLLcjN9Lsw/CrYtQhh9NAPU2BOYMOzcePdT57f4l1KM+Zt/L/4b51x4PnUO+NGUr3918i8pxjDendAKOHxbFkdDvIIpbwhz/0gdM5xiOKqb83FkNnQsSLdevYOvA74uh/mqhMwajYWKDwOUWaLKtIfNbI2vuHq2pfYEakmxShoada58H8yB0zjF/om07971vKfXuRepfRVGZZW5H0Ic8f6Yl4W6ZsbGbJmTZUIVUSk+ZQRcP3QdDBptBhjK8RII/CZ7BNHwiTNSsQ6d1Itw/J+q9JzJ70cKOGPjoaI6a6lSJjXq9SGjftSLHoO/uHb+FhI3+AyNS/wZUD+xM6OUk9N7OcOD+C674CuZ/mJKRP8fIK4vcNSnJOD63/GrsWfjzYiffVooqjU1dD+ozBpvEMjK35m7luUIMnFCPpYEltrmriPk8mBsH/3wNtdcnnzmofxrnHeR5sPAsmsPLRqJ+onDjS+GpiiMHiXpdwgBaM43pRUjeoHEtPhBPxniFd342ZDAYVHy+SqKFX3cMQupUpBkgv04pcZg6kzqabRHqXL10Sf2dVWKjlQ6yj5t7j2b+NYKOigvKcUQbH8PNrDsJneXoBWTcw8zxYUgfOu+RYVm7uKrLacXnNPCS3GuvNPTFwrZjKkpo6xPLXGKDLcXlVmtUUstI8ODzR1uObd25C0vnljds+vKmPTu/Qv48OD3d4zeOUl+N2fYPPuHMSev1CoTwpiDTOoXw8OsHTmQiX4cRQ+EBkwGHz7egv15WRINzWUjY5RJIHVqHhdeKvFODIYdNI5MmqRQUzXkGRcjbRPn77lIdvo1Rh72lZdok9dOPjeAJ+ju/Jvv+D5T++OidvnKqwf4iYt05A0+/mNBxiGn41IJx51a6l5Btn1Jj2lGMgrvTScyFyYa1V1Krmi4IhXp+qb70gt6wQaGW2urVOhXPfCU0vYaYn9xCYsB9GBj3H+aeRCEuSDMT9tGRh6lPdtwerfV6iTw/D9RHPB5vEdP6qVMnUKWB62Lj8GivQ+sDGJHtLks3esjEQ+f0I8AsTVogOBvwGw5l8JNUFM1pHS7YdyWo/4GolzDq0B7bXtCMHd2LdbkIdvwNeFCnLfptOv16d6VTHNeJLB3WPUKdgOOvOaHvp6p7eed4WzhXizAfVONeNjZNcDq38ZPdM1c29V1+E3uj+E5irhamuPpwe1iq6bL432LMC7d+BUUZQIceMOxcGx93lybcXfbB2w+3Udyu/8yTr/Ow1lGay7MHr902eok6a7S+mrmDMrcvpzLqhSth4e9C6mVAbvJQe12kpHEaEcTeHZwN+c+ezUjiYTsdojm3m7x6GrSeAL9O1CkbnyCp3yHoC9Q55uFJF3TaJofLo306fh7zlu3R2vv+sYkHkdg9TB0fgz6+t7wcQsfcBDPuTOcvM51TrqavZjqvdpYmSf23r2y6+ualHEA3yLIviDFEo9FhybvLokYdbnrFXEUL4goaNIllDfQjTOfzELpLHZha2xBLDyI+8zTonNO6Tw7s9sEVwSXUD2R+NffINlixXSg5bSzEQ2ZYeIzIGv3s5YsyTcrjJbNiPKOuM5TKkuAolPR2vRU1eLLwz5PWJxA34ZvAGePMzOF+QAf16NY663Teokrso/U4on5gKPoBI37C0TuwU8JGs88/4sx6yQJzhO7hPjr2S/wUzEEcQgdzpnM00HOqL5QynTvFfM3U2tSOP17S84UZOIvcJ9bUCxJVYpfGpVKb3bPTR9BkOYYEfRc1Uyna2fmVk/Dn6KVOh+ytU2tj4c8P6T/1dOic07pPqTTjSevDVqJeVkRjcxgVfuGlI7tYCE9jc1gySFr3okSDvTS0bS6ZrjYqofX8wGDQrdPYxFSGJ+qtoI7YPq8C1G+FqZPU72QOIX7HtxjAE/USrv5OTr2cYYxmDqlHQ19UOqPODc1w1p3Sc3xcEMd59HLM7oyPt30DzBl12PbJPwRV6KXS0ARjjj+vupkrqR0Xbuo3CLP52TF9YpfALHXZxPVJYkFoNjS/Zq7iXPzJHTsxb9BAJQw8+CTmbB7O3jp4peEiYricmKdF59zNXZ8dYjdNPRx0gDpXpTlwIHNj7k42LPkKZ+GpDu+lnhu8OtXmpJiL1gJumtY7OBjw6wy4WMJKc2mOViV+G7OSq/9ynKgDO6iPDyOW618w8NEzc5xTL18Q+rspfUntHeU4uPQI7TBzrtPy7d0FWGGGRgvpnNl27JNBTUbBT9qAh6lY5VtvLbUp+I6uyw0XLv1Rvz1JKLPZqsVqXCKt1/E0mh6fzoFcbeDoudqT9OqPhiawlRA1mZXEHG8aHGC+/OcXf1Wsj3l6dB6O5lCbA/UVQY+3FSOwmJYE9Ve/yA3+7cIjCCwZxDu3u2Xd94oQwPu1WRK0XZQpyQIl+Cr9wdlZv86WsUFgN+fL07BmDwvnlPDrf+EyNwa9jUrwzaC+kKxHlE6V8p+Rfd/NiD9W6dENl4hTh9Sp2TLBXPpiJEfMWdUdQi/vxbHtBebI1eZ8EpxqUPXVl8KfO20GqVQ1tbyp9DlrTg6Mu8HqxEICXZcsRVc/I5VkTU8Hd66rrDnJBuK4AXdcdcXu+tVB1GQcDvLny27+/qljzm4tm0HdfnvFFCy8EUtpjkLrP8jcugWZG439oUoD6njx1NjYWGQsykrH3Jw8OZmHC+xampkxBUdn/RpnRpKIhuGxqAJnmGHiya8fX6DePFzw9Tv9pzmpc5CW9F3YJAWg4+dxPj0aOnx6GPr3ejtZwhYVx8Gfk3XfS0IfQooese14sPaXP89KkKuhx0LMrYZSqdR8e22T8zlaFibM1lQ7AV7I22DQOHFDUTI7d2/NQOXKrdRMTU1l9fZtuOQbB+bzYebLMQ+nB/P3vecp+/CkFem63DiCaM7TakwvYhZ+KHPrV0CdvbrOxWpJUL9bUTZaZsqil8xyOQ4z46ybHL01HAwIBlQGl3iD0p6XLxcJlIF8QMfi4Q9RbY6z8P37ezMzMUxBUl8coymhhiglbW1k3wllNHV02RahP0p9d+/YA3TYSpZAx99lzBeEji0n7PjWRH/nufWjZv72DbIuK6dzp1BqnplZ7mr6FeJ2mUbToROq63nCeoNaJVQI/GtnBw4OVKx8m3S+4M+xLmwlG3z1+wNTV7bFXvyV/unTeVjrcqU5z/jnI0GPh1l4VpuD1sM9t51YVYFXEEdXdzd6aZsoIjqzVsqn7ouSqHuCgwGzwZmRmEYxvAAWPi8ZNj698UOTN7DtmZZ8watTLPfy6aXQQQvQQZ3Z9/LHmnekbI/00yPUy3s5644vivnp01zoPjTW/+AXgE7Mx8B8Pku6IQk9ltJSp7W0tFScrJi6vauqyaqHzjM0V2VYAMzTOBNxha++q8MfmDuYUFFTS3/2UwE9ldVe4+PiaAjyLYejderKcorhnkadM+of6aFgzvjnFYNh6sjcCk68uiO8gmrFwS0vMK0PVDSOotGKpptUS3NzaK5L4L+1xuCgWwWbmKiV44Nf9+ajJ6NNX/fRSebX6aRl7/DQ15vbEL8vUTp+Md+OSuyfJsvDxp1+/rFPjwTv5c30nIk9X4owh0Mn6ON7d5cPY+knEzqn8zPr5/xS/gZJV0+otBTMbeIkVWBkW1+HFXOvQtkhpGrVKRsUWKBr7TMY+Ja5uYP3KmoOb80Fc9oiRHU46Pz51WA+q3EEgldg2988lBPzyaeSOWndJQF1svBEPb2CqP/gB4dpmyiFrPT05fCvycJjlsZUhggePzRBhR67Er9EXlh4s6ZUxpeqlIAuknuVqMim7Vv3YVB/h1Efx6TaELK2CHaGm0veIvE7Ix7t0wsWlR69J5QpHS6ds+4R6CXMpf8U1h3p2lB/f8nPOOZtnWdq13u1fL64q8flQoZuM4j5OndH6oz16vYcvVhsuyDO0CSpVJIUQ5dCqPK75+bXDFScq926BQV3BHHLvoPHS7lxTOfTCFxd0Dnl50+rzjnqDokc1O9fG/V4AqDO+usnDm95cQW3eGwnVWnodWNFd7cJxP3+rHQU5wQCtmgwTRsMBkMSVGm2p9iVcvRlsHYM1PNB/RxRv3XrZxPNlLa1QYZReRvDXsLG3yF1jujjoUc31Ak6XPqSctzLjPpSobMo7neI4SY624k54pCqeqcTzM/aBFK1pSO1r+o57AoD8+riDJdYwVN3qHCU1IcTtEHGfCM11sKB+56Dq+PjarhZZ3fPSANjXvw0+vNF6hYaljTePzJahhgeCXvLmVM/QMH54Cvk1yO1OaZ1ownNdS0xx4d0PY2itsH5oFeiccZsF5kAXUAWPo0KsgkfZrW5iV/eGus9hW4bGXguhF9i41Ezw/NVgv6Fpcw/z6A/bv0Is+/k0m+x2L0kwvxlBv2nFMYV3BkjoWM4egIO/e34Rprl7ap3kkM3GBTJfv/t1A7rzQz01YS2arVQoVHghFmyRFPvC4WCc2CeUPtV0vm2VPLn2AT5fHz8XdocpXG4B68Q87M5n3p6dc6ofw7UlXbPn0Hd02oqoqcvNEuzBRaee8jx1Y2H26lKY/SO0viUPx0ro/kCaroR96zRYNCrgIVPFJmVZokyLc+YjwnZtKKEj6I2N0kbGZt775wY7ocQF7W+kLL/jJK28i+8m3nnlL5o3bnKzILUOeanf9yMMG7oTxNtZNx/OTHRScyztCk82HYnIvezBnGiWUXMLxYjhoNtz0hSu3g6XqLGNeOSSEwj82vuFiUghqMuM/rnFM0ejI9ngzKzGp17cGTXd6DznKda5+FxeArDPPdXBFClYRa+/cAPDtBDZmbhV2DLKml93UC3sSzdQzG8lk1LUvsljaNukRhssmSBSslTiDAbmwbq2vQB+PVbDwAdUh8a6g8b+Ah1xgxenex7QbTQ8UUrHb+WMi+Psu4kdVCn0J2EXo4cHisqsaV8srM9vhbMcUS0ywfouIEt5Kl0t1NnLlzM0G/PENqqxHqrWqYTyuqdAp7UbTHe+/Bd6HwH9z+d7iqCeW0cmizEHIuAb6cuY8yfbp2HqachmvM8XDHqBXXSOqOOAaoIdVh46rQWdd+jDYMexHO4u6zlLLwoKwitaw0uFU7Jm5US+HW2dky77+7bk8d/+RdQ77xz6kQzoC9SJy/MQb9F9j3aoz+apy+ljoRtjMXu31zylTCPPk4evRMuBTq/NdZ5BszT8cdTA+Y+Z6nBIJQqNF2b+i7ExmzfnpFT6szIzhAnJbrrVfwUm5svmQ7OPU/Mc39I7/Zjkb+Qzhnz+R6Lyl3f0fCsMAf1zzmQZud5Hl6D1rmeWzvW7EHroM4yN6yl4WZpGo3G7nStP+zXJQjnkLll0bCkxFaasSHFbKYZKrmd/jCgIPv25I3XQR0GvGBorI2VaECdY8754xLYd0Anh82w/qNALgJ9fGzRur/M/YA5jV2Hhf67GzeIeWFtZRaGtzVv+Xwhp82mkQrMmq6GjgsXs2Hbcw6VZmc4k2zOammSTNVn0Ljemr2/Hsxrt5Btj23YRsxfXA/mdzEpY1FjzVDTpotv4s7qs8Cc1sOrqNPqfXit1cuos4Js+METbNyRXCySwTh8QndR0EjZOtK2LECnfXNpoJ4XHA36JTabOkmEu42068SRRrOS+/7y0XM33ngw+frY0KnMXkAPa504hesqLH4f/laEd4R5FPToEejy3rbo2J3+wjw6rDva6GMTWBj5Bmw7mBdhCMDRNRsKYVGQhieVOLqWX6r+eTZmJpJkzkNO2YZEXpLY4OpySaX+6dn7H66oi6+lP+qb0Etl63PBnDprQQdOl0V0/rFngXn4wZNSaWLUW8tAvY7S9VeZ1kF9187cF2gF1euYpSljTyDCw5JSnIPANklR1sBA0CIrLVUlSs1muvYF6uiu5++rqT13/Je4vTpccGCIKjSsCM++CDHE71SUWwod3+OGKGAM6MBLeTMXuy9Fjg8e/duI4u6MTWBL6C8n28H8aHqWVACYkLnzkEGYovZ3Lb/8m9hDxeixZlyIsSk21Ks0GrHTsEHqCAUCYF4Zd3IVmbcGsu2p0PlKMJ8PDlocLl9HLJerYbHzs/G99wOfQ+itBfWHrbDw4TI8qGN5cCqk/gqW655EMPc6grl7ZelYSmOk5cFEPRlvG1GDmx+dtyhsLhVfQF0c3Pvy5DPqq98+BwSvn4FXLx8HGnyL1EGL4vfmsfLNwPqo0qNbq7jTRRf5oqBz3BlzugFVkDk5dgtB3GT7mWMn64qykJRPz7pdIefZQxjUd/c0dVTHns0RbhcessY4hbwUl8bdg2sOPql7pHvuw42VNWD+Cphz+fnO+HjSOWPuAnPY9pz/+bKw/yx1DD7l53nDT1846lhGRA6OW2H/AqijINtd1u01ti6k6xIkwajJSLOC9+Y9WW6nekOyHP9JSi2oI2Fn1I+/MTmJc8wUy71MWl+idHLqbXjpsvkL7w6du+nzrfKxtncwFxEmXsIxZ7E7hD48NvnLG8S88HACmAvUXSFm27P5UpSLGzqqL57dnsPnq0uzrTiLWi9TJZolHWqJY7poblVFRU18LphvA3NqoEPn2P6Jpyxuh9vdEbuJbPuzo/MFrWNaMvDwIdy6Kaz1V4k6e9aBnsOOw4x6o3HUY+JWB2Oogt64IYaXa0F9zmu2odOaYpZnSWDjPWn5+CpW17aAevvQqRN3xtuWSD0CnQ1NFURLffNjy7C4yEcuHcvKKHbnAgOy7Rx07KyEcR+7xZgfI+ZakbrP6Q6V2mw63DhWOWM7rM+V8ovBvDq7S4gtvzJxl2ZGJZH43ppdvwbMa1e9yOk8tQExXC1jPhAMOdyBmW3LLj5zzNlQhZKeuQWuPUS6bjIVcWV4UKdm0yaaCtx4OFya85iMHvLr6LrAtCNxEySnwa8TdcTwiQK5iYZkszw4CZCXX7S69txrx9txJidzeAzR+6JbBzCifuudXtj3L/wj6NxvMujUbPkl11Ul6GHmbbSMuhxR3NiN48S8to6Yq7p8IXTViLnZ7Gu6ZI09lKOHP6+SXRALZRjwc6NNLNE6vIG5NWUVK2trX3ollRZHQeaUn5NtB3O1wT2zfBsx1z9jzEnrPnqICurQesDEmi8YmyPquyiswd7bLxaSX0d7PUgu3ZRulwtE9JBZxFMiL8+aHwB1Fyy80q40U+bWShY+qyIOMfzr54fO/wDFWIK+GMzRT8ktsu+LSt/8CHT8hYTOoG9m5bifcUOQJRHobXDpzb2ZdyY7bx2fPA9/nlCEApJ9yhcCdIOBp5D4fdevVv/8LJgLY6wx1VinoVGouxQqiU53O1A29+HuorvxJ3OPcP4czF+shT9fibg95NfY+hqYP9c/Q/58UesudlzZd+02LLwxfR/bSgOtc+11DPp/lVF/425l2b2iIq82y06lOUadormsrPlRpvXiDSKHHMfXBSZjfj7eMVc8/9GE42fuHDh/4g7eODHoDHvYHZN9Hy7/UqTsTsz/Vumbud+khA3NlolIGAelh4WOMI4Z98k3Xl9JOqek0jwVCAG64ZCeJ/EHrl+uvlhKzGVWg1XP49ksKr7D3NVhk3rvz61vRPE1F4OvuyB06jOBeS06awPzIYfOVh1Ltl2f8wwyJ63X24l668MpTys1X7gYvhBraXaRyYPWueZLQqMRjyBMdHWdYQf0ZBqbywqMzqHTastITFapFAqFNt2Yh2AuDxFSzRtn6CZWb1sboC9ixwepN7P4/e8rnfvnwtC5QSlWlClZAn24YKhzcuyNN860F8YdLUIhzjIdwmczZIuFCkdPU1/XTXDbXiyzHjJkZGhkaovF7HNIpLqewNyHK4rurtoB5niYyi2II52vHpgf9foNtqqm7zz3q5gc/ZOyFPA/rfWP3DYz6stHPIHWsvTw2Bw7AILuMoqSYb++rpsWiprSkeZpzaxKA+RUkQ0E54JmjVPNT8SFJwXeN3pNafmo0tTVnqlELIcHL/2w7/QtgT4B+479X0zorMW2NHr/LnQOpX+eQSfrPvbgF7dKKDlf6tJRjAPzd269UdN+eGVlOlKL0HTIEnK5NGqpRKbrWl7dcb0YA+7F+o6MYo1wg8EgURlUcPWzgeD9+aKKuFo89EDRmWOeC+RorAVHvWaLqyp22c3fFOc8MYsg/+Pfez/Sw6gPrhgxBvBKmai307DkCwdZz20PxuHxzI1ieLx4MnmMND4lJa1jJh4WPg3dl/kpicGazRcodRIFHLvHmJ+GaC6u9kzdnaHzmTDwHPVIGH8agp2g+szmBaUD8lLooA6ph6FT3T0i9MgwJJL0MRj3SYTuZ9qPrayk/RmhqZDbZSs1qAS4H1/f0HX1Jg4pooF+NUaYne1UaHialKo+H/Y2B+fmK5BhvHAQi3fAnE2OxNceO4awfdDjt9jA/FnW+cIAFbovt6+RhfcXgTobh//iDmzBxUFRVGlY86WSqGOEViuB0CVaPivRiKj2em9gLiA5ZM1Gvu6gkmy+57X87+fnVcYfbjmTiViOM/ALJp6Rn2hG/F4QYU7Yo6Ez5kAPoTePvYPzMQSdfsLM2/qxUqh98tevj50/FldJE/qBnpDbbcOYjIwn0Vmud/XdLNbr0Uzty9CXFm9X87uSMeMu4U8Hy9bMF1VC5wdfiTDfkwuZH1s5AJ07LO6qpmV0kE//hC2I+y9oHdvCiHoA0VyE+kZEtptYbe6FrYdXnmPUya9jFl4h0EqkfNTmMBQJv949MGeRnK3W8BOhdZWcqKcp8/OO1r7dcv7E+a8jWW+jFbKL1GHg+/8Epw7WEe6APrQAHR9+h0Vy5bDu70DoJVw7NRy5t+H51Ineyc7JyfbCQjBP1wam3G6y7TJxkkzmaOrouBlTjJpMRrVGnK1GKKeyqFw6iXnQ370etv35uB0vHYH3akpF4A5/Hlcbt5LqymDe1bSJ5WpPzsLX/8YHrQ9C6vn2kWuDoE5+vY7d8Nv4FWzOY8YPZ2o46o2N7O26lj5pMso0oA6/fm9+BD23qmw+H6kb1lXktdqJet3bx1qOFd7hpL5InUGfoPh9M8f7MdA3f4n7AwHoY+9MIEln0MMqf7mNll4MnensbDlfWEgxXFZY5zoeLwWXzK/3Xb6JZfU5wuxSgzBbnaERdyXyLG6B+S1/99z6oorVq1cdpEuK9EgRiWn8scK41WDucVgMXU0NF3+LmP/jT9PjpX8vmutBxy1fTtRbaaiCUS/8+ldzI9Rf2hEP6kextIA2VZi0ZrOWaV0gSqT36+nBOaJ+QZNEFl4JC99qwsqC9LraYy2vnjoxhGoso/7jReo/QvxewKI17q8i0L/IoBN2MCfovQjWcBwsMiyDj5iPU1kGzNFjqcDgZutgKOS2GXRihUChsF2+2tQRA5kLD9msQpmaL9ZsVyda3Co/ovu5uQroHHU4NFlil7FrW/GFhbDtxFwD5suwXE6f8/EPvudZ/97/EbcW7VJofdTbSvk6d7lxK/wea69jbI6oH60YoGVExjwEAdRxA3UeTrDTBPTc3Igf1A8lbZDg+roE6UBeft5rRXUnz7QPHcgsp2os1gZ/e4E67DsV5VCDoZANLnwJdBBHzoaPQe+ES6db3oSddE7M2xDFlY/9erL9WGFdERy6d9DtdhuQqolTBGbXlasXq6w4uya0HarOUeB1Iub0q7okErXPJ187V1G5Oq4WqQk9ZCHb/iKOf8TFJYC5xWCoRgz327PFOdlP+3DUPzkiCwNPFj4AC2+KUN9I1NndEuwiAvUEUG/szjMZlcjcJApQB/NECfx6+jzTep8maYPcYcIChPQAqKcX1RXiP4ekDlxYDB/ROoVyvZ3DBYuKpkBuETq+CPQxJGxczM566Bx0Stc6x87AtlcQ86DbbQFzGZjbXTMd13/z22I8VzVkVwtRhOOrrVK+AOMU8ABrR9IrV8fHv8TmZFK30anp2sOF8bDt9zwOYr7p4qXSnJynZOnAf2CAil6imu5fC3gDHjtHnYK5g8hluY3RJ+Nq4Nf/UNbammeyaylbB3E+muuJSrh149z8fYfEMKNBfOdQKWm1JNL19KKEwpZTd9B4AXWS+kI01zbR3NxZDkEzuhD8otIjd7mBPGLdI3adcnxA7xyG0NtbamsZc/uU20I6R9FN7nCD+e+fo23etmyr0JC9Hc+XZBp3vcBiCTmu3C9C1SieDbjDtJNtX1VbWAjbTnG7zYq4nZhnPBODMv/UNTc72/m79mErad3ERmQLw9SRrnPUa+oqR43e1nST3K6kOxAI5lJw6gc3AbLKQB0Vry4culPo7AgRvB5WpDl37Ex7ZmZzG3SK/bF7gT1Mnex7ARn4x0H/Eqd0JGyAfotBL2HYSef9eEzR3t4SX4sYDtAHLRaDhpgLVRb37Y6b1ueK9UnF2dlVQoWhVCGE/A06M2aZZwP3i4ruYpv3zl27Uhuw5Jdse20hMpN7eAJgcTuvo/YKf/4UP2r417VuTwN10/0VrcjXTfsq3kD3hbTOLDwarbjSuhL3P0Cd0nWTEgk7H8Yd+TpVZJOzvPODax0S34whKVGlk5vy0kY9WBaeV1nT3nIeb9vasEoUhz8YdeLeRkW5zV+CQ38c9CUu/cEvJyI6h9JpmT8V3c+cOX8yoaIIA9qzFgt2G6p5whSFzn29r8l6M4aflJRhuIDHqUI+r1pY3Sfs8zlmZx3Xiopq4mppE+S25Th8v23PS7W1h3Hd4i5iOIfbdvk70DlmZp/Wx0v/ntYdaXJQH8EAVQDU90HroP4CqFMwhxNInIXHvuhurynLbpbAwgvQXwd0PHFRZnnngmssoK5JSjQ77PK8/FFPPivDt9S9ij0FdN7px3v3w69z1Et6x2HfAZ2VYaIDOXwRl97PrPs321gQR9DZjsJ27OU+WkRBnC+E7DpbI0vhye3uK12xZ29m5+RszzBU67ENUqgh656SxOPhhNpIAH212lzUZHYR81ToHHF73MC9e17ovJSYY7lc8f8TcwxLfpYtk7E/vIa5aIrm2Ml9JG5r2OVGWPgXTyKYq+sGdUxK2kVKM7YJJm+Q8iSJkkS02QPz82u9El+HITFZ6bCb8nH/Q5SXB+p1LZkUy0HrEamDesk4xe809/oodCTpnHUfHnsHLyK5PO00gw6PXp55vqUmnjHXgrkFtp2XxFPZHWvrY603D2HrAOqwPDq0hXWAUpdL4Habp7HCvehcHK5zgHkDMUcvNfNYYeG5gSDV4QyXv/Pcpd/n/J8xZxbezNaKrL2GdN1i3Ffx+pnhU4XYRUR7whn1LbWg3niv29jqlWc5WLIukELrIvxQGX5+fo1b4uowpIC6CVM5QVj4/PSKc5VUl6Mq6vh+os6Fc9zQFKn6b6FzLZiwdcfFc64og++bJZSuZRa2tMRVkMyzAm7oXKPWp8jsdvtaX6z1EjXWhBlVUpmLL0RFjm/RbfdZJDP+mZH0OvTPd2LJL7WNEaUgbifmAxaLWxNh/iwNxP3T1JVsNeC1aw5vyJu+7zioM60fgV/ntF5bA+rdAVOrx0Sb4e0SxPB4FZySmEwTNYPB+WshieuqIQnUKZoLekWI4SsTKo+h8dJGUt+7QL2tF/E7s+SPKh3A6etFOQ7LRMif95PQAX2Miu5HV5PMpVrI3GHA9TihDNO4131N1qu0tZ+f4VSrq5OEhnq+y6mTTpvlPbMzM+kJK+N3/HDPruXIz8F856qTYJ4AncNSGC4Rc/3/I3NGnWn92lpMiXnS973xOivNwa9zFv7Izpfia86ta8R7Vq8n3YSKrBRXG6F1XOYl6vTgaYVP4OyAX5db7Mr8dNJ63mvrjtYdxhg8tlH89NukdWAHdNh3TFIQ42jo+McU1HPW/RYn9PD0PFJ0GPejNdC5VisIQecag1ooFsOhr61vcl74Pfw5HydSNZokId+p0rl4ErfDHJoaHCnqrqmlYedd7Kjenp07wDz+3MA9L8X+l5CrQefPcmPtH1KXg7rIAuqtAc9r0DpRJ7+OUjXL3HLjziGEJwtvpCqNyCzAvU5+Mg+3IBKTtXjSOr9iVlJ6WYPFPm4HCjR/8KSJ8vatq6zbOvTrNlRZiDon9v623s7dBQzxYnFmYxg6123p7IR1Z4adPDq66XDoQ4V156ivJpUSc4cGD9N4Yrnuiq/J+WYpMTfgzFZGkgLPltQ+vkujk8zMTt8vOloTT8PODayvBn++FcxrBu4F4M8tYP4mmD+Lw1H/rNZFqLGCujHg2UfUqeUGra/ZwyLenS/uYEWaUS/8ejoyNzt2sfGTEpN5YgriMRgdnH/Fp7de1iWLoHVQv22nCdmjlee2vt0J6ojgAZ2o97ehPlMQrr5FQ+f6rQVotrT9CBVc7sN+5za6GdJyrpGYC0BLrdOgx8KTye1gXoqhNuwKzNbJqjE8odMJdDobnqabZxyzjDmKr4jbUXUIMy+sSRgIONwWy5Vlz71p1f+/6jyida1UGbh2xY5Ga1jrB774lVy65rZsF1HnEjcslDZC6lqzVsSTJqWgSsNLTAZ1+PU9Pr3zspovNXs9RN1LiVtlRQ2oT3zj5dPf7t3NTHw/s+8FrM4eDZ0xh9DJpZe0hav19N61bX/BD9oTGtkEvhurDDU6Ys5TOda64M9/T8wzNDqfMMPqFNSbZyQbfGp1l2uKmMfFH9kDneP9EsaBVuH4N5jf6/ZbwDwVfTX99mdzIO6fvtwI36wl6lSaA/UWsvCgDgvfgBetO19cFVdTV9c4WgYLb7KjkypS8BITU7BtLoWoYwPV3C63wnkVKbyJqJtuexDMlR2viNt6p22ipKT/2/t37wb1cbLvvQWbUY0h5ovQuW46WXe4dErV2HuJkh/h+TmCuLpuMOcjhtMBuU7MS+HZdVfqYduJuTDHpnOrVNjpLJVgUXm9WxHqAfPKlTh7/wpqMtu2oZcK5kjQoXMwd7tnUpvo3yp8xhvo76p1kxbRnOXhCCy4cR9pvR0tt69+BRVZNF9QpdkRX5MArZNfJwuv1NJsbIoAC+eSNoiSkbnNLe9SWDtUsPBejNHIpwIoyDYer6h5+09tPwL1vUS9GWs99/YObybo0UqnnC0i9In+NiDvB3Nsnh27c6e9BToX8LVuiw5CVwO5XO6+PXPJ+eZZiLVYaM0AdGr+hfDPO3T+24G5+bKjNSth2xG4M53jDQfVXs8NdHvgIWa2PYejTWig/9/a9r+yd6Y/jZVRGI9bEUZNVIxLjPoHaPRL29tbvW1dcm3trcu9qaaTyo0V1FY6KFKdFCudstSxVmcqrgMCIx0dKRioMFIiFYuIglCFIAlulTEq4h7jHp/zgvu+JmqvH8x8mCXzm+ec8551/a4XG18328sXfWlGHTfK+u7bcT5lZKlFFjf8Hug+uBMxPL3cKiN2tyiisq6F3i1aLaov4+8VqqelGxZcaKeKZ8LBYH4ZbXO7OnYNffT2oy/fSFd2riGto4sZSbkz14L3H5h3gk5Cf/ohyJwxx95Z6ByzyAaD36OQO5c4rl62p/Mzk00vYkbRdIllllMacEQuF5MlXL1Hh3vv6httnUMbDrmiGswRt2OfzIM7WjaVDeF0fDwQieX2ffGdeyr4m074X+t8zcKHHZhPi2kKvvEB5tfZzX1QL62mnQVEvWz44I7xJV9rayJIp13QCY9sp94owcI7Q28ghl+5BNT1Rieoh0LLy/Dru3btKvvo7VduvJnuaRH1u7B9bL4RPv0nzPsF1B332ctPP83yOIz5rY2juwdqzIgVYqqi1NXZOGM9FmoUZrpuw9X7Cv4SS86venS2SQkeXzsRtQZmImC+u3vDIffWVleXUq5h2+YHN0HnB+OtloDOu/Y97NN7kJP5zzfK/FatO9xRzbve8YH4d6gfXkoZrVqm9d2d48jIIppjI00Oh1Fr1Bu0foNB63S/AQufvKRnUDWav6EebN+169mP1qhjg8Q1kPqjTz4J6D/26ZA69T5/Buv+Eu0RB3MsnW3sG+6sFHS8BOZqnWJD6OgE80LPbR9Qo4zF0mVRklbeFI1KsismCrlYYPWZDjB/AO/zFMosqKuRzrd3Dw0h3x4LQOdPfMCY/z8K6L9C/ciC32xHhq122ZfJ+GDhn4Vfv37T+eccjt3BbLPkubDwhN2XSIA6Ze2NoG6wmiUD8vCgXl49JvYMugxr1O2FkRBpfXgvQvhXQPDqa0D9pZduf/yCH5p3WjgD6My6gzmUTvtFkZXpG95d6dTqpACYu6oQwsEJhZd7Vpo+IJ2Llp2mqijPdak6Y5ONn/BHCoHyka27y8B8W3U1xXDw5w/suG8T6XwgniDbftiLHxeZf4d62IyFYfltBd9aNMeqL9vPvZRieCjmiktJ60TdG/cCOuZaHAYBYZxWoCCehiBKQb1rwbOmdXtwMY9Ca/Ou/rc3vvDyy2SrYeAfefzJ+asbG0+9oPH7Sgd0WPfHP4PQH7rroevA/JXHn9zb37nVaTBIAQUOXbFA57Dty8mFhhcPqOArBKHJojTorcKES1AFKWBNzvhn3sJbDc1RtbUaHGQhnaPGsn3P0BtvDMChB7rA/H28z4vMv6G+jOqL3ZGvzfu+jeFxw+9OdhOA3uugPtzZiWOd4/EwTa1iLQmF8EaRUXe/NzKnaZBygx6jYAf1dvsMqLe3P9v99kePv/wyDDzW/F79+K2w740XfA29haCvM0c6DocikLljQdxLYL67NWTQip5eWXHJxNwMnScH1akDMIBu9TcpVVE9dM4bklEp5g9M9M6MkD8/GksBNRqa0qIYbs+ODUPkz1FNndj3CcbcVWT+HepktB356uX1GJ4aqO7bcdHh97LiC7S++SB0yNL4eiLsdYbttIJIa0D4bhV1Wp0bDVRzmoA0ueBCVj6eDofCq+lgsL352f639z798isvvES3NOcfR/wO6Bd8Fzo+yrs//tIrT1OO/mvmnW1Bs9biUWRVBXML5wTz6KA8iyZI/lrFo9huMPFWVQkIHL8S6Z0YW3l9KzG/orY6lUqRbb8XzDehTEh/4kBgouSJD95En/Q9/59Gmd9CPWl2Avty9UjlUmvzmtaxgepcGu+llxv8OmVpOl5r9SEhGyS37ucMegOmnSS9VmtNLL5XqvGIk4MevcD8eviLNLQefGp0794XkGjBEx0nmJ58ZP5rpV+4Bh1h3FWnnQqhP/0KEzoF7qTzthBWz3sQtzPmFs5hX05qbNnZa/kKm9IkiVG9Nhk1GKKqNtbrLu9dfJ3Z9i2I4UqQekUccgj8+Z5u6DyeiUcmSko+eBNHGOv+bwX0X7v6EnVS0W0Z0dz4AKCDel9fy+mXISPLqGNByUGI4dtGkJvzBcOAbvZD6VqDpJW0OlxuhNZTDRKoa3HyBRbeuxoPOpvbifqrr7yKYTYcv34E9p10/h3obHdg3+OPPPooEzqWeT+yt/+pthBS+x61inTO4XOEl8cGlcnZaxGJXRLlXB6JM8gRJWrgcoq7p/d1MB+iGA62PQXoqKs90ALmBz+DuD0eSBJzHGH81252/ru+fU4MmMnEFzR5XxrU1zKy2884FyO+jPq9GIIgrT/jxYVWarEz+B0Cnmw6zmght966OlKquY38OqpwlKXxLoZCsPCg/uQrr7yKERe6hDwP+/596NRLM//4IyR0GHeE+mC+K2iw8gqL4SQjR42vy7EFdZJd2zLdgJ1RnJrr4fkA1r+5tBNjrzPbftCdVD9niyauuGzH9u1lQxS3o8aSZLYdbVX/kW1hfyX14wJOJ6M+4cPFZaI+uqdv0xnnr1v4WjRLboDWB95oRQgfdtoRyzmsRr1ObwR1pvXXq1NRqavEZTTb4deD+U/aQ8Ego/7qqy/cDuqAjlDup6FfDuO+zrw5ZNbzNpeCOXOkXo1G8udz8uQUwF1rukHyeIxa1SgqUauup4GLFd56F8wpbq++WIMXOpgfAuZ7GHP48+hgyYtM58f+j4ssP6/1CKM+o0n73mglC797dA8mWs+lNPy+a6MvGxDNHTFOSZpg3I54X0AqlvXIGnW44ffuoiYVteVKcMA6lEmH278cCTpJ62/vfeRVGPjbcX7l9m+gX/idQO5x3NC8/K7r6IH+5GhnW8ipBfOqKnqrGakJMp8clHPTl/CYWNspqlHBqLdaREmRZc4WXeld3bp7aMNBGGSBztk+GdL5fUOvPZPwxuNgvi8x56v+z4W1X/DrRJ3G3ErTvnGvt5na4edB/fw7kdSkznFqkUV5HYXWTGszZmRQqUGShjLweLxp0Sz57rulqahlctCFc46ZzPPtXy6Rhd/1KqN+6+2NQP4T0JGOe+Tppy8n4478PHSOB3oVRhEVGSqHP4/k03Nq15QJgTsftageXphcEbkVmVe65Giy9/DWzuGvmV9Mu0XAvGVH9zPw5+ipSxPzm/j/Z3PUb6NOA6ghx0ztW2F0VTSjRZYSsqdD62wDFVGHhW8bSQTHByrjVKgxWzjCLsC7Q+vY7zJ3cRIWXoVNBvXmL7CMCIndV/fuxfIQjKowp05fy/ehP/koLioy5vDnToPWpjDmBgHMA/lkuTq5cMm1YK66lCZe5HhJcHFirsGaDPSujncOrftzFnycd9nGFjAfgm0PoJi6cNaLH15SUWT+i9TNjpCjBloPp6F1aqqgIYhzN0PrZ6WI+mWYbWweGW9rHfAFQw4k3+0QO1JzZgF2HqcTFueqo2JuUOHq7Zk4QvgEufV16k/uvf3qvvk1pW/6Fnrjk4888uhLuJ3NmLebtXr4c5mYO531jkg0P6fkpm+i5ig1JvXwnNIlCHzMKnhsyuuJ1YE2xHCXUtzOVqjgMHJLy/Z+MPcG4rHYYArLRXj+v7td5C8ZglDJr9vLSzO+Je/W71CnMTdWaUVjdEfHMx2ouNFEK3bEGixGg06A8zXgvT62CupJabKkjqsPpzNBeri1Q+v9eK6/+sLeRkj9B9CvuqBx/pGnH30a2Vqmc7NWB+b4OKOAbq5IcmJB7pq28TxvdTVZm0y6nUqFmkvqpB6rUug9fKADja93Ig9XWs2iTdb32j30DJhjE2T52WTb+f9xc9Rvo+53OB0YggD1cW/zGnW83C7bvI1Rx7lpok4HnhAlhex2lOI5aF1n1FoMWlBPl6+Un3WDbRIW3hlJx33xVW8IUm9j1OcBfbTxucbG576Fjlw8vdJfefnpt0nnTq1VUhSYd4ylOdF5l54ol7umoHO+AhOpDTbew1ulmCjGYkJyrBc639190KXMtl9M+15RZGnZMQTmcWwdINv+ZhVfYSky/zXqohksQT3hG2epuVGmdbTSVK/1EyNJM9TRPEIhfDxiDobNZkmv0+o5DLTCwlvfmlucSe2syg2qeksknWhPrLbja2sb+mjvC+iSg3ln0L/16WfiFPq3zFFkUWW/UmXTG3EyKpBcnumdnL6JNr7KXaLLo/dETYrM+wMxvscVWR3vQGHtztra2jmMpuIw8mYUU1v6wZxqLIHpfRnzom3/Lc2STidC87m571E/f218HRaemiUPZtTjGWRk8WA3cOij0dMyUa1Ob/2wfKY89SGo24y2SBpuYrU5GMSeE6KOdxuL5K7/OpA7E62S8488/gr2Sr796rPtKLJILjCXLXpMyDoC0fxMb272AB7+3N8jqFFdXR2vuBQxF3AHPgTzNjA/ZNvFYI6bY9X3HvIgAnfY9nEvTayB+WPYRSMVmf8W6lRDs4fnSuPeVu869b0XYmlBLTVQofqyeZ36UuW4NxgMoSprRWrO6NTaDTqd1f16+czixTnbY1mTRY4kM+35L4NUfOno3jTfP/8kLig2nnk9M+/nAzqaKuaffOGVFz5/GzoPGXQi/LmsWkwQuiOchG3fmXXxJgwv9VjVKC+7eH/UwucEoQdvtfG2g8s2bL4CxdQUu9Pw4IMt68y9gTXmVRX/+4a433z/I+zGqRYsLcB2eFBHrWy+D7m5zbSYCy9hUD+obPfu1vGtA60+LybT7W6HiId6PVdv5LQ6rTtZXr6imap7bNbCyUzrX/ro5dbZvXf+hScbIfXr7/gG+gWNeKW/+vjnsO3N0LmsyvhsRnyOWLpQUHOTN/FWnseFlgZVQCZeVa0uVZGj0bF3BzrhzzdvAXP0a19czfrhwJzq56TzkmmK2y3F5qjfSj3iRNENi8fi8URzczvt9kY0t3Ezqi8QO7R+zgOgTltplig150QMLwgI44xalqyxBspLX58uqZpdkA3+cCbtzXwRppdbRz9ebs/N9zU2rkE/l0GH0B9HkEc616oyCujUM0HTE4GZqGsyR081vknlcFRPUnnOU9HkUflsbOzdtt1DZQdB56U0r0Z3lx5s2TTaj+m7Vm884Jouwd4o5OGKTZC/uW3ulIgZJZWa1TmfF+91qosT9dPZglVInVEf7sTOgsp4PEyXHpx4U2uBvJ7jdDoDPzajWVmYsmWnJQFJ1HR46QtviMrr3c/t3bt3fv3JdhmD3vf4ky/sHSXbXm9UIr1+eqsZ8buHY+XRqsmcCSEcf4Nqitp01jG32mRyNSj2QoDmWIbKNkDnGmJOPZAbW3bs6YbfAfNMYKXkRWIuFRtlfk+LLKg7HYE5os7a5pjWUX3ZAqmzSitGWjvb3vDSILM3XI8wwGwA9fp6GHmd2Tq2qHl9sMc2tWAR7eFkxpde9QWh9d392+efG0UAv2njRhxI2w6P3jc6//aep55FkcVAHROKbOLQVhuKxws9VV1dJr6CmAtNkk6NWQMyz/VIciGQxkwDdH7pFuic7f686EHUz4l5ayuCuMjKvi9ivLHI/PdqPUzUMxhkxpQDqMOvE3XSOjKyGgw3gvrutqW4O74UDNopmiPLDujGevh1HtRXzmqqemdBkqRwMu3Lr4bIwneW7XludLSPQd980fa7Ebv3z48Og7nTIIO4InEmvV5weDP5vNo1iRqLSXeDao3arAqgi341qlqXI+nVtg7483O2kT8H9G3Mn9/XD+Yw7ZHIytkvPkald0+xUeb3af0UvwEJsSS0Hk9sbSOtf02dxfBbtoA6baVBI00mGHY6iTqwOyF1/M9gGJspnzzr4arZaQnRHPz6J6sI9INtB4/27emf37vxdIK+6e4L+vpHiTlee7Ki+mXYdozKOSOJpcVIbvYSyFwfVWw9nE6YVHUNqtgkGeDPj4Zt74Ztr9bMUVGA6mr37SDmlHtlzN/B077YBPn7tb7sNws05lZaiTi9GW3s67k55Llh4JGRPeegMraBqhK9ND66u2vgyMJ/Hc0lyxe69m2qmpqu4uRAPuN798sgxN7R3b8HffUbzwf0Szdd3zffj2sSpHPkXlEsRVkN1fhwJr/o75mFznljVOWSgqGJ0ykNvORy+ZPRMebPD1r35ymaY0GJpax/CP48EglEJvd9cbbuWv6Sos7/QNvcyaKAi6vpufLKOLPwX0dz6FY4m93hBvWhI9pw/ANrxBHOhevNRqKuB3XSOk5mPbbvbQdMTdssSmwp40V5PYSeiv7h4f7RjeeeDqXvuL4PP3rq2XanWVKrZJVqqbAZKNAt9o6t4MFVIUUVLslZPRMqx5msikfIMebDyLfjrTaIEO6s2kvZ7BLe57DtYL5SAub8tZaizv9Iye3IHnS3u91vzX0RDmR87buanx2mdnjK0tBFYrzc2D5RZGmCGV8I15btTq0RFVYYaMrG66SVwexkCaNu82PtgXeVqO966qmn+vt3nH/6A4dcBJPMmIfMfrUKGXcLwn9nKJzJFHobpusqeKsM+UdFSZZ01knOlrNIycjY4tZONMpchBnFQcSUCCoxu4QYjjEPByIFzcLsPdfypqLO/6DWow4zZpiSmnKiXgmtDzO/DuosDY+MbAt2Bzcvx4MZL25s0wwEkjSgrofc9TplcnBhdt/bYOElSY7mE6DuC+HVj19nw7mnHwToe4Z3U+DutCtIuNhQm2dxe6YQGZu6jecNnEuWk6Kk9iAa5F05vdT71thiW8fB3Rugc5pRTFE/HObPifkA6TxcGGTM+WKD+x/WesApgHo+NeNIpL14urGaGzKymClYo77xvj1Dnd6loHcJHVSgjsH1bwy8TuvJLixkS26rmp6WbIz6F4j0Qf3Zp4Y2nr/hgXMO6n/q2c5mp1OMIIazATnndHp96cVENHubidcJmEdNIusj6NSkoEgeOZJPrFZ2sBiOxe0p2iG0ETrvLzu4w4tiam9BMzhbZ6rg64o6/1Ntc2bOPlG9WoOFoVtptSTbDn8IpebOStVuu3TjBvx94yAAtge2h+1UfaEPDzdOj2jOlV2Ymkp5lOlpi6Sk8/H4FxlQH3h2V+eGy4Z3HzLU2XGEFxefFOTbJclIxj0cT+AMU/YGiNXYoNiigjXWA/MuCAG/P7JYuYiDct1ll37DfAtqLBvpfQ6dI27PgfnD+Kl1xxaZ/4lWGtUscEZHvnTVjoPMzaC+1lWB9CetjMa9zo33lR3ceURzHE0XQR+iMLOZqGvrtUYYeFAfnJoedIG6zSYT9UUfqB9xBBLxbW0Hg3lryOyWVcUvgzlHzOMjy7GZnXiqGaOypcFkjSH5mkRvlDgWyVeutnagCfIiMC+9OIUaC9VSN7UMDQ11tMbD8XAhNTh7D8qwVUXmf7KBiq5z2ZerZ+xYNlRZCep9a1oHdfprP3/HfdQ25024EwjogpSbq69HlgbhnA7RnGdyYWFhsI4sPM6nvZUY+aQZOZqlI1DGaWtre2MAWXsJ/lwU6bFWH860gvlKF8SqVSX5NtMlSlLl0eae9Pf6C753B9b9eSn6ZGgP5CEbqWeC5eHAfJnpvKLI/M9vh/e7wVFcri7YM4jmqNJK1Dcegiuta9Q3tvSDuq8ykUGYRu/1egNhXwvh+YaV6cFBUF+Y9ov+ZDK+OlIZdLaDentz81Jr0AnmsiyJwrrOlwqBla5LKnS8okhNJpOnihejpiop4u9d7n0X9XOWkynVoNwHM4N8e8t2lodbZ559uAJNkMUG9z9N/RRU0aD1AqinM5U42Dm8Rp0GntgJy3NB/dldVG9Lh8M+lF+cTjbwVE/odbwnOzOdGqw7ANT94Yl0fHUpGAL1gcrmN7whBzIxKnKvyLfX3xL2xsff9WdZwr3KJTVxJhcniDJfUaX6/Vn/4jgNrOH8d6mG1g5QDLe9ZRPLw8G2eyc0WOaNMqytyPzPB3P7n2zHKT7BvlhdqAH1yq2gfscdsPDspiG1w5+Dp1dn25IvHs4HQ4Buppebrp4+WHi9J7sydfaLVQdMQ+u99HCjQxDBN94YRxrPjNW+iOE4mAW8zxOJRd9kl1WnM9lcFo/FZBEFJOSkWd4jvu6fAfPhDeeQbWe11C2w7dvRGzU0gEpfxDsxWDIFf15k/leV1/1mvNcZ9Tz8enPHmtYx3FhbzY4CnLOjbJi0vuQejzvCMPAUzLHii1Gn0+s82ez0WQtVdQszkhjIJxDCU0LWWwlXYJdVv2ThWNwejmcW/csrJgRxIF6n0BBLg6x3JUXFv+JfTLQh+XrIFWDOmvWIOcKJbvTDefFT84OpqXuuLdr2v5C6w4mMrH2muuBIw69XdjCtn3Euvdzg16H1ltGhZ3eN1NAgcyWyNA4wxweW5Ne1DdnZwdSCzaVZcdtj+TSoh4Jo0yDmsl+UyLY7iPlMpCfL8Tqs95VUj0mVPYJsvcECfz7RS7adLQujngkI/d5DEEFipmFoHA7dm0jPaabwVtMXh5f+wpIbXVt1h2eql+15LAfeyqhff+H5h9CqipQGCdn7RqH1N1q9NZl4ZcgOogY9RG4ktWu1fMNMbuHs6ZvqBnOCGMtn0l8k4PgdxFxmzAVnuD2eKASSWRsKayaE8w28TZSxa9x2ialXXPQhhoPOj75i27bS1L4p6ntF3P4t82S5BgdZdHpbsQnyL/tQXqfdE+7eGQ2iuXBlELd+QB0WHi83NgRxHqgf3IHzfWkkcWrCgM4Z6J2+7te1npnczNnTl7g0UdEfyweS5RG3INgVMLcZEOU7wDxTCESzVTrMq9qgcZOoWD0elxyVxqTlmsWBNjbUsK22FE812HZivmmNuc+bSS4Q84qizv9i6if4BQHnHVaqZ7x5HFxeo47O6EOoM5qNDWIIovOIgYQvlEi4fbDeAmI4LaijVxL01ezk1NnTLmUh5hYDydjYTNQm4yN3rjViZiKeWQ4kc5YKvcnCeWSXSeQUXuVkFVX2nsiit4Ns+6VbSkvPAvRtd56LwhqL4QbAPL48uED+3FRV1PlfrXXs/UZ9fVmziGguiJdbJ4YbUWkF9bOIOpJjG5BWHfeN4AZDTRzUDeTOwRyax8dlc5Nnl9S5Ukm3iIGjQK5BQbqdZpGJeSC56M/lTGBuM0Vll6BYBdWWU3iPEnsrsFqJPpmyQ84D84vX+mQ23sf6ZDqhc7zVUi++c0BFhVUpMv+rqR95iizgcy9jVUU+bg8iS0PUqdJaTdQRwz+4ob9z1xKUXpkPheIOM7AjhqcP0PWW7M7Js0qUqAZ3UF2w3C7VJoG5gSPm0WU5l0PYrrdZPC7FqIicR+FtFpeqJiOrW0nnm68g5ngiUp8M1VjY+xz/pQenwJzn1f/3lt+/5QN1ySEIWFoA6iNEvW03Ub//9M2gTtWXK855cA97udWkfXF0zaF6Rl3R2q+py9lc9uyskNTErErMhaljvNU4A5b2o/N1Wd6ZM+nxPuc8DUaZo5P3qifqEgPpXhzV6+zuRmHvW+Z3rDOHbQ9nvpieqqvARGux2Rnf30DdT9e0w5rqtG8kwqgjD8/WyNaefeXZbHx9T39nB/aT2CNJpz2IO8xgbiDoeh2wK9mJ6bNzQm4wIqqBAJgLCOI4Gaudc0rPLGy7FtqO6mUJ9ReuR5RlayAP5h1oiHvw0m1gTneRN1+2XktFz4QPzbiI27FzgO8tDjX8LR+oiw6H4IyVloI6lrtv7YDWMftyOtbDs3VzWy76iHJz46F8xJzBe50laYwEHfBh6V3ZnQupCWFlsNcfiazl4SxyvRxLunqmcDEVzNUoJyFfY4Btt0Yxl8p0Xlb24KVbtqz3QD54Bnqdh1m+3RfuTZensg1F5n/jB+p2iuFjc5qMN88s/DBZeBz2YovHyK8/sOHgzuZPQvF8MB/y+cxmzryemmP90Wo2V3J2TiyU90ZUcY253YFdQD1ZMNdzNjRLWBvwdJfRBQnbPtZKzNdjuOqzU2dX30k6v28YOo8Dem96pmRqJ1J4vccXmf9dHzVQgbo4ptEkImiSWvfrWChK1IGd/HoZhhsRzeXduPFgNxsgdqgcuTktYfdku0pSE2Jh0W8HdI5T7M5YYKIhW1WBFisZAyychxcE1WozyUpsrPddxvxBysmwf1VbaGf/fcND1CcTxhxGOQbWsDZUKfrzv/EjC29FNJfWaGLh5TjV158avb6vj9rha9debtD60LMdb1RWJgJhZ9xuQFKHiZyrZ5LvmSXqvkLBIXDQuSxEYjurZm/C4w7MoxaTi+dkURZ71AbxLfLniOGgc2JOuz83P4i9UTSvthXNW3Hy52DOy8cfWNT53/eB+phoFpxolpyLRZa9wRrk4Unrp2Pgaf2GH1n4DlBP+CIZtDOTX19P0rBAfjI7OZh6y18o2DkLRhUjgVxd9raKCj2HGA61VIvikVUUYVTxrcjiVsq3X4ZaKnIyjDlsO5gzf+6FzlPQeUWFVPTnf+8H6ifAq7uFnhSj7q7ZCgtPz/VzDt92FrPAWy59YMNwR9tSKO/zpZ1hB+qy9HCjpTQUynOTM10LJR/WFL4I22WbGutxZbsqeETxDVFBkJKSIhtkU50iTuB9Tvn2zWBem2Ku49zTd8C2s7eaHXH7TGrqTfRAisUB9L/7Q4tsRDAgb55MzUUiy5FgzVoMvwnU0beG+BrUHywbJr++lKhBKd6OK8yC1vANdcyydn1Q8qE9PWOxyD3Ruqku+HOtzRUVMP9kloxcj2ypsr5e8y57q112BaufY/4c+XbUz8G8ozmOdovEouadNzGkyBX9+T/w7XNoxG0QDeJEai4QX444KIbfA61jtWTp2oISoo61NOMwwumA2x424zN8rfV6LajvnC7B4j8bl/O4Zrt4PNBlMMfFPWvMGnX5/TFxwv/6OIvbofNtrN8atVQEccjJtHlbm73eOHTeZcKdrqLO/4kPG6NPMpsRzS2DegTUQ6COh9v1p5/Pii9n1ZbSkkGquQULNY4IDbSaqcBuIOqArrdMk9Z3eky5mGt2Uq/j9dC50ahIoiALIi9G3K/7Xh/ZSnk49lbDQeyLS5GU2bGju//gVnhz767MqmYKyz91QtGf/zMfqPeaBfTSFDTl2J9P1Dv6+6irAn6dLR4rhV8vG2obT4Ty3njabcfOAoE93Dh6uemMtunZne8cVnfbhCs7i+SrnkMMJ4miEsELXXQF3BM48kdDiow5jS7V3nsnMR8lnccxVpdZ1ExjaT9vLer8H/v2O/YkATlWeyEF6sthe6i5k6hvp8VjoE5H/O58YMNu6nxE5s5n9kHrVlBnWjcgJWtb+PTj99/fqUxOmXTolHE1CJyIngl/IAro1omat8D8YDDfhrverB9u82Vry0WwZ4Jyr4U5LJSp4Is6/yc/tMO74ahBfSESW/bV0I6Jvsa+7bjcyKqfTOuYbRxP+FAG87rDdquwTt2JEUedvm76/Y+76nqm9SiscRhGFRQBg2su1YOtkBP+t97bSjHcpVvuRR6O/DkOKULn/d2drb5KX3OmAJ2DubXI/B/9oHV00hj8WU05qIdrKllqDtTJwhOnUqygGkKLbLPvk2Bl3OrGwX1GnTOgP5q1yO6sa8qaeIy9qTFRkISYx6pyiiibenrfeg8Da2UPMH+Of0LVW47BYucdo8Pdnbtw+hPtFoNY5l1k/s9/+x8bhl8XRKI+lvcFKzs616hfengp9c3V0kVmaH0pHvoEO6qsfreVid3ImesJvjYajYI5r9UjGyOYY4JVsbhMNkXEMPJ7lZ3D3Uedt+VeDfMVW+5E3L6JdD7QjNxr5vV9PyDmhiLzf/xjWjc47Yuamd50uiYY7MCFJ1A/9yLE8OTW6SIzPdyaQyO+mpjVHWFaxz0eKq/rDIaerN5UoTUqHsks9oh+SYi6JBfX0zsG2z6M4SWWh2P9cOe37NhOzJFwJ51roPNrdeYi86/YO7+Xts4wjq9bl9X9Lq27KnQXhQ1ZYTetJoOYWro0Mx4NlhiUTFHPxByMB8oiI6trPCwJMQiahZbNmGS1cUtNBiY7LUbQSSUU6pxDiAXZRSljZS2rWy+2Qce+zxu7P2Em6fvcBq8+fs/7/H7+fwN1s0Dv+ppmTUkEzcNSsfgy0dz48sj7KfK+GPUItkouhMZCdlPaZDISdoEGn44fO3GiE5m4Vj/2XTiNQe2nuHzfbsxLoQci3nMMNaDXGcXUs/2Izwcn0DSRzEQkyRFCc9R33Z21+qP7OfNdMGjdarBjzG3joCvvN9O7XvThm5nWUV9vefnFy/FIJiyOOeRQ2iQJELtOaxj+2EqV1s5aXb3LZazTt5pN8N11XU4lqyzcJR/u68b+KtTPU+TDWSYnffDb4zHvFHIyt1Qc1cMYM9f57hjedZcBAbh+XV3rSiRkUI/TF97X0MgWj5HWm19AaB1bEXProke222WDSY8vvJmdAcEOzx5FaKozmc74sSnsvHPZJW2HsSAOdbX+6DjVas9GGzsmqQdyPk5rah2hW6s3P8NzrucLZXbLoPUgqOsNeU1eySc8sjtA1C+AOiI38uZGerGWJh6JZdzolszJQlow6UHdgIkZdEafQB5GoJwMplya2pvSy/KDMPXDfd0/MlKspV5Evr0NzHEQLixi7cB6YfXbTtMx/p7vokHrChKseuHXgTyuLZjtIlE/943PYsOZVnqRoy2WF19NejN3pxay9pxkNzsxC4nTnLSxQmj1CyZjk8mF7tj2YFdTHjWWQOwyi9UY83FiPugDc8rJoMF9QfMTdK6zv86Xi+yiQetpTDAZPBua2XZQl+XHWu8l6pRXIa0nI+EVN1ZVyJIsoOQGL97gFIxdQbMhnTcam7BaxmVMP7Q/CLN5NVs/629PQecNE/i2034TUXKAufrTJfTJmF7nPtzuGrRuhQ+vbGgSrnzCLOxQP3fSVszN4YafBXe4vTMrjhXKw9tlxc607mwFc4PRadQndK1po7Is/wLmxfe8ivntFxtPYpc3Y+4Qvd7cuvrH393wA7nOd912qLtAffl20GmXI3FkZC+ca7AdoJIoqNtwr7N6xrvi/itrHyOxI6sDV6DVCWdAMXuQfPWb5If2hQyYz33Ncq/sNkdjB2NOPpzo8GbW1Z/+HiXm+znzXTfk5kAdLbIpf5Cow4dn8XpfbxTUqcupl27zRmJbogOLC+yy5BQEO2ZlcIbb4EmjhH7+jPGhfAs6hw9nG4mO4M/oNkdD0W9PUr5988etKmKuM7zOF8qUgu095CSt+zc0Qf/1oFMWSeuI3Jp7DxC+U1XRlj6iHlnxhkLymCgrHkEw2w0ewWMU8GE3+o0PpW32bcd7PlL8V6l62eIrxmqxAPLtM1uPCt+BuYkzLxHbe4hanYWEqgYT14NmuxSJsdGX5ha2ggqq7bVM07t+V1xZCadl+sTbFXzZ7S6/fdmU0N+TtzPE/EUb3nPaIcTy7W3w4cDcIaHxdWtj7YcPsDjq6FuceYnY3kMCdnfrZ0F9Ng/qojdO1CdtLbSD//TOux6PzKyId8Wwwy6FJLssy+mgQQk6FXs+TcxfwoG1flRr2P3zi5aOyelFxGox3JWAA3hwjcYhdDX8PS8dY9RxQkmj9oA6y82xIQgEbsybQ7zOsjSZu44FUdoSZVGUsuuyB9vh0sZ7oWymmHttidIpX8q9grkP3/ZYOCBh63huo3BztJ4zLzHbe8hKX3is6WyfnXUZBbFYfenoxRf+FGw8yq6vUx5+ISSh+wWdskAfNLrS95R0Md+OYWQWq6Gu1twx0baIltqMd2oqPLOyof72LPYD1/Bve2kZtI44rO56qtCVn22nMTem9UEbaZ2ya1FbM3VV4E5eLhdal92SLGfTcla+l04/2PHhWHxe1Png4LVFxGpgPhNeOajefLazVnuU67zUbO9hAbk5IZ862PPlrGJmi8cunMO7vkOdaR3UMfqSldxUGJfFsbS8vsP8xSLzFN1LbZ6cBPOrcbznU5szK7dw422oVlvD/fbSM2idqi/51GpPHtSHxRhLzRH1AcAcqGqBN0c3AcTMdii05Zay6GVeDylgPg/meM/Z0beWPsRqg4vXLlOsNjUzk7mVWqWlA1znJWn7DlvR6tx0PbXUnk8oTneAUfd19PbTmevT71M7PHVVfO8V7zvkbBZ5toVwGIMsSaqfR6MDdPyLZpfwbSfmDtHt+DHzYACLIE26Gr4UsDRt72HaGlh3O7XURdTFAIXroI7IDd4cqbix4/mXQH0lnF0JheXQgwAxj2PJL2I1GmlAbAfmpPNkJuwWveHMP5rV80O1Ov5tL1nbdxhrIPWG26kbPaBulrxxbIc/50O8XhxfH29h4+uxjLiwJYsL24x5kgZTo6yWivfc0kbM51BAn0KAHvpLs/pFt+6Ykeu8dA1a12Kj6I1T11Fo9ZhF7PKnWz9t6H4iZw4VchuNtMZ+Dji2kZwLbwfoYiqy9NEBGmSJ0uxS2+LiHHTuxaWgDK7wYIG7ych1Xsq27zA1S8KbW0LbnEdirTSI3Nps0SpaLYkvvA3DjVhGlMksBDI/0yHF6T78SHuj2OzS4OTi4tVk3AGdz2zd1yx9iNtsZq7z0rZ9h6xWUPerBSUfVNy0Hh7Uz/mQh6erqNgUZKMsTWwrHPj5bgSx2rSll/0yMIJfrrT5cJAxGQu4pzZRY1G/+wA1FokzL3XDymi6xejHcOOdYFpwByKk9a8m+loOaE4jr87e9flY/PtXv8c9lsVpC3T+NPLz2P3Zh1oqmMczAdG7STr/brTeZBI589K3fW9breh29aduBPNBetdjTOuTjUVvbqBIPf7Sq7GrVy/7LC2YUXwa9dcDH1muDO7oXJza3MzdBvOh41qu87Kwfa9bh4m6xh+843KKoE5an3hM/f0Rop6Mx67Oz013ND6uyNj6dpjHA7I0M1N9B8w7h7Stb/Nh5LIwUIfW625ogtC6U5Aea53q63T2hcXrySSYTzZf1KDgTjlaWuw8x5iLDtx6XNj44VksjpIOceblYVgUbjbg/FIhxaibxQBR/xwZWaJe3BmEsy/z01cstvFTeNBRjbFgs/Mi/hPiXmlqbDOz8KjwxdCQSeY6LxsDdet/1F1mURRZlmZiElUVWhmNTtfmjkVfBybQ2dVWVOAmB8Ec77kXodpm9fZG4TMML3Hm5WSgjiGWd95TNS5/XgF074/sXb+CjCyow1fvtTRcIeZ0Xy2KK19tFxapH475cNVbVcTcJLzNF0eVk5HWQb1VVdtxvUNyT5E3d+3CREdjyzios8jtI0y8oR0Ok+yNlsFvdvx2L5gvbBT+7B4y2d/kw0vlZXv2g7pB/56qKol1l1kC9cuMOhtfP/1uajzaT/iRrbnYaMFxZlzVpvjcC50XmZve5IMs5WZ79h+l1NwZtdCVWFc8bolp/RyWEUXHz1JTVNVZ6Jx6JlBkmb7G/Hac2WbMf++u1Rr48FIZWpH6sa7n1NbZdY8koTGavLlBpOBGSOLMBqoONFpO+lBjoVhNQqyG5OsnQ93HDHzpQFnaM/trcJn3nS5VbU3M0iUI5s1NgPpFPOYQezHhDuZM52ymYWbroPrJ6JDOyhtlytSY1rEtLAWtJxSJmiXn8IFvY9QBHbHagY+wdeAa0zmefW8me1BzaVRXr+U6L1tjWjfo21MFfOEVUI3EFhGuIw9H3hzpnJhPs54JyU3v+Zr6e/dQLW+IK2fbA+oQew9RzypTU+wSBAVuGHMbGBgH84bBb67NzZMPB7+9+tFzv+PbruM6L2uD1rHvHSW3VSf2k5DW50F9EOF6NAqdNxNz5sPhzlt19f0qMO80cZ2XuTGtW7X+UwXnbE5x40oro95g6335IxuYT0PnyQj6XjdzmftnH0Lnhhqu83I39q7r6xKn15zrWQ++4j/OL077Ji29tr6GhjYfMY8hVtvMYbPzw+76WhMfWKsAg9YFQ13t7Kk1Tz4H6qT1a76O5saGk20++O3V4YCIZd65O6lLo0NaAx9GrghD5GbQntD7U2tKlmk9npxb9E02nERhbW4+E6acTHXuNo/PK8qeoXjdqm/VaJRgghVf4tRAMYlP+3zcIaKwtpV7pH462nmcL5SpHGPenFbfrkH1JTeFSdRYPDn/PMrnyVhElEXvSm5N/bS+u5YzrySjyM1qqOvSqJ78mAfUZ2LJeDJOu0VkUQoR89GhY4YxzrySDO/6sFUPrS/hcKNEkwyRSCwWCUiCWwpl19XPRodMWl5XqzCjE08I3VypWTMdaUUePhKIBERBwKB6VgOd63jutfKMtI6Jp/ypRDrhEQS3GAgERNkO5sHUl01gznVegUZZGsEqrKWWGXVRktzDbgmbo9SlD008316hRvG6YG0qpFxdfo/dPuweNpulsWV1qafuuPYo74GsTNvzylGrVXAWUl0KFskN4+SyZ8ylLp2vO244yo9hV6yB+sdCq6rxhHKSVRA8SlC9+W23Vnvktae4VarteaVm2Gpt3dhwBrMenN4NqqtfYLPzET7TUMmGLzw2lHjUjbRr2eXsUld7TgzpOPMKN1BHuN6lOejEsZ6bBX9rPWde+YYvPJYMntGsvvfpjcL5Vi3/tj8JRtTr0Bi9ekn97ESt/gjfOfAkGFE/9s755wrn3+Pf9ifH9h3BIXX/pRO6+je4zp8Y23dEr9eeqa3hzP9t746JAABhIAgOQ4o4wMBX+BeICqrsyrjmJtknN/HammVVd0mvAAAAAAB88ABhhJexnGwswgAAAABJRU5ErkJggg=="
+
+# Image de chaque rang, par id de RANK_TIERS (ranks_config.py)
+RANK_IMAGES = {
+    0: IMG_AMATEUR,
+    1: IMG_NOVICE,
+    2: IMG_COMPETITEUR,
+    3: IMG_VIRTUOSE,
+    4: IMG_LEGENDE,
+    5: IMG_MAITRE,
+}
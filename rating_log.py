@@ -0,0 +1,144 @@
+# --- rating_log.py ---
+# Journal des Elos : chaque match validé produit, pour chacun de ses joueurs,
+# une ligne (match_id, player_id, rating_before, rating_after) dans la table "rating_events".
+# Le journal est en ajout seul : un rejeu (réparation, révocation) ajoute de nouvelles lignes
+# qui remplacent les anciennes pour le même couple (match, joueur).
+
+import numpy as np
+
+from elo_engine import EloEngine
+
+# Types d'événements
+KIND_VALIDATE = "validate"  # Match validé normalement
+KIND_REPLAY = "replay"      # Match recalculé (réparation / révocation d'un match plus ancien)
+KIND_REVOKE = "revoke"      # Match annulé : le joueur récupère ses points
+KIND_RESET = "reset"        # Soft reset de fin de saison (pas de match)
+
+
+def match_teams(match):
+    """Retourne (vainqueurs, vaincus) d'un match, selon son mode."""
+    if match.get("mode") == "2v2":
+        return [match["winner_id"], match["winner2_id"]], [match["loser_id"], match["loser2_id"]]
+    return [match["winner_id"]], [match["loser_id"]]
+
+
+def make_event(player_id, mode, rating_before, rating_after, kind, match_id=None):
+    return {
+        "match_id": match_id,
+        "player_id": player_id,
+        "mode": mode,
+        "kind": kind,
+        "rating_before": rating_before,
+        "rating_after": rating_after,
+    }
+
+
+def match_events(match, gain, loss, ratings_before, kind=KIND_VALIDATE):
+    """
+    Événements d'un match à partir des Elos de ses joueurs AVANT le match.
+    ratings_before : {player_id: Elo} (au moins les joueurs du match).
+    """
+    mode = match.get("mode") or "1v1"
+    winners, losers = match_teams(match)
+    events = []
+    for pid in winners:
+        before = ratings_before[pid]
+        events.append(make_event(pid, mode, before, before + gain, kind, match["id"]))
+    for pid in losers:
+        before = ratings_before[pid]
+        events.append(make_event(pid, mode, before, before - loss, kind, match["id"]))
+    return events
+
+
+def replay_events(matches, start_elos_1v1, start_elos_2v2, kind=KIND_REPLAY, engine=None):
+    """
+    Rejoue une liste chronologique de matchs avec EloEngine.replay_season et
+    construit le journal correspondant.
+    Retourne le dict de replay_season, complété d'une clé "events".
+    """
+    engine = engine or EloEngine()
+    replay = engine.replay_season(matches, start_elos_1v1, start_elos_2v2)
+
+    current = {"1v1": dict(start_elos_1v1), "2v2": dict(start_elos_2v2)}
+    events = []
+    for m, gain, loss in zip(matches, replay["gains"], replay["losses"]):
+        ratings = current[m.get("mode") or "1v1"]
+        winners, losers = match_teams(m)
+        if not all(pid in ratings for pid in winners + losers):
+            continue  # Match ignoré par le rejeu (joueur inconnu)
+
+        new_events = match_events(m, int(gain), int(loss), ratings, kind)
+        for e in new_events:
+            ratings[e["player_id"]] = e["rating_after"]
+        events.extend(new_events)
+
+    replay["events"] = events
+    return replay
+
+
+def latest_by_match(events, player_id=None):
+    """
+    Ramène le journal à sa dernière version : {match_id: événement} pour un joueur.
+    Les événements doivent être dans l'ordre d'insertion. Un match révoqué disparaît.
+    """
+    latest = {}
+    for e in events:
+        if e.get("match_id") is None:
+            continue
+        if player_id is not None and e["player_id"] != player_id:
+            continue
+        if e["kind"] == KIND_REVOKE:
+            latest.pop(e["match_id"], None)
+        else:
+            latest[e["match_id"]] = e
+    return latest
+
+
+def current_ratings(events, mode):
+    """Dernier Elo connu de chaque joueur pour un mode : {player_id: Elo}."""
+    ratings = {}
+    for e in events:
+        if e["mode"] == mode:
+            ratings[e["player_id"]] = e["rating_after"]
+    return ratings
+
+
+def soft_reset(elo):
+    """
+    Soft reset de fin de saison : 1000 + 40% de ce qui dépasse 1000, tronqué à l'entier.
+    Seule définition du reset : la clôture (season_close) écrit ces valeurs et les rejeux
+    sans point de reprise (DBManager.get_season_start_elos) repartent des mêmes.
+    elo : un nombre (rend un int) ou un tableau NumPy (rend un tableau int64).
+    """
+    elos = np.asarray(elo, dtype=float)
+    reset = np.where(elos > 1000, 1000 + (elos - 1000) * 0.4, 1000).astype("int64")
+    return reset if reset.ndim else int(reset)
+
+
+def changed_matches(matches, replay):
+    """Matchs dont le gain / la perte stockés diffèrent du rejeu : [(match_id, gain, perte)]."""
+    changes = []
+    for m, gain, loss in zip(matches, replay["gains"], replay["losses"]):
+        gain, loss = int(gain), int(loss)
+        if m.get("elo_gain") != gain or m.get("elo_loss") != loss:
+            changes.append((m["id"], gain, loss))
+    return changes
+
+
+def changed_profiles(profiles, elos, counts, elo_col, count_col):
+    """Profils dont l'Elo ou le compteur de matchs diffère du rejeu : [(player_id, updates)]."""
+    changes = []
+    for p in profiles:
+        pid = p["id"]
+        if pid not in elos:
+            continue
+        updates = {}
+        new_elo = int(round(elos[pid]))
+        if p.get(elo_col) != new_elo:
+            updates[elo_col] = new_elo
+        new_count = counts.get(pid, 0)
+        if p.get(count_col) != new_count:
+            updates[count_col] = new_count
+        if updates:
+            changes.append((pid, updates))
+    return changes
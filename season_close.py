@@ -0,0 +1,137 @@
+# --- season_close.py ---
+# Clôture de saison calculée en une passe vectorisée sur le classement d'un mode :
+#   archive (Elo final, matchs, rang final), soft reset, remise à zéro des compteurs,
+#   rang affiché (Novice), titres de rang et de podium (table player_titles).
+# build() ne fait aucun accès à la base : il rend un ClosePlan qu'on peut afficher
+# (prévisualisation du Panel Admin) puis appliquer tel quel avec DBManager.apply_season_close,
+# en un seul appel à la fonction Postgres `close_season` (une transaction).
+# Mêmes valeurs que l'ancienne boucle joueur par joueur de DBManager.close_season_logic.
+
+import numpy as np
+import pandas as pd
+
+import rating_log
+from ranks_config import RANK_TIERS
+
+MODE_LABELS = {"1v1": "Solo", "2v2": "Duo"}
+PODIUM_TITLES = ("Champion {label} de {season}", "Dauphin {label} de {season}", "3ème {label} de {season}")
+RESET_RANK_ID = 1  # Novice : tout le monde repart du même rang affiché
+
+
+def close_key(season_name, mode):
+    """Clé d'idempotence d'une clôture : une saison ne se clôture qu'une fois par mode."""
+    return f"{season_name}/{mode}"
+
+
+def columns(mode):
+    """(colonne Elo, colonne compteur, colonne rang, colonne dernier Elo vu) d'un mode."""
+    if mode == "1v1":
+        return "elo_rating", "matches_played", "current_rank_id_1v1", "last_seen_elo_1v1"
+    return "elo_2v2", "matches_2v2", "current_rank_id_2v2", "last_seen_elo_2v2"
+
+
+def rank_names(elos):
+    """Nom du rang atteint pour chaque Elo (Novice en dessous du premier seuil)."""
+    thresholds = np.array([tier["threshold"] for tier in RANK_TIERS])
+    names = np.array([tier["name"] for tier in RANK_TIERS] + ["Novice"], dtype=object)
+    # searchsorted - 1 = dernier seuil atteint ; -1 (aucun) pointe sur "Novice" en fin de tableau
+    return names[np.searchsorted(thresholds, elos, side="right") - 1]
+
+
+class ClosePlan:
+    """
+    Clôture prête à appliquer :
+      profiles : lignes de profils à écrire (Elo, compteur, rang, dernier Elo vu)
+      archives : lignes de season_archives
+      titles : titres gagnés, [{player_id, title}] (déjà débloqués : ignorés à l'insertion)
+      events : journal des Elos (soft reset)
+      ratings : {player_id: Elo de départ} (point de reprise de la nouvelle saison)
+      fingerprint : état des matchs validés au moment du calcul (voir DBManager)
+    """
+
+    def __init__(self, season_name, mode, profiles, archives, titles, events, ratings, fingerprint=None):
+        self.season_name = season_name
+        self.mode = mode
+        self.profiles = profiles
+        self.archives = archives
+        self.titles = titles
+        self.events = events
+        self.ratings = ratings
+        self.fingerprint = fingerprint
+
+    @property
+    def key(self):
+        return close_key(self.season_name, self.mode)
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def preview(self):
+        """Tableau de prévisualisation : une ligne par joueur (rang, Elo avant / après, titres gagnés)."""
+        new_titles = {}
+        for t in self.titles:
+            new_titles.setdefault(t["player_id"], []).append(t["title"])
+        return pd.DataFrame([
+            {
+                "Rang": a["final_rank"],
+                "Joueur": a["username"],
+                "Matchs": a["matches_played"],
+                "Elo final": a["final_elo"],
+                "Elo de départ": self.ratings[a["player_id"]],
+                "Titres gagnés": ", ".join(new_titles.get(a["player_id"], [])),
+            }
+            for a in self.archives
+        ], columns=["Rang", "Joueur", "Matchs", "Elo final", "Elo de départ", "Titres gagnés"])
+
+
+def build(players, season_name, mode="1v1", fingerprint=None):
+    """
+    Plan de clôture d'un mode à partir de son classement (joueurs triés par Elo décroissant).
+    Aucun accès à la base.
+    """
+    elo_col, count_col, rank_col, seen_col = columns(mode)
+    label = MODE_LABELS.get(mode, mode)
+    if not players:
+        return ClosePlan(season_name, mode, [], [], [], [], {}, fingerprint)
+
+    df = pd.DataFrame(players)
+    elos = pd.to_numeric(df.get(elo_col), errors="coerce").fillna(1000).to_numpy(dtype=float)
+    played = pd.to_numeric(df.get(count_col), errors="coerce").fillna(0).to_numpy(dtype="int64")
+
+    # Soft reset, tronqué à l'entier (mêmes valeurs que les Elos de départ des rejeux)
+    reset = rating_log.soft_reset(elos)
+
+    # Titres gagnés : rang atteint (plus d'un match joué) puis podium (3 premiers)
+    rank_titles = np.where(played > 1, rank_names(elos) + f" {label} {season_name}", None)
+    podium = [t.format(label=label, season=season_name) for t in PODIUM_TITLES]
+
+    ids = df["id"].tolist()
+    usernames = df["username"].tolist() if "username" in df else [None] * len(ids)
+
+    profiles, archives, titles = [], [], []
+    for i, (pid, username, rank_title) in enumerate(zip(ids, usernames, rank_titles.tolist())):
+        for title in (rank_title, podium[i] if i < len(podium) else None):
+            if title:
+                titles.append({"player_id": pid, "title": title})
+        profiles.append({
+            "id": pid,
+            elo_col: int(reset[i]),
+            count_col: 0,
+            rank_col: RESET_RANK_ID,
+            seen_col: int(reset[i]),
+        })
+        archives.append({
+            "season_name": season_name,
+            "player_id": pid,
+            "username": username,
+            "final_elo": int(elos[i]),
+            "matches_played": int(played[i]),
+            "final_rank": i + 1,
+            "mode": mode,
+        })
+
+    events = [
+        rating_log.make_event(pid, mode, before, after, rating_log.KIND_RESET)
+        for pid, before, after in zip(ids, elos.tolist(), reset.tolist())
+    ]
+    return ClosePlan(season_name, mode, profiles, archives, titles, events, dict(zip(ids, reset.tolist())), fingerprint)
@@ -0,0 +1,102 @@
+# --- season_repair.py ---
+# Réparation de la saison en cours ("🔧 Réparer la saison en cours", Panel Admin) :
+# rejoue tous les matchs validés depuis les Elos de départ (soft reset de la dernière archive)
+# et compare le résultat à ce qui est en base.
+# build() ne fait aucun accès à la base : il rend un RepairPlan (gains / pertes des matchs et
+# profils qui changent, nouveau journal des Elos) qu'on peut afficher puis appliquer tel quel
+# avec DBManager.apply_season_repair, en un seul appel à la fonction Postgres
+# `apply_season_repair` (une transaction).
+
+import numpy as np
+import pandas as pd
+
+import rating_log
+
+PROFILE_COLUMNS = ("elo_rating", "matches_played", "elo_2v2", "matches_2v2")
+
+
+class RepairPlan:
+    """
+    Réparation prête à appliquer :
+      matches : matchs dont le gain / la perte changent, [{id, elo_gain, elo_loss}]
+      old_matches : {match_id: (ancien gain, ancienne perte)}
+      profiles : profils qui changent, lignes complètes [{id, elo_rating, matches_played, elo_2v2, matches_2v2}]
+      old_profiles : {player_id: profil actuel}
+      events : nouveau journal des Elos de tous les matchs rejoués
+      fingerprint : état des matchs validés au moment du calcul (voir DBManager)
+    """
+
+    def __init__(self, matches, old_matches, profiles, old_profiles, events, replayed, fingerprint=None):
+        self.matches = matches
+        self.old_matches = old_matches
+        self.profiles = profiles
+        self.old_profiles = old_profiles
+        self.events = events
+        self.replayed = replayed
+        self.fingerprint = fingerprint
+
+    def __bool__(self):
+        # Le journal est réécrit même sans différence : le plan n'est "vide" que sans match
+        return bool(self.replayed)
+
+    def preview_matches(self):
+        """Matchs corrigés : gain / perte enregistrés et recalculés."""
+        return pd.DataFrame([
+            {
+                "Match": m["id"],
+                "Gain enregistré": self.old_matches[m["id"]][0],
+                "Gain recalculé": m["elo_gain"],
+                "Perte enregistrée": self.old_matches[m["id"]][1],
+                "Perte recalculée": m["elo_loss"],
+            }
+            for m in self.matches
+        ], columns=["Match", "Gain enregistré", "Gain recalculé", "Perte enregistrée", "Perte recalculée"])
+
+    def preview_profiles(self):
+        """Profils corrigés : Elos et compteurs avant / après."""
+        rows = []
+        for p in self.profiles:
+            old = self.old_profiles.get(p["id"], {})
+            rows.append({
+                "Joueur": old.get("username", p["id"]),
+                "Elo 1v1": f"{old.get('elo_rating')} → {p['elo_rating']}",
+                "Matchs 1v1": f"{old.get('matches_played')} → {p['matches_played']}",
+                "Elo 2v2": f"{old.get('elo_2v2')} → {p['elo_2v2']}",
+                "Matchs 2v2": f"{old.get('matches_2v2')} → {p['matches_2v2']}",
+            })
+        return pd.DataFrame(rows, columns=["Joueur", "Elo 1v1", "Matchs 1v1", "Elo 2v2", "Matchs 2v2"])
+
+
+def build(matches, profiles, start_elos_1v1, start_elos_2v2, fingerprint=None, engine=None):
+    """
+    Plan de réparation. matches : matchs validés de la saison, dans l'ordre chronologique ;
+    profiles : profils actuels (id, pseudo, Elos et compteurs). Aucun accès à la base.
+    """
+    replay = rating_log.replay_events(matches, start_elos_1v1, start_elos_2v2, engine=engine)
+
+    # Matchs : comparaison vectorisée des gains / pertes enregistrés et rejoués
+    gains = np.asarray(replay["gains"], dtype=float).astype("int64")
+    losses = np.asarray(replay["losses"], dtype=float).astype("int64")
+    stored = pd.DataFrame(matches, columns=["id", "elo_gain", "elo_loss"])
+    stored_gain = pd.to_numeric(stored["elo_gain"]).to_numpy(dtype=float)
+    stored_loss = pd.to_numeric(stored["elo_loss"]).to_numpy(dtype=float)
+    # Un gain / une perte manquant (NaN) compte comme différent
+    changed = np.flatnonzero(~(stored_gain == gains) | ~(stored_loss == losses))
+    changed_matches = [
+        {"id": matches[i]["id"], "elo_gain": int(gains[i]), "elo_loss": int(losses[i])} for i in changed
+    ]
+    old_matches = {matches[i]["id"]: (matches[i].get("elo_gain"), matches[i].get("elo_loss")) for i in changed}
+
+    # Profils : Elos arrondis et compteurs rejoués, seuls ceux qui changent sont gardés
+    old_profiles = {p["id"]: p for p in profiles}
+    new_values = {}
+    for elo_col, count_col, mode in (("elo_rating", "matches_played", "1v1"), ("elo_2v2", "matches_2v2", "2v2")):
+        elos, counts = replay[f"elo_{mode}"], replay[f"matches_{mode}"]
+        for pid, updates in rating_log.changed_profiles(profiles, elos, counts, elo_col, count_col):
+            new_values.setdefault(pid, {}).update(updates)
+    changed_profiles = [
+        {"id": pid, **{col: old_profiles[pid].get(col) for col in PROFILE_COLUMNS}, **updates}
+        for pid, updates in new_values.items()
+    ]
+
+    return RepairPlan(changed_matches, old_matches, changed_profiles, old_profiles, replay["events"], len(matches), fingerprint)
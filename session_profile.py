@@ -0,0 +1,51 @@
+# --- session_profile.py ---
+# Profil du joueur connecté gardé dans st.session_state, pour ne pas le relire à chaque rerun.
+# Il n'est relu que si sa version a changé (DBManager.profile_version : une écriture qui le
+# concerne, faite par cette session ou par une autre) ou s'il a plus de PROFILE_TTL secondes
+# (écritures faites hors de l'application, ex. depuis l'éditeur Supabase).
+
+import time
+
+import streamlit as st
+
+PROFILE_TTL = 60
+STATE_KEY = "profile_cache"
+
+
+def get_profile(db, user_id, force=False):
+    """Profil du joueur user_id, relu seulement s'il est périmé (ou si force=True)."""
+    entry = st.session_state.get(STATE_KEY)
+    version = db.profile_version(user_id)
+    if (
+        not force
+        and entry
+        and entry["id"] == user_id
+        and entry["version"] == version
+        and time.monotonic() - entry["loaded_at"] < PROFILE_TTL
+    ):
+        return entry["profile"]
+
+    # Version lue AVANT la requête : une écriture pendant la lecture déclenchera une relecture
+    profile = db.get_profile(user_id)
+    if profile:
+        st.session_state[STATE_KEY] = {
+            "id": user_id,
+            "version": version,
+            "loaded_at": time.monotonic(),
+            "profile": profile,
+        }
+    return profile
+
+
+def update_profile(db, user_id, updates):
+    """Écrit des colonnes du profil et les reporte dans le profil en mémoire (sans relecture)."""
+    db.update_profile(user_id, updates)
+    entry = st.session_state.get(STATE_KEY)
+    if entry and entry["id"] == user_id:
+        entry["profile"].update(updates)
+        entry["version"] = db.profile_version(user_id)
+
+
+def forget():
+    """Oublie le profil en mémoire (déconnexion)."""
+    st.session_state.pop(STATE_KEY, None)
@@ -0,0 +1,157 @@
+# --- stats_engine.py ---
+# Statistiques du "📊 Centre de Statistiques" (page Profils) calculées en une passe vectorisée
+# par saison sur le DataFrame des matchs d'un joueur :
+#   courbe Elo : somme cumulée des gains (ou Elos du journal rating_events)
+#   séries : longueur des suites de victoires consécutives (run-length)
+#   marathon / rival : comptages par jour (heure de Paris) et par adversaire
+# Mêmes résultats que l'ancienne boucle match par match de app.py.
+
+import numpy as np
+import pandas as pd
+
+CURRENT_SEASON = "🔥 Saison en cours"
+
+MATCH_COLUMNS = [
+    "id", "winner_id", "winner2_id", "loser_id", "loser2_id",
+    "elo_gain", "elo_loss", "created_at", "status", "season_name",
+]
+
+
+def matches_frame(matches, player_id):
+    """
+    Un match par ligne, dans l'ordre reçu (chronologique) :
+    season, is_win, points (gain ou perte, sans signe), opp_a / opp_b (adversaires), paris (date locale).
+    """
+    df = pd.DataFrame(matches, columns=MATCH_COLUMNS)
+    is_win = df["winner_id"].eq(player_id) | df["winner2_id"].eq(player_id)
+
+    season = df["season_name"].astype(object).where(df["status"].eq("archived"), CURRENT_SEASON)
+    gain = pd.to_numeric(df["elo_gain"]).fillna(0)
+    loss = pd.to_numeric(df["elo_loss"]).fillna(gain)
+    paris = pd.to_datetime(df["created_at"], utc=True, format="ISO8601").dt.tz_convert("Europe/Paris")
+
+    return pd.DataFrame({
+        "id": df["id"],
+        "season": season.where(season.notna(), None),
+        "is_win": is_win.to_numpy(dtype=bool),
+        "points": gain.where(is_win, loss).astype("int64"),
+        "opp_a": df["loser_id"].where(is_win, df["winner_id"]),
+        "opp_b": df["loser2_id"].where(is_win, df["winner2_id"]),
+        "paris": paris,
+    })
+
+
+def longest_run(flags):
+    """Plus longue suite de True consécutifs."""
+    flags = np.asarray(flags, dtype=np.int8)
+    if flags.size == 0:
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], flags, [0]))))
+    return int((edges[1::2] - edges[::2]).max()) if edges.size else 0
+
+
+def most_played(frames, usernames):
+    """Adversaire le plus affronté, "Nom (N matchs)" ; en cas d'égalité, le premier rencontré."""
+    if not frames:
+        return "Aucun"
+    opponents = pd.Series(np.concatenate([np.column_stack([f["opp_a"], f["opp_b"]]).ravel() for f in frames]), dtype=object)
+    opponents = opponents[opponents.notna() & opponents.ne("")]
+    if opponents.empty:
+        return "Aucun"
+    codes, uniques = pd.factorize(opponents)
+    counts = np.bincount(codes)
+    top = int(counts.argmax())
+    return f"{usernames.get(uniques[top], 'Inconnu')} ({int(counts[top])} matchs)"
+
+
+def max_daily(frames):
+    """Record de matchs joués sur une même journée (heure de Paris)."""
+    days = pd.concat([f["paris"].dt.normalize() for f in frames]) if frames else pd.Series(dtype=object)
+    return int(days.value_counts().max()) if len(days) else 0
+
+
+def season_pass(df, end_elo, log):
+    """
+    Courbe et bilan d'une saison. Si tous ses matchs sont dans le journal des Elos (log, indexé
+    par match), on y lit les Elos ; sinon l'Elo de départ est déduit de l'Elo de fin et du gain net.
+    """
+    from_log = len(df) > 0 and bool(df["id"].isin(log.index).all())
+
+    if from_log:
+        before = df["id"].map(log["rating_before"]).to_numpy()
+        elos = df["id"].map(log["rating_after"]).to_numpy()
+        start_elo = before.tolist()[0]
+        delta = np.abs(elos - before)
+        gains = np.where(df["is_win"], delta, -delta)
+    else:
+        gains = np.where(df["is_win"], df["points"], -df["points"])
+        start_elo = end_elo - int(gains.sum())
+        # Somme cumulée depuis l'Elo de départ (même ordre d'addition que match par match)
+        elos = np.cumsum(np.concatenate(([start_elo], gains)))[1:]
+
+    curve = [{"Numéro": 0, "Date": "Début", "Elo": start_elo, "Gain": 0, "Résultat": "-"}]
+    curve += [
+        {"Numéro": i, "Date": date, "Elo": elo, "Gain": gain, "Résultat": "Victoire" if win else "Défaite"}
+        for i, date, elo, gain, win in zip(
+            range(1, len(df) + 1),
+            df["paris"].dt.strftime("%d/%m %Hh%M").tolist(),
+            elos.tolist(),
+            gains.tolist(),
+            df["is_win"].tolist(),
+        )
+    ]
+
+    wins = int(df["is_win"].sum())
+    stats = {
+        "peak": max([start_elo, *elos.tolist()]),
+        "wins": wins,
+        "losses": len(df) - wins,
+        "total": len(df),
+        "start_elo": start_elo,
+        "end_elo": end_elo,
+        "max_day": max_daily([df]),
+        "longest_streak": longest_run(df["is_win"]),
+    }
+    return curve, stats, elos
+
+
+def profile_stats(matches, player_id, season_end_elos, logged_ratings, usernames):
+    """
+    Statistiques du Centre de Statistiques pour les matchs (d'un mode) d'un joueur.
+    season_end_elos : {saison: Elo de fin}, saison en cours puis archives ; les saisons
+    rencontrées dans les matchs sans archive sont ajoutées à la suite (Elo de fin 1000).
+    Retourne (carrière, {saison: bilan}, {saison: courbe}).
+    """
+    frame = matches_frame(matches, player_id)
+    log = pd.DataFrame.from_dict(logged_ratings, orient="index").reindex(columns=["rating_before", "rating_after"])
+
+    seasons = dict(season_end_elos)
+    for name in frame["season"].drop_duplicates():
+        seasons.setdefault(name, 1000)
+
+    season_stats = {}
+    season_curves = {}
+    frames = []
+    all_time_peak = 1000
+    for s_name, end_elo in seasons.items():
+        s_df = frame[frame["season"].eq(s_name)] if s_name is not None else frame[frame["season"].isna()]
+        if s_df.empty and s_name != CURRENT_SEASON:
+            continue
+
+        curve, stats, elos = season_pass(s_df, end_elo, log)
+        stats["most_played"] = most_played([s_df], usernames)
+        season_stats[s_name] = stats
+        season_curves[s_name] = curve
+        if len(elos):
+            all_time_peak = max(all_time_peak, max(elos.tolist()))
+        frames.append(s_df)
+
+    # Séries All-Time : saisons mises bout à bout dans l'ordre ci-dessus
+    career = {
+        "peak": all_time_peak,
+        "wins": int(frame["is_win"].sum()),
+        "max_streak": longest_run(np.concatenate([f["is_win"].to_numpy() for f in frames])) if frames else 0,
+        "most_played": most_played(frames, usernames),
+        "max_day": max_daily(frames),
+    }
+    return career, season_stats, season_curves
@@ -0,0 +1,18 @@
+-- Journal des Elos : une ligne par joueur et par match (avant / après).
+-- Table en ajout seul : un rejeu ajoute de nouvelles lignes, la plus récente fait foi.
+create table if not exists public.rating_events (
+    id bigint generated always as identity primary key,
+    match_id bigint references public.matches (id) on delete cascade,
+    player_id uuid not null references public.profiles (id) on delete cascade,
+    mode text not null default '1v1',
+    kind text not null default 'validate',  -- validate | replay | revoke | reset
+    rating_before double precision not null,
+    rating_after double precision not null,
+    created_at timestamptz not null default now()
+);
+
+create index if not exists rating_events_player_mode_idx
+    on public.rating_events (player_id, mode, id);
+
+create index if not exists rating_events_match_idx
+    on public.rating_events (match_id);
@@ -0,0 +1,17 @@
+-- Points de reprise des Elos : état complet d'un mode après un match donné.
+-- cutoff_at = created_at du dernier match inclus (NULL = début de saison, après le soft reset).
+create table if not exists public.rating_checkpoints (
+    id bigint generated always as identity primary key,
+    mode text not null default '1v1',
+    cutoff_at timestamptz,
+    last_match_id bigint references public.matches (id) on delete set null,
+    ratings jsonb not null,  -- {player_id: Elo}
+    counts jsonb not null,   -- {player_id: matchs joués dans la saison}
+    created_at timestamptz not null default now()
+);
+
+create index if not exists rating_checkpoints_mode_cutoff_idx
+    on public.rating_checkpoints (mode, cutoff_at desc nulls last);
+
+create index if not exists matches_status_mode_created_idx
+    on public.matches (status, mode, created_at);
@@ -0,0 +1,109 @@
+-- Validation d'un match en un seul appel (RPC) et dans une seule transaction :
+-- verrouille le match et les profils, calcule les Elos (mêmes paramètres que EloEngine),
+-- met à jour profils + match, écrit le journal des Elos et invalide les points de reprise périmés.
+-- round(double precision) arrondit au pair le plus proche, comme round() en Python.
+create or replace function public.validate_match(p_match_id bigint)
+returns jsonb
+language plpgsql
+as $$
+declare
+    m public.matches%rowtype;
+    v_mode text;
+    k_win constant double precision := 50;
+    k_loss constant double precision := 30;
+    diviseur constant double precision := 600;
+    w_elo double precision;
+    l_elo double precision;
+    v_gain integer;
+    v_loss integer;
+    v_count integer;
+    v_ratings jsonb;
+begin
+    select * into m from public.matches where id = p_match_id for update;
+    if not found then
+        raise exception 'Match % introuvable', p_match_id;
+    end if;
+
+    v_mode := coalesce(m.mode, '1v1');
+    if m.status = 'validated' then
+        return jsonb_build_object('already_validated', true, 'mode', v_mode);
+    end if;
+
+    -- Verrou des profils, toujours dans le même ordre pour éviter les interblocages
+    perform 1 from public.profiles
+     where id in (m.winner_id, m.loser_id, m.winner2_id, m.loser2_id)
+     order by id
+       for update;
+
+    if v_mode = '2v2' then
+        select (coalesce(a.elo_2v2, 1000) + coalesce(b.elo_2v2, 1000)) / 2.0 into w_elo
+          from public.profiles a, public.profiles b
+         where a.id = m.winner_id and b.id = m.winner2_id;
+        select (coalesce(a.elo_2v2, 1000) + coalesce(b.elo_2v2, 1000)) / 2.0 into l_elo
+          from public.profiles a, public.profiles b
+         where a.id = m.loser_id and b.id = m.loser2_id;
+    else
+        select elo_rating into w_elo from public.profiles where id = m.winner_id;
+        select elo_rating into l_elo from public.profiles where id = m.loser_id;
+    end if;
+
+    if w_elo is null or l_elo is null then
+        raise exception 'Profil introuvable pour le match %', p_match_id;
+    end if;
+
+    v_gain := round(k_win * (1 - 1 / (1 + power(10::double precision, (l_elo - w_elo) / diviseur))));
+    v_loss := abs(round(k_loss * (0 - 1 / (1 + power(10::double precision, (w_elo - l_elo) / diviseur)))));
+
+    -- Journal des Elos (valeurs avant mise à jour)
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select m.id, p.id, v_mode, 'validate', r.elo,
+           r.elo + case when p.id in (m.winner_id, m.winner2_id) then v_gain else -v_loss end
+      from public.profiles p
+     cross join lateral (
+            select case when v_mode = '2v2' then coalesce(p.elo_2v2, 1000) else p.elo_rating end as elo
+           ) r
+     where p.id in (m.winner_id, m.loser_id, m.winner2_id, m.loser2_id);
+
+    if v_mode = '2v2' then
+        update public.profiles
+           set elo_2v2 = coalesce(elo_2v2, 1000) + v_gain, matches_2v2 = coalesce(matches_2v2, 0) + 1
+         where id in (m.winner_id, m.winner2_id);
+        update public.profiles
+           set elo_2v2 = coalesce(elo_2v2, 1000) - v_loss, matches_2v2 = coalesce(matches_2v2, 0) + 1
+         where id in (m.loser_id, m.loser2_id);
+    else
+        update public.profiles
+           set elo_rating = elo_rating + v_gain, matches_played = matches_played + 1
+         where id = m.winner_id;
+        update public.profiles
+           set elo_rating = elo_rating - v_loss, matches_played = matches_played + 1
+         where id = m.loser_id;
+    end if;
+
+    update public.matches
+       set status = 'validated', elo_gain = v_gain, elo_loss = v_loss
+     where id = m.id;
+
+    -- Un point de reprise postérieur à ce match est désormais périmé
+    delete from public.rating_checkpoints
+     where mode = v_mode and cutoff_at > m.created_at;
+
+    -- Nouveaux Elos des joueurs du match (mise à jour de l'index des rangs côté application)
+    select jsonb_object_agg(id, case when v_mode = '2v2' then elo_2v2 else elo_rating end) into v_ratings
+      from public.profiles
+     where id in (m.winner_id, m.loser_id, m.winner2_id, m.loser2_id);
+
+    select count(*) into v_count
+      from public.matches
+     where status = 'validated' and coalesce(mode, '1v1') = v_mode;
+
+    return jsonb_build_object(
+        'already_validated', false,
+        'mode', v_mode,
+        'gain', v_gain,
+        'loss', v_loss,
+        'validated_count', v_count,
+        'ratings', v_ratings
+    );
+end;
+$$;
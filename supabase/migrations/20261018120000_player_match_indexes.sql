@@ -0,0 +1,8 @@
+-- Matchs d'un joueur : DBManager.get_player_matches filtre
+-- winner_id = X or loser_id = X or winner2_id = X or loser2_id = X.
+-- Un index par colonne permet à Postgres de combiner les quatre (BitmapOr)
+-- au lieu de parcourir toute la table des matchs.
+create index if not exists matches_winner_idx on public.matches (winner_id, created_at);
+create index if not exists matches_loser_idx on public.matches (loser_id, created_at);
+create index if not exists matches_winner2_idx on public.matches (winner2_id, created_at) where winner2_id is not null;
+create index if not exists matches_loser2_idx on public.matches (loser2_id, created_at) where loser2_id is not null;
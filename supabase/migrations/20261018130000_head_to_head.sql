@@ -0,0 +1,135 @@
+-- Face-à-face entre deux joueurs (page Comparateur), tenu à jour match par match.
+-- Une ligne par (joueur A, joueur B, mode, relation) du point de vue de A :
+--   relation 'versus'   : A et B dans des équipes opposées
+--   relation 'partners' : A et B dans la même équipe (2v2)
+-- wins / losses : victoires / défaites de A ; elo_swapped : bilan Elo net de A
+-- (versus : +elo_gain gagné, -elo_gain concédé ; partners : +elo_gain, -elo_loss) ;
+-- streak : série en cours (> 0 : victoires de A, < 0 : défaites) ; last_played_at : dernier match.
+-- Chaque paire est stockée dans les deux sens pour une lecture directe.
+create table if not exists public.head_to_head (
+    player_a uuid not null,
+    player_b uuid not null,
+    mode text not null,
+    relation text not null check (relation in ('versus', 'partners')),
+    wins integer not null default 0,
+    losses integer not null default 0,
+    elo_swapped integer not null default 0,
+    streak integer not null default 0,
+    last_played_at timestamptz,
+    primary key (player_a, player_b, mode, relation)
+);
+
+-- Paires d'un match, du point de vue de chaque joueur : (a, b, relation, a a gagné)
+create or replace function public.head_to_head_pairs(m public.matches)
+returns table (player_a uuid, player_b uuid, relation text, won boolean)
+language sql
+immutable
+as $$
+    select w, l, 'versus', true
+      from unnest(array[m.winner_id, m.winner2_id]) w, unnest(array[m.loser_id, m.loser2_id]) l
+     where w is not null and l is not null
+    union all
+    select l, w, 'versus', false
+      from unnest(array[m.winner_id, m.winner2_id]) w, unnest(array[m.loser_id, m.loser2_id]) l
+     where w is not null and l is not null
+    union all
+    select a, b, 'partners', a in (m.winner_id, m.winner2_id)
+      from (values (m.winner_id, m.winner2_id), (m.winner2_id, m.winner_id),
+                   (m.loser_id, m.loser2_id), (m.loser2_id, m.loser_id)) t(a, b)
+     where a is not null and b is not null;
+$$;
+
+-- Série en cours et date du dernier match d'une paire : on remonte ses matchs du plus récent
+-- au plus ancien et on s'arrête au premier changement de vainqueur.
+create or replace function public.head_to_head_refresh_streak(p_a uuid, p_b uuid, p_mode text, p_relation text)
+returns void
+language plpgsql
+as $$
+declare
+    r record;
+    v_streak integer := 0;
+    v_last timestamptz;
+begin
+    for r in
+        select mm.created_at,
+               coalesce(p_a in (mm.winner_id, mm.winner2_id), false) as a_won,
+               coalesce(p_b in (mm.winner_id, mm.winner2_id), false) as b_won
+          from public.matches mm
+         where mm.status in ('validated', 'archived')
+           and coalesce(mm.mode, '1v1') = p_mode
+           and p_a in (mm.winner_id, mm.loser_id, mm.winner2_id, mm.loser2_id)
+           and p_b in (mm.winner_id, mm.loser_id, mm.winner2_id, mm.loser2_id)
+         order by mm.created_at desc, mm.id desc
+    loop
+        continue when (r.a_won <> r.b_won) <> (p_relation = 'versus');
+        if v_last is null then
+            v_last := r.created_at;
+        end if;
+        exit when v_streak <> 0 and (v_streak > 0) <> r.a_won;
+        v_streak := v_streak + case when r.a_won then 1 else -1 end;
+    end loop;
+
+    update public.head_to_head
+       set streak = v_streak, last_played_at = v_last
+     where player_a = p_a and player_b = p_b and mode = p_mode and relation = p_relation;
+end;
+$$;
+
+-- Ajoute (p_sign = 1) ou retire (p_sign = -1) un match des face-à-face de ses joueurs
+create or replace function public.head_to_head_apply(m public.matches, p_sign integer)
+returns void
+language plpgsql
+as $$
+declare
+    p record;
+    v_mode text := coalesce(m.mode, '1v1');
+begin
+    for p in select * from public.head_to_head_pairs(m) loop
+        insert into public.head_to_head as h (player_a, player_b, mode, relation, wins, losses, elo_swapped)
+        values (
+            p.player_a, p.player_b, v_mode, p.relation,
+            case when p.won then p_sign else 0 end,
+            case when p.won then 0 else p_sign end,
+            p_sign * case
+                when p.won then coalesce(m.elo_gain, 0)
+                when p.relation = 'versus' then -coalesce(m.elo_gain, 0)
+                else -coalesce(m.elo_loss, 0)
+            end
+        )
+        on conflict (player_a, player_b, mode, relation) do update
+           set wins = h.wins + excluded.wins,
+               losses = h.losses + excluded.losses,
+               elo_swapped = h.elo_swapped + excluded.elo_swapped;
+
+        perform public.head_to_head_refresh_streak(p.player_a, p.player_b, v_mode, p.relation);
+    end loop;
+end;
+$$;
+
+-- Un match compte dès qu'il est validé (et reste compté une fois archivé) ;
+-- une révocation le retire, un rejeu qui change ses gains le remplace.
+create or replace function public.head_to_head_on_match()
+returns trigger
+language plpgsql
+as $$
+declare
+    was_counted boolean := tg_op = 'UPDATE' and old.status in ('validated', 'archived');
+    is_counted boolean := new.status in ('validated', 'archived');
+begin
+    if is_counted and not was_counted then
+        perform public.head_to_head_apply(new, 1);
+    elsif was_counted and not is_counted then
+        perform public.head_to_head_apply(old, -1);
+    elsif was_counted and is_counted
+          and (old.elo_gain is distinct from new.elo_gain or old.elo_loss is distinct from new.elo_loss) then
+        perform public.head_to_head_apply(old, -1);
+        perform public.head_to_head_apply(new, 1);
+    end if;
+    return new;
+end;
+$$;
+
+drop trigger if exists matches_head_to_head on public.matches;
+create trigger matches_head_to_head
+    after insert or update of status, elo_gain, elo_loss on public.matches
+    for each row execute function public.head_to_head_on_match();
@@ -0,0 +1,152 @@
+-- Statistiques de carrière par joueur (badges du profil), tenues à jour match par match.
+-- Les adversaires uniques et le meilleur binôme se lisent dans head_to_head ;
+-- player_stats garde les compteurs qui dépendent de l'ordre des matchs.
+--   matches / wins : matchs comptés (validés ou archivés, tous modes) et victoires
+--   win_streak : série de victoires en cours
+--   giant_kills : victoires rapportant au moins 30 points
+--   max_daily_matches : record de matchs sur une journée (heure de Paris)
+--   last_day / last_day_matches / last_match_at : état nécessaire à la mise à jour incrémentale
+create table if not exists public.player_stats (
+    player_id uuid primary key,
+    matches integer not null default 0,
+    wins integer not null default 0,
+    win_streak integer not null default 0,
+    giant_kills integer not null default 0,
+    max_daily_matches integer not null default 0,
+    last_day date,
+    last_day_matches integer not null default 0,
+    last_match_at timestamptz
+);
+
+-- Recalcul complet des statistiques d'un joueur depuis ses matchs
+create or replace function public.player_stats_refresh(p_player uuid)
+returns void
+language plpgsql
+as $$
+declare
+    r record;
+    v_streak integer := 0;
+begin
+    insert into public.player_stats (player_id) values (p_player) on conflict do nothing;
+
+    update public.player_stats s
+       set matches = a.matches,
+           wins = a.wins,
+           giant_kills = a.giant_kills,
+           last_match_at = a.last_match_at
+      from (
+            select count(*) as matches,
+                   count(*) filter (where p_player in (winner_id, winner2_id)) as wins,
+                   count(*) filter (where p_player in (winner_id, winner2_id) and coalesce(elo_gain, 0) >= 30) as giant_kills,
+                   max(created_at) as last_match_at
+              from public.matches
+             where status in ('validated', 'archived')
+               and p_player in (winner_id, loser_id, winner2_id, loser2_id)
+           ) a
+     where s.player_id = p_player;
+
+    update public.player_stats s
+       set max_daily_matches = coalesce(d.max_daily, 0),
+           last_day = d.last_day,
+           last_day_matches = coalesce(d.last_count, 0)
+      from (
+            select max(n) as max_daily,
+                   (array_agg(day order by day desc))[1] as last_day,
+                   (array_agg(n order by day desc))[1] as last_count
+              from (
+                    select (created_at at time zone 'Europe/Paris')::date as day, count(*) as n
+                      from public.matches
+                     where status in ('validated', 'archived')
+                       and p_player in (winner_id, loser_id, winner2_id, loser2_id)
+                     group by 1
+                   ) t
+           ) d
+     where s.player_id = p_player;
+
+    for r in
+        select coalesce(p_player in (winner_id, winner2_id), false) as won
+          from public.matches
+         where status in ('validated', 'archived')
+           and p_player in (winner_id, loser_id, winner2_id, loser2_id)
+         order by created_at desc, id desc
+    loop
+        exit when not r.won;
+        v_streak := v_streak + 1;
+    end loop;
+
+    update public.player_stats set win_streak = v_streak where player_id = p_player;
+end;
+$$;
+
+-- Ajout d'un match en O(1) par joueur (recalcul complet si le match est plus ancien
+-- que le dernier match compté : la série et le record du jour en dépendent)
+create or replace function public.player_stats_add(m public.matches)
+returns void
+language plpgsql
+as $$
+declare
+    pid uuid;
+    v_won boolean;
+    v_day date := (m.created_at at time zone 'Europe/Paris')::date;
+    v_last timestamptz;
+begin
+    foreach pid in array array[m.winner_id, m.winner2_id, m.loser_id, m.loser2_id] loop
+        continue when pid is null;
+        v_won := coalesce(pid in (m.winner_id, m.winner2_id), false);
+
+        insert into public.player_stats (player_id) values (pid) on conflict do nothing;
+        select last_match_at into v_last from public.player_stats where player_id = pid for update;
+
+        if v_last is not null and m.created_at < v_last then
+            perform public.player_stats_refresh(pid);
+            continue;
+        end if;
+
+        update public.player_stats
+           set matches = matches + 1,
+               wins = wins + case when v_won then 1 else 0 end,
+               win_streak = case when v_won then win_streak + 1 else 0 end,
+               giant_kills = giant_kills + case when v_won and coalesce(m.elo_gain, 0) >= 30 then 1 else 0 end,
+               max_daily_matches = greatest(max_daily_matches, case when last_day = v_day then last_day_matches + 1 else 1 end),
+               last_day_matches = case when last_day = v_day then last_day_matches + 1 else 1 end,
+               last_day = v_day,
+               last_match_at = m.created_at
+         where player_id = pid;
+    end loop;
+end;
+$$;
+
+-- Validation : ajout incrémental ; révocation : recalcul des joueurs du match ;
+-- rejeu (elo_gain modifié) : seul le compteur giant_kills des vainqueurs peut bouger.
+create or replace function public.player_stats_on_match()
+returns trigger
+language plpgsql
+as $$
+declare
+    was_counted boolean := tg_op = 'UPDATE' and old.status in ('validated', 'archived');
+    is_counted boolean := new.status in ('validated', 'archived');
+    pid uuid;
+begin
+    if is_counted and not was_counted then
+        perform public.player_stats_add(new);
+    elsif was_counted and not is_counted then
+        foreach pid in array array[old.winner_id, old.winner2_id, old.loser_id, old.loser2_id] loop
+            if pid is not null then
+                perform public.player_stats_refresh(pid);
+            end if;
+        end loop;
+    elsif was_counted and is_counted and old.elo_gain is distinct from new.elo_gain then
+        update public.player_stats
+           set giant_kills = giant_kills
+               + (case when coalesce(new.elo_gain, 0) >= 30 then 1 else 0 end)
+               - (case when coalesce(old.elo_gain, 0) >= 30 then 1 else 0 end)
+         where player_id in (new.winner_id, new.winner2_id);
+    end if;
+    return new;
+end;
+$$;
+
+drop trigger if exists matches_player_stats on public.matches;
+create trigger matches_player_stats
+    after insert or update of status, elo_gain on public.matches
+    for each row execute function public.player_stats_on_match();
@@ -0,0 +1,93 @@
+-- Clôture de saison d'un mode en un seul appel (RPC) et dans une seule transaction.
+-- Les valeurs sont calculées côté application (season_close.py) ; la fonction les applique
+-- en bloc : profils (soft reset, compteurs, rang, titres), archives, journal des Elos,
+-- point de reprise de début de saison et archivage des matchs.
+-- season_closures rend l'appel idempotent : une clôture déjà faite (même clé) n'est pas rejouée.
+create table if not exists public.season_closures (
+    close_key text primary key,  -- "<saison>/<mode>"
+    season_name text not null,
+    mode text not null,
+    players integer not null default 0,
+    matches integer not null default 0,
+    closed_at timestamptz not null default now()
+);
+
+create or replace function public.close_season(
+    p_close_key text,
+    p_season text,
+    p_mode text,
+    p_profiles jsonb,  -- [{id, <colonnes du profil à écrire>}]
+    p_archives jsonb,  -- lignes de season_archives
+    p_events jsonb,    -- lignes de rating_events (kind = 'reset')
+    p_ratings jsonb    -- {player_id: Elo de départ} (point de reprise)
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_players integer;
+    v_matches integer;
+begin
+    insert into public.season_closures (close_key, season_name, mode)
+    values (p_close_key, p_season, p_mode)
+    on conflict (close_key) do nothing;
+    if not found then
+        return jsonb_build_object('already_closed', true);
+    end if;
+
+    -- jsonb_populate_recordset convertit chaque valeur au type de sa colonne dans profiles
+    if p_mode = '2v2' then
+        update public.profiles p
+           set elo_2v2 = r.elo_2v2,
+               matches_2v2 = r.matches_2v2,
+               current_rank_id_2v2 = r.current_rank_id_2v2,
+               last_seen_elo_2v2 = r.last_seen_elo_2v2,
+               unlocked_titles = r.unlocked_titles
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    else
+        update public.profiles p
+           set elo_rating = r.elo_rating,
+               matches_played = r.matches_played,
+               current_rank_id_1v1 = r.current_rank_id_1v1,
+               last_seen_elo_1v1 = r.last_seen_elo_1v1,
+               unlocked_titles = r.unlocked_titles
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    end if;
+    get diagnostics v_players = row_count;
+
+    insert into public.season_archives (season_name, player_id, username, final_elo, matches_played, final_rank, mode)
+    select season_name, player_id, username, final_elo, matches_played, final_rank, mode
+      from jsonb_populate_recordset(null::public.season_archives, p_archives);
+
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select match_id, player_id, mode, kind, rating_before, rating_after
+      from jsonb_populate_recordset(null::public.rating_events, p_events);
+
+    -- Nouveau point de reprise de début de saison (les anciens ne servent plus)
+    delete from public.rating_checkpoints where mode = p_mode;
+    insert into public.rating_checkpoints (mode, cutoff_at, ratings, counts)
+    values (
+        p_mode,
+        null,
+        p_ratings,
+        coalesce((select jsonb_object_agg(key, 0) from jsonb_object_keys(p_ratings) key), '{}'::jsonb)
+    );
+
+    update public.matches
+       set status = 'archived', season_name = p_season
+     where status = 'validated' and mode = p_mode;
+    get diagnostics v_matches = row_count;
+
+    update public.season_closures
+       set players = v_players, matches = v_matches
+     where close_key = p_close_key;
+
+    return jsonb_build_object(
+        'already_closed', false,
+        'players', v_players,
+        'matches', v_matches
+    );
+end;
+$$;
@@ -0,0 +1,40 @@
+-- Application d'une réparation de saison en un seul appel (RPC) et dans une seule transaction.
+-- Le rejeu est calculé côté application (season_repair.py) ; la fonction écrit en bloc
+-- les gains / pertes corrigés, les profils corrigés et le nouveau journal des Elos,
+-- puis supprime les points de reprise intermédiaires (celui du début de saison est gardé).
+create or replace function public.apply_season_repair(
+    p_matches jsonb,   -- [{id, elo_gain, elo_loss}]
+    p_profiles jsonb,  -- [{id, elo_rating, matches_played, elo_2v2, matches_2v2}]
+    p_events jsonb     -- lignes de rating_events (kind = 'replay')
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_matches integer;
+    v_profiles integer;
+begin
+    update public.matches m
+       set elo_gain = r.elo_gain, elo_loss = r.elo_loss
+      from jsonb_populate_recordset(null::public.matches, p_matches) r
+     where m.id = r.id;
+    get diagnostics v_matches = row_count;
+
+    update public.profiles p
+       set elo_rating = r.elo_rating,
+           matches_played = r.matches_played,
+           elo_2v2 = r.elo_2v2,
+           matches_2v2 = r.matches_2v2
+      from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+     where p.id = r.id;
+    get diagnostics v_profiles = row_count;
+
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select match_id, player_id, mode, kind, rating_before, rating_after
+      from jsonb_populate_recordset(null::public.rating_events, p_events);
+
+    delete from public.rating_checkpoints where cutoff_at is not null;
+
+    return jsonb_build_object('matches', v_matches, 'profiles', v_profiles);
+end;
+$$;
@@ -0,0 +1,115 @@
+-- Titres débloqués : une ligne par (joueur, titre) au lieu du tableau profiles.unlocked_titles.
+-- La clé primaire rend l'attribution idempotente : un lot de titres (podium, saison) s'ajoute
+-- en une seule requête "insert ... on conflict do nothing", sans relire ni réécrire le profil.
+-- profiles.equipped_title référence un titre débloqué du joueur : retirer un titre le déséquipe.
+create table if not exists public.player_titles (
+    player_id uuid not null references public.profiles (id) on delete cascade,
+    title text not null,
+    granted_at timestamptz not null default now(),
+    primary key (player_id, title)
+);
+
+-- Reprise des tableaux existants (text[] ou jsonb), titres équipés compris
+insert into public.player_titles (player_id, title)
+select p.id, t.title
+  from public.profiles p
+ cross join lateral jsonb_array_elements_text(coalesce(to_jsonb(p.unlocked_titles), '[]'::jsonb)) as t(title)
+on conflict do nothing;
+
+insert into public.player_titles (player_id, title)
+select id, equipped_title
+  from public.profiles
+ where equipped_title is not null
+on conflict do nothing;
+
+alter table public.profiles
+    add constraint profiles_equipped_title_fkey
+    foreign key (id, equipped_title) references public.player_titles (player_id, title)
+    on delete set null (equipped_title);
+
+-- close_season (20261018150000) écrivait unlocked_titles : les titres passent désormais par p_titles
+drop function if exists public.close_season(text, text, text, jsonb, jsonb, jsonb, jsonb);
+
+create or replace function public.close_season(
+    p_close_key text,
+    p_season text,
+    p_mode text,
+    p_profiles jsonb,  -- [{id, <colonnes du profil à écrire>}]
+    p_archives jsonb,  -- lignes de season_archives
+    p_events jsonb,    -- lignes de rating_events (kind = 'reset')
+    p_ratings jsonb,   -- {player_id: Elo de départ} (point de reprise)
+    p_titles jsonb     -- [{player_id, title}] titres de rang et de podium
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_players integer;
+    v_matches integer;
+begin
+    insert into public.season_closures (close_key, season_name, mode)
+    values (p_close_key, p_season, p_mode)
+    on conflict (close_key) do nothing;
+    if not found then
+        return jsonb_build_object('already_closed', true);
+    end if;
+
+    if p_mode = '2v2' then
+        update public.profiles p
+           set elo_2v2 = r.elo_2v2,
+               matches_2v2 = r.matches_2v2,
+               current_rank_id_2v2 = r.current_rank_id_2v2,
+               last_seen_elo_2v2 = r.last_seen_elo_2v2
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    else
+        update public.profiles p
+           set elo_rating = r.elo_rating,
+               matches_played = r.matches_played,
+               current_rank_id_1v1 = r.current_rank_id_1v1,
+               last_seen_elo_1v1 = r.last_seen_elo_1v1
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    end if;
+    get diagnostics v_players = row_count;
+
+    insert into public.player_titles (player_id, title)
+    select player_id, title
+      from jsonb_populate_recordset(null::public.player_titles, p_titles)
+    on conflict do nothing;
+
+    insert into public.season_archives (season_name, player_id, username, final_elo, matches_played, final_rank, mode)
+    select season_name, player_id, username, final_elo, matches_played, final_rank, mode
+      from jsonb_populate_recordset(null::public.season_archives, p_archives);
+
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select match_id, player_id, mode, kind, rating_before, rating_after
+      from jsonb_populate_recordset(null::public.rating_events, p_events);
+
+    delete from public.rating_checkpoints where mode = p_mode;
+    insert into public.rating_checkpoints (mode, cutoff_at, ratings, counts)
+    values (
+        p_mode,
+        null,
+        p_ratings,
+        coalesce((select jsonb_object_agg(key, 0) from jsonb_object_keys(p_ratings) key), '{}'::jsonb)
+    );
+
+    update public.matches
+       set status = 'archived', season_name = p_season
+     where status = 'validated' and mode = p_mode;
+    get diagnostics v_matches = row_count;
+
+    update public.season_closures
+       set players = v_players, matches = v_matches
+     where close_key = p_close_key;
+
+    return jsonb_build_object(
+        'already_closed', false,
+        'players', v_players,
+        'matches', v_matches
+    );
+end;
+$$;
+
+alter table public.profiles drop column if exists unlocked_titles;
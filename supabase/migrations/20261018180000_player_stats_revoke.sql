@@ -0,0 +1,271 @@
+-- Révocation d'un match en O(1) par joueur : au lieu de relire tous ses matchs
+-- (player_stats_refresh), on retire le match des compteurs sur place.
+--   matches / wins / giant_kills : décrémentés (giant_kills d'après l'ancien elo_gain)
+--   player_stats_daily : nombre de matchs par jour joué ; le record du jour et le dernier jour
+--     se relisent dans cette table (une ligne par jour) quand le jour retiré les portait
+--   last_loss_at / last_loss_id : défaite qui a lancé la série en cours
+--     victoire retirée après cette défaite : win_streak - 1
+--     cette défaite retirée : la série rejoint la précédente, relue depuis le match le plus
+--       récent jusqu'à la défaite d'avant (player_stats_rescan_streak, bornée par la série)
+--     match plus ancien : la série ne bouge pas
+-- Un match validé plus ancien que le dernier match compté suit les mêmes règles
+-- (il n'y a plus de recalcul complet dans le trigger).
+-- player_stats_refresh reste le recalcul complet d'un joueur (reprise des données, réparation).
+alter table public.player_stats
+    add column if not exists last_loss_at timestamptz,
+    add column if not exists last_loss_id bigint;
+
+create table if not exists public.player_stats_daily (
+    player_id uuid not null,
+    day date not null,
+    matches integer not null,
+    primary key (player_id, day)
+);
+
+-- Matchs comptés d'un joueur, du plus récent au plus ancien.
+-- Une branche par colonne : chacune suit son index (winner_id, created_at) etc. (20261018120000),
+-- une boucle qui s'arrête tôt ne lit donc que les derniers matchs.
+create or replace function public.player_stats_recent(p_player uuid)
+returns table (id bigint, created_at timestamptz, won boolean)
+language sql
+stable
+as $$
+    select id, created_at, won
+      from (
+            select id, created_at, true as won from public.matches
+             where winner_id = p_player and status in ('validated', 'archived')
+            union all
+            select id, created_at, true from public.matches
+             where winner2_id = p_player and status in ('validated', 'archived')
+            union all
+            select id, created_at, false from public.matches
+             where loser_id = p_player and status in ('validated', 'archived')
+            union all
+            select id, created_at, false from public.matches
+             where loser2_id = p_player and status in ('validated', 'archived')
+           ) t
+     order by created_at desc, id desc
+$$;
+
+-- Série en cours : victoires depuis la dernière défaite (lecture arrêtée à cette défaite)
+create or replace function public.player_stats_rescan_streak(p_player uuid)
+returns void
+language plpgsql
+as $$
+declare
+    r record;
+    v_streak integer := 0;
+    v_loss_at timestamptz;
+    v_loss_id bigint;
+begin
+    for r in select * from public.player_stats_recent(p_player) loop
+        if not r.won then
+            v_loss_at := r.created_at;
+            v_loss_id := r.id;
+            exit;
+        end if;
+        v_streak := v_streak + 1;
+    end loop;
+
+    update public.player_stats
+       set win_streak = v_streak,
+           last_loss_at = v_loss_at,
+           last_loss_id = v_loss_id
+     where player_id = p_player;
+end;
+$$;
+
+-- Recalcul complet d'un joueur, player_stats_daily et dernière défaite compris
+create or replace function public.player_stats_refresh(p_player uuid)
+returns void
+language plpgsql
+as $$
+begin
+    insert into public.player_stats (player_id) values (p_player) on conflict do nothing;
+
+    delete from public.player_stats_daily where player_id = p_player;
+    insert into public.player_stats_daily (player_id, day, matches)
+    select p_player, (created_at at time zone 'Europe/Paris')::date, count(*)
+      from public.matches
+     where status in ('validated', 'archived')
+       and p_player in (winner_id, loser_id, winner2_id, loser2_id)
+     group by 2;
+
+    update public.player_stats s
+       set matches = a.matches,
+           wins = a.wins,
+           giant_kills = a.giant_kills,
+           last_match_at = a.last_match_at
+      from (
+            select count(*) as matches,
+                   count(*) filter (where p_player in (winner_id, winner2_id)) as wins,
+                   count(*) filter (where p_player in (winner_id, winner2_id) and coalesce(elo_gain, 0) >= 30) as giant_kills,
+                   max(created_at) as last_match_at
+              from public.matches
+             where status in ('validated', 'archived')
+               and p_player in (winner_id, loser_id, winner2_id, loser2_id)
+           ) a
+     where s.player_id = p_player;
+
+    update public.player_stats s
+       set max_daily_matches = coalesce(d.max_daily, 0),
+           last_day = d.last_day,
+           last_day_matches = coalesce(d.last_count, 0)
+      from (
+            select max(matches) as max_daily,
+                   (array_agg(day order by day desc))[1] as last_day,
+                   (array_agg(matches order by day desc))[1] as last_count
+              from public.player_stats_daily
+             where player_id = p_player
+           ) d
+     where s.player_id = p_player;
+
+    perform public.player_stats_rescan_streak(p_player);
+end;
+$$;
+
+-- Ajout d'un match en O(1) par joueur, quelle que soit sa date
+-- (une défaite plus ancienne que le dernier match relit seulement la série)
+create or replace function public.player_stats_add(m public.matches)
+returns void
+language plpgsql
+as $$
+declare
+    pid uuid;
+    s public.player_stats;
+    v_won boolean;
+    v_day date := (m.created_at at time zone 'Europe/Paris')::date;
+    v_day_matches integer;
+begin
+    foreach pid in array array[m.winner_id, m.winner2_id, m.loser_id, m.loser2_id] loop
+        continue when pid is null;
+        v_won := coalesce(pid in (m.winner_id, m.winner2_id), false);
+
+        insert into public.player_stats (player_id) values (pid) on conflict do nothing;
+        select * into s from public.player_stats where player_id = pid for update;
+
+        insert into public.player_stats_daily (player_id, day, matches)
+        values (pid, v_day, 1)
+        on conflict (player_id, day) do update set matches = public.player_stats_daily.matches + 1
+        returning matches into v_day_matches;
+
+        update public.player_stats
+           set matches = matches + 1,
+               wins = wins + case when v_won then 1 else 0 end,
+               giant_kills = giant_kills + case when v_won and coalesce(m.elo_gain, 0) >= 30 then 1 else 0 end,
+               max_daily_matches = greatest(max_daily_matches, v_day_matches),
+               last_day_matches = case when last_day is null or v_day >= last_day then v_day_matches else last_day_matches end,
+               last_day = greatest(last_day, v_day),
+               last_match_at = greatest(last_match_at, m.created_at)
+         where player_id = pid;
+
+        -- Série : seuls les matchs postérieurs à la dernière défaite la changent
+        if s.last_loss_id is null or (m.created_at, m.id) > (s.last_loss_at, s.last_loss_id) then
+            if v_won then
+                update public.player_stats set win_streak = win_streak + 1 where player_id = pid;
+            elsif s.last_match_at is null or m.created_at > s.last_match_at then
+                update public.player_stats
+                   set win_streak = 0, last_loss_at = m.created_at, last_loss_id = m.id
+                 where player_id = pid;
+            else
+                perform public.player_stats_rescan_streak(pid);
+            end if;
+        end if;
+    end loop;
+end;
+$$;
+
+-- Retrait d'un match (révocation) en O(1) par joueur
+create or replace function public.player_stats_remove(m public.matches)
+returns void
+language plpgsql
+as $$
+declare
+    pid uuid;
+    s public.player_stats;
+    v_won boolean;
+    v_day date := (m.created_at at time zone 'Europe/Paris')::date;
+    v_day_matches integer;
+    v_in_streak boolean;
+    v_last_day date;
+    v_last_day_matches integer;
+begin
+    foreach pid in array array[m.winner_id, m.winner2_id, m.loser_id, m.loser2_id] loop
+        continue when pid is null;
+        select * into s from public.player_stats where player_id = pid for update;
+        continue when not found;
+        v_won := coalesce(pid in (m.winner_id, m.winner2_id), false);
+        v_in_streak := s.last_loss_id is null or (m.created_at, m.id) > (s.last_loss_at, s.last_loss_id);
+
+        update public.player_stats_daily
+           set matches = matches - 1
+         where player_id = pid and day = v_day
+        returning matches into v_day_matches;
+        delete from public.player_stats_daily where player_id = pid and day = v_day and matches <= 0;
+
+        update public.player_stats
+           set matches = matches - 1,
+               wins = wins - case when v_won then 1 else 0 end,
+               giant_kills = giant_kills - case when v_won and coalesce(m.elo_gain, 0) >= 30 then 1 else 0 end,
+               win_streak = win_streak - case when v_won and v_in_streak then 1 else 0 end
+         where player_id = pid;
+
+        -- La défaite qui a lancé la série disparaît : la série rejoint la précédente
+        if not v_won and m.id = s.last_loss_id then
+            perform public.player_stats_rescan_streak(pid);
+        end if;
+
+        -- Record du jour / dernier jour : relus dans player_stats_daily si ce jour les portait
+        if coalesce(v_day_matches, 0) + 1 >= s.max_daily_matches then
+            update public.player_stats
+               set max_daily_matches = coalesce((select max(matches) from public.player_stats_daily where player_id = pid), 0)
+             where player_id = pid;
+        end if;
+        if v_day = s.last_day then
+            select day, matches into v_last_day, v_last_day_matches
+              from public.player_stats_daily
+             where player_id = pid
+             order by day desc
+             limit 1;
+            update public.player_stats
+               set last_day = v_last_day, last_day_matches = coalesce(v_last_day_matches, 0)
+             where player_id = pid;
+        end if;
+
+        -- Dernier match compté : le suivant dans l'ordre, si c'était lui
+        if m.created_at >= s.last_match_at then
+            update public.player_stats
+               set last_match_at = (select created_at from public.player_stats_recent(pid) limit 1)
+             where player_id = pid;
+        end if;
+    end loop;
+end;
+$$;
+
+-- Validation : player_stats_add ; révocation : player_stats_remove ;
+-- rejeu (elo_gain modifié) : seul le compteur giant_kills des vainqueurs peut bouger.
+create or replace function public.player_stats_on_match()
+returns trigger
+language plpgsql
+as $$
+declare
+    was_counted boolean := tg_op = 'UPDATE' and old.status in ('validated', 'archived');
+    is_counted boolean := new.status in ('validated', 'archived');
+begin
+    if is_counted and not was_counted then
+        perform public.player_stats_add(new);
+    elsif was_counted and not is_counted then
+        perform public.player_stats_remove(old);
+    elsif was_counted and is_counted and old.elo_gain is distinct from new.elo_gain then
+        update public.player_stats
+           set giant_kills = giant_kills
+               + (case when coalesce(new.elo_gain, 0) >= 30 then 1 else 0 end)
+               - (case when coalesce(old.elo_gain, 0) >= 30 then 1 else 0 end)
+         where player_id in (new.winner_id, new.winner2_id);
+    end if;
+    return new;
+end;
+$$;
+
+-- Reprise : jours joués et dernière défaite des joueurs existants
+select public.player_stats_refresh(player_id) from public.player_stats;
@@ -0,0 +1,76 @@
+-- Révocation d'un match en un seul appel (RPC) et dans une seule transaction.
+-- Le rejeu des matchs suivants (sans le match révoqué) est calculé côté application
+-- (DBManager.revoke_match) ; la fonction vérifie que ce calcul est à jour, passe le match
+-- en 'revoked', supprime les points de reprise postérieurs et écrit en bloc les gains / pertes
+-- et les profils qui changent, puis le journal des Elos. Une erreur n'écrit rien.
+create or replace function public.revoke_match(
+    p_match_id bigint,
+    p_validated integer,     -- matchs validés du mode au moment du calcul...
+    p_last_match_id bigint,  -- ... et id du plus récent (DBManager.validated_fingerprint)
+    p_matches jsonb,         -- [{id, elo_gain, elo_loss}]
+    p_profiles jsonb,        -- [{id, <colonne Elo>, <colonne compteur>}] du mode
+    p_events jsonb           -- lignes de rating_events (kind = 'revoke' et 'replay')
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    m public.matches;
+    v_mode text;
+    v_validated integer;
+    v_last bigint;
+    v_matches integer;
+    v_profiles integer;
+begin
+    select * into m from public.matches where id = p_match_id for update;
+    if not found then
+        raise exception 'Match % introuvable', p_match_id;
+    end if;
+    if m.status <> 'validated' then
+        return jsonb_build_object('revoked', false, 'stale', false);
+    end if;
+    v_mode := coalesce(m.mode, '1v1');
+
+    -- Un match validé ou révoqué depuis le calcul rend le rejeu faux
+    select count(*), max(id) into v_validated, v_last
+      from public.matches
+     where status = 'validated' and mode = v_mode;
+    if v_validated <> p_validated or v_last is distinct from p_last_match_id then
+        return jsonb_build_object('revoked', false, 'stale', true);
+    end if;
+
+    update public.matches set status = 'revoked' where id = p_match_id;
+
+    delete from public.rating_checkpoints
+     where mode = v_mode and cutoff_at >= m.created_at;
+
+    update public.matches t
+       set elo_gain = r.elo_gain, elo_loss = r.elo_loss
+      from jsonb_populate_recordset(null::public.matches, p_matches) r
+     where t.id = r.id;
+    get diagnostics v_matches = row_count;
+
+    if v_mode = '2v2' then
+        update public.profiles p
+           set elo_2v2 = r.elo_2v2, matches_2v2 = r.matches_2v2
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    else
+        update public.profiles p
+           set elo_rating = r.elo_rating, matches_played = r.matches_played
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    end if;
+    get diagnostics v_profiles = row_count;
+
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select match_id, player_id, mode, kind, rating_before, rating_after
+      from jsonb_populate_recordset(null::public.rating_events, p_events);
+
+    return jsonb_build_object(
+        'revoked', true,
+        'matches', v_matches,
+        'profiles', v_profiles
+    );
+end;
+$$;
@@ -0,0 +1,167 @@
+-- Plans de clôture et de réparation : le contrôle de fraîcheur passe dans la transaction.
+-- Le plan est calculé côté application sur un état des matchs validés (nombre, id le plus
+-- récent : DBManager.validated_fingerprint). Vérifié dans une requête séparée, avant le RPC,
+-- un match validé ou révoqué entre les deux appels était écrasé par des valeurs absolues
+-- calculées sur l'ancien état. Les deux fonctions verrouillent désormais la table matches
+-- (validations et révocations attendent la fin de la transaction), comparent l'empreinte
+-- puis écrivent ; un plan périmé ne modifie rien ('stale' = true).
+-- p_validated null : pas de contrôle (plan sans empreinte).
+-- Matchs sans mode (anciennes lignes) : comptés en 1v1, comme validate_match.
+
+drop function if exists public.apply_season_repair(jsonb, jsonb, jsonb);
+
+create or replace function public.apply_season_repair(
+    p_validated integer,     -- matchs validés (tous modes) au moment du calcul...
+    p_last_match_id bigint,  -- ... et id du plus récent
+    p_matches jsonb,         -- [{id, elo_gain, elo_loss}]
+    p_profiles jsonb,        -- [{id, elo_rating, matches_played, elo_2v2, matches_2v2}]
+    p_events jsonb           -- lignes de rating_events (kind = 'replay')
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_validated integer;
+    v_last bigint;
+    v_matches integer;
+    v_profiles integer;
+begin
+    lock table public.matches in share row exclusive mode;
+    if p_validated is not null then
+        select count(*), max(id) into v_validated, v_last
+          from public.matches
+         where status = 'validated';
+        if v_validated <> p_validated or v_last is distinct from p_last_match_id then
+            return jsonb_build_object('stale', true);
+        end if;
+    end if;
+
+    update public.matches m
+       set elo_gain = r.elo_gain, elo_loss = r.elo_loss
+      from jsonb_populate_recordset(null::public.matches, p_matches) r
+     where m.id = r.id;
+    get diagnostics v_matches = row_count;
+
+    update public.profiles p
+       set elo_rating = r.elo_rating,
+           matches_played = r.matches_played,
+           elo_2v2 = r.elo_2v2,
+           matches_2v2 = r.matches_2v2
+      from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+     where p.id = r.id;
+    get diagnostics v_profiles = row_count;
+
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select match_id, player_id, mode, kind, rating_before, rating_after
+      from jsonb_populate_recordset(null::public.rating_events, p_events);
+
+    delete from public.rating_checkpoints where cutoff_at is not null;
+
+    return jsonb_build_object('stale', false, 'matches', v_matches, 'profiles', v_profiles);
+end;
+$$;
+
+drop function if exists public.close_season(text, text, text, jsonb, jsonb, jsonb, jsonb, jsonb);
+
+create or replace function public.close_season(
+    p_close_key text,
+    p_season text,
+    p_mode text,
+    p_validated integer,     -- matchs validés du mode au moment du calcul...
+    p_last_match_id bigint,  -- ... et id du plus récent
+    p_profiles jsonb,        -- [{id, <colonnes du profil à écrire>}]
+    p_archives jsonb,        -- lignes de season_archives
+    p_events jsonb,          -- lignes de rating_events (kind = 'reset')
+    p_ratings jsonb,         -- {player_id: Elo de départ} (point de reprise)
+    p_titles jsonb           -- [{player_id, title}] titres de rang et de podium
+)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_validated integer;
+    v_last bigint;
+    v_players integer;
+    v_matches integer;
+begin
+    lock table public.matches in share row exclusive mode;
+
+    -- Clôture déjà faite : la clé passe avant l'empreinte, que la clôture a forcément changée
+    if exists (select 1 from public.season_closures where close_key = p_close_key) then
+        return jsonb_build_object('already_closed', true, 'stale', false);
+    end if;
+
+    if p_validated is not null then
+        select count(*), max(id) into v_validated, v_last
+          from public.matches
+         where status = 'validated' and coalesce(mode, '1v1') = p_mode;
+        if v_validated <> p_validated or v_last is distinct from p_last_match_id then
+            return jsonb_build_object('already_closed', false, 'stale', true);
+        end if;
+    end if;
+
+    insert into public.season_closures (close_key, season_name, mode)
+    values (p_close_key, p_season, p_mode)
+    on conflict (close_key) do nothing;
+    if not found then
+        return jsonb_build_object('already_closed', true, 'stale', false);
+    end if;
+
+    if p_mode = '2v2' then
+        update public.profiles p
+           set elo_2v2 = r.elo_2v2,
+               matches_2v2 = r.matches_2v2,
+               current_rank_id_2v2 = r.current_rank_id_2v2,
+               last_seen_elo_2v2 = r.last_seen_elo_2v2
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    else
+        update public.profiles p
+           set elo_rating = r.elo_rating,
+               matches_played = r.matches_played,
+               current_rank_id_1v1 = r.current_rank_id_1v1,
+               last_seen_elo_1v1 = r.last_seen_elo_1v1
+          from jsonb_populate_recordset(null::public.profiles, p_profiles) r
+         where p.id = r.id;
+    end if;
+    get diagnostics v_players = row_count;
+
+    insert into public.player_titles (player_id, title)
+    select player_id, title
+      from jsonb_populate_recordset(null::public.player_titles, p_titles)
+    on conflict do nothing;
+
+    insert into public.season_archives (season_name, player_id, username, final_elo, matches_played, final_rank, mode)
+    select season_name, player_id, username, final_elo, matches_played, final_rank, mode
+      from jsonb_populate_recordset(null::public.season_archives, p_archives);
+
+    insert into public.rating_events (match_id, player_id, mode, kind, rating_before, rating_after)
+    select match_id, player_id, mode, kind, rating_before, rating_after
+      from jsonb_populate_recordset(null::public.rating_events, p_events);
+
+    delete from public.rating_checkpoints where mode = p_mode;
+    insert into public.rating_checkpoints (mode, cutoff_at, ratings, counts)
+    values (
+        p_mode,
+        null,
+        p_ratings,
+        coalesce((select jsonb_object_agg(key, 0) from jsonb_object_keys(p_ratings) key), '{}'::jsonb)
+    );
+
+    update public.matches
+       set status = 'archived', season_name = p_season
+     where status = 'validated' and coalesce(mode, '1v1') = p_mode;
+    get diagnostics v_matches = row_count;
+
+    update public.season_closures
+       set players = v_players, matches = v_matches
+     where close_key = p_close_key;
+
+    return jsonb_build_object(
+        'already_closed', false,
+        'stale', false,
+        'players', v_players,
+        'matches', v_matches
+    );
+end;
+$$;
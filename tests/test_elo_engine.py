@@ -0,0 +1,144 @@
+# --- tests/test_elo_engine.py ---
+# Les calculs vectorisés (compute_batch, compute_team_batch, replay_season et son découpage
+# en vagues) doivent donner exactement les mêmes gains, pertes et Elos que compute_new_ratings
+# appliqué match par match. Tous les rejeux (révocation, réparation, clôture) en dépendent.
+
+import random
+
+import numpy as np
+import pytest
+
+from elo_engine import EloEngine
+
+
+def loop_replay(engine, matches, start_elos_1v1, start_elos_2v2):
+    """Rejeu de référence : compute_new_ratings match par match, dans l'ordre."""
+    elos = {"1v1": dict(start_elos_1v1), "2v2": dict(start_elos_2v2)}
+    counts = {mode: {pid: 0 for pid in ratings} for mode, ratings in elos.items()}
+    gains, losses = [], []
+    for m in matches:
+        mode = m.get("mode", "1v1")
+        ratings = elos[mode]
+        if mode == "1v1":
+            winners, losers = [m["winner_id"]], [m["loser_id"]]
+        else:
+            winners, losers = [m["winner_id"], m["winner2_id"]], [m["loser_id"], m["loser2_id"]]
+        if not all(pid in ratings for pid in winners + losers):
+            gains.append(0)
+            losses.append(0)
+            continue
+
+        w_elo = sum(ratings[pid] for pid in winners) / len(winners)
+        l_elo = sum(ratings[pid] for pid in losers) / len(losers)
+        _, _, gain, loss = engine.compute_new_ratings(w_elo, l_elo)
+        for pid in winners:
+            ratings[pid] += gain
+            counts[mode][pid] += 1
+        for pid in losers:
+            ratings[pid] -= loss
+            counts[mode][pid] += 1
+        gains.append(gain)
+        losses.append(loss)
+
+    return {
+        "gains": gains,
+        "losses": losses,
+        "elo_1v1": elos["1v1"],
+        "elo_2v2": elos["2v2"],
+        "matches_1v1": counts["1v1"],
+        "matches_2v2": counts["2v2"],
+    }
+
+
+def random_history(seed, n_matches, n_players, share_2v2=0.3, unknown=()):
+    """Historique aléatoire ; les joueurs de `unknown` n'ont pas d'Elo de départ."""
+    rnd = random.Random(seed)
+    players = [f"p{i}" for i in range(n_players)] + list(unknown)
+    matches = []
+    for i in range(n_matches):
+        if rnd.random() < share_2v2:
+            w1, w2, l1, l2 = rnd.sample(players, 4)
+            matches.append({"id": i, "mode": "2v2", "winner_id": w1, "winner2_id": w2, "loser_id": l1, "loser2_id": l2})
+        else:
+            w, l = rnd.sample(players, 2)
+            matches.append({"id": i, "mode": "1v1", "winner_id": w, "loser_id": l})
+    start_1v1 = {f"p{i}": rnd.randint(700, 1600) for i in range(n_players)}
+    start_2v2 = {f"p{i}": rnd.randint(700, 1600) for i in range(n_players)}
+    return matches, start_1v1, start_2v2
+
+
+def assert_same_replay(engine, matches, start_1v1, start_2v2):
+    expected = loop_replay(engine, matches, start_1v1, start_2v2)
+    result = engine.replay_season(matches, start_1v1, start_2v2)
+    assert result["gains"].tolist() == expected["gains"]
+    assert result["losses"].tolist() == expected["losses"]
+    for key in ("elo_1v1", "elo_2v2", "matches_1v1", "matches_2v2"):
+        assert result[key] == expected[key], key
+
+
+def test_compute_batch_matches_scalar():
+    engine = EloEngine()
+    rng = np.random.default_rng(0)
+    winners = rng.integers(500, 2000, 5000).astype(float)
+    losers = rng.integers(500, 2000, 5000).astype(float)
+    # Écarts exacts qui tombent sur des demi-points (arrondi au pair)
+    winners[:3], losers[:3] = [1000, 1000, 1300], [1000, 1600, 1000]
+
+    new_w, new_l, gains, losses = engine.compute_batch(winners, losers)
+    expected = [engine.compute_new_ratings(w, l) for w, l in zip(winners.tolist(), losers.tolist())]
+    assert new_w.tolist() == [e[0] for e in expected]
+    assert new_l.tolist() == [e[1] for e in expected]
+    assert gains.tolist() == [e[2] for e in expected]
+    assert losses.tolist() == [e[3] for e in expected]
+
+
+def test_compute_team_batch_matches_scalar():
+    engine = EloEngine()
+    rng = np.random.default_rng(1)
+    w1, w2, l1, l2 = (rng.integers(500, 2000, 2000).astype(float) for _ in range(4))
+
+    gains, losses = engine.compute_team_batch(w1, w2, l1, l2)
+    expected = [
+        engine.compute_new_ratings((a + b) / 2, (c + d) / 2)
+        for a, b, c, d in zip(w1.tolist(), w2.tolist(), l1.tolist(), l2.tolist())
+    ]
+    assert gains.tolist() == [e[2] for e in expected]
+    assert losses.tolist() == [e[3] for e in expected]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n_players", [4, 12, 200])
+def test_replay_season_matches_loop(seed, n_players):
+    # 4 joueurs : presque chaque match partage un joueur avec le précédent (une vague par match) ;
+    # 200 joueurs : de larges vagues calculées ensemble
+    matches, start_1v1, start_2v2 = random_history(seed, 600, n_players)
+    assert_same_replay(EloEngine(), matches, start_1v1, start_2v2)
+
+
+def test_replay_season_player_in_consecutive_matches():
+    # Le même joueur enchaîne les matchs : chacun doit partir de l'Elo laissé par le précédent
+    matches = [
+        {"id": 0, "winner_id": "a", "loser_id": "b"},
+        {"id": 1, "winner_id": "c", "loser_id": "d"},
+        {"id": 2, "winner_id": "a", "loser_id": "c"},
+        {"id": 3, "winner_id": "b", "loser_id": "d"},
+        {"id": 4, "winner_id": "d", "loser_id": "a"},
+        {"id": 5, "mode": "2v2", "winner_id": "a", "winner2_id": "b", "loser_id": "c", "loser2_id": "d"},
+        {"id": 6, "mode": "2v2", "winner_id": "c", "winner2_id": "a", "loser_id": "b", "loser2_id": "d"},
+    ]
+    elos = {"a": 1000, "b": 1200, "c": 900, "d": 1100}
+    assert_same_replay(EloEngine(), matches, elos, dict(elos))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_replay_season_unknown_players_are_skipped(seed):
+    # Joueurs absents des Elos de départ : leurs matchs sont ignorés (gain et perte à 0)
+    matches, start_1v1, start_2v2 = random_history(seed, 400, 10, unknown=("ghost1", "ghost2"))
+    engine = EloEngine()
+    assert_same_replay(engine, matches, start_1v1, start_2v2)
+
+    skipped = engine.replay_season(matches, start_1v1, start_2v2)
+    for m, gain, loss in zip(matches, skipped["gains"], skipped["losses"]):
+        if {"ghost1", "ghost2"} & {m.get("winner_id"), m.get("winner2_id"), m.get("loser_id"), m.get("loser2_id")}:
+            assert gain == 0 and loss == 0
+    assert "ghost1" not in skipped["elo_1v1"]
@@ -0,0 +1,103 @@
+# --- tests/test_leaderboard.py ---
+# Classement découpé en fenêtres (leaderboard.py) : mêmes lignes que l'ancienne boucle joueur
+# par joueur de app.py (filtre des actifs, anonymize, iterrows, get_rank_info), pour le
+# classement complet comme pour chaque fenêtre (top, autour de moi, pages).
+
+import random
+
+import pytest
+
+import leaderboard
+from luxury_table import player_cell
+from ranks_config import RANK_TIERS
+
+VIEWER = "p07"
+
+
+def strict_tier(elo):
+    """get_rank_info sans rang courant (pas de tampon de maintien)."""
+    for tier in reversed(RANK_TIERS):
+        if elo >= tier["threshold"]:
+            return tier
+
+
+def old_rows(rows, elo_col, count_col, viewer_id):
+    """
+    Ancienne boucle de app.py. Les égalités d'Elo y suivaient l'ordre du tri pandas (non
+    stable) : elles sont départagées ici par l'identifiant, comme RankIndex et ranking_frame.
+    """
+    active = [r for r in rows if (r[count_col] or 0) > 0]
+    active.sort(key=lambda r: (-r[elo_col], r["id"]))
+    data = []
+    for index, row in enumerate(active):
+        username = row["username"]
+        if row.get("is_hidden_leaderboard", False) and row["id"] != viewer_id:
+            username = "🕵️ Joueur Masqué"
+        data.append({
+            "Rang": index + 1,
+            "Joueur": player_cell(strict_tier(row[elo_col]), username),
+            "Points Elo": f"<b>{int(row[elo_col])}</b> <span style='color: #ffd700;'>⭐️</span>",
+            "Matchs": f"{int(row[count_col])} 🎮",
+        })
+    return data
+
+
+@pytest.fixture
+def rows():
+    rnd = random.Random(0)
+    # Peu d'Elos distincts (beaucoup d'égalités), dont les seuils de rang exacts et leurs voisins
+    elos = [990, 999, 1000, 1049, 1050, 1051, 1149, 1150, 1300, 1450, 1500]
+    players = []
+    for i in range(110):
+        players.append({
+            "id": f"p{i:02d}",
+            "username": f"Joueur {i}",
+            "elo_rating": rnd.choice(elos),
+            "matches_played": rnd.choice([0, None, 1, 3, 12]),  # 0 / None : pas classé
+            "elo_2v2": rnd.choice(elos),
+            "matches_2v2": rnd.choice([0, 2, 2]),
+            "is_hidden_leaderboard": rnd.random() < 0.2,
+        })
+    players[7]["is_hidden_leaderboard"] = True   # Le lecteur masqué voit son propre nom
+    players[7]["matches_played"] = 5
+    rnd.shuffle(players)
+    return players
+
+
+@pytest.mark.parametrize("elo_col, count_col", [("elo_rating", "matches_played"), ("elo_2v2", "matches_2v2")])
+def test_windows_match_old_loop(rows, elo_col, count_col):
+    expected = old_rows(rows, elo_col, count_col, VIEWER)
+    ranking = leaderboard.ranking_frame(rows, elo_col, count_col, viewer_id=VIEWER)
+    assert len(expected) > 2 * leaderboard.PAGE_SIZE and len(expected) % leaderboard.PAGE_SIZE
+
+    assert leaderboard.table_rows(ranking) == expected
+    assert leaderboard.table_rows(leaderboard.top(ranking)) == expected[:leaderboard.TOP_SIZE]
+
+    # Pages : la dernière est incomplète, une page au-delà est vide
+    pages = leaderboard.page_count(ranking)
+    assert pages == len(expected) // leaderboard.PAGE_SIZE + 1
+    for number in range(1, pages + 2):
+        start = (number - 1) * leaderboard.PAGE_SIZE
+        assert leaderboard.table_rows(leaderboard.page(ranking, number)) == expected[start:start + leaderboard.PAGE_SIZE]
+
+    # Autour de moi : premier, deuxième, milieu, avant-dernier et dernier du classement
+    ids = ranking["id"].tolist()
+    r = leaderboard.AROUND_RADIUS
+    for pos in [0, 1, len(ids) // 2, len(ids) - 2, len(ids) - 1]:
+        window = leaderboard.table_rows(leaderboard.around(ranking, ids[pos]))
+        assert window == expected[max(0, pos - r):pos + r + 1]
+
+
+def test_unranked_players(rows):
+    ranking = leaderboard.ranking_frame(rows, "elo_rating", "matches_played", viewer_id=VIEWER)
+    inactive = [r["id"] for r in rows if not r["matches_played"]]
+    assert inactive
+    assert not ranking["id"].isin(inactive).any()
+    assert leaderboard.around(ranking, inactive[0]).empty
+
+    # Aucun joueur actif : classement vide, une page
+    for r in rows:
+        r["matches_played"] = 0
+    empty = leaderboard.ranking_frame(rows, "elo_rating", "matches_played")
+    assert empty.empty and leaderboard.table_rows(empty) == []
+    assert leaderboard.page_count(empty) == 1
@@ -0,0 +1,83 @@
+# --- tests/test_player_matches.py ---
+# Lecture des matchs d'un joueur (pages par clé (created_at, id)) et d'une paire de joueurs sur
+# la base SQLite locale (local_backend) : mêmes matchs, dans le même ordre, que le filtrage de
+# tout l'historique.
+
+import random
+
+import pytest
+
+from DB_manager import DBManager
+from local_backend import LocalClient
+
+PLAYERS = [f"p{i}" for i in range(6)]
+
+
+def involves(m, pid):
+    return pid in (m["winner_id"], m["loser_id"], m.get("winner2_id"), m.get("loser2_id"))
+
+
+def make_db():
+    rnd = random.Random(0)
+    client = LocalClient()
+    client.table("profiles").insert([{"id": pid, "username": pid} for pid in PLAYERS]).execute()
+    rows = []
+    for i in range(120):
+        # Peu d'horodatages distincts : beaucoup d'égalités, départagées par l'id
+        created_at = f"2026-03-{1 + i // 15:02d}T18:00:00+00:00"
+        status = rnd.choice(["validated", "validated", "archived", "pending", "revoked"])
+        if rnd.random() < 0.4:
+            w1, w2, l1, l2 = rnd.sample(PLAYERS, 4)
+            rows.append({"winner_id": w1, "winner2_id": w2, "loser_id": l1, "loser2_id": l2, "mode": "2v2",
+                         "status": status, "created_at": created_at})
+        else:
+            w, l = rnd.sample(PLAYERS, 2)
+            rows.append({"winner_id": w, "loser_id": l, "mode": "1v1", "status": status, "created_at": created_at})
+    client.table("matches").insert(rows).execute()
+    db = DBManager(client)
+    db.CACHE_TTL = 0
+    return db
+
+
+@pytest.fixture(scope="module")
+def db():
+    # Lecture seule : une base pour tout le module
+    return make_db()
+
+
+def all_matches(db):
+    return db.supabase.table("matches").select("*").order("created_at").order("id").execute().data
+
+
+@pytest.mark.parametrize("page_size", [1, 7, 500])
+@pytest.mark.parametrize("mode", [None, "2v2"])
+def test_player_matches_keyset_pages(db, page_size, mode):
+    # Pages coupées au milieu d'horodatages identiques : ni doublon ni match oublié
+    expected = [
+        m for m in all_matches(db)
+        if m["status"] in ("validated", "archived") and mode in (None, m["mode"]) and involves(m, "p2")
+    ]
+    assert db.get_player_matches("p2", mode=mode, page_size=page_size) == expected
+    assert db.get_player_matches("p2", mode=mode, page=1, page_size=page_size) == expected[page_size:2 * page_size]
+
+
+@pytest.mark.parametrize("mode", ["1v1", "2v2"])
+def test_pair_matches_match_history_filter(db, mode):
+    expected = [
+        m for m in all_matches(db)
+        if m["status"] in ("validated", "archived") and m["mode"] == mode and involves(m, "p0") and involves(m, "p1")
+    ]
+    assert expected
+    assert db.get_pair_matches("p0", "p1", mode) == expected
+    assert db.get_pair_matches("p1", "p0", mode) == expected
+
+
+def test_pair_matches_cache_is_invalidated_by_validation():
+    db = make_db()
+    db.CACHE_TTL = 60
+    before = db.get_pair_matches("p1", "p0")
+    match = db.supabase.table("matches").insert(
+        {"winner_id": "p0", "loser_id": "p1", "mode": "1v1", "created_at": "2026-04-01T18:00:00+00:00"}
+    ).execute().data[0]
+    assert db.validate_match_logic(match["id"])[0]
+    assert [m["id"] for m in db.get_pair_matches("p0", "p1")] == [m["id"] for m in before] + [match["id"]]
@@ -0,0 +1,54 @@
+# --- tests/test_rank_index.py ---
+# Index des rangs (rank_index.RankIndex) : après chaque mise à jour, mêmes rangs et mêmes
+# tranches que le tri complet des clés (-elo, player_id).
+
+import random
+
+from rank_index import RankIndex
+
+
+def sorted_ranking(ratings):
+    return [(i + 1, pid, -neg) for i, (neg, pid) in enumerate(sorted((-elo, pid) for pid, elo in ratings.items()))]
+
+
+def check(index, ratings):
+    expected = sorted_ranking(ratings)
+    assert len(index) == len(expected)
+    assert index.page(0, len(expected) + 5) == expected
+    for rank, pid, _ in expected:
+        assert index.rank(pid) == rank
+        assert index.around(pid) == expected[max(0, rank - 3):rank + 2]
+    assert index.page(7, 5) == expected[7:12]
+
+
+def test_updates_match_full_sort():
+    rnd = random.Random(0)
+    ratings = {f"p{i}": rnd.choice([950, 1000, 1000, 1012, 1180]) for i in range(40)}
+    ratings["p0"] = None  # Profil sans Elo : 1000
+    index = RankIndex(ratings)
+    ratings["p0"] = 1000
+    check(index, ratings)
+
+    for step in range(300):
+        pid = f"p{rnd.randrange(60)}"
+        if step % 10 == 0 and pid in ratings:
+            index.remove(pid)
+            del ratings[pid]
+        else:
+            # Égalités, Elos non entiers (même seau, ordre par Elo exact) et Elos hors de la
+            # plage couverte (reconstruction de l'arbre)
+            elo = rnd.choice([1000, 1000, 1000.5, 1000.25, rnd.randint(900, 1300), rnd.randint(-3000, 6000)])
+            index.update({pid: elo})
+            ratings[pid] = elo
+        if step % 25 == 0:
+            check(index, ratings)
+    check(index, ratings)
+
+
+def test_empty_index():
+    index = RankIndex()
+    assert len(index) == 0 and index.page() == [] and index.rank("p0") is None and index.around("p0") == []
+    index.update({"p0": 1100})
+    assert index.page() == [(1, "p0", 1100)]
+    index.remove("p0")
+    assert index.page() == []
@@ -0,0 +1,95 @@
+# --- tests/test_read_cache.py ---
+# Cache de lecture de DBManager : entrées rangées par contexte d'authentification (RLS) et
+# lectures concurrentes d'une écriture jamais gardées.
+
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import DB_manager
+from DB_manager import DBManager
+from local_backend import LocalClient
+
+
+def jwt(claims):
+    """Jeton au format JWT (signature factice : seul le contenu est lu)."""
+    def part(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+    return f"{part({'alg': 'HS256'})}.{part(claims)}.signature"
+
+
+@pytest.fixture
+def db():
+    db = DBManager(LocalClient())
+    db.CACHE_TTL = 60
+    return db
+
+
+def test_sessions_do_not_share_entries(db, monkeypatch):
+    context = {"value": ("authenticated", "alice")}
+    monkeypatch.setattr(db, "_auth_context", lambda: context["value"])
+    loads = []
+
+    def loader():
+        loads.append(context["value"])
+        return f"lu par {context['value'][1]}"
+
+    assert db._cached(("leaderboard", "1v1"), loader) == "lu par alice"
+    context["value"] = ("authenticated", "bob")
+    assert db._cached(("leaderboard", "1v1"), loader) == "lu par bob"
+    context["value"] = ("authenticated", "alice")
+    assert db._cached(("leaderboard", "1v1"), loader) == "lu par alice"
+    assert len(loads) == 2
+
+    # Une écriture invalide la clé pour toutes les sessions
+    db.invalidate("leaderboard")
+    assert db.cache_info()["entries"] == 0
+
+
+def test_auth_context_reads_the_session_token(monkeypatch):
+    db = DBManager()
+    client = SimpleNamespace(options=SimpleNamespace(headers={}))
+    monkeypatch.setattr(DB_manager.st, "session_state", {"supabase_client": client})
+
+    client.options.headers["Authorization"] = "Bearer " + jwt({"role": "authenticated", "sub": "alice"})
+    assert db._auth_context() == ("authenticated", "alice")
+    client.options.headers["Authorization"] = "Bearer " + jwt({"role": "anon"})
+    assert db._auth_context() == ("anon", None)
+    client.options.headers["Authorization"] = "Bearer sb_publishable_abc"
+    assert db._auth_context() == ("anon", None)
+
+    monkeypatch.setattr(DB_manager.st, "session_state", {})
+    assert db._auth_context() == ("anon", None)
+
+
+def test_load_invalidated_during_read_is_not_kept(db):
+    versions = iter(["avant l'écriture", "après l'écriture"])
+
+    def loader():
+        value = next(versions)
+        # Une validation (autre session) se termine pendant la lecture
+        db.invalidate(("leaderboard", "1v1"))
+        return value
+
+    assert db._cached(("leaderboard", "1v1"), loader) == "avant l'écriture"
+    assert db.cache_info()["discarded"] == 1
+    assert db._cached(("leaderboard", "1v1"), lambda: next(versions)) == "après l'écriture"
+    assert db._cached(("leaderboard", "1v1"), lambda: "jamais lu") == "après l'écriture"
+
+
+def test_rank_index_updated_in_every_context(db, monkeypatch):
+    db.supabase.table("profiles").insert([
+        {"id": "p0", "username": "p0", "elo_rating": 1100},
+        {"id": "p1", "username": "p1", "elo_rating": 1000},
+    ]).execute()
+    context = {"value": ("authenticated", "alice")}
+    monkeypatch.setattr(db, "_auth_context", lambda: context["value"])
+    alice = db.get_rank_index("1v1")
+    context["value"] = ("authenticated", "bob")
+    bob = db.get_rank_index("1v1")
+    assert alice is not bob
+
+    db.update_rank_index("1v1", {"p1": 1200})
+    assert alice.rank("p1") == bob.rank("p1") == 1
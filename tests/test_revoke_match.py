@@ -0,0 +1,133 @@
+# --- tests/test_revoke_match.py ---
+# Révocation d'un match sur la base SQLite locale (local_backend) : même état que si le match
+# n'avait jamais été validé, écrit en une seule transaction (tout ou rien).
+
+import numpy as np
+import pytest
+
+import rating_log
+from DB_manager import DBManager
+from local_backend import LocalClient
+
+PLAYERS = ["p0", "p1", "p2", "p3"]
+HISTORY = [("p0", "p1"), ("p2", "p0"), ("p0", "p3"), ("p1", "p2"), ("p0", "p1"), ("p3", "p0")]
+REVOKED = 2  # p0 bat p3
+
+
+PREVIOUS_SEASON = [("p1", "p2"), ("p0", "p1"), ("p0", "p1"), ("p3", "p1"), ("p3", "p0")]
+
+
+def validate_all(db, history, month="03"):
+    """Valide dans l'ordre les matchs de history (index = jour du mois) ; rend leurs ids."""
+    ids = []
+    for day, (winner, loser) in history:
+        match = db.supabase.table("matches").insert({
+            "winner_id": winner, "loser_id": loser, "mode": "1v1",
+            "created_at": f"2026-{month}-0{day + 1}T18:00:00+00:00",
+        }).execute().data[0]
+        assert db.validate_match_logic(match["id"])[0]
+        ids.append(match["id"])
+    return ids
+
+
+def make_db(history, previous_season=False):
+    """
+    Base locale où les matchs de history sont validés dans l'ordre.
+    previous_season : une saison (février) est d'abord clôturée, puis tous les points de
+    reprise sont effacés : les rejeux repartent du soft reset des archives.
+    """
+    client = LocalClient()
+    client.table("profiles").insert([{"id": pid, "username": pid} for pid in PLAYERS]).execute()
+    db = DBManager(client)
+    db.CACHE_TTL = 0
+    if previous_season:
+        validate_all(db, list(enumerate(PREVIOUS_SEASON)), month="02")
+        assert db.close_season_logic("Février 2026", "1v1")[0]
+        db.clear_checkpoints("1v1", keep_base=False)
+    return db, validate_all(db, history)
+
+
+def snapshot(db):
+    """Profils, statistiques et face-à-face, comparables entre deux bases."""
+    profiles = {p["id"]: (p["elo_rating"], p["matches_played"]) for p in db.supabase.table("profiles").select("*").execute().data}
+    stats = {s["player_id"]: s for s in db.supabase.table("player_stats").select("*").execute().data}
+    for s in stats.values():
+        s.pop("last_loss_id")  # ids de matchs propres à chaque base
+    h2h = sorted(
+        (h["player_a"], h["player_b"], h["relation"], h["wins"], h["losses"])
+        for h in db.supabase.table("head_to_head").select("*").execute().data
+    )
+    gains = {
+        m["created_at"]: (m["elo_gain"], m["elo_loss"])
+        for m in db.supabase.table("matches").select("*").eq("status", "validated").execute().data
+    }
+    return profiles, stats, h2h, gains
+
+
+@pytest.fixture
+def db():
+    return make_db(list(enumerate(HISTORY)))
+
+
+def test_revoke_restores_state_without_the_match(db):
+    db, ids = db
+    success, _ = db.revoke_match(ids[REVOKED])
+    assert success
+
+    expected, _ = make_db([(day, m) for day, m in enumerate(HISTORY) if day != REVOKED])
+    assert snapshot(db) == snapshot(expected)
+    assert db.supabase.table("matches").select("status").eq("id", ids[REVOKED]).execute().data[0]["status"] == "revoked"
+
+
+def test_failed_write_leaves_match_validated(db, monkeypatch):
+    db, ids = db
+    before = snapshot(db)
+    # Le journal est écrit en dernier : statut, matchs et profils sont déjà modifiés
+    def fail(conn, events):
+        raise RuntimeError("écriture du journal impossible")
+    monkeypatch.setattr("local_backend._insert_events", fail)
+
+    success, msg = db.revoke_match(ids[REVOKED])
+    assert not success and "journal impossible" in msg
+    assert snapshot(db) == before
+    assert db.supabase.table("matches").select("status").eq("id", ids[REVOKED]).execute().data[0]["status"] == "validated"
+
+
+def test_stale_replay_is_refused(db, monkeypatch):
+    db, ids = db
+    before = snapshot(db)
+    # Un match validé entre le rejeu et l'écriture change l'empreinte
+    monkeypatch.setattr(DBManager, "validated_fingerprint", lambda self, mode=None: (len(ids) - 1, ids[-2]))
+
+    success, msg = db.revoke_match(ids[REVOKED])
+    assert not success and "relancez" in msg
+    assert snapshot(db) == before
+
+
+def test_revoke_without_checkpoint_replays_from_the_closing_reset():
+    db, ids = make_db(list(enumerate(HISTORY)), previous_season=True)
+    assert db.get_latest_checkpoint("1v1") is None
+    # Le scénario n'a de sens que si un reset arrondi diffère du reset tronqué de la clôture
+    finals = [a["final_elo"] for a in db.supabase.table("season_archives").select("final_elo").execute().data]
+    assert any(f > 1000 and (f - 1000) * 0.4 % 1 >= 0.5 for f in finals)
+
+    assert db.revoke_match(ids[REVOKED])[0]
+    expected, _ = make_db([(day, m) for day, m in enumerate(HISTORY) if day != REVOKED], previous_season=True)
+    assert snapshot(db) == snapshot(expected)
+
+
+def test_soft_reset_is_truncated_like_the_close():
+    assert rating_log.soft_reset(1004) == 1001
+    assert rating_log.soft_reset(950) == 1000
+    assert rating_log.soft_reset(np.array([1004.0, 1203.0, 900.0])).tolist() == [1001, 1081, 1000]
+
+
+def test_legacy_match_without_mode_counts_as_1v1(db):
+    db, ids = db
+    # Ancienne ligne sans mode : comptée en 1v1 par l'empreinte comme par le RPC
+    db.supabase.table("matches").update({"mode": None}).eq("id", ids[0]).execute()
+    assert db.validated_fingerprint("1v1") == (len(ids), ids[-1])
+
+    assert db.revoke_match(ids[REVOKED])[0]
+    expected, _ = make_db([(day, m) for day, m in enumerate(HISTORY) if day != REVOKED])
+    assert snapshot(db) == snapshot(expected)
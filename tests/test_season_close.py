@@ -0,0 +1,58 @@
+# --- tests/test_season_close.py ---
+# Clôture de saison sur la base SQLite locale (local_backend) : plan puis application en un
+# seul appel, idempotente par saison et par mode.
+
+import pytest
+
+from DB_manager import DBManager
+from local_backend import LocalClient
+
+
+@pytest.fixture
+def db():
+    client = LocalClient()
+    client.table("profiles").insert([
+        {"id": f"p{i}", "username": f"Joueur {i}", "elo_rating": 1000 + 50 * i, "matches_played": 5}
+        for i in range(5)
+    ]).execute()
+    client.table("matches").insert([
+        {"winner_id": "p4", "loser_id": "p0", "status": "validated", "mode": "1v1", "elo_gain": 20, "elo_loss": 12},
+        {"winner_id": "p3", "loser_id": "p1", "status": "validated", "mode": "1v1", "elo_gain": 22, "elo_loss": 13},
+    ]).execute()
+    db = DBManager(client)
+    db.CACHE_TTL = 0
+    return db
+
+
+def test_close_applies_plan(db):
+    plan = db.plan_season_close("Mars 2026", "1v1")
+    assert db.apply_season_close(plan)[0]
+
+    profiles = {p["id"]: p for p in db.supabase.table("profiles").select("*").execute().data}
+    assert profiles["p4"]["elo_rating"] == 1080  # 1000 + (1200 - 1000) * 0.4
+    assert profiles["p4"]["matches_played"] == 0
+    assert "Champion Solo de Mars 2026" in db.get_player_titles("p4")
+    assert db.supabase.table("matches").select("id").eq("status", "archived").execute().data
+
+
+def test_reapplying_a_closed_plan_is_a_no_op(db):
+    plan = db.plan_season_close("Mars 2026", "1v1")
+    assert db.apply_season_close(plan)[0]
+    archives = db.supabase.table("season_archives").select("id").execute().data
+
+    # Nouvel essai après succès (délai dépassé, double clic) : pas de refus pour plan périmé
+    success, msg = db.apply_season_close(plan)
+    assert success and "déjà clôturée" in msg
+    assert db.supabase.table("season_archives").select("id").execute().data == archives
+    assert db.get_profile("p4")["elo_rating"] == 1080
+
+
+def test_stale_plan_is_refused(db):
+    plan = db.plan_season_close("Mars 2026", "1v1")
+    db.supabase.table("matches").insert(
+        {"winner_id": "p0", "loser_id": "p4", "status": "validated", "mode": "1v1", "elo_gain": 40, "elo_loss": 25}
+    ).execute()
+
+    success, _ = db.apply_season_close(plan)
+    assert not success
+    assert db.get_season_closure(plan.key) is None
@@ -0,0 +1,66 @@
+# --- tests/test_season_repair.py ---
+# Réparation de la saison en cours sur la base SQLite locale (local_backend) : plan puis
+# application en un seul appel ; un plan périmé est refusé dans la transaction, sans rien écrire.
+
+import pytest
+
+from DB_manager import DBManager
+from local_backend import LocalClient
+
+
+@pytest.fixture
+def db():
+    client = LocalClient()
+    client.table("profiles").insert([{"id": f"p{i}", "username": f"Joueur {i}"} for i in range(4)]).execute()
+    db = DBManager(client)
+    db.CACHE_TTL = 0
+    for i, (winner, loser) in enumerate([("p0", "p1"), ("p2", "p3"), ("p0", "p2"), ("p1", "p3")]):
+        match = client.table("matches").insert(
+            {"winner_id": winner, "loser_id": loser, "mode": "1v1", "created_at": f"2026-03-0{i + 1}T18:00:00+00:00"}
+        ).execute().data[0]
+        assert db.validate_match_logic(match["id"])[0]
+    # Gain faussé à la main : c'est ce que la réparation doit corriger
+    client.table("matches").update({"elo_gain": 99}).eq("winner_id", "p0").eq("loser_id", "p2").execute()
+    client.table("profiles").update({"elo_rating": 1200}).eq("id", "p0").execute()
+    return db
+
+
+def ratings(db):
+    return {p["id"]: p["elo_rating"] for p in db.supabase.table("profiles").select("id, elo_rating").execute().data}
+
+
+def test_repair_applies_plan(db):
+    plan = db.plan_season_repair()
+    assert plan.matches and plan.profiles
+    assert db.apply_season_repair(plan)[0]
+    assert not db.plan_season_repair().matches
+    assert not db.plan_season_repair().profiles
+
+
+def test_stale_repair_plan_is_refused(db):
+    plan = db.plan_season_repair()
+    before = ratings(db)
+    match = db.supabase.table("matches").insert(
+        {"winner_id": "p3", "loser_id": "p0", "mode": "1v1", "created_at": "2026-03-09T18:00:00+00:00"}
+    ).execute().data[0]
+    assert db.validate_match_logic(match["id"])[0]
+    after_validation = ratings(db)
+    assert after_validation != before
+
+    success, msg = db.apply_season_repair(plan)
+    assert not success and "relancez" in msg
+    # La validation arrivée entre le calcul et l'application n'est pas écrasée
+    assert ratings(db) == after_validation
+
+
+def test_stale_fingerprint_is_checked_inside_the_rpc(db):
+    # Même contrôle sans passer par DBManager : la fonction refuse d'elle-même
+    result = db.supabase.rpc("apply_season_repair", {
+        "p_validated": 3,
+        "p_last_match_id": 3,
+        "p_matches": [{"id": 1, "elo_gain": 0, "elo_loss": 0}],
+        "p_profiles": [],
+        "p_events": [],
+    }).execute().data
+    assert result == {"stale": True}
+    assert db.supabase.table("matches").select("elo_gain").eq("id", 1).execute().data[0]["elo_gain"] != 0
@@ -0,0 +1,180 @@
+# --- tests/test_stats_engine.py ---
+# Statistiques du Centre de Statistiques (stats_engine.profile_stats) : mêmes chiffres et mêmes
+# courbes que l'ancienne boucle match par match de app.py.
+
+import pandas as pd
+import pytest
+
+import stats_engine
+
+PLAYER = "me"
+USERNAMES = {"a": "Alice", "b": "Bob", "c": "Chloé", "d": "Dan", PLAYER: "Moi"}
+
+
+def old_profile_stats(matches, player_id, season_end_elos, logged_ratings, usernames):
+    """Ancienne boucle de app.py (section 3 de la page Profils), résultats regroupés comme profile_stats."""
+    user_seasons = {name: {"matches": [], "end_elo": elo} for name, elo in season_end_elos.items()}
+    for m in matches:
+        s_name = m.get("season_name") if m.get("status") == "archived" else stats_engine.CURRENT_SEASON
+        if s_name not in user_seasons:
+            user_seasons[s_name] = {"matches": [], "end_elo": 1000}
+        user_seasons[s_name]["matches"].append(m)
+
+    all_time_peak = 1000
+    global_wins = 0
+    global_max_streak = 0
+    global_current_streak = 0
+    global_opponents = {}
+    global_dates = {}
+    season_curves = {}
+    season_stats = {}
+
+    for s_name, s_data in user_seasons.items():
+        s_matches = s_data["matches"]
+        if not s_matches and s_name != stats_engine.CURRENT_SEASON:
+            continue
+
+        from_log = bool(s_matches) and all(m["id"] in logged_ratings for m in s_matches)
+        if from_log:
+            start_elo = logged_ratings[s_matches[0]["id"]]["rating_before"]
+        else:
+            net_gain = 0
+            for m in s_matches:
+                is_win = player_id in [m["winner_id"], m.get("winner2_id")]
+                delta = m.get("elo_loss", m.get("elo_gain", 0)) if not is_win else m.get("elo_gain", 0)
+                net_gain += delta if is_win else -delta
+            start_elo = s_data["end_elo"] - net_gain
+        current_s_elo = start_elo
+        s_peak = start_elo
+        s_wins = 0
+        s_opponents = {}
+        s_dates = {}
+        s_max_streak = 0
+        s_current_streak = 0
+
+        curve = [{"Numéro": 0, "Date": "Début", "Elo": start_elo, "Gain": 0, "Résultat": "-"}]
+        for i, m in enumerate(s_matches):
+            is_win = player_id in [m["winner_id"], m.get("winner2_id")]
+            delta = m.get("elo_loss", m.get("elo_gain", 0)) if not is_win else m.get("elo_gain", 0)
+            if is_win:
+                global_wins += 1
+                s_wins += 1
+                global_current_streak += 1
+                s_current_streak += 1
+                global_max_streak = max(global_max_streak, global_current_streak)
+                s_max_streak = max(s_max_streak, s_current_streak)
+            else:
+                global_current_streak = 0
+                s_current_streak = 0
+
+            opp_ids = [m["loser_id"], m.get("loser2_id")] if is_win else [m["winner_id"], m.get("winner2_id")]
+            for oid in [oid for oid in opp_ids if oid]:
+                s_opponents[oid] = s_opponents.get(oid, 0) + 1
+                global_opponents[oid] = global_opponents.get(oid, 0) + 1
+
+            if from_log:
+                event = logged_ratings[m["id"]]
+                current_s_elo = event["rating_after"]
+                delta = abs(event["rating_after"] - event["rating_before"])
+            else:
+                current_s_elo += delta if is_win else -delta
+            s_peak = max(s_peak, current_s_elo)
+            all_time_peak = max(all_time_peak, current_s_elo)
+
+            dt_utc = pd.to_datetime(m["created_at"])
+            dt_paris = dt_utc.tz_convert("Europe/Paris") if dt_utc.tzinfo else dt_utc.tz_localize("UTC").tz_convert("Europe/Paris")
+            day_str = dt_paris.strftime("%Y-%m-%d")
+            s_dates[day_str] = s_dates.get(day_str, 0) + 1
+            global_dates[day_str] = global_dates.get(day_str, 0) + 1
+
+            curve.append({
+                "Numéro": i + 1,
+                "Date": dt_paris.strftime("%d/%m %Hh%M"),
+                "Elo": current_s_elo,
+                "Gain": delta if is_win else -delta,
+                "Résultat": "Victoire" if is_win else "Défaite",
+            })
+
+        s_most_played = "Aucun"
+        if s_opponents:
+            top_oid, top_c = max(s_opponents.items(), key=lambda x: x[1])
+            s_most_played = f"{usernames.get(top_oid, 'Inconnu')} ({top_c} matchs)"
+
+        season_curves[s_name] = curve
+        season_stats[s_name] = {
+            "peak": s_peak,
+            "wins": s_wins,
+            "losses": len(s_matches) - s_wins,
+            "total": len(s_matches),
+            "start_elo": start_elo,
+            "end_elo": s_data["end_elo"],
+            "most_played": s_most_played,
+            "max_day": max(s_dates.values()) if s_dates else 0,
+            "longest_streak": s_max_streak,
+        }
+
+    g_most_played = "Aucun"
+    if global_opponents:
+        g_top_oid, g_top_c = max(global_opponents.items(), key=lambda x: x[1])
+        g_most_played = f"{usernames.get(g_top_oid, 'Inconnu')} ({g_top_c} matchs)"
+    career = {
+        "peak": all_time_peak,
+        "wins": global_wins,
+        "max_streak": global_max_streak,
+        "most_played": g_most_played,
+        "max_day": max(global_dates.values()) if global_dates else 0,
+    }
+    return career, season_stats, season_curves
+
+
+def match(i, created_at, winner, loser, status="validated", season=None, winner2=None, loser2=None):
+    return {
+        "id": i, "winner_id": winner, "winner2_id": winner2, "loser_id": loser, "loser2_id": loser2,
+        "elo_gain": 10 + i % 7, "elo_loss": 6 + i % 5, "created_at": created_at,
+        "status": status, "season_name": season,
+    }
+
+
+@pytest.fixture
+def matches():
+    return [
+        # Hiver 2026 (archivée) : minuit de Paris = 23h UTC, égalité Alice / Bob comme rivaux
+        match(1, "2026-01-10T22:59:00+00:00", PLAYER, "a", "archived", "Hiver 2026"),
+        match(2, "2026-01-10T23:00:00+00:00", "b", PLAYER, "archived", "Hiver 2026"),
+        match(3, "2026-01-11T20:00:00+00:00", PLAYER, "b", "archived", "Hiver 2026"),
+        match(4, "2026-01-11T21:00:00+00:00", PLAYER, "a", "archived", "Hiver 2026"),
+        # Printemps 2026 (archivée, sans archive : Elo de fin 1000), passage à l'heure d'été
+        match(5, "2026-03-28T22:30:00+00:00", "c", PLAYER, "archived", "Printemps 2026"),
+        match(6, "2026-03-29T21:59:00+00:00", PLAYER, "c", "archived", "Printemps 2026"),
+        match(7, "2026-03-29T22:00:00+00:00", PLAYER, "d", "archived", "Printemps 2026"),
+        # Saison en cours, en 2v2 : deux adversaires par match, même horodatage
+        match(8, "2026-04-02T18:00:00+00:00", PLAYER, "a", winner2="b", loser2="c"),
+        match(9, "2026-04-02T18:00:00+00:00", PLAYER, "c", winner2="b", loser2="d"),
+        match(10, "2026-04-02T19:00:00+00:00", "c", PLAYER, winner2="d", loser2="b"),
+        match(11, "2026-04-03T19:00:00+00:00", PLAYER, "d", winner2="a", loser2="c"),
+    ]
+
+
+SEASON_END_ELOS = {stats_engine.CURRENT_SEASON: 1042, "Hiver 2026": 1031, "Automne 2025": 1012}
+
+
+@pytest.mark.parametrize("logged", [
+    set(),                       # Aucun journal : Elos déduits des gains
+    {1, 2, 3, 4, 8, 9, 10, 11},  # Hiver et saison en cours lus dans le journal, pas Printemps
+    {8, 9},                      # Saison en cours partiellement journalisée : gains
+])
+def test_profile_stats_match_old_loop(matches, logged):
+    logged_ratings = {
+        m["id"]: {"rating_before": 1000 + 3 * m["id"], "rating_after": 1000 + 3 * m["id"] + (5 if m["winner_id"] == PLAYER else -4)}
+        for m in matches if m["id"] in logged
+    }
+    args = (matches, PLAYER, SEASON_END_ELOS, logged_ratings, USERNAMES)
+    assert stats_engine.profile_stats(*args) == old_profile_stats(*args)
+
+
+def test_player_without_matches():
+    args = ([], PLAYER, {stats_engine.CURRENT_SEASON: 1000, "Hiver 2026": 1010}, {}, USERNAMES)
+    career, season_stats, season_curves = stats_engine.profile_stats(*args)
+    assert (career, season_stats, season_curves) == old_profile_stats(*args)
+    assert list(season_stats) == [stats_engine.CURRENT_SEASON]
+    assert career["most_played"] == "Aucun" and career["max_day"] == 0
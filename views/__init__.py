@@ -0,0 +1,27 @@
+# --- views/__init__.py ---
+# Pages de l'application, une par module (fonction render(db, user)).
+# app.py n'importe que la page affichée : le code exécuté à chaque rerun se limite
+# à l'en-tête commun (session, barre latérale) et à cette page.
+
+import importlib
+
+# Libellé du menu -> module de views/
+PAGES = {
+    "🏆 Classement": "classement",
+    "👤 Profils Joueurs": "profils",
+    "🎯 Déclarer un match": "declarer_match",
+    "🆚 Comparateur de joueurs": "comparateur",
+    "📑 Mes validations": "validations",
+    "🧠 Entraînements": "entrainements",
+    "🍻 Weekly Fun": "weekly",
+    "🏟️ Grand Tournoi": "grand_tournoi",
+    "📢 Nouveautés": "nouveautes",
+    "📜 Règlement": "reglement",
+    "⚙️ Paramètres": "parametres",
+    "🔧 Panel Admin": "admin",
+}
+
+
+def render(page, db, user):
+    """Affiche une page du menu, en important son module à la première visite."""
+    importlib.import_module(f"{__name__}.{PAGES[page]}").render(db, user)
@@ -0,0 +1,370 @@
+# --- views/admin.py ---
+# Page "🔧 Panel Admin".
+
+import pandas as pd
+import streamlit as st
+from datetime import datetime
+
+import db_trace
+import season_close
+
+
+def render(db, user):
+    """Panel Admin : matchs, sauvegardes, réparation et clôture de saison."""
+    st.header("🔧 Outils d'administration")
+
+    @st.fragment
+    def render_admin_match_queue():
+        """File des matchs à traiter (fragment : filtrer ou agir ne relance que cette section)."""
+        # --- 1. GESTION DES MATCHS ---
+        # On récupère les matchs avec les jointures (winner, loser, winner2, loser2)
+        all_matches = db.get_all_matches().data
+
+        status_filter = st.multiselect(
+            "Statuts :",
+            [
+                "pending",  # En attente
+                "validated",  # Validé
+                "rejected",  # Refusé
+                "disputed",  # Litige
+                "revoked",  # Révoqué (annulé après validation)
+                "rejected_confirmed",  # Refus archivé
+            ],
+            default=["disputed", "pending"],
+        )
+
+        if all_matches:
+            for m in all_matches:
+                if m["status"] in status_filter:
+                    # A. Récupération des infos de base
+                    mode = m.get("mode", "1v1")
+                    icon = "👥" if mode == "2v2" else "👤"
+                    dt_utc = pd.to_datetime(m["created_at"])
+                    dt_paris = (
+                        dt_utc.tz_convert("Europe/Paris")
+                        if dt_utc.tzinfo
+                        else dt_utc.tz_localize("UTC").tz_convert("Europe/Paris")
+                    )
+                    date_str = dt_paris.strftime("%d/%m à %Hh%M")
+
+                    # B. Récupération sécurisée des pseudos (Gestion des None)
+                    # Note : m.get("winner") peut être None si la jointure a échoué, d'où le (Or {})
+                    w1 = (m.get("winner") or {}).get("username", "Inconnu")
+                    l1 = (m.get("loser") or {}).get("username", "Inconnu")
+
+                    # C. Construction du titre selon le mode
+                    if mode == "2v2":
+                        w2 = (m.get("winner2") or {}).get("username", "?")
+                        l2 = (m.get("loser2") or {}).get("username", "?")
+                        versus_str = f"{w1} & {w2} vs {l1} & {l2}"
+                    else:
+                        versus_str = f"{w1} vs {l1}"
+
+                    # D. Titre final de l'expander
+                    match_label = (
+                        f"{icon} {mode} | {m['status'].upper()} | {date_str} | {versus_str}"
+                    )
+
+                    # E. Affichage et Actions
+                    with st.expander(match_label):
+                        c1, c2 = st.columns(2)
+
+                        # --- Actions pour "En attente" ---
+                        if m["status"] == "pending":
+                            if c1.button("Forcer Validation ✅", key=f"adm_val_{m['id']}"):
+                                db.validate_match_logic(m["id"])
+                                st.rerun(scope="fragment")
+                            if c2.button("Supprimer 🗑️", key=f"adm_del_{m['id']}"):
+                                db.reject_match(m["id"])
+                                st.rerun(scope="fragment")
+
+                        # --- Actions pour "Litige" ---
+                        elif m["status"] == "disputed":
+                            if c1.button("Forcer Validation ✅", key=f"f_v_{m['id']}"):
+                                db.validate_match_logic(m["id"])
+                                st.rerun(scope="fragment")
+                            if c2.button("Confirmer Rejet ❌", key=f"f_r_{m['id']}"):
+                                db.reject_match(m["id"])
+                                st.rerun(scope="fragment")
+
+                        # --- Actions pour "Validé" ---
+                        elif m["status"] == "validated":
+                            st.info(f"Gain enregistré : {m.get('elo_gain')} points")
+                            if st.button(
+                                "Révoquer le match (Annuler les points) ⚠️",
+                                key=f"rev_{m['id']}",
+                            ):
+                                db.revoke_match(m["id"])
+                                st.rerun(scope="fragment")
+
+        st.divider()
+
+    render_admin_match_queue()
+
+    # --- 2. SAUVEGARDE DE SÉCURITÉ ---
+    st.subheader("💾 Sauvegarde de sécurité")
+    if st.button("Préparer les fichiers de sauvegarde"):
+        # On télécharge les tables brutes
+        profiles = db.supabase.table("profiles").select("*").execute().data
+        df_prof = pd.DataFrame(profiles)
+        matches = db.supabase.table("matches").select("*").execute().data
+        df_match = pd.DataFrame(matches)
+
+        c1, c2 = st.columns(2)
+        c1.download_button(
+            "📥 Backup Joueurs",
+            df_prof.to_csv(index=False).encode("utf-8"),
+            "backup_profiles.csv",
+            "text/csv",
+        )
+        c2.download_button(
+            "📥 Backup Matchs",
+            df_match.to_csv(index=False).encode("utf-8"),
+            "backup_matches.csv",
+            "text/csv",
+        )
+
+    st.divider()
+
+    # --- ⏱️ PERFORMANCE ---
+    render_performance_panel(db)
+
+    st.divider()
+
+    # --- 3. SYNCHRONISATION DE LA SAISON EN COURS ---
+    st.subheader("🔄 Réparation de la Saison")
+    st.info(
+        "Recalcule tous les scores de la **saison en cours**. "
+        "Le système récupère l'Elo de fin de saison dernière, applique le soft-reset, "
+        "puis rejoue tous les matchs actuels dans l'ordre."
+    )
+
+    # Le plan est calculé sans rien écrire : on le relit, puis on l'applique en un seul appel
+    if st.button("👁️ Prévisualiser la réparation"):
+        try:
+            st.session_state["repair_plan"] = db.plan_season_repair()
+        except Exception as e:
+            st.error(f"Erreur lors du calcul : {e}")
+
+    repair_plan = st.session_state.get("repair_plan")
+    if repair_plan is not None:
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Matchs rejoués", repair_plan.replayed)
+        c2.metric("Matchs à corriger", len(repair_plan.matches))
+        c3.metric("Profils à corriger", len(repair_plan.profiles))
+        if repair_plan.matches:
+            st.dataframe(repair_plan.preview_matches(), hide_index=True, use_container_width=True)
+        if repair_plan.profiles:
+            st.dataframe(repair_plan.preview_profiles(), hide_index=True, use_container_width=True)
+
+        if st.button("🔧 Réparer la saison en cours", type="primary"):
+            progress_bar = st.progress(0.0, text="⏳ Démarrage du recalcul...")
+            success, msg = db.apply_season_repair(repair_plan, progress=lambda fraction, text: progress_bar.progress(fraction, text=text))
+            progress_bar.empty()
+            del st.session_state["repair_plan"]
+            if success:
+                st.success(f"✅ {msg}")
+                st.balloons()
+            else:
+                st.error(msg)
+
+    st.divider()
+    st.subheader("📊 Statistiques pré-calculées")
+    st.info("Recalcule depuis les matchs les tables tenues à jour automatiquement (à utiliser après une modification manuelle en base).")
+    col_h2h, col_stats = st.columns(2)
+    if col_h2h.button("Reconstruire les face-à-face"):
+        success, msg = db.rebuild_head_to_head()
+        if success:
+            st.success(msg)
+        else:
+            st.error(msg)
+    if col_stats.button("Reconstruire les statistiques joueurs"):
+        success, msg = db.rebuild_player_stats()
+        if success:
+            st.success(msg)
+        else:
+            st.error(msg)
+
+    st.divider()
+    st.subheader("📅 Clôture de Saison")
+    st.info("Cette action va archiver les scores, donner les titres au Top 3 et reset les Elos de tout le monde.")
+    
+    with st.expander("🚀 Lancer la fin de saison"):
+        # --- SÉLECTEURS DE DATE POUR LE NOM DE SAISON ---
+        col_c1, col_c2 = st.columns(2)
+        
+        mois_fr = [
+            "Janvier", "Février", "Mars", "Avril", "Mai", "Juin", 
+            "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"
+        ]
+        
+        # On récupère la date actuelle pour pré-remplir les sélecteurs
+        now = datetime.now()
+        
+        with col_c1:
+            sel_month = st.selectbox("Mois de la saison", mois_fr, index=now.month - 1)
+        with col_c2:
+            # On propose de 2025 à 2030, adaptable si besoin
+            sel_year = st.selectbox("Année", list(range(2025, 2031)), index=list(range(2025, 2031)).index(now.year))
+
+        # On construit automatiquement le nom (ex: "Avril 2026")
+        s_name = f"{sel_month} {sel_year}"
+        
+        st.write(f"Saison à clôturer : **{s_name}**")
+        
+        s_mode = st.radio("Mode à clôturer", ["Solo (1v1)", "Duo (2v2)", "Les deux"], horizontal=True)
+        
+        modes_to_process = []
+        if s_mode == "Solo (1v1)": 
+            modes_to_process = ["1v1"]
+        elif s_mode == "Duo (2v2)": 
+            modes_to_process = ["2v2"]
+        else: 
+            modes_to_process = ["1v1", "2v2"]
+
+        # Prévisualisation : plans calculés sans rien écrire, appliqués tels quels à la confirmation
+        if st.button("👁️ Prévisualiser la clôture"):
+            try:
+                st.session_state["close_plans"] = {m: db.plan_season_close(s_name, mode=m) for m in modes_to_process}
+            except Exception as e:
+                st.error(f"Erreur lors du calcul : {e}")
+
+        close_plans = st.session_state.get("close_plans") or {}
+        # Un plan ne vaut que pour la saison et les modes sélectionnés
+        close_plans = {m: plan for m, plan in close_plans.items() if m in modes_to_process and plan.season_name == s_name}
+        for m, plan in close_plans.items():
+            st.markdown(f"**{m}** : {len(plan)} joueurs archivés, {len(plan.titles)} titres distribués")
+            st.dataframe(plan.preview(), hide_index=True, use_container_width=True)
+
+        st.warning("⚠️ Attention : Cette action est irréversible.")
+        
+        if st.button("Confirmer la clôture et Reset les Elos", type="primary"):
+            success_count = 0
+            for m in modes_to_process:
+                bar = st.progress(0.0, text=f"{m} : préparation...")
+                report = lambda fraction, text, m=m, bar=bar: bar.progress(fraction, text=f"{m} : {text}")
+                if m in close_plans:
+                    success, msg = db.apply_season_close(close_plans[m], progress=report)
+                else:
+                    # On utilise le s_name construit proprement
+                    success, msg = db.close_season_logic(s_name, mode=m, progress=report)
+                if success:
+                    success_count += 1
+                    st.success(f"✅ {m} : {msg}")
+                else:
+                    st.error(f"❌ {m} : {msg}")
+            
+            st.session_state.pop("close_plans", None)
+            if success_count > 0:
+                st.balloons()
+                st.rerun()
+
+    # --- OUTIL TEMPORAIRE : PURGE DES ÉMOJIS & TITRES MARS 2026 ---
+    st.divider()
+    with st.expander("🛠️ Nettoyer les émojis et réparer les titres (Mars 2026)"):
+        st.info("Ce bouton purge les émojis de la base de données et distribue les titres propres (sans emoji).")
+        if st.button("Purger et Distribuer", type="primary"):
+            try:
+                def strip_emojis(title):
+                    return title.replace("🏆 ", "").replace("🥈 ", "").replace("🥉 ", "").replace("🥇 ", "")
+
+                # 1. PURGE GLOBALE : chaque titre à émoji est remplacé par sa version propre
+                all_titles = db.supabase.table("player_titles").select("player_id, title").execute().data or []
+                dirty = [t for t in all_titles if strip_emojis(t["title"]) != t["title"]]
+                db.grant_titles([(t["player_id"], strip_emojis(t["title"])) for t in dirty])
+
+                # Les titres équipés suivent (avant la suppression, qui les déséquiperait)
+                equipped = db.supabase.table("profiles").select("id, equipped_title").not_.is_("equipped_title", "null").execute().data or []
+                for prof in equipped:
+                    if strip_emojis(prof["equipped_title"]) != prof["equipped_title"]:
+                        db.update_profile(prof["id"], {"equipped_title": strip_emojis(prof["equipped_title"])})
+                if dirty:
+                    db.supabase.table("player_titles").delete().in_("title", list({t["title"] for t in dirty})).execute()
+
+                # 2. DISTRIBUTION PROPRE : titres recalculés depuis les archives (même calcul que la clôture)
+                season = "Mars 2026"
+                existing = {
+                    (t["player_id"], t["title"])
+                    for t in db.supabase.table("player_titles").select("player_id, title").like("title", f"%{season}%").execute().data or []
+                }
+                wanted = set()
+                stale = {}
+                for m_db, m_lbl in [("1v1", "Solo"), ("2v2", "Duo")]:
+                    arch_data = db.supabase.table("season_archives").select("*").eq("season_name", season).eq("mode", m_db).order("final_rank", desc=False).execute().data or []
+                    elo_col, count_col = season_close.columns(m_db)[:2]
+                    plan = season_close.build(
+                        [{"id": p["player_id"], "username": p["username"], elo_col: p["final_elo"], count_col: p.get("matches_played", 0)} for p in arch_data],
+                        season,
+                        m_db,
+                    )
+                    wanted |= {(t["player_id"], t["title"]) for t in plan.titles}
+
+                    # Anciens titres de la saison pour ce mode (ou sans mode) qui ne sont plus mérités
+                    archived = {p["player_id"] for p in arch_data}
+                    for p_id, title in existing:
+                        if p_id in archived and (m_lbl in title or ("Solo" not in title and "Duo" not in title)):
+                            stale.setdefault(p_id, set()).add(title)
+
+                for p_id in list(stale):
+                    stale[p_id] = {title for title in stale[p_id] if (p_id, title) not in wanted}
+                    if stale[p_id]:
+                        db.revoke_titles(p_id, stale[p_id])
+                db.grant_titles(sorted(wanted - existing))
+
+                count_updates = len({p_id for p_id, titles in stale.items() if titles} | {p_id for p_id, _ in wanted - existing})
+                db.invalidate("leaderboard", "player_titles")
+                db.touch_profiles()
+                st.success(f"✅ Émojis supprimés et Titres propres distribués à {count_updates} joueurs !")
+                st.balloons()
+            except Exception as e:
+                st.error(f"Erreur : {e}")
+
+
+def render_performance_panel(db):
+    """Appels à la base par rerun (session en cours) et par page (tout le serveur), exportables en JSON."""
+    st.subheader("⏱️ Performance")
+    st.caption("Requêtes Supabase mesurées par db_trace : nombre, durée cumulée, lignes et octets reçus.")
+
+    runs = db_trace.history()
+    if not runs:
+        st.info("Aucun rerun mesuré pour l'instant : naviguez dans l'application puis revenez ici.")
+    else:
+        st.markdown("**Derniers reruns (cette session)**")
+        df_runs = pd.DataFrame([db_trace.run_summary(run) for run in reversed(runs)])
+        st.dataframe(df_runs, hide_index=True, use_container_width=True)
+
+        labels = [f"{r['started_at']} — {r['page']}" for r in df_runs.to_dict("records")]
+        chosen = st.selectbox("Détail d'un rerun :", range(len(labels)), format_func=lambda i: labels[i])
+        run = runs[len(runs) - 1 - chosen]
+        if run["queries"]:
+            df_q = pd.DataFrame(run["queries"])
+            df_q["method"] = df_q["method"].fillna("(page)")
+            st.dataframe(df_q, hide_index=True, use_container_width=True)
+        if run["methods"]:
+            df_m = pd.DataFrame(run["methods"])
+            by_method = df_m[df_m["depth"] == 0].groupby("method").agg(
+                appels=("ms", "size"), ms=("ms", "sum"), requetes=("queries", "sum")
+            ).sort_values("ms", ascending=False)
+            st.dataframe(by_method, use_container_width=True)
+
+    totals = db_trace.page_totals()
+    if totals:
+        st.markdown("**Moyenne par page (toutes sessions)**")
+        df_pages = pd.DataFrame.from_dict(totals, orient="index")
+        for field in ("queries", "ms", "rows", "bytes"):
+            df_pages[field] = (df_pages[field] / df_pages["reruns"]).round(1)
+        st.dataframe(df_pages.sort_values("ms", ascending=False), use_container_width=True)
+
+    cache = db.cache_info()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Cache : succès", cache["hits"])
+    c2.metric("Cache : échecs", cache["misses"])
+    c3.metric("Invalidations", cache["invalidations"])
+    c4.metric("Entrées", cache["entries"])
+
+    st.download_button(
+        "📥 Exporter les mesures (JSON)",
+        db_trace.export_json({"cache": cache}),
+        "db_trace.json",
+        "application/json",
+    )
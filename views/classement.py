@@ -0,0 +1,118 @@
+# --- views/classement.py ---
+# Page "🏆 Classement".
+
+import streamlit as st
+
+import leaderboard
+from luxury_table import draw_luxury_table, player_cell
+
+from views.common import get_rank_info
+
+
+def render(db, user):
+    """Classement général : saison en cours (top, autour de moi, pages) et archives."""
+    st.header("🏆 Classement Général")
+
+    # Création des deux sous-onglets
+    tab_current, tab_archives = st.tabs(["🔥 Saison en cours", "🏛️ Archives des Saisons"])
+
+    with tab_current:
+        @st.fragment
+        def render_current_leaderboard():
+            """Classement de la saison en cours (fragment : mode, tableau complet et pages)."""
+            # 1. Le Sélecteur de Mode
+            ranking_mode = st.radio("Mode :", ["Solo (1v1)", "Duo (2v2)"], horizontal=True, key="rank_current")
+            mode_db = "1v1" if ranking_mode == "Solo (1v1)" else "2v2"
+
+            # 2. Récupération des données triées
+            res = db.get_leaderboard(mode=mode_db, columns=db.LEADERBOARD_COLUMNS[mode_db])
+
+            if not res.data:
+                st.info("Aucun joueur n'est encore inscrit.")
+            else:
+                # 3. Préparation des données (joueurs actifs, anonymisation, rangs)
+                if mode_db == "1v1":
+                    target_elo = "elo_rating"
+                    target_matches = "matches_played"
+                else:
+                    target_elo = "elo_2v2"
+                    target_matches = "matches_2v2"
+
+                ranking = leaderboard.ranking_frame(res.data, target_elo, target_matches, viewer_id=user["id"])
+
+                if ranking.empty:
+                    st.info("Aucun joueur classé pour le moment dans ce mode.")
+                else:
+                    # 4. Tableau VIP : seules les lignes affichées sont construites
+                    st.markdown(draw_luxury_table(leaderboard.table_rows(leaderboard.top(ranking))), unsafe_allow_html=True)
+
+                    # 📍 Autour de moi (si le joueur n'est pas déjà dans le top)
+                    my_window = leaderboard.around(ranking, user["id"])
+                    if not my_window.empty and my_window["rank"].max() > leaderboard.TOP_SIZE:
+                        st.markdown(
+                            draw_luxury_table(leaderboard.table_rows(my_window), title="📍 Autour de moi"),
+                            unsafe_allow_html=True,
+                        )
+
+                    # 📜 Classement complet, page par page et seulement à la demande
+                    if len(ranking) > leaderboard.TOP_SIZE and st.toggle(
+                        f"Voir le classement complet ({len(ranking)} joueurs)", key=f"rank_full_{mode_db}"
+                    ):
+                        nb_pages = leaderboard.page_count(ranking)
+                        page_num = st.number_input(
+                            f"Page (sur {nb_pages})", min_value=1, max_value=nb_pages, value=1, step=1,
+                            key=f"rank_page_{mode_db}",
+                        )
+                        st.markdown(
+                            draw_luxury_table(leaderboard.table_rows(leaderboard.page(ranking, page_num))),
+                            unsafe_allow_html=True,
+                        )
+
+        render_current_leaderboard()
+
+    with tab_archives:
+        st.markdown("#### 📜 Explorer le passé")
+        # Noms uniques des saisons archivées
+        archived_names = db.get_season_names()
+        
+        if not archived_names:
+            st.info("Aucune saison n'a encore été archivée. Clôturez une saison depuis le Panel Admin !")
+        else:
+            
+            c1, c2 = st.columns(2)
+            selected_season = c1.selectbox("Sélectionner la saison :", archived_names)
+            arch_mode = c2.radio("Mode :", ["Solo (1v1)", "Duo (2v2)"], horizontal=True, key="rank_archive")
+            arch_mode_db = "1v1" if arch_mode == "Solo (1v1)" else "2v2"
+
+            # 🔴 CORRECTION : On utilise la colonne "final_rank" ou "final_elo" (colonnes d'archives)
+            archive_data = db.get_season_archive(selected_season, arch_mode_db)
+            
+            if not archive_data:
+                st.info(f"Aucun classement trouvé pour **{selected_season}** en **{arch_mode}**.")
+            else:
+                list_arch = []
+                
+                # Boucle sécurisée qui s'adapte au nom exact de tes colonnes d'archives
+                for index, row in enumerate(archive_data):
+                    # Cherche la valeur Elo sous différents noms possibles
+                    score_elo = row.get("final_elo", row.get("elo", row.get("elo_rating", 1000)))
+                    
+                    # Cherche le nombre de matchs
+                    nb_matchs = row.get("matches_played", row.get("final_matches", 0))
+                    
+                    # Cherche le rang final
+                    final_rank = row.get("final_rank", index + 1)
+                    
+                    rank_info = get_rank_info(score_elo)
+                    
+                    list_arch.append({
+                        "Rang": final_rank,
+                        "Joueur": player_cell(rank_info, row.get('username', 'Inconnu')),
+                        "Points Elo": f"<b>{int(score_elo)}</b> <span style='color: #a0aec0;'>pts</span>",
+                        "Matchs Joués": f"{int(nb_matchs)} 🎮"
+                    })
+                
+                # Tri de sécurité en Python au cas où le tri Supabase aurait échoué
+                list_arch = sorted(list_arch, key=lambda x: int(x["Rang"]))
+                
+                st.markdown(draw_luxury_table(list_arch, title=f"Classement Final - {selected_season}"), unsafe_allow_html=True)
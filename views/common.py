@@ -0,0 +1,442 @@
+# --- views/common.py ---
+# Fonctions d'affichage partagées par plusieurs pages (rangs, badges, tableaux).
+# Importé une fois par processus : les définitions ne sont plus ré-exécutées à chaque rerun.
+
+from assets import badge_url
+from ranks_config import RANK_TIERS, rank_icon
+
+
+def render_xp_bar(old_elo, new_elo, old_rank_info, new_rank_info):
+    """Génère la carte d'XP avec le buffer de survie et remplissage dynamique post-transition."""
+    is_promo = new_rank_info["id"] > old_rank_info["id"]
+    is_demote = new_rank_info["id"] < old_rank_info["id"]
+    is_same = not (is_promo or is_demote)
+
+    # Fonction utilitaire pour calculer le % d'une barre
+    def get_pct(val, min_v, max_v):
+        if max_v <= min_v: return 100
+        return max(0, min(100, ((val - min_v) / (max_v - min_v)) * 100))
+
+    # === 1. PARAMÈTRES NOUVEAU RANG ===
+    new_base_min = new_rank_info["threshold"]
+    new_next = next((t for t in RANK_TIERS if t["id"] == new_rank_info["id"] + 1), None)
+
+    new_display_min = (new_base_min - 25) if new_base_min >= 25 else 0
+    new_display_max = new_next["threshold"] if new_next else "MAX"
+    new_calc_max = new_display_min + 100 if new_display_max == "MAX" else new_display_max
+
+    is_in_danger = new_elo < new_base_min
+
+    # === 2. PARAMÈTRES ANCIEN RANG ===
+    old_base_min = old_rank_info["threshold"]
+    old_next = next((t for t in RANK_TIERS if t["id"] == old_rank_info["id"] + 1), None)
+    
+    old_display_min = (old_base_min - 25) if old_base_min >= 25 else 0
+    old_display_max = old_next["threshold"] if old_next else "MAX"
+    old_calc_max = old_display_min + 100 if old_display_max == "MAX" else old_display_max
+
+    # === 3. CALCUL DES POURCENTAGES (Correction Téléportation) ===
+    if is_promo:
+        trans_elo = new_base_min
+        old_start_pct = get_pct(old_elo, old_display_min, old_calc_max)
+        old_end_pct = get_pct(trans_elo, old_display_min, old_calc_max)
+        # 🔴 CORRECTION : La nouvelle barre part de 0% pour montrer le remplissage du buffer
+        new_start_pct = 0 
+        new_end_pct = get_pct(new_elo, new_display_min, new_calc_max)
+    elif is_demote:
+        trans_elo = old_base_min - 25
+        old_start_pct = get_pct(old_elo, old_display_min, old_calc_max)
+        old_end_pct = get_pct(trans_elo, old_display_min, old_calc_max)
+        # 🔴 CORRECTION : La nouvelle barre part de 100% et se vide
+        new_start_pct = 100 
+        new_end_pct = get_pct(new_elo, new_display_min, new_calc_max)
+    else:
+        old_start_pct = get_pct(old_elo, new_display_min, new_calc_max)
+        new_end_pct = get_pct(new_elo, new_display_min, new_calc_max)
+
+    diff = int(new_elo - old_elo)
+    color_pts = "#2ecc71" if diff > 0 else "#e74c3c"
+
+    # === 4. STYLES (Zone de Danger) ===
+    if is_same and is_in_danger:
+        status_text = "⚠️ ZONE DE DANGER"
+        status_color = "#ff4b2b"
+        border_color = "#ff4b2b"
+        bar_color = "linear-gradient(90deg, #ff4b2b, #ff416c)"
+        bar_shadow = "#ff4b2b"
+        anim_pulse = "animation: dangerPulse 2s infinite;"
+    else:
+        status_text = new_rank_info['name']
+        status_color = "white"
+        border_color = "rgba(198,156,37,0.3)"
+        bar_color = new_rank_info['bg_gradient']
+        bar_shadow = new_rank_info['color']
+        anim_pulse = ""
+
+    # === 5. ANIMATIONS CSS CINÉMATIQUES ===
+    if is_promo:
+        anim_css = f"@keyframes fillOld {{from {{width: {old_start_pct}%;}} to {{width: {old_end_pct}%;}}}} @keyframes fillNew {{from {{width: {new_start_pct}%;}} to {{width: {new_end_pct}%;}}}} .bar-phase1 {{animation: fillOld 1.5s ease-in forwards;}} .bar-phase2 {{width: {new_start_pct}%; animation: fillNew 1.5s 1.7s ease-out forwards;}}"
+        flash_anim = "flashPromo"
+    elif is_demote:
+        anim_css = f"@keyframes drainOld {{from {{width: {old_start_pct}%;}} to {{width: {old_end_pct}%;}}}} @keyframes drainNew {{from {{width: {new_start_pct}%;}} to {{width: {new_end_pct}%;}}}} .bar-phase1 {{animation: drainOld 1.5s ease-in forwards;}} .bar-phase2 {{width: {new_start_pct}%; animation: drainNew 1.5s 1.7s ease-out forwards;}}"
+        flash_anim = "flashDemote"
+    else:
+        anim_css = f"@keyframes moveBar {{from {{width: {old_start_pct}%;}} to {{width: {new_end_pct}%;}}}} .bar-single {{animation: moveBar 2s ease-out forwards;}} @keyframes dangerPulse {{ 0% {{opacity: 1;}} 50% {{opacity: 0.6;}} 100% {{opacity: 1;}} }}"
+        flash_anim = "none"
+
+    # === 6. HTML MINIFIÉ ===
+    html = f"""<style>{anim_css}
+    @keyframes fadeOut {{ 0%, 88% {{opacity:1; transform:scale(1);}} 100% {{opacity:0; transform:scale(1.3); visibility:hidden;}} }}
+    @keyframes fadeIn {{ 0%, 88% {{opacity:0; transform:scale(0.5);}} 100% {{opacity:1; transform:scale(1);}} }}
+    @keyframes flashPromo {{ 0%, 45% {{border-color: rgba(198,156,37,0.3); box-shadow: 0 0 0px transparent;}} 50% {{border-color: white; box-shadow: 0 0 50px white;}} 100% {{border-color: {new_rank_info['color']}; box-shadow: 0 10px 30px rgba(0,0,0,0.5);}} }}
+    @keyframes flashDemote {{ 0%, 45% {{border-color: rgba(198,156,37,0.3); box-shadow: 0 0 0px transparent;}} 50% {{border-color: #ff4b2b; box-shadow: 0 0 50px #ff4b2b;}} 100% {{border-color: {new_rank_info['color']}; box-shadow: 0 10px 30px rgba(0,0,0,0.5);}} }}
+    .xp-card {{width:100%; max-width:600px; margin:0 auto; font-family:'Montserrat',sans-serif; background:#0f172a; padding:40px 30px; border-radius:20px; border:2px solid {border_color}; text-align:center; color:white; overflow:hidden;}}
+    .card-anim-cinematic {{animation: {flash_anim} 3.5s forwards;}}
+    .swap-out {{animation: fadeOut 1.7s forwards;}}
+    .swap-in {{opacity:0; animation: fadeIn 1.7s forwards;}}
+    .huge-icon img, .huge-icon svg {{width:130px !important; height:130px !important; object-fit:contain;}}
+    .prog-container {{width:100%; height:18px; background:#1e293b; border-radius:9px; overflow:hidden; border:1px solid #334155; position:relative; {anim_pulse}}}
+    .bar-base {{height:100%;}}
+    </style>
+    <div class="xp-card {'card-anim-cinematic' if not is_same else ''}">
+    """
+
+    if is_same:
+        html += f"""
+        <div style="display:flex; flex-direction:column; align-items:center; gap:20px; margin-bottom:35px;">
+            <div class="huge-icon">{rank_icon(new_rank_info)}</div>
+            <span style="font-weight:900; color:{status_color}; font-size:1.8em; text-transform:uppercase; letter-spacing:1px;">{status_text}</span>
+        </div>
+        <div class="prog-container"><div class="bar-base bar-single" style="background:{bar_color}; box-shadow:0 0 15px {bar_shadow};"></div></div>
+        <div style="display:flex; justify-content:space-between; margin-top:12px; font-size:0.9em; color:#8BA1B5; font-weight:bold;">
+            <span>{new_display_min} ELO {'(SURVIE)' if is_in_danger else ''}</span>
+            <span>{new_display_max}{' ELO' if new_display_max != 'MAX' else ''}</span>
+        </div>
+        """
+    else:
+        html += f"""
+        <div style="display: grid; grid-template-columns: 1fr;">
+            <div style="grid-row: 1; grid-column: 1; z-index: 2;" class="swap-out">
+                <div style="display:flex; flex-direction:column; align-items:center; gap:20px; margin-bottom:35px;">
+                    <div class="huge-icon">{rank_icon(old_rank_info)}</div>
+                    <span style="font-weight:900; color:{'#e74c3c' if is_demote else 'white'}; font-size:1.8em; text-transform:uppercase; letter-spacing:1px;">{old_rank_info['name']}</span>
+                </div>
+                <div class="prog-container"><div class="bar-base bar-phase1" style="background:{old_rank_info['bg_gradient']}; box-shadow:0 0 15px {old_rank_info['color']};"></div></div>
+                <div style="display:flex; justify-content:space-between; margin-top:12px; font-size:0.9em; color:#8BA1B5; font-weight:bold;">
+                    <span>{old_display_min} ELO</span>
+                    <span>{old_display_max}{' ELO' if old_display_max != 'MAX' else ''}</span>
+                </div>
+            </div>
+            
+            <div style="grid-row: 1; grid-column: 1; z-index: 3;" class="swap-in">
+                <div style="display:flex; flex-direction:column; align-items:center; gap:20px; margin-bottom:35px;">
+                    <div class="huge-icon">{rank_icon(new_rank_info)}</div>
+                    <span style="font-weight:900; color:{'#f1c40f' if is_promo else '#e74c3c'}; font-size:1.8em; text-transform:uppercase; letter-spacing:1px;">{'⬆️ PROMOTION !' if is_promo else '⬇️ RÉTROGRADATION...'}</span>
+                </div>
+                <div class="prog-container"><div class="bar-base bar-phase2" style="background:{new_rank_info['bg_gradient']}; box-shadow:0 0 15px {new_rank_info['color']};"></div></div>
+                <div style="display:flex; justify-content:space-between; margin-top:12px; font-size:0.9em; color:#8BA1B5; font-weight:bold;">
+                    <span>{new_display_min} ELO {'(SURVIE)' if is_in_danger else ''}</span>
+                    <span>{new_display_max}{' ELO' if new_display_max != 'MAX' else ''}</span>
+                </div>
+            </div>
+        </div>
+        """
+
+    html += f"""
+        <div style="margin-top:40px; position:relative; z-index:5;">
+            <div style="font-family:'Playfair Display',serif; font-size:3.2em; font-weight:bold;">{int(new_elo)} <span style="font-size:0.3em; color:#C69C25;">ELO</span></div>
+            <div style="color:{color_pts}; font-weight:900; font-size:1.6em; margin-top:5px;">{diff:+} PTS</div>
+        </div>
+    </div>
+    """
+    return html.replace('\n', '')
+    
+def get_rank_info(current_elo, current_rank_id=None):
+    # (Ton code ici...)
+    strict_rank = None
+    for tier in reversed(RANK_TIERS):
+        if current_elo >= tier["threshold"]:
+            strict_rank = tier
+            break
+            
+    if current_rank_id is None:
+        return strict_rank
+
+    if strict_rank["id"] < current_rank_id:
+        current_tier = next(t for t in RANK_TIERS if t["id"] == current_rank_id)
+        if current_elo >= (current_tier["threshold"] - 25):
+            return current_tier 
+        else:
+            return strict_rank 
+    else:
+        return strict_rank 
+
+def draw_rank_badge(elo):
+    rank = get_rank_info(elo) # Cette fonction utilise RANK_TIERS
+    
+    # On récupère l'icône (balise <img> complète, image servie en fichier statique)
+    icon_html = rank_icon(rank)
+    
+    # On l'intègre dans un design plus grand pour le profil
+    html = f"""
+    <div style="
+        background: {rank['bg_gradient']};
+        border: 2px solid {rank['color']};
+        border-radius: 15px;
+        padding: 20px;
+        text-align: center;
+        box-shadow: {rank.get('glow', '0 0 10px rgba(0,0,0,0.5)')};
+        color: white;
+    ">
+        <div style="transform: scale(2); margin-bottom: 15px;">{icon_html}</div>
+        <div style="font-family: 'Playfair Display', serif; font-size: 1.5em; font-weight: bold;">
+            {rank['name'].upper()}
+        </div>
+        <div style="font-size: 1em; opacity: 0.9;">{int(elo)} Elo</div>
+    </div>
+    """
+    return html
+
+def get_badges_html(stats):
+    """
+    Génère les badges avec progression visible et infobulles compatibles mobile.
+    Version compactée sans retours à la ligne pour éviter les bugs d'affichage.
+    stats : compteurs pré-calculés (db.get_player_stats), sans parcourir les matchs.
+    """
+
+    # --- 1. STATS (tables player_stats et head_to_head, tenues à jour à chaque match) ---
+    total_matches = stats["total_matches"]
+    wins = stats["wins"]
+    current_streak = stats["current_streak"]
+    max_daily_matches = stats["max_daily_matches"]
+    nb_unique = stats["nb_unique"]
+    max_duo_matches = stats["max_duo_matches"]
+    has_giant_kill = stats["has_giant_kill"]
+    has_marathon = max_daily_matches >= 10
+
+    # --- 2. GÉNÉRATEUR DE HTML ---
+    html_parts = []
+
+    # --- Dictionnaire des couleurs magiques ---
+    # Tu peux ajuster ces codes couleurs hexadécimaux selon tes goûts
+    TIER_COLORS = {
+        "bronze": "#cd7f32",
+        "silver": "#c0c0c0",
+        "gold": "#ffd700",
+        "platinum": "#00e5ff", # Un cyan brillant fait très "Platine/Diamant"
+        "magma": "#ff4500",
+        "electric": "#ffd700",
+        "blood": "#ff0000",
+        "locked": "#444444"
+    }
+
+    def process_tier_badge(current_val, tiers, base_image_url, label):
+        # 🛡️ LE BULLDOZER : Retire guillemets, retours à la ligne et espaces !
+        clean_url = base_image_url.replace('"', '').replace("'", "").replace('\n', '').replace('\r', '').replace(' ', '')
+        
+        achieved_tier = None
+        next_tier = None
+        for tier in tiers:
+            if current_val >= tier["req"]:
+                achieved_tier = tier
+            else:
+                next_tier = tier
+                break
+
+        progress_text = f"<span style='color: #4db8ff; font-weight:bold;'>📊 Actuel : {current_val}</span>"
+
+        if achieved_tier:
+            style = achieved_tier["style"]
+            name = achieved_tier["name"]
+            color = TIER_COLORS.get(style, "#ffffff")
+            if next_tier:
+                tooltip_text = f"✅ {name}<br>{progress_text}<br><span style='font-size:0.9em; opacity:0.8;'>🎯 Prochain : {next_tier['name']} ({next_tier['req']} {label})</span>"
+            else:
+                tooltip_text = f"🏆 NIVEAU MAX<br>{name}<br>{progress_text}<br><span style='font-size:0.9em; opacity:0.8;'>Vous êtes une légende !</span>"
+            css_class = ""
+        else:
+            first_tier = tiers[0]
+            style = "locked"
+            name = first_tier["name"]
+            color = TIER_COLORS["locked"]
+            tooltip_text = f"🔒 BLOQUÉ<br>{progress_text}<br><span style='font-size:0.9em; opacity:0.8;'>🎯 Objectif : {first_tier['req']} {label}</span>"
+            css_class = "locked"
+
+        # 🔴 NOUVEAU DESIGN : Pas de cadre, juste lueur & image plus grosse
+        badge_html = f'''<div class="badge-item {css_class}" style="position: relative; display: flex; flex-direction: column; align-items: center; margin: 10px; width: 80px;">
+<div style="width: 70px; height: 70px; display: flex; justify-content: center; align-items: center; position: relative;">
+<img src="{clean_url}" style="width: 70px; height: 70px; object-fit: contain; filter: drop-shadow(0 0 8px {color});" />
+</div>
+<div style="font-size: 0.85em; font-weight: bold; margin-top: 8px; color: {color if style != 'locked' else '#888'}; text-transform: uppercase; text-shadow: 1px 1px 2px rgba(0,0,0,0.8); text-align: center;">{name}</div>
+<span class="tooltip-content">{tooltip_text}</span>
+</div>'''
+        html_parts.append(badge_html)
+    
+    def add_special(cond, style, image_url, name, desc, current_stat=""):
+        # 🛡️ LE BULLDOZER
+        clean_url = image_url.replace('"', '').replace("'", "").replace('\n', '').replace('\r', '').replace(' ', '')
+        
+        css_class = "" if cond else "locked"
+        color = TIER_COLORS.get(style, "#ffffff") if cond else TIER_COLORS["locked"]
+        
+        stat_line = f"<br><span style='color: #ff9f43; font-weight:bold;'>{current_stat}</span>" if current_stat else ""
+        if cond:
+            tooltip_text = f"✅ {name}{stat_line}<br><span style='font-size:0.9em; opacity:0.8;'>{desc}</span>"
+        else:
+            tooltip_text = f"🔒 BLOQUÉ{stat_line}<br><span style='font-size:0.9em; opacity:0.8;'>Objectif : {desc}</span>"
+
+        # 🔴 PAREIL ICI : Pas d'hexagone, lueur intense & image grosse
+        badge_html = f'''<div class="badge-item {css_class}" style="position: relative; display: flex; flex-direction: column; align-items: center; margin: 10px; width: 80px;">
+<div style="width: 70px; height: 70px; display: flex; justify-content: center; align-items: center; position: relative;">
+<img src="{clean_url}" style="width: 70px; height: 70px; object-fit: contain; filter: drop-shadow(0 0 8px {color});" />
+</div>
+<div style="font-size: 0.85em; font-weight: bold; margin-top: 8px; color: {color if cond else '#888'}; text-transform: uppercase; text-shadow: 1px 1px 2px rgba(0,0,0,0.8); text-align: center;">{name}</div>
+<span class="tooltip-content">{tooltip_text}</span>
+</div>'''
+        html_parts.append(badge_html)
+
+    # --- 3. DÉFINITION DES PALIERS ---
+    
+    # 1. Palier Fidélité (Matchs)
+    tiers_fidelity = [
+        {"req": 10, "style": "bronze", "name": "Rookie"},
+        {"req": 50, "style": "silver", "name": "Confirmé"},
+        {"req": 100, "style": "gold", "name": "Pilier"},
+        {"req": 200, "style": "platinum", "name": "Légende"},
+    ]
+    process_tier_badge(total_matches, tiers_fidelity, badge_url("fidelite"), "matchs")
+
+    # 2. Palier Victoire
+    tiers_victory = [
+        {"req": 10, "style": "bronze", "name": "Gâchette"},
+        {"req": 25, "style": "silver", "name": "Conquérant"},
+        {"req": 50, "style": "gold", "name": "Champion"},
+        {"req": 100, "style": "platinum", "name": "Invincible"},
+    ]
+    process_tier_badge(wins, tiers_victory, badge_url("victoire"), "victoires")
+
+    # 3. Palier Duo
+    tiers_duo = [
+        {"req": 10, "style": "bronze", "name": "Binôme"},
+        {"req": 30, "style": "silver", "name": "Frères d'armes"},
+        {"req": 60, "style": "gold", "name": "Fusion"},
+        {"req": 120, "style": "platinum", "name": "Symbiose"},
+    ]
+    process_tier_badge(max_duo_matches, tiers_duo, badge_url("duo"), "matchs ensemble")
+
+    # 4. Palier Social
+    tiers_social = [
+        {"req": 5, "style": "bronze", "name": "Explorateur"},
+        {"req": 10, "style": "silver", "name": "Voyageur"},
+        {"req": 20, "style": "gold", "name": "Monde"},
+        {"req": 40, "style": "platinum", "name": "Universel"},
+    ]
+    process_tier_badge(nb_unique, tiers_social, badge_url("social"), "adversaires")
+
+    # 5. Badges Spéciaux
+    add_special(
+        current_streak >= 5,
+        "magma",
+        badge_url("on_fire"),
+        "On Fire",
+        "Série de 5 victoires",
+        f"Série : {current_streak}",
+    )
+    add_special(
+        has_marathon,
+        "electric",
+        badge_url("marathon"),
+        "Marathon",
+        "10 matchs en 1 jour",
+        f"Record jour : {max_daily_matches}",
+    )
+    add_special(
+        has_giant_kill,
+        "blood",
+        badge_url("tueur"),
+        "Tueur",
+        "Battre un +200 Elo",
+        "Accompli !" if has_giant_kill else "Pas encore...",
+    )
+
+    container_style = "display: flex; flex-wrap: wrap; justify-content: center; gap: 4px; background: rgba(20, 20, 30, 0.4); padding: 15px; border-radius: 16px; border: 1px solid rgba(255,255,255,0.05); box-shadow: 0 4px 20px rgba(0,0,0,0.3);"
+    return f'<div style="{container_style}">{"".join(html_parts)}</div>'
+    
+    def add_special(cond, shape, style, icon, name, desc, current_stat=""):
+        css = "" if cond else "locked"
+        stat_line = (
+            f"<br><span style='color: #ff9f43; font-weight:bold;'>{current_stat}</span>"
+            if current_stat
+            else ""
+        )
+        if cond:
+            tooltip_text = f"✅ {name}{stat_line}<br><span style='font-size:0.9em; opacity:0.8;'>{desc}</span>"
+        else:
+            tooltip_text = f"🔒 BLOQUÉ{stat_line}<br><span style='font-size:0.9em; opacity:0.8;'>Objectif : {desc}</span>"
+
+        badge_html = f'<div class="badge-item {css}"><div class="badge-icon-box {shape} {style}">{icon}</div><div class="badge-name">{name}</div><span class="tooltip-content">{tooltip_text}</span></div>'
+        html_parts.append(badge_html)
+
+    # --- 3. DÉFINITION DES PALIERS ---
+    tiers_fidelity = [
+        {"req": 10, "style": "bronze", "name": "Rookie"},
+        {"req": 50, "style": "silver", "name": "Confirmé"},
+        {"req": 100, "style": "gold", "name": "Pilier"},
+        {"req": 200, "style": "platinum", "name": "Légende"},
+    ]
+    process_tier_badge(total_matches, tiers_fidelity, "shield", "⚔️", "matchs")
+
+    tiers_victory = [
+        {"req": 10, "style": "bronze", "name": "Gâchette"},
+        {"req": 25, "style": "silver", "name": "Conquérant"},
+        {"req": 50, "style": "gold", "name": "Champion"},
+        {"req": 100, "style": "platinum", "name": "Invincible"},
+    ]
+    process_tier_badge(wins, tiers_victory, "star", "🏆", "victoires")
+
+    tiers_duo = [
+        {"req": 10, "style": "bronze", "name": "Binôme"},
+        {"req": 30, "style": "silver", "name": "Frères d'armes"},
+        {"req": 60, "style": "gold", "name": "Fusion"},
+        {"req": 120, "style": "platinum", "name": "Symbiose"},
+    ]
+    process_tier_badge(max_duo_matches, tiers_duo, "circle", "🤝", "matchs ensemble")
+
+    tiers_social = [
+        {"req": 5, "style": "bronze", "name": "Explorateur"},
+        {"req": 10, "style": "silver", "name": "Voyageur"},
+        {"req": 20, "style": "gold", "name": "Monde"},
+        {"req": 40, "style": "platinum", "name": "Universel"},
+    ]
+    process_tier_badge(nb_unique, tiers_social, "circle", "🌍", "adversaires")
+
+    add_special(
+        current_streak >= 5,
+        "hexagon",
+        "magma",
+        "🔥",
+        "On Fire",
+        "Série de 5 victoires",
+        f"Série : {current_streak}",
+    )
+    add_special(
+        has_marathon,
+        "hexagon",
+        "electric",
+        "⚡",
+        "Marathon",
+        "10 matchs en 1 jour",
+        f"Record jour : {max_daily_matches}",
+    )
+    add_special(
+        has_giant_kill,
+        "hexagon",
+        "blood",
+        "🩸",
+        "Tueur",
+        "Battre un +200 Elo",
+        "Accompli !" if has_giant_kill else "Pas encore...",
+    )
+
+    container_style = "display: flex; flex-wrap: wrap; justify-content: center; gap: 4px; background: rgba(20, 20, 30, 0.4); padding: 15px; border-radius: 16px; border: 1px solid rgba(255,255,255,0.05); box-shadow: 0 4px 20px rgba(0,0,0,0.3);"
+    return f'<div style="{container_style}">{"".join(html_parts)}</div>'
@@ -0,0 +1,37 @@
+# --- views/nouveautes.py ---
+# Page "📢 Nouveautés".
+
+import streamlit as st
+
+
+def render(db, user):
+    """Notes de version de l'application."""
+    st.header("📢 Nouveautés & Mises à jour")
+
+    # --- MISE A JOUR V2.1 ---
+    with st.container(border=True):
+        st.subheader("💎 Mise à jour v2.1 : Trophées & Rivalités")
+        st.caption("Déployée le 22 Janvier 2026")
+
+        st.markdown(
+            """
+            L'application s'enrichit de deux fonctionnalités majeures pour pimenter la compétition !
+
+            ### 🏅 1. Arrivée des Badges & Trophées
+            Vos exploits sont désormais immortalisés ! Un système de succès inédit fait son apparition sur votre profil :
+            * **Collectionnez-les tous :** Des badges au design 3D (Or, Argent, Bronze) qui récompensent votre fidélité, vos victoires et votre style de jeu.
+            * **Objectif PLATINE 💎 :** Serez-vous assez assidu pour atteindre ce rang ultime (ex: 200 matchs ou 100 victoires) ?
+            * **Progression Interactive :** Cliquez sur un badge verrouillé (grisé) pour découvrir l'objectif précis à atteindre.
+            * **Spécial Duo :** Des trophées exclusifs pour récompenser la fidélité de votre binôme.
+
+            ### ⚔️ 2. Le Comparateur de Joueurs
+            Fini les débats, place aux chiffres. L'onglet **"Historique"** devient un puissant outil d'analyse :
+            * **Duel au Sommet :** Comparez n'importe quel joueur A contre n'importe quel joueur B.
+            * **Graphiques Avancés :** Analysez la domination via deux courbes : l'écart de Victoires (Forme) et l'écart de Points Elo (Niveau).
+            * **Titres & Statuts :** L'appli détermine automatiquement si vous êtes la "Bête Noire" de votre adversaire ou son "Sac de Frappe".
+            * **Analyse Synergie (2v2) :** Découvrez si votre duo est classé comme "Gorilles" (Invincibles) ou "Toxiques" (Incompatibles).
+
+            ---
+            *La chasse aux trophées est ouverte !* 🏆
+            """
+        )